@@ -10,6 +10,8 @@ schemas
     Entity and relationship schema constants for all data sources.
 relationship_derivation
     Functions to derive graph edges from FIPS code joins.
+spatial_join
+    Point-in-polygon derivation of ``IN_TRACT`` edges for OSM nodes.
 shapefile_loader
     Shapefile → DataFrame conversion utilities.
 georgia_pipeline
@@ -0,0 +1,307 @@
+"""Columnar engine for FIPS-key relationship derivations.
+
+Every FIPS-derived relationship has the same shape: build a code from one
+or more columns on each side, join, and emit one ``(__SOURCE__,
+__TARGET__)`` pair per matched row.  A :class:`DerivationSpec` states the
+shape declaratively and :func:`run_derivation` executes it.
+
+Join keys are integers.  A zero-padded FIPS code such as ``"06"`` or
+``"03700"`` is a fixed-width decimal number, so normalizing it — whether
+pandas read it as ``6``, ``6.0``, ``"6"`` or ``"06"`` — is one
+``pd.to_numeric`` pass instead of regex substitution plus ``zfill`` on
+Python strings.  Composite keys pack their parts positionally (``STATE *
+10**5 + PUMA``) and prefix matches become integer division (a 12-digit
+block group GEOID ``// 10`` is its tract).  The right side is sorted once
+and probed with ``np.searchsorted``; only the key and endpoint columns
+are ever read, and no intermediate frames are built.
+
+Left frames larger than ``partition_rows`` are split into contiguous
+partitions (in practice one or a few states each, since every source is
+concatenated state by state) and probed on a thread pool.  Derivations
+themselves run concurrently in
+:func:`fastopendata.pipeline.load_available_datasets`.
+
+Usage::
+
+    spec = DerivationSpec(
+        left_key=KeySpec((("STATE", 2), ("PUMA", 5))),
+        right_key=KeySpec((("STATEFP", 2), ("PUMACE20", 5))),
+        source=Endpoint("left", column="SERIALNO"),
+        target=Endpoint("right", column="GEOID"),
+    )
+    edges = run_derivation(spec, persons_df, pumas_df)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+#: Left rows per parallel partition.
+DEFAULT_PARTITION_ROWS = 2_000_000
+
+EDGE_COLUMNS = ["__SOURCE__", "__TARGET__"]
+
+
+@dataclass(frozen=True)
+class KeySpec:
+    """An integer join key packed from fixed-width numeric code columns.
+
+    Attributes
+    ----------
+    parts:
+        ``(column, width)`` pairs, most significant first.  A value that is
+        null, non-integral, negative or wider than its width invalidates
+        the row.
+    drop_digits:
+        Trailing digits removed after packing, turning the key into its
+        prefix (``1`` maps a block group GEOID to its tract GEOID).
+
+    """
+
+    parts: tuple[tuple[str, int], ...]
+    drop_digits: int = 0
+
+    @property
+    def width(self) -> int:
+        """Digits in the packed key."""
+        return sum(width for _, width in self.parts) - self.drop_digits
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """Where an edge endpoint's value comes from.
+
+    Either the raw value of ``column`` or, when ``key`` is given, that key
+    rendered as a zero-padded string, read from the ``side`` frame.
+    """
+
+    side: Literal["left", "right"]
+    column: str | None = None
+    key: KeySpec | None = None
+
+
+@dataclass(frozen=True)
+class DerivationSpec:
+    """Declarative description of one derived relationship.
+
+    With a ``right_key`` each left row joins the first right row with an
+    equal key and rows without a match are dropped.  Without one, every
+    left row with a valid key yields an edge (e.g. a crosswalk that
+    already holds both endpoints).
+    """
+
+    left_key: KeySpec
+    source: Endpoint
+    target: Endpoint
+    right_key: KeySpec | None = None
+
+
+def empty_edges() -> pd.DataFrame:
+    """Return an edge frame with no rows."""
+    return pd.DataFrame(columns=EDGE_COLUMNS)
+
+
+def _codes(column: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a code column to int64, with a validity mask."""
+    if pd.api.types.is_integer_dtype(column.dtype) and not column.hasnans:
+        return column.to_numpy(dtype=np.int64), np.ones(len(column), bool)
+    if pd.api.types.is_bool_dtype(column.dtype):
+        return np.zeros(len(column), np.int64), np.zeros(len(column), bool)
+    values = pd.to_numeric(column, errors="coerce").to_numpy(
+        dtype=np.float64,
+        na_value=np.nan,
+    )
+    with np.errstate(invalid="ignore"):
+        valid = np.isfinite(values) & (values == np.floor(values))
+    return np.where(valid, values, 0).astype(np.int64), valid
+
+
+def encode_key(
+    frame: pd.DataFrame,
+    key: KeySpec,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Pack *key* for every row of *frame*.
+
+    Returns
+    -------
+    ``(keys, valid)`` — int64 keys and a mask of rows whose every part
+    parsed within its width.
+
+    """
+    packed = np.zeros(len(frame), dtype=np.int64)
+    valid = np.ones(len(frame), dtype=bool)
+    for column, width in key.parts:
+        codes, ok = _codes(frame[column])
+        ok &= (codes >= 0) & (codes < 10**width)
+        packed = packed * 10**width + np.where(ok, codes, 0)
+        valid &= ok
+    if key.drop_digits:
+        packed //= 10**key.drop_digits
+    return packed, valid
+
+
+def format_key(keys: np.ndarray, width: int) -> np.ndarray:
+    """Render integer keys as zero-padded strings (Arrow kernels)."""
+    text = pc.cast(pa.array(keys, type=pa.int64()), pa.string())
+    padded = pc.utf8_lpad(text, width=width, padding="0")
+    return padded.to_numpy(zero_copy_only=False)
+
+
+def _endpoint_values(
+    endpoint: Endpoint,
+    frame: pd.DataFrame,
+    rows: np.ndarray,
+) -> np.ndarray:
+    if endpoint.key is not None:
+        keys, _ = encode_key(frame, endpoint.key)
+        return format_key(keys[rows], endpoint.key.width)
+    return frame[endpoint.column].to_numpy()[rows]
+
+
+def _endpoint_valid(
+    endpoint: Endpoint,
+    frame: pd.DataFrame,
+) -> np.ndarray:
+    if endpoint.key is not None:
+        return encode_key(frame, endpoint.key)[1]
+    return frame[endpoint.column].notna().to_numpy()
+
+
+@dataclass(frozen=True)
+class _RightIndex:
+    """Sorted unique right keys and the first row holding each."""
+
+    keys: np.ndarray
+    rows: np.ndarray
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame, spec: DerivationSpec) -> _RightIndex:
+        assert spec.right_key is not None
+        keys, valid = encode_key(frame, spec.right_key)
+        if spec.target.side == "right":
+            valid &= _endpoint_valid(spec.target, frame)
+        positions = np.flatnonzero(valid)
+        unique, first = np.unique(keys[positions], return_index=True)
+        return cls(keys=unique, rows=positions[first])
+
+    def probe(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return (matched mask, right row) for each key."""
+        if not len(self.keys):
+            return np.zeros(len(keys), bool), np.zeros(len(keys), np.int64)
+        slot = np.searchsorted(self.keys, keys)
+        slot = np.minimum(slot, len(self.keys) - 1)
+        return self.keys[slot] == keys, self.rows[slot]
+
+
+def _match_partition(
+    spec: DerivationSpec,
+    left: pd.DataFrame,
+    bounds: tuple[int, int],
+    right_index: _RightIndex | None,
+    where: Mapping[str, Any],
+) -> tuple[np.ndarray, np.ndarray]:
+    start, stop = bounds
+    part = left.iloc[start:stop]
+    keys, valid = encode_key(part, spec.left_key)
+    for column, value in where.items():
+        codes, ok = _codes(part[column])
+        valid &= ok & (codes == int(value))
+    for endpoint in (spec.source, spec.target):
+        if endpoint.side == "left":
+            valid &= _endpoint_valid(endpoint, part)
+    if right_index is None:
+        rows = np.flatnonzero(valid)
+        return rows + start, rows
+    matched, right_rows = right_index.probe(keys)
+    rows = np.flatnonzero(valid & matched)
+    return rows + start, right_rows[rows]
+
+
+def run_derivation(  # noqa: PLR0913
+    spec: DerivationSpec,
+    left: pd.DataFrame,
+    right: pd.DataFrame | None = None,
+    *,
+    where: Mapping[str, Any] | None = None,
+    partition_rows: int = DEFAULT_PARTITION_ROWS,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Execute *spec* and return its edge frame.
+
+    Parameters
+    ----------
+    spec:
+        The derivation to run.
+    left, right:
+        Input frames; *right* is required when the spec has a right key.
+    where:
+        Equality filters on left code columns, compared as integers
+        (``{"STATEFP": "13"}`` keeps rows whose STATEFP is 13 however it
+        is typed).
+    partition_rows:
+        Left rows per parallel partition.
+    max_workers:
+        Thread-pool size for partitions; defaults to ``min(8, cpu_count)``.
+
+    Returns
+    -------
+    DataFrame with ``__SOURCE__`` and ``__TARGET__`` in left-row order.
+    Rows with an invalid key, a null endpoint or no match are dropped.
+
+    """
+    needs_right = spec.right_key is not None
+    if left.empty or (needs_right and (right is None or right.empty)):
+        return empty_edges()
+
+    right_index = _RightIndex.build(right, spec) if needs_right else None
+    bounds = [
+        (start, min(start + partition_rows, len(left)))
+        for start in range(0, len(left), partition_rows)
+    ]
+    where = where or {}
+    if len(bounds) == 1:
+        parts = [
+            _match_partition(spec, left, bounds[0], right_index, where),
+        ]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=max_workers or min(8, os.cpu_count() or 1),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _match_partition,
+                    spec,
+                    left,
+                    part,
+                    right_index,
+                    where,
+                )
+                for part in bounds
+            ]
+            parts = [future.result() for future in futures]
+    left_rows = np.concatenate([p[0] for p in parts])
+    right_rows = np.concatenate([p[1] for p in parts])
+
+    def _values(endpoint: Endpoint) -> np.ndarray:
+        if endpoint.side == "left":
+            return _endpoint_values(endpoint, left, left_rows)
+        assert right is not None
+        return _endpoint_values(endpoint, right, right_rows)
+
+    return pd.DataFrame(
+        {
+            "__SOURCE__": _values(spec.source),
+            "__TARGET__": _values(spec.target),
+        },
+    )
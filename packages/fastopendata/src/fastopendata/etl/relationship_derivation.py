@@ -6,13 +6,52 @@ exists in the source files — edges are derived from column matches.
 
 Each function takes entity DataFrames as input and returns an edge
 DataFrame with ``__SOURCE__`` and ``__TARGET__`` columns suitable for
-:meth:`GraphPipeline.add_relationship_dataframe`.
+:meth:`GraphPipeline.add_relationship_dataframe`.  The joins themselves
+are declared as :class:`~fastopendata.etl.derivation_engine.DerivationSpec`
+constants and executed by the columnar engine in
+:mod:`fastopendata.etl.derivation_engine`, which compares FIPS codes as
+integers — so ``6``, ``6.0``, ``"6"`` and ``"06"`` all match.
 """
 
 from __future__ import annotations
 
 import pandas as pd
 
+from fastopendata.etl.derivation_engine import (
+    DerivationSpec,
+    Endpoint,
+    KeySpec,
+    empty_edges,
+    run_derivation,
+)
+
+_STATE = KeySpec((("STATEFP", 2),))
+
+TRACT_STATE_SPEC = DerivationSpec(
+    left_key=_STATE,
+    right_key=_STATE,
+    source=Endpoint("left", column="GEOID"),
+    target=Endpoint("right", column="STATEFP"),
+)
+
+TRACT_PUMA_SPEC = DerivationSpec(
+    left_key=KeySpec((("STATEFP", 2), ("COUNTYFP", 3), ("TRACTCE", 6))),
+    source=Endpoint(
+        "left",
+        key=KeySpec((("STATEFP", 2), ("COUNTYFP", 3), ("TRACTCE", 6))),
+    ),
+    target=Endpoint("left", column="PUMA5CE"),
+)
+
+# Driven from the block-group side: its GEOID minus the last digit is the
+# tract GEOID.
+BLOCK_GROUP_TRACT_SPEC = DerivationSpec(
+    left_key=KeySpec((("GEOID", 12),), drop_digits=1),
+    right_key=KeySpec((("GEOID", 11),)),
+    source=Endpoint("right", column="GEOID"),
+    target=Endpoint("left", column="GEOID"),
+)
+
 
 def derive_tract_state_relationships(
     tracts_df: pd.DataFrame,
@@ -31,11 +70,7 @@ def derive_tract_state_relationships(
     -------
     DataFrame with ``__SOURCE__`` (tract GEOID) and ``__TARGET__`` (state STATEFP).
     """
-    valid_states = set(states_df["STATEFP"])
-    edges = tracts_df[["GEOID", "STATEFP"]].copy()
-    edges = edges[edges["STATEFP"].isin(valid_states)]
-    edges = edges.rename(columns={"GEOID": "__SOURCE__", "STATEFP": "__TARGET__"})
-    return edges.reset_index(drop=True)
+    return run_derivation(TRACT_STATE_SPEC, tracts_df, states_df)
 
 
 def derive_tract_puma_relationships(
@@ -49,7 +84,7 @@ def derive_tract_puma_relationships(
     ----------
     crosswalk_df:
         Tract-PUMA crosswalk DataFrame with ``STATEFP``, ``COUNTYFP``,
-        ``TRACTCE``, and ``PUMA5CE`` columns. All columns must be string type.
+        ``TRACTCE``, and ``PUMA5CE`` columns.
     state_fips:
         Optional state FIPS filter. If provided, only crosswalk rows for
         that state are included.
@@ -58,16 +93,12 @@ def derive_tract_puma_relationships(
     -------
     DataFrame with ``__SOURCE__`` (tract GEOID) and ``__TARGET__`` (PUMA code).
     """
-    df = crosswalk_df.copy()
-
-    if state_fips is not None:
-        df = df[df["STATEFP"] == state_fips]
-
-    # Build tract GEOID: STATEFP + COUNTYFP + TRACTCE
-    df["__SOURCE__"] = df["STATEFP"] + df["COUNTYFP"] + df["TRACTCE"]
-    df["__TARGET__"] = df["PUMA5CE"]
-
-    return df[["__SOURCE__", "__TARGET__"]].reset_index(drop=True)
+    # Tract GEOID is STATEFP + COUNTYFP + TRACTCE, rendered from the key.
+    return run_derivation(
+        TRACT_PUMA_SPEC,
+        crosswalk_df,
+        where=None if state_fips is None else {"STATEFP": state_fips},
+    )
 
 
 def derive_tract_block_group_relationships(
@@ -92,12 +123,7 @@ def derive_tract_block_group_relationships(
     -------
     DataFrame with ``__SOURCE__`` (tract GEOID) and ``__TARGET__`` (block group GEOID).
     """
-    valid_tracts = set(tracts_df["GEOID"])
-    bg = block_groups_df[["GEOID"]].copy()
-    bg["tract_geoid"] = bg["GEOID"].str[:11]
-    bg = bg[bg["tract_geoid"].isin(valid_tracts)]
-    edges = bg.rename(columns={"tract_geoid": "__SOURCE__", "GEOID": "__TARGET__"})
-    return edges[["__SOURCE__", "__TARGET__"]].reset_index(drop=True)
+    return run_derivation(BLOCK_GROUP_TRACT_SPEC, block_groups_df, tracts_df)
 
 
 def derive_contract_state_relationships(
@@ -125,17 +151,13 @@ def derive_contract_state_relationships(
     -------
     DataFrame with ``__SOURCE__`` (contract key) and ``__TARGET__`` (state STATEFP).
     """
-    valid_states = set(states_df["STATEFP"])
-    edges = contracts_df[["contract_transaction_unique_key", fips_column]].copy()
-    edges = edges.dropna(subset=[fips_column])
-    edges = edges[edges[fips_column].isin(valid_states)]
-    edges = edges.rename(
-        columns={
-            "contract_transaction_unique_key": "__SOURCE__",
-            fips_column: "__TARGET__",
-        }
+    spec = DerivationSpec(
+        left_key=KeySpec(((fips_column, 2),)),
+        right_key=_STATE,
+        source=Endpoint("left", column="contract_transaction_unique_key"),
+        target=Endpoint("right", column="STATEFP"),
     )
-    return edges[["__SOURCE__", "__TARGET__"]].reset_index(drop=True)
+    return run_derivation(spec, contracts_df, states_df)
 
 
 def derive_person_puma_relationships(
@@ -147,9 +169,9 @@ def derive_person_puma_relationships(
     Each ACS PUMS person record carries a ``PUMA`` code (numeric, up to 5
     digits) and a ``STATE`` FIPS code (numeric, up to 2 digits). PUMAs from
     TIGER shapefiles use ``STATEFP`` (zero-padded 2-char string) and
-    ``PUMACE20`` (zero-padded 5-char string). This function normalizes the
-    types on both sides so the join succeeds regardless of how each frame
-    was loaded.
+    ``PUMACE20`` (zero-padded 5-char string). Both sides are packed into
+    the same integer ``STATE * 10**5 + PUMA`` key, so the join succeeds
+    regardless of how each frame was loaded.
 
     Parameters
     ----------
@@ -170,49 +192,20 @@ def derive_person_puma_relationships(
     required_person_cols = {"SERIALNO", "PUMA", "STATE"}
     required_puma_cols = {"PUMACE20", "STATEFP"}
     if not required_person_cols.issubset(persons_df.columns):
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
+        return empty_edges()
     if not required_puma_cols.issubset(pumas_df.columns):
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
-
-    if persons_df.empty or pumas_df.empty:
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
-
-    # Normalize PUMA/STATE on persons: pad PUMA to 5 chars, STATE to 2 chars.
-    persons = persons_df[["SERIALNO", "PUMA", "STATE"]].copy()
-    persons = persons.dropna(subset=["PUMA", "STATE", "SERIALNO"])
-    persons["_puma_key"] = (
-        persons["PUMA"]
-        .astype(str)
-        .str.replace(r"\.0$", "", regex=True)
-        .str.zfill(5)
-    )
-    persons["_state_key"] = (
-        persons["STATE"]
-        .astype(str)
-        .str.replace(r"\.0$", "", regex=True)
-        .str.zfill(2)
-    )
+        return empty_edges()
 
-    # Normalize on PUMA frame: pick the best target id column.
     target_col = "GEOID" if "GEOID" in pumas_df.columns else (
         "GEOID20" if "GEOID20" in pumas_df.columns else "PUMACE20"
     )
-    if target_col == "PUMACE20":
-        pumas = pumas_df[["PUMACE20", "STATEFP"]].copy()
-        pumas["__TARGET__"] = pumas["PUMACE20"].astype(str)
-    else:
-        pumas = pumas_df[["PUMACE20", "STATEFP", target_col]].copy()
-        pumas = pumas.rename(columns={target_col: "__TARGET__"})
-    pumas["_puma_key"] = pumas["PUMACE20"].astype(str).str.zfill(5)
-    pumas["_state_key"] = pumas["STATEFP"].astype(str).str.zfill(2)
-
-    edges = persons.merge(
-        pumas[["_puma_key", "_state_key", "__TARGET__"]],
-        on=["_puma_key", "_state_key"],
-        how="inner",
+    spec = DerivationSpec(
+        left_key=KeySpec((("STATE", 2), ("PUMA", 5))),
+        right_key=KeySpec((("STATEFP", 2), ("PUMACE20", 5))),
+        source=Endpoint("left", column="SERIALNO"),
+        target=Endpoint("right", column=target_col),
     )
-    edges = edges.rename(columns={"SERIALNO": "__SOURCE__"})
-    return edges[["__SOURCE__", "__TARGET__"]].reset_index(drop=True)
+    return run_derivation(spec, persons_df, pumas_df)
 
 
 def derive_county_state_relationships(
@@ -229,8 +222,8 @@ def derive_county_state_relationships(
     and drops counties whose state isn't represented in ``states_df``.
 
     Type normalization: county FIPS may be an int from pandas auto-inference
-    (which loses leading zeros) or a zero-padded string. Inputs are coerced
-    to zero-padded 5-char strings before slicing.
+    (which loses leading zeros) or a zero-padded string. Both are compared
+    as integers and written back as zero-padded 5-char strings.
 
     Parameters
     ----------
@@ -250,26 +243,16 @@ def derive_county_state_relationships(
     either input, an empty edge DataFrame is returned.
     """
     if county_fips_col not in county_df.columns:
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
+        return empty_edges()
     if "STATEFP" not in states_df.columns:
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
-    if county_df.empty or states_df.empty:
-        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
-
-    # Normalize county FIPS to zero-padded 5-char string. Strips a trailing
-    # ``.0`` if pandas read the column as float.
-    county_keys = (
-        county_df[county_fips_col]
-        .astype(str)
-        .str.replace(r"\.0$", "", regex=True)
-        .str.zfill(5)
+        return empty_edges()
+
+    county = KeySpec(((county_fips_col, 5),))
+    spec = DerivationSpec(
+        # The first two of the five county digits are the state FIPS.
+        left_key=KeySpec(county.parts, drop_digits=3),
+        right_key=_STATE,
+        source=Endpoint("left", key=county),
+        target=Endpoint("right", key=_STATE),
     )
-    state_prefix = county_keys.str[:2]
-    valid_states = set(states_df["STATEFP"].astype(str).str.zfill(2))
-
-    edges = pd.DataFrame({
-        "__SOURCE__": county_keys,
-        "__TARGET__": state_prefix,
-    })
-    edges = edges[edges["__TARGET__"].isin(valid_states)]
-    return edges.reset_index(drop=True)
+    return run_derivation(spec, county_df, states_df)
@@ -223,6 +223,16 @@ CONTRACT_AWARDED_IN_STATE_SCHEMA = RelationshipSchema(
     description="Contract awarded to recipient in a state",
 )
 
+OSM_NODE_IN_TRACT_SCHEMA = RelationshipSchema(
+    relationship_type="IN_TRACT",
+    source_entity="OsmNode",
+    target_entity="CensusTract",
+    source_col="__SOURCE__",
+    target_col="__TARGET__",
+    derivation="OsmNode (longitude, latitude) within CensusTract.geometry",
+    description="OpenStreetMap node lies inside a census tract",
+)
+
 
 # ---------------------------------------------------------------------------
 # Schema collections for pipeline construction
@@ -243,4 +253,5 @@ ALL_RELATIONSHIP_SCHEMAS: tuple[RelationshipSchema, ...] = (
     TRACT_CONTAINS_BLOCK_GROUP_SCHEMA,
     CONTRACT_PERFORMED_IN_STATE_SCHEMA,
     CONTRACT_AWARDED_IN_STATE_SCHEMA,
+    OSM_NODE_IN_TRACT_SCHEMA,
 )
@@ -0,0 +1,248 @@
+"""Derive graph relationships by point-in-polygon joins.
+
+Unlike the FIPS joins in :mod:`fastopendata.etl.relationship_derivation`,
+OSM nodes carry only coordinates, so their tract is found geometrically:
+the tract polygons (WKB ``geometry`` column, as kept by the shapefile
+loader) are bulk-loaded once into a :class:`pycypher.spatial.SpatialIndex`
+and the points are probed against it in large chunks on a thread pool.
+
+Two entry points:
+
+* :func:`derive_point_tract_relationships` — in-memory points, returns
+  an ``IN_TRACT`` edge DataFrame for
+  :meth:`GraphPipeline.add_relationship_dataframe`.
+* :func:`stream_points_to_tracts` — streams a Parquet point file of any
+  size, writing each point row with its tract's attributes to a Parquet
+  crosswalk (the ``united_states_nodes_tract_crosswalk.parquet`` product).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from pycypher.constants import ID_COLUMN
+from pycypher.spatial import SpatialIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_logger = logging.getLogger(__name__)
+
+#: Points probed per task.  Large enough that per-task overhead vanishes,
+#: small enough that a few in-flight chunks fit comfortably in memory.
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def _default_workers() -> int:
+    return min(8, os.cpu_count() or 1)
+
+
+def build_tract_index(
+    tracts_df: pd.DataFrame,
+    *,
+    geometry_col: str = "geometry",
+) -> SpatialIndex:
+    """Bulk-load the STR-tree over tract polygons.
+
+    The index's IDs are row positions in *tracts_df*, so matches can be
+    turned into any tract column with a single ``take``.
+
+    Parameters
+    ----------
+    tracts_df:
+        Tract DataFrame with a WKB geometry column.
+    geometry_col:
+        Column holding WKB polygons.
+
+    """
+    return SpatialIndex.build(
+        "CensusTract",
+        geometry_col,
+        pd.DataFrame(
+            {
+                ID_COLUMN: np.arange(len(tracts_df)),
+                geometry_col: tracts_df[geometry_col].to_numpy(),
+            },
+        ),
+    )
+
+
+def _probe(
+    index: SpatialIndex,
+    points: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+) -> tuple[np.ndarray, np.ndarray]:
+    x = pd.to_numeric(points[x_col], errors="coerce").to_numpy(
+        dtype=np.float64,
+    )
+    y = pd.to_numeric(points[y_col], errors="coerce").to_numpy(
+        dtype=np.float64,
+    )
+    return index.query_points(x, y, batch_size=len(x) or 1)
+
+
+def derive_point_tract_relationships(  # noqa: PLR0913
+    points_df: pd.DataFrame,
+    tracts_df: pd.DataFrame,
+    *,
+    id_col: str = "id",
+    x_col: str = "longitude",
+    y_col: str = "latitude",
+    tract_id_col: str = "GEOID",
+    geometry_col: str = "geometry",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """Create IN_TRACT edges: point entity → CensusTract containing it.
+
+    Parameters
+    ----------
+    points_df:
+        Point DataFrame (e.g. OSM nodes) with ID and coordinate columns.
+    tracts_df:
+        Census tract DataFrame with ``GEOID`` and WKB ``geometry``.
+    id_col, x_col, y_col:
+        Point ID, longitude and latitude columns.
+    tract_id_col, geometry_col:
+        Tract ID and WKB polygon columns.
+    chunk_size:
+        Points per parallel task.
+    max_workers:
+        Thread-pool size; defaults to ``min(8, cpu_count)``.
+
+    Returns
+    -------
+    DataFrame with ``__SOURCE__`` (point ID) and ``__TARGET__`` (tract
+    GEOID), in point order.  Points outside every tract, or with missing
+    coordinates, produce no edge; points on a shared boundary produce one.
+    The result is empty when *tracts_df* has no geometry column.
+
+    """
+    if geometry_col not in tracts_df.columns:
+        return pd.DataFrame(columns=["__SOURCE__", "__TARGET__"])
+    index = build_tract_index(tracts_df, geometry_col=geometry_col)
+    starts = range(0, len(points_df), chunk_size)
+    with ThreadPoolExecutor(
+        max_workers=max_workers or _default_workers(),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _probe,
+                index,
+                points_df.iloc[start : start + chunk_size],
+                x_col,
+                y_col,
+            )
+            for start in starts
+        ]
+        parts = [
+            (start + positions, tract_rows)
+            for start, (positions, tract_rows) in zip(
+                starts,
+                (f.result() for f in futures),
+                strict=True,
+            )
+        ]
+
+    empty = np.array([], dtype=np.int64)
+    positions = np.concatenate([p for p, _ in parts] or [empty])
+    tract_rows = np.concatenate([t for _, t in parts] or [empty])
+    _logger.debug(
+        "IN_TRACT: %d of %d points matched %d tracts",
+        len(positions),
+        len(points_df),
+        index.size,
+    )
+    return pd.DataFrame(
+        {
+            "__SOURCE__": points_df[id_col].to_numpy()[positions],
+            "__TARGET__": tracts_df[tract_id_col].to_numpy()[tract_rows],
+        },
+    )
+
+
+def _join_chunk(
+    index: SpatialIndex,
+    tract_attributes: pd.DataFrame,
+    points: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+) -> pd.DataFrame:
+    positions, tract_rows = _probe(index, points, x_col, y_col)
+    matched = points.iloc[positions].drop(columns=[x_col, y_col])
+    matched = matched.reset_index(drop=True)
+    attributes = tract_attributes.iloc[tract_rows].reset_index(drop=True)
+    return pd.concat([matched, attributes], axis=1)
+
+
+def stream_points_to_tracts(  # noqa: PLR0913
+    points_path: Path,
+    tracts_df: pd.DataFrame,
+    output_path: Path,
+    *,
+    x_col: str = "longitude",
+    y_col: str = "latitude",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> int:
+    """Join a Parquet point file to tracts, streaming to a Parquet file.
+
+    Row groups are read in ``chunk_size`` batches and probed on a thread
+    pool with a bounded number of chunks in flight, so memory stays flat
+    however large the input.  Output rows are written in input order and
+    hold the point's columns (minus its coordinates) followed by the
+    matched tract's attribute columns (minus its geometry).
+
+    Returns
+    -------
+    Number of rows written.
+
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    index = build_tract_index(tracts_df)
+    tract_attributes = tracts_df.drop(columns=["geometry"])
+    workers = max_workers or _default_workers()
+    pending: deque[Future[pd.DataFrame]] = deque()
+    writer: pq.ParquetWriter | None = None
+    written = 0
+
+    def _drain(limit: int) -> None:
+        nonlocal writer, written
+        while len(pending) > limit:
+            joined = pending.popleft().result()
+            table = pa.Table.from_pandas(joined, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output_path, table.schema)
+            writer.write_table(table)
+            written += len(joined)
+            _logger.info("join to tract rows written: %d", written)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            source = pq.ParquetFile(points_path)
+            for batch in source.iter_batches(batch_size=chunk_size):
+                pending.append(
+                    executor.submit(
+                        _join_chunk,
+                        index,
+                        tract_attributes,
+                        batch.to_pandas(),
+                        x_col,
+                        y_col,
+                    ),
+                )
+                _drain(2 * workers)
+            _drain(0)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
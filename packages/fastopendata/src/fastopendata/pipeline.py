@@ -40,8 +40,17 @@ For streaming pipelines, records can be ingested incrementally::
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
 import pandas as pd
@@ -128,6 +137,14 @@ _OSM_DEFAULT_MAX_ROWS = 100_000
 
 _OSM_DATASETS = frozenset({"osm_us"})
 
+# Typed Parquet copies of source tables live in this subdirectory of the
+# data directory unless ``load_available_datasets`` is given another one.
+_PARQUET_CACHE_DIRNAME = ".parquet_cache"
+
+# Loader thread-pool size: reading is mostly I/O and GIL-free parsing, so
+# a few more threads than cores keeps the disks busy.
+_DEFAULT_LOAD_WORKERS = min(16, (os.cpu_count() or 1) + 4)
+
 # Mapping from pandas dtypes to schema FieldTypes
 _DTYPE_MAP: dict[str, FieldType] = {
     "int64": FieldType.INTEGER,
@@ -157,11 +174,13 @@ def _load_shapefile_as_entity(
     entity_type: str,
     id_col: str,
 ) -> pd.DataFrame | None:
-    """Load a TIGER/Line shapefile as a plain DataFrame (geometry dropped).
+    """Load a TIGER/Line shapefile as a plain DataFrame.
 
-    Reads ``filepath`` with geopandas, drops the ``geometry`` column, and
-    returns a plain pandas DataFrame suitable for adding to a
-    :class:`GraphPipeline` as an entity table.
+    Reads ``filepath`` with geopandas and returns a plain pandas DataFrame
+    suitable for adding to a :class:`GraphPipeline` as an entity table.
+    The ``geometry`` column is kept as WKB ``bytes`` so that it survives
+    the Parquet cache and can be indexed by pycypher's spatial functions
+    (``point.withinPolygon``, ``CALL spatial.pointInPolygon``).
 
     Parameters
     ----------
@@ -177,8 +196,8 @@ def _load_shapefile_as_entity(
     Returns
     -------
     pandas.DataFrame or None
-        The shapefile's attribute table without geometry, or *None* if
-        geopandas is not installed (a warning is logged in that case).
+        The shapefile's attribute table plus WKB ``geometry``, or *None*
+        if geopandas is not installed (a warning is logged in that case).
 
     """
     try:
@@ -194,6 +213,8 @@ def _load_shapefile_as_entity(
 
     gdf = gpd.read_file(filepath)
     df = pd.DataFrame(gdf.drop(columns="geometry", errors="ignore"))
+    if "geometry" in gdf.columns:
+        df["geometry"] = gdf.geometry.to_wkb().to_numpy()
     _logger.debug(
         "Loaded shapefile %s: %d rows, id_col=%s, entity_type=%s",
         filepath,
@@ -232,6 +253,7 @@ class GraphPipeline:
         self._entity_id_cols: dict[str, str | None] = {}
         self._schema_registry = schema_registry
         self._lineage = LineageGraph()
+        self._load_timings: list[DatasetTiming] = []
 
     # ── Batch ingestion ──────────────────────────────────────────────
 
@@ -578,6 +600,11 @@ class GraphPipeline:
 
     # ── Inspection ───────────────────────────────────────────────────
 
+    @property
+    def load_timings(self) -> list[DatasetTiming]:
+        """Per-dataset timings recorded by :func:`load_available_datasets`."""
+        return list(self._load_timings)
+
     @property
     def lineage(self) -> LineageGraph:
         """Return the data lineage graph tracking pipeline data flow."""
@@ -604,155 +631,234 @@ class GraphPipeline:
         return len(entry[0]) if entry is not None else 0
 
 
-def load_available_datasets(
-    data_dir: Path | None = None,
-    *,
-    max_rows: int | None = None,
-) -> GraphPipeline:
-    """Discover and load available CSV datasets from the data directory.
-
-    Scans the configured data directory for CSV output files listed in
-    ``config.datasets`` and loads each one as an entity type in a
-    :class:`GraphPipeline`.  Datasets whose output files do not exist
-    (i.e. not yet downloaded via Snakemake) are silently skipped.
+@dataclass(frozen=True)
+class DatasetTiming:
+    """Wall-clock cost of one step of :func:`load_available_datasets`.
 
-    Parameters
+    Attributes
     ----------
-    data_dir:
-        Override the data directory from config. If *None*, uses
-        ``config.data_dir``.
-    max_rows:
-        Optional row limit per dataset (useful for development/preview).
+    name:
+        Entity or relationship type the step produced.
+    kind:
+        ``"entity"`` or ``"relationship"``.
+    rows:
+        Number of rows (entities or edges) produced.
+    seconds:
+        Time spent reading or deriving, measured on the worker thread.
+    cached:
+        Whether the entity table was served from the Parquet cache.
+
+    """
+
+    name: str
+    kind: str
+    rows: int
+    seconds: float
+    cached: bool = False
+
+
+def _parquet_cache_key(
+    sources: Sequence[Path],
+    options: str,
+) -> tuple[str, str]:
+    """Hash *sources* and their read options for the Parquet cache.
 
     Returns
     -------
-    GraphPipeline
-        A pipeline with all discovered datasets loaded as entity types.
+    tuple
+        ``(identity, version)``: a hash of the resolved source paths plus
+        *options*, and a hash of the sources' mtimes and sizes.
 
     """
-    from fastopendata.config import config
+    identity = hashlib.sha1(options.encode("utf-8"), usedforsecurity=False)
+    version = hashlib.sha1(usedforsecurity=False)
+    for source in sources:
+        stat = source.stat()
+        identity.update(f"|{source.resolve()}".encode())
+        version.update(f"|{stat.st_mtime_ns}|{stat.st_size}".encode())
+    return identity.hexdigest()[:16], version.hexdigest()[:16]
+
+
+def _cached_read(
+    cache_dir: Path | None,
+    sources: Sequence[Path],
+    options: str,
+    read: Callable[[], pd.DataFrame | None],
+) -> tuple[pd.DataFrame | None, bool]:
+    """Return ``read()``, going through a typed Parquet copy when possible.
+
+    The copy lives in *cache_dir* under a name derived from the first
+    source's stem, a hash of every source's path plus *options* (row
+    limits, column selection) and a hash of their mtimes and sizes, so an
+    edited source file or a different ``max_rows`` never serves stale
+    rows.  Older versions of the same sources read with the same options
+    are removed when a new one is written.  Frames that
+    Parquet cannot represent (mixed-type object columns) are simply not
+    cached.
 
-    if data_dir is None:
-        data_dir = config.data_path
-    else:
-        data_dir = Path(data_dir)
+    Returns
+    -------
+    tuple
+        ``(frame, served_from_cache)``.
 
-    pipeline = GraphPipeline()
-    loaded = 0
+    """
+    if cache_dir is None:
+        return read(), False
 
-    for name, dataset in config.datasets.items():
-        if not dataset.output_file:
-            continue
+    identity, version = _parquet_cache_key(sources, options)
+    prefix = f"{sources[0].stem}.{identity}"
+    cache_path = cache_dir / f"{prefix}.{version}.parquet"
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path), True
+        except Exception:
+            _logger.warning(
+                "Ignoring unreadable Parquet cache %s", cache_path,
+                exc_info=True,
+            )
 
-        # ACS PUMS person CSVs have 500+ columns; load them in the
-        # dedicated branch below with explicit column selection.
-        if name in _ACS_PUMS_DATASETS:
-            continue
+    df = read()
+    if df is None:
+        return None, False
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        staging = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        df.to_parquet(staging, index=False)
+        staging.replace(cache_path)
+        for stale in cache_dir.glob(f"{prefix}.*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        _logger.debug(
+            "Could not cache %s as Parquet", sources[0], exc_info=True,
+        )
+    return df, False
 
-        # CJARS county job offers — handled in a dedicated branch below
-        # so it registers as ``CountyJobOffers`` (not the autogenerated
-        # ``Cjars2022``) and gets ``dtype=str`` for FIPS columns.
-        if name in _CJARS_DATASETS:
-            continue
 
-        # OSM U.S. nodes — 500M+ row file. Handled via the DuckDB branch
-        # below to avoid loading the full CSV into pandas memory.
-        if name in _OSM_DATASETS:
-            continue
+def _shapefile_sources(shp_path: Path) -> list[Path]:
+    """Return the shapefile and its attribute table, if present."""
+    dbf_path = shp_path.with_suffix(".dbf")
+    return [shp_path, dbf_path] if dbf_path.exists() else [shp_path]
 
-        filepath = data_dir / dataset.output_file
-        if not filepath.exists():
-            continue
 
-        if dataset.format.upper() not in ("CSV", "PBF/CSV"):
-            continue
+# Loader results: ``(frame, id_col, served_from_cache, seconds)``.
+_Loaded = tuple[pd.DataFrame | None, str | None, bool, float]
 
-        try:
-            read_kwargs: dict[str, Any] = {}
-            if max_rows is not None:
-                read_kwargs["nrows"] = max_rows
 
-            df = pd.read_csv(filepath, **read_kwargs)
+def _timed(
+    load: Callable[[], tuple[pd.DataFrame | None, str | None, bool]],
+) -> Callable[[], _Loaded]:
+    """Wrap a loader so it also reports its own wall-clock time."""
 
-            # Use dataset name as entity type, converting to PascalCase
-            entity_type = name.replace("_", " ").title().replace(" ", "")
+    def _run() -> _Loaded:
+        started = time.perf_counter()
+        df, id_col, cached = load()
+        return df, id_col, cached, time.perf_counter() - started
 
-            # Auto-detect or generate an ID column
-            id_col: str | None = None
-            if "__ID__" in df.columns:
-                id_col = "__ID__"
+    return _run
 
-            pipeline.add_entity_dataframe(entity_type, df, id_col=id_col)
-            loaded += 1
-            _logger.info(
-                "Loaded dataset %s: %d rows as entity type %s",
-                name,
-                len(df),
-                entity_type,
-            )
-        except Exception:
-            _logger.exception("Failed to load dataset %s from %s", name, filepath)
-
-    # Second pass: discover and load TIGER/Line shapefiles as geographic
-    # entities.  Per-state files are concatenated so each entity type is
-    # registered exactly once even when multiple states are present.
-    #
-    # File pattern → (entity_type, id_col)
-    shapefile_specs: list[tuple[str, str, str]] = [
-        ("tl_2025_*_tract.shp", "CensusTract", "GEOID"),
-        ("tl_2024_*_bg.shp", "BlockGroup", "GEOID"),
-        ("tl_2024_*_puma20.shp", "Puma", "PUMACE20"),
-    ]
 
-    for pattern, entity_type, id_col in shapefile_specs:
-        matches = sorted(data_dir.glob(pattern))
-        if not matches:
-            continue
+def _load_generic_csv(
+    name: str,
+    filepath: Path,
+    max_rows: int | None,
+    cache_dir: Path | None,
+) -> tuple[pd.DataFrame | None, str | None, bool]:
+    """Load one configured CSV dataset (generic branch)."""
+    try:
+        read_kwargs: dict[str, Any] = {}
+        if max_rows is not None:
+            read_kwargs["nrows"] = max_rows
+
+        df, cached = _cached_read(
+            cache_dir,
+            [filepath],
+            f"csv|nrows={max_rows}",
+            lambda: pd.read_csv(filepath, **read_kwargs),
+        )
+        # Auto-detect or generate an ID column
+        id_col = "__ID__" if "__ID__" in df.columns else None
+        return df, id_col, cached
+    except Exception:
+        _logger.exception("Failed to load dataset %s from %s", name, filepath)
+        return None, None, False
 
-        frames: list[pd.DataFrame] = []
-        for shp_path in matches:
-            try:
-                df = _load_shapefile_as_entity(shp_path, entity_type, id_col)
-            except Exception:
-                _logger.exception(
-                    "Failed to load shapefile %s as %s", shp_path, entity_type,
-                )
-                continue
-            if df is None:
-                # geopandas unavailable — warning already logged.  Bail out
-                # of this entity type entirely; subsequent shapefiles will
-                # also fail for the same reason.
-                frames = []
-                break
-            frames.append(df)
 
-        if not frames:
-            continue
+def _load_shapefile(
+    shp_path: Path,
+    entity_type: str,
+    id_col: str,
+    cache_dir: Path | None,
+) -> tuple[pd.DataFrame | None, str | None, bool]:
+    """Load one TIGER/Line shapefile's attribute table."""
+    df, cached = _cached_read(
+        cache_dir,
+        _shapefile_sources(shp_path),
+        "shapefile",
+        lambda: _load_shapefile_as_entity(shp_path, entity_type, id_col),
+    )
+    return df, id_col, cached
 
-        if len(frames) == 1:
-            combined = frames[0]
-        else:
-            combined = pd.concat(frames, ignore_index=True)
 
+def _combine_shapefiles(
+    entity_type: str,
+    paths: list[Path],
+    parts: list[Future[_Loaded]],
+) -> _Loaded:
+    """Concatenate per-state shapefile frames into one entity table.
+
+    Runs on the loader pool after the per-file futures were submitted, so
+    waiting on them cannot deadlock the pool.
+    """
+    started = time.perf_counter()
+    frames: list[pd.DataFrame] = []
+    id_col: str | None = None
+    all_cached = True
+    # The files were read concurrently, so the slowest one is the cost.
+    slowest = 0.0
+    for shp_path, part in zip(paths, parts):
         try:
-            pipeline.add_entity_dataframe(entity_type, combined, id_col=id_col)
-            loaded += 1
-            _logger.info(
-                "Loaded %d shapefile(s) as entity type %s: %d rows",
-                len(frames),
-                entity_type,
-                len(combined),
-            )
+            df, id_col, cached, seconds = part.result()
         except Exception:
             _logger.exception(
-                "Failed to register shapefile entity %s", entity_type,
+                "Failed to load shapefile %s as %s", shp_path, entity_type,
             )
+            continue
+        if df is None:
+            # geopandas unavailable — warning already logged.  The other
+            # shapefiles of this entity type fail for the same reason.
+            return None, None, False, 0.0
+        frames.append(df)
+        all_cached = all_cached and cached
+        slowest = max(slowest, seconds)
+
+    if not frames:
+        return None, None, False, 0.0
+    if len(frames) == 1:
+        combined = frames[0]
+    else:
+        combined = pd.concat(frames, ignore_index=True)
+    _logger.info(
+        "Loaded %d shapefile(s) as entity type %s: %d rows",
+        len(frames),
+        entity_type,
+        len(combined),
+    )
+    seconds = slowest + time.perf_counter() - started
+    return combined, id_col, all_cached, seconds
 
-    # ── ACS PUMS person records ──────────────────────────────────────
-    # Loaded outside the generic CSV loop so we can pass ``usecols`` —
-    # the source file has 500+ columns and we only need ~13 demographic
-    # fields. The 1-year file is preferred when both 1yr and 5yr are
-    # present (first match wins to avoid double-registering Person).
+
+def _load_acs_pums(
+    data_dir: Path,
+    max_rows: int | None,
+    cache_dir: Path | None,
+) -> tuple[pd.DataFrame | None, str | None, bool]:
+    """Load ACS PUMS person records with explicit column selection.
+
+    The source file has 500+ columns and only ~13 demographic fields are
+    needed.  The 1-year file is preferred when both 1yr and 5yr are present
+    (first match wins to avoid double-registering Person).
+    """
     for pums_filename in _ACS_PUMS_FILES:
         pums_path = data_dir / pums_filename
         if not pums_path.exists():
@@ -773,25 +879,37 @@ def load_available_datasets(
             if max_rows is not None:
                 read_kwargs["nrows"] = max_rows
 
-            persons_df = pd.read_csv(pums_path, **read_kwargs)
-            id_col_persons = "SERIALNO" if "SERIALNO" in persons_df.columns else None
-            pipeline.add_entity_dataframe(
-                "Person", persons_df, id_col=id_col_persons,
+            persons_df, cached = _cached_read(
+                cache_dir,
+                [pums_path],
+                f"pums|{usecols}|nrows={max_rows}",
+                lambda: pd.read_csv(pums_path, **read_kwargs),
+            )
+            id_col_persons = (
+                "SERIALNO" if "SERIALNO" in persons_df.columns else None
             )
-            loaded += 1
             _logger.info(
                 "Loaded ACS PUMS persons from %s: %d rows, %d columns as entity type Person",
                 pums_filename,
                 len(persons_df),
                 len(persons_df.columns),
             )
-            break  # First match wins.
+            return persons_df, id_col_persons, cached  # First match wins.
         except Exception:
             _logger.exception("Failed to load ACS PUMS persons from %s", pums_path)
+    return None, None, False
 
-    # ── CJARS county job offers ──────────────────────────────────────
-    # Small CSV (~25 MB) — load all columns, but force string dtype for
-    # FIPS columns so leading-zero state codes (e.g. "01" Alabama) survive.
+
+def _load_cjars(
+    data_dir: Path,
+    max_rows: int | None,
+    cache_dir: Path | None,
+) -> tuple[pd.DataFrame | None, str | None, bool]:
+    """Load CJARS county job offers with string-typed FIPS columns.
+
+    Small CSV (~25 MB) — load all columns, but force string dtype for FIPS
+    columns so leading-zero state codes (e.g. "01" Alabama) survive.
+    """
     for cjars_filename in _CJARS_FILES:
         cjars_path = data_dir / cjars_filename
         if not cjars_path.exists():
@@ -809,14 +927,15 @@ def load_available_datasets(
             if max_rows is not None:
                 read_kwargs["nrows"] = max_rows
 
-            cjars_df = pd.read_csv(cjars_path, **read_kwargs)
+            cjars_df, cached = _cached_read(
+                cache_dir,
+                [cjars_path],
+                f"cjars|{sorted(dtype_map)}|nrows={max_rows}",
+                lambda: pd.read_csv(cjars_path, **read_kwargs),
+            )
             id_col_cjars = (
                 "county_fips" if "county_fips" in cjars_df.columns else None
             )
-            pipeline.add_entity_dataframe(
-                "CountyJobOffers", cjars_df, id_col=id_col_cjars,
-            )
-            loaded += 1
             _logger.info(
                 "Loaded CJARS county job offers from %s: %d rows, %d columns "
                 "as entity type CountyJobOffers",
@@ -824,19 +943,28 @@ def load_available_datasets(
                 len(cjars_df),
                 len(cjars_df.columns),
             )
-            break  # First match wins.
+            return cjars_df, id_col_cjars, cached  # First match wins.
         except Exception:
             _logger.exception(
                 "Failed to load CJARS county job offers from %s", cjars_path,
             )
-
-    # ── OSM U.S. nodes ──────────────────────────────────────────────
-    # The full file is 10 GB / 500M+ rows so we load via DuckDB's CSV
-    # streaming reader with column projection + LIMIT pushdown rather than
-    # ``pd.read_csv``. Default cap of 100K rows for dev; production callers
-    # can pass ``max_rows=None`` (the explicit "load everything" signal) by
-    # working around the ``load_available_datasets`` API — set
-    # ``max_rows=0`` is treated as "use the OSM dev cap of 100K".
+    return None, None, False
+
+
+def _load_osm_nodes(
+    data_dir: Path,
+    max_rows: int | None,
+    cache_dir: Path | None,
+) -> tuple[pd.DataFrame | None, str | None, bool]:
+    """Load the OSM U.S. node extract through DuckDB's streaming reader.
+
+    The full file is 10 GB / 500M+ rows so we load via DuckDB's CSV
+    streaming reader with column projection + LIMIT pushdown rather than
+    ``pd.read_csv``. Default cap of 100K rows for dev; production callers
+    can pass ``max_rows=None`` (the explicit "load everything" signal) by
+    working around the ``load_available_datasets`` API — set
+    ``max_rows=0`` is treated as "use the OSM dev cap of 100K".
+    """
     osm_max_rows = (
         max_rows if (max_rows is not None and max_rows > 0)
         else _OSM_DEFAULT_MAX_ROWS
@@ -853,20 +981,24 @@ def load_available_datasets(
             # don't break the SQL string. DuckDB accepts SQL-style quoting.
             sql_path = str(osm_path).replace("'", "''")
             col_list = ", ".join(_OSM_COLS)
-            con = duckdb.connect(":memory:")
-            try:
-                osm_df = con.execute(
-                    f"SELECT {col_list} FROM read_csv_auto('{sql_path}') "
-                    f"LIMIT {osm_max_rows}"
-                ).df()
-            finally:
-                con.close()
 
-            id_col_osm = "id" if "id" in osm_df.columns else None
-            pipeline.add_entity_dataframe(
-                "OsmNode", osm_df, id_col=id_col_osm,
+            def _read() -> pd.DataFrame:
+                con = duckdb.connect(":memory:")
+                try:
+                    return con.execute(
+                        f"SELECT {col_list} FROM read_csv_auto('{sql_path}') "
+                        f"LIMIT {osm_max_rows}"
+                    ).df()
+                finally:
+                    con.close()
+
+            osm_df, cached = _cached_read(
+                cache_dir,
+                [osm_path],
+                f"osm|{col_list}|limit={osm_max_rows}",
+                _read,
             )
-            loaded += 1
+            id_col_osm = "id" if "id" in osm_df.columns else None
             limit_note = (
                 f"dev limit: {osm_max_rows}"
                 if max_rows is None or max_rows == 0
@@ -880,190 +1012,437 @@ def load_available_datasets(
                 len(osm_df.columns),
                 limit_note,
             )
-            break  # First match wins.
+            return osm_df, id_col_osm, cached  # First match wins.
         except Exception:
             _logger.exception(
                 "Failed to load OSM nodes from %s", osm_path,
             )
+    return None, None, False
+
 
-    # ── Derive relationships from loaded entities ────────────────────
-    # All edges in the fastopendata graph are computed at load time by
-    # joining FIPS / GEOID columns across entity tables. We inspect what
-    # has been loaded and invoke the matching derive_* helpers; missing
-    # entities cause silent skips so partial datasets still load cleanly.
-    relationships_added = _derive_relationships(pipeline)
+def load_available_datasets(
+    data_dir: Path | None = None,
+    *,
+    max_rows: int | None = None,
+    max_workers: int | None = None,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+) -> GraphPipeline:
+    """Discover and load available CSV datasets from the data directory.
+
+    Scans the configured data directory for CSV output files listed in
+    ``config.datasets`` and loads each one as an entity type in a
+    :class:`GraphPipeline`.  Datasets whose output files do not exist
+    (i.e. not yet downloaded via Snakemake) are silently skipped.
+
+    Independent datasets (and the individual per-state shapefiles) are
+    read concurrently on a thread pool; the CSV, Parquet and DuckDB
+    readers release the GIL for the bulk of the work.  Each relationship
+    derivation is submitted to the same pool and starts as soon as the
+    entity tables it joins have loaded.  Entities and relationships are
+    still registered in a fixed order, so the resulting pipeline does not
+    depend on thread scheduling.  Per-step timings are available from
+    :attr:`GraphPipeline.load_timings`.
+
+    Parameters
+    ----------
+    data_dir:
+        Override the data directory from config. If *None*, uses
+        ``config.data_dir``.
+    max_rows:
+        Optional row limit per dataset (useful for development/preview).
+    max_workers:
+        Size of the loader thread pool.  Defaults to
+        :data:`_DEFAULT_LOAD_WORKERS`; ``1`` loads sequentially.
+    cache_dir:
+        Directory for typed Parquet copies of each source table, keyed
+        by source path, mtime and size.  Defaults to
+        ``<data_dir>/.parquet_cache``.
+    use_cache:
+        Set to *False* to always read the source files.
+
+    Returns
+    -------
+    GraphPipeline
+        A pipeline with all discovered datasets loaded as entity types.
+
+    """
+    from fastopendata.config import config
+
+    if data_dir is None:
+        data_dir = config.data_path
+    else:
+        data_dir = Path(data_dir)
+
+    if not use_cache:
+        cache_dir = None
+    elif cache_dir is None:
+        cache_dir = data_dir / _PARQUET_CACHE_DIRNAME
+    else:
+        cache_dir = Path(cache_dir)
+
+    started = time.perf_counter()
+    pipeline = GraphPipeline()
+    loaded = 0
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or _DEFAULT_LOAD_WORKERS,
+        thread_name_prefix="fastopendata-load",
+    ) as pool:
+        # Registration order: generic CSVs, shapefiles, ACS PUMS, CJARS,
+        # OSM — the order the loader has always used.
+        pending: list[tuple[str, Future[_Loaded]]] = []
+
+        for name, dataset in config.datasets.items():
+            if not dataset.output_file:
+                continue
+
+            # ACS PUMS person CSVs have 500+ columns; load them in the
+            # dedicated branch below with explicit column selection.
+            if name in _ACS_PUMS_DATASETS:
+                continue
+
+            # CJARS county job offers — handled in a dedicated branch below
+            # so it registers as ``CountyJobOffers`` (not the autogenerated
+            # ``Cjars2022``) and gets ``dtype=str`` for FIPS columns.
+            if name in _CJARS_DATASETS:
+                continue
+
+            # OSM U.S. nodes — 500M+ row file. Handled via the DuckDB branch
+            # below to avoid loading the full CSV into pandas memory.
+            if name in _OSM_DATASETS:
+                continue
+
+            filepath = data_dir / dataset.output_file
+            if not filepath.exists():
+                continue
+
+            if dataset.format.upper() not in ("CSV", "PBF/CSV"):
+                continue
+
+            # Use dataset name as entity type, converting to PascalCase
+            entity_type = name.replace("_", " ").title().replace(" ", "")
+            pending.append((
+                entity_type,
+                pool.submit(_timed(partial(
+                    _load_generic_csv, name, filepath, max_rows, cache_dir,
+                ))),
+            ))
+
+        # TIGER/Line shapefiles as geographic entities.  Per-state files
+        # are read in parallel and concatenated so each entity type is
+        # registered exactly once even when multiple states are present.
+        #
+        # File pattern → (entity_type, id_col)
+        shapefile_specs: list[tuple[str, str, str]] = [
+            ("tl_2025_*_tract.shp", "CensusTract", "GEOID"),
+            ("tl_2024_*_bg.shp", "BlockGroup", "GEOID"),
+            ("tl_2024_*_puma20.shp", "Puma", "PUMACE20"),
+        ]
+        for pattern, entity_type, id_col in shapefile_specs:
+            matches = sorted(data_dir.glob(pattern))
+            if not matches:
+                continue
+            parts = [
+                pool.submit(_timed(partial(
+                    _load_shapefile, shp_path, entity_type, id_col, cache_dir,
+                )))
+                for shp_path in matches
+            ]
+            pending.append((
+                entity_type,
+                pool.submit(
+                    _combine_shapefiles, entity_type, matches, parts,
+                ),
+            ))
+
+        for entity_type, loader in (
+            ("Person", _load_acs_pums),
+            ("CountyJobOffers", _load_cjars),
+            ("OsmNode", _load_osm_nodes),
+        ):
+            pending.append((
+                entity_type,
+                pool.submit(_timed(partial(
+                    loader, data_dir, max_rows, cache_dir,
+                ))),
+            ))
+
+        # Start every derivation now; each waits on its own inputs only.
+        frame_futures: dict[str, list[Future[_Loaded]]] = {}
+        for entity_type, future in pending:
+            frame_futures.setdefault(entity_type, []).append(future)
+        derivations = _submit_derivations(pool, frame_futures)
+
+        for entity_type, future in pending:
+            try:
+                df, id_col, cached, seconds = future.result()
+            except Exception:
+                _logger.exception("Failed to load entity %s", entity_type)
+                continue
+            if df is None:
+                continue
+            try:
+                pipeline.add_entity_dataframe(entity_type, df, id_col=id_col)
+            except Exception:
+                _logger.exception(
+                    "Failed to register entity %s", entity_type,
+                )
+                continue
+            loaded += 1
+            pipeline._load_timings.append(  # noqa: SLF001
+                DatasetTiming(entity_type, "entity", len(df), seconds, cached),
+            )
+
+        # ── Derive relationships from loaded entities ─────────────
+        # All edges in the fastopendata graph are computed at load time by
+        # joining FIPS / GEOID columns across entity tables. Missing
+        # entities cause silent skips so partial datasets still load
+        # cleanly.
+        relationships_added = _collect_derivations(pipeline, derivations)
 
     _logger.info(
-        "Loaded %d/%d available datasets, %d relationship type(s) derived",
+        "Loaded %d/%d available datasets, %d relationship type(s) derived "
+        "in %.2fs",
         loaded,
         len(config.datasets),
         relationships_added,
+        time.perf_counter() - started,
     )
+    for timing in pipeline.load_timings:
+        _logger.debug(
+            "  %-12s %-24s %10d rows  %7.3fs%s",
+            timing.kind,
+            timing.name,
+            timing.rows,
+            timing.seconds,
+            "  (parquet cache)" if timing.cached else "",
+        )
     return pipeline
 
 
-def _derive_relationships(pipeline: GraphPipeline) -> int:
-    """Run all available relationship derivations on a populated pipeline.
+def _spatial_join() -> ModuleType:
+    """Import the point-in-polygon stage only when OSM nodes are loaded."""
+    from fastopendata.etl import spatial_join
 
-    Inspects ``pipeline._entity_frames`` and dispatches to the relevant
-    ``derive_*`` helpers in :mod:`fastopendata.etl.relationship_derivation`.
-    Each derivation is wrapped in its own try/except so a failure in one
-    does not break the rest. Missing entities cause a silent skip with a
-    debug log line.
+    return spatial_join
 
-    Parameters
-    ----------
-    pipeline:
-        A GraphPipeline already populated with entity DataFrames.
 
-    Returns
-    -------
-    int
-        The number of relationship types successfully added.
+@dataclass(frozen=True)
+class _Derivation:
+    """One relationship type computed by joining loaded entity tables."""
+
+    rel_type: str
+    inputs: tuple[str, ...]
+    derive: Callable[[ModuleType, dict[str, pd.DataFrame]], pd.DataFrame]
+
+
+_DERIVATIONS: tuple[_Derivation, ...] = (
+    # 1. CensusTract → State (IN_STATE)
+    _Derivation(
+        "IN_STATE",
+        ("CensusTract", "State"),
+        lambda rd, f: rd.derive_tract_state_relationships(
+            f["CensusTract"], f["State"],
+        ),
+    ),
+    # 2. CensusTract → Puma (MAPS_TO_PUMA via crosswalk)
+    _Derivation(
+        "MAPS_TO_PUMA",
+        ("CensusTract", "Puma", "TractPumaCrosswalk"),
+        lambda rd, f: rd.derive_tract_puma_relationships(
+            f["TractPumaCrosswalk"],
+        ),
+    ),
+    # 3. CensusTract → BlockGroup (CONTAINS_BLOCK_GROUP)
+    _Derivation(
+        "CONTAINS_BLOCK_GROUP",
+        ("CensusTract", "BlockGroup"),
+        lambda rd, f: rd.derive_tract_block_group_relationships(
+            f["CensusTract"], f["BlockGroup"],
+        ),
+    ),
+    # 4. Contract → State (place of performance, then recipient state)
+    _Derivation(
+        "PERFORMED_IN_STATE",
+        ("Contract", "State"),
+        lambda rd, f: rd.derive_contract_state_relationships(
+            f["Contract"], f["State"],
+            fips_column=(
+                "prime_award_transaction_place_of_performance_state_fips_code"
+            ),
+        ),
+    ),
+    _Derivation(
+        "AWARDED_IN_STATE",
+        ("Contract", "State"),
+        lambda rd, f: rd.derive_contract_state_relationships(
+            f["Contract"], f["State"],
+            fips_column="prime_award_transaction_recipient_state_fips_code",
+        ),
+    ),
+    # 5. Person → Puma (LIVES_IN_PUMA)
+    _Derivation(
+        "LIVES_IN_PUMA",
+        ("Person", "Puma"),
+        lambda rd, f: rd.derive_person_puma_relationships(
+            f["Person"], f["Puma"],
+        ),
+    ),
+    # 6. CountyJobOffers → State (COUNTY_IN_STATE)
+    _Derivation(
+        "COUNTY_IN_STATE",
+        ("CountyJobOffers", "State"),
+        lambda rd, f: rd.derive_county_state_relationships(
+            f["CountyJobOffers"], f["State"],
+            county_fips_col="county_fips",
+        ),
+    ),
+    # 7. OsmNode → CensusTract (IN_TRACT), by point-in-polygon
+    _Derivation(
+        "IN_TRACT",
+        ("OsmNode", "CensusTract"),
+        lambda _rd, f: _spatial_join().derive_point_tract_relationships(
+            f["OsmNode"], f["CensusTract"],
+        ),
+    ),
+)
+
+
+def _resolved_frame(futures: list[Future[_Loaded]]) -> pd.DataFrame | None:
+    """Return the frame that registration will keep for an entity type.
+
+    When several loaders produce the same entity type the last successful
+    one wins, exactly as with sequential ``add_entity_dataframe`` calls.
+    """
+    frame: pd.DataFrame | None = None
+    for future in futures:
+        if future.exception() is None and future.result()[0] is not None:
+            frame = future.result()[0]
+    return frame
+
+
+def _run_derivation(
+    derivation: _Derivation,
+    frame_futures: dict[str, list[Future[_Loaded]]],
+) -> tuple[pd.DataFrame | None, float]:
+    """Wait for a derivation's inputs, then compute its edges.
 
+    Returns ``(None, 0.0)`` when an input entity did not load.
     """
     from fastopendata.etl import relationship_derivation as _rd
 
-    frames = pipeline._entity_frames  # noqa: SLF001 — internal coordination
-    added = 0
+    frames: dict[str, pd.DataFrame] = {}
+    for entity_type in derivation.inputs:
+        frame = _resolved_frame(frame_futures.get(entity_type, []))
+        if frame is None:
+            _logger.debug(
+                "Skipping %s derivation (%s)",
+                derivation.rel_type,
+                ", ".join(
+                    f"{name}={bool(frame_futures.get(name))}"
+                    for name in derivation.inputs
+                ),
+            )
+            return None, 0.0
+        frames[entity_type] = frame
+    started = time.perf_counter()
+    edges = derivation.derive(_rd, frames)
+    return edges, time.perf_counter() - started
+
+
+def _submit_derivations(
+    pool: ThreadPoolExecutor,
+    frame_futures: dict[str, list[Future[_Loaded]]],
+) -> list[tuple[_Derivation, Future[tuple[pd.DataFrame | None, float]]]]:
+    """Submit every derivation whose inputs can possibly be loaded.
+
+    Must be called after all entity loads were submitted to *pool*: the
+    executor's queue is FIFO, so a derivation only occupies a worker once
+    every load it may wait on is already running or done.
+    """
+    return [
+        (derivation, pool.submit(_run_derivation, derivation, frame_futures))
+        for derivation in _DERIVATIONS
+        if all(name in frame_futures for name in derivation.inputs)
+    ]
 
-    def _add_edges(rel_type: str, edges: pd.DataFrame) -> bool:
+
+def _collect_derivations(
+    pipeline: GraphPipeline,
+    derivations: list[
+        tuple[_Derivation, Future[tuple[pd.DataFrame | None, float]]]
+    ],
+) -> int:
+    """Register derived edges in declaration order; return the type count."""
+    added = 0
+    for derivation, future in derivations:
+        rel_type = derivation.rel_type
+        try:
+            edges, seconds = future.result()
+        except Exception:
+            _logger.exception("Failed to derive %s relationships", rel_type)
+            continue
         if edges is None or edges.empty:
             _logger.debug("No %s edges derived; skipping", rel_type)
-            return False
+            continue
         pipeline.add_relationship_dataframe(
             rel_type, edges, source_col="__SOURCE__", target_col="__TARGET__",
         )
+        pipeline._load_timings.append(  # noqa: SLF001
+            DatasetTiming(rel_type, "relationship", len(edges), seconds),
+        )
         _logger.info("Derived %d %s edges", len(edges), rel_type)
-        return True
+        added += 1
+    return added
 
-    # 1. CensusTract → State (IN_STATE)
-    tracts_df = frames.get("CensusTract")
-    states_df = frames.get("State")
-    if tracts_df is not None and states_df is not None:
-        try:
-            edges = _rd.derive_tract_state_relationships(tracts_df, states_df)
-            if _add_edges("IN_STATE", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive IN_STATE relationships")
-    else:
-        _logger.debug(
-            "Skipping IN_STATE derivation (CensusTract=%s, State=%s)",
-            tracts_df is not None,
-            states_df is not None,
-        )
 
-    # 2. CensusTract → Puma (MAPS_TO_PUMA via crosswalk)
-    pumas_df = frames.get("Puma")
-    crosswalk_df = frames.get("TractPumaCrosswalk")
-    if (
-        tracts_df is not None
-        and pumas_df is not None
-        and crosswalk_df is not None
-    ):
-        try:
-            edges = _rd.derive_tract_puma_relationships(crosswalk_df)
-            if _add_edges("MAPS_TO_PUMA", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive MAPS_TO_PUMA relationships")
-    else:
-        _logger.debug(
-            "Skipping MAPS_TO_PUMA derivation (CensusTract=%s, Puma=%s, "
-            "TractPumaCrosswalk=%s)",
-            tracts_df is not None,
-            pumas_df is not None,
-            crosswalk_df is not None,
-        )
+def _derive_relationships(
+    pipeline: GraphPipeline,
+    *,
+    max_workers: int | None = None,
+) -> int:
+    """Run all available relationship derivations on a populated pipeline.
 
-    # 3. CensusTract → BlockGroup (CONTAINS_BLOCK_GROUP)
-    bg_df = frames.get("BlockGroup")
-    if tracts_df is not None and bg_df is not None:
-        try:
-            edges = _rd.derive_tract_block_group_relationships(tracts_df, bg_df)
-            if _add_edges("CONTAINS_BLOCK_GROUP", edges):
-                added += 1
-        except Exception:
-            _logger.exception(
-                "Failed to derive CONTAINS_BLOCK_GROUP relationships"
-            )
-    else:
-        _logger.debug(
-            "Skipping CONTAINS_BLOCK_GROUP derivation "
-            "(CensusTract=%s, BlockGroup=%s)",
-            tracts_df is not None,
-            bg_df is not None,
-        )
+    Inspects ``pipeline._entity_frames`` and dispatches to the relevant
+    ``derive_*`` helpers in :mod:`fastopendata.etl.relationship_derivation`
+    in parallel on a thread pool.  Each derivation is isolated so a failure
+    in one does not break the rest. Missing entities cause a silent skip
+    with a debug log line.
 
-    # 4. Contract → State (PERFORMED_IN_STATE + AWARDED_IN_STATE)
-    contracts_df = frames.get("Contract")
-    if contracts_df is not None and states_df is not None:
-        # Place-of-performance edges
-        try:
-            edges = _rd.derive_contract_state_relationships(
-                contracts_df, states_df,
-                fips_column=(
-                    "prime_award_transaction_place_of_performance_state_fips_code"
-                ),
-            )
-            if _add_edges("PERFORMED_IN_STATE", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive PERFORMED_IN_STATE relationships")
-        # Recipient-state edges
-        try:
-            edges = _rd.derive_contract_state_relationships(
-                contracts_df, states_df,
-                fips_column=(
-                    "prime_award_transaction_recipient_state_fips_code"
-                ),
-            )
-            if _add_edges("AWARDED_IN_STATE", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive AWARDED_IN_STATE relationships")
-    else:
-        _logger.debug(
-            "Skipping Contract→State derivations (Contract=%s, State=%s)",
-            contracts_df is not None,
-            states_df is not None,
-        )
+    Parameters
+    ----------
+    pipeline:
+        A GraphPipeline already populated with entity DataFrames.
+    max_workers:
+        Size of the derivation thread pool.
 
-    # 5. Person → Puma (LIVES_IN_PUMA)
-    persons_df = frames.get("Person")
-    if persons_df is not None and pumas_df is not None:
-        try:
-            edges = _rd.derive_person_puma_relationships(persons_df, pumas_df)
-            if _add_edges("LIVES_IN_PUMA", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive LIVES_IN_PUMA relationships")
-    else:
-        _logger.debug(
-            "Skipping LIVES_IN_PUMA derivation (Person=%s, Puma=%s)",
-            persons_df is not None,
-            pumas_df is not None,
-        )
+    Returns
+    -------
+    int
+        The number of relationship types successfully added.
 
-    # 6. CountyJobOffers → State (COUNTY_IN_STATE)
-    counties_df = frames.get("CountyJobOffers")
-    if counties_df is not None and states_df is not None:
-        try:
-            edges = _rd.derive_county_state_relationships(
-                counties_df, states_df,
-                county_fips_col="county_fips",
+    """
+    frame_futures: dict[str, list[Future[_Loaded]]] = {}
+    for entity_type, df in pipeline._entity_frames.items():  # noqa: SLF001
+        done: Future[_Loaded] = Future()
+        done.set_result((df, None, False, 0.0))
+        frame_futures[entity_type] = [done]
+
+    for derivation in _DERIVATIONS:
+        missing = [n for n in derivation.inputs if n not in frame_futures]
+        if missing:
+            _logger.debug(
+                "Skipping %s derivation (missing %s)",
+                derivation.rel_type,
+                ", ".join(missing),
             )
-            if _add_edges("COUNTY_IN_STATE", edges):
-                added += 1
-        except Exception:
-            _logger.exception("Failed to derive COUNTY_IN_STATE relationships")
-    else:
-        _logger.debug(
-            "Skipping COUNTY_IN_STATE derivation "
-            "(CountyJobOffers=%s, State=%s)",
-            counties_df is not None,
-            states_df is not None,
-        )
 
-    return added
+    with ThreadPoolExecutor(
+        max_workers=max_workers or _DEFAULT_LOAD_WORKERS,
+        thread_name_prefix="fastopendata-derive",
+    ) as pool:
+        return _collect_derivations(
+            pipeline,
+            _submit_derivations(pool, frame_futures),
+        )
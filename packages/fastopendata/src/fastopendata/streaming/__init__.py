@@ -9,6 +9,7 @@ Core components
 * :class:`StreamRecord` — immutable event wrapper with event-time metadata
 * :class:`StreamBuffer` — thread-safe, bounded async ring buffer
 * :class:`WatermarkTracker` — monotonic watermark with allowed lateness
+* :class:`HashedIdRing`, :class:`RotatingBloomFilter` — compact dedup stores
 * :class:`WindowAssigner` — tumbling, sliding, and session window assignment
 * :class:`IncrementalView` — differential materialized view with changelog
 * :class:`StreamTableJoin` — enriches stream records against a snapshot table
@@ -23,6 +24,11 @@ from fastopendata.streaming.core import (
     StreamRecord,
     WatermarkTracker,
 )
+from fastopendata.streaming.dedup import (
+    DedupBackend,
+    HashedIdRing,
+    RotatingBloomFilter,
+)
 from fastopendata.streaming.engine import StreamEngine
 from fastopendata.streaming.joins import StreamTableJoin
 from fastopendata.streaming.views import IncrementalView
@@ -35,8 +41,11 @@ from fastopendata.streaming.windows import (
 )
 
 __all__: list[str] = [
+    "DedupBackend",
     "DeduplicationStore",
+    "HashedIdRing",
     "IncrementalView",
+    "RotatingBloomFilter",
     "SessionWindow",
     "SlidingWindow",
     "StreamBuffer",
@@ -0,0 +1,127 @@
+"""Columnar micro-batches of stream records.
+
+In micro-batch mode the :class:`~fastopendata.streaming.engine.StreamEngine`
+turns each drained batch of :class:`StreamRecord` objects into one Arrow
+:class:`pyarrow.RecordBatch` and passes that through transforms, joins,
+windows, views and sinks, so operators work on whole columns instead of
+being awaited once per record.
+
+A record batch holds the record metadata in reserved columns
+(:data:`KEY_COLUMN`, :data:`EVENT_TIME_COLUMN`, ...) followed by one column
+per payload field.  Records that lack a field get null in its column.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+import pyarrow as pa
+
+from fastopendata.streaming.core import RecordType, StreamRecord
+
+KEY_COLUMN = "__key__"
+EVENT_TIME_COLUMN = "__event_time__"
+PROCESSING_TIME_COLUMN = "__processing_time__"
+RECORD_TYPE_COLUMN = "__record_type__"
+RECORD_ID_COLUMN = "__record_id__"
+SOURCE_COLUMN = "__source__"
+
+#: Reserved metadata columns, in batch order.
+META_COLUMNS: tuple[str, ...] = (
+    KEY_COLUMN,
+    EVENT_TIME_COLUMN,
+    PROCESSING_TIME_COLUMN,
+    RECORD_TYPE_COLUMN,
+    RECORD_ID_COLUMN,
+    SOURCE_COLUMN,
+)
+
+BatchTransform = Callable[[pa.RecordBatch], pa.RecordBatch | None]
+BatchSink = Callable[[pa.RecordBatch], object]
+
+
+def records_to_batch(records: Sequence[StreamRecord]) -> pa.RecordBatch:
+    """Build one record batch from *records*, preserving their order.
+
+    A payload field whose values have no common Arrow type (e.g. ``1`` in
+    one record and ``"x"`` in another) becomes a string column.
+    """
+    values = [r.value for r in records]
+    fields = dict.fromkeys(name for value in values for name in value)
+    payload = pa.RecordBatch.from_pydict(
+        {
+            name: column_array([value.get(name) for value in values])
+            for name in fields
+        },
+    )
+    meta = {
+        KEY_COLUMN: pa.array([r.key for r in records], pa.string()),
+        EVENT_TIME_COLUMN: pa.array(
+            [r.event_time for r in records],
+            pa.float64(),
+        ),
+        PROCESSING_TIME_COLUMN: pa.array(
+            [r.processing_time for r in records],
+            pa.float64(),
+        ),
+        RECORD_TYPE_COLUMN: pa.array(
+            [r.record_type.name for r in records],
+            pa.string(),
+        ),
+        RECORD_ID_COLUMN: pa.array(
+            [r.record_id for r in records],
+            pa.string(),
+        ),
+        SOURCE_COLUMN: pa.array([r.source for r in records], pa.string()),
+    }
+    arrays = [*meta.values(), *payload.columns]
+    names = [*meta, *payload.schema.names]
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def column_array(values: Sequence[object]) -> pa.Array:
+    """Convert *values* to an Arrow array, as strings if they mix types."""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [v if v is None else str(v) for v in values],
+            pa.string(),
+        )
+
+
+def payload_columns(batch: pa.RecordBatch) -> list[str]:
+    """Return the names of the non-metadata columns of *batch*."""
+    return [name for name in batch.schema.names if name not in META_COLUMNS]
+
+
+def batch_to_records(batch: pa.RecordBatch) -> list[StreamRecord]:
+    """Materialize *batch* back into :class:`StreamRecord` objects.
+
+    Payload fields that are null for a row are omitted from its value.
+    """
+    columns = batch.to_pydict()
+    fields = payload_columns(batch)
+    if fields:
+        values = [
+            {
+                name: v
+                for name, v in zip(fields, row, strict=True)
+                if v is not None
+            }
+            for row in zip(*(columns[name] for name in fields), strict=True)
+        ]
+    else:
+        values = [{} for _ in range(batch.num_rows)]
+    rows = zip(
+        columns[KEY_COLUMN],
+        values,
+        columns[EVENT_TIME_COLUMN],
+        columns[PROCESSING_TIME_COLUMN],
+        [RecordType[name] for name in columns[RECORD_TYPE_COLUMN]],
+        columns[RECORD_ID_COLUMN],
+        columns[SOURCE_COLUMN],
+        strict=True,
+    )
+    # Positional order of the StreamRecord fields.
+    return [StreamRecord(*row) for row in rows]
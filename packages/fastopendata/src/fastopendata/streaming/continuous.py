@@ -0,0 +1,878 @@
+"""Continuous Cypher queries over a streaming graph.
+
+A :class:`StreamingGraph` holds entity and relationship rows fed by
+:class:`~fastopendata.streaming.views.IncrementalView` changelogs: every
+bound view's upserts and deletes become row-level deltas on one label.
+Registered :class:`ContinuousQuery` objects keep their result up to date
+as those deltas arrive and publish a result changelog to subscribers.
+
+Maintenance uses the delta-join rule.  For a MATCH over tables
+``R1 … Rn`` whose changed tables are ``Ri`` (old → new)::
+
+    Q(new) - Q(old) = Σ_i Q(R1new, …, R(i-1)new, ΔRi, R(i+1)old, …)
+
+and each ``ΔRi`` term splits into its inserted rows (added to the result)
+and deleted rows (removed), because projection, filtering and joins are
+linear in every input.  Each term runs the query with one pattern
+occurrence bound to just its changed rows, so a small delta joins against
+the other tables instead of recomputing the whole pattern.  Every
+occurrence gets its own table, which keeps self-joins such as
+``(a:Person)-[:FOLLOWS]->(b:Person)`` incremental, and relationship
+tables are semi-joined to their endpoint tables so an edge only matches
+while both of its entities exist.  ``count`` and ``sum``
+aggregates are decomposable, so grouped results are maintained by adding
+the signed per-group partials of each term.
+
+Queries the rule does not cover — anything beyond ``MATCH … [WHERE …]
+RETURN …`` (``OPTIONAL MATCH``, ``WITH``, ``DISTINCT``, ``ORDER BY``,
+``SKIP``/``LIMIT``, variable-length, undirected or unlabeled patterns,
+pattern and label predicates) or aggregates other than ``count``/``sum``
+— are recomputed in full and diffed against the previous result.  Either
+way subscribers see the same changelog.
+
+Usage::
+
+    graph = StreamingGraph()
+    graph.bind_entity_view(people, "Person")
+    graph.bind_relationship_view(
+        follows, "FOLLOWS", source_field="src", target_field="dst",
+    )
+    query = graph.register(
+        "MATCH (a:Person)-[:FOLLOWS]->(b:Person) "
+        "RETURN b.name AS name, count(*) AS followers",
+    )
+    changes = query.subscribe()
+    ...
+    await graph.flush()   # StreamEngine does this once per cycle
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+from pycypher.aggregation_evaluator import KNOWN_AGGREGATIONS
+from pycypher.ast_converter import ASTConverter
+from pycypher.ast_models.clauses import (
+    Match,
+    NodePattern,
+    Query,
+    RelationshipPattern,
+    Return,
+    ReturnItem,
+)
+from pycypher.ast_models.core import ASTNode, RelationshipDirection
+from pycypher.ast_models.expressions import (
+    CountStar,
+    Exists,
+    FunctionInvocation,
+    LabelPredicate,
+    PatternComprehension,
+)
+from pycypher.constants import ID_COLUMN
+from pycypher.expression_renderer import ExpressionRenderer
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.star import Star
+
+from fastopendata.streaming.views import (
+    ChangelogEntry,
+    ChangeType,
+    IncrementalView,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+
+_logger = logging.getLogger(__name__)
+
+#: Hidden per-group row count added to incrementally aggregated queries.
+_ROWS = "__rows__"
+
+#: Prefix of the hidden non-null input counts kept beside ``sum`` columns.
+_NON_NULL = "__non_null_"
+
+#: Aggregates whose per-group value is the sum of their per-delta values.
+_DECOMPOSABLE = frozenset({"count", "sum"})
+
+Row = dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Query analysis
+# ---------------------------------------------------------------------------
+
+
+def _is_aggregate(node: ASTNode) -> bool:
+    if isinstance(node, CountStar):
+        return True
+    return (
+        isinstance(node, FunctionInvocation)
+        and node.function_name.lower() in KNOWN_AGGREGATIONS
+    )
+
+
+def _contains_aggregate(node: ASTNode | None) -> bool:
+    return node is not None and any(_is_aggregate(n) for n in node.traverse())
+
+
+@dataclass(frozen=True)
+class _QueryPlan:
+    """How a query is maintained."""
+
+    #: Node labels and relationship types the query reads.
+    labels: frozenset[str]
+    #: Table name of each pattern occurrence in ``delta_query`` → label.
+    occurrences: dict[str, str]
+    #: Relationship table name → (source, target) node table names.
+    endpoints: dict[str, tuple[str, str]]
+    #: Output column names, in RETURN order.
+    columns: tuple[str, ...]
+    #: Positions of aggregate output columns (empty for row queries).
+    aggregates: tuple[int, ...]
+    #: Indexes into ``aggregates`` of the ``sum`` columns, each followed
+    #: in ``delta_query`` by a hidden count of its non-null inputs.
+    sums: tuple[int, ...]
+    #: Query evaluated per delta term (aggregates get a hidden row count).
+    delta_query: Query | None
+    #: Why the query is recomputed in full, or None if incremental.
+    fallback: str | None
+
+
+def _column_name(item: ReturnItem) -> str:
+    if item.alias:
+        return item.alias
+    return ExpressionRenderer().render(item.expression)
+
+
+def _pattern_fallback(
+    node: NodePattern | RelationshipPattern,
+    labels: set[str],
+) -> str | None:
+    """Add *node*'s labels to *labels*; return why it is not incremental."""
+    labels.update(node.labels)
+    if len(node.labels) != 1:
+        return "pattern without exactly one label"
+    if not isinstance(node, RelationshipPattern):
+        return None
+    if node.length:
+        return "variable-length relationship"
+    undirected = node.direction == RelationshipDirection.UNDIRECTED
+    return "undirected relationship" if undirected else None
+
+
+def _match_fallback(matches: list[ASTNode], labels: set[str]) -> str | None:
+    """Add the labels *matches* read to *labels*; return any fallback."""
+    reasons: list[str | None] = []
+    if not matches:
+        reasons.append("no MATCH clause")
+    for clause in matches:
+        if not isinstance(clause, Match) or clause.optional:
+            reasons.append(f"{type(clause).__name__} clause")
+            continue
+        for node in clause.traverse():
+            if isinstance(node, Exists | PatternComprehension):
+                reasons.append("pattern predicate")
+            elif isinstance(node, LabelPredicate):
+                reasons.append("label predicate")
+            elif isinstance(node, NodePattern | RelationshipPattern):
+                reasons.append(_pattern_fallback(node, labels))
+    patterns = [m.pattern for m in matches if isinstance(m, Match)]
+    reasons.extend(
+        "path variable"
+        for pattern in patterns
+        if pattern
+        for path in pattern.paths
+        if path.variable is not None or path.shortest_path_mode != "none"
+    )
+    return next((r for r in reasons if r), None)
+
+
+def _is_decomposable(expression: ASTNode) -> bool:
+    return isinstance(expression, CountStar) or (
+        isinstance(expression, FunctionInvocation)
+        and expression.function_name.lower() in _DECOMPOSABLE
+        and not expression.distinct
+        and not any(
+            _is_aggregate(n)
+            for n in expression.traverse()
+            if n is not expression
+        )
+    )
+
+
+def _aggregate_items(
+    items: list[ReturnItem],
+) -> tuple[list[int], list[int], str | None]:
+    """Return aggregate positions, ``sum`` indexes and any fallback reason.
+
+    ``sum`` indexes point into the aggregate positions.
+    """
+    aggregates: list[int] = []
+    sums: list[int] = []
+    reasons: list[str] = []
+    for position, item in enumerate(items):
+        expression = item.expression
+        if not _contains_aggregate(expression):
+            if any(isinstance(n, Exists) for n in expression.traverse()):
+                reasons.append("pattern predicate")
+            continue
+        aggregates.append(position)
+        if not _is_decomposable(expression):
+            reasons.append("non-decomposable aggregate")
+        elif (
+            isinstance(expression, FunctionInvocation)
+            and expression.function_name.lower() == "sum"
+        ):
+            sums.append(len(aggregates) - 1)
+    return aggregates, sums, next(iter(reasons), None)
+
+
+def _delta_query(
+    query: Query,
+    aggregates: list[int],
+    sums: list[int],
+) -> tuple[Query, dict[str, str], dict[str, tuple[str, str]]]:
+    """Return the per-delta query with its occurrence and endpoint tables."""
+    occurrences: dict[str, str] = {}
+    endpoints: dict[str, tuple[str, str]] = {}
+    # Give every pattern occurrence its own table so that a self-join
+    # such as (a:Person)-->(b:Person) can take a delta on one side
+    # while the other side keeps the full table.
+    delta_query = query.model_copy(deep=True)
+    for clause in delta_query.clauses[:-1]:
+        for path in clause.pattern.paths:
+            names = []
+            for element in path.elements:
+                name = f"__{len(occurrences)}_{element.labels[0]}"
+                occurrences[name] = element.labels[0]
+                element.labels = [name]
+                names.append(name)
+            for i in range(1, len(names), 2):
+                left, right = names[i - 1], names[i + 1]
+                direction = path.elements[i].direction
+                if direction == RelationshipDirection.LEFT:
+                    left, right = right, left
+                endpoints[names[i]] = (left, right)
+    if aggregates:
+        # sum() of only nulls is null, not 0, so each sum carries the
+        # count of its non-null inputs to tell the two apart.
+        items = delta_query.clauses[-1].items
+        for index in sums:
+            total = items[aggregates[index]].expression
+            items.append(
+                ReturnItem(
+                    expression=total.model_copy(update={"name": "count"}),
+                    alias=f"{_NON_NULL}{index}",
+                ),
+            )
+        items.append(ReturnItem(expression=CountStar(), alias=_ROWS))
+    return delta_query, occurrences, endpoints
+
+
+def _plan(query: Query) -> _QueryPlan:
+    *matches, last = query.clauses or [None]
+    # A parsed query of the wrong shape is a bad value, not a bad type.
+    if not isinstance(last, Return):
+        msg = "A continuous query must end with RETURN"
+        raise ValueError(msg)  # noqa: TRY004
+    labels: set[str] = set()
+    reasons = [_match_fallback(matches, labels)]
+    if last.distinct or last.order_by or last.skip or last.limit:
+        reasons.append("DISTINCT/ORDER BY/SKIP/LIMIT")
+    items = last.items
+    if not items or not all(isinstance(i, ReturnItem) for i in items):
+        msg = "A continuous query must RETURN named expressions, not *"
+        raise ValueError(msg)
+    aggregates, sums, reason = _aggregate_items(items)
+    reasons.append(reason)
+    fallback = next((r for r in reasons if r), None)
+
+    delta_query: Query | None = None
+    occurrences: dict[str, str] = {}
+    endpoints: dict[str, tuple[str, str]] = {}
+    if fallback is None:
+        delta_query, occurrences, endpoints = _delta_query(
+            query,
+            aggregates,
+            sums,
+        )
+    return _QueryPlan(
+        labels=frozenset(labels),
+        occurrences=occurrences,
+        endpoints=endpoints,
+        columns=tuple(_column_name(item) for item in last.items),
+        aggregates=tuple(aggregates),
+        sums=tuple(sums) if delta_query is not None else (),
+        delta_query=delta_query,
+        fallback=fallback,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Result state
+# ---------------------------------------------------------------------------
+
+
+def _hashable(value: object) -> Hashable:
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _rows(frame: pd.DataFrame) -> list[list[Any]]:
+    """Return result rows as Python values, with nulls as None."""
+    if frame.empty:
+        return []
+    cleaned = frame.astype(object).where(frame.notna(), None)
+    return cleaned.to_numpy().tolist()
+
+
+@dataclass
+class _Delta:
+    """Row changes to one label since the last flush."""
+
+    inserted: list[Row] = field(default_factory=list)
+    deleted: list[Row] = field(default_factory=list)
+
+
+class ContinuousQuery:
+    """A Cypher query whose result is maintained as the graph changes.
+
+    Create instances with :meth:`StreamingGraph.register` (or
+    :meth:`StreamEngine.register_query`).  The result is a bag of rows
+    for plain queries and one row per group for aggregating queries.
+
+    Result changes are published as :class:`ChangelogEntry` objects whose
+    ``key`` identifies the row (its values) or group (its grouping
+    values): a plain row is INSERTed or DELETEd once per added or removed
+    copy; a group is INSERTed when it first appears, UPDATEd when an
+    aggregate changes and DELETEd when its last row goes away.
+    """
+
+    def __init__(self, query: str) -> None:
+        """Parse and plan *query*; its result is empty until registered."""
+        self._text = query
+        ast = ASTConverter.from_cypher(query)
+        if not isinstance(ast, Query):
+            msg = "A continuous query must be a single MATCH … RETURN query"
+            raise ValueError(msg)  # noqa: TRY004
+        self._ast = ast
+        self._plan = _plan(ast)
+        #: Bag of result rows (plain queries).
+        self._bag: Counter[tuple[Hashable, ...]] = Counter()
+        self._values: dict[tuple[Hashable, ...], list[Any]] = {}
+        #: Group key → aggregate values + hidden non-null and row counts.
+        self._groups: dict[tuple[Hashable, ...], list[Any]] = {}
+        self._changelog: list[ChangelogEntry] = []
+        self._subscribers: list[asyncio.Queue[ChangelogEntry]] = []
+        self.full_recomputes = 0
+        self.delta_evaluations = 0
+
+    @property
+    def query(self) -> str:
+        """The Cypher text the query was created from."""
+        return self._text
+
+    @property
+    def labels(self) -> frozenset[str]:
+        """Labels and relationship types the query reads."""
+        return self._plan.labels
+
+    @property
+    def incremental(self) -> bool:
+        """Whether deltas are applied with delta joins."""
+        return self._plan.fallback is None
+
+    @property
+    def fallback_reason(self) -> str | None:
+        """Why the query is recomputed in full, or None if incremental."""
+        return self._plan.fallback
+
+    @property
+    def changelog(self) -> list[ChangelogEntry]:
+        """Every result change published so far."""
+        return list(self._changelog)
+
+    def subscribe(self) -> asyncio.Queue[ChangelogEntry]:
+        """Create a queue that receives future result changes."""
+        q: asyncio.Queue[ChangelogEntry] = asyncio.Queue()
+        self._subscribers.append(q)
+        return q
+
+    def result(self) -> pd.DataFrame:
+        """Return the current result as a DataFrame."""
+        columns = list(self._plan.columns)
+        if self._plan.aggregates:
+            rows = [
+                self._group_row(key, values)
+                for key, values in self._groups.items()
+            ]
+        else:
+            rows = [
+                self._values[key]
+                for key, count in self._bag.items()
+                for _ in range(count)
+            ]
+        return pd.DataFrame(rows, columns=columns)
+
+    # -- evaluation -----------------------------------------------------
+
+    def _is_global(self) -> bool:
+        return len(self._plan.aggregates) == len(self._plan.columns)
+
+    def _group_row(
+        self,
+        key: tuple[Hashable, ...],
+        values: list[Any],
+    ) -> list[Any]:
+        row: list[Any] = []
+        keys = iter(key)
+        aggregates = iter(values)
+        for position in range(len(self._plan.columns)):
+            if position in self._plan.aggregates:
+                row.append(next(aggregates))
+            else:
+                row.append(next(keys))
+        return row
+
+    def _visible(self, values: list[Any]) -> list[Any]:
+        """Drop the hidden counts from a group's *values*."""
+        return values[: len(self._plan.aggregates)]
+
+    def _split(self, row: list[Any]) -> tuple[tuple[Hashable, ...], list]:
+        aggregates = self._plan.aggregates
+        key = tuple(
+            _hashable(v) for i, v in enumerate(row) if i not in aggregates
+        )
+        values = [row[i] for i in aggregates]
+        return key, values
+
+    async def initialize(self, graph: StreamingGraph) -> None:
+        """Evaluate the query over the whole graph."""
+        await self._recompute(graph)
+
+    async def apply(
+        self,
+        graph: StreamingGraph,
+        deltas: Mapping[str, _Delta],
+    ) -> None:
+        """Fold the flushed *deltas* into the result."""
+        if not self._plan.labels.intersection(deltas):
+            return
+        if not self.incremental:
+            await self._recompute(graph)
+            return
+
+        occurrences = self._plan.occurrences
+        changed = [
+            name for name, label in occurrences.items() if label in deltas
+        ]
+        signed: list[tuple[int, pd.DataFrame]] = []
+        # Occurrences before the delta term see the new table, those
+        # after it the old one, and unchanged labels their only table.
+        for position, name in enumerate(changed):
+            label = occurrences[name]
+            tables = {
+                later: graph.frame(occurrences[later], deltas, old=True)
+                for later in changed[position + 1 :]
+            }
+            for sign, rows in (
+                (1, deltas[label].inserted),
+                (-1, deltas[label].deleted),
+            ):
+                if not rows:
+                    continue
+                tables[name] = graph.rows_frame(label, rows)
+                frame = graph.execute(
+                    self._plan.delta_query,
+                    tables,
+                    occurrences,
+                    self._plan.endpoints,
+                )
+                signed.append((sign, frame))
+                self.delta_evaluations += 1
+        if self._plan.aggregates:
+            await self._merge_groups(signed)
+        else:
+            await self._merge_bag(signed)
+
+    async def _recompute(self, graph: StreamingGraph) -> None:
+        self.full_recomputes += 1
+        counted = self._plan.delta_query
+        if counted is None:
+            frame = graph.execute(self._ast)
+        else:
+            frame = graph.execute(
+                counted,
+                {},
+                self._plan.occurrences,
+                self._plan.endpoints,
+            )
+        if self._plan.aggregates:
+            groups = {}
+            for row in _rows(frame):
+                if counted is None:
+                    # Never merged with deltas, so no row count is needed.
+                    key, values = self._split(row)
+                    groups[key] = [*values, None]
+                else:
+                    width = len(self._plan.columns)
+                    key, values = self._split(row[:width])
+                    groups[key] = [*values, *row[width:]]
+            await self._replace_groups(groups)
+            return
+        bag: Counter[tuple[Hashable, ...]] = Counter()
+        values: dict[tuple[Hashable, ...], list[Any]] = {}
+        for row in _rows(frame):
+            key = tuple(_hashable(v) for v in row)
+            bag[key] += 1
+            values.setdefault(key, row)
+        additions = bag - self._bag
+        removals = self._bag - bag
+        self._values.update(values)
+        await self._emit_bag(removals, additions)
+        self._bag = bag
+        self._values = values
+
+    # -- merging --------------------------------------------------------
+
+    async def _merge_bag(self, signed: list[tuple[int, pd.DataFrame]]) -> None:
+        change: Counter[tuple[Hashable, ...]] = Counter()
+        for sign, frame in signed:
+            for row in _rows(frame):
+                key = tuple(_hashable(v) for v in row)
+                change[key] += sign
+                self._values.setdefault(key, row)
+        additions = Counter({k: n for k, n in change.items() if n > 0})
+        removals = Counter({k: -n for k, n in change.items() if n < 0})
+        await self._emit_bag(removals, additions)
+        self._bag.update(additions)
+        self._bag.subtract(removals)
+        for key in removals:
+            if self._bag[key] <= 0:
+                del self._bag[key]
+                del self._values[key]
+
+    async def _emit_bag(
+        self,
+        removals: Counter[tuple[Hashable, ...]],
+        additions: Counter[tuple[Hashable, ...]],
+    ) -> None:
+        columns = self._plan.columns
+        for key, count in removals.items():
+            row = dict(zip(columns, self._values[key], strict=True))
+            for _ in range(count):
+                await self._emit(ChangeType.DELETE, key, row, None)
+        for key, count in additions.items():
+            row = dict(zip(columns, self._values[key], strict=True))
+            for _ in range(count):
+                await self._emit(ChangeType.INSERT, key, None, row)
+
+    async def _merge_groups(
+        self,
+        signed: list[tuple[int, pd.DataFrame]],
+    ) -> None:
+        groups = {key: list(values) for key, values in self._groups.items()}
+        width = len(self._plan.columns)
+        for sign, frame in signed:
+            for row in _rows(frame):
+                # The hidden counts follow the RETURN columns.
+                key, values = self._split(row[:width])
+                current = groups.setdefault(key, self._empty_group())
+                for i, value in enumerate([*values, *row[width:]]):
+                    current[i] = (current[i] or 0) + sign * (value or 0)
+        offset = len(self._plan.aggregates)
+        for values in groups.values():
+            for n, index in enumerate(self._plan.sums):
+                if not values[offset + n]:
+                    values[index] = None
+        kept = {
+            key: values
+            for key, values in groups.items()
+            if values[-1] is None or values[-1] > 0 or key == ()
+        }
+        await self._replace_groups(kept)
+
+    def _empty_group(self) -> list[Any]:
+        """Return the values of a group with no rows."""
+        values: list[Any] = [0] * (
+            len(self._plan.aggregates) + len(self._plan.sums) + 1
+        )
+        for index in self._plan.sums:
+            values[index] = None
+        return values
+
+    async def _replace_groups(
+        self,
+        groups: dict[tuple[Hashable, ...], list[Any]],
+    ) -> None:
+        """Swap in *groups* and emit the per-group differences."""
+        columns = self._plan.columns
+        if self._is_global():
+            groups.setdefault((), self._empty_group())
+        for key, values in self._groups.items():
+            if key not in groups:
+                row = dict(
+                    zip(columns, self._group_row(key, values), strict=True)
+                )
+                await self._emit(ChangeType.DELETE, key, row, None)
+        for key, values in groups.items():
+            new = dict(zip(columns, self._group_row(key, values), strict=True))
+            old_values = self._groups.get(key)
+            if old_values is None:
+                await self._emit(ChangeType.INSERT, key, None, new)
+            elif self._visible(old_values) != self._visible(values):
+                old = dict(
+                    zip(
+                        columns,
+                        self._group_row(key, old_values),
+                        strict=True,
+                    ),
+                )
+                await self._emit(ChangeType.UPDATE, key, old, new)
+        self._groups = groups
+
+    async def _emit(
+        self,
+        change_type: ChangeType,
+        key: tuple[Hashable, ...],
+        old: Row | None,
+        new: Row | None,
+    ) -> None:
+        entry = ChangelogEntry(
+            change_type=change_type,
+            key=repr(key),
+            old_value=old,
+            new_value=new,
+        )
+        self._changelog.append(entry)
+        for q in self._subscribers:
+            await q.put(entry)
+
+
+# ---------------------------------------------------------------------------
+# Streaming graph
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Binding:
+    label: str
+    queue: asyncio.Queue[ChangelogEntry]
+    source_field: str | None = None
+    target_field: str | None = None
+
+    @property
+    def is_relationship(self) -> bool:
+        return self.source_field is not None
+
+
+class StreamingGraph:
+    """Entity and relationship rows maintained from view changelogs.
+
+    Each bound :class:`IncrementalView` drives one label: the view key is
+    the entity (or relationship) ID and its value holds the properties.
+    Relationship views also name the value fields holding the source and
+    target entity IDs.  Changes are buffered until :meth:`flush`, which
+    applies them and updates every registered :class:`ContinuousQuery`
+    with one net delta per label.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty graph with no bound views or queries."""
+        self._bindings: dict[str, _Binding] = {}
+        self._rows: dict[str, dict[str, Row]] = {}
+        self._frames: dict[str, pd.DataFrame] = {}
+        self._queries: list[ContinuousQuery] = []
+
+    @property
+    def queries(self) -> list[ContinuousQuery]:
+        """The registered queries, in registration order."""
+        return list(self._queries)
+
+    def bind_entity_view(self, view: IncrementalView, label: str) -> None:
+        """Feed *view*'s changelog into entity *label*."""
+        self._bind(view, _Binding(label, view.subscribe()))
+
+    def bind_relationship_view(
+        self,
+        view: IncrementalView,
+        relationship_type: str,
+        *,
+        source_field: str,
+        target_field: str,
+    ) -> None:
+        """Feed *view*'s changelog into *relationship_type* edges."""
+        self._bind(
+            view,
+            _Binding(
+                relationship_type,
+                view.subscribe(),
+                source_field=source_field,
+                target_field=target_field,
+            ),
+        )
+
+    def _bind(self, view: IncrementalView, binding: _Binding) -> None:
+        if binding.label in self._bindings:
+            msg = f"Label '{binding.label}' is already bound to a view"
+            raise ValueError(msg)
+        self._bindings[binding.label] = binding
+        self._rows[binding.label] = {
+            key: self._row(key, value) for key, value in view.snapshot.items()
+        }
+
+    @staticmethod
+    def _row(key: str, value: Mapping[str, Any]) -> Row:
+        return {**value, ID_COLUMN: key}
+
+    async def register(self, query: str | ContinuousQuery) -> ContinuousQuery:
+        """Register *query* and evaluate it over the current graph."""
+        if isinstance(query, str):
+            query = ContinuousQuery(query)
+        await self.flush()
+        self._queries.append(query)
+        await query.initialize(self)
+        return query
+
+    def unregister(self, query: ContinuousQuery) -> None:
+        """Stop maintaining *query*."""
+        self._queries.remove(query)
+
+    # -- deltas ---------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Apply buffered view changes and update registered queries.
+
+        Returns
+        -------
+        Number of rows inserted or deleted across all labels.
+
+        """
+        deltas: dict[str, _Delta] = {}
+        for label, binding in self._bindings.items():
+            rows = self._rows[label]
+            before: dict[str, Row | None] = {}
+            after: dict[str, Row | None] = {}
+            while not binding.queue.empty():
+                entry = binding.queue.get_nowait()
+                before.setdefault(entry.key, rows.get(entry.key))
+                after[entry.key] = (
+                    None
+                    if entry.new_value is None
+                    else self._row(entry.key, entry.new_value)
+                )
+            delta = _Delta()
+            for key, new in after.items():
+                old = before[key]
+                if old == new:
+                    continue
+                if old is not None:
+                    delta.deleted.append(old)
+                    del rows[key]
+                if new is not None:
+                    delta.inserted.append(new)
+                    rows[key] = new
+            if delta.inserted or delta.deleted:
+                deltas[label] = delta
+                self._frames.pop(label, None)
+        for query in self._queries:
+            await query.apply(self, deltas)
+        return sum(len(d.inserted) + len(d.deleted) for d in deltas.values())
+
+    # -- evaluation -----------------------------------------------------
+
+    def rows_frame(self, label: str, rows: list[Row]) -> pd.DataFrame:
+        """Build *label*'s table from *rows*."""
+        frame = pd.DataFrame(rows, columns=None if rows else [ID_COLUMN])
+        binding = self._bindings.get(label)
+        if binding is not None and binding.is_relationship:
+            for column in (binding.source_field, binding.target_field):
+                if column not in frame:
+                    frame[column] = pd.Series(dtype=object)
+                # Entity IDs are view keys, which are strings.
+                frame[column] = frame[column].map(
+                    lambda v: v if v is None else str(v),
+                )
+        return frame
+
+    def frame(
+        self,
+        label: str,
+        deltas: Mapping[str, _Delta] | None = None,
+        *,
+        old: bool = False,
+    ) -> pd.DataFrame:
+        """Return *label*'s current table, or its pre-flush table if *old*."""
+        rows = self._rows.get(label, {})
+        if old and deltas and label in deltas:
+            delta = deltas[label]
+            inserted = {row[ID_COLUMN] for row in delta.inserted}
+            previous = [r for k, r in rows.items() if k not in inserted]
+            return self.rows_frame(label, previous + delta.deleted)
+        cached = self._frames.get(label)
+        if cached is None:
+            cached = self._frames[label] = self.rows_frame(
+                label,
+                list(rows.values()),
+            )
+        return cached
+
+    def execute(
+        self,
+        query: Query,
+        tables: Mapping[str, pd.DataFrame] | None = None,
+        occurrences: Mapping[str, str] | None = None,
+        endpoints: Mapping[str, tuple[str, str]] | None = None,
+    ) -> pd.DataFrame:
+        """Run *query* over the graph.
+
+        *occurrences* maps table names used in *query* to the label whose
+        rows they hold (by default each name is its own label); *tables*
+        replaces the current rows of some of those names.  Relationship
+        tables listed in *endpoints* keep only the edges whose source and
+        target are rows of the named node tables, so a match needs both
+        endpoint entities to be present.
+        """
+        occurrences = occurrences or {}
+        used = {
+            label
+            for node in query.traverse()
+            if isinstance(node, NodePattern | RelationshipPattern)
+            for label in node.labels
+        }
+        frames = {
+            name: self.frame(occurrences.get(name, name))
+            for name in sorted(used)
+        }
+        frames.update(tables or {})
+        builder = ContextBuilder()
+        for name, table in frames.items():
+            frame = table
+            binding = self._bindings.get(occurrences.get(name, name))
+            if name in (endpoints or {}) and binding is not None:
+                source, target = endpoints[name]
+                frame = frame[
+                    frame[binding.source_field].isin(frames[source][ID_COLUMN])
+                    & frame[binding.target_field].isin(
+                        frames[target][ID_COLUMN],
+                    )
+                ]
+            if binding is not None and binding.is_relationship:
+                builder.add_relationship(
+                    name,
+                    frame,
+                    source_col=binding.source_field,
+                    target_col=binding.target_field,
+                    id_col=ID_COLUMN,
+                    allow_multi_edges=True,
+                )
+            else:
+                builder.add_entity(name, frame, id_col=ID_COLUMN)
+        return Star(builder.build(backend="pandas")).execute_query(query)
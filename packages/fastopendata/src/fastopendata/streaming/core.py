@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import sys
 import threading
 import time
 import uuid
@@ -17,6 +18,10 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Self
 
+import numpy as np
+
+from fastopendata.streaming.dedup import DedupBackend, PathLike, save_npz
+
 
 class RecordType(Enum):
     """Discriminator for stream record semantics."""
@@ -201,12 +206,42 @@ class WatermarkTracker:
             return True
         return False
 
+    def late_mask(
+        self,
+        event_times: np.ndarray,
+        is_data: np.ndarray,
+    ) -> np.ndarray:
+        """Batch form of :meth:`is_late` followed by :meth:`advance`.
+
+        Rows are taken in order: each data row is judged against the
+        watermark as advanced by every earlier row, and watermark rows
+        (``is_data`` false) only advance it.  A late row can never
+        advance the watermark, so one running maximum gives the same
+        answer as the per-record path.
+
+        Returns
+        -------
+        Mask of the data rows that are too late.
+        """
+        if not len(event_times):
+            return np.zeros(0, dtype=bool)
+        running = np.maximum.accumulate(
+            np.concatenate([[self._watermark], event_times]),
+        )
+        late = is_data & (
+            event_times < running[:-1] - self._allowed_lateness
+        )
+        self._late_count += int(late.sum())
+        self._watermark = float(running[-1])
+        return late
 
-class DeduplicationStore:
+
+class DeduplicationStore(DedupBackend):
     """Bounded LRU store for exactly-once record deduplication.
 
     Retains up to ``capacity`` record IDs.  When the store is full the
-    oldest entry is evicted.
+    oldest entry is evicted.  See :mod:`fastopendata.streaming.dedup` for
+    compact backends that remember far more IDs per byte.
 
     Parameters
     ----------
@@ -216,13 +251,14 @@ class DeduplicationStore:
     """
 
     def __init__(self, capacity: int = 100_000) -> None:
+        super().__init__()
         self._seen: OrderedDict[str, None] = OrderedDict()
         self._capacity = capacity
-        self._duplicates_dropped: int = 0
 
     @property
-    def duplicates_dropped(self) -> int:
-        return self._duplicates_dropped
+    def nbytes(self) -> int:
+        ids = sum(sys.getsizeof(record_id) for record_id in self._seen)
+        return sys.getsizeof(self._seen) + ids
 
     def check_and_add(self, record_id: str) -> bool:
         """Return *True* if the record is new (not a duplicate).
@@ -237,3 +273,16 @@ class DeduplicationStore:
         if len(self._seen) > self._capacity:
             self._seen.popitem(last=False)
         return True
+
+    def save(self, path: PathLike) -> None:
+        save_npz(
+            path,
+            ids=np.array(list(self._seen), dtype=str),
+            duplicates_dropped=np.array(self._duplicates_dropped),
+        )
+
+    def restore(self, path: PathLike) -> None:
+        with np.load(path) as data:
+            ids = data["ids"].tolist()[-self._capacity :]
+            self._seen = OrderedDict.fromkeys(ids)
+            self._duplicates_dropped = int(data["duplicates_dropped"])
@@ -0,0 +1,458 @@
+"""Deduplication backends for exactly-once stream processing.
+
+:class:`~fastopendata.streaming.engine.StreamEngine` drops records whose
+``record_id`` it has already seen.  Every backend answers the same
+question — "is this ID new?" — with a different memory/accuracy trade-off:
+
+* :class:`~fastopendata.streaming.core.DeduplicationStore` keeps the
+  exact ID strings of the most recent records (~150+ bytes per ID).
+* :class:`HashedIdRing` keeps 64-bit hashes of the most recent IDs in
+  sorted NumPy segments (~10 bytes per ID).  A false duplicate needs a
+  64-bit hash collision.
+* :class:`RotatingBloomFilter` keeps time- or count-partitioned Bloom
+  filters (~2 bytes per ID at a 0.1% false-positive rate).  A new record
+  is wrongly dropped with probability at most ``error_rate``; a
+  duplicate is never let through while its partition is retained.
+
+All backends forget the oldest IDs in whole segments or partitions, can
+check a whole micro-batch at once with :meth:`DedupBackend.check_many`,
+and can be saved to and restored from a local ``.npz`` file so that a
+restarted engine keeps its exactly-once guarantee (see the engine's
+``dedup_checkpoint`` option).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+_MASK64 = (1 << 64) - 1
+
+#: Segment bounds of :class:`HashedIdRing` (generations are ``uint8``).
+_MIN_SEGMENTS = 2
+_MAX_SEGMENTS = 255
+
+PathLike = str | os.PathLike[str]
+
+
+def hash_id(record_id: str) -> tuple[int, int]:
+    """Return two independent 64-bit hashes of *record_id*."""
+    digest = hashlib.blake2b(record_id.encode(), digest_size=16).digest()
+    return (
+        int.from_bytes(digest[:8], "little"),
+        int.from_bytes(digest[8:], "little"),
+    )
+
+
+def hash_ids(record_ids: Sequence[str]) -> np.ndarray:
+    """Vectorized :func:`hash_id`: an ``(n, 2)`` array of ``uint64``."""
+    blake2b = hashlib.blake2b
+    raw = b"".join(
+        blake2b(r.encode(), digest_size=16).digest() for r in record_ids
+    )
+    return np.frombuffer(raw, dtype="<u8").reshape(-1, 2)
+
+
+def save_npz(path: PathLike, **arrays: np.ndarray) -> None:
+    """Write *arrays* to an ``.npz`` archive at exactly *path*.
+
+    :func:`numpy.savez` appends ``.npz`` to a path without that suffix,
+    so the archive is written through an open file instead.
+    """
+    with Path(path).open("wb") as f:
+        np.savez(f, **arrays)
+
+
+def _first_occurrences(hashes: np.ndarray) -> np.ndarray:
+    """Mask of the first occurrence of each value in *hashes*."""
+    first = np.zeros(len(hashes), dtype=bool)
+    first[np.unique(hashes, return_index=True)[1]] = True
+    return first
+
+
+class DedupBackend(ABC):
+    """Interface shared by the stream deduplication stores."""
+
+    def __init__(self) -> None:
+        """Start with no duplicates counted."""
+        self._duplicates_dropped: int = 0
+
+    @property
+    def duplicates_dropped(self) -> int:
+        """Number of record IDs rejected as duplicates so far."""
+        return self._duplicates_dropped
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Approximate memory held by the store, in bytes."""
+
+    @abstractmethod
+    def check_and_add(self, record_id: str) -> bool:
+        """Return *True* if the record is new (not a duplicate).
+
+        If the record has been seen before, it is counted as a duplicate
+        and *False* is returned.
+        """
+
+    def check_many(self, record_ids: Sequence[str]) -> np.ndarray:
+        """Batch form of :meth:`check_and_add`.
+
+        IDs are taken in order, so a repeat within *record_ids* is a
+        duplicate of its first occurrence.
+
+        Returns
+        -------
+        Boolean mask of the new record IDs.
+
+        """
+        check = self.check_and_add
+        return np.fromiter(
+            (check(r) for r in record_ids),
+            dtype=bool,
+            count=len(record_ids),
+        )
+
+    @abstractmethod
+    def save(self, path: PathLike) -> None:
+        """Write the store's state to *path* (an ``.npz`` archive).
+
+        The path is used as given, without adding an ``.npz`` suffix.
+        """
+
+    @abstractmethod
+    def restore(self, path: PathLike) -> None:
+        """Replace the store's state with the one saved at *path*.
+
+        Raises
+        ------
+        ValueError
+            If the file was saved by a differently configured store.
+
+        """
+
+    def _check_config(self, saved: np.ndarray, expected: list) -> None:
+        if saved.tolist() != expected:
+            msg = (
+                f"{type(self).__name__} checkpoint was saved with "
+                f"configuration {saved.tolist()}, expected {expected}"
+            )
+            raise ValueError(msg)
+
+
+class HashedIdRing(DedupBackend):
+    """Remembers 64-bit hashes of the most recent record IDs.
+
+    IDs are hashed into the active segment (a Python set of at most
+    ``capacity // segments`` hashes).  When it fills, it is frozen into a
+    sorted ``uint64`` array and merged with the older frozen segments;
+    the oldest segment is dropped once ``segments`` are held.  The store
+    therefore always remembers the last ``capacity * (segments - 1) /
+    segments`` IDs and at most ``capacity``.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of record IDs to remember.
+    segments : int
+        Number of segments the capacity is split into (2 to 255).  More
+        segments forget in smaller steps but re-sort more often.
+
+    """
+
+    def __init__(self, capacity: int = 1_000_000, segments: int = 8) -> None:
+        """Create an empty ring; see the class docstring for parameters."""
+        super().__init__()
+        if not _MIN_SEGMENTS <= segments <= _MAX_SEGMENTS:
+            msg = "segments must be between 2 and 255"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._segments = segments
+        self._segment_size = max(1, capacity // segments)
+        self._active: set[int] = set()
+        self._frozen = np.zeros(0, dtype=np.uint64)
+        self._generation = np.zeros(0, dtype=np.uint8)
+        self._live: deque[int] = deque()
+        self._next_generation = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of record IDs remembered."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Return the number of record ID hashes currently held."""
+        return len(self._active) + len(self._frozen)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the store, in bytes."""
+        # A set slot plus a boxed int is ~ 70 bytes per active hash.
+        return (
+            self._frozen.nbytes
+            + self._generation.nbytes
+            + 70 * len(self._active)
+        )
+
+    def _frozen_contains(self, h: int) -> bool:
+        frozen = self._frozen
+        i = int(np.searchsorted(frozen, np.uint64(h)))
+        return i < len(frozen) and int(frozen[i]) == h
+
+    def check_and_add(self, record_id: str) -> bool:
+        """Return *True* if the record is new, remembering its hash."""
+        h = hash_id(record_id)[0]
+        if h in self._active or self._frozen_contains(h):
+            self._duplicates_dropped += 1
+            return False
+        self._add(h)
+        return True
+
+    def check_many(self, record_ids: Sequence[str]) -> np.ndarray:
+        """Return the mask of new IDs, probing all segments at once."""
+        hashes = hash_ids(record_ids)[:, 0]
+        active = self._active
+        seen = np.fromiter(
+            (h in active for h in hashes.tolist()),
+            dtype=bool,
+            count=len(hashes),
+        )
+        if len(self._frozen):
+            idx = np.searchsorted(self._frozen, hashes)
+            idx[idx == len(self._frozen)] = 0
+            seen |= self._frozen[idx] == hashes
+        new = ~seen & _first_occurrences(hashes)
+        self._duplicates_dropped += int(len(new) - new.sum())
+        for h in hashes[new].tolist():
+            self._add(h)
+        return new
+
+    def _add(self, h: int) -> None:
+        self._active.add(h)
+        if len(self._active) >= self._segment_size:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        """Freeze the active segment, dropping the oldest if full."""
+        segment = np.fromiter(self._active, dtype=np.uint64)
+        self._active = set()
+        generation = self._next_generation
+        self._next_generation = (generation + 1) % 256
+        frozen, generations = self._frozen, self._generation
+        if len(self._live) >= self._segments - 1:
+            keep = generations != self._live.popleft()
+            frozen, generations = frozen[keep], generations[keep]
+        self._live.append(generation)
+        frozen = np.concatenate([frozen, segment])
+        generations = np.concatenate(
+            [generations, np.full(len(segment), generation, np.uint8)],
+        )
+        order = np.argsort(frozen, kind="stable")
+        self._frozen, self._generation = frozen[order], generations[order]
+
+    def _config(self) -> list[int]:
+        return [self._capacity, self._segments]
+
+    def save(self, path: PathLike) -> None:
+        """Write the hashes and segment state to *path*."""
+        save_npz(
+            path,
+            config=np.array(self._config(), dtype=np.int64),
+            active=np.fromiter(self._active, dtype=np.uint64),
+            frozen=self._frozen,
+            generation=self._generation,
+            live=np.array(self._live, dtype=np.uint8),
+            counters=np.array(
+                [self._next_generation, self._duplicates_dropped],
+                dtype=np.int64,
+            ),
+        )
+
+    def restore(self, path: PathLike) -> None:
+        """Replace the hashes and segment state with those at *path*."""
+        with np.load(path) as data:
+            self._check_config(data["config"], self._config())
+            self._active = set(data["active"].tolist())
+            self._frozen = data["frozen"]
+            self._generation = data["generation"]
+            self._live = deque(data["live"].tolist())
+            self._next_generation, self._duplicates_dropped = data[
+                "counters"
+            ].tolist()
+
+
+class RotatingBloomFilter(DedupBackend):
+    """Time- or count-partitioned Bloom filters over record IDs.
+
+    New IDs are added to the newest of ``partitions`` Bloom filters and
+    looked up in all of them.  The newest filter is retired — and the
+    oldest one dropped — once it holds ``capacity / partitions`` IDs or,
+    when ``partition_seconds`` is set, once it is that many seconds old.
+    Each filter is sized for a ``error_rate / partitions`` false-positive
+    rate, so a lookup across all of them stays within ``error_rate``.
+
+    Parameters
+    ----------
+    capacity : int
+        Number of IDs the retained partitions hold together.
+    error_rate : float
+        Target probability that a new ID is reported as a duplicate.
+    partitions : int
+        Number of filters; the store forgets ``1 / partitions`` of its
+        capacity at a time.
+    partition_seconds : float | None
+        Also rotate partitions on this wall-clock period.
+    clock : Callable[[], float]
+        Time source for ``partition_seconds`` (``time.monotonic``).
+
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        partitions: int = 4,
+        *,
+        partition_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create empty filters; see the class docstring for parameters."""
+        super().__init__()
+        if not 0 < error_rate < 1:
+            msg = "error_rate must be between 0 and 1"
+            raise ValueError(msg)
+        if partitions < 1:
+            msg = "partitions must be at least 1"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._partitions = partitions
+        self._partition_seconds = partition_seconds
+        self._clock = clock
+        per_partition = max(1, math.ceil(capacity / partitions))
+        p = error_rate / partitions
+        bits = math.ceil(-per_partition * math.log(p) / math.log(2) ** 2)
+        self._partition_size = per_partition
+        self._num_bytes = (bits + 7) // 8
+        self._num_bits = self._num_bytes * 8
+        self._num_hashes = max(
+            1,
+            round(self._num_bits / per_partition * math.log(2)),
+        )
+        self._filters: deque[bytearray] = deque(
+            bytearray(self._num_bytes) for _ in range(partitions)
+        )
+        self._count = 0
+        self._started = clock()
+
+    @property
+    def capacity(self) -> int:
+        """Number of IDs the retained partitions hold together."""
+        return self._capacity
+
+    @property
+    def num_hashes(self) -> int:
+        """Number of bit positions set per ID."""
+        return self._num_hashes
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the filters, in bytes."""
+        return self._num_bytes * self._partitions
+
+    def _positions(self, h1: int, h2: int) -> list[int]:
+        m = self._num_bits
+        return [((h1 + i * h2) & _MASK64) % m for i in range(self._num_hashes)]
+
+    def check_and_add(self, record_id: str) -> bool:
+        """Return *True* if the record is new, adding it to the filter."""
+        self._maybe_rotate()
+        positions = self._positions(*hash_id(record_id))
+        for bits in self._filters:
+            if all(bits[p >> 3] >> (p & 7) & 1 for p in positions):
+                self._duplicates_dropped += 1
+                return False
+        current = self._filters[-1]
+        for p in positions:
+            current[p >> 3] |= 1 << (p & 7)
+        self._count += 1
+        return True
+
+    def check_many(self, record_ids: Sequence[str]) -> np.ndarray:
+        """Return the mask of new IDs, probing all filters at once."""
+        self._maybe_rotate()
+        hashes = hash_ids(record_ids)
+        steps = np.arange(self._num_hashes, dtype=np.uint64)
+        # uint64 arithmetic wraps exactly like the masked scalar path.
+        positions = (hashes[:, :1] + steps * hashes[:, 1:]) % np.uint64(
+            self._num_bits
+        )
+        byte_index = (positions >> np.uint64(3)).astype(np.intp)
+        bit = np.left_shift(1, (positions & np.uint64(7)).astype(np.uint8))
+        seen = np.zeros(len(hashes), dtype=bool)
+        for bits in self._filters:
+            view = np.frombuffer(bits, dtype=np.uint8)
+            seen |= ((view[byte_index] & bit) != 0).all(axis=1)
+        new = ~seen & _first_occurrences(hashes[:, 0])
+        self._duplicates_dropped += int(len(new) - new.sum())
+
+        # Add in chunks so a count-based rotation lands between records.
+        rows = np.flatnonzero(new)
+        while len(rows):
+            room = max(1, self._partition_size - self._count)
+            chunk, rows = rows[:room], rows[room:]
+            view = np.frombuffer(self._filters[-1], dtype=np.uint8)
+            np.bitwise_or.at(view, byte_index[chunk], bit[chunk])
+            self._count += len(chunk)
+            self._maybe_rotate()
+        return new
+
+    def _maybe_rotate(self) -> None:
+        expired = (
+            self._partition_seconds is not None
+            and self._clock() - self._started >= self._partition_seconds
+        )
+        if expired or self._count >= self._partition_size:
+            self._filters.popleft()
+            self._filters.append(bytearray(self._num_bytes))
+            self._count = 0
+            self._started = self._clock()
+
+    def _config(self) -> list[int]:
+        return [self._num_bits, self._num_hashes, self._partitions]
+
+    def save(self, path: PathLike) -> None:
+        """Write the filters and partition fill to *path*."""
+        save_npz(
+            path,
+            config=np.array(self._config(), dtype=np.int64),
+            filters=np.frombuffer(
+                b"".join(self._filters),
+                dtype=np.uint8,
+            ).reshape(self._partitions, self._num_bytes),
+            counters=np.array(
+                [self._count, self._duplicates_dropped],
+                dtype=np.int64,
+            ),
+        )
+
+    def restore(self, path: PathLike) -> None:
+        """Replace the filters with those at *path*, restarting the clock."""
+        with np.load(path) as data:
+            self._check_config(data["config"], self._config())
+            self._filters = deque(
+                bytearray(row.tobytes()) for row in data["filters"]
+            )
+            self._count, self._duplicates_dropped = data["counters"].tolist()
+        self._started = self._clock()
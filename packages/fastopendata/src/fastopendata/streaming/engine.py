@@ -4,17 +4,41 @@
 joins, views), and sinks into a running pipeline.  It manages the
 event loop, watermark advancement, exactly-once dedup, and graceful
 shutdown.
+
+With ``micro_batch=True`` each drained batch is converted once into an
+Arrow record batch (see :mod:`fastopendata.streaming.batches`): dedup
+and lateness are decided for the whole batch, and batch transforms,
+columnar joins, windows, views and batch sinks each run once per batch
+instead of once per record.
+
+Continuous Cypher queries (:meth:`StreamEngine.register_query`) run over
+the engine's :class:`~fastopendata.streaming.continuous.StreamingGraph`;
+changes to the views bound to it are applied once per cycle.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+import pyarrow as pa
+
+from fastopendata.streaming.batches import (
+    BatchSink,
+    BatchTransform,
+    batch_to_records,
+    records_to_batch,
+)
+from fastopendata.streaming.continuous import (
+    ContinuousQuery,
+    StreamingGraph,
+)
 from fastopendata.streaming.core import (
     DeduplicationStore,
     RecordType,
@@ -22,6 +46,7 @@ from fastopendata.streaming.core import (
     StreamRecord,
     WatermarkTracker,
 )
+from fastopendata.streaming.dedup import DedupBackend, PathLike
 from fastopendata.streaming.joins import StreamTableJoin
 from fastopendata.streaming.views import IncrementalView
 from fastopendata.streaming.windows import WindowManager, WindowState
@@ -82,12 +107,22 @@ class StreamEngine:
         Input record buffer.
     watermark : WatermarkTracker
         Watermark tracker for event-time progress.
-    dedup : DeduplicationStore | None
-        Optional deduplication store for exactly-once semantics.
+    dedup : DedupBackend | None
+        Deduplication store for exactly-once semantics (default: a
+        :class:`DeduplicationStore`); see
+        :mod:`fastopendata.streaming.dedup` for compact backends.
     batch_size : int
         Maximum records to drain per processing cycle.
     cycle_interval : float
         Seconds between processing cycles (controls latency).
+    micro_batch : bool
+        Process each drained batch as one Arrow record batch.  Record
+        transforms are replaced by :meth:`add_batch_transform` and joins
+        need a ``key_column``; record sinks still receive records.
+    dedup_checkpoint : str | os.PathLike | None
+        ``.npz`` file the dedup store is restored from on :meth:`start`
+        (when it exists) and saved to on :meth:`stop`, so exactly-once
+        holds across restarts.
 
     """
 
@@ -95,16 +130,20 @@ class StreamEngine:
         self,
         buffer: StreamBuffer,
         watermark: WatermarkTracker | None = None,
-        dedup: DeduplicationStore | None = None,
+        dedup: DedupBackend | None = None,
         *,
         batch_size: int = 256,
         cycle_interval: float = 0.05,
+        micro_batch: bool = False,
+        dedup_checkpoint: PathLike | None = None,
     ) -> None:
         self._buffer = buffer
         self._watermark = watermark or WatermarkTracker()
         self._dedup = dedup or DeduplicationStore()
         self._batch_size = batch_size
         self._cycle_interval = cycle_interval
+        self._micro_batch = micro_batch
+        self._dedup_checkpoint = dedup_checkpoint
 
         self._window_managers: list[WindowManager] = []
         self._joins: list[StreamTableJoin] = []
@@ -113,6 +152,9 @@ class StreamEngine:
         self._transforms: list[
             Callable[[StreamRecord], StreamRecord | None]
         ] = []
+        self._batch_transforms: list[BatchTransform] = []
+        self._batch_sinks: list[BatchSink] = []
+        self._graph = StreamingGraph()
 
         self._metrics = PipelineMetrics()
         self._running = False
@@ -126,10 +168,31 @@ class StreamEngine:
     def is_running(self) -> bool:
         return self._running
 
+    @property
+    def micro_batch(self) -> bool:
+        return self._micro_batch
+
+    @property
+    def graph(self) -> StreamingGraph:
+        """Graph fed by view changelogs for continuous queries."""
+        return self._graph
+
+    async def register_query(self, query: str) -> ContinuousQuery:
+        """Register a continuous Cypher query over :attr:`graph`.
+
+        Bind the views it reads first (``engine.graph.bind_entity_view``
+        and ``bind_relationship_view``); the query is evaluated once now
+        and then kept up to date after every processing cycle.
+        """
+        return await self._graph.register(query)
+
     def add_window_manager(self, wm: WindowManager) -> None:
         self._window_managers.append(wm)
 
     def add_join(self, join: StreamTableJoin) -> None:
+        if self._micro_batch and join.key_column is None:
+            msg = "Micro-batch joins need a StreamTableJoin key_column"
+            raise ValueError(msg)
         self._joins.append(join)
 
     def add_view(self, view: IncrementalView) -> None:
@@ -142,12 +205,36 @@ class StreamEngine:
         self, fn: Callable[[StreamRecord], StreamRecord | None]
     ) -> None:
         """Add a stateless map/filter transform to the pipeline."""
+        if self._micro_batch:
+            msg = "Use add_batch_transform() in micro-batch mode"
+            raise ValueError(msg)
         self._transforms.append(fn)
 
+    def add_batch_transform(self, fn: BatchTransform) -> None:
+        """Add a map/filter transform over Arrow record batches.
+
+        The transform returns a new batch (possibly with fewer rows or
+        extra columns), or *None* to drop the whole batch.
+        """
+        if not self._micro_batch:
+            msg = "Batch transforms require micro_batch=True"
+            raise ValueError(msg)
+        self._batch_transforms.append(fn)
+
+    def add_batch_sink(self, sink: BatchSink) -> None:
+        """Add a sink that receives each processed Arrow record batch."""
+        if not self._micro_batch:
+            msg = "Batch sinks require micro_batch=True"
+            raise ValueError(msg)
+        self._batch_sinks.append(sink)
+
     async def start(self) -> None:
         """Start the engine's processing loop as a background task."""
         if self._running:
             return
+        checkpoint = self._dedup_checkpoint
+        if checkpoint is not None and os.path.exists(checkpoint):
+            self._dedup.restore(checkpoint)
         self._running = True
         self._metrics = PipelineMetrics()
         self._task = asyncio.create_task(self._run_loop())
@@ -159,6 +246,9 @@ class StreamEngine:
         if self._task is not None:
             await self._task
             self._task = None
+        await self._flush_graph()
+        if self._dedup_checkpoint is not None:
+            self._dedup.save(self._dedup_checkpoint)
         _logger.info(
             "StreamEngine stopped — %s",
             self._metrics.to_dict(),
@@ -172,14 +262,23 @@ class StreamEngine:
                 await asyncio.sleep(self._cycle_interval)
                 continue
 
-            for record in batch:
+            if self._micro_batch:
                 try:
-                    await self._process_record(record)
+                    await self._process_batch(batch)
                 except Exception:
                     _logger.exception(
-                        "Error processing record %s", record.record_id
+                        "Error processing batch of %d records", len(batch)
                     )
                     self._metrics.errors += 1
+            else:
+                for record in batch:
+                    try:
+                        await self._process_record(record)
+                    except Exception:
+                        _logger.exception(
+                            "Error processing record %s", record.record_id
+                        )
+                        self._metrics.errors += 1
 
             # Fire windows after processing the batch
             for wm in self._window_managers:
@@ -188,6 +287,16 @@ class StreamEngine:
                     self._metrics.windows_fired += 1
                     await self._handle_window_fire(key, window_state)
 
+            await self._flush_graph()
+
+    async def _flush_graph(self) -> None:
+        """Apply this cycle's view changes to continuous queries."""
+        try:
+            await self._graph.flush()
+        except Exception:
+            _logger.exception("Error updating continuous queries")
+            self._metrics.errors += 1
+
     async def _process_record(self, record: StreamRecord) -> None:
         # Handle watermark advancement records
         if record.record_type == RecordType.WATERMARK:
@@ -209,6 +318,77 @@ class StreamEngine:
         await self._route_record(current)
         self._metrics.records_processed += 1
 
+    async def _process_batch(self, records: Sequence[StreamRecord]) -> None:
+        """Micro-batch form of :meth:`_process_record` for a whole batch."""
+        event_times = np.fromiter(
+            (r.event_time for r in records),
+            dtype=np.float64,
+            count=len(records),
+        )
+        is_watermark = np.fromiter(
+            (r.record_type == RecordType.WATERMARK for r in records),
+            dtype=bool,
+            count=len(records),
+        )
+        candidates = np.flatnonzero(~is_watermark)
+        # Build the batch before dedup and the watermark see any record,
+        # so a batch that cannot be converted leaves no state behind.
+        batch = records_to_batch([records[i] for i in candidates])
+        is_data = np.zeros(len(records), dtype=bool)
+        is_new = self._dedup.check_many(
+            [records[i].record_id for i in candidates],
+        )
+        is_data[candidates[is_new]] = True
+        self._metrics.records_dropped_dedup += int(len(is_new) - is_new.sum())
+
+        active = np.flatnonzero(is_data | is_watermark)
+        late = self._watermark.late_mask(
+            event_times[active],
+            is_data[active],
+        )
+        self._metrics.records_dropped_late += int(late.sum())
+        keep = active[is_data[active] & ~late]
+        if not len(keep):
+            return
+
+        batch = self._apply_batch_pipeline(
+            batch.filter(pa.array(np.isin(candidates, keep))),
+        )
+        if batch is None or batch.num_rows == 0:
+            return
+        await self._route_batch(batch)
+        self._metrics.records_processed += batch.num_rows
+
+    def _apply_batch_pipeline(
+        self,
+        batch: pa.RecordBatch,
+    ) -> pa.RecordBatch | None:
+        """Apply batch transforms and columnar joins."""
+        current: pa.RecordBatch | None = batch
+        for transform in self._batch_transforms:
+            if current is None or current.num_rows == 0:
+                return None
+            current = transform(current)
+        for join in self._joins:
+            if current is None or current.num_rows == 0:
+                return None
+            current = join.process_batch(current)
+        return current
+
+    async def _route_batch(self, batch: pa.RecordBatch) -> None:
+        """Route a processed record batch to windows, views, and sinks."""
+        for wm in self._window_managers:
+            wm.add_batch(batch)
+        for view in self._views:
+            entries = await view.apply_batch(batch)
+            self._metrics.view_changes += len(entries)
+        for batch_sink in self._batch_sinks:
+            batch_sink(batch)
+        if self._sinks:
+            for record in batch_to_records(batch):
+                for sink in self._sinks:
+                    sink(record)
+
     def _filter_record(self, record: StreamRecord) -> bool:
         """Return True if the record passes dedup and lateness checks."""
         if not self._dedup.check_and_add(record.record_id):
@@ -244,18 +424,20 @@ class StreamEngine:
             sink(record)
 
     async def _handle_window_fire(self, key: str, state: WindowState) -> None:
-        """Aggregate a fired window's records and push through views/sinks."""
-        if not state.records:
+        """Summarize a fired window and push it through views/sinks."""
+        if not state.count:
             return
-        # Create a summary record for the window
+        value: dict[str, Any] = {
+            "__window_start__": state.spec.start,
+            "__window_end__": state.spec.end,
+            "__window_count__": state.count,
+            "__window_aggregates__": state.summary(),
+        }
+        if state.records is not None:
+            value["__window_records__"] = [r.value for r in state.records]
         summary = StreamRecord(
             key=key,
-            value={
-                "__window_start__": state.spec.start,
-                "__window_end__": state.spec.end,
-                "__window_count__": state.count,
-                "__window_records__": [r.value for r in state.records],
-            },
+            value=value,
             event_time=state.spec.end,
             source="window_aggregate",
         )
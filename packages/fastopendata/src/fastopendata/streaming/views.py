@@ -15,6 +15,10 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any
 
+import numpy as np
+import pyarrow as pa
+
+from fastopendata.streaming.batches import KEY_COLUMN, batch_to_records
 from fastopendata.streaming.core import RecordType, StreamRecord
 
 
@@ -107,6 +111,29 @@ class IncrementalView:
         # INSERT or UPDATE
         return await self._handle_upsert(key, record)
 
+    async def apply_batch(
+        self,
+        batch: pa.RecordBatch,
+    ) -> list[ChangelogEntry]:
+        """Apply a columnar micro-batch and return its changelog delta.
+
+        Without an aggregate function only the last change to each key in
+        the batch is observable, so each key is applied once: the
+        changelog is compacted within the batch and the snapshot ends up
+        the same as applying every row in turn.
+        """
+        if self._aggregate_fn is None:
+            keys = batch.column(KEY_COLUMN).to_pandas()
+            last = np.flatnonzero(~keys.duplicated(keep="last").to_numpy())
+            if len(last) < batch.num_rows:
+                batch = batch.take(pa.array(last))
+        entries: list[ChangelogEntry] = []
+        for record in batch_to_records(batch):
+            entry = await self.apply(record)
+            if entry is not None:
+                entries.append(entry)
+        return entries
+
     async def _handle_upsert(
         self,
         key: str,
@@ -1,18 +1,44 @@
 """Temporal windowing for the streaming query engine.
 
 Supports tumbling (fixed-size, non-overlapping), sliding (fixed-size,
-overlapping), and session (activity-gap-based) windows.  Each window
-accumulates records and fires when triggered by the watermark.
+overlapping), and session (activity-gap-based) windows.  Each window keeps
+incremental aggregate state — a record count, count/sum/min/max per
+numeric field and optional distinct-count and quantile sketches — and
+fires when triggered by the watermark.  Raw records are only retained
+when asked for, so an open window's memory does not grow with its
+traffic.
+
+Records can be added one at a time (:meth:`WindowManager.add`) or as a
+columnar micro-batch (:meth:`WindowManager.add_batch`), which assigns
+windows and aggregates each ``(key, window)`` group with vectorized
+kernels.
 """
 
 from __future__ import annotations
 
 import bisect
+import math
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from dataclasses import dataclass, field
-
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pycypher.sketches import HyperLogLog, KllSketch, hash_values
+
+from fastopendata.streaming.batches import (
+    EVENT_TIME_COLUMN,
+    KEY_COLUMN,
+    batch_to_records,
+    payload_columns,
+)
 from fastopendata.streaming.core import StreamRecord
 
+#: Quantiles reported for fields with a quantile sketch.
+SUMMARY_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+
 
 @dataclass(frozen=True, slots=True)
 class WindowSpec:
@@ -32,20 +58,115 @@ class WindowSpec:
         return f"Window({self.start:.1f}-{self.end:.1f})"
 
 
+@dataclass(slots=True)
+class FieldAggregate:
+    """Running count, sum, minimum and maximum of one numeric field."""
+
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: FieldAggregate) -> None:
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        if not self.count:
+            return {"count": 0, "sum": 0, "min": None, "max": None}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum,
+            "max": self.maximum,
+            "mean": self.total / self.count,
+        }
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
 @dataclass
 class WindowState:
-    """Mutable accumulator for records assigned to a specific window."""
+    """Incremental aggregate state for one window of one key.
+
+    Attributes
+    ----------
+    count : int
+        Records assigned to the window.
+    fields : dict[str, FieldAggregate]
+        Running aggregates per numeric payload field.
+    distinct, quantiles : dict
+        Sketches for the fields configured on the :class:`WindowManager`.
+    records : list[StreamRecord] | None
+        The raw records, only when the manager retains them.
+
+    """
 
     spec: WindowSpec
-    records: list[StreamRecord] = field(default_factory=list)
+    records: list[StreamRecord] | None = None
     fired: bool = False
+    count: int = 0
+    fields: dict[str, FieldAggregate] = field(default_factory=dict)
+    distinct: dict[str, HyperLogLog] = field(default_factory=dict)
+    quantiles: dict[str, KllSketch] = field(default_factory=dict)
+    tracked_fields: frozenset[str] | None = None
 
     def add(self, record: StreamRecord) -> None:
-        self.records.append(record)
-
-    @property
-    def count(self) -> int:
-        return len(self.records)
+        self.count += 1
+        if self.records is not None:
+            self.records.append(record)
+        for name, value in record.value.items():
+            if not _is_number(value):
+                continue
+            if self.tracked_fields is None or name in self.tracked_fields:
+                aggregate = self.fields.get(name)
+                if aggregate is None:
+                    aggregate = self.fields[name] = FieldAggregate()
+                aggregate.add(value)
+        for name, sketch in self.distinct.items():
+            value = record.value.get(name)
+            if value is not None:
+                sketch.add_series(pd.Series([value]))
+        for name, sketch in self.quantiles.items():
+            value = record.value.get(name)
+            if _is_number(value):
+                sketch.add_series(np.array([value], dtype=np.float64))
+
+    def merge(self, other: WindowState) -> None:
+        """Fold *other*'s state into this window."""
+        self.count += other.count
+        if self.records is not None and other.records is not None:
+            self.records.extend(other.records)
+        for name, aggregate in other.fields.items():
+            self.fields.setdefault(name, FieldAggregate()).merge(aggregate)
+        for name, sketch in other.distinct.items():
+            self.distinct[name].merge(sketch)
+        for name, sketch in other.quantiles.items():
+            self.quantiles[name].merge(sketch)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Return the window's aggregates as plain values, per field."""
+        result: dict[str, dict[str, Any]] = {
+            name: aggregate.to_dict()
+            for name, aggregate in self.fields.items()
+        }
+        for name, sketch in self.distinct.items():
+            result.setdefault(name, {})["distinct"] = round(sketch.estimate())
+        for name, sketch in self.quantiles.items():
+            result.setdefault(name, {})["quantiles"] = {
+                q: sketch.quantile(q) for q in SUMMARY_QUANTILES
+            }
+        return result
 
 
 class WindowAssigner(ABC):
@@ -59,6 +180,33 @@ class WindowAssigner(ABC):
     def merge(self, windows: list[WindowSpec]) -> list[WindowSpec]:
         """Merge overlapping or adjacent windows (session semantics)."""
 
+    def assign_times(
+        self,
+        event_times: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Assign many event times at once.
+
+        Returns
+        -------
+        ``(rows, starts, ends)`` with one entry per assignment: row
+        ``rows[i]`` belongs to window ``[starts[i], ends[i])``.  The
+        windows are identical to those :meth:`assign` returns.
+        """
+        rows: list[int] = []
+        starts: list[float] = []
+        ends: list[float] = []
+        for row, event_time in enumerate(event_times.tolist()):
+            probe = StreamRecord(key="", value={}, event_time=event_time)
+            for spec in self.assign(probe):
+                rows.append(row)
+                starts.append(spec.start)
+                ends.append(spec.end)
+        return (
+            np.array(rows, dtype=np.intp),
+            np.array(starts, dtype=np.float64),
+            np.array(ends, dtype=np.float64),
+        )
+
 
 class TumblingWindow(WindowAssigner):
     """Fixed-size, non-overlapping windows.
@@ -85,6 +233,14 @@ class TumblingWindow(WindowAssigner):
         # Tumbling windows never overlap — no merge needed.
         return windows
 
+    def assign_times(
+        self,
+        event_times: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        starts = (event_times // self._size) * self._size
+        rows = np.arange(len(event_times), dtype=np.intp)
+        return rows, starts, starts + self._size
+
 
 class SlidingWindow(WindowAssigner):
     """Fixed-size windows that advance by a configurable slide interval.
@@ -133,6 +289,33 @@ class SlidingWindow(WindowAssigner):
     def merge(self, windows: list[WindowSpec]) -> list[WindowSpec]:
         return windows
 
+    def assign_times(
+        self,
+        event_times: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Same float steps as assign(), one candidate start per pass, so
+        # both paths produce bit-identical window bounds.
+        last_start = (event_times // self._slide) * self._slide
+        start = last_start - self._size + self._slide
+        all_rows = np.arange(len(event_times), dtype=np.intp)
+        rows: list[np.ndarray] = []
+        starts: list[np.ndarray] = []
+        pending = start <= last_start
+        while pending.any():
+            end = start + self._size
+            hit = pending & (start <= event_times) & (event_times < end)
+            rows.append(all_rows[hit])
+            starts.append(start[hit])
+            start = start + self._slide
+            pending &= start <= last_start
+        if not rows:
+            empty = np.array([], dtype=np.float64)
+            return all_rows[:0], empty, empty
+        row = np.concatenate(rows)
+        order = np.argsort(row, kind="stable")
+        begin = np.concatenate(starts)[order]
+        return row[order], begin, begin + self._size
+
 
 class SessionWindow(WindowAssigner):
     """Activity-gap-based windows that close after inactivity exceeds the gap.
@@ -174,6 +357,13 @@ class SessionWindow(WindowAssigner):
                 merged.append(win)
         return merged
 
+    def assign_times(
+        self,
+        event_times: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows = np.arange(len(event_times), dtype=np.intp)
+        return rows, event_times.astype(np.float64), event_times + self._gap
+
 
 class WindowManager:
     """Manages window state for a keyed stream.
@@ -185,11 +375,33 @@ class WindowManager:
     ----------
     assigner : WindowAssigner
         Strategy for assigning records to windows.
+    fields : Collection[str] | None
+        Numeric payload fields to aggregate; all numeric fields when
+        *None*.
+    distinct : Collection[str]
+        Fields whose distinct values are counted with a HyperLogLog.
+    quantiles : Collection[str]
+        Numeric fields summarised with a KLL quantile sketch.
+    keep_records : bool
+        Also retain every raw record on its window (memory grows with
+        window traffic; off by default).
 
     """
 
-    def __init__(self, assigner: WindowAssigner) -> None:
+    def __init__(
+        self,
+        assigner: WindowAssigner,
+        *,
+        fields: Collection[str] | None = None,
+        distinct: Collection[str] = (),
+        quantiles: Collection[str] = (),
+        keep_records: bool = False,
+    ) -> None:
         self._assigner = assigner
+        self._fields = None if fields is None else frozenset(fields)
+        self._distinct = tuple(distinct)
+        self._quantiles = tuple(quantiles)
+        self._keep_records = keep_records
         # key → { WindowSpec → WindowState }
         self._state: dict[str, dict[WindowSpec, WindowState]] = {}
         self._total_fired: int = 0
@@ -201,20 +413,134 @@ class WindowManager:
     def total_fired(self) -> int:
         return self._total_fired
 
+    def _new_state(self, spec: WindowSpec) -> WindowState:
+        return WindowState(
+            spec=spec,
+            records=[] if self._keep_records else None,
+            distinct={name: HyperLogLog() for name in self._distinct},
+            quantiles={name: KllSketch() for name in self._quantiles},
+            tracked_fields=self._fields,
+        )
+
+    def _window(self, key: str, spec: WindowSpec) -> WindowState:
+        key_windows = self._state.get(key)
+        if key_windows is None:
+            key_windows = self._state[key] = {}
+        state = key_windows.get(spec)
+        if state is None:
+            state = key_windows[spec] = self._new_state(spec)
+            # Insert into sorted index using bisect for O(log n) insertion.
+            bisect.insort(self._end_index, (spec.end, key, spec))
+        return state
+
     def add(self, record: StreamRecord) -> None:
         """Assign a record to the appropriate window(s)."""
-        specs = self._assigner.assign(record)
-        key = record.key
-        if key not in self._state:
-            self._state[key] = {}
-        key_windows = self._state[key]
-        for spec in specs:
-            if spec not in key_windows:
-                key_windows[spec] = WindowState(spec=spec)
-                # Insert into sorted index using bisect for O(log n) insertion.
-                entry = (spec.end, key, spec)
-                bisect.insort(self._end_index, entry)
-            key_windows[spec].add(record)
+        for spec in self._assigner.assign(record):
+            self._window(record.key, spec).add(record)
+
+    def add_batch(self, batch: pa.RecordBatch) -> None:
+        """Assign and aggregate a columnar micro-batch.
+
+        Equivalent to calling :meth:`add` for every row, but windows are
+        assigned with array arithmetic and each ``(key, window)`` group is
+        aggregated once with vectorized kernels.
+        """
+        if batch.num_rows == 0:
+            return
+        event_times = batch.column(EVENT_TIME_COLUMN).to_numpy()
+        rows, starts, ends = self._assigner.assign_times(event_times)
+        if not len(rows):
+            return
+        keys = batch.column(KEY_COLUMN).to_numpy(zero_copy_only=False)
+        frame = pd.DataFrame(
+            {"key": keys[rows], "start": starts, "end": ends},
+        )
+        # Numeric columns, as floats: aggregated ones (``fields``) and
+        # sketched ones (``quantiles``) are chosen independently.
+        floats: list[str] = []
+        for name in payload_columns(batch):
+            dtype = batch.schema.field(name).type
+            tracked = self._fields is None or name in self._fields
+            if (tracked or name in self._quantiles) and (
+                pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+            ):
+                column = batch.column(name).cast(pa.float64())
+                frame[name] = column.to_numpy(zero_copy_only=False)[rows]
+                floats.append(name)
+        numeric = [
+            name
+            for name in floats
+            if self._fields is None or name in self._fields
+        ]
+
+        codes = (
+            frame.groupby(["key", "start", "end"], sort=False)
+            .ngroup()
+            .to_numpy()
+        )
+        n_groups = int(codes.max()) + 1
+        order = np.argsort(codes, kind="stable")
+        sizes = np.bincount(codes, minlength=n_groups)
+        bounds = np.concatenate([[0], np.cumsum(sizes)])
+        first = order[bounds[:-1]]
+
+        stats: dict[str, tuple[np.ndarray, ...]] = {}
+        for name in numeric:
+            values = frame[name].to_numpy()
+            present = ~np.isnan(values)
+            low = np.full(n_groups, np.inf)
+            high = np.full(n_groups, -np.inf)
+            np.minimum.at(low, codes[present], values[present])
+            np.maximum.at(high, codes[present], values[present])
+            stats[name] = (
+                np.bincount(codes[present], minlength=n_groups),
+                np.bincount(
+                    codes[present],
+                    weights=values[present],
+                    minlength=n_groups,
+                ),
+                low,
+                high,
+            )
+        records = batch_to_records(batch) if self._keep_records else None
+        hashes = {
+            name: hash_values(batch.column(name).to_pandas())
+            for name in self._distinct
+            if name in batch.schema.names
+        }
+        valid = {
+            name: batch.column(name).is_valid().to_numpy(zero_copy_only=False)
+            for name in hashes
+        }
+
+        window_keys = frame["key"].to_numpy()[first]
+        for group in range(n_groups):
+            row = first[group]
+            state = self._window(
+                window_keys[group],
+                WindowSpec(start=float(starts[row]), end=float(ends[row])),
+            )
+            state.count += int(sizes[group])
+            members = order[bounds[group] : bounds[group + 1]]
+            group_rows = rows[members]
+            if records is not None and state.records is not None:
+                state.records.extend(records[i] for i in group_rows)
+            for name, (count, total, low, high) in stats.items():
+                if count[group]:
+                    state.fields.setdefault(name, FieldAggregate()).merge(
+                        FieldAggregate(
+                            int(count[group]),
+                            float(total[group]),
+                            float(low[group]),
+                            float(high[group]),
+                        ),
+                    )
+            for name, hashed in hashes.items():
+                taken = group_rows[valid[name][group_rows]]
+                state.distinct[name].add_hashes(hashed[taken])
+            for name, sketch in state.quantiles.items():
+                if name in floats:
+                    sketch.add_series(frame[name].to_numpy()[members])
 
     def fire(self, watermark: float) -> list[tuple[str, WindowState]]:
         """Fire and return all windows whose end <= watermark.
@@ -261,10 +587,10 @@ class WindowManager:
                 rebuild_index = True
                 new_states: dict[WindowSpec, WindowState] = {}
                 for mspec in merged:
-                    combined = WindowState(spec=mspec)
+                    combined = self._new_state(mspec)
                     for old_spec, old_state in key_windows.items():
                         if mspec.contains(old_spec.start):
-                            combined.records.extend(old_state.records)
+                            combined.merge(old_state)
                     new_states[mspec] = combined
                 self._state[key] = new_states
         if rebuild_index:
@@ -0,0 +1,164 @@
+"""Tests for the columnar FIPS relationship derivation engine.
+
+Covers key normalization in
+:func:`fastopendata.etl.derivation_engine.encode_key` and
+:func:`run_derivation` joins: composite and prefix keys, ``where``
+filters, invalid-row dropping, right-side de-duplication and partitioned
+execution.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastopendata.etl.derivation_engine import (
+    DerivationSpec,
+    Endpoint,
+    KeySpec,
+    encode_key,
+    format_key,
+    run_derivation,
+)
+
+_STATE = KeySpec((("STATEFP", 2),))
+
+# ---------------------------------------------------------------------------
+# Key encoding
+# ---------------------------------------------------------------------------
+
+
+class TestEncodeKey:
+    @pytest.mark.parametrize(
+        "values",
+        [
+            [6, 13],
+            [6.0, 13.0],
+            ["6", "13"],
+            ["06", "13"],
+            pd.array([6, 13], dtype="Int64"),
+        ],
+    )
+    def test_code_spellings_agree(self, values) -> None:
+        keys, valid = encode_key(pd.DataFrame({"STATEFP": values}), _STATE)
+        assert keys.tolist() == [6, 13]
+        assert valid.all()
+
+    def test_invalid_codes(self) -> None:
+        frame = pd.DataFrame({"STATEFP": ["06", None, "x", 6.5, -1, 100]})
+        _, valid = encode_key(frame, _STATE)
+        assert valid.tolist() == [True, False, False, False, False, False]
+
+    def test_composite_and_prefix(self) -> None:
+        frame = pd.DataFrame({"STATE": [13, "06"], "PUMA": ["03700", 101]})
+        key = KeySpec((("STATE", 2), ("PUMA", 5)))
+        keys, _ = encode_key(frame, key)
+        assert keys.tolist() == [1303700, 600101]
+        assert format_key(keys, key.width).tolist() == ["1303700", "0600101"]
+        prefix, _ = encode_key(frame, KeySpec(key.parts, drop_digits=5))
+        assert prefix.tolist() == [13, 6]
+
+
+# ---------------------------------------------------------------------------
+# Joins
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def states() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"STATEFP": ["06", "13", "13"], "NAME": ["CA", "GA", "dup"]},
+    )
+
+
+class TestRunDerivation:
+    def test_join_drops_unmatched_and_dedupes_right(self, states) -> None:
+        left = pd.DataFrame(
+            {
+                "id": ["a", "b", "c", "d", None],
+                "fips": [13, "06", 99, None, 6],
+            },
+        )
+        spec = DerivationSpec(
+            left_key=KeySpec((("fips", 2),)),
+            right_key=_STATE,
+            source=Endpoint("left", column="id"),
+            target=Endpoint("right", column="NAME"),
+        )
+        edges = run_derivation(spec, left, states)
+        assert edges.to_dict("list") == {
+            "__SOURCE__": ["a", "b"],
+            "__TARGET__": ["GA", "CA"],
+        }
+
+    def test_formatted_endpoints_and_where(self) -> None:
+        crosswalk = pd.DataFrame(
+            {
+                "STATEFP": [13, 13, 6],
+                "TRACTCE": [100, 200, 300],
+                "PUMA": [1, 2, 3],
+            },
+        )
+        tract = KeySpec((("STATEFP", 2), ("TRACTCE", 6)))
+        spec = DerivationSpec(
+            left_key=tract,
+            source=Endpoint("left", key=tract),
+            target=Endpoint("left", key=KeySpec((("PUMA", 5),))),
+        )
+        edges = run_derivation(spec, crosswalk, where={"STATEFP": "13"})
+        assert edges["__SOURCE__"].tolist() == ["13000100", "13000200"]
+        assert edges["__TARGET__"].tolist() == ["00001", "00002"]
+
+    def test_empty_inputs(self, states) -> None:
+        spec = DerivationSpec(
+            left_key=_STATE,
+            right_key=_STATE,
+            source=Endpoint("left", column="STATEFP"),
+            target=Endpoint("right", column="NAME"),
+        )
+        assert run_derivation(spec, states.iloc[:0], states).empty
+        assert run_derivation(spec, states, states.iloc[:0]).empty
+        assert list(run_derivation(spec, states, None).columns) == [
+            "__SOURCE__",
+            "__TARGET__",
+        ]
+
+    def test_partitions_match_single_pass(self) -> None:
+        rng = np.random.default_rng(3)
+        n = 10_000
+        left = pd.DataFrame(
+            {
+                "id": np.arange(n),
+                "STATE": rng.integers(0, 60, n),
+                "PUMA": rng.integers(0, 50, n).astype(str),
+            },
+        )
+        right = pd.DataFrame(
+            {
+                "STATEFP": [f"{s:02d}" for s in range(0, 60, 2)] * 25,
+                "PUMACE": [f"{p:05d}" for p in range(25) for _ in range(30)],
+            },
+        )
+        right["GEOID"] = right["STATEFP"] + right["PUMACE"]
+        spec = DerivationSpec(
+            left_key=KeySpec((("STATE", 2), ("PUMA", 5))),
+            right_key=KeySpec((("STATEFP", 2), ("PUMACE", 5))),
+            source=Endpoint("left", column="id"),
+            target=Endpoint("right", column="GEOID"),
+        )
+        whole = run_derivation(spec, left, right)
+        parts = run_derivation(
+            spec,
+            left,
+            right,
+            partition_rows=777,
+            max_workers=3,
+        )
+        pd.testing.assert_frame_equal(whole, parts)
+        even_state = left["STATE"] % 2 == 0
+        expected = left[even_state & (left["PUMA"].astype(int) < 25)]
+        assert whole["__SOURCE__"].tolist() == expected["id"].tolist()
+        assert whole["__TARGET__"].tolist() == (
+            expected["STATE"].map("{:02d}".format)
+            + expected["PUMA"].str.zfill(5)
+        ).tolist()
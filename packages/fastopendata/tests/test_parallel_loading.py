@@ -0,0 +1,215 @@
+"""Tests for concurrent dataset loading and the Parquet source cache.
+
+Covers :func:`fastopendata.pipeline.load_available_datasets` running its
+readers on a thread pool, serving repeat loads from typed Parquet copies
+keyed by source mtime/size, and reporting per-dataset timings.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from fastopendata.pipeline import (
+    _PARQUET_CACHE_DIRNAME,
+    DatasetTiming,
+    _cached_read,
+    load_available_datasets,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeDataset:
+    def __init__(self, output_file: str, fmt: str = "CSV") -> None:
+        self.output_file = output_file
+        self.format = fmt
+
+
+class _FakeConfig:
+    def __init__(self, data_path: Path, datasets: dict) -> None:
+        self.data_path = data_path
+        self.datasets = datasets
+
+
+def _load(data_dir: Path, datasets: dict | None = None, **kwargs):
+    fake = _FakeConfig(data_dir, datasets or {})
+    with patch("fastopendata.config.config", fake):
+        return load_available_datasets(data_dir=data_dir, **kwargs)
+
+
+@pytest.fixture
+def states_dir(tmp_path: Path) -> Path:
+    pd.DataFrame(
+        {
+            "STATEFP": ["06", "13"],
+            "NAME": ["California", "Georgia"],
+            "population": [39_000_000, 11_000_000],
+        },
+    ).to_csv(tmp_path / "states.csv", index=False)
+    return tmp_path
+
+
+STATES = {"state": _FakeDataset("states.csv")}
+
+
+# ---------------------------------------------------------------------------
+# Parquet cache
+# ---------------------------------------------------------------------------
+
+
+class TestParquetCache:
+    def test_second_load_is_served_from_cache(self, states_dir: Path) -> None:
+        first = _load(states_dir, STATES)
+        second = _load(states_dir, STATES)
+
+        assert [t.cached for t in first.load_timings] == [False]
+        assert [t.cached for t in second.load_timings] == [True]
+        cached = list((states_dir / _PARQUET_CACHE_DIRNAME).glob("*.parquet"))
+        assert len(cached) == 1
+        pd.testing.assert_frame_equal(
+            first._entity_frames["State"],  # noqa: SLF001
+            second._entity_frames["State"],  # noqa: SLF001
+        )
+
+    def test_modified_source_invalidates_cache(self, states_dir: Path) -> None:
+        _load(states_dir, STATES)
+        source = states_dir / "states.csv"
+        source.write_text(source.read_text() + "48,Texas,30000000\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        reloaded = _load(states_dir, STATES)
+
+        assert reloaded.entity_count("State") == 3
+        assert reloaded.load_timings[0].cached is False
+        # The stale copy was replaced, not kept alongside.
+        cache = states_dir / _PARQUET_CACHE_DIRNAME
+        assert len(list(cache.glob("*.parquet"))) == 1
+
+    def test_row_limit_is_part_of_the_key(self, states_dir: Path) -> None:
+        _load(states_dir, STATES)
+        limited = _load(states_dir, STATES, max_rows=1)
+        assert limited.entity_count("State") == 1
+        assert limited.load_timings[0].cached is False
+        # Both copies are kept: neither read evicts the other's.
+        assert _load(states_dir, STATES).load_timings[0].cached is True
+        assert _load(states_dir, STATES, max_rows=1).load_timings[0].cached
+
+    def test_same_stem_in_other_directory(self, tmp_path: Path) -> None:
+        cache = tmp_path / "cache"
+        sources = []
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            source = tmp_path / name / "states.csv"
+            source.write_text(f"NAME\n{name}\n")
+            sources.append(source)
+
+        def _read(source: Path) -> tuple[pd.DataFrame | None, bool]:
+            return _cached_read(
+                cache, [source], "csv", lambda: pd.read_csv(source)
+            )
+
+        for source in (*sources, *sources):
+            _read(source)
+        frames = [_read(source) for source in sources]
+
+        assert [cached for _, cached in frames] == [True, True]
+        assert [df["NAME"].tolist() for df, _ in frames] == [["a"], ["b"]]
+
+    def test_cache_can_be_disabled(self, states_dir: Path) -> None:
+        _load(states_dir, STATES, use_cache=False)
+        assert not (states_dir / _PARQUET_CACHE_DIRNAME).exists()
+
+    def test_typed_columns_survive_the_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "cjars_joe_2022_co.csv").write_text(
+            "county_fips,state_fips,jobs\n01001,01,10\n",
+        )
+        for _ in range(2):
+            pipeline = _load(tmp_path)
+            frame = pipeline._entity_frames["CountyJobOffers"]  # noqa: SLF001
+            assert frame["county_fips"].tolist() == ["01001"]
+        assert pipeline.load_timings[0].cached is True
+
+
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentLoading:
+    def test_shapefiles_are_read_concurrently(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        for fips in ("06", "13", "48"):
+            (tmp_path / f"tl_2025_{fips}_tract.shp").write_bytes(b"")
+        # Every reader must be in flight at once to get past the barrier.
+        barrier = threading.Barrier(3, timeout=10)
+
+        def _fake_loader(filepath: Path, entity_type: str, id_col: str):
+            barrier.wait()
+            fips = filepath.name.split("_")[2]
+            return pd.DataFrame({"GEOID": [f"{fips}001"], "STATEFP": [fips]})
+
+        monkeypatch.setattr(
+            "fastopendata.pipeline._load_shapefile_as_entity",
+            _fake_loader,
+        )
+        pipeline = _load(tmp_path, use_cache=False, max_workers=4)
+
+        frame = pipeline._entity_frames["CensusTract"]  # noqa: SLF001
+        # Concatenated in file order regardless of completion order.
+        assert frame["STATEFP"].tolist() == ["06", "13", "48"]
+
+    def test_registration_order_is_deterministic(
+        self,
+        states_dir: Path,
+    ) -> None:
+        pd.DataFrame({"x": [1]}).to_csv(states_dir / "a.csv", index=False)
+        datasets = {
+            "zeta": _FakeDataset("a.csv"),
+            "state": _FakeDataset("states.csv"),
+        }
+        for workers in (1, 4):
+            pipeline = _load(states_dir, datasets, max_workers=workers)
+            assert pipeline.entity_types == ["Zeta", "State"]
+
+
+# ---------------------------------------------------------------------------
+# Derivations and timing report
+# ---------------------------------------------------------------------------
+
+
+class TestTimingReport:
+    def test_entities_and_relationships_are_reported(
+        self,
+        states_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (states_dir / "tl_2025_13_tract.shp").write_bytes(b"")
+        monkeypatch.setattr(
+            "fastopendata.pipeline._load_shapefile_as_entity",
+            lambda *_: pd.DataFrame(
+                {"GEOID": ["13001000100"], "STATEFP": [13]},
+            ),
+        )
+        pipeline = _load(states_dir, STATES)
+
+        assert pipeline.relationship_count("IN_STATE") == 1
+        report = {(t.kind, t.name): t for t in pipeline.load_timings}
+        assert set(report) == {
+            ("entity", "State"),
+            ("entity", "CensusTract"),
+            ("relationship", "IN_STATE"),
+        }
+        assert all(isinstance(t, DatasetTiming) for t in report.values())
+        assert report[("relationship", "IN_STATE")].rows == 1
+        assert all(t.seconds >= 0.0 for t in report.values())
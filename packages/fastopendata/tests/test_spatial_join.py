@@ -0,0 +1,194 @@
+"""Tests for the point-in-polygon IN_TRACT derivation stage.
+
+Covers :mod:`fastopendata.etl.spatial_join` (chunked in-memory edges and
+the streaming Parquet crosswalk), WKB geometry retention in the shapefile
+loader, and the ``IN_TRACT`` derivation in ``load_available_datasets``.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+import shapely
+from fastopendata.etl.spatial_join import (
+    derive_point_tract_relationships,
+    stream_points_to_tracts,
+)
+from fastopendata.pipeline import (
+    _load_shapefile_as_entity,
+    load_available_datasets,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tracts() -> pd.DataFrame:
+    boxes = [shapely.box(x, 0, x + 1, 1) for x in range(4)]
+    return pd.DataFrame(
+        {
+            "GEOID": ["13001", "13002", "13003", "13004"],
+            "STATEFP": ["13"] * 4,
+            "geometry": shapely.to_wkb(np.array(boxes)),
+        },
+    )
+
+
+@pytest.fixture
+def points() -> pd.DataFrame:
+    rng = np.random.default_rng(17)
+    n = 2_000
+    return pd.DataFrame(
+        {
+            "id": np.arange(n) + 100,
+            "longitude": rng.random(n) * 5 - 0.5,
+            "latitude": rng.random(n) * 1.4 - 0.2,
+            "encoded_tags": [f"t{i}" for i in range(n)],
+        },
+    )
+
+
+def _expected_tracts(points: pd.DataFrame) -> pd.Series:
+    x, y = points["longitude"], points["latitude"]
+    inside = (x >= 0) & (x < 4) & (y >= 0) & (y <= 1)
+    return ("1300" + (x[inside].astype(int) + 1).astype(str)).rename(None)
+
+
+# ---------------------------------------------------------------------------
+# In-memory derivation
+# ---------------------------------------------------------------------------
+
+
+class TestDerivePointTractRelationships:
+    @pytest.mark.parametrize("chunk_size", [2_000, 128])
+    def test_edges_match_geometry(self, points, tracts, chunk_size) -> None:
+        edges = derive_point_tract_relationships(
+            points,
+            tracts,
+            chunk_size=chunk_size,
+            max_workers=3,
+        )
+        expected = _expected_tracts(points)
+        assert list(edges.columns) == ["__SOURCE__", "__TARGET__"]
+        assert edges["__SOURCE__"].tolist() == (
+            points.loc[expected.index, "id"].tolist()
+        )
+        assert edges["__TARGET__"].tolist() == expected.tolist()
+
+    def test_missing_coordinates_are_skipped(self, tracts) -> None:
+        points = pd.DataFrame(
+            {"id": [1, 2], "longitude": [0.5, None], "latitude": [0.5, 0.5]},
+        )
+        edges = derive_point_tract_relationships(points, tracts)
+        assert edges["__SOURCE__"].tolist() == [1]
+
+    def test_tracts_without_geometry(self, points, tracts) -> None:
+        edges = derive_point_tract_relationships(
+            points,
+            tracts.drop(columns="geometry"),
+        )
+        assert edges.empty
+
+
+# ---------------------------------------------------------------------------
+# Streaming crosswalk
+# ---------------------------------------------------------------------------
+
+
+class TestStreamPointsToTracts:
+    def test_crosswalk_matches_in_memory(
+        self,
+        points,
+        tracts,
+        tmp_path: Path,
+    ) -> None:
+        source = tmp_path / "nodes.parquet"
+        output = tmp_path / "crosswalk.parquet"
+        points.to_parquet(source, row_group_size=300)
+
+        rows = stream_points_to_tracts(
+            source,
+            tracts,
+            output,
+            chunk_size=250,
+            max_workers=2,
+        )
+
+        crosswalk = pd.read_parquet(output)
+        expected = _expected_tracts(points)
+        assert rows == len(crosswalk) == len(expected)
+        assert list(crosswalk.columns) == [
+            "id",
+            "encoded_tags",
+            "GEOID",
+            "STATEFP",
+        ]
+        assert crosswalk["id"].tolist() == (
+            points.loc[expected.index, "id"].tolist()
+        )
+        assert crosswalk["GEOID"].tolist() == expected.tolist()
+
+
+# ---------------------------------------------------------------------------
+# Loader and pipeline integration
+# ---------------------------------------------------------------------------
+
+
+class _FakeConfig:
+    def __init__(self, data_path: Path) -> None:
+        self.data_path = data_path
+        self.datasets: dict = {}
+
+
+class TestPipelineIntegration:
+    def test_shapefile_geometry_is_kept_as_wkb(
+        self,
+        tracts,
+        tmp_path: Path,
+    ) -> None:
+        path = tmp_path / "tl_2025_13_tract.shp"
+        gpd.GeoDataFrame(
+            tracts.drop(columns="geometry"),
+            geometry=shapely.from_wkb(tracts["geometry"].to_numpy()),
+            crs="EPSG:4269",
+        ).to_file(path)
+
+        frame = _load_shapefile_as_entity(path, "CensusTract", "GEOID")
+
+        assert isinstance(frame["geometry"].iloc[0], bytes)
+        assert shapely.from_wkb(frame["geometry"].iloc[2]).bounds == (
+            2.0,
+            0.0,
+            3.0,
+            1.0,
+        )
+
+    def test_in_tract_edges_are_derived(
+        self,
+        points,
+        tracts,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (tmp_path / "tl_2025_13_tract.shp").write_bytes(b"")
+        points.to_csv(tmp_path / "united_states_nodes.csv", index=False)
+        monkeypatch.setattr(
+            "fastopendata.pipeline._load_shapefile_as_entity",
+            lambda *_: tracts,
+        )
+        with patch("fastopendata.config.config", _FakeConfig(tmp_path)):
+            pipeline = load_available_datasets(
+                data_dir=tmp_path,
+                use_cache=False,
+            )
+
+        assert pipeline.relationship_count("IN_TRACT") == len(
+            _expected_tracts(points),
+        )
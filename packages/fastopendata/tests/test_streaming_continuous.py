@@ -0,0 +1,350 @@
+"""Tests for continuous Cypher queries over a streaming graph.
+
+Incrementally maintained results are checked against a from-scratch
+evaluation after random inserts, updates and deletes, for plain and
+aggregating queries and self-joins.  Also covers the result changelog,
+the full-recompute fallback and :class:`StreamEngine` integration.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastopendata.streaming.continuous import StreamingGraph
+from fastopendata.streaming.core import RecordType, StreamBuffer, StreamRecord
+from fastopendata.streaming.engine import StreamEngine
+from fastopendata.streaming.views import ChangeType, IncrementalView
+
+_FOLLOWERS = (
+    "MATCH (a:Person)-[:FOLLOWS]->(b:Person) "
+    "RETURN b.name AS name, count(*) AS n, sum(a.age) AS ages"
+)
+
+
+def _upsert(key: str, **value) -> StreamRecord:
+    return StreamRecord(key=key, value=value, event_time=0.0)
+
+
+def _delete(key: str) -> StreamRecord:
+    return StreamRecord(
+        key=key,
+        value={},
+        event_time=0.0,
+        record_type=RecordType.DELETE,
+    )
+
+
+def _bind(people: IncrementalView, follows: IncrementalView) -> StreamingGraph:
+    graph = StreamingGraph()
+    graph.bind_entity_view(people, "Person")
+    graph.bind_relationship_view(
+        follows,
+        "FOLLOWS",
+        source_field="src",
+        target_field="dst",
+    )
+    return graph
+
+
+async def _graph() -> tuple[StreamingGraph, IncrementalView, IncrementalView]:
+    people, follows = IncrementalView("people"), IncrementalView("follows")
+    return _bind(people, follows), people, follows
+
+
+def _sorted(frame: pd.DataFrame) -> list[tuple]:
+    frame = frame.astype(object).where(frame.notna(), None)
+    return sorted(map(tuple, frame.to_numpy().tolist()), key=repr)
+
+
+# ---------------------------------------------------------------------------
+# Incremental maintenance
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalMatchesRecompute:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:FOLLOWS]->(b:Person) "
+            "WHERE a.age > 20 RETURN a.name AS a, b.name AS b",
+            _FOLLOWERS,
+            "MATCH (a:Person)-[:FOLLOWS]->(b:Person)-[:FOLLOWS]->(c:Person) "
+            "RETURN c.name AS name, count(*) AS n",
+            "MATCH (a:Person) RETURN count(*) AS n, sum(a.age) AS total",
+        ],
+    )
+    def test_random_changes(self, query) -> None:
+        rng = np.random.default_rng(7)
+
+        async def _run() -> None:
+            graph, people, follows = await _graph()
+            continuous = await graph.register(query)
+            assert continuous.incremental
+            for _ in range(3):
+                for _ in range(20):
+                    key = str(rng.integers(12))
+                    if rng.random() < 0.2:
+                        await people.apply(_delete(key))
+                    else:
+                        await people.apply(
+                            _upsert(
+                                key,
+                                name=f"p{key}",
+                                age=int(rng.integers(50)),
+                            ),
+                        )
+                    edge = f"e{rng.integers(30)}"
+                    if rng.random() < 0.2:
+                        await follows.apply(_delete(edge))
+                    else:
+                        await follows.apply(
+                            _upsert(
+                                edge,
+                                src=int(rng.integers(12)),
+                                dst=int(rng.integers(12)),
+                            ),
+                        )
+                await graph.flush()
+
+                fresh = _bind(people, follows)
+                expected = await fresh.register(query)
+                assert _sorted(continuous.result()) == _sorted(
+                    expected.result(),
+                )
+            assert continuous.full_recomputes == 1
+            assert continuous.delta_evaluations > 0
+
+        asyncio.run(_run())
+
+    def test_sum_of_nulls_is_null(self) -> None:
+        queries = (
+            "MATCH (a:Person) RETURN a.name AS name, sum(a.age) AS total",
+            "MATCH (a:Person) RETURN sum(a.age) AS total, count(*) AS n",
+        )
+        steps = (
+            [("1", "x", None), ("2", "x", None), ("3", "y", 4)],
+            [("1", "x", 6)],
+            [("1", "x", None), ("3", "y", None)],
+            [("1", None, None), ("2", None, None), ("3", None, None)],
+        )
+
+        async def _run() -> None:
+            graph, people, follows = await _graph()
+            continuous = [await graph.register(q) for q in queries]
+            for step in steps:
+                for key, name, age in step:
+                    if name is None:
+                        await people.apply(_delete(key))
+                    else:
+                        await people.apply(_upsert(key, name=name, age=age))
+                await graph.flush()
+                fresh = _bind(people, follows)
+                for query in continuous:
+                    expected = await fresh.register(query.query)
+                    assert _sorted(query.result()) == _sorted(
+                        expected.result(),
+                    )
+            assert all(q.full_recomputes == 1 for q in continuous)
+            assert continuous[1].result().iloc[0].tolist() == [None, 0]
+
+        asyncio.run(_run())
+
+    def test_matches_star_on_consistent_graph(self) -> None:
+        async def _run() -> pd.DataFrame:
+            graph, people, follows = await _graph()
+            continuous = await graph.register(_FOLLOWERS)
+            for key, age in (("1", 30), ("2", 40), ("3", 50)):
+                await people.apply(_upsert(key, name=f"p{key}", age=age))
+            for edge, src, dst in (("e1", 1, 2), ("e2", 3, 2), ("e3", 2, 1)):
+                await follows.apply(_upsert(edge, src=src, dst=dst))
+            await graph.flush()
+            return continuous.result()
+
+        assert _sorted(asyncio.run(_run())) == [
+            ("p1", 1, 40),
+            ("p2", 2, 80),
+        ]
+
+    def test_edges_need_both_endpoints(self) -> None:
+        async def _run() -> list[pd.DataFrame]:
+            graph, people, follows = await _graph()
+            continuous = await graph.register(_FOLLOWERS)
+            await people.apply(_upsert("1", name="p1", age=1))
+            await follows.apply(_upsert("e1", src=1, dst=2))
+            await graph.flush()
+            before = continuous.result()
+            await people.apply(_upsert("2", name="p2", age=2))
+            await graph.flush()
+            return [before, continuous.result()]
+
+        before, after = asyncio.run(_run())
+        assert before.empty
+        assert _sorted(after) == [("p2", 1, 1)]
+
+
+# ---------------------------------------------------------------------------
+# Result changelog
+# ---------------------------------------------------------------------------
+
+
+class TestResultChangelog:
+    def test_group_insert_update_delete(self) -> None:
+        async def _run() -> list:
+            graph, people, follows = await _graph()
+            for key in "123":
+                await people.apply(_upsert(key, name=f"p{key}", age=10))
+            continuous = await graph.register(_FOLLOWERS)
+            queue = continuous.subscribe()
+            await follows.apply(_upsert("e1", src=1, dst=2))
+            await graph.flush()
+            await follows.apply(_upsert("e2", src=3, dst=2))
+            await people.apply(_upsert("3", name="p3", age=5))
+            await graph.flush()
+            await people.apply(_delete("2"))
+            await graph.flush()
+            entries = []
+            while not queue.empty():
+                entries.append(queue.get_nowait())
+            return entries
+
+        insert, update, delete = asyncio.run(_run())
+        assert insert.change_type is ChangeType.INSERT
+        assert insert.new_value == {"name": "p2", "n": 1, "ages": 10}
+        assert update.change_type is ChangeType.UPDATE
+        assert update.new_value == {"name": "p2", "n": 2, "ages": 15}
+        assert delete.change_type is ChangeType.DELETE
+        assert delete.old_value == update.new_value
+
+    def test_row_bag_and_global_count(self) -> None:
+        async def _run():
+            graph, people, _ = await _graph()
+            rows = await graph.register(
+                "MATCH (a:Person) RETURN a.name AS name",
+            )
+            total = await graph.register("MATCH (a:Person) RETURN count(*)")
+            await people.apply(_upsert("1", name="x"))
+            await people.apply(_upsert("2", name="x"))
+            await graph.flush()
+            bag = rows.result()
+            await people.apply(_delete("1"))
+            await people.apply(_delete("2"))
+            await graph.flush()
+            return rows, total, bag
+
+        rows, total, bag = asyncio.run(_run())
+        assert bag["name"].tolist() == ["x", "x"]
+        assert [e.change_type for e in rows.changelog] == [
+            ChangeType.INSERT,
+            ChangeType.INSERT,
+            ChangeType.DELETE,
+            ChangeType.DELETE,
+        ]
+        assert rows.result().empty
+        # The global group stays, at zero, when its input empties.
+        assert total.result().iloc[0, 0] == 0
+        assert len(total.result()) == 1
+
+    def test_no_entries_for_net_zero_changes(self) -> None:
+        async def _run():
+            graph, people, _ = await _graph()
+            await people.apply(_upsert("1", name="x"))
+            continuous = await graph.register(
+                "MATCH (a:Person) RETURN a.name AS name",
+            )
+            await people.apply(_upsert("1", name="y"))
+            await people.apply(_upsert("1", name="x"))
+            await people.apply(_upsert("2", name="z"))
+            await people.apply(_delete("2"))
+            changes = await graph.flush()
+            return continuous, changes
+
+        continuous, changes = asyncio.run(_run())
+        assert changes == 0
+        assert continuous.changelog[-1].new_value == {"name": "x"}
+        assert len(continuous.changelog) == 1
+
+
+# ---------------------------------------------------------------------------
+# Fallback and errors
+# ---------------------------------------------------------------------------
+
+
+class TestFallback:
+    @pytest.mark.parametrize(
+        ("query", "reason"),
+        [
+            (
+                "MATCH (a:Person) RETURN a.name AS name ORDER BY name",
+                "ORDER BY",
+            ),
+            ("MATCH (a:Person) RETURN avg(a.age) AS age", "aggregate"),
+            (
+                "MATCH (a:Person)-[:FOLLOWS]-(b:Person) RETURN a.name AS n",
+                "undirected",
+            ),
+            (
+                "MATCH (a:Person) WITH a WHERE a.age > 1 RETURN a.name AS n",
+                "With",
+            ),
+        ],
+    )
+    def test_recomputes_in_full(self, query, reason) -> None:
+        async def _run():
+            graph, people, follows = await _graph()
+            continuous = await graph.register(query)
+            await people.apply(_upsert("1", name="p1", age=4))
+            await people.apply(_upsert("2", name="p2", age=8))
+            await follows.apply(_upsert("e", src=1, dst=2))
+            await graph.flush()
+            return continuous
+
+        continuous = asyncio.run(_run())
+        assert not continuous.incremental
+        assert reason in continuous.fallback_reason
+        assert continuous.full_recomputes == 2
+        assert not continuous.result().empty
+
+    def test_invalid_queries_and_bindings(self) -> None:
+        async def _run() -> None:
+            graph, people, _ = await _graph()
+            with pytest.raises(ValueError, match="already bound"):
+                graph.bind_entity_view(people, "Person")
+            with pytest.raises(ValueError, match="RETURN"):
+                await graph.register("MATCH (a:Person) SET a.x = 1")
+
+        asyncio.run(_run())
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class TestEngineIntegration:
+    def test_query_follows_stream(self) -> None:
+        async def _run():
+            buf = StreamBuffer()
+            engine = StreamEngine(buf, cycle_interval=0.01)
+            people = IncrementalView("people")
+            engine.add_view(people)
+            engine.graph.bind_entity_view(people, "Person")
+            continuous = await engine.register_query(
+                "MATCH (p:Person) RETURN p.city AS city, count(*) AS n",
+            )
+            changes = continuous.subscribe()
+            await engine.start()
+            for i, city in enumerate(["a", "b", "a", "a"]):
+                await buf.put(_upsert(str(i), city=city))
+            await asyncio.sleep(0.1)
+            await buf.put(_delete("0"))
+            await asyncio.sleep(0.1)
+            await engine.stop()
+            return continuous, changes
+
+        continuous, changes = asyncio.run(_run())
+        assert _sorted(continuous.result()) == [("a", 2), ("b", 1)]
+        assert not changes.empty()
+        assert continuous.full_recomputes == 1
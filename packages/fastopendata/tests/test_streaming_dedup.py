@@ -0,0 +1,168 @@
+"""Tests for the stream deduplication backends.
+
+Every backend is checked for exact duplicate detection, batch/record
+agreement, bounded forgetting and checkpoint round trips; the Bloom
+filter's false-positive rate and time-based rotation are checked
+separately, as is the engine's ``dedup_checkpoint`` option.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+from fastopendata.streaming.core import (
+    DeduplicationStore,
+    StreamBuffer,
+    StreamRecord,
+)
+from fastopendata.streaming.dedup import (
+    HashedIdRing,
+    RotatingBloomFilter,
+    hash_id,
+    hash_ids,
+)
+from fastopendata.streaming.engine import StreamEngine
+
+_BACKENDS = [
+    lambda: DeduplicationStore(capacity=1_000),
+    lambda: HashedIdRing(capacity=1_000, segments=4),
+    lambda: RotatingBloomFilter(capacity=1_000, error_rate=1e-4),
+]
+
+
+@pytest.fixture(params=_BACKENDS, ids=["lru", "ring", "bloom"])
+def make_store(request):
+    return request.param
+
+
+def test_hash_ids_matches_hash_id() -> None:
+    ids = ["a", "record-1", "ü"]
+    assert hash_ids(ids).tolist() == [list(hash_id(i)) for i in ids]
+
+
+class TestBackends:
+    def test_detects_duplicates(self, make_store) -> None:
+        store = make_store()
+        assert all(store.check_and_add(f"id{i}") for i in range(500))
+        assert not any(store.check_and_add(f"id{i}") for i in range(500))
+        assert store.duplicates_dropped == 500
+
+    def test_batch_matches_per_record(self, make_store) -> None:
+        rng = np.random.default_rng(1)
+        ids = [f"id{i}" for i in rng.integers(600, size=1_500)]
+        one, many = make_store(), make_store()
+        expected = [one.check_and_add(i) for i in ids]
+        actual = np.concatenate(
+            [many.check_many(ids[i : i + 250]) for i in range(0, 1_500, 250)],
+        )
+        assert actual.tolist() == expected
+        assert many.duplicates_dropped == one.duplicates_dropped
+
+    def test_forgets_oldest(self, make_store) -> None:
+        store = make_store()
+        for i in range(5_000):
+            store.check_and_add(f"id{i}")
+        assert store.check_and_add("id0")
+        assert not store.check_and_add("id4999")
+
+    @pytest.mark.parametrize("name", ["dedup.npz", "dedup"])
+    def test_checkpoint_round_trip(self, make_store, tmp_path, name) -> None:
+        store = make_store()
+        store.check_many([f"id{i}" for i in range(700)])
+        path = tmp_path / name
+        store.save(path)
+        assert [p.name for p in tmp_path.iterdir()] == [name]
+        restored = make_store()
+        restored.restore(path)
+        assert not restored.check_many([f"id{i}" for i in range(700)]).any()
+        assert restored.check_and_add("fresh")
+
+
+class TestHashedIdRing:
+    def test_retention_bounds(self) -> None:
+        ring = HashedIdRing(capacity=800, segments=4)
+        for i in range(10_000):
+            ring.check_and_add(f"id{i}")
+        assert 600 <= len(ring) <= 800
+        recent = [f"id{i}" for i in range(10_000 - 600, 10_000)]
+        assert not ring.check_many(recent).any()
+        assert ring.nbytes < 800 * 40
+
+    def test_rejects_other_configuration(self, tmp_path) -> None:
+        path = tmp_path / "ring.npz"
+        HashedIdRing(capacity=100).save(path)
+        with pytest.raises(ValueError, match="configuration"):
+            HashedIdRing(capacity=200).restore(path)
+
+
+class TestRotatingBloomFilter:
+    def test_false_positive_rate(self) -> None:
+        bloom = RotatingBloomFilter(capacity=40_000, error_rate=0.01)
+        bloom.check_many([f"seen{i}" for i in range(30_000)])
+        fresh = bloom.check_many([f"new{i}" for i in range(20_000)])
+        assert 1 - fresh.mean() < 0.02
+        # ~1.2 bytes per ID at a 1% false-positive rate.
+        assert bloom.nbytes < 40_000 * 2
+
+    def test_time_partitions(self) -> None:
+        now = [0.0]
+        bloom = RotatingBloomFilter(
+            capacity=1_000,
+            partitions=2,
+            partition_seconds=10.0,
+            clock=lambda: now[0],
+        )
+        bloom.check_and_add("old")
+        now[0] = 10.0
+        assert not bloom.check_and_add("old")
+        now[0] = 20.0
+        bloom.check_and_add("other")
+        now[0] = 30.0
+        assert bloom.check_and_add("old")
+
+    def test_rejects_bad_parameters(self) -> None:
+        with pytest.raises(ValueError, match="error_rate"):
+            RotatingBloomFilter(error_rate=0)
+        with pytest.raises(ValueError, match="partitions"):
+            RotatingBloomFilter(partitions=0)
+
+
+class TestEngineCheckpoint:
+    @pytest.mark.parametrize("micro_batch", [False, True])
+    @pytest.mark.parametrize("name", ["engine-dedup.npz", "engine-dedup"])
+    def test_restart_keeps_exactly_once(
+        self,
+        tmp_path,
+        micro_batch,
+        name,
+    ) -> None:
+        path = tmp_path / name
+
+        async def _run(ids: list[str]) -> int:
+            buf = StreamBuffer()
+            engine = StreamEngine(
+                buf,
+                dedup=HashedIdRing(capacity=1_000),
+                cycle_interval=0.01,
+                micro_batch=micro_batch,
+                dedup_checkpoint=path,
+            )
+            await engine.start()
+            for i, record_id in enumerate(ids):
+                await buf.put(
+                    StreamRecord(
+                        key="k",
+                        value={"v": i},
+                        event_time=0.0,
+                        record_id=record_id,
+                    ),
+                )
+            await asyncio.sleep(0.1)
+            await engine.stop()
+            return engine.metrics.records_processed
+
+        assert asyncio.run(_run(["a", "b", "a"])) == 2
+        assert path.exists()
+        assert asyncio.run(_run(["b", "c"])) == 1
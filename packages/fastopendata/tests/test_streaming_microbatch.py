@@ -0,0 +1,423 @@
+"""Tests for columnar micro-batch processing in the streaming engine.
+
+Each micro-batch operator is checked against its per-record counterpart:
+window assignment and aggregation, watermark lateness, stream-table
+joins and view maintenance, plus the engine's ``micro_batch`` mode end
+to end.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pyarrow as pa
+import pytest
+from fastopendata.streaming.batches import (
+    KEY_COLUMN,
+    batch_to_records,
+    records_to_batch,
+)
+from fastopendata.streaming.core import (
+    RecordType,
+    StreamBuffer,
+    StreamRecord,
+    WatermarkTracker,
+)
+from fastopendata.streaming.engine import StreamEngine
+from fastopendata.streaming.joins import StreamTableJoin, TableSnapshot
+from fastopendata.streaming.views import IncrementalView
+from fastopendata.streaming.windows import (
+    SessionWindow,
+    SlidingWindow,
+    TumblingWindow,
+    WindowManager,
+)
+
+
+def _records(n: int = 300, seed: int = 0) -> list[StreamRecord]:
+    rng = np.random.default_rng(seed)
+    return [
+        StreamRecord(
+            key=f"k{rng.integers(4)}",
+            value={"v": int(rng.integers(100)), "x": float(rng.random())},
+            event_time=float(rng.random() * 40),
+            record_id=f"r{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _fired(manager: WindowManager) -> dict[tuple, tuple]:
+    return {
+        (key, state.spec): (state.count, state.summary())
+        for key, state in manager.fire(watermark=1e9)
+    }
+
+
+# ---------------------------------------------------------------------------
+# Record batches
+# ---------------------------------------------------------------------------
+
+
+class TestRecordBatches:
+    def test_round_trip(self) -> None:
+        records = [
+            StreamRecord(key="a", value={"v": 1}, event_time=1.0),
+            StreamRecord(
+                key="b",
+                value={"w": "x"},
+                event_time=2.0,
+                record_type=RecordType.DELETE,
+                source="s",
+            ),
+        ]
+        batch = records_to_batch(records)
+        assert batch.column(KEY_COLUMN).to_pylist() == ["a", "b"]
+        assert batch_to_records(batch) == records
+
+    def test_mixed_types_become_strings(self) -> None:
+        batch = records_to_batch(
+            [
+                StreamRecord(key="a", value={"v": 1, "w": 2}, event_time=1),
+                StreamRecord(key="b", value={"v": "x"}, event_time=2),
+            ],
+        )
+        assert batch.column("v").to_pylist() == ["1", "x"]
+        assert batch.column("w").to_pylist() == [2, None]
+
+
+# ---------------------------------------------------------------------------
+# Windows
+# ---------------------------------------------------------------------------
+
+
+class TestWindowBatches:
+    @pytest.mark.parametrize(
+        "assigner",
+        [
+            TumblingWindow(size=10.0),
+            SlidingWindow(size=10.0, slide=2.5),
+            SessionWindow(gap=3.0),
+        ],
+    )
+    def test_batch_matches_per_record(self, assigner) -> None:
+        records = _records()
+        one = WindowManager(assigner)
+        for record in records:
+            one.add(record)
+        many = WindowManager(assigner)
+        many.add_batch(records_to_batch(records[:100]))
+        many.add_batch(records_to_batch(records[100:]))
+
+        expected, actual = _fired(one), _fired(many)
+        assert expected.keys() == actual.keys()
+        for window, (count, summary) in expected.items():
+            assert actual[window][0] == count
+            for name, stats in summary.items():
+                assert actual[window][1][name] == pytest.approx(stats)
+
+    def test_no_raw_records_by_default(self) -> None:
+        manager = WindowManager(TumblingWindow(size=100.0))
+        for record in _records(50):
+            manager.add(record)
+        (_, state), *_ = manager.fire(watermark=100.0)
+        assert state.records is None
+        kept = WindowManager(TumblingWindow(size=100.0), keep_records=True)
+        kept.add_batch(records_to_batch(_records(50)))
+        total = sum(len(s.records) for _, s in kept.fire(watermark=100.0))
+        assert total == 50
+
+    def test_sketches_and_field_filter(self) -> None:
+        records = [
+            StreamRecord(
+                key="k",
+                value={"user": f"u{i % 30}", "v": i, "skip": 1},
+                event_time=1.0,
+            )
+            for i in range(1000)
+        ]
+        manager = WindowManager(
+            TumblingWindow(size=10.0),
+            fields=["v"],
+            distinct=["user"],
+            quantiles=["v"],
+        )
+        manager.add_batch(records_to_batch(records))
+        (_, state), = manager.fire(watermark=10.0)
+        summary = state.summary()
+        assert "skip" not in summary
+        assert summary["v"]["max"] == 999
+        assert summary["user"]["distinct"] == 30
+        assert summary["v"]["quantiles"][0.5] == pytest.approx(500, abs=25)
+
+    def test_quantiles_outside_fields(self) -> None:
+        records = _records()
+        kwargs = {"fields": ["v"], "quantiles": ["x"]}
+        one = WindowManager(TumblingWindow(size=10.0), **kwargs)
+        for record in records:
+            one.add(record)
+        many = WindowManager(TumblingWindow(size=10.0), **kwargs)
+        many.add_batch(records_to_batch(records))
+
+        expected, actual = _fired(one), _fired(many)
+        assert expected.keys() == actual.keys()
+        for window, (_, summary) in expected.items():
+            assert set(actual[window][1]) == set(summary) == {"v", "x"}
+            assert actual[window][1]["v"] == pytest.approx(summary["v"])
+            assert actual[window][1]["x"]["quantiles"] == pytest.approx(
+                summary["x"]["quantiles"],
+            )
+
+    def test_session_merge_combines_aggregates(self) -> None:
+        manager = WindowManager(SessionWindow(gap=5.0))
+        manager.add_batch(
+            records_to_batch(
+                [
+                    StreamRecord(key="k", value={"v": 1}, event_time=1.0),
+                    StreamRecord(key="k", value={"v": 5}, event_time=3.0),
+                ],
+            ),
+        )
+        manager.merge_sessions()
+        (_, state), = manager.fire(watermark=100.0)
+        assert state.count == 2
+        assert state.summary()["v"]["sum"] == 6
+
+
+# ---------------------------------------------------------------------------
+# Watermark, joins and views
+# ---------------------------------------------------------------------------
+
+
+class TestLateMask:
+    def test_matches_per_record(self) -> None:
+        times = np.array([10.0, 3.0, 20.0, 16.0, 14.0, 30.0, 24.0])
+        is_data = np.array([True, True, True, True, False, True, True])
+        one = WatermarkTracker(allowed_lateness=5.0)
+        expected = []
+        for t, data in zip(times, is_data, strict=True):
+            record = StreamRecord(key="k", value={}, event_time=float(t))
+            late = bool(data) and one.is_late(record)
+            expected.append(late)
+            if not late:
+                one.advance(float(t))
+        many = WatermarkTracker(allowed_lateness=5.0)
+        assert many.late_mask(times, is_data).tolist() == expected
+        assert many.current == one.current
+        assert many.late_count == one.late_count == 2
+
+
+class TestColumnarJoin:
+    @pytest.mark.parametrize("join_type", ["inner", "left"])
+    def test_matches_record_join(self, join_type) -> None:
+        table = TableSnapshot(name="regions")
+        table.bulk_load(
+            {
+                "1": {"region": "north", "v": 100},
+                "2": {"region": "south"},
+            },
+        )
+        records = [
+            StreamRecord(key="a", value={"rid": 1, "v": 1}, event_time=1.0),
+            StreamRecord(key="b", value={"rid": 3, "v": 2}, event_time=2.0),
+            StreamRecord(key="c", value={"rid": 2, "v": 3}, event_time=3.0),
+        ]
+        by_record = StreamTableJoin(
+            table,
+            lambda r: str(r.value["rid"]),
+            join_type,
+        )
+        by_batch = StreamTableJoin(
+            table,
+            join_type=join_type,
+            key_column="rid",
+        )
+
+        expected = by_record.process_batch(records)
+        joined = by_batch.process_batch(records_to_batch(records))
+
+        assert isinstance(joined, pa.RecordBatch)
+        assert [r.value for r in batch_to_records(joined)] == [
+            {k: v for k, v in r.value.items() if v is not None}
+            for r in expected
+        ]
+        assert (by_batch.matched, by_batch.unmatched) == (2, 1)
+
+    def test_table_nulls_override_stream(self) -> None:
+        table = TableSnapshot(name="t")
+        table.bulk_load({"1": {"v": None}, "2": {"v": 100}, "4": {}})
+        records = [
+            StreamRecord(key=k, value={"rid": int(k), "v": 1}, event_time=1)
+            for k in "1234"
+        ]
+        by_record = StreamTableJoin(
+            table,
+            lambda r: str(r.value["rid"]),
+            "left",
+        )
+        by_batch = StreamTableJoin(table, join_type="left", key_column="rid")
+
+        expected = by_record.process_batch(records)
+        joined = by_batch.process_batch(records_to_batch(records))
+
+        assert joined.column("v").to_pylist() == [
+            r.value.get("v") for r in expected
+        ]
+        assert joined.column("v").to_pylist() == [None, 100, 1, 1]
+
+    def test_incompatible_field_types(self) -> None:
+        table = TableSnapshot(name="t")
+        table.bulk_load({"1": {"v": "x"}})
+        records = [
+            StreamRecord(key=k, value={"rid": k, "v": [1]}, event_time=1)
+            for k in "12"
+        ]
+        join = StreamTableJoin(table, join_type="left", key_column="rid")
+        joined = join.process_batch(records_to_batch(records))
+        assert joined.column("v").to_pylist() == ["x", "[1]"]
+
+    def test_requires_key_column(self) -> None:
+        join = StreamTableJoin(TableSnapshot(name="t"), lambda r: r.key)
+        with pytest.raises(ValueError, match="key_column"):
+            join.process_batch(records_to_batch(_records(3)))
+        with pytest.raises(ValueError, match="key_extractor or key_column"):
+            StreamTableJoin(TableSnapshot(name="t"))
+
+
+class TestViewBatches:
+    @pytest.mark.parametrize("aggregate", [False, True])
+    def test_snapshot_matches_per_record(self, aggregate) -> None:
+        def _total(values: list[dict]) -> dict:
+            return {"total": sum(v["v"] for v in values)}
+
+        records = [
+            *_records(60),
+            StreamRecord(
+                key="k1",
+                value={},
+                event_time=50.0,
+                record_type=RecordType.DELETE,
+            ),
+            StreamRecord(key="k1", value={"v": 7, "x": 0.0}, event_time=51),
+        ]
+        fn = _total if aggregate else None
+
+        async def _run() -> tuple[dict, dict, int]:
+            one = IncrementalView("one", fn)
+            for record in records:
+                await one.apply(record)
+            many = IncrementalView("many", fn)
+            entries = await many.apply_batch(records_to_batch(records))
+            return one.snapshot, many.snapshot, len(entries)
+
+        expected, actual, changes = asyncio.run(_run())
+        assert actual == expected
+        assert changes == (len(records) - 1 if aggregate else 4)
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class TestMicroBatchEngine:
+    def test_pipeline(self) -> None:
+        async def _run() -> None:
+            buf = StreamBuffer(max_size=1000)
+            engine = StreamEngine(
+                buf,
+                watermark=WatermarkTracker(allowed_lateness=0.0),
+                batch_size=500,
+                cycle_interval=0.01,
+                micro_batch=True,
+            )
+            windows = WindowManager(TumblingWindow(size=10.0))
+            engine.add_window_manager(windows)
+            engine.add_batch_transform(
+                lambda b: b.filter(pa.compute.greater(b.column("v"), 0)),
+            )
+            batches: list[pa.RecordBatch] = []
+            engine.add_batch_sink(batches.append)
+            summaries: list[StreamRecord] = []
+            engine.add_sink(
+                lambda r: summaries.append(r)
+                if r.source == "window_aggregate"
+                else None,
+            )
+
+            for i in range(10):
+                await buf.put(
+                    StreamRecord(
+                        key="k",
+                        value={"v": i},
+                        event_time=float(i),
+                        record_id=f"r{i}",
+                    ),
+                )
+            await buf.put(
+                StreamRecord(
+                    key="k",
+                    value={"v": 1},
+                    event_time=5.0,
+                    record_id="r1",
+                ),
+            )
+            await buf.put(StreamRecord.watermark(20.0))
+            await buf.put(
+                StreamRecord(key="k", value={"v": 1}, event_time=2.0),
+            )
+            await engine.start()
+            await asyncio.sleep(0.1)
+            await engine.stop()
+
+            metrics = engine.metrics
+            assert metrics.records_processed == 9
+            assert metrics.records_dropped_dedup == 1
+            assert metrics.records_dropped_late == 1
+            assert sum(b.num_rows for b in batches) == 9
+            assert metrics.windows_fired == 1
+            (summary,) = summaries
+            assert summary.value["__window_count__"] == 9
+            assert summary.value["__window_aggregates__"]["v"]["sum"] == 45
+            assert "__window_records__" not in summary.value
+
+        asyncio.run(_run())
+
+    def test_mixed_field_types(self) -> None:
+        async def _run() -> None:
+            buf = StreamBuffer()
+            engine = StreamEngine(buf, cycle_interval=0.01, micro_batch=True)
+            batches: list[pa.RecordBatch] = []
+            engine.add_batch_sink(batches.append)
+            for i, value in enumerate((1, "x")):
+                await buf.put(
+                    StreamRecord(
+                        key="k",
+                        value={"v": value},
+                        event_time=float(i),
+                        record_id=f"r{i}",
+                    ),
+                )
+            await engine.start()
+            await asyncio.sleep(0.1)
+            await engine.stop()
+
+            assert engine.metrics.records_processed == 2
+            assert engine.metrics.errors == 0
+            (batch,) = batches
+            assert batch.column("v").to_pylist() == ["1", "x"]
+
+        asyncio.run(_run())
+
+    def test_mode_specific_operators(self) -> None:
+        batch_engine = StreamEngine(StreamBuffer(), micro_batch=True)
+        with pytest.raises(ValueError, match="add_batch_transform"):
+            batch_engine.add_transform(lambda r: r)
+        with pytest.raises(ValueError, match="key_column"):
+            batch_engine.add_join(
+                StreamTableJoin(TableSnapshot(name="t"), lambda r: r.key),
+            )
+        record_engine = StreamEngine(StreamBuffer())
+        with pytest.raises(ValueError, match="micro_batch"):
+            record_engine.add_batch_sink(print)
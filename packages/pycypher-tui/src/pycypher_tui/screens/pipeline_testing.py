@@ -3,6 +3,12 @@
 Provides dry run execution, execution plan visualization, error diagnosis,
 and comprehensive pipeline validation with VIM-style navigation.
 
+Preview execution runs each query against consistent, relationship-aware
+samples of the sources (see :class:`pycypher.ingestion.data_preview.
+QueryTester`) instead of the full data: the first rows appear within
+milliseconds and the sample grows while each round stays under a latency
+target.
+
 Refactored to use VimNavigableScreen for consistent VIM navigation,
 ModeManager integration, search, and register/clipboard support.
 """
@@ -14,12 +20,12 @@ import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from textual.app import ComposeResult
 from textual.css.query import NoMatches
 from textual.message import Message
-from textual.widgets import Label, Static
+from textual.widgets import DataTable, Label, Static
 
 from pycypher_tui.config.pipeline import ConfigManager
 from pycypher_tui.screens.base import (
@@ -28,8 +34,25 @@ from pycypher_tui.screens.base import (
     VimNavigableScreen,
 )
 
+if TYPE_CHECKING:
+    from pycypher.cancellation import CancellationToken, OperatorProgress
+    from pycypher.ingestion.data_preview import (
+        PreviewCache,
+        PreviewStage,
+        QueryTester,
+    )
+
 logger = logging.getLogger(__name__)
 
+#: Minimum seconds between progress-driven refreshes of a running step.
+_PROGRESS_REFRESH_S = 0.25
+
+#: Latency each preview round should stay under.
+PREVIEW_TARGET_MS = 500.0
+
+#: Result rows kept on a step for the preview table.
+PREVIEW_ROW_LIMIT = 50
+
 
 # ─── Data Models ──────────────────────────────────────────────────────────────
 
@@ -57,6 +80,25 @@ class ExecutionStep:
     row_count: int = 0
     error_message: str | None = None
     warnings: list[str] = field(default_factory=list)
+    progress_operator: str | None = None
+    progress_processed: int = 0
+    progress_total: int | None = None
+    progress_unit: str = "rows"
+    sample_rows: int | None = None
+    preview_columns: list[str] = field(default_factory=list)
+    preview_rows: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def progress_label(self) -> str | None:
+        """Return e.g. ``"join: 2,048/10,000 rows (20%)"``, if any."""
+        if self.progress_operator is None:
+            return None
+        label = f"{self.progress_operator}: {self.progress_processed:,}"
+        if self.progress_total:
+            pct = min(self.progress_processed / self.progress_total, 1.0)
+            label += f"/{self.progress_total:,} {self.progress_unit}"
+            return f"{label} ({pct:.0%})"
+        return f"{label} {self.progress_unit}"
 
     @property
     def status_icon(self) -> str:
@@ -324,26 +366,76 @@ def run_dry_execution(config_manager: ConfigManager) -> ExecutionPlan:
     return plan
 
 
+def _resolve_config_uri(uri: str, config_dir: Path) -> str:
+    """Resolve a relative file path URI against the config directory.
+
+    URIs with explicit schemes (s3://, https://, postgres://, etc.) are
+    returned unchanged. Bare paths and ``file://`` URIs are resolved
+    relative to ``config_dir`` so the TUI works correctly regardless of
+    the launch directory.
+    """
+    from urllib.parse import urlparse
+
+    parsed = urlparse(uri)
+    scheme = parsed.scheme.lower()
+    # Single-character schemes are Windows drive letters, not URI schemes
+    if scheme and len(scheme) > 1 and scheme != "file":
+        return uri
+    path_part = parsed.path if scheme == "file" else uri
+    path_obj = Path(path_part)
+    if path_obj.is_absolute():
+        return str(path_obj)
+    return str((config_dir / path_obj).resolve())
+
+
+def _load_query_text(q: Any, config_dir: Path) -> str:
+    """Return the Cypher text of query config *q*.
+
+    Raises:
+        ValueError: If *q* has no text or its source escapes *config_dir*.
+        OSError: If the source file cannot be read.
+    """
+    if q.inline is not None:
+        return q.inline
+    if q.source is not None:
+        query_path = (config_dir / q.source).resolve()
+        try:
+            query_path.relative_to(config_dir.resolve())
+        except ValueError as exc:
+            raise ValueError(
+                f"Query source {q.source!r} escapes the config directory"
+            ) from exc
+        return query_path.read_text(encoding="utf-8")
+    raise ValueError(f"Query {q.id!r} has neither 'inline' nor 'source'")
+
+
 def run_real_execution(
     config_manager: ConfigManager,
     config_path: Path | None = None,
     on_step_change: Callable[[ExecutionStep, ExecutionPlan], None]
     | None = None,
     cancel_check: Callable[[], bool] | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> ExecutionPlan:
     """Execute the pipeline against the live runtime, updating per-step status.
 
     Mirrors ``pycypher.cli.pipeline.run_impl`` but iterates the steps from
     ``build_execution_plan`` so the existing TUI list/detail UI works
     unchanged.  ``on_step_change`` is invoked at every status transition so
-    the caller (the TUI) can refresh the display in real time.
-    """
-    from urllib.parse import urlparse
+    the caller (the TUI) can refresh the display in real time, and — at
+    most every ``_PROGRESS_REFRESH_S`` seconds — while a query's operators
+    report progress.
 
+    A running query is stopped mid-operator when ``cancel_token`` is
+    cancelled or ``cancel_check`` starts returning ``True``; its step is
+    marked SKIPPED along with every step after it.
+    """
+    from pycypher.cancellation import CancellationToken
     from pycypher.cli.pipeline import (  # lazy: heavy imports
         _OUTPUT_ERRORS,
         _QUERY_EXEC_ERRORS,
     )
+    from pycypher.exceptions import QueryCancelledError
     from pycypher.ingestion.context_builder import ContextBuilder
     from pycypher.ingestion.output_writer import write_dataframe_to_uri
     from pycypher.ingestion.security import mask_uri_credentials
@@ -354,23 +446,7 @@ def run_real_execution(
     config_dir = config_path.parent if config_path else Path.cwd()
 
     def _resolve_uri(uri: str) -> str:
-        """Resolve a relative file path URI against the config directory.
-
-        URIs with explicit schemes (s3://, https://, postgres://, etc.) are
-        returned unchanged. Bare paths and ``file://`` URIs are resolved
-        relative to ``config_dir`` so the TUI works correctly regardless of
-        the launch directory.
-        """
-        parsed = urlparse(uri)
-        scheme = parsed.scheme.lower()
-        # Single-character schemes are Windows drive letters, not URI schemes
-        if scheme and len(scheme) > 1 and scheme != "file":
-            return uri
-        path_part = parsed.path if scheme == "file" else uri
-        path_obj = Path(path_part)
-        if path_obj.is_absolute():
-            return str(path_obj)
-        return str((config_dir / path_obj).resolve())
+        return _resolve_config_uri(uri, config_dir)
 
     start = time.monotonic()
 
@@ -378,8 +454,30 @@ def run_real_execution(
         if on_step_change is not None:
             on_step_change(step, plan)
 
+    token = cancel_token if cancel_token is not None else CancellationToken()
+
     def cancelled() -> bool:
-        return cancel_check is not None and cancel_check()
+        return token.cancelled or (cancel_check is not None and cancel_check())
+
+    def progress_callback(
+        step: ExecutionStep,
+    ) -> Callable[[OperatorProgress], None]:
+        last_refresh = 0.0
+
+        def on_progress(progress: OperatorProgress) -> None:
+            nonlocal last_refresh
+            if cancelled():
+                token.cancel("Cancelled")
+            step.progress_operator = progress.operator
+            step.progress_processed = progress.processed
+            step.progress_total = progress.total
+            step.progress_unit = progress.unit
+            now = time.monotonic()
+            if now - last_refresh >= _PROGRESS_REFRESH_S:
+                last_refresh = now
+                notify(step)
+
+        return on_progress
 
     def fail_remaining(reason: str) -> None:
         for s in plan.steps:
@@ -565,21 +663,7 @@ def run_real_execution(
 
         # Load query text
         try:
-            if q.inline is not None:
-                query_text = q.inline
-            elif q.source is not None:
-                query_path = (config_dir / q.source).resolve()
-                try:
-                    query_path.relative_to(config_dir.resolve())
-                except ValueError as exc:
-                    raise ValueError(
-                        f"Query source {q.source!r} escapes the config directory"
-                    ) from exc
-                query_text = query_path.read_text(encoding="utf-8")
-            else:
-                raise ValueError(
-                    f"Query {q.id!r} has neither 'inline' nor 'source'"
-                )
+            query_text = _load_query_text(q, config_dir)
         except (
             ValueError,
             FileNotFoundError,
@@ -608,7 +692,19 @@ def run_real_execution(
 
         # Execute query
         try:
-            result_df = star.execute_query(query_text)
+            result_df = star.execute_query(
+                query_text,
+                cancel_token=token,
+                on_progress=progress_callback(q_step),
+            )
+        except QueryCancelledError:
+            q_step.status = StepStatus.SKIPPED
+            q_step.error_message = "Cancelled"
+            q_step.duration_ms = (time.monotonic() - qs) * 1000
+            notify(q_step)
+            fail_remaining("Cancelled")
+            plan.total_duration_ms = (time.monotonic() - start) * 1000
+            return plan
         except _QUERY_EXEC_ERRORS as exc:
             q_step.status = StepStatus.ERROR
             q_step.error_message = f"{type(exc).__name__}: {exc}"
@@ -676,6 +772,172 @@ def run_real_execution(
     return plan
 
 
+def preview_tester_from_config(
+    config_manager: ConfigManager,
+    config_path: Path | None = None,
+    cache: PreviewCache | None = None,
+) -> QueryTester:
+    """Return a :class:`QueryTester` over the pipeline's sources.
+
+    Reuse the tester between preview runs: it keeps the samples it has
+    drawn, so only the first run of each sample size reads the sources.
+    """
+    from pycypher.ingestion.data_preview import QueryTester
+
+    cfg = config_manager.get_config()
+    config_dir = config_path.parent if config_path else Path.cwd()
+    tester = QueryTester(cache=cache)
+    if cfg.sources:
+        for entity_src in cfg.sources.entities:
+            tester.add_entity(
+                entity_src.entity_type,
+                _resolve_config_uri(entity_src.uri, config_dir),
+                id_col=entity_src.id_col,
+            )
+        for rel_src in cfg.sources.relationships:
+            tester.add_relationship(
+                rel_src.relationship_type,
+                _resolve_config_uri(rel_src.uri, config_dir),
+                source_col=rel_src.source_col,
+                target_col=rel_src.target_col,
+                id_col=rel_src.id_col,
+            )
+    return tester
+
+
+def run_preview_execution(
+    config_manager: ConfigManager,
+    config_path: Path | None = None,
+    on_step_change: Callable[[ExecutionStep, ExecutionPlan], None]
+    | None = None,
+    cancel_token: CancellationToken | None = None,
+    tester: QueryTester | None = None,
+    target_ms: float = PREVIEW_TARGET_MS,
+) -> ExecutionPlan:
+    """Run every query on progressively larger samples of the sources.
+
+    Each query step is updated after every round, so its first rows can
+    be shown while larger samples are still running; the step ends with
+    the result of the largest sample that met *target_ms*.  Load steps
+    are skipped (sources are sampled on demand) and outputs are not
+    written.
+
+    Args:
+        config_manager: Pipeline configuration.
+        config_path: Config file, for resolving relative paths.
+        on_step_change: Called at every step update.
+        cancel_token: Stops the preview when cancelled.
+        tester: Tester from :func:`preview_tester_from_config`, reused to
+            keep samples and cached results across runs.
+        target_ms: Latency each round should stay under.
+
+    Returns:
+        The execution plan with per-step results.
+    """
+    from pycypher.cancellation import CancellationToken
+
+    plan = build_execution_plan(config_manager)
+    cfg = config_manager.get_config()
+    config_dir = config_path.parent if config_path else Path.cwd()
+    token = cancel_token if cancel_token is not None else CancellationToken()
+    if tester is None:
+        tester = preview_tester_from_config(config_manager, config_path)
+    start = time.monotonic()
+
+    def notify(step: ExecutionStep) -> None:
+        if on_step_change is not None:
+            on_step_change(step, plan)
+
+    for step in plan.steps:
+        if step.step_type == "load":
+            step.status = StepStatus.SKIPPED
+            step.error_message = "Preview: sources are sampled per query"
+        elif step.step_type == "output":
+            step.status = StepStatus.SKIPPED
+            step.error_message = "Preview: outputs are not written"
+        elif step.step_type == "validate":
+            step.status = StepStatus.SUCCESS
+        else:
+            continue
+        notify(step)
+
+    query_steps = {
+        s.name.removeprefix("Execute "): s
+        for s in plan.steps
+        if s.step_type == "query"
+    }
+    for q in cfg.queries:
+        q_step = query_steps.get(q.id)
+        if q_step is None:
+            continue
+        if token.cancelled:
+            q_step.status = StepStatus.SKIPPED
+            q_step.error_message = "Cancelled"
+            notify(q_step)
+            continue
+        q_step.status = StepStatus.RUNNING
+        notify(q_step)
+        qs = time.monotonic()
+        try:
+            query_text = _load_query_text(q, config_dir)
+        except (ValueError, OSError) as exc:
+            q_step.status = StepStatus.ERROR
+            q_step.error_message = f"Query load failed: {exc}"
+            notify(q_step)
+            continue
+
+        def on_stage(
+            stage: PreviewStage,
+            step: ExecutionStep = q_step,
+        ) -> None:
+            table = stage.result.table
+            if table is not None:
+                step.sample_rows = stage.sample_rows
+                step.row_count = table.num_rows
+                step.preview_columns = list(table.column_names)
+                step.preview_rows = table.slice(
+                    0,
+                    PREVIEW_ROW_LIMIT,
+                ).to_pylist()
+            step.duration_ms = stage.elapsed_ms
+            notify(step)
+
+        stages = tester.run_progressive(
+            query_text,
+            target_ms=target_ms,
+            on_stage=on_stage,
+            cancel_token=token,
+        )
+        last = stages[-1]
+        q_step.duration_ms = (time.monotonic() - qs) * 1000
+        if token.cancelled and last.result.error is not None:
+            q_step.status = StepStatus.SKIPPED
+            q_step.error_message = "Cancelled"
+        elif last.result.error is not None:
+            q_step.status = StepStatus.ERROR
+            q_step.error_message = last.result.error
+            plan.diagnostics.append(
+                DiagnosticEntry(
+                    severity="error",
+                    category="runtime",
+                    message=last.result.error,
+                    location=f"query.{q.id}",
+                    suggestion="Check Cypher syntax and bound parameters",
+                )
+            )
+        else:
+            q_step.status = StepStatus.SUCCESS
+            if not last.complete:
+                q_step.warnings = [
+                    f"Preview on a sample of {last.sample_rows:,} rows "
+                    "per source"
+                ]
+        notify(q_step)
+
+    plan.total_duration_ms = (time.monotonic() - start) * 1000
+    return plan
+
+
 # ─── Widgets ──────────────────────────────────────────────────────────────────
 
 
@@ -773,6 +1035,14 @@ class StepDetailPanel(BaseDetailPanel):
                 )
             )
 
+        if step.progress_label is not None:
+            self.mount(
+                Label(
+                    f"  Progress: {step.progress_label}",
+                    classes="detail-row",
+                )
+            )
+
         if step.error_message:
             self.mount(Label("  Error", classes="detail-section"))
             self.mount(
@@ -784,6 +1054,23 @@ class StepDetailPanel(BaseDetailPanel):
             for warn in step.warnings:
                 self.mount(Label(f"    ! {warn}", classes="detail-row"))
 
+        if step.preview_columns:
+            self.mount(
+                Label(
+                    f"  Preview ({step.row_count:,} rows from a sample of "
+                    f"{step.sample_rows or 0:,} rows per source)",
+                    classes="detail-section",
+                )
+            )
+            table = DataTable(classes="preview-table")
+            for column in step.preview_columns:
+                table.add_column(column, key=column)
+            for row in step.preview_rows:
+                table.add_row(
+                    *[str(row.get(c, "")) for c in step.preview_columns]
+                )
+            self.mount(table)
+
         # Show related diagnostics
         if diagnostics:
             self.mount(Label("  Diagnostics", classes="detail-section"))
@@ -815,7 +1102,8 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
         Enter/l     - View step details
         r           - Run dry execution (validation only)
         R           - Run real execution (load, query, write outputs)
-        c           - Cancel running execution between steps
+        p           - Preview queries on growing samples of the sources
+        c           - Cancel running execution (stops the running query)
         gg/G        - Jump to first/last step
         /pattern    - Search steps
         n/N         - Next/previous search match
@@ -853,6 +1141,9 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
         self._plan: ExecutionPlan | None = None
         self._config_path = config_path
         self._cancel_requested = False
+        self._cancel_token: CancellationToken | None = None
+        self._preview_tester: QueryTester | None = None
+        self._preview_sources: str | None = None
         self._is_running = False
         # Lock used to serialize per-step UI refreshes pushed from the
         # worker thread. Without this, two refreshes can interleave and
@@ -874,7 +1165,8 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
     @property
     def footer_hints(self) -> str:
         return (
-            " j/k:nav  r:dry  R:run  c:cancel  Enter:details  /search  q:close"
+            " j/k:nav  r:dry  R:run  p:preview  c:cancel  Enter:details"
+            "  /search  q:close"
         )
 
     @property
@@ -937,7 +1229,7 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
 
     @property
     def _screen_override_keys(self) -> frozenset[str]:
-        return frozenset({"r", "R", "c", "q"})
+        return frozenset({"r", "R", "p", "c", "q"})
 
     def handle_extra_key(self, key: str) -> bool:
         match key:
@@ -947,19 +1239,34 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
                 return True
             case "R":
                 if not self._is_running:
+                    from pycypher.cancellation import CancellationToken
+
                     self._cancel_requested = False
+                    self._cancel_token = CancellationToken()
                     self.run_worker(
                         self._run_real_execution,
                         exclusive=True,
                         thread=True,
                     )
                 return True
+            case "p":
+                if not self._is_running:
+                    from pycypher.cancellation import CancellationToken
+
+                    self._cancel_requested = False
+                    self._cancel_token = CancellationToken()
+                    self.run_worker(
+                        self._run_preview_execution,
+                        exclusive=True,
+                        thread=True,
+                    )
+                return True
             case "c":
                 if self._is_running:
                     self._cancel_requested = True
-                    self._show_summary_text(
-                        "Cancelling after current step…", color="#e0af68"
-                    )
+                    if self._cancel_token is not None:
+                        self._cancel_token.cancel("Cancelled from the TUI")
+                    self._show_summary_text("Cancelling…", color="#e0af68")
                 return True
             case "q":
                 self.app.pop_screen()
@@ -1020,6 +1327,7 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
                     config_path=self._config_path,
                     on_step_change=on_step_change,
                     cancel_check=cancel_check,
+                    cancel_token=self._cancel_token,
                 )
             except Exception as exc:  # noqa: BLE001 - any failure should surface
                 logger.exception("Real execution failed")
@@ -1038,6 +1346,56 @@ class PipelineTestingScreen(VimNavigableScreen[ExecutionStep]):
         finally:
             self._is_running = False
 
+    def _preview_tester_for_config(self) -> QueryTester:
+        """Return the preview tester, rebuilt when the sources change."""
+        from pycypher.ingestion.data_preview import PreviewCache
+
+        cfg = self._config_manager.get_config()
+        sources = cfg.sources.model_dump_json() if cfg.sources else ""
+        if self._preview_tester is None or sources != self._preview_sources:
+            self._preview_tester = preview_tester_from_config(
+                self._config_manager,
+                self._config_path,
+                cache=PreviewCache(max_size=64),
+            )
+            self._preview_sources = sources
+        return self._preview_tester
+
+    def _run_preview_execution(self) -> None:
+        """Preview every query on samples (runs on a worker thread)."""
+        self._is_running = True
+        try:
+
+            def on_step_change(
+                _step: ExecutionStep, plan: ExecutionPlan
+            ) -> None:
+                self.app.call_from_thread(self._on_step_changed, plan)
+
+            try:
+                plan = run_preview_execution(
+                    self._config_manager,
+                    config_path=self._config_path,
+                    on_step_change=on_step_change,
+                    cancel_token=self._cancel_token,
+                    tester=self._preview_tester_for_config(),
+                )
+            except Exception as exc:  # noqa: BLE001 - any failure should surface
+                logger.exception("Preview execution failed")
+                self.app.call_from_thread(
+                    self._show_summary_text,
+                    f"Preview failed: {exc}",
+                    "#f7768e",
+                )
+                return
+
+            self._plan = plan
+            self.app.call_from_thread(self._on_step_changed, plan)
+            self.app.call_from_thread(
+                self.post_message, self.TestCompleted(plan)
+            )
+        finally:
+            self._is_running = False
+
     async def _on_step_changed(self, plan: ExecutionPlan) -> None:
         """Update list + summary after a step transitions (runs on event loop).
 
@@ -150,3 +150,43 @@ def test_run_pipeline_real_execution_via_worker(tmp_path):
             assert len(rows) == 3
 
     asyncio.run(body())
+
+
+def test_run_pipeline_preview_via_worker(tmp_path):
+    """Pressing p previews the query on samples and writes no output."""
+    cfg, out_path = _build_csv_pipeline(tmp_path)
+
+    async def body():
+        app = PyCypherTUI()
+        app._config_manager = ConfigManager.from_config(cfg)
+        app.config_path = tmp_path / "pipeline.yaml"
+
+        async with app.run_test() as pilot:
+            await app._show_pipeline_run()
+            await pilot.pause()
+
+            screen = app.query_one(PipelineTestingScreen)
+            screen.handle_extra_key("p")
+            for _ in range(50):
+                await pilot.pause()
+                if screen._plan is not None and not screen._is_running:
+                    break
+
+            assert screen._plan is not None, "worker never produced a plan"
+            query_step = next(
+                s for s in screen._plan.steps if s.step_type == "query"
+            )
+            assert query_step.status == StepStatus.SUCCESS
+            assert query_step.row_count == 2
+            assert query_step.preview_columns == ["name", "age"]
+            assert not out_path.exists()
+            # A second preview reuses the tester and its cached results.
+            tester = screen._preview_tester
+            screen.handle_extra_key("p")
+            for _ in range(50):
+                await pilot.pause()
+                if not screen._is_running:
+                    break
+            assert screen._preview_tester is tester
+
+    asyncio.run(body())
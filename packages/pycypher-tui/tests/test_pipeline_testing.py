@@ -13,13 +13,16 @@ from pycypher.ingestion.config import (
 
 from pycypher_tui.config.pipeline import ConfigManager
 from pycypher_tui.screens.pipeline_testing import (
+    PREVIEW_ROW_LIMIT,
     DiagnosticEntry,
     ExecutionPlan,
     ExecutionStep,
     PipelineTestingScreen,
     StepStatus,
     build_execution_plan,
+    preview_tester_from_config,
     run_dry_execution,
+    run_preview_execution,
     run_real_execution,
 )
 
@@ -605,6 +608,42 @@ class TestRunRealExecutionCancellation:
         # At least one of the load/query/output steps should be SKIPPED
         assert any(s.status == StepStatus.SKIPPED for s in plan.steps)
 
+    def test_token_cancels_running_query(self, tmp_path):
+        from pycypher.cancellation import CancellationToken
+
+        cm, cfg_path, out = _build_csv_pipeline(tmp_path)
+        token = CancellationToken()
+
+        def cb(step, _plan):
+            if step.step_type == "query" and step.status == StepStatus.RUNNING:
+                token.cancel("stop")
+
+        plan = run_real_execution(
+            cm, config_path=cfg_path, on_step_change=cb, cancel_token=token
+        )
+        query_step = next(s for s in plan.steps if s.step_type == "query")
+        assert query_step.status == StepStatus.SKIPPED
+        assert query_step.error_message == "Cancelled"
+        assert not out.exists()
+
+
+class TestStepProgress:
+    def test_progress_label(self):
+        step = ExecutionStep(name="q", description="", step_type="query")
+        assert step.progress_label is None
+        step.progress_operator = "join"
+        step.progress_processed = 2048
+        step.progress_total = 10_000
+        assert step.progress_label == "join: 2,048/10,000 rows (20%)"
+        step.progress_total = None
+        assert step.progress_label == "join: 2,048 rows"
+
+    def test_query_step_records_progress(self, tmp_path):
+        cm, cfg_path, _ = _build_csv_pipeline(tmp_path)
+        plan = run_real_execution(cm, config_path=cfg_path)
+        query_step = next(s for s in plan.steps if s.step_type == "query")
+        assert query_step.progress_operator is not None
+
 
 class TestRunRealExecutionCallback:
     def test_callback_invoked_per_step(self, tmp_path):
@@ -639,3 +678,94 @@ class TestRunRealExecutionCallback:
                 StepStatus.ERROR,
                 StepStatus.SKIPPED,
             ), (name, transitions)
+
+
+class TestRunPreviewExecution:
+    def _graph_pipeline(self, tmp_path):
+        people = tmp_path / "people.csv"
+        people.write_text(
+            "id,name\n" + "".join(f"{i},P{i}\n" for i in range(300))
+        )
+        knows = tmp_path / "knows.csv"
+        knows.write_text(
+            "src,tgt\n" + "".join(f"{i},{(i * 7) % 300}\n" for i in range(300))
+        )
+        out = tmp_path / "out.csv"
+        cfg = PipelineConfig(
+            version="1.0",
+            sources=SourcesConfig(
+                entities=[
+                    EntitySourceConfig(
+                        id="people",
+                        uri=str(people),
+                        entity_type="Person",
+                        id_col="id",
+                    ),
+                ],
+                relationships=[
+                    RelationshipSourceConfig(
+                        id="knows",
+                        uri=str(knows),
+                        relationship_type="KNOWS",
+                        source_col="src",
+                        target_col="tgt",
+                    ),
+                ],
+            ),
+            queries=[
+                QueryConfig(
+                    id="pairs",
+                    inline=(
+                        "MATCH (a:Person)-[:KNOWS]->(b:Person) "
+                        "RETURN a.name AS a, b.name AS b"
+                    ),
+                ),
+            ],
+            output=[OutputConfig(query_id="pairs", uri=str(out))],
+        )
+        return ConfigManager.from_config(cfg), tmp_path / "pipeline.yaml", out
+
+    def test_streams_stages_and_writes_nothing(self, tmp_path):
+        cm, cfg_path, out = self._graph_pipeline(tmp_path)
+        seen: list[tuple[StepStatus, int]] = []
+
+        def cb(step, _plan):
+            if step.step_type == "query":
+                seen.append((step.status, step.row_count))
+
+        plan = run_preview_execution(
+            cm, config_path=cfg_path, on_step_change=cb, target_ms=60_000.0
+        )
+        query_step = next(s for s in plan.steps if s.step_type == "query")
+        assert query_step.status == StepStatus.SUCCESS
+        assert query_step.row_count == 300
+        assert query_step.preview_columns == ["a", "b"]
+        assert len(query_step.preview_rows) == PREVIEW_ROW_LIMIT
+        # The first rows arrive before the query step finishes.
+        running = [rows for status, rows in seen if status == StepStatus.RUNNING]
+        assert running and running[1] == 100
+        assert not out.exists()
+        assert all(
+            s.status == StepStatus.SKIPPED
+            for s in plan.steps
+            if s.step_type in {"load", "output"}
+        )
+
+    def test_tester_reuses_cached_results(self, tmp_path):
+        from pycypher.ingestion.data_preview import PreviewCache
+
+        cm, cfg_path, _ = self._graph_pipeline(tmp_path)
+        cache = PreviewCache()
+        tester = preview_tester_from_config(cm, cfg_path, cache=cache)
+        run_preview_execution(cm, config_path=cfg_path, tester=tester)
+        hits = cache.hits
+        run_preview_execution(cm, config_path=cfg_path, tester=tester)
+        assert cache.hits > hits
+
+    def test_small_target_keeps_a_sample(self, tmp_path):
+        cm, cfg_path, _ = self._graph_pipeline(tmp_path)
+        plan = run_preview_execution(cm, config_path=cfg_path, target_ms=0.0)
+        query_step = next(s for s in plan.steps if s.step_type == "query")
+        assert query_step.status == StepStatus.SUCCESS
+        assert query_step.sample_rows == 100
+        assert query_step.warnings
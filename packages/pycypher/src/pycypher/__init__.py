@@ -63,6 +63,7 @@ All exceptions are importable from :mod:`pycypher` directly.
 - :class:`PatternComprehensionError` (:class:`ValueError`) — invalid pattern comprehension structure
 - :class:`QueryComplexityError` (:class:`ValueError`) — query complexity exceeds configured limit
 - :class:`QueryTimeoutError` (:class:`TimeoutError`) — query exceeded wall-clock budget
+- :class:`QueryCancelledError` (:class:`RuntimeError`) — query cancelled by its token
 
 **Dependency errors** (catch when composing multi-query pipelines):
 
@@ -122,7 +123,10 @@ release.  The following table summarises the stability of each public symbol:
 
 from __future__ import annotations
 
-from pycypher.config import apply_preset, show_config
+from typing import TYPE_CHECKING
+
+# Exceptions are light (stdlib only) and are what callers most often
+# import — load them eagerly.
 from pycypher.exceptions import (
     ASTConversionError,
     CyclicDependencyError,
@@ -134,6 +138,7 @@ from pycypher.exceptions import (
     InvalidCastError,
     MissingParameterError,
     PatternComprehensionError,
+    QueryCancelledError,
     QueryComplexityError,
     QueryMemoryBudgetError,
     QueryTimeoutError,
@@ -145,20 +150,75 @@ from pycypher.exceptions import (
     VariableTypeMismatchError,
     WrongCypherTypeError,
 )
-from pycypher.ingestion import ContextBuilder
-from pycypher.pipeline import Pipeline, PipelineContext, PipelineResult, Stage
-from pycypher.relational_models import (
-    ID_COLUMN,
-    RELATIONSHIP_SOURCE_COLUMN,
-    RELATIONSHIP_TARGET_COLUMN,
-    Context,
-    EntityMapping,
-    EntityTable,
-    RelationshipMapping,
-    RelationshipTable,
-)
-from pycypher.semantic_validator import SemanticValidator, validate_query
-from pycypher.star import ResultCache, Star, get_cache_stats
+
+if TYPE_CHECKING:
+    from pycypher.cancellation import CancellationToken, OperatorProgress
+    from pycypher.config import apply_preset, show_config
+    from pycypher.ingestion import ContextBuilder
+    from pycypher.pipeline import (
+        Pipeline,
+        PipelineContext,
+        PipelineResult,
+        Stage,
+    )
+    from pycypher.relational_models import (
+        ID_COLUMN,
+        RELATIONSHIP_SOURCE_COLUMN,
+        RELATIONSHIP_TARGET_COLUMN,
+        Context,
+        EntityMapping,
+        EntityTable,
+        RelationshipMapping,
+        RelationshipTable,
+    )
+    from pycypher.semantic_validator import SemanticValidator, validate_query
+    from pycypher.star import ResultCache, Star, get_cache_stats
+
+# Everything else pulls in pandas, the evaluator stack or the grammar, so
+# it is imported on first attribute access (PEP 562).  ``import pycypher``
+# stays cheap for the CLI, the LSP server and short-lived workers.
+# Lazy-loaded symbols: mapped to (module_path, attribute_name).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    # Constants
+    "ID_COLUMN": ("pycypher.relational_models", "ID_COLUMN"),
+    "RELATIONSHIP_SOURCE_COLUMN": (
+        "pycypher.relational_models",
+        "RELATIONSHIP_SOURCE_COLUMN",
+    ),
+    "RELATIONSHIP_TARGET_COLUMN": (
+        "pycypher.relational_models",
+        "RELATIONSHIP_TARGET_COLUMN",
+    ),
+    # Ingestion helpers
+    "ContextBuilder": ("pycypher.ingestion", "ContextBuilder"),
+    # Data containers
+    "Context": ("pycypher.relational_models", "Context"),
+    "EntityMapping": ("pycypher.relational_models", "EntityMapping"),
+    "EntityTable": ("pycypher.relational_models", "EntityTable"),
+    "RelationshipMapping": (
+        "pycypher.relational_models",
+        "RelationshipMapping",
+    ),
+    "RelationshipTable": ("pycypher.relational_models", "RelationshipTable"),
+    # Pre-execution validation
+    "SemanticValidator": ("pycypher.semantic_validator", "SemanticValidator"),
+    "validate_query": ("pycypher.semantic_validator", "validate_query"),
+    # Core query execution
+    "CancellationToken": ("pycypher.cancellation", "CancellationToken"),
+    "OperatorProgress": ("pycypher.cancellation", "OperatorProgress"),
+    "Star": ("pycypher.star", "Star"),
+    # Caching
+    "ResultCache": ("pycypher.star", "ResultCache"),
+    "get_cache_stats": ("pycypher.star", "get_cache_stats"),
+    # Pipeline
+    "Pipeline": ("pycypher.pipeline", "Pipeline"),
+    "PipelineContext": ("pycypher.pipeline", "PipelineContext"),
+    "PipelineResult": ("pycypher.pipeline", "PipelineResult"),
+    "Stage": ("pycypher.pipeline", "Stage"),
+    # Configuration
+    "apply_preset": ("pycypher.config", "apply_preset"),
+    "show_config": ("pycypher.config", "show_config"),
+}
 
 __version__ = "0.0.19"
 
@@ -179,6 +239,7 @@ __all__ = [
     "GraphTypeNotFoundError",
     "MissingParameterError",
     "PatternComprehensionError",
+    "QueryCancelledError",
     "QueryComplexityError",
     "QueryMemoryBudgetError",
     "QueryTimeoutError",
@@ -203,6 +264,8 @@ __all__ = [
     # Pre-execution validation
     "SemanticValidator",
     # Core query execution
+    "CancellationToken",
+    "OperatorProgress",
     "Star",
     "validate_query",
     # Caching
@@ -219,11 +282,25 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str) -> type:
-    """Lazy attribute lookup with typo suggestions against ``__all__``."""
+def __getattr__(name: str) -> object:
+    """Lazily import public symbols; suggest close matches for typos."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        import importlib
+
+        value = getattr(importlib.import_module(module_path), attr_name)
+        # Cache on the module so later lookups skip __getattr__.
+        globals()[name] = value
+        return value
+
     import difflib
 
     matches = difflib.get_close_matches(name, __all__, n=1, cutoff=0.6)
     hint = f"  Did you mean {matches[0]!r}?" if matches else ""
     msg = f"module {__name__!r} has no attribute {name!r}.{hint}"
     raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded symbols in ``dir(pycypher)``."""
+    return sorted({*globals(), *__all__})
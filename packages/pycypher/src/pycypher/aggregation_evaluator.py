@@ -25,6 +25,7 @@ from shared.logger import LOGGER
 from pycypher.binding_frame import BindingFrame
 from pycypher.constants import _normalize_func_args
 from pycypher.cypher_types import FrameSeries
+from pycypher.sketches import HyperLogLog, KllSketch, SpaceSaving
 
 _DEBUG_ENABLED: bool = LOGGER.isEnabledFor(logging.DEBUG)
 
@@ -154,11 +155,54 @@ def _agg_stdevp(values: FrameSeries) -> float | None:
     return float(non_null.std(ddof=0)) if not non_null.empty else None
 
 
+#: Default ``k`` for ``approxTopK(expr)`` called without a second argument.
+DEFAULT_TOP_K: int = 10
+
+
+def _agg_approx_count_distinct(values: FrameSeries) -> int:
+    """Estimated number of distinct non-null values (HyperLogLog).
+
+    Uses a fixed 4 KiB sketch regardless of input size, instead of the hash
+    set ``count(DISTINCT ...)`` materialises.
+    """
+    return round(HyperLogLog.from_series(values).estimate())
+
+
+def _agg_approx_percentile(
+    values: pd.Series,
+    percentile: float,
+) -> float | None:
+    """Approximate percentile from a KLL sketch, null-ignoring.
+
+    Returns an input value whose rank is within about 1% of the requested
+    percentile, without sorting the whole column.  ``None`` for all-null
+    input.
+    """
+    return KllSketch.from_series(values, seed=0).quantile(percentile)
+
+
+def _agg_approx_top_k(
+    values: FrameSeries,
+    k: int = DEFAULT_TOP_K,
+) -> list[Any]:
+    """The (approximately) *k* most frequent non-null values, most first."""
+    summary = SpaceSaving.for_top_k(k)
+    summary.add_series(values)
+    return [value for value, _ in summary.top(k)]
+
+
 #: Two-argument aggregations (value expression + percentile parameter).
 _PERCENTILE_AGGREGATIONS: frozenset[str] = frozenset(
-    {"percentilecont", "percentiledisc"},
+    {"percentilecont", "percentiledisc", "approxpercentile"},
 )
 
+#: Percentile aggregation name → implementation.
+_PERCENTILE_OPS: dict[str, Any] = {
+    "percentilecont": _agg_percentile_cont,
+    "percentiledisc": _agg_percentile_disc,
+    "approxpercentile": _agg_approx_percentile,
+}
+
 #: Aggregation function dispatch table.  Keys are lower-case function names.
 _AGG_OPS: dict[str, Any] = {
     "collect": lambda values: values.tolist(),
@@ -169,6 +213,8 @@ _AGG_OPS: dict[str, Any] = {
     "max": _agg_max,
     "stdev": _agg_stdev,
     "stdevp": _agg_stdevp,
+    "approxcountdistinct": _agg_approx_count_distinct,
+    "approxtopk": _agg_approx_top_k,
 }
 
 #: Complete set of known aggregation function names for validation and error messages.
@@ -368,10 +414,18 @@ class AggregationExpressionEvaluator:
                     "expression and percentile in [0.0, 1.0]",
                 )
             pct_series = expression_evaluator.evaluate(args[1])
+            if pct_series.empty:
+                # Zero rows: nothing to rank, and no row to read p from.
+                return None
             pct_val = float(pct_series.iloc[0])
-            if func_name_lower == "percentilecont":
-                return _agg_percentile_cont(values, pct_val)
-            return _agg_percentile_disc(values, pct_val)
+            return _PERCENTILE_OPS[func_name_lower](values, pct_val)
+
+        # approxTopK(expr, k): the optional second argument is the list size.
+        if func_name_lower == "approxtopk" and len(args) > 1:
+            k_series = expression_evaluator.evaluate(args[1])
+            if k_series.empty:
+                return []
+            return _agg_approx_top_k(values, int(k_series.iloc[0]))
 
         agg_handler = _AGG_OPS.get(func_name_lower)
         if agg_handler is None:
@@ -494,14 +548,19 @@ class AggregationExpressionEvaluator:
             if len(args) < 2:
                 return None
             pct_val = float(expression_evaluator.evaluate(args[1]).iloc[0])
+            percentile_op = _PERCENTILE_OPS[func_name_lower]
 
             def agg_fn(s: pd.Series, p: float = pct_val) -> float | None:
-                if func_name_lower == "percentilecont":
-                    return _agg_percentile_cont(s, p)
-                return _agg_percentile_disc(s, p)
+                return percentile_op(s, p)
 
             return pd.Series(grouped.agg(agg_fn).values)
 
+        if func_name_lower == "approxtopk" and len(args) > 1:
+            k_val = int(expression_evaluator.evaluate(args[1]).iloc[0])
+            return pd.Series(
+                grouped.agg(lambda s: _agg_approx_top_k(s, k_val)).values,
+            )
+
         agg_handler = _AGG_OPS.get(func_name_lower)
         if agg_handler is None:
             return None
@@ -9,17 +9,21 @@ Handles:
 - Recursive aggregation detection in expression trees
 - Three aggregation modes: no-agg, full-table, grouped
 - Dual-purpose min/max function disambiguation
-- Vectorised grouped aggregation with per-group fallback
+- Single-pass grouped aggregation over factorized group codes, with
+  per-group fallback
+- Weighted aggregation over a factorized MATCH result
+  (:class:`~pycypher.factorized.FactorizedFrame`) without flattening it
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
 from shared.logger import LOGGER
 
-from pycypher.aggregation_evaluator import KNOWN_AGGREGATIONS
+from pycypher.aggregation_evaluator import DEFAULT_TOP_K, KNOWN_AGGREGATIONS
 from pycypher.ast_models import (
     BinaryExpression,
     CountStar,
@@ -28,13 +32,25 @@ from pycypher.ast_models import (
     Not,
     NullCheck,
     Unary,
+    Variable,
 )
+from pycypher.cancellation import chunk_slices, operator_monitor
 from pycypher.constants import _normalize_func_args
+from pycypher.grouped_aggregation import (
+    MERGEABLE_AGGREGATIONS,
+    GroupCodes,
+    PartialAggregates,
+)
 from pycypher.scalar_functions import ScalarFunctionRegistry
 
 if TYPE_CHECKING:
     from pycypher.binding_frame import BindingFrame
     from pycypher.evaluator_protocol import ExpressionEvaluatorFactory
+    from pycypher.factorized import (
+        FactorizedAggregate,
+        FactorizedFrame,
+        FactorizedReturn,
+    )
 
 #: Dual-purpose functions that are scalar when called with a list literal,
 #: aggregation otherwise.
@@ -53,6 +69,105 @@ _KNOWN_GRAPH_FUNCTIONS: frozenset[str] = frozenset(
     },
 )
 
+#: Aggregates whose constant second argument is passed to the grouped
+#: kernel as an option.
+_OPTION_AGGREGATIONS: frozenset[str] = frozenset(
+    {"approxpercentile", "approxtopk"},
+)
+
+#: Group-key column used when delegating to the per-expression grouped
+#: evaluator with precomputed group codes.
+_GROUP_CODE_COLUMN = "__group_code__"
+
+#: Groups evaluated one by one between two progress reports.
+_GROUPS_PER_REPORT = 1024
+
+
+def _partial_aggregates(
+    context: Any,
+    group_df: pd.DataFrame,
+    aggregates: dict[str, tuple[Any, ...]],
+    groups: GroupCodes,
+) -> PartialAggregates:
+    """Aggregate *group_df* in row chunks and merge the partial states.
+
+    A single chunk reuses the precomputed *groups*; larger inputs are
+    aggregated chunk by chunk (see
+    :func:`~pycypher.cancellation.chunk_slices`) so the query can be
+    cancelled, and reports progress, between them.
+    """
+    partials = []
+    for rows in chunk_slices(context, "aggregate", len(group_df)):
+        if rows == slice(0, len(group_df)):
+            partials.append(
+                PartialAggregates.from_rows(
+                    group_df,
+                    aggregates,
+                    groups=groups,
+                ),
+            )
+            continue
+        partials.append(
+            PartialAggregates.from_rows(
+                group_df.iloc[rows],
+                {
+                    alias: (
+                        function,
+                        None if values is None else values.iloc[rows],
+                        *rest,
+                    )
+                    for alias, (function, values, *rest) in (
+                        aggregates.items()
+                    )
+                },
+            ),
+        )
+    first, *others = partials
+    return first.merge(*others) if others else first
+
+
+def _mergeable_aggregate(
+    expression: Any,
+) -> tuple[str, Any, Any] | None:
+    """Return ``(function, argument, option)`` for single-pass aggregates.
+
+    Matches ``count(*)`` and non-DISTINCT ``count``/``sum``/``avg``/``min``/
+    ``max``/``collect``/``approxCountDistinct`` over one argument (``None``
+    for ``count(*)``), plus ``approxPercentile(expr, p)`` and
+    ``approxTopK(expr[, k])`` whose second argument is returned as the
+    *option* expression.  Anything else returns ``None``.
+    """
+    if isinstance(expression, CountStar):
+        return ("count", None, None)
+    if not isinstance(expression, FunctionInvocation) or not isinstance(
+        expression.function_name,
+        str,
+    ):
+        return None
+    func_name_lower = expression.function_name.lower()
+    if func_name_lower not in MERGEABLE_AGGREGATIONS:
+        return None
+    arguments = expression.arguments or {}
+    if isinstance(arguments, dict) and arguments.get("distinct", False):
+        return None
+    args = _normalize_func_args(arguments)
+    option_expr = None
+    if func_name_lower in _OPTION_AGGREGATIONS and len(args) == 2:
+        args, option_expr = args[:1], args[1]
+    if len(args) > 1:
+        return None
+    if args:
+        arg_expr = args[0]
+    elif isinstance(arguments, dict):
+        arg_expr = arguments.get("expression")
+    else:
+        arg_expr = None
+    if arg_expr is None:
+        return ("count", None, None) if func_name_lower == "count" else None
+    if func_name_lower == "approxpercentile" and option_expr is None:
+        return None
+    return (func_name_lower, arg_expr, option_expr)
+
 
 class AggregationPlanner:
     """Detects aggregations in expressions and evaluates projection items.
@@ -291,16 +406,18 @@ class AggregationPlanner:
             )
 
         # Grouped aggregation (vectorised path)
-        # Evaluate GROUP BY key expressions once over the full frame.
         group_key_aliases = [item.alias for item in non_agg_items]
-        group_df = pd.DataFrame(
-            {
-                item.alias: evaluator.evaluate(item.expression).reset_index(
-                    drop=True,
-                )
-                for item in non_agg_items
-            },
-        )
+        group_df, groups = self._group_codes(non_agg_items, frame, evaluator)
+        if groups is not None:
+            return self._aggregate_by_codes(
+                agg_items,
+                frame,
+                evaluator,
+                group_df,
+                groups,
+            )
+
+        # Unhashable group keys (lists, maps): group with pandas directly.
         groupby_key = (
             group_key_aliases[0]
             if len(group_key_aliases) == 1
@@ -343,7 +460,14 @@ class AggregationPlanner:
             for item in fallback_items:
                 unique_groups[item.alias] = None  # initialise column
 
+            monitor = operator_monitor(
+                frame.context,
+                "aggregate_groups",
+                total=len(unique_groups),
+                unit="groups",
+            )
             for group_vals, group_idx in _groupby_obj.groups.items():
+                monitor.check()
                 mask = pd.Series(False, index=range(len(frame)))
                 mask.iloc[list(group_idx)] = True
                 group_frame = frame.filter(mask)
@@ -368,6 +492,304 @@ class AggregationPlanner:
                     unique_groups.loc[row_idx, item.alias] = (
                         group_evaluator.evaluate_aggregation(item.expression)
                     )
+            monitor.advance(len(unique_groups))
+            monitor.close()
 
         all_aliases = group_key_aliases + [item.alias for item in agg_items]
         return unique_groups[all_aliases]
+
+    @staticmethod
+    def _aggregate_option(
+        func_name: str,
+        option_expr: Any,
+        evaluator: Any,
+    ) -> Any:
+        """Evaluate the constant second argument of an option aggregate.
+
+        With zero rows there is no row to read it from, but no group to
+        aggregate either, so a placeholder is returned.
+        """
+        if func_name == "approxtopk":
+            if option_expr is None:
+                return DEFAULT_TOP_K
+            values = evaluator.evaluate(option_expr)
+            return int(values.iloc[0]) if len(values) else DEFAULT_TOP_K
+        if func_name == "approxpercentile":
+            values = evaluator.evaluate(option_expr)
+            return float(values.iloc[0]) if len(values) else 0.5
+        return None
+
+    def _group_codes(
+        self,
+        key_items: list[Any],
+        frame: BindingFrame,
+        evaluator: Any,
+    ) -> tuple[pd.DataFrame, GroupCodes | None]:
+        """Evaluate the group keys over *frame* and factorize them.
+
+        Both are cached on *frame*, so a later aggregation over the same
+        frame and keys reuses the codes instead of re-hashing the keys.
+        The cache is cleared when the frame's properties are written.
+
+        Args:
+            key_items: The non-aggregating projection items.
+            frame: Input :class:`~pycypher.binding_frame.BindingFrame`.
+            evaluator: Expression evaluator over *frame*.
+
+        Returns:
+            ``(group_df, groups)``: one key column per item, and its group
+            codes or ``None`` when a key is unhashable.
+
+        """
+        keys = [(item.alias, item.expression) for item in key_items]
+        for cached_keys, group_df, groups in frame._group_codes_cache:
+            if cached_keys == keys:
+                return group_df, groups
+        group_df = pd.DataFrame(
+            {
+                item.alias: evaluator.evaluate(item.expression).reset_index(
+                    drop=True,
+                )
+                for item in key_items
+            },
+        )
+        groups = GroupCodes.from_frame(group_df)
+        frame._group_codes_cache.append((keys, group_df, groups))
+        return group_df, groups
+
+    def _aggregate_by_codes(
+        self,
+        agg_items: list[Any],
+        frame: BindingFrame,
+        evaluator: Any,
+        group_df: pd.DataFrame,
+        groups: GroupCodes,
+    ) -> pd.DataFrame:
+        """Compute every aggregate of a grouped projection in one pass.
+
+        The group keys are factorized once (*groups*).  ``count``, ``sum``,
+        ``avg``, ``min``, ``max``, ``collect`` and the sketch-based
+        ``approx*`` aggregates are computed together by
+        :class:`~pycypher.grouped_aggregation.PartialAggregates`, with each
+        distinct argument expression evaluated once.  Other aggregates
+        (DISTINCT, percentiles, standard deviations) are grouped by the
+        precomputed codes rather than re-hashing the keys, and expressions
+        that wrap aggregations fall back to per-group evaluation.
+
+        Args:
+            agg_items: Projection items containing aggregations.
+            frame: Input :class:`~pycypher.binding_frame.BindingFrame`.
+            evaluator: Expression evaluator over *frame*.
+            group_df: Evaluated group-key columns, one row per frame row.
+            groups: Group codes for *group_df*.
+
+        Returns:
+            One row per group: key columns, then one column per item.
+
+        """
+        evaluated: list[tuple[Any, pd.Series]] = []
+
+        def _argument_values(arg_expr: Any) -> pd.Series:
+            for seen_expr, values in evaluated:
+                if seen_expr == arg_expr:
+                    return values
+            values = evaluator.evaluate(arg_expr).reset_index(drop=True)
+            evaluated.append((arg_expr, values))
+            return values
+
+        aggregates: dict[str, tuple[str, pd.Series | None]] = {}
+        agg_series_map: dict[str, pd.Series] = {}
+        fallback_items: list[Any] = []
+        code_df = pd.DataFrame({_GROUP_CODE_COLUMN: groups.codes})
+        for item in agg_items:
+            spec = _mergeable_aggregate(item.expression)
+            if spec is not None:
+                func_name, arg_expr, option_expr = spec
+                aggregates[item.alias] = (
+                    func_name,
+                    None if arg_expr is None else _argument_values(arg_expr),
+                    self._aggregate_option(func_name, option_expr, evaluator),
+                )
+                continue
+            series = evaluator.evaluate_aggregation_grouped(
+                item.expression,
+                code_df,
+                [_GROUP_CODE_COLUMN],
+            )
+            if series is not None:
+                agg_series_map[item.alias] = series
+            else:
+                fallback_items.append(item)
+
+        result = _partial_aggregates(
+            frame.context,
+            group_df,
+            aggregates,
+            groups,
+        ).finalize()
+        # Key columns get the dtypes a groupby index would infer.
+        key_aliases = list(group_df.columns)
+        result[key_aliases] = result[key_aliases].infer_objects()
+        for alias, series in agg_series_map.items():
+            result[alias] = series.values
+
+        if fallback_items:
+            fallback_values: dict[str, list[Any]] = {
+                item.alias: [] for item in fallback_items
+            }
+            monitor = operator_monitor(
+                frame.context,
+                "aggregate_groups",
+                total=groups.n_groups,
+                unit="groups",
+            )
+            for done, positions in enumerate(groups.group_rows(), 1):
+                monitor.check()
+                mask = np.zeros(len(frame), dtype=bool)
+                mask[positions] = True
+                group_evaluator = self._evaluator_factory(
+                    frame.filter(pd.Series(mask)),
+                )
+                for item in fallback_items:
+                    fallback_values[item.alias].append(
+                        group_evaluator.evaluate_aggregation(item.expression),
+                    )
+                if done % _GROUPS_PER_REPORT == 0:
+                    monitor.advance(_GROUPS_PER_REPORT)
+            monitor.advance(groups.n_groups - monitor.processed)
+            monitor.close()
+            for alias, values in fallback_values.items():
+                result[alias] = pd.Series(values, dtype=object)
+
+        return result[key_aliases + [item.alias for item in agg_items]]
+
+    def aggregate_factorized(
+        self,
+        plan: FactorizedReturn,
+        frame: FactorizedFrame,
+    ) -> pd.DataFrame | None:
+        """Evaluate a factorized RETURN plan without flattening *frame*.
+
+        Grouping keys are evaluated once per ID of the plan's group
+        variable; ``count(*)`` is the flat row count per ID and every other
+        aggregate is computed over ``(group ID, argument ID)`` pairs
+        weighted by their flat row counts (see
+        :meth:`~pycypher.factorized.FactorizedFrame.pair_weights`).
+
+        Args:
+            plan: The RETURN items, from
+                :func:`~pycypher.factorized.plan_factorized_return`.
+            frame: The factorized MATCH result.
+
+        Returns:
+            One row per group: key columns, then one column per aggregate —
+            the layout of :meth:`aggregate_items` — or ``None`` when the
+            result is empty or a value cannot be aggregated this way, and
+            the caller should flatten *frame* instead.
+
+        """
+        root = plan.group_var or next(
+            (a.variable for a in plan.aggregates if a.variable is not None),
+            frame.graph.node_vars[0],
+        )
+        weights = frame.weights(root)
+        if weights.empty:
+            return None
+        root_ids = pd.Index(weights.index)
+        if plan.keys:
+            root_frame = frame.node_frame(root, root_ids.to_numpy())
+            key_df = self._simple_projection(
+                plan.keys,
+                root_frame,
+                self._evaluator_factory(root_frame),
+            )
+        else:
+            key_df = pd.DataFrame(index=range(len(root_ids)))
+        groups = GroupCodes.from_frame(key_df)
+        if groups is None:
+            return None
+        result = groups.key_frame(key_df)
+        if plan.aggregates:
+            # Key columns get the dtypes a groupby index would infer.
+            result = result.infer_objects()
+        for aggregate in plan.aggregates:
+            # count(n) of a matched node never sees a null: it is count(*).
+            if aggregate.argument is None or (
+                aggregate.function == "count"
+                and not aggregate.distinct
+                and isinstance(aggregate.argument, Variable)
+            ):
+                column = pd.Series(weights.to_numpy()).groupby(
+                    groups.codes,
+                ).sum()
+            else:
+                column = self._weighted_aggregate(
+                    aggregate,
+                    frame,
+                    root,
+                    root_ids,
+                    groups,
+                )
+                if column is None:
+                    return None
+            fill = 0 if aggregate.function == "count" else np.nan
+            result[aggregate.alias] = column.reindex(
+                range(groups.n_groups),
+                fill_value=fill,
+            ).to_numpy()
+        # A full-table aggregation is one row of inferred scalars.
+        return result if plan.keys else result.infer_objects()
+
+    def _weighted_aggregate(
+        self,
+        aggregate: FactorizedAggregate,
+        frame: FactorizedFrame,
+        root: str,
+        root_ids: pd.Index,
+        groups: GroupCodes,
+    ) -> pd.Series | None:
+        """Aggregate one argument over weighted ``(root, variable)`` pairs.
+
+        Returns a Series indexed by group code, or ``None`` when the
+        argument values cannot be aggregated from weights.
+        """
+        assert aggregate.variable is not None
+        pair_roots, pair_ids, pair_weights = frame.pair_weights(
+            root,
+            aggregate.variable,
+        )
+        codes = groups.codes[root_ids.get_indexer(pair_roots)]
+        id_codes, unique_ids = pd.factorize(pair_ids)
+        var_frame = frame.node_frame(aggregate.variable, unique_ids)
+        values = (
+            self._evaluator_factory(var_frame)
+            .evaluate(aggregate.argument)
+            .reset_index(drop=True)
+            .iloc[id_codes]
+            .reset_index(drop=True)
+        )
+        valid = values.notna().to_numpy()
+        if aggregate.distinct:
+            try:
+                distinct = pd.DataFrame(
+                    {"code": codes[valid], "value": values[valid].to_numpy()},
+                ).drop_duplicates()
+            except TypeError:
+                return None
+            return distinct.groupby("code").size()
+        counts = pd.Series(pair_weights * valid).groupby(codes).sum()
+        if aggregate.function == "count":
+            return counts
+        if aggregate.function in _DUAL_PURPOSE:
+            return values[valid].groupby(codes[valid]).agg(aggregate.function)
+        numeric = values.infer_objects()
+        if numeric.dtype.kind not in "iuf":
+            return None
+        sums = (numeric[valid] * pair_weights[valid]).groupby(
+            codes[valid],
+        ).sum()
+        if aggregate.function == "avg":
+            sums = sums.reindex(counts.index) / counts.where(counts > 0)
+        # Boxed property values aggregate to boxed results, as in
+        # :meth:`_aggregate_by_codes`.
+        return sums.astype(object) if values.dtype == object else sums
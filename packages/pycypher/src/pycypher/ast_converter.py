@@ -32,6 +32,7 @@ from pycypher.ast_models import (
     Clause,
     Comparison,
     CountStar,
+    CountSubquery,
     Create,
     Delete,
     Exists,
@@ -1475,6 +1476,15 @@ class ASTConverter:
             ),
         )
 
+    def _convert_CountSubquery(self, node: dict) -> CountSubquery:
+        """Convert CountSubquery node."""
+        return CountSubquery(
+            content=cast(
+                "Pattern | Query | None",
+                self.convert(node.get("content")),
+            ),
+        )
+
     def _convert_ExistsSubquery(self, node: dict) -> Query:
         """Convert ExistsSubquery node — full EXISTS { MATCH ... RETURN ... } form."""
         clauses = [self.convert(c) for c in node.get("clauses", [])]
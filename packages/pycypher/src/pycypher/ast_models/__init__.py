@@ -104,6 +104,7 @@ from pycypher.ast_models.expressions import (
     CaseExpression,
     Comparison,
     CountStar,
+    CountSubquery,
     Exists,
     Expression,
     FloatLiteral,
@@ -123,6 +124,7 @@ from pycypher.ast_models.expressions import (
     Or,
     Parameter,
     PatternComprehension,
+    PatternDegree,
     PropertyLookup,
     Quantifier,
     Reduce,
@@ -271,6 +273,7 @@ __all__ = [
     "CaseExpression",
     "Comparison",
     "CountStar",
+    "CountSubquery",
     "Exists",
     "Expression",
     "FloatLiteral",
@@ -290,6 +293,7 @@ __all__ = [
     "Or",
     "Parameter",
     "PatternComprehension",
+    "PatternDegree",
     "PropertyLookup",
     "Quantifier",
     "Reduce",
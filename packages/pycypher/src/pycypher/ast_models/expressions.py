@@ -320,6 +320,40 @@ class Exists(Expression):
     content: Pattern | Query | None = None
 
 
+class CountSubquery(Expression):
+    """COUNT subquery -- the number of rows a pattern or subquery produces.
+
+    ``COUNT { (a)-[:R]->(b) }`` counts, per row, the matches of *content* (a
+    :class:`Pattern` or :class:`Query`) anchored on the row's bound
+    variables.  Evaluated using batch semantics in the binding evaluator.
+    """
+
+    content: Pattern | Query | None = None
+
+
+class PatternDegree(Expression):
+    """Number of single-hop matches of a degree-only pattern.
+
+    Rewritten from ``size((n)-[:R]->())``, ``size([(n)-[:R]->() | ...])``
+    and ``COUNT { (n)-[:R]->() }`` by
+    :func:`~pycypher.pattern_degree.rewrite_degree_patterns` and evaluated
+    as a lookup in precomputed degree arrays instead of by matching.
+
+    Attributes:
+        variable: The bound node whose degree is taken.
+        rel_types: Relationship types counted; empty means every type.
+        direction: ``"outgoing"``, ``"incoming"`` or ``"both"``, seen from
+            *variable*.
+        neighbor_label: Label the other endpoint must carry, if any.
+
+    """
+
+    variable: Variable
+    rel_types: list[str] = Field(default_factory=list)
+    direction: str = "outgoing"
+    neighbor_label: str | None = None
+
+
 class ListComprehension(Expression):
     """List comprehension expression: [x IN list WHERE pred | expr].
 
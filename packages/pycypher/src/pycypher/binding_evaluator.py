@@ -16,8 +16,10 @@ Design
    WITH and RETURN clause grouping.  Supported aggregation functions:
    ``collect``, ``count``, ``sum``, ``avg``, ``min``, ``max``,
    ``stdev`` (sample, ddof=1), ``stdevp`` (population, ddof=0),
-   ``percentileCont(expr, p)`` (linear interpolation), and
-   ``percentileDisc(expr, p)`` (lower/discrete interpolation).
+   ``percentileCont(expr, p)`` (linear interpolation),
+   ``percentileDisc(expr, p)`` (lower/discrete interpolation), and the
+   sketch-based ``approxCountDistinct``, ``approxPercentile(expr, p)`` and
+   ``approxTopK(expr[, k])``.
 5. **Null-safe boolean logic** — AND, OR, NOT, XOR are delegated to
    ``BooleanExpressionEvaluator`` which uses Kleene three-valued logic.
 6. **Modular architecture** — arithmetic operations are delegated to
@@ -51,6 +53,7 @@ from pycypher.ast_models import (
     BooleanLiteral,
     CaseExpression,
     Comparison,
+    CountSubquery,
     Exists,
     FloatLiteral,
     FunctionInvocation,
@@ -67,6 +70,7 @@ from pycypher.ast_models import (
     Or,
     Parameter,
     PatternComprehension,
+    PatternDegree,
     PropertyLookup,
     Quantifier,
     Reduce,
@@ -659,6 +663,12 @@ class BindingExpressionEvaluator:
             case Exists(content=exists_content):
                 return self._eval_exists(exists_content)
 
+            case CountSubquery(content=count_content):
+                return self._eval_count_subquery(count_content)
+
+            case PatternDegree() as degree:
+                return self.exists_evaluator.evaluate_degree(degree)
+
             case _:
                 msg = (
                     f"Expression type '{type(expression).__name__}' is not yet "
@@ -1203,6 +1213,13 @@ class BindingExpressionEvaluator:
         """
         return self.exists_evaluator.evaluate_exists(content, self)
 
+    def _eval_count_subquery(self, content: Any) -> FrameSeries:
+        """Evaluate a ``COUNT { pattern }`` subquery.
+
+        Delegates to :class:`~pycypher.exists_evaluator.ExistsEvaluator`.
+        """
+        return self.exists_evaluator.evaluate_count(content, self)
+
     def _eval_pattern_comprehension(
         self,
         pc: PatternComprehension,
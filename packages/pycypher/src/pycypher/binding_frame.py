@@ -40,6 +40,7 @@ import pandas as pd
 from shared.helpers import suggest_close_match
 from shared.logger import LOGGER
 
+from pycypher.cancellation import run_chunked
 from pycypher.config import (
     CROSS_JOIN_WARN_THRESHOLDS as CROSS_JOIN_WARN_THRESHOLDS,
 )
@@ -48,6 +49,7 @@ from pycypher.constants import (
     ID_COLUMN,
 )
 from pycypher.cypher_types import FrameDataFrame, FrameSeries
+from pycypher.dataframe_utils import indexed_source_frame
 
 # ---------------------------------------------------------------------------
 # Performance: module-level debug check avoids per-call overhead
@@ -294,6 +296,14 @@ class BindingFrame:
         repr=False,
         compare=False,
     )
+    #: Evaluated group keys and their factorized group codes, as
+    #: ``(key items, key frame, GroupCodes | None)``; see
+    #: :meth:`~pycypher.aggregation_planner.AggregationPlanner.aggregate_items`.
+    _group_codes_cache: list[tuple[Any, pd.DataFrame, Any]] = field(
+        default_factory=list,
+        repr=False,
+        compare=False,
+    )
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -383,13 +393,18 @@ class BindingFrame:
             pass
         return id_values
 
-    def _get_indexed_dataframe(self, entity_type: str) -> pd.DataFrame | None:
+    def _get_indexed_dataframe(
+        self,
+        entity_type: str,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame | None:
         """Resolve an ID-indexed DataFrame for *entity_type*.
 
         Shadow entries (from uncommitted CREATE/SET) take precedence over
         canonical data.  Canonical reads are cached on the Context so that
-        Arrow-to-pandas conversion happens at most once per entity/relationship
-        type per query epoch.
+        Arrow-to-pandas conversion happens at most once per column of each
+        entity/relationship type per query epoch; only *columns* (all when
+        ``None``) are guaranteed to be converted.
 
         Cache key convention:
           entity_mapping entries  ->  entity_type          (e.g. ``"Person"``)
@@ -410,20 +425,19 @@ class BindingFrame:
         if entity_type in shadow_rels:
             return shadow_rels[entity_type].set_index(ID_COLUMN)
         if entity_type in self.context.entity_mapping.mapping:
-            if entity_type not in cache:
-                raw_df = _source_to_pandas(
-                    self.context.entity_mapping[entity_type].source_obj,
-                )
-                cache[entity_type] = raw_df.set_index(ID_COLUMN)
-            return cache[entity_type]
+            return indexed_source_frame(
+                cache,
+                entity_type,
+                self.context.entity_mapping[entity_type].source_obj,
+                columns,
+            )
         if entity_type in self.context.relationship_mapping.mapping:
-            cache_key = f"__rel__{entity_type}"
-            if cache_key not in cache:
-                raw_df = _source_to_pandas(
-                    self.context.relationship_mapping[entity_type].source_obj,
-                )
-                cache[cache_key] = raw_df.set_index(ID_COLUMN)
-            return cache[cache_key]
+            return indexed_source_frame(
+                cache,
+                f"__rel__{entity_type}",
+                self.context.relationship_mapping[entity_type].source_obj,
+                columns,
+            )
         return None
 
     def get_property(self, var_name: str, prop_name: str) -> FrameSeries:
@@ -548,7 +562,10 @@ class BindingFrame:
 
         if not _used_vectorized:
             # --- Standard path (hash-based map) ---
-            indexed_df = self._get_indexed_dataframe(entity_type)
+            indexed_df = self._get_indexed_dataframe(
+                entity_type,
+                [prop_name],
+            )
             if indexed_df is None:
                 return _null_series(
                     len(self.bindings), index=self.bindings.index
@@ -695,7 +712,7 @@ class BindingFrame:
                 )
 
         # --- Standard path (reindex-based, with backend delegation) ---
-        indexed_df = self._get_indexed_dataframe(entity_type)
+        indexed_df = self._get_indexed_dataframe(entity_type, prop_names)
         if indexed_df is None:
             null_results = {
                 p: _null_series(len(self.bindings), index=self.bindings.index)
@@ -790,10 +807,12 @@ class BindingFrame:
         cache: dict = getattr(ctx, "_property_lookup_cache", {})
         id_etype: dict = {}
         for etype, table in ctx.entity_mapping.mapping.items():
-            if etype not in cache:
-                raw_df: pd.DataFrame = _source_to_pandas(table.source_obj)
-                cache[etype] = raw_df.set_index(ID_COLUMN)
-            ids = cache[etype].index
+            ids = indexed_source_frame(
+                cache,
+                etype,
+                table.source_obj,
+                columns=(),
+            ).index
             for eid in ids:
                 id_etype[eid] = etype
         ctx._id_etype_map = id_etype  # noqa: SLF001
@@ -857,10 +876,12 @@ class BindingFrame:
                 id_arr = subset[ID_COLUMN].to_numpy(dtype=object)
                 val_arr = subset[prop_name].to_numpy(dtype=object)
             else:
-                if etype not in cache:
-                    raw_df: pd.DataFrame = _source_to_pandas(table.source_obj)
-                    cache[etype] = raw_df.set_index(ID_COLUMN)
-                idx_df = cache[etype]
+                idx_df = indexed_source_frame(
+                    cache,
+                    etype,
+                    table.source_obj,
+                    columns=[prop_name],
+                )
                 if prop_name not in idx_df.columns:
                     continue
                 # Use .reindex() to look up only the IDs we need — O(k) not O(N).
@@ -916,12 +937,12 @@ class BindingFrame:
                 # Use .isin() for O(k) check rather than materialising full set.
                 hit_count = shadow_df[ID_COLUMN].isin(var_ids).sum()
             else:
-                if etype not in cache:
-                    raw_df: pd.DataFrame = _source_to_pandas(
-                        entity_table.source_obj,
-                    )
-                    cache[etype] = raw_df.set_index(ID_COLUMN)
-                idx_df = cache[etype]
+                idx_df = indexed_source_frame(
+                    cache,
+                    etype,
+                    entity_table.source_obj,
+                    columns=(),
+                )
                 hit_count = idx_df.index.isin(var_ids).sum()
             if hit_count >= n_needed:
                 return etype
@@ -1126,15 +1147,25 @@ class BindingFrame:
         if _plan.strategy == JoinStrategy.BROADCAST and _right_len > _left_len:
             # Swap so smaller side is the build table for the hash join.
             if backend is not None:
-                merged = _backend_merge(
-                    backend,
+
+                def _probe(part: pd.DataFrame) -> pd.DataFrame:
+                    return _backend_merge(
+                        backend,
+                        part,
+                        self.bindings,
+                        left_col=right_col,
+                        right_col=left_col,
+                        how="inner",
+                        strategy=_plan.strategy.value,
+                        suffixes=("_right", ""),
+                    )
+
+                merged = run_chunked(
+                    self.context,
+                    "join",
                     other.bindings,
-                    self.bindings,
-                    left_col=right_col,
-                    right_col=left_col,
-                    how="inner",
-                    strategy=_plan.strategy.value,
-                    suffixes=("_right", ""),
+                    _probe,
+                    build_rows=_left_len,
                 )
                 # _backend_merge normalises both join keys to the same name
                 # (right_col after the swap).  Restore the original left_col
@@ -1146,31 +1177,49 @@ class BindingFrame:
                 ):
                     merged = merged.rename(columns={right_col: left_col})
             else:
-                merged = other.bindings.merge(
-                    self.bindings,
-                    left_on=right_col,
-                    right_on=left_col,
-                    how="inner",
-                    suffixes=("_right", ""),
+                merged = run_chunked(
+                    self.context,
+                    "join",
+                    other.bindings,
+                    lambda part: part.merge(
+                        self.bindings,
+                        left_on=right_col,
+                        right_on=left_col,
+                        how="inner",
+                        suffixes=("_right", ""),
+                    ),
+                    build_rows=_left_len,
                 )
         else:
             if backend is not None:
-                merged = _backend_merge(
-                    backend,
+                merged = run_chunked(
+                    self.context,
+                    "join",
                     self.bindings,
-                    other.bindings,
-                    left_col=left_col,
-                    right_col=right_col,
-                    how="inner",
-                    strategy=_plan.strategy.value,
+                    lambda part: _backend_merge(
+                        backend,
+                        part,
+                        other.bindings,
+                        left_col=left_col,
+                        right_col=right_col,
+                        how="inner",
+                        strategy=_plan.strategy.value,
+                    ),
+                    build_rows=_right_len,
                 )
             else:
-                merged = self.bindings.merge(
-                    other.bindings,
-                    left_on=left_col,
-                    right_on=right_col,
-                    how="inner",
-                    suffixes=("", "_right"),
+                merged = run_chunked(
+                    self.context,
+                    "join",
+                    self.bindings,
+                    lambda part: part.merge(
+                        other.bindings,
+                        left_on=left_col,
+                        right_on=right_col,
+                        how="inner",
+                        suffixes=("", "_right"),
+                    ),
+                    build_rows=_right_len,
                 )
 
         merged = BindingFrame._cleanup_merged(merged, left_col, right_col)
@@ -1244,22 +1293,35 @@ class BindingFrame:
 
         backend = self._backend
         if backend is not None:
-            merged: pd.DataFrame = _backend_merge(
-                backend,
-                self.bindings,
-                other.bindings,
-                left_col=left_col,
-                right_col=right_col,
-                how="left",
-            )
+
+            def _probe(part: pd.DataFrame) -> pd.DataFrame:
+                return _backend_merge(
+                    backend,
+                    part,
+                    other.bindings,
+                    left_col=left_col,
+                    right_col=right_col,
+                    how="left",
+                )
+
         else:
-            merged: pd.DataFrame = self.bindings.merge(
-                other.bindings,
-                left_on=left_col,
-                right_on=right_col,
-                how="left",
-                suffixes=("", "_right"),
-            )
+
+            def _probe(part: pd.DataFrame) -> pd.DataFrame:
+                return part.merge(
+                    other.bindings,
+                    left_on=left_col,
+                    right_on=right_col,
+                    how="left",
+                    suffixes=("", "_right"),
+                )
+
+        merged: pd.DataFrame = run_chunked(
+            self.context,
+            "left_join",
+            self.bindings,
+            _probe,
+            build_rows=len(other.bindings),
+        )
 
         merged = BindingFrame._cleanup_merged(merged, left_col, right_col)
         if not self.type_registry:
@@ -1359,18 +1421,26 @@ class BindingFrame:
             if collisions:
                 rename_map = {c: f"{c}_right" for c in collisions}
                 right_df = backend.rename(right_df, rename_map)
-            merged: pd.DataFrame = backend.join(
-                self.bindings,
-                right_df,
-                on=[],
-                how="cross",
-            )
+
+            def _probe(part: pd.DataFrame) -> pd.DataFrame:
+                return backend.join(part, right_df, on=[], how="cross")
+
         else:
-            merged: pd.DataFrame = self.bindings.merge(
-                other.bindings,
-                how="cross",
-                suffixes=("", "_right"),
-            )
+
+            def _probe(part: pd.DataFrame) -> pd.DataFrame:
+                return part.merge(
+                    other.bindings,
+                    how="cross",
+                    suffixes=("", "_right"),
+                )
+
+        merged: pd.DataFrame = run_chunked(
+            self.context,
+            "cross_join",
+            self.bindings,
+            _probe,
+            fanout=_right_rows,
+        )
         merged = BindingFrame._cleanup_merged(merged)
         if not self.type_registry:
             merged_registry = other.type_registry
@@ -0,0 +1,369 @@
+"""Cooperative cancellation and progress reporting for query operators.
+
+A query can only be stopped where it checks.  :meth:`Context.check_timeout
+<pycypher.relational_models.Context.check_timeout>` runs between clauses,
+but a single pandas merge or BFS hop over millions of rows used to run to
+completion before the next check, overrunning its timeout by as long as
+the operator took.  Operators that can run long in one call — joins,
+variable-length expansion, grouped aggregation — now split large inputs
+into chunks of :data:`~pycypher.config.OPERATOR_CHUNK_ROWS` rows and check
+between chunks.
+
+* :class:`CancellationToken` — set from any thread (a UI, a server
+  handler, a watchdog); the query raises
+  :class:`~pycypher.exceptions.QueryCancelledError` at its next check.
+* :class:`OperatorProgress` — rows (or hops, clauses, groups) an operator
+  has processed out of its estimated total.
+* :class:`ProgressReporter` — one per query; passes each snapshot to the
+  registered callbacks and keeps per-operator totals for
+  :class:`~pycypher.query_profiler.QueryProfiler`.
+* :class:`OperatorMonitor` — what an operator holds while it runs;
+  :func:`run_chunked` drives one over the chunks of a frame.
+
+Both the token and the reporter live on the per-query
+:class:`~pycypher.execution_scope.ExecutionScope`, so concurrent queries on
+one ``Star`` never see each other's cancellation or progress.
+
+Usage::
+
+    token = CancellationToken()
+    star.execute_query(query, cancel_token=token, on_progress=print)
+    token.cancel("user pressed stop")      # from another thread
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+__all__ = [
+    "CancellationToken",
+    "OperatorMonitor",
+    "OperatorProgress",
+    "ProgressCallback",
+    "ProgressReporter",
+    "chunk_slices",
+    "operator_monitor",
+    "run_chunked",
+]
+
+
+#: Most times :func:`run_chunked` lets a join re-read its build side.
+MAX_BUILD_PASSES: int = 8
+
+
+class CancellationToken:
+    """Thread-safe flag asking a running query to stop.
+
+    A token may be shared by several queries (e.g. every query of one
+    pipeline run); once cancelled it stays cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._reason = ""
+
+    def cancel(self, reason: str = "") -> None:
+        """Request cancellation; the first *reason* given is kept."""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Return ``True`` once :meth:`cancel` has been called."""
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str:
+        """Return the reason passed to :meth:`cancel`."""
+        return self._reason
+
+    def raise_if_cancelled(self, query_fragment: str = "") -> None:
+        """Raise :class:`~pycypher.exceptions.QueryCancelledError` if set.
+
+        Args:
+            query_fragment: Optional truncated query text for the message.
+
+        """
+        if self._event.is_set():
+            from pycypher.exceptions import QueryCancelledError
+
+            raise QueryCancelledError(self._reason, query_fragment)
+
+
+@dataclass(frozen=True)
+class OperatorProgress:
+    """Progress of one operator.
+
+    Attributes:
+        operator: Operator name, e.g. ``"join"``, ``"expand"``,
+            ``"aggregate"`` or ``"clauses"``.
+        processed: Units processed so far.
+        total: Estimated total units, or ``None`` when unknown.
+        unit: What is counted — ``"rows"``, ``"hops"``, ``"groups"`` or
+            ``"clauses"``.
+        elapsed_seconds: Wall-clock seconds the operator has run.
+
+    """
+
+    operator: str
+    processed: int
+    total: int | None = None
+    unit: str = "rows"
+    elapsed_seconds: float = 0.0
+
+    @property
+    def fraction(self) -> float | None:
+        """Return ``processed / total`` capped at 1, or ``None`` if unknown."""
+        if not self.total:
+            return None
+        return min(self.processed / self.total, 1.0)
+
+
+#: Receives an :class:`OperatorProgress` snapshot, on the query's thread.
+ProgressCallback = Callable[[OperatorProgress], None]
+
+
+class ProgressReporter:
+    """Per-query sink for operator progress.
+
+    Args:
+        callbacks: Called with every snapshot, in order.  A callback may
+            cancel the query's token; the operator stops at its next check.
+
+    """
+
+    def __init__(
+        self,
+        callbacks: Iterable[ProgressCallback] = (),
+    ) -> None:
+        self._callbacks = list(callbacks)
+        self._totals: dict[str, OperatorProgress] = {}
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: ProgressCallback) -> None:
+        """Register another progress callback."""
+        self._callbacks.append(callback)
+
+    def report(self, progress: OperatorProgress) -> None:
+        """Pass *progress* to every callback."""
+        for callback in self._callbacks:
+            callback(progress)
+
+    def finish(self, progress: OperatorProgress) -> None:
+        """Fold the final snapshot of one operator run into the totals."""
+        with self._lock:
+            prior = self._totals.get(progress.operator)
+            if prior is not None:
+                progress = replace(
+                    progress,
+                    processed=prior.processed + progress.processed,
+                    total=(
+                        None
+                        if prior.total is None or progress.total is None
+                        else prior.total + progress.total
+                    ),
+                    elapsed_seconds=(
+                        prior.elapsed_seconds + progress.elapsed_seconds
+                    ),
+                )
+            self._totals[progress.operator] = progress
+
+    @property
+    def totals(self) -> dict[str, OperatorProgress]:
+        """Return the summed progress of every finished operator run."""
+        with self._lock:
+            return dict(self._totals)
+
+
+class OperatorMonitor:
+    """Cancellation checks and progress for one run of an operator.
+
+    Obtain one from :func:`operator_monitor` and use it as a context
+    manager, or call :meth:`close` when the operator is done; the final
+    snapshot is then added to the reporter's totals.  A run that raises
+    is not added.
+
+    Args:
+        check: Raises when the query must stop (``Context.check_timeout``).
+        reporter: Where progress goes, or ``None`` to only check.
+        operator: Operator name.
+        total: Estimated total units.
+        unit: What is counted.
+
+    """
+
+    def __init__(
+        self,
+        check: Callable[[], None],
+        reporter: ProgressReporter | None,
+        operator: str,
+        *,
+        total: int | None = None,
+        unit: str = "rows",
+    ) -> None:
+        self._check = check
+        self._reporter = reporter
+        self._operator = operator
+        self._total = total
+        self._unit = unit
+        self._t0 = time.perf_counter()
+        #: Units processed so far.
+        self.processed = 0
+
+    def __enter__(self) -> OperatorMonitor:
+        """Return *self*."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Record the run in the reporter's totals unless it failed."""
+        if exc_type is None:
+            self.close()
+
+    def close(self) -> None:
+        """Record the run in the reporter's totals."""
+        if self._reporter is not None:
+            self._reporter.finish(self.snapshot())
+
+    def check(self) -> None:
+        """Raise if the query was cancelled or ran past its deadline."""
+        self._check()
+
+    def advance(self, units: int) -> None:
+        """Record *units* more processed units and report progress."""
+        self.processed += units
+        if self._reporter is not None:
+            self._reporter.report(self.snapshot())
+
+    def snapshot(self) -> OperatorProgress:
+        """Return the current progress."""
+        return OperatorProgress(
+            operator=self._operator,
+            processed=self.processed,
+            total=self._total,
+            unit=self._unit,
+            elapsed_seconds=time.perf_counter() - self._t0,
+        )
+
+
+def _no_check() -> None:
+    return None
+
+
+def operator_monitor(
+    context: Any,
+    operator: str,
+    *,
+    total: int | None = None,
+    unit: str = "rows",
+) -> OperatorMonitor:
+    """Return a monitor for *operator* bound to *context*'s query.
+
+    *context* may be anything with the ``Context`` interface; objects
+    without ``check_timeout`` (test doubles) get a monitor that never
+    raises and reports nowhere.
+    """
+    return OperatorMonitor(
+        getattr(context, "check_timeout", _no_check),
+        getattr(context, "progress_reporter", None),
+        operator,
+        total=total,
+        unit=unit,
+    )
+
+
+def chunk_slices(
+    context: Any,
+    operator: str,
+    n_rows: int,
+    *,
+    chunk_rows: int | None = None,
+    build_rows: int = 0,
+    fanout: int = 1,
+) -> Iterator[slice]:
+    """Yield the row slices an operator over *n_rows* rows should process.
+
+    The query is checked for cancellation before each slice is yielded,
+    and progress is reported once the caller asks for the next one.
+    Inputs no larger than one chunk are yielded as a single slice.
+
+    Args:
+        context: The query's ``Context``.
+        operator: Operator name for progress reports.
+        n_rows: Input rows.
+        chunk_rows: Rows per chunk; defaults to
+            :data:`~pycypher.config.OPERATOR_CHUNK_ROWS`.  ``0`` disables
+            chunking.
+        build_rows: Rows of another input the operator reads in full for
+            every chunk (the build side of a hash join).  Chunks grow so
+            that input is read at most :data:`MAX_BUILD_PASSES` times.
+        fanout: Result rows per input row (the other side of a cross
+            join); chunks shrink so each result has about *chunk_rows*
+            rows.
+
+    Yields:
+        Consecutive slices covering ``range(n_rows)``.
+
+    """
+    from pycypher import config
+
+    size = config.OPERATOR_CHUNK_ROWS if chunk_rows is None else chunk_rows
+    if size > 0 and build_rows:
+        size = max(size, -(-build_rows // MAX_BUILD_PASSES))
+    if size > 0 and fanout > 1:
+        size = max(size // fanout, 1)
+    if size <= 0 or n_rows <= size:
+        size = max(n_rows, 1)
+    with operator_monitor(context, operator, total=n_rows) as monitor:
+        for start in range(0, max(n_rows, 1), size):
+            monitor.check()
+            rows = slice(start, min(start + size, n_rows))
+            yield rows
+            monitor.advance(rows.stop - rows.start)
+
+
+def run_chunked(
+    context: Any,
+    operator: str,
+    frame: pd.DataFrame,
+    apply: Callable[[pd.DataFrame], pd.DataFrame],
+    **chunking: int,
+) -> pd.DataFrame:
+    """Apply a row-wise operator to *frame* chunk by chunk.
+
+    *apply* must be distributive over row slices of *frame* — an inner,
+    left or cross join probing with *frame*, for instance — so that
+    concatenating the per-chunk results in order equals ``apply(frame)``.
+    Chunks and checks follow :func:`chunk_slices`; a frame no larger than
+    one chunk is passed to *apply* whole.
+
+    Args:
+        context: The query's ``Context``.
+        operator: Operator name for progress reports.
+        frame: Rows to process.
+        apply: The operator.
+        **chunking: ``chunk_rows``, ``build_rows`` or ``fanout``, as for
+            :func:`chunk_slices`.
+
+    Returns:
+        The result of *apply*, concatenated with a fresh ``RangeIndex``
+        when *frame* was split.
+
+    """
+    parts = [
+        apply(frame if rows == slice(0, len(frame)) else frame.iloc[rows])
+        for rows in chunk_slices(context, operator, len(frame), **chunking)
+    ]
+    if len(parts) == 1:
+        return parts[0]
+    non_empty = [part for part in parts if len(part)] or parts[:1]
+    return pd.concat(non_empty, ignore_index=True)
@@ -7,7 +7,9 @@ and enable independent testing.
 
 Key classes:
 
-- :class:`ColumnStatistics` — per-column NDV, null fraction, histograms.
+- :class:`ColumnStatistics` — per-column NDV, null fraction, histograms,
+  most-common values and string-prefix histograms.
+- :class:`DegreeStatistics` — relationship fan-out in each direction.
 - :class:`TableStatistics` — lazily computed column statistics for a table.
 - :class:`CardinalityFeedbackStore` — accumulates actual-vs-estimated
   ratios for self-correcting estimates.
@@ -22,6 +24,7 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
 import threading
 from collections import deque
 from dataclasses import dataclass
@@ -31,10 +34,17 @@ import numpy as np
 import pandas as pd
 from shared.logger import LOGGER
 
+from pycypher.constants import (
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+)
+
 __all__ = [
     "CardinalityFeedbackStore",
     "ColumnStatistics",
+    "DegreeStatistics",
     "TableStatistics",
+    "profile_column",
 ]
 
 # ---------------------------------------------------------------------------
@@ -50,6 +60,20 @@ HISTOGRAM_BINS: int = 64
 #: Minimum non-null rows required to build a histogram.
 HISTOGRAM_MIN_ROWS: int = 10
 
+#: Maximum number of most-common values (MCVs) kept per column.
+MCV_SIZE: int = 16
+
+#: A value is kept as an MCV only when it is at least this many times more
+#: frequent than the average value (``1 / NDV``).  Uniform columns therefore
+#: keep no MCVs and equality selectivity stays ``1 / NDV``.
+MCV_MIN_RATIO: float = 1.25
+
+#: Number of equi-depth buckets in a string-prefix histogram.
+PREFIX_HISTOGRAM_BINS: int = 32
+
+#: Strings are truncated to this many characters before bucketing.
+PREFIX_LENGTH: int = 8
+
 #: Default selectivity factor for WHERE predicates when no statistics are
 #: available.  Assumes an equality filter keeps ~33% of rows.
 DEFAULT_FILTER_SELECTIVITY: float = 0.33
@@ -81,6 +105,12 @@ class ColumnStatistics:
             Length is ``num_bins + 1``.
         histogram_counts: Row counts per histogram bin (numeric only).
             Length is ``num_bins``.
+        most_common_values: ``(value, fraction_of_rows)`` pairs for values
+            that are markedly more frequent than average, most frequent
+            first.  ``None`` when the column is close to uniform.
+        prefix_bounds: Equi-depth bucket boundaries over the non-null
+            values truncated to ``PREFIX_LENGTH`` characters (string columns
+            only).  Length is ``num_buckets + 1``.
 
     """
 
@@ -91,13 +121,86 @@ class ColumnStatistics:
     row_count: int = 0
     histogram_edges: tuple[float, ...] | None = None
     histogram_counts: tuple[int, ...] | None = None
+    most_common_values: tuple[tuple[Any, float], ...] | None = None
+    prefix_bounds: tuple[str, ...] | None = None
+
+    def equality_selectivity(self, value: Any = None) -> float:
+        """Selectivity for ``col = value``: 1/NDV, adjusted for nulls.
 
-    def equality_selectivity(self) -> float:
-        """Selectivity for ``col = value``: 1/NDV, adjusted for nulls."""
+        When *value* is given and the column has most-common values, the
+        MCV frequency is returned for a listed value; other values share the
+        remaining (non-MCV, non-null) fraction evenly.
+        """
         if self.ndv <= 0:
             return DEFAULT_FILTER_SELECTIVITY
+        if value is not None and self.most_common_values:
+            mcv = dict(self.most_common_values)
+            try:
+                frequency = mcv.get(value)
+            except TypeError:  # unhashable literal
+                frequency = None
+            if frequency is not None:
+                return frequency
+            rest_ndv = self.ndv - len(mcv)
+            rest_fraction = 1.0 - self.null_fraction - sum(mcv.values())
+            if rest_ndv <= 0 or rest_fraction <= 0:
+                return 1.0 / max(self.row_count, 1)
+            return rest_fraction / rest_ndv
         return (1.0 - self.null_fraction) / self.ndv
 
+    def prefix_selectivity(self, prefix: str) -> float:
+        """Selectivity for ``col STARTS WITH prefix``.
+
+        Uses the string-prefix histogram; prefixes longer than
+        ``PREFIX_LENGTH`` are truncated, so the estimate errs high.
+        """
+        if not self.prefix_bounds:
+            return DEFAULT_FILTER_SELECTIVITY
+        if not prefix:
+            return 1.0 - self.null_fraction
+        key = prefix[:PREFIX_LENGTH]
+        return self._bounded_string_selectivity(key, key + "\U0010ffff")
+
+    def string_range_selectivity(
+        self,
+        low: str | None = None,
+        high: str | None = None,
+    ) -> float:
+        """Selectivity for string range predicates (``col >= 'M'``)."""
+        if not self.prefix_bounds:
+            return DEFAULT_FILTER_SELECTIVITY
+        lo = low[:PREFIX_LENGTH] if low is not None else ""
+        hi = high[:PREFIX_LENGTH] if high is not None else "\U0010ffff"
+        return self._bounded_string_selectivity(lo, hi)
+
+    def _bounded_string_selectivity(self, lo: str, hi: str) -> float:
+        """Fraction of rows in ``[lo, hi)`` estimated from *prefix_bounds*.
+
+        Each bucket holds ``1 / num_buckets`` of the non-null rows; a bound
+        falling strictly inside a bucket is assumed to split it in half.
+        """
+        assert self.prefix_bounds is not None
+        bounds = self.prefix_bounds
+        buckets = len(bounds) - 1
+        floor = 1.0 / max(self.row_count, 1)
+        if buckets <= 0 or hi <= bounds[0] or lo > bounds[-1]:
+            return floor
+
+        def _rank(value: str) -> float:
+            i = bisect.bisect_left(bounds, value)
+            if i < len(bounds) and bounds[i] == value:
+                return i / buckets
+            if i == 0:
+                return 0.0
+            if i > buckets:
+                return 1.0
+            return (i - 0.5) / buckets
+
+        fraction = _rank(hi) - _rank(lo)
+        # A range inside a single bucket matches at least one value's worth.
+        fraction = max(fraction, 1.0 / max(self.ndv, 1))
+        return max(fraction * (1.0 - self.null_fraction), floor)
+
     def range_selectivity(
         self,
         low: float | None = None,
@@ -176,6 +279,243 @@ class ColumnStatistics:
 
         return matching_rows / total_rows
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to a JSON-compatible mapping."""
+        return {
+            "ndv": self.ndv,
+            "null_fraction": self.null_fraction,
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "row_count": self.row_count,
+            "histogram_edges": _as_list(self.histogram_edges),
+            "histogram_counts": _as_list(self.histogram_counts),
+            "most_common_values": (
+                [list(pair) for pair in self.most_common_values]
+                if self.most_common_values is not None
+                else None
+            ),
+            "prefix_bounds": _as_list(self.prefix_bounds),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ColumnStatistics:
+        """Rebuild statistics serialised by :meth:`to_dict`."""
+        mcv = data.get("most_common_values")
+        return cls(
+            ndv=int(data["ndv"]),
+            null_fraction=float(data["null_fraction"]),
+            min_value=data.get("min_value"),
+            max_value=data.get("max_value"),
+            row_count=int(data.get("row_count", 0)),
+            histogram_edges=_as_tuple(data.get("histogram_edges")),
+            histogram_counts=_as_tuple(data.get("histogram_counts")),
+            most_common_values=(
+                tuple((value, float(freq)) for value, freq in mcv)
+                if mcv is not None
+                else None
+            ),
+            prefix_bounds=_as_tuple(data.get("prefix_bounds")),
+        )
+
+
+def _as_list(values: tuple[Any, ...] | None) -> list[Any] | None:
+    return list(values) if values is not None else None
+
+
+def _as_tuple(values: list[Any] | None) -> tuple[Any, ...] | None:
+    return tuple(values) if values is not None else None
+
+
+def _python_scalar(value: Any) -> Any:
+    """Convert a numpy scalar to its Python equivalent, or ``None``.
+
+    Only JSON-representable scalars are kept as most-common values.
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return None
+
+
+def profile_column(
+    values: pd.Series,
+    *,
+    row_count: int | None = None,
+    ndv: int | None = None,
+) -> ColumnStatistics:
+    """Compute :class:`ColumnStatistics` for *values*.
+
+    Args:
+        values: The column (or a sample of it).
+        row_count: Rows in the full table; defaults to ``len(values)``.
+        ndv: Distinct-value count to use instead of ``values.nunique()``,
+            e.g. a HyperLogLog estimate over the full column when *values*
+            is a sample.
+
+    """
+    n = len(values) if row_count is None else row_count
+    null_count = int(values.isna().sum())
+    null_fraction = null_count / max(len(values), 1)
+    non_null = values.dropna()
+    if ndv is None:
+        ndv = int(non_null.nunique())
+
+    min_val: float | None = None
+    max_val: float | None = None
+    hist_edges: tuple[float, ...] | None = None
+    hist_counts: tuple[int, ...] | None = None
+    prefix_bounds: tuple[str, ...] | None = None
+    if len(non_null) > 0 and pd.api.types.is_bool_dtype(non_null):
+        pass  # Booleans: NDV and MCVs only.
+    elif len(non_null) > 0 and pd.api.types.is_numeric_dtype(non_null):
+        min_val = float(non_null.min())
+        max_val = float(non_null.max())
+        # Build equi-width histogram for range selectivity.
+        if min_val < max_val and len(non_null) >= HISTOGRAM_MIN_ROWS:
+            num_bins = max(min(HISTOGRAM_BINS, ndv), 1)
+            try:
+                counts, edges = np.histogram(
+                    non_null.values,
+                    bins=num_bins,
+                )
+                hist_edges = tuple(float(e) for e in edges)
+                hist_counts = tuple(int(c) for c in counts)
+            except (ValueError, TypeError):
+                pass  # Non-histogrammable data; use uniform fallback.
+    elif (
+        len(non_null) >= HISTOGRAM_MIN_ROWS
+        and pd.api.types.infer_dtype(non_null, skipna=True) == "string"
+    ):
+        prefixes = np.sort(non_null.str.slice(0, PREFIX_LENGTH).to_numpy())
+        buckets = min(PREFIX_HISTOGRAM_BINS, len(prefixes) - 1)
+        positions = np.linspace(0, len(prefixes) - 1, buckets + 1)
+        prefix_bounds = tuple(str(prefixes[int(i)]) for i in positions)
+
+    return ColumnStatistics(
+        ndv=ndv,
+        null_fraction=null_fraction,
+        min_value=min_val,
+        max_value=max_val,
+        row_count=n,
+        histogram_edges=hist_edges,
+        histogram_counts=hist_counts,
+        most_common_values=_most_common_values(non_null, len(values), ndv),
+        prefix_bounds=prefix_bounds,
+    )
+
+
+def _most_common_values(
+    non_null: pd.Series,
+    sampled_rows: int,
+    ndv: int,
+) -> tuple[tuple[Any, float], ...] | None:
+    """Return the skewed values of *non_null* with their row fractions."""
+    if ndv <= 1 or len(non_null) <= ndv:
+        return None
+    try:
+        counts = non_null.value_counts(sort=True).head(MCV_SIZE)
+    except TypeError:  # unhashable cell values (lists, dicts)
+        return None
+    threshold = MCV_MIN_RATIO * len(non_null) / ndv
+    pairs = []
+    for value, count in counts.items():
+        if count < threshold:
+            break
+        scalar = _python_scalar(value)
+        if scalar is not None:
+            pairs.append((scalar, int(count) / max(sampled_rows, 1)))
+    return tuple(pairs) or None
+
+
+# ---------------------------------------------------------------------------
+# Relationship degree statistics
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class DegreeStatistics:
+    """Fan-out distribution of one relationship type in each direction.
+
+    Attributes:
+        relationship_count: Number of relationships of this type.
+        source_count: Distinct source nodes (nodes with out-degree >= 1).
+        target_count: Distinct target nodes (nodes with in-degree >= 1).
+        max_out_degree: Largest number of relationships leaving one node.
+        max_in_degree: Largest number of relationships entering one node.
+
+    """
+
+    relationship_count: int
+    source_count: int
+    target_count: int
+    max_out_degree: int
+    max_in_degree: int
+
+    @property
+    def avg_out_degree(self) -> float:
+        """Mean out-degree over nodes with at least one outgoing edge."""
+        return self.relationship_count / max(self.source_count, 1)
+
+    @property
+    def avg_in_degree(self) -> float:
+        """Mean in-degree over nodes with at least one incoming edge."""
+        return self.relationship_count / max(self.target_count, 1)
+
+    def fanout(self, direction: str) -> float:
+        """Average rows produced per bound endpoint when traversing.
+
+        Args:
+            direction: ``"->"`` (follow outgoing edges), ``"<-"`` (incoming)
+                or ``"-"`` (either).
+
+        """
+        if direction == "->":
+            return self.avg_out_degree
+        if direction == "<-":
+            return self.avg_in_degree
+        # Either direction: every edge is seen from both endpoints.
+        return 2 * self.relationship_count / max(
+            self.source_count + self.target_count,
+            1,
+        )
+
+    def endpoint_count(self, direction: str) -> int:
+        """Nodes a traversal in *direction* can start from."""
+        if direction == "->":
+            return self.source_count
+        if direction == "<-":
+            return self.target_count
+        return self.source_count + self.target_count
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> DegreeStatistics:
+        """Compute degree statistics from a relationship table."""
+        out_degree = df[RELATIONSHIP_SOURCE_COLUMN].value_counts()
+        in_degree = df[RELATIONSHIP_TARGET_COLUMN].value_counts()
+        return cls(
+            relationship_count=len(df),
+            source_count=len(out_degree),
+            target_count=len(in_degree),
+            max_out_degree=int(out_degree.max()) if len(out_degree) else 0,
+            max_in_degree=int(in_degree.max()) if len(in_degree) else 0,
+        )
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialise to a JSON-compatible mapping."""
+        return {
+            "relationship_count": self.relationship_count,
+            "source_count": self.source_count,
+            "target_count": self.target_count,
+            "max_out_degree": self.max_out_degree,
+            "max_in_degree": self.max_in_degree,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DegreeStatistics:
+        """Rebuild statistics serialised by :meth:`to_dict`."""
+        return cls(**{k: int(data[k]) for k in cls.__dataclass_fields__})
+
 
 # ---------------------------------------------------------------------------
 # Table statistics
@@ -195,6 +535,24 @@ class TableStatistics:
         self._columns: dict[str, ColumnStatistics] = {}
         self._row_count: int | None = None
 
+    @classmethod
+    def from_columns(
+        cls,
+        source_obj: pd.DataFrame | Any,
+        row_count: int,
+        columns: dict[str, ColumnStatistics],
+    ) -> TableStatistics:
+        """Build statistics pre-populated with already-computed columns.
+
+        Used for persisted ``ANALYZE`` results (see
+        :class:`~pycypher.statistics_catalog.StatisticsCatalog`); columns
+        that were not analyzed are still computed lazily from *source_obj*.
+        """
+        stats = cls(source_obj)
+        stats._row_count = row_count
+        stats._columns.update(columns)
+        return stats
+
     @property
     def row_count(self) -> int:
         """Return the number of rows in the source table."""
@@ -237,40 +595,7 @@ class TableStatistics:
             else:
                 sample = df[column]
 
-            null_count = int(sample.isna().sum())
-            null_fraction = null_count / max(len(sample), 1)
-            non_null = sample.dropna()
-            ndv = int(non_null.nunique())
-
-            min_val: float | None = None
-            max_val: float | None = None
-            hist_edges: tuple[float, ...] | None = None
-            hist_counts: tuple[int, ...] | None = None
-            if len(non_null) > 0 and pd.api.types.is_numeric_dtype(non_null):
-                min_val = float(non_null.min())
-                max_val = float(non_null.max())
-                # Build equi-width histogram for range selectivity.
-                if min_val < max_val and len(non_null) >= HISTOGRAM_MIN_ROWS:
-                    num_bins = min(HISTOGRAM_BINS, ndv)
-                    try:
-                        counts, edges = np.histogram(
-                            non_null.values,
-                            bins=num_bins,
-                        )
-                        hist_edges = tuple(float(e) for e in edges)
-                        hist_counts = tuple(int(c) for c in counts)
-                    except (ValueError, TypeError):
-                        pass  # Non-histogrammable data; use uniform fallback.
-
-            return ColumnStatistics(
-                ndv=ndv,
-                null_fraction=null_fraction,
-                min_value=min_val,
-                max_value=max_val,
-                row_count=n,
-                histogram_edges=hist_edges,
-                histogram_counts=hist_counts,
-            )
+            return profile_column(sample, row_count=n)
         except (TypeError, ValueError, ArithmeticError) as _stats_exc:
             LOGGER.debug(
                 "Failed to compute statistics for column %r: %s",
@@ -335,6 +660,12 @@ class CardinalityFeedbackStore:
         # Clamp to [0.01, 100] to prevent runaway corrections.
         return max(0.01, min(100.0, avg_ratio))
 
+    def latest(self, entity_type: str) -> tuple[int, int] | None:
+        """Return the most recent ``(estimated, actual)`` pair, if any."""
+        with self._lock:
+            history = self._history.get(entity_type)
+            return history[-1] if history else None
+
     @property
     def entity_types_tracked(self) -> list[str]:
         """Return entity types with recorded history."""
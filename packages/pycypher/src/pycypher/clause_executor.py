@@ -9,6 +9,7 @@ execution logic from the main orchestration facade.  The
 * UNWIND clause processing with seed-frame management
 * WHERE filter application
 * Dead column elimination
+* Factorized MATCH → RETURN execution for aggregating queries
 * The main clause execution loop
 """
 
@@ -22,6 +23,8 @@ from shared.logger import LOGGER
 from shared.metrics import get_rss_mb
 
 from pycypher.binding_frame import BindingFrame
+from pycypher.cancellation import operator_monitor
+from pycypher.factorized import FactorizedFrame
 
 if TYPE_CHECKING:
     from pycypher.evaluator_protocol import ExpressionEvaluatorFactory
@@ -46,6 +49,10 @@ class ClauseExecutor:
         frame_joiner: FrameJoiner for frame merging.
         projection_planner: ProjectionPlanner for RETURN/WITH clauses.
         query_analyzer: QueryAnalyzer for pre-execution planning.
+        use_factorization: Answer ``MATCH … RETURN`` queries that only
+            aggregate (or return DISTINCT keys) from a
+            :class:`~pycypher.factorized.FactorizedFrame` instead of the
+            flat MATCH result.
 
     """
 
@@ -59,6 +66,7 @@ class ClauseExecutor:
         query_analyzer: QueryAnalyzer,
         *,
         evaluator_factory: ExpressionEvaluatorFactory,
+        use_factorization: bool = True,
     ) -> None:
         self._context = context
         self._pattern_matcher = pattern_matcher
@@ -67,6 +75,7 @@ class ClauseExecutor:
         self._projection_planner = projection_planner
         self._query_analyzer = query_analyzer
         self._evaluator_factory = evaluator_factory
+        self._use_factorization = use_factorization
 
         from pycypher.ast_models import (
             Call,
@@ -313,6 +322,8 @@ class ClauseExecutor:
         """Return row count string for a BindingFrame, or ``'(none)'``."""
         if frame is None:
             return "(none)"
+        if isinstance(frame, FactorizedFrame):
+            return "(factorized)"
         try:
             return str(len(frame.bindings))
         except AttributeError:
@@ -350,6 +361,13 @@ class ClauseExecutor:
     ) -> Any:
         if current_frame is None:
             current_frame = self._frame_joiner.make_seed_frame()
+        if isinstance(current_frame, FactorizedFrame):
+            result = self._projection_planner.return_from_factorized(
+                clause, current_frame,
+            )
+            if result is not None:
+                return result
+            current_frame = current_frame.flatten()
         return self._projection_planner.return_from_frame(
             clause, current_frame,
         )
@@ -363,6 +381,7 @@ class ClauseExecutor:
         self.require_bound_frame(current_frame, "SET")
         self._mutations.set_properties(clause, current_frame)
         current_frame._property_cache.clear()
+        current_frame._group_codes_cache.clear()
         return current_frame
 
     def _dispatch_remove(
@@ -374,6 +393,7 @@ class ClauseExecutor:
         self.require_bound_frame(current_frame, "REMOVE")
         self._mutations.remove_properties(clause, current_frame)
         current_frame._property_cache.clear()
+        current_frame._group_codes_cache.clear()
         return current_frame
 
     def _dispatch_delete(
@@ -385,6 +405,7 @@ class ClauseExecutor:
         self.require_bound_frame(current_frame, "DELETE")
         self._mutations.process_delete(clause, current_frame)
         current_frame._property_cache.clear()
+        current_frame._group_codes_cache.clear()
         return current_frame
 
     def _dispatch_unwind(
@@ -413,7 +434,11 @@ class ClauseExecutor:
         current_frame: Any,
         _limit_hint: int | None,
     ) -> Any:
-        return self._mutations.process_call(clause, current_frame)
+        return self._mutations.process_call(
+            clause,
+            current_frame,
+            make_seed_frame=self._frame_joiner.make_seed_frame,
+        )
 
     def _dispatch_merge(
         self,
@@ -462,6 +487,28 @@ class ClauseExecutor:
             raise NotImplementedError(msg)
         return handler(clause, current_frame, limit_hint)
 
+    def factorizable(self, query: Any) -> bool:
+        """Return whether *query* may run on a factorized MATCH result.
+
+        True for ``MATCH … RETURN`` whose RETURN only aggregates or returns
+        DISTINCT keys (see
+        :func:`~pycypher.factorized.plan_factorized_return`); the MATCH
+        itself is checked by
+        :meth:`~pycypher.pattern_matcher.PatternMatcher.match_to_factorized`.
+        """
+        from pycypher.ast_models import Match, Return
+
+        clauses = query.clauses
+        return (
+            self._use_factorization
+            and len(clauses) == 2
+            and isinstance(clauses[0], Match)
+            and not clauses[0].optional
+            and isinstance(clauses[1], Return)
+            and self._projection_planner.plan_factorized_return(clauses[1])
+            is not None
+        )
+
     # ------------------------------------------------------------------
     # Main execution loop
     # ------------------------------------------------------------------
@@ -491,6 +538,9 @@ class ClauseExecutor:
             )
             raise ValueError(msg)
 
+        from pycypher.pattern_degree import rewrite_degree_patterns
+
+        query = rewrite_degree_patterns(query)
         _clause_timings: dict[str, float] = {}
         _clause_memory: dict[str, float] = {}
         _limit_hint = self._query_analyzer.analyze_and_plan(query)
@@ -500,20 +550,33 @@ class ClauseExecutor:
         from pycypher.lazy_eval import compute_live_columns
 
         _live_columns = compute_live_columns(query.clauses)
+        _factorize = initial_frame is None and self.factorizable(query)
 
+        _clauses_monitor = operator_monitor(
+            self._context,
+            "clauses",
+            total=len(query.clauses),
+            unit="clauses",
+        )
         for clause_idx, clause in enumerate(query.clauses):
-            self._context.check_timeout()
+            _clauses_monitor.check()
 
             _clause_name = type(clause).__name__
             _size_before = self.frame_size(current_frame)
             _clause_rss_before = get_rss_mb()
             _clause_t0 = time.perf_counter()
 
-            result = self.dispatch_clause(
-                clause,
-                current_frame,
-                _limit_hint,
-            )
+            result = None
+            if _factorize and clause_idx == 0:
+                # Aggregating MATCH … RETURN: keep the match factorized;
+                # the RETURN consumes it without building the flat rows.
+                result = self._pattern_matcher.match_to_factorized(clause)
+            if result is None:
+                result = self.dispatch_clause(
+                    clause,
+                    current_frame,
+                    _limit_hint,
+                )
 
             _clause_elapsed = time.perf_counter() - _clause_t0
             _clause_rss_after = get_rss_mb()
@@ -525,6 +588,7 @@ class ClauseExecutor:
                 _clause_memory.get(_clause_name, 0.0)
                 + (_clause_rss_after - _clause_rss_before)
             )
+            _clauses_monitor.advance(1)
 
             # Check if this is a final result (DataFrame) requiring early return
             if isinstance(result, pd.DataFrame):
@@ -538,6 +602,7 @@ class ClauseExecutor:
                 self.last_clause_timings = _clause_timings
                 self.last_clause_memory = _clause_memory
                 self._query_analyzer.record_cardinality_feedback(len(result))
+                _clauses_monitor.close()
                 return result
 
             # --- Dead column elimination ---
@@ -584,6 +649,7 @@ class ClauseExecutor:
         self.last_clause_timings = _clause_timings
         self.last_clause_memory = _clause_memory
         self._query_analyzer.record_cardinality_feedback(0)
+        _clauses_monitor.close()
         return pd.DataFrame()
 
     def execute_query_binding_frame(
@@ -1 +1,36 @@
-"""CLI package for nmetl command-line interface."""
+"""CLI package for nmetl command-line interface.
+
+Importing the package is cheap: :data:`cli` and the group classes are
+loaded from :mod:`pycypher.cli.main` on first access, and each command
+module only when its command runs.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pycypher.cli.main import LazyGroup, SuggestingGroup, cli
+
+# Lazy-loaded symbols: mapped to (module_path, attribute_name).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "LazyGroup": ("pycypher.cli.main", "LazyGroup"),
+    "SuggestingGroup": ("pycypher.cli.main", "SuggestingGroup"),
+    "cli": ("pycypher.cli.main", "cli"),
+}
+
+__all__ = ["LazyGroup", "SuggestingGroup", "cli"]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import public symbols on first attribute access."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        import importlib
+
+        value = getattr(importlib.import_module(module_path), attr_name)
+        # Cache on the module to avoid repeated imports.
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
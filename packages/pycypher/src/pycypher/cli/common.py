@@ -26,14 +26,6 @@ from pycypher.exceptions import (
     WrongCypherTypeError,
 )
 
-# Import DuckDB exceptions for proper error handling
-try:
-    import duckdb  # noqa: F401  # required for _duckdb internal module
-    from _duckdb import IOException as DuckDBIOException
-except ImportError:
-    # Handle case where DuckDB is not available
-    DuckDBIOException = None  # ty: ignore[invalid-assignment]  # fallback when duckdb unavailable
-
 if TYPE_CHECKING:
     pass
 
@@ -44,6 +36,16 @@ def cli_error(message: str, *, exit_code: int = 1) -> NoReturn:
     sys.exit(exit_code)
 
 
+def is_duckdb_io_error(exc: BaseException) -> bool:
+    """Return whether *exc* is a DuckDB ``IOException``.
+
+    DuckDB is not imported for the check (it adds ~60 ms to every CLI
+    start): an exception raised by DuckDB means it is already loaded.
+    """
+    duckdb = sys.modules.get("duckdb")
+    return duckdb is not None and isinstance(exc, duckdb.IOException)
+
+
 def format_validation_errors(
     exc: ValidationError, *, verbose: bool = False
 ) -> str:
@@ -148,9 +150,7 @@ def load_data_source(
     except ValidationError as exc:
         cli_error(format_validation_errors(exc), exit_code=2)
     except Exception as exc:  # noqa: BLE001 — CLI top-level: format any error for user display
-        if DuckDBIOException is not None and isinstance(
-            exc, DuckDBIOException
-        ):
+        if is_duckdb_io_error(exc):
             cli_error(
                 translate_duckdb_error(exc, kind, safe_path), exit_code=1
             )
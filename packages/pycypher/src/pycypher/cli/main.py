@@ -1,18 +1,43 @@
-"""Modular CLI entry point for nmetl."""
+"""Modular CLI entry point for nmetl.
+
+Sub-commands are imported when they are invoked (see :class:`LazyGroup`),
+so ``nmetl parse`` does not pay for the pipeline runner's pandas and
+ingestion imports, and vice versa.
+"""
 
 from __future__ import annotations
 
 import difflib
+import importlib
 
 import click
 
-from .interactive import repl
-from .pipeline import list_queries, run, validate
-from .query import format_query, parse, query
-from .schema import functions, schema
-from .security import security_check
-from .system import config, health, health_server, metrics, show_config
-from .utility import compat_check
+#: Command name -> ``"module:attribute"`` of its ``click.Command``.
+_COMMANDS: dict[str, str] = {
+    # Pipeline commands
+    "run": "pycypher.cli.pipeline:run",
+    "validate": "pycypher.cli.pipeline:validate",
+    "list-queries": "pycypher.cli.pipeline:list_queries",
+    # Query processing commands
+    "parse": "pycypher.cli.query:parse",
+    "query": "pycypher.cli.query:query",
+    "format-query": "pycypher.cli.query:format_query",
+    # Schema and metadata commands
+    "functions": "pycypher.cli.schema:functions",
+    "schema": "pycypher.cli.schema:schema",
+    # System monitoring commands
+    "metrics": "pycypher.cli.system:metrics",
+    "config": "pycypher.cli.system:config",
+    "health": "pycypher.cli.system:health",
+    "health-server": "pycypher.cli.system:health_server",
+    "show-config": "pycypher.cli.system:show_config",
+    # Interactive commands
+    "repl": "pycypher.cli.interactive:repl",
+    # Security commands
+    "security-check": "pycypher.cli.security:security_check",
+    # Utility commands
+    "compat-check": "pycypher.cli.utility:compat_check",
+}
 
 
 class SuggestingGroup(click.Group):
@@ -36,7 +61,39 @@ class SuggestingGroup(click.Group):
             raise
 
 
-@click.group(cls=SuggestingGroup)
+class LazyGroup(SuggestingGroup):
+    """Suggesting group whose commands are imported on first use.
+
+    Args:
+        lazy_commands: Command name -> ``"module:attribute"``.
+
+    """
+
+    def __init__(
+        self,
+        *args: object,
+        lazy_commands: dict[str, str] | None = None,
+        **kwargs: object,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager and lazy command names, sorted."""
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(
+        self, ctx: click.Context, cmd_name: str
+    ) -> click.Command | None:
+        """Return *cmd_name*, importing its module if needed."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_path, attr_name = self.lazy_commands[cmd_name].split(":")
+            module = importlib.import_module(module_path)
+            self.add_command(getattr(module, attr_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=_COMMANDS)
 @click.option(
     "--verbose",
     "-v",
@@ -67,36 +124,5 @@ def cli(*, verbose: bool, debug: bool) -> None:
         logging.basicConfig(level=logging.INFO)
 
 
-# Register pipeline commands
-cli.add_command(run)
-cli.add_command(validate)
-cli.add_command(list_queries)
-
-# Register query processing commands
-cli.add_command(parse)
-cli.add_command(query)
-cli.add_command(format_query)
-
-# Register schema and metadata commands
-cli.add_command(functions)
-cli.add_command(schema)
-
-# Register system monitoring commands
-cli.add_command(metrics)
-cli.add_command(config)
-cli.add_command(health)
-cli.add_command(health_server)
-cli.add_command(show_config)
-
-# Register interactive commands
-cli.add_command(repl)
-
-# Register security commands
-cli.add_command(security_check)
-
-# Register utility commands
-cli.add_command(compat_check)
-
-
 if __name__ == "__main__":
     cli()
@@ -140,9 +140,10 @@ def _register_user_functions(function_configs: list[Any]) -> None:
       a list of functions, or every public ``def``-defined callable in that
       module.
 
-    Each callable is wrapped row-wise via
-    :func:`pycypher.scalar_functions.user_functions.register_user_function`,
-    so users can write plain scalar Python (one value in, one value out).
+    Each callable is wrapped via
+    :func:`pycypher.scalar_functions.user_functions.register_user_function`
+    in the entry's ``mode`` (row-wise by default), so users can write plain
+    scalar Python (one value in, one value out).
     Failures (bad import path, missing attribute) raise :class:`ImportError`
     or :class:`AttributeError` and are surfaced via :func:`cli_error`.
     """
@@ -160,6 +161,11 @@ def _register_user_functions(function_configs: list[Any]) -> None:
     click.echo(f"Registering user-defined functions from {n} entry/entries …")
 
     for cfg in function_configs:
+        options: dict[str, Any] = {"mode": cfg.mode}
+        if cfg.memo_size is not None:
+            options["memo_size"] = cfg.memo_size
+        if cfg.processes is not None:
+            options["processes"] = cfg.processes
         if cfg.callable:
             mod_path, _, attr = cfg.callable.rpartition(".")
             if not mod_path:
@@ -184,7 +190,7 @@ def _register_user_functions(function_configs: list[Any]) -> None:
                     f"functions.callable={cfg.callable!r} resolved to a "
                     f"non-callable object of type {type(func).__name__}",
                 )
-            register_user_function(func)
+            register_user_function(func, **options)
             click.echo(f"  registered {cfg.callable}")
             continue
 
@@ -220,7 +226,7 @@ def _register_user_functions(function_configs: list[Any]) -> None:
                     f"{cfg.module}.{name} is not callable "
                     f"(got {type(func).__name__})",
                 )
-            register_user_function(func)
+            register_user_function(func, **options)
             click.echo(f"  registered {cfg.module}.{name}")
 
 
@@ -276,6 +282,38 @@ def _reorder_queries_by_dependency(
     return [by_id[qid] for qid in sorted_ids if qid in by_id] + unparseable
 
 
+def _plan_source_scans(queries: list[Any], config_dir: Path) -> Any | None:
+    """Return a :class:`~pycypher.ingestion.scan_pushdown.SourceScanPlan` for *queries*.
+
+    The plan narrows each file source to the columns and rows the selected
+    queries can observe, so loading reads less.  It is only sound over the
+    whole workload: if any query's text cannot be loaded or parsed, return
+    ``None`` and every source is read in full.
+    """
+    texts: list[str] = []
+    for q in queries:
+        cypher = q.inline or ""
+        if not cypher and q.source:
+            try:
+                cypher = _load_query_text(q.source, config_dir)
+            except (
+                OSError,
+                ValueError,
+                UnicodeDecodeError,
+            ):
+                return None
+        if not cypher:
+            return None
+        texts.append(cypher)
+
+    try:
+        from pycypher.ingestion.scan_pushdown import plan_source_scans
+
+        return plan_source_scans(texts)
+    except Exception:  # noqa: BLE001 — the query's own error handler reports it
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Dry-run pre-flight validation
 # ---------------------------------------------------------------------------
@@ -621,7 +659,9 @@ def _try_streaming_run(
                 continue
             for si, sink in enumerate(sinks, 1):
                 try:
-                    star.stream_query_to_uri(text, sink.uri, sink.format)
+                    star.stream_query_to_uri(
+                        text, sink.uri, sink.format, parquet=sink.parquet,
+                    )
                     click.echo(
                         f"  [{qi}/{len(plan)}] query [{q.id}]"
                         f" output {si}/{len(sinks)}"
@@ -730,6 +770,9 @@ def run_impl(
     n_sources = n_entity + n_rel
     click.echo(f"Loading {n_sources} data source(s) …")
 
+    # Push the workload's projections and filters into the source scans.
+    scan_plan = _plan_source_scans(queries, config.parent.resolve())
+
     try:
         builder = ContextBuilder()
         for i, entity_src in enumerate(pipeline_config.sources.entities, 1):
@@ -743,6 +786,11 @@ def run_impl(
                 id_col=entity_src.id_col,
                 query=entity_src.query,
                 schema_hints=entity_src.schema_hints,
+                scan=(
+                    scan_plan.entity(entity_src.entity_type)
+                    if scan_plan is not None
+                    else None
+                ),
             )
         for j, rel_src in enumerate(
             pipeline_config.sources.relationships, 1
@@ -761,6 +809,11 @@ def run_impl(
                 query=rel_src.query,
                 allow_multi_edges=rel_src.allow_multi_edges,
                 schema_hints=rel_src.schema_hints,
+                scan=(
+                    scan_plan.relationship(rel_src.relationship_type)
+                    if scan_plan is not None
+                    else None
+                ),
             )
         context = builder.build(
             backend=pipeline_config.backend_engine, instrument=verbose,
@@ -854,7 +907,9 @@ def run_impl(
         for si, sink in enumerate(sinks, 1):
             sink_start = time.monotonic()
             try:
-                write_dataframe_to_uri(result_df, sink.uri, sink.format)
+                write_dataframe_to_uri(
+                    result_df, sink.uri, sink.format, parquet=sink.parquet,
+                )
                 n_rows = len(result_df) if result_df is not None else 0
                 sink_ms = (time.monotonic() - sink_start) * 1000
                 click.echo(
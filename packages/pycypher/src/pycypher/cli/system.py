@@ -34,6 +34,11 @@ CONFIG_REGISTRY: list[tuple[str, str, str]] = [
     ("PYCYPHER_RESULT_CACHE_MAX_MB", "Result cache size (MB)", "100"),
     ("PYCYPHER_RESULT_CACHE_TTL_S", "Cache TTL (seconds, 0=no expiry)", "0"),
     ("PYCYPHER_AST_CACHE_MAX", "Parsed AST cache size (LRU)", "1024"),
+    (
+        "PYCYPHER_GRAMMAR_CACHE_DIR",
+        "Compiled grammar cache dir (empty=off)",
+        "~/.cache/pycypher",
+    ),
     # --- Security limits ---
     ("PYCYPHER_MAX_QUERY_SIZE_BYTES", "Max query size (bytes)", "1,048,576"),
     ("PYCYPHER_MAX_QUERY_NESTING_DEPTH", "Max AST nesting depth", "200"),
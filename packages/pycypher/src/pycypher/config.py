@@ -47,6 +47,35 @@ Environment Variables
     expansion.  Prevents memory exhaustion from adversarial inputs.
     Default: ``1_000_000`` (1 M elements/characters).
 
+``PYCYPHER_JOIN_ORDER_MIN_RELATIONSHIPS``
+    Minimum number of relationships in a MATCH pattern before its join
+    order is chosen by the cost-based DPccp enumerator instead of joining
+    hops left to right.  Default: ``3``.  ``0`` disables cost-based join
+    ordering.
+
+``PYCYPHER_JOIN_ORDER_MAX_RELATIONS``
+    Largest join graph (node scans plus relationship scans) the DPccp
+    enumerator will plan; bigger patterns keep the left-to-right order.
+    Default: ``16``.
+
+``PYCYPHER_OPERATOR_CHUNK_ROWS``
+    Rows a long-running operator (join, variable-length expansion,
+    grouped aggregation) processes between cooperative cancellation and
+    timeout checks.  Larger inputs are split into chunks of about this
+    size, and progress is reported after each one.  Default: ``262_144``.
+    ``0`` disables chunking.
+
+``PYCYPHER_PROPERTY_CACHE_MAX_MB``
+    Memory budget for per-property value arrays converted from Arrow
+    sources on demand.  Least recently used arrays are evicted once the
+    budget is exceeded and rebuilt on next use.  Default: ``512``.
+
+``PYCYPHER_GRAMMAR_CACHE_DIR``
+    Directory for the on-disk cache of the compiled Cypher grammar, which
+    makes the first parse of a process ~0.5 s faster.  Default:
+    ``$XDG_CACHE_HOME/pycypher`` (``~/.cache/pycypher``).  An empty value
+    disables the cache.
+
 ``PYCYPHER_AUDIT_LOG``
     Enable structured query audit logging.  Set to ``1``, ``true``, or
     ``yes`` to emit one JSON record per query to the ``pycypher.audit``
@@ -86,12 +115,17 @@ __all__ = [
     "AST_CACHE_MAX_ENTRIES",
     "COMPLEXITY_WARN_THRESHOLD",
     "CROSS_JOIN_WARN_THRESHOLDS",
+    "GRAMMAR_CACHE_DIR",
+    "JOIN_ORDER_MAX_RELATIONS",
+    "JOIN_ORDER_MIN_RELATIONSHIPS",
     "MAX_COLLECTION_SIZE",
     "MAX_COMPLEXITY_SCORE",
     "MAX_CROSS_JOIN_ROWS",
     "MAX_QUERY_NESTING_DEPTH",
     "MAX_QUERY_SIZE_BYTES",
     "MAX_UNBOUNDED_PATH_HOPS",
+    "OPERATOR_CHUNK_ROWS",
+    "PROPERTY_CACHE_MAX_MB",
     "QUERIES",
     "QUERY_TIMEOUT_S",
     "RATE_LIMIT_BURST",
@@ -254,6 +288,36 @@ RATE_LIMIT_BURST: int = _read_int("PYCYPHER_RATE_LIMIT_BURST", 10)
 """Maximum burst size for rate limiting.  Allows short bursts above the
 sustained QPS rate.  Only meaningful when ``RATE_LIMIT_QPS > 0``."""
 
+JOIN_ORDER_MIN_RELATIONSHIPS: int = _read_int(
+    "PYCYPHER_JOIN_ORDER_MIN_RELATIONSHIPS",
+    3,
+)
+"""Minimum relationships in a MATCH before cost-based join ordering applies.
+``0`` disables it."""
+
+JOIN_ORDER_MAX_RELATIONS: int = _read_int(
+    "PYCYPHER_JOIN_ORDER_MAX_RELATIONS",
+    16,
+)
+"""Largest join graph (scans) planned by the DPccp join enumerator."""
+
+OPERATOR_CHUNK_ROWS: int = _read_int("PYCYPHER_OPERATOR_CHUNK_ROWS", 262_144)
+"""Rows an operator processes between cancellation checks and progress
+reports.  ``0`` disables chunking."""
+
+PROPERTY_CACHE_MAX_MB: int = _read_int("PYCYPHER_PROPERTY_CACHE_MAX_MB", 512)
+"""Memory budget in MB for lazily converted per-property arrays."""
+
+GRAMMAR_CACHE_DIR: str = os.environ.get(
+    "PYCYPHER_GRAMMAR_CACHE_DIR",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "pycypher",
+    ),
+)
+"""Directory of the compiled-grammar cache.  Empty disables it."""
+
 
 # ---------------------------------------------------------------------------
 # Configuration presets
@@ -329,7 +393,7 @@ def apply_preset(name: str) -> None:
     LOGGER.info("Applied configuration preset %r", name)
 
 
-def show_config() -> dict[str, int | float | None | list[str]]:
+def show_config() -> dict[str, int | float | str | None | list[str]]:
     """Return a dict of all current configuration values.
 
     Useful for debugging and logging the active configuration::
@@ -352,4 +416,9 @@ def show_config() -> dict[str, int | float | None | list[str]]:
         "COMPLEXITY_WARN_THRESHOLD": COMPLEXITY_WARN_THRESHOLD,
         "RATE_LIMIT_QPS": RATE_LIMIT_QPS,
         "RATE_LIMIT_BURST": RATE_LIMIT_BURST,
+        "JOIN_ORDER_MIN_RELATIONSHIPS": JOIN_ORDER_MIN_RELATIONSHIPS,
+        "JOIN_ORDER_MAX_RELATIONS": JOIN_ORDER_MAX_RELATIONS,
+        "OPERATOR_CHUNK_ROWS": OPERATOR_CHUNK_ROWS,
+        "PROPERTY_CACHE_MAX_MB": PROPERTY_CACHE_MAX_MB,
+        "GRAMMAR_CACHE_DIR": GRAMMAR_CACHE_DIR,
     }
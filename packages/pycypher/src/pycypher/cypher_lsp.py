@@ -31,18 +31,30 @@ Supported LSP methods:
 
 - ``initialize`` / ``initialized``
 - ``textDocument/didOpen`` / ``textDocument/didChange`` — triggers diagnostics
+  (full or incremental document sync)
 - ``textDocument/completion`` — keyword, function, and label completion
 - ``textDocument/hover`` — function documentation on hover
 - ``textDocument/signatureHelp`` — parameter hints for function calls
 - ``textDocument/formatting`` — query formatting
 - ``shutdown`` / ``exit``
+
+A document may hold many statements separated by ``;``.  Diagnostics are
+computed per statement and cached by the statement's hash, so an edit
+re-parses only the statements it touched.  They are published from a
+background thread once edits pause for ``_DIAGNOSTICS_DEBOUNCE_S``
+seconds, so completion and hover requests never queue behind a parse.
 """
 
 from __future__ import annotations
 
+import collections
+import hashlib
 import json
 import re
 import sys
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any
 
 from shared.logger import LOGGER
@@ -54,6 +66,9 @@ from shared.logger import LOGGER
 
 _MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10 MiB — reject oversized payloads
 
+# Responses (main thread) and diagnostics (worker thread) share stdout.
+_write_lock = threading.Lock()
+
 
 def _read_message() -> dict[str, Any] | None:
     """Read a single LSP JSON-RPC message from stdin."""
@@ -91,9 +106,10 @@ def _send_message(msg: dict[str, Any]) -> None:
     """Send a JSON-RPC message to stdout."""
     body = json.dumps(msg)
     header = f"Content-Length: {len(body)}\r\n\r\n"
-    sys.stdout.buffer.write(header.encode("utf-8"))
-    sys.stdout.buffer.write(body.encode("utf-8"))
-    sys.stdout.buffer.flush()
+    with _write_lock:
+        sys.stdout.buffer.write(header.encode("utf-8"))
+        sys.stdout.buffer.write(body.encode("utf-8"))
+        sys.stdout.buffer.flush()
 
 
 def _respond(request_id: int | str | None, result: Any) -> None:
@@ -137,6 +153,45 @@ def _store_document(uri: str, text: str) -> None:
         _documents.pop(oldest)
 
 
+def _offset_at(text: str, position: dict[str, Any]) -> int:
+    """Return the string offset of an LSP ``Position`` in *text*.
+
+    Characters are counted as code points, as elsewhere in this module.
+    Positions past the end of a line or of the text are clamped.
+    """
+    offset = 0
+    for _ in range(position.get("line", 0)):
+        newline = text.find("\n", offset)
+        if newline < 0:
+            return len(text)
+        offset = newline + 1
+    end = text.find("\n", offset)
+    if end < 0:
+        end = len(text)
+    return min(offset + position.get("character", 0), end)
+
+
+def _apply_content_changes(
+    text: str,
+    changes: list[dict[str, Any]],
+) -> str:
+    """Apply ``didChange`` content changes to *text*, in order.
+
+    A change with a ``range`` replaces that span (incremental sync); one
+    without replaces the whole document.
+    """
+    for change in changes:
+        new_text = change.get("text", "")
+        span = change.get("range")
+        if span is None:
+            text = new_text
+            continue
+        start = _offset_at(text, span["start"])
+        end = _offset_at(text, span["end"])
+        text = text[:start] + new_text + text[max(start, end) :]
+    return text
+
+
 # ---------------------------------------------------------------------------
 # Go-to-definition: variable binding extraction
 # ---------------------------------------------------------------------------
@@ -329,17 +384,82 @@ def _handle_definition(
 # Diagnostics
 # ---------------------------------------------------------------------------
 
+_DIAGNOSTICS_DEBOUNCE_S = 0.2  # Quiet period after an edit before publishing
+_MAX_CACHED_STATEMENTS = 4096  # Per-statement diagnostics kept across edits
+
+# Tokens that may contain ``;`` without ending a statement, and ``;``
+# itself.  The regex engine skips ordinary text between them.
+_STATEMENT_TOKEN_RE = re.compile(
+    r"'(?:[^'\\\n]|\\.)*'"
+    r'|"(?:[^"\\\n]|\\.)*"'
+    r"|`[^`]*`"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/"
+    r"|;",
+    re.DOTALL,
+)
+_LEADING_TRIVIA_RE = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.DOTALL)
+
+
+@dataclass(frozen=True)
+class _Statement:
+    """One ``;``-separated statement of a document.
+
+    Attributes:
+        text: Statement text, from its first token to the last non-blank
+            character before the ``;`` (or the end of the document).
+        line: 0-based document line where *text* starts.
+        character: Column of that first character.
 
-def _publish_diagnostics(uri: str, text: str) -> None:
-    """Parse query text and publish diagnostics."""
+    """
+
+    text: str
+    line: int
+    character: int
+
+
+def _split_statements(text: str) -> list[_Statement]:
+    """Split a document into statements at top-level ``;``.
+
+    Semicolons inside strings, backquoted names and comments do not split.
+    Segments holding only whitespace and comments are dropped.
+    """
+    ends = [
+        m.start() for m in _STATEMENT_TOKEN_RE.finditer(text) if m[0] == ";"
+    ]
+    ends.append(len(text))
+    statements: list[_Statement] = []
+    start = 0
+    line = 0
+    counted = 0  # ``line`` is the line number of offset ``counted``
+    for end in ends:
+        code = _LEADING_TRIVIA_RE.match(text, start, end).end()
+        if code < end:
+            line += text.count("\n", counted, code)
+            counted = code
+            statements.append(
+                _Statement(
+                    text=text[code:end].rstrip(),
+                    line=line,
+                    character=code - (text.rfind("\n", 0, code) + 1),
+                ),
+            )
+        start = end + 1
+    return statements
+
+
+def _statement_diagnostics(text: str) -> list[dict[str, Any]]:
+    """Parse, validate and lint one statement.
+
+    Ranges are relative to the start of *text*.
+    """
     diagnostics: list[dict[str, Any]] = []
 
     # Try parsing
     try:
-        from pycypher.grammar_parser import GrammarParser
+        from pycypher.grammar_parser import get_default_parser
 
-        parser = GrammarParser()
-        ast = parser.parse(text)
+        ast = get_default_parser().parse(text)
 
         # Run semantic validation
         try:
@@ -376,11 +496,7 @@ def _publish_diagnostics(uri: str, text: str) -> None:
                     },
                 )
         except (ValueError, TypeError, KeyError, AttributeError, ImportError):
-            LOGGER.debug(
-                "Semantic validation failed for %s",
-                uri,
-                exc_info=True,
-            )
+            LOGGER.debug("Semantic validation failed", exc_info=True)
 
     except Exception as exc:  # noqa: BLE001 — LSP: report any error as diagnostic to editor
         # Parse error — report as error diagnostic
@@ -414,11 +530,11 @@ def _publish_diagnostics(uri: str, text: str) -> None:
             },
         )
 
-    # Lint warnings
+    # Lint warnings (the statement was parsed above)
     try:
         from pycypher.query_formatter import lint_query
 
-        for issue in lint_query(text):
+        for issue in lint_query(text, check_parse=False):
             if issue.severity == "warning":
                 diagnostics.append(
                     {
@@ -445,14 +561,163 @@ def _publish_diagnostics(uri: str, text: str) -> None:
         AttributeError,
         ImportError,
     ):
-        LOGGER.debug("Lint query failed for %s", uri, exc_info=True)
+        LOGGER.debug("Lint query failed", exc_info=True)
+
+    return diagnostics
+
+
+# Statement hash -> relative diagnostics, least recently used first.
+_statement_cache: collections.OrderedDict[bytes, list[dict[str, Any]]] = (
+    collections.OrderedDict()
+)
+_statement_cache_lock = threading.Lock()
+
+
+def _cached_statement_diagnostics(text: str) -> list[dict[str, Any]]:
+    """Return :func:`_statement_diagnostics` for *text*, from cache if seen."""
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    with _statement_cache_lock:
+        cached = _statement_cache.get(key)
+        if cached is not None:
+            _statement_cache.move_to_end(key)
+            return cached
+    diagnostics = _statement_diagnostics(text)
+    with _statement_cache_lock:
+        _statement_cache[key] = diagnostics
+        while len(_statement_cache) > _MAX_CACHED_STATEMENTS:
+            _statement_cache.popitem(last=False)
+    return diagnostics
+
+
+def _shift_position(
+    position: dict[str, int],
+    statement: _Statement,
+) -> dict[str, int]:
+    """Map a statement-relative position to a document position."""
+    line = position["line"]
+    character = position["character"]
+    if line == 0:
+        character += statement.character
+    return {"line": statement.line + line, "character": character}
+
+
+def _document_diagnostics(text: str) -> list[dict[str, Any]]:
+    """Return the diagnostics of every statement in a document."""
+    diagnostics: list[dict[str, Any]] = []
+    for statement in _split_statements(text):
+        for diag in _cached_statement_diagnostics(statement.text):
+            span = diag["range"]
+            diagnostics.append(
+                {
+                    **diag,
+                    "range": {
+                        "start": _shift_position(span["start"], statement),
+                        "end": _shift_position(span["end"], statement),
+                    },
+                },
+            )
+    return diagnostics
+
 
+def _publish_diagnostics(uri: str, text: str) -> None:
+    """Parse query text and publish diagnostics."""
     _notify(
         "textDocument/publishDiagnostics",
-        {"uri": uri, "diagnostics": diagnostics},
+        {"uri": uri, "diagnostics": _document_diagnostics(text)},
     )
 
 
+class _DiagnosticsWorker:
+    """Publish diagnostics on a background thread once edits pause.
+
+    :meth:`schedule` (called for every ``didOpen``/``didChange``) pushes
+    the document's deadline back by *delay* seconds; the worker publishes
+    when a deadline passes, using the document text current at that time.
+    Results for a document edited while they were computed are dropped —
+    the edit has already scheduled a newer run.
+
+    Args:
+        delay: Debounce delay in seconds.
+
+    """
+
+    def __init__(self, delay: float = _DIAGNOSTICS_DEBOUNCE_S) -> None:
+        self._delay = delay
+        self._due: dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="pycypher-lsp-diagnostics",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread and wait for it to exit."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+
+    def schedule(self, uri: str) -> None:
+        """Publish diagnostics for *uri* after the debounce delay."""
+        with self._cond:
+            self._due[uri] = time.monotonic() + self._delay
+            self._cond.notify()
+
+    def cancel(self, uri: str) -> None:
+        """Drop a pending run for *uri* (the document was closed)."""
+        with self._cond:
+            self._due.pop(uri, None)
+
+    def _next_uri(self) -> str | None:
+        """Wait for the earliest deadline; ``None`` once stopped."""
+        with self._cond:
+            while not self._stopped:
+                if not self._due:
+                    self._cond.wait()
+                    continue
+                uri, due = min(self._due.items(), key=lambda item: item[1])
+                remaining = due - time.monotonic()
+                if remaining <= 0:
+                    del self._due[uri]
+                    return uri
+                self._cond.wait(remaining)
+            return None
+
+    def _run(self) -> None:
+        while (uri := self._next_uri()) is not None:
+            text = _documents.get(uri)
+            if text is None:
+                continue
+            try:
+                diagnostics = _document_diagnostics(text)
+            except Exception:  # noqa: BLE001 — keep the worker alive
+                LOGGER.exception("Diagnostics failed for %s", uri)
+                continue
+            if _documents.get(uri) is text:
+                _notify(
+                    "textDocument/publishDiagnostics",
+                    {"uri": uri, "diagnostics": diagnostics},
+                )
+
+
+# Started by main(); without it, diagnostics are published synchronously.
+_diagnostics_worker: _DiagnosticsWorker | None = None
+
+
+def _schedule_diagnostics(uri: str, text: str) -> None:
+    """Publish diagnostics for a changed document, debounced if possible."""
+    if _diagnostics_worker is None:
+        _publish_diagnostics(uri, text)
+    else:
+        _diagnostics_worker.schedule(uri)
+
+
 # ---------------------------------------------------------------------------
 # Completion
 # ---------------------------------------------------------------------------
@@ -550,6 +815,9 @@ def _get_completions() -> list[dict[str, Any]]:
         "stDevP",
         "percentileDisc",
         "percentileCont",
+        "approxCountDistinct",
+        "approxPercentile",
+        "approxTopK",
     ]
     for func in _AGGREGATES:
         items.append(
@@ -704,6 +972,24 @@ _AGGREGATE_DOCS: dict[str, tuple[str, str, int, int | None]] = {
         2,
         2,
     ),
+    "approxcountdistinct": (
+        "Approximate distinct count (HyperLogLog)",
+        "approxCountDistinct(n.id)",
+        1,
+        1,
+    ),
+    "approxpercentile": (
+        "Approximate percentile (KLL sketch)",
+        "approxPercentile(n.score, 0.95)",
+        2,
+        2,
+    ),
+    "approxtopk": (
+        "Approximate most frequent values (SpaceSaving)",
+        "approxTopK(n.city, 10)",
+        1,
+        2,
+    ),
 }
 
 
@@ -861,7 +1147,7 @@ def _handle_message(msg: dict[str, Any]) -> None:
                 "capabilities": {
                     "textDocumentSync": {
                         "openClose": True,
-                        "change": 1,  # Full document sync
+                        "change": 2,  # Incremental document sync
                     },
                     "completionProvider": {
                         "triggerCharacters": [".", ":", "("],
@@ -888,21 +1174,23 @@ def _handle_message(msg: dict[str, Any]) -> None:
         uri = td.get("uri", "")
         text = td.get("text", "")
         _store_document(uri, text)
-        _publish_diagnostics(uri, text)
+        _schedule_diagnostics(uri, text)
 
     elif method == "textDocument/didChange":
         td = params.get("textDocument", {})
         uri = td.get("uri", "")
         changes = params.get("contentChanges", [])
         if changes:
-            text = changes[-1].get("text", "")
+            text = _apply_content_changes(_documents.get(uri, ""), changes)
             _store_document(uri, text)
-            _publish_diagnostics(uri, text)
+            _schedule_diagnostics(uri, text)
 
     elif method == "textDocument/didClose":
         td = params.get("textDocument", {})
         uri = td.get("uri", "")
         _documents.pop(uri, None)
+        if _diagnostics_worker is not None:
+            _diagnostics_worker.cancel(uri)
 
     elif method == "textDocument/completion":
         _respond(request_id, _get_completions())
@@ -957,7 +1245,11 @@ def _handle_message(msg: dict[str, Any]) -> None:
 
 def main() -> None:
     """Run the Cypher LSP server (stdin/stdout)."""
+    global _diagnostics_worker
+
     LOGGER.info("PyCypher LSP server starting...")
+    _diagnostics_worker = _DiagnosticsWorker()
+    _diagnostics_worker.start()
     while True:
         msg = _read_message()
         if msg is None:
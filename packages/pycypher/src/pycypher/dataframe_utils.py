@@ -47,3 +47,105 @@ def source_to_pandas(obj: Any) -> pd.DataFrame:
     ):
         return obj.to_pandas()
     return obj
+
+
+def source_column_names(obj: Any) -> list[str]:
+    """Return the column names of a ``pd.DataFrame`` or ``pyarrow.Table``.
+
+    Unlike ``source_to_pandas(obj).columns`` this never converts data.
+    """
+    if _PYARROW_TABLE_TYPE is not None and isinstance(
+        obj,
+        _PYARROW_TABLE_TYPE,
+    ):
+        return list(obj.column_names)
+    return list(obj.columns)
+
+
+def source_columns_to_pandas(obj: Any, columns: list[str]) -> pd.DataFrame:
+    """Convert only *columns* of *obj* to a pandas DataFrame.
+
+    Arrow tables are projected before conversion, so untouched columns are
+    never materialised.  Names absent from *obj* are skipped.
+    """
+    present = set(source_column_names(obj))
+    wanted = [c for c in columns if c in present]
+    if _PYARROW_TABLE_TYPE is not None and isinstance(
+        obj,
+        _PYARROW_TABLE_TYPE,
+    ):
+        return obj.select(wanted).to_pandas()
+    return obj[wanted]
+
+
+#: Cache-key tag for the bookkeeping entry of a partially converted frame.
+_PENDING_COLUMNS = "__pending_columns__"
+
+
+def indexed_source_frame(
+    cache: dict,
+    key: str,
+    source_obj: Any,
+    columns: list[str] | tuple[str, ...] | None = None,
+) -> pd.DataFrame:
+    """Return *source_obj* indexed by ``__ID__``, cached in *cache*.
+
+    Arrow sources are converted column by column: the cached frame starts
+    with just the ID index and gains each property column the first time a
+    caller asks for it.  ``columns=None`` asks for every column; an empty
+    sequence asks for the index only.  pandas sources (already
+    materialised) are indexed in full on first use, as are frames that some
+    other code path stored under *key* directly.
+
+    Args:
+        cache: The context's ``_property_lookup_cache``.
+        key: Cache key (entity type, or ``"__rel__" + type``).
+        source_obj: The table's ``source_obj``.
+        columns: Property columns the caller is about to read.
+
+    Returns:
+        A DataFrame indexed by ``__ID__`` containing at least *columns*
+        (those that exist in the source).
+
+    """
+    from pycypher.constants import ID_COLUMN
+
+    pending_key = (_PENDING_COLUMNS, key)
+    frame = cache.get(key)
+    if frame is None:
+        if _PYARROW_TABLE_TYPE is None or not isinstance(
+            source_obj,
+            _PYARROW_TABLE_TYPE,
+        ):
+            frame = source_to_pandas(source_obj).set_index(ID_COLUMN)
+            cache[key] = frame
+            return frame
+        frame = source_columns_to_pandas(source_obj, [ID_COLUMN]).set_index(
+            ID_COLUMN,
+        )
+        names = [c for c in source_obj.column_names if c != ID_COLUMN]
+        cache[key] = frame
+        cache[pending_key] = (names, names)
+
+    if pending_key not in cache:
+        return frame
+    names, pending = cache[pending_key]
+    wanted = (
+        list(pending)
+        if columns is None
+        else [c for c in pending if c in set(columns)]
+    )
+    if not wanted:
+        return frame
+
+    extra = source_columns_to_pandas(source_obj, wanted)
+    extra.index = frame.index
+    have = set(frame.columns) | set(wanted)
+    frame = pd.concat([frame, extra], axis=1)[[c for c in names if c in have]]
+    remaining = [c for c in pending if c not in set(wanted)]
+    cache[key] = frame
+    if remaining:
+        cache[pending_key] = (names, remaining)
+    else:
+        del cache[pending_key]
+    return frame
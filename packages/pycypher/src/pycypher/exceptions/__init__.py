@@ -39,6 +39,7 @@ from pycypher.exceptions.runtime import (
     InvalidCastError,
     MissingParameterError,
     PatternComprehensionError,
+    QueryCancelledError,
     QueryComplexityError,
     QueryMemoryBudgetError,
     QueryTimeoutError,
@@ -72,6 +73,7 @@ __all__ = [
     "InvalidCastError",
     "MissingParameterError",
     "PatternComprehensionError",
+    "QueryCancelledError",
     "QueryComplexityError",
     "QueryMemoryBudgetError",
     "QueryTimeoutError",
@@ -20,6 +20,7 @@ _DOCS_BASE_URL = "https://pycypher.readthedocs.io/en/latest"
 _DOCS_ANCHORS: dict[str, str] = {
     "CypherSyntaxError": "/user_guide/error_handling.html#cyphersyntaxerror",
     "QueryTimeoutError": "/user_guide/error_handling.html#querytimeouterror",
+    "QueryCancelledError": "/user_guide/error_handling.html#querytimeouterror",
     "QueryMemoryBudgetError": "/user_guide/error_handling.html#querymemorybudgeterror",
     "VariableNotFoundError": "/user_guide/error_handling.html#variablenotfounderror",
     "UnsupportedFunctionError": "/user_guide/error_handling.html#unsupportedfunctionerror",
@@ -559,6 +559,49 @@ class QueryTimeoutError(TimeoutError):
         )
 
 
+class QueryCancelledError(RuntimeError):
+    """Exception raised when a query is cancelled through its token.
+
+    Raised at the next cooperative check — between clauses, BFS hops, or
+    the chunks of a long join or aggregation — after
+    :meth:`~pycypher.cancellation.CancellationToken.cancel` was called.
+
+    Attributes:
+        reason: The reason passed to ``cancel()``.
+        query_fragment: Truncated query text for diagnostics.
+
+    """
+
+    def __init__(self, reason: str = "", query_fragment: str = "") -> None:
+        """Initialize with cancellation details.
+
+        Args:
+            reason: Why the query was cancelled.
+            query_fragment: Truncated query text for diagnostics.
+
+        """
+        self.reason = reason
+        self.query_fragment = query_fragment
+
+        message = "Query cancelled"
+        if reason:
+            message += f": {reason}"
+        if query_fragment:
+            short = (
+                query_fragment[:80] + "..."
+                if len(query_fragment) > 80
+                else query_fragment
+            )
+            message += f". Query: {short!r}"
+        message += _docs_hint("QueryCancelledError")
+
+        super().__init__(message)
+
+    def __repr__(self) -> str:
+        """Return a repr exposing structured attributes for REPL inspection."""
+        return f"QueryCancelledError(reason={self.reason!r})"
+
+
 class QueryMemoryBudgetError(MemoryError):
     """Exception raised when a query's estimated memory exceeds the budget.
 
@@ -2,7 +2,8 @@
 
 ``Context`` (``relational_models.py``) is constructed once and shared for the
 lifetime of a ``Star`` instance. Query-scoped state (bound parameters, the
-mutation shadow layer, the query timeout deadline) used to live directly on
+mutation shadow layer, the query timeout deadline, the cancellation token and
+progress reporter) used to live directly on
 ``Context`` as mutable attributes, which races when two ``execute_query()``
 calls run concurrently on the same ``Star`` (threads, or
 ``execute_query_async`` via ``asyncio.to_thread``).
@@ -21,10 +22,13 @@ from __future__ import annotations
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, Iterator
 
 import pandas as pd
 
+if TYPE_CHECKING:
+    from pycypher.cancellation import CancellationToken, ProgressReporter
+
 
 @dataclass
 class ExecutionScope:
@@ -36,6 +40,8 @@ class ExecutionScope:
     shadow_rels: dict[str, pd.DataFrame] = field(default_factory=dict)
     query_deadline: float | None = None
     query_timeout_seconds: float | None = None
+    cancel_token: CancellationToken | None = None
+    progress: ProgressReporter | None = None
 
 
 #: A ``ContextVar`` holding the active scope for one ``Context`` instance.
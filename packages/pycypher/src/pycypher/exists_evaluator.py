@@ -6,8 +6,12 @@ focused, independently testable module.
 
 Handles:
 
-- ``EXISTS { (a)-[:TYPE]->(b) }`` — single-hop pattern existence check
+- ``EXISTS { (a)-[:TYPE]->(b) }`` — single-hop pattern existence check,
+  answered as a semi-join against the degree index / relationship table
 - ``EXISTS { MATCH ... WHERE ... }`` — full subquery existence check
+- ``COUNT { ... }`` — per-row match counts of a pattern or subquery
+- :class:`~pycypher.ast_models.PatternDegree` — vectorized degree lookups
+  (see :mod:`pycypher.pattern_degree`)
 - ``[(a)-[:TYPE]->(b) WHERE pred | expr]`` — pattern comprehensions
 """
 
@@ -22,19 +26,26 @@ from shared.logger import LOGGER
 
 from pycypher.constants import _broadcast_series
 from pycypher.cypher_types import FrameSeries
+from pycypher.dataframe_utils import source_columns_to_pandas
 from pycypher.exceptions import PatternComprehensionError
 from pycypher.relational_models import (
+    ID_COLUMN,
     RELATIONSHIP_SOURCE_COLUMN,
     RELATIONSHIP_TARGET_COLUMN,
 )
 
 if TYPE_CHECKING:
-    from pycypher.ast_models import PatternComprehension
+    from pycypher.ast_models import (
+        Pattern,
+        PatternComprehension,
+        PatternDegree,
+    )
     from pycypher.binding_frame import BindingFrame
     from pycypher.evaluator_protocol import (
         ExpressionEvaluatorFactory,
         ExpressionEvaluatorProtocol,
     )
+    from pycypher.graph_index import DegreeIndex
 
 _DEBUG_ENABLED: bool = LOGGER.isEnabledFor(logging.DEBUG)
 
@@ -126,6 +137,16 @@ class ExistsEvaluator:
         if not isinstance(content, Pattern):
             return _broadcast_series(False, len(self.frame.bindings))
 
+        # Single hop from one bound node, or between two: a semi-join.
+        from pycypher.pattern_degree import degree_pattern
+
+        degree = degree_pattern(content)
+        if degree is not None:
+            return self.evaluate_degree(degree) > 0
+        paired = self._exists_between_bound_nodes(content)
+        if paired is not None:
+            return paired
+
         # Multi-hop patterns: fall back to full MATCH execution.
         if (
             content.paths
@@ -181,6 +202,25 @@ class ExistsEvaluator:
         Returns:
             A ``pd.Series`` of ``bool`` values, one per row in ``self.frame``.
 
+        """
+        n_rows = len(self.frame.bindings)
+        matched = np.unique(self._matched_rows_via_query_execution(subquery))
+        return pd.Series(
+            np.isin(np.arange(n_rows), matched),
+            dtype=bool,
+            index=self.frame.bindings.index,
+        )
+
+    def _matched_rows_via_query_execution(self, subquery: Any) -> np.ndarray:
+        """Return the outer row of every row *subquery* produces.
+
+        Args:
+            subquery: A :class:`~pycypher.ast_models.Query` to execute.
+
+        Returns:
+            Positions into ``self.frame``, one per inner result row (so a
+            row with *k* inner matches appears *k* times).
+
         """
         from pycypher.ast_models import (
             Query,
@@ -192,7 +232,6 @@ class ExistsEvaluator:
         from pycypher.binding_frame import BindingFrame
 
         n_rows = len(self.frame.bindings)
-        orig_index = self.frame.bindings.index
         sentinel = _EXISTS_SENTINEL
 
         augmented_bindings = self.frame.bindings.assign(
@@ -233,15 +272,206 @@ class ExistsEvaluator:
         )
 
         if result_df.empty or sentinel not in result_df.columns:
-            return _broadcast_series(False, n_rows, index=orig_index)
+            return np.zeros(0, dtype=np.intp)
+        return result_df[sentinel].dropna().to_numpy(dtype=np.intp)
 
-        matched = result_df[sentinel].dropna().astype(int).unique()
-        all_indices = np.arange(n_rows)
+    # ------------------------------------------------------------------
+    # COUNT subquery and degree lookups
+    # ------------------------------------------------------------------
+
+    def evaluate_count(
+        self, content: Any, evaluator: ExpressionEvaluatorProtocol
+    ) -> FrameSeries:
+        """Evaluate a ``COUNT { ... }`` subquery.
+
+        Degree-only patterns are answered by :meth:`evaluate_degree`;
+        anything else runs once for the whole frame, like ``EXISTS``, and
+        counts the inner rows traced back to each outer row.
+
+        Args:
+            content: A :class:`~pycypher.ast_models.Pattern` or
+                :class:`~pycypher.ast_models.Query`.
+            evaluator: The parent :class:`BindingExpressionEvaluator`.
+
+        Returns:
+            A ``pd.Series`` of ``int`` counts, one per row.
+
+        """
+        from pycypher.ast_models import Match, Pattern, Query
+        from pycypher.pattern_degree import degree_pattern
+
+        n_rows = len(self.frame.bindings)
+        if isinstance(content, Pattern):
+            degree = degree_pattern(content)
+            if degree is not None:
+                return self.evaluate_degree(degree)
+            content = Query(clauses=[Match(pattern=content, where=None)])
+        if not isinstance(content, Query):
+            return _broadcast_series(
+                0,
+                n_rows,
+                index=self.frame.bindings.index,
+            )
+        rows = self._matched_rows_via_query_execution(content)
         return pd.Series(
-            np.isin(all_indices, matched),
-            dtype=bool,
-            index=orig_index,
+            np.bincount(rows, minlength=n_rows).astype(np.int64),
+            index=self.frame.bindings.index,
+        )
+
+    def evaluate_degree(self, degree: PatternDegree) -> FrameSeries:
+        """Evaluate a :class:`~pycypher.ast_models.PatternDegree` lookup.
+
+        Sums the :class:`~pycypher.graph_index.DegreeIndex` degrees of the
+        bound node over the pattern's relationship types (every type when
+        none is given).  Unbound, null and unknown nodes have degree 0.
+
+        Returns:
+            A ``pd.Series`` of ``int`` degrees, one per row.
+
+        """
+        bindings = self.frame.bindings
+        var = degree.variable.name
+        degrees = np.zeros(len(bindings), dtype=np.int64)
+        if var in bindings.columns:
+            node_ids = bindings[var].to_numpy()
+            rel_types = degree.rel_types or list(
+                self.frame.context.relationship_mapping.mapping,
+            )
+            for rel_type in dict.fromkeys(rel_types):
+                index = self._degree_index(
+                    rel_type,
+                    degree.direction,
+                    degree.neighbor_label,
+                )
+                if index is not None:
+                    degrees += index.lookup(node_ids)
+        return pd.Series(degrees, index=bindings.index)
+
+    def _relationship_endpoints(self, rel_type: str) -> pd.DataFrame | None:
+        """Return *rel_type*'s endpoint columns, including pending writes."""
+        context = self.frame.context
+        columns = [RELATIONSHIP_SOURCE_COLUMN, RELATIONSHIP_TARGET_COLUMN]
+        shadow_rels = getattr(context, "_shadow_rels", {})
+        if rel_type in shadow_rels:
+            return shadow_rels[rel_type][columns]
+        rel_mapping = context.relationship_mapping.mapping
+        if rel_type not in rel_mapping:
+            return None
+        return source_columns_to_pandas(
+            rel_mapping[rel_type].source_obj,
+            columns,
+        )
+
+    def _degree_index(
+        self,
+        rel_type: str,
+        direction: str,
+        neighbor_label: str | None,
+    ) -> DegreeIndex | None:
+        """Return the degree index, built uncached over pending writes."""
+        from pycypher.graph_index import DegreeIndex
+
+        context = self.frame.context
+        shadow = getattr(context, "_shadow", {})
+        if rel_type not in getattr(context, "_shadow_rels", {}) and (
+            neighbor_label not in shadow
+        ):
+            return context.index_manager.get_degree_index(
+                rel_type,
+                direction,
+                neighbor_label,
+            )
+        endpoints = self._relationship_endpoints(rel_type)
+        if endpoints is None:
+            return None
+        neighbor_ids = None
+        if neighbor_label is not None:
+            if neighbor_label in shadow:
+                entities = shadow[neighbor_label]
+            else:
+                entity_mapping = context.entity_mapping.mapping
+                entities = (
+                    source_columns_to_pandas(
+                        entity_mapping[neighbor_label].source_obj,
+                        [ID_COLUMN],
+                    )
+                    if neighbor_label in entity_mapping
+                    else pd.DataFrame({ID_COLUMN: []})
+                )
+            neighbor_ids = entities[ID_COLUMN].to_numpy()
+        return DegreeIndex.build(
+            rel_type,
+            direction,
+            endpoints,
+            neighbor_label=neighbor_label,
+            neighbor_ids=neighbor_ids,
+        )
+
+    def _exists_between_bound_nodes(
+        self,
+        pattern: Pattern,
+    ) -> FrameSeries | None:
+        """Semi-join ``EXISTS { (a)-[:R]->(b) }`` with *a* and *b* bound.
+
+        Returns:
+            Per-row booleans, or ``None`` when *pattern* is not a single
+            plain hop between two bare variables of the frame.
+
+        """
+        from pycypher.ast_models import (
+            NodePattern,
+            RelationshipDirection,
+            RelationshipPattern,
+        )
+        from pycypher.graph_index import _coerce_query_ids
+
+        if len(pattern.paths) != 1 or len(pattern.paths[0].elements) != 3:
+            return None
+        first, rel, last = pattern.paths[0].elements
+        bindings = self.frame.bindings
+        nodes = [first, last]
+        if not (
+            isinstance(rel, RelationshipPattern)
+            and rel.variable is None
+            and not rel.properties
+            and rel.length is None
+            and rel.where is None
+            and all(
+                isinstance(node, NodePattern)
+                and node.variable is not None
+                and node.variable.name in bindings.columns
+                and not node.labels
+                and not node.properties
+                for node in nodes
+            )
+        ):
+            return None
+
+        first_ids = bindings[first.variable.name].to_numpy()
+        last_ids = bindings[last.variable.name].to_numpy()
+        rel_types = rel.labels or list(
+            self.frame.context.relationship_mapping.mapping,
         )
+        found = np.zeros(len(bindings), dtype=bool)
+        for rel_type in dict.fromkeys(rel_types):
+            endpoints = self._relationship_endpoints(rel_type)
+            if endpoints is None or endpoints.empty:
+                continue
+            src = endpoints[RELATIONSHIP_SOURCE_COLUMN].to_numpy()
+            tgt = endpoints[RELATIONSHIP_TARGET_COLUMN].to_numpy()
+            if src.dtype != first_ids.dtype:
+                first_ids = _coerce_query_ids(src, first_ids)
+                last_ids = _coerce_query_ids(src, last_ids)
+            edges = pd.MultiIndex.from_arrays([src, tgt])
+            if rel.direction != RelationshipDirection.LEFT:
+                found |= pd.MultiIndex.from_arrays(
+                    [first_ids, last_ids],
+                ).isin(edges)
+            if rel.direction != RelationshipDirection.RIGHT:
+                found |= pd.MultiIndex.from_arrays(
+                    [last_ids, first_ids],
+                ).isin(edges)
+        return pd.Series(found, dtype=bool, index=bindings.index)
 
     # ------------------------------------------------------------------
     # Pattern comprehension
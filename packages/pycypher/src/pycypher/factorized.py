@@ -0,0 +1,443 @@
+"""Factorized representation of acyclic MATCH results.
+
+A MATCH over a tree-shaped pattern such as ``(s:State)<-[:IN_STATE]-(t)
+<-[:LIVES_IN]-(p)`` flattens to one row per ``(s, t, p)`` combination, so
+its size is the *product* of the fan-outs.  When the query only
+aggregates — ``RETURN s.name, count(p)`` — none of those rows is needed:
+the count of ``p`` per ``s`` is a sum of products over the tree, computed
+from the base relations alone.
+
+:class:`FactorizedFrame` keeps a MATCH result in that form (an
+*f-representation*): the semi-join-reduced base relations of the pattern
+(see :mod:`~pycypher.semi_join`), whose total size is linear in the input.
+Rooting the pattern tree at any node variable ``g``:
+
+- :meth:`FactorizedFrame.weights` — the number of flat rows per ``g`` ID,
+  i.e. ``count(*)`` grouped by ``g``, as products of per-branch sums;
+- :meth:`FactorizedFrame.pair_weights` — the number of flat rows per
+  ``(g, v)`` pair, from which weighted ``count``/``sum``/``avg`` and plain
+  ``min``/``max``/``count(DISTINCT …)`` over ``v`` follow;
+- :meth:`FactorizedFrame.flatten` — the ordinary
+  :class:`~pycypher.binding_frame.BindingFrame`, only built when a RETURN
+  needs the rows.
+
+:func:`plan_factorized_return` decides which RETURN clauses can be answered
+from the weights: every grouping key depends on one node variable, and
+every aggregate is ``count(*)`` or ``count``/``sum``/``avg``/``min``/``max``
+(or ``count(DISTINCT …)``) of an expression over a single node variable.
+``RETURN DISTINCT`` over one variable's properties qualifies too.
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from pycypher.binding_frame import BindingFrame
+
+if TYPE_CHECKING:
+    from pycypher.generic_join import PatternGraph
+    from pycypher.relational_models import Context
+
+__all__ = [
+    "FactorizedAggregate",
+    "FactorizedFrame",
+    "FactorizedReturn",
+    "plan_factorized_return",
+]
+
+#: Aggregates computed from factorized weights.
+FACTORIZED_AGGREGATIONS: frozenset[str] = frozenset(
+    {"count", "sum", "avg", "min", "max"},
+)
+
+_ORIGIN_COLUMN = "__origin__"
+_WEIGHT_COLUMN = "__weight__"
+
+
+def _sum_by(codes: np.ndarray, weights: np.ndarray, n: int) -> np.ndarray:
+    """Sum integer *weights* per code in ``range(n)``."""
+    return np.bincount(codes, weights=weights, minlength=n).astype(np.int64)
+
+
+@dataclass
+class _RootedTree:
+    """The pattern tree hung from one root variable, with subtree weights.
+
+    Attributes:
+        hops: ``(parent, child, relation index)`` in breadth-first order.
+        parent: Child variable → ``(parent, relation index)``.
+        subtree: Flat rows of each variable's subtree, per ID.
+        branch: Flat rows contributed by the ``child`` branch, per
+            ``parent`` ID, keyed ``(parent, child)``.
+
+    """
+
+    hops: list[tuple[str, str, int]]
+    parent: dict[str, tuple[str, int]]
+    subtree: dict[str, pd.Series] = field(default_factory=dict)
+    branch: dict[tuple[str, str], pd.Series] = field(default_factory=dict)
+
+
+@dataclass
+class FactorizedFrame:
+    """MATCH result of an acyclic pattern, kept as reduced base relations.
+
+    Attributes:
+        graph: The pattern, flattened into node variables and hops.
+        relations: Semi-join-reduced base relations: node scans and
+            self-loops (one node variable) and relationship scans (two).
+        ids: IDs of each node variable that take part in a full match.
+        context: The query context, for evaluating expressions.
+
+    """
+
+    graph: PatternGraph
+    relations: list[pd.DataFrame]
+    ids: dict[str, np.ndarray]
+    context: Context
+    _trees: dict[str, _RootedTree] = field(default_factory=dict, repr=False)
+
+    @cached_property
+    def _unary(self) -> dict[str, list[pd.DataFrame]]:
+        node_vars = set(self.graph.node_vars)
+        unary: dict[str, list[pd.DataFrame]] = {}
+        for frame in self.relations:
+            bound = [c for c in frame.columns if c in node_vars]
+            if len(bound) == 1:
+                unary.setdefault(bound[0], []).append(frame)
+        return unary
+
+    @cached_property
+    def _adjacency(self) -> dict[str, list[tuple[str, int]]]:
+        node_vars = set(self.graph.node_vars)
+        adjacency: dict[str, list[tuple[str, int]]] = {}
+        for index, frame in enumerate(self.relations):
+            bound = [c for c in frame.columns if c in node_vars]
+            if len(bound) == 2:
+                src, tgt = bound
+                adjacency.setdefault(src, []).append((tgt, index))
+                adjacency.setdefault(tgt, []).append((src, index))
+        return adjacency
+
+    def __len__(self) -> int:
+        """Number of rows the flattened frame would have."""
+        return int(self.weights(self.graph.node_vars[0]).sum())
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the reduced base relations."""
+        return int(
+            sum(f.memory_usage(deep=True).sum() for f in self.relations)
+            + sum(ids.nbytes for ids in self.ids.values()),
+        )
+
+    def _multiplicity(self, var: str) -> pd.Series:
+        """Rows of *var*'s node relations and self-loops, per ID."""
+        counts = pd.Series(1, index=self.ids[var], dtype=np.int64)
+        for frame in self._unary.get(var, []):
+            counts = counts * frame[var].value_counts().reindex(
+                counts.index,
+                fill_value=0,
+            )
+        return counts
+
+    def _tree(self, root: str) -> _RootedTree:
+        """Hang the pattern from *root* and weigh every subtree."""
+        tree = self._trees.get(root)
+        if tree is not None:
+            return tree
+        hops: list[tuple[str, str, int]] = []
+        parent: dict[str, tuple[str, int]] = {}
+        queue, visited = [root], {root}
+        while queue:
+            var = queue.pop(0)
+            for neighbour, index in self._adjacency.get(var, []):
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    hops.append((var, neighbour, index))
+                    parent[neighbour] = (var, index)
+                    queue.append(neighbour)
+        tree = _RootedTree(hops=hops, parent=parent)
+        for var in self.graph.node_vars:
+            tree.subtree[var] = self._multiplicity(var)
+        # Children before parents: each branch sums its child's subtree
+        # weights per parent ID, and a subtree is the product of branches.
+        for up, down, index in reversed(hops):
+            edges = self.relations[index]
+            below = tree.subtree[down]
+            reached = below.to_numpy()[below.index.get_indexer(edges[down])]
+            ids = tree.subtree[up].index
+            branch = pd.Series(
+                _sum_by(ids.get_indexer(edges[up]), reached, len(ids)),
+                index=ids,
+            )
+            tree.branch[(up, down)] = branch
+            tree.subtree[up] = tree.subtree[up] * branch
+        self._trees[root] = tree
+        return tree
+
+    def weights(self, root: str) -> pd.Series:
+        """Return the number of flat rows per ID of *root*.
+
+        Args:
+            root: A node variable of the pattern.
+
+        Returns:
+            ``int64`` Series indexed by the surviving IDs of *root*.
+
+        """
+        return self._tree(root).subtree[root]
+
+    def pair_weights(
+        self,
+        root: str,
+        var: str,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the number of flat rows per ``(root, var)`` ID pair.
+
+        Walks the tree path from *var* up to *root*, joining one relation
+        per hop and multiplying in the weight of every side branch, so
+        only the pairs that occur are ever built.
+
+        Args:
+            root: A node variable of the pattern.
+            var: Another (or the same) node variable.
+
+        Returns:
+            ``(root_ids, var_ids, weights)``, one entry per pair with a
+            non-zero weight.
+
+        """
+        tree = self._tree(root)
+        if var == root:
+            weights = tree.subtree[root]
+            ids = weights.index.to_numpy()
+            return ids, ids, weights.to_numpy()
+        below = tree.subtree[var]
+        pairs = pd.DataFrame(
+            {
+                _ORIGIN_COLUMN: below.index.to_numpy(),
+                var: below.index.to_numpy(),
+                _WEIGHT_COLUMN: below.to_numpy(),
+            },
+        )
+        node = var
+        while node != root:
+            up, index = tree.parent[node]
+            pairs = self.relations[index][[up, node]].merge(pairs, on=node)
+            side = self._multiplicity(up)
+            for other, _ in self._adjacency.get(up, []):
+                if (up, other) in tree.branch and other != node:
+                    side = side * tree.branch[(up, other)]
+            weights = (
+                pairs[_WEIGHT_COLUMN].to_numpy()
+                * side.to_numpy()[side.index.get_indexer(pairs[up])]
+            )
+            # Sum the weights per (up, origin) pair over combined codes.
+            up_codes, up_ids = pd.factorize(pairs[up])
+            origin_codes, origin_ids = pd.factorize(pairs[_ORIGIN_COLUMN])
+            pair_codes, pair_keys = pd.factorize(
+                up_codes * len(origin_ids) + origin_codes,
+            )
+            pairs = pd.DataFrame(
+                {
+                    up: up_ids[pair_keys // len(origin_ids)],
+                    _ORIGIN_COLUMN: origin_ids[pair_keys % len(origin_ids)],
+                    _WEIGHT_COLUMN: _sum_by(
+                        pair_codes,
+                        weights,
+                        len(pair_keys),
+                    ),
+                },
+            )
+            node = up
+        return (
+            pairs[root].to_numpy(),
+            pairs[_ORIGIN_COLUMN].to_numpy(),
+            pairs[_WEIGHT_COLUMN].to_numpy(dtype=np.int64),
+        )
+
+    def node_frame(self, var: str, ids: Any = None) -> BindingFrame:
+        """Return a one-column BindingFrame binding *var* to *ids*.
+
+        Args:
+            var: A node variable of the pattern.
+            ids: IDs to bind, in order; defaults to the surviving IDs.
+
+        Returns:
+            A BindingFrame typed by the variable's label.
+
+        """
+        label = self.graph.type_registry.get(var)
+        return BindingFrame(
+            bindings=pd.DataFrame(
+                {var: self.ids[var] if ids is None else ids},
+            ),
+            type_registry={} if label is None else {var: label},
+            context=self.context,
+        )
+
+    def flatten(self) -> BindingFrame:
+        """Join the reduced relations into the flat BindingFrame."""
+        root = self.graph.node_vars[0]
+        df = pd.DataFrame({root: self.ids[root]})
+        for frame in self._unary.get(root, []):
+            df = df.merge(frame, on=root)
+        for up, down, index in self._tree(root).hops:
+            df = df.merge(self.relations[index], on=up)
+            for frame in self._unary.get(down, []):
+                df = df.merge(frame, on=down)
+        columns = [c for c in self.graph.columns if c in df.columns]
+        return BindingFrame(
+            bindings=df[columns].reset_index(drop=True),
+            type_registry=dict(self.graph.type_registry),
+            context=self.context,
+        )
+
+
+# ---------------------------------------------------------------------------
+# RETURN planning
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class FactorizedAggregate:
+    """One aggregate RETURN item answered from factorized weights.
+
+    Attributes:
+        alias: Output column.
+        function: Lower-case aggregate name, one of
+            :data:`FACTORIZED_AGGREGATIONS`.
+        argument: Aggregated expression, or ``None`` for ``count(*)``.
+        variable: The node variable *argument* depends on.
+        distinct: Whether the aggregate is ``count(DISTINCT …)``.
+
+    """
+
+    alias: str
+    function: str
+    argument: Any = None
+    variable: str | None = None
+    distinct: bool = False
+
+
+@dataclass(frozen=True)
+class FactorizedReturn:
+    """A RETURN clause that a :class:`FactorizedFrame` can answer.
+
+    Attributes:
+        group_var: The node variable every grouping key depends on, or
+            ``None`` for a full-table aggregation.
+        keys: The non-aggregate RETURN items.
+        aggregates: The aggregate RETURN items.
+
+    """
+
+    group_var: str | None
+    keys: list[Any]
+    aggregates: list[FactorizedAggregate]
+
+
+def _factorized_aggregate(
+    item: Any,
+    node_vars: set[str] | None,
+) -> FactorizedAggregate | None:
+    from pycypher.ast_models import (
+        CountStar,
+        FunctionInvocation,
+        extract_referenced_variables,
+    )
+    from pycypher.constants import _normalize_func_args
+
+    if isinstance(item.expression, CountStar):
+        return FactorizedAggregate(alias=item.alias, function="count")
+    expr = item.expression
+    if not isinstance(expr, FunctionInvocation) or not isinstance(
+        expr.function_name,
+        str,
+    ):
+        return None
+    function = expr.function_name.lower()
+    arguments = expr.arguments or {}
+    distinct = bool(
+        isinstance(arguments, dict) and arguments.get("distinct", False),
+    )
+    args = _normalize_func_args(arguments)
+    if (
+        function not in FACTORIZED_AGGREGATIONS
+        or len(args) != 1
+        or (distinct and function != "count")
+    ):
+        return None
+    refs = extract_referenced_variables(args[0])
+    if len(refs) != 1 or (node_vars is not None and not refs <= node_vars):
+        return None
+    return FactorizedAggregate(
+        alias=item.alias,
+        function=function,
+        argument=args[0],
+        variable=next(iter(refs)),
+        distinct=distinct,
+    )
+
+
+def plan_factorized_return(
+    return_clause: Any,
+    contains_aggregation: Callable[[Any], bool],
+    node_vars: set[str] | None = None,
+) -> FactorizedReturn | None:
+    """Decide whether *return_clause* can be answered without flattening.
+
+    Args:
+        return_clause: AST ``Return`` node whose items have aliases.
+        contains_aggregation: Predicate telling aggregate expressions apart.
+        node_vars: The pattern's node variables, when known; aggregates
+            and keys must then depend on one of them.
+
+    Returns:
+        The plan, or ``None`` when the RETURN needs the flat rows.
+
+    """
+    from pycypher.ast_models import extract_referenced_variables
+
+    items = return_clause.items
+    if not items:
+        return None
+    keys: list[Any] = []
+    aggregates: list[FactorizedAggregate] = []
+    group_vars: set[str] = set()
+    for item in items:
+        if contains_aggregation(item.expression):
+            aggregate = _factorized_aggregate(item, node_vars)
+            if aggregate is None:
+                return None
+            aggregates.append(aggregate)
+        else:
+            refs = extract_referenced_variables(item.expression)
+            if len(refs) != 1:
+                return None
+            keys.append(item)
+            group_vars |= refs
+    if len(group_vars) > 1 or (
+        node_vars is not None and not group_vars <= node_vars
+    ):
+        return None
+    # Without aggregates only the set of distinct keys can be produced.
+    if not aggregates and not return_clause.distinct:
+        return None
+    aliases = {item.alias for item in items}
+    for order_item in return_clause.order_by or []:
+        if not extract_referenced_variables(order_item.expression) <= aliases:
+            return None
+    return FactorizedReturn(
+        group_var=next(iter(group_vars), None),
+        keys=keys,
+        aggregates=aggregates,
+    )
@@ -0,0 +1,207 @@
+"""On-disk cache of compiled Lark parsers.
+
+Compiling the Cypher grammar into an Earley parser takes 0.4-0.9 s and
+dominates the first parse of every process.  Lark's own ``cache=`` option
+only supports LALR, and Lark cannot serialize an Earley parser to plain
+data, so :func:`load_parser` pickles the compiled parser instead, storing
+the Python modules it references (the lexer's ``re`` module) by name.
+
+Cache files are keyed by a digest of the grammar text, the Lark options,
+the Lark version and the Python version, so a stale file is never read.
+Each file starts with a header holding that digest and a SHA-256 of the
+pickle, and is rejected unless both match.  Because unpickling runs code,
+the unpickler only resolves Lark's own classes and the handful of
+callables a compiled parser references; anything else in the file is
+refused rather than imported.  Any problem reading or writing the cache
+falls back to compiling.
+
+Example::
+
+    from pycypher.grammar_cache import load_parser
+
+    parser = load_parser(grammar, parser="earley", ambiguity="explicit")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+import types
+from pathlib import Path
+from typing import Any
+
+import lark
+from lark import Lark
+from shared.logger import LOGGER
+
+__all__ = ["cache_path", "load_parser"]
+
+#: Bump when the pickle layout changes in a way the digest cannot see.
+_FORMAT_VERSION = 2
+
+_MAGIC = b"pycypher-grammar\n"
+_DIGEST_CHARS = 32
+
+#: Non-Lark globals a pickled parser may reference.
+_ALLOWED_GLOBALS = frozenset(
+    {
+        ("re", "_compile"),
+        ("functools", "partial"),
+    },
+)
+
+
+class _Pickler(pickle.Pickler):
+    """Pickler that stores module objects as references by name."""
+
+    def persistent_id(self, obj: Any) -> tuple[str, str] | None:
+        if isinstance(obj, types.ModuleType):
+            return ("module", obj.__name__)
+        return None
+
+
+def _is_lark_module(name: str) -> bool:
+    return name == "lark" or name.startswith("lark.")
+
+
+def _public_getattr(obj: Any, name: str) -> Any:
+    """``getattr`` limited to public attributes of Lark objects.
+
+    Pickled bound methods (the Earley matcher's ``match``) are rebuilt
+    through ``getattr``; an unrestricted one would reach any module.
+    """
+    if name.startswith("_") or not _is_lark_module(type(obj).__module__):
+        msg = f"refusing getattr({type(obj).__name__}, {name!r})"
+        raise pickle.UnpicklingError(msg)
+    return getattr(obj, name)
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler that only resolves what a compiled Lark parser needs.
+
+    Modules stored by :class:`_Pickler` are re-imported when they are
+    ``re`` or part of Lark; globals must be classes defined by Lark or one
+    of :data:`_ALLOWED_GLOBALS`.
+    """
+
+    def persistent_load(self, pid: Any) -> types.ModuleType:
+        kind, name = pid
+        if kind != "module" or not (name == "re" or _is_lark_module(name)):
+            msg = f"unsupported persistent id {pid!r}"
+            raise pickle.UnpicklingError(msg)
+        return importlib.import_module(name)
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) == ("builtins", "getattr"):
+            return _public_getattr
+        if (module, name) in _ALLOWED_GLOBALS:
+            return super().find_class(module, name)
+        if _is_lark_module(module) and "." not in name:
+            obj = getattr(importlib.import_module(module), name, None)
+            if isinstance(obj, type) and _is_lark_module(obj.__module__):
+                return obj
+        msg = f"refusing to load {module}.{name}"
+        raise pickle.UnpicklingError(msg)
+
+
+def cache_path(grammar: str, **options: Any) -> Path | None:
+    """Return the cache file for *grammar* and *options*.
+
+    Args:
+        grammar: Lark grammar text.
+        **options: Keyword arguments passed to :class:`lark.Lark`.
+
+    Returns:
+        The cache file path, or ``None`` when
+        ``PYCYPHER_GRAMMAR_CACHE_DIR`` is empty (cache disabled).
+
+    """
+    from pycypher import config
+
+    directory = config.GRAMMAR_CACHE_DIR
+    if not directory:
+        return None
+    key = "\0".join(
+        [
+            grammar,
+            repr(sorted(options.items())),
+            lark.__version__,
+            sys.version,
+            str(_FORMAT_VERSION),
+        ],
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:_DIGEST_CHARS]
+    return Path(directory) / f"grammar-{digest}.pickle"
+
+
+def _header(path: Path, payload: bytes) -> bytes:
+    """Return the header binding *payload* to the cache key of *path*."""
+    key = path.stem.removeprefix("grammar-").encode("ascii")
+    return _MAGIC + key + hashlib.sha256(payload).digest()
+
+
+def _load(path: Path) -> Lark | None:
+    """Return the parser pickled at *path*, or ``None``."""
+    try:
+        data = path.read_bytes()
+        size = len(_MAGIC) + _DIGEST_CHARS + hashlib.sha256().digest_size
+        header, payload = data[:size], data[size:]
+        if header != _header(path, payload):
+            LOGGER.debug("Ignoring mismatched grammar cache %s", path)
+            return None
+        parser = _Unpickler(io.BytesIO(payload)).load()
+    except FileNotFoundError:
+        return None
+    except Exception:  # noqa: BLE001 — a bad cache file must never break parsing
+        LOGGER.debug("Unreadable grammar cache %s", path, exc_info=True)
+        return None
+    if not isinstance(parser, Lark):
+        return None
+    return parser
+
+
+def _store(path: Path, parser: Lark) -> None:
+    """Atomically pickle *parser* to *path*; failures are logged only."""
+    try:
+        buffer = io.BytesIO()
+        _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(parser)
+        payload = buffer.getvalue()
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_header(path, payload) + payload)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except Exception:  # noqa: BLE001 — caching is best-effort
+        LOGGER.debug("Could not write grammar cache %s", path, exc_info=True)
+
+
+def load_parser(grammar: str, **options: Any) -> Lark:
+    """Return a :class:`lark.Lark` parser, from the disk cache if possible.
+
+    Args:
+        grammar: Lark grammar text.
+        **options: Keyword arguments passed to :class:`lark.Lark`.
+
+    Returns:
+        A parser equivalent to ``Lark(grammar, **options)``.
+
+    """
+    path = cache_path(grammar, **options)
+    if path is not None:
+        parser = _load(path)
+        if parser is not None:
+            LOGGER.debug("Loaded compiled grammar from %s", path)
+            return parser
+    parser = Lark(grammar, **options)
+    if path is not None:
+        _store(path, parser)
+    return parser
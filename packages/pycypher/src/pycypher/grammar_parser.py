@@ -32,6 +32,7 @@ from typing import Any
 from lark import Lark, Transformer, Tree
 from shared.logger import LOGGER
 
+from pycypher.grammar_cache import load_parser
 from pycypher.grammar_rule_mixins import (  # noqa: F401 — re-exported for backward compat
     ClauseRulesMixin,
     ExpressionRulesMixin,
@@ -49,23 +50,6 @@ __all__ = [
 ]
 
 
-def _eager_compile_parser() -> None:
-    """Compile the Lark Earley parser in a background thread.
-
-    Grammar compilation takes ~96ms.  By starting it eagerly at import
-    time in a daemon thread, the parser is ready before the first query
-    arrives, eliminating the cold-start penalty for interactive use.
-    """
-    try:
-        # Trigger class-level cache population for the default (debug=False) mode.
-        GrammarParser(debug=False)
-    except Exception:  # noqa: BLE001 — best-effort startup warmup; any failure is non-fatal
-        LOGGER.debug(
-            "Eager parser compilation failed; will retry on first use",
-            exc_info=True,
-        )
-
-
 # Complete Lark grammar for openCypher
 # Based on the official openCypher grammar specification
 CYPHER_GRAMMAR = r"""
@@ -412,6 +396,7 @@ slice_end: expression |
                 | count_star
                 | function_invocation
                 | exists_expression
+                | count_subquery
                 | inline_pattern_predicate
                 | list_comprehension
                 | pattern_comprehension
@@ -440,6 +425,12 @@ exists_expression: "EXISTS"i "{" exists_content "}"
 exists_content: (match_clause | unwind_clause | with_clause)* return_clause?
               | pattern where_clause?
 
+//============================================================================
+// COUNT subquery
+//============================================================================
+
+count_subquery: "COUNT"i "{" exists_content "}"
+
 //============================================================================
 // Function invocation
 //============================================================================
@@ -775,9 +766,10 @@ class GrammarParser:
 
     # Class-level Lark instance cache keyed by debug flag.  Building the
     # Earley parser from the grammar string is the most expensive step
-    # (~96 ms).  By caching at the class level, all ``GrammarParser``
-    # instances with the same *debug* flag share a single ``Lark`` object,
-    # avoiding redundant grammar compilation.
+    # (0.4-0.9 s; see ``pycypher.grammar_cache`` for the on-disk copy).
+    # By caching at the class level, all ``GrammarParser`` instances with
+    # the same *debug* flag share a single ``Lark`` object, avoiding
+    # redundant grammar loading.
     _lark_cache: dict[bool, Lark] = {}
     _lark_cache_lock: threading.Lock = threading.Lock()
     _lark_cache_hits: int = 0
@@ -792,7 +784,7 @@ class GrammarParser:
         """
         with GrammarParser._lark_cache_lock:
             if debug not in GrammarParser._lark_cache:
-                GrammarParser._lark_cache[debug] = Lark(
+                GrammarParser._lark_cache[debug] = load_parser(
                     CYPHER_GRAMMAR,
                     parser="earley",  # Use Earley parser for better ambiguity handling
                     debug=debug,
@@ -801,7 +793,7 @@ class GrammarParser:
                 )
                 GrammarParser._lark_cache_misses += 1
                 LOGGER.debug(
-                    "Lark parser cache MISS (debug=%s); compiled new parser",
+                    "Lark parser cache MISS (debug=%s); loaded new parser",
                     debug,
                 )
             else:
@@ -1011,19 +1003,6 @@ def get_default_parser(*, debug: bool = False) -> GrammarParser:
     return GrammarParser(debug=debug)
 
 
-# ---------------------------------------------------------------------------
-# Eager background compilation
-# ---------------------------------------------------------------------------
-# Kick off Lark grammar compilation in a daemon thread at import time so the
-# ~96ms compilation cost is absorbed before the first query arrives.
-_eager_compile_thread = threading.Thread(
-    target=_eager_compile_parser,
-    name="pycypher-parser-warmup",
-    daemon=True,
-)
-_eager_compile_thread.start()
-
-
 def main() -> None:
     """Command-line interface for the grammar parser."""
     parser: argparse.ArgumentParser = argparse.ArgumentParser(
@@ -604,6 +604,21 @@ class ExpressionRulesMixin:
         content = args[0] if args else None
         return {"type": "Exists", "content": content}
 
+    def count_subquery(self, args: list[Any]) -> dict[str, Any]:
+        """Transform COUNT { ... } subquery expression.
+
+        COUNT evaluates to the number of rows the subquery produces.
+
+        Args:
+            args: Single exists_content node containing the subquery specification.
+
+        Returns:
+            Dict with type "CountSubquery" containing the subquery content.
+
+        """
+        content = args[0] if args else None
+        return {"type": "CountSubquery", "content": content}
+
     def inline_pattern_predicate(self, args: list[Any]) -> dict[str, Any]:
         """Transform an inline pattern predicate into an EXISTS expression.
 
@@ -665,7 +680,8 @@ class ExpressionRulesMixin:
 
         Returns:
             The subquery content unchanged, or a wrapped ExistsSubquery dict
-            when the content is a full subquery with multiple clauses.
+            when the content is a full subquery with multiple clauses or a
+            pattern with a WHERE clause (as a single implicit MATCH).
 
         """
         if not args:
@@ -680,4 +696,21 @@ class ExpressionRulesMixin:
             "Unwind",
         ):
             return {"type": "ExistsSubquery", "clauses": list(args)}
+        where = next(
+            (
+                a
+                for a in args[1:]
+                if isinstance(a, dict) and a.get("type") == "WhereClause"
+            ),
+            None,
+        )
+        if where is not None:
+            # ``pattern WHERE pred`` is an implicit MATCH; keep the filter.
+            match = {
+                "type": "MatchClause",
+                "optional": False,
+                "pattern": first,
+                "where": where,
+            }
+            return {"type": "ExistsSubquery", "clauses": [match]}
         return first
@@ -13,10 +13,14 @@ Architecture
     ├── AdjacencyIndex         — per-relationship-type adjacency lists
     │   ├── outgoing[src_id]   → list of (rel_id, tgt_id)
     │   └── incoming[tgt_id]   → list of (rel_id, src_id)
+    ├── DegreeIndex            — per-(type, direction, neighbour label)
+    │   └── degrees[i]         → relationship count of node ids[i]
     ├── PropertyValueIndex     — per-(entity_type, property) hash index
     │   └── value_to_ids[val]  → set of entity IDs
-    └── EntityLabelIndex       — per-label sorted ID arrays for fast membership
-        └── ids: np.ndarray    — sorted entity IDs for O(log n) lookup
+    ├── EntityLabelIndex       — per-label sorted ID arrays for fast membership
+    │   └── ids: np.ndarray    — sorted entity IDs for O(log n) lookup
+    └── SpatialIndex           — per-(entity_type, geometry) STR-tree
+        └── tree: STRtree      — packed polygon bounding boxes (GEOS)
 
 Indexes are built lazily on first access and invalidated when the Context
 commits mutations (``commit_query()`` increments ``_data_epoch``).
@@ -32,13 +36,19 @@ Usage::
 
     # Property index — O(1) instead of O(N)
     ids = manager.lookup_property("Person", "name", "Alice")
+
+    # Degrees of many nodes at once — one vectorized lookup
+    degrees = manager.get_degree_index("KNOWS", "outgoing").lookup(ids)
 """
 
 from __future__ import annotations
 
+import itertools
+import sys
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -46,11 +56,17 @@ import numpy as np
 import pandas as pd
 from shared.logger import LOGGER
 
+from pycypher import config
 from pycypher.constants import (
     ID_COLUMN,
     RELATIONSHIP_SOURCE_COLUMN,
     RELATIONSHIP_TARGET_COLUMN,
 )
+from pycypher.dataframe_utils import (
+    source_column_names,
+    source_columns_to_pandas,
+)
+from pycypher.spatial import SpatialIndex
 
 if TYPE_CHECKING:
     from pycypher.relational_models import Context
@@ -214,6 +230,114 @@ class AdjacencyIndex:
         )
 
 
+@dataclass(slots=True)
+class DegreeIndex:
+    """Per-node degree array for one relationship type and direction.
+
+    Answers degree-only pattern expressions such as
+    ``size((n)-[:KNOWS]->())`` and single-hop ``EXISTS`` for a whole frame
+    with one vectorized lookup instead of per-row neighbour lists.
+
+    Attributes:
+        rel_type: The relationship type this index covers.
+        direction: ``"outgoing"``, ``"incoming"`` or ``"both"`` (where a
+            self-loop counts once, as an undirected MATCH matches it once).
+        neighbor_label: When set, only relationships whose other endpoint
+            carries this label are counted.
+        ids: Node IDs with at least one counted relationship.
+        degrees: Number of counted relationships of each node in *ids*.
+
+    """
+
+    rel_type: str
+    direction: str = "outgoing"
+    neighbor_label: str | None = None
+    ids: pd.Index = field(default_factory=lambda: pd.Index([], dtype=object))
+    degrees: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64),
+    )
+
+    @classmethod
+    def build(
+        cls,
+        rel_type: str,
+        direction: str,
+        source_df: pd.DataFrame,
+        *,
+        neighbor_label: str | None = None,
+        neighbor_ids: np.ndarray | None = None,
+    ) -> DegreeIndex:
+        """Build degree arrays from a relationship DataFrame.
+
+        Args:
+            rel_type: Relationship type label.
+            direction: ``"outgoing"``, ``"incoming"`` or ``"both"``.
+            source_df: DataFrame with __SOURCE__ and __TARGET__ columns.
+            neighbor_label: Label recorded on the index.
+            neighbor_ids: IDs of the nodes carrying *neighbor_label*; only
+                relationships whose other endpoint is among them count.
+
+        Returns:
+            Populated DegreeIndex.
+
+        """
+        t0 = time.perf_counter()
+        index = cls(
+            rel_type=rel_type,
+            direction=direction,
+            neighbor_label=neighbor_label,
+        )
+        if not {
+            RELATIONSHIP_SOURCE_COLUMN,
+            RELATIONSHIP_TARGET_COLUMN,
+        } <= set(source_df.columns):
+            return index
+
+        src = source_df[RELATIONSHIP_SOURCE_COLUMN].to_numpy()
+        tgt = source_df[RELATIONSHIP_TARGET_COLUMN].to_numpy()
+        if direction == "incoming":
+            nodes, neighbors = tgt, src
+        elif direction == "both":
+            other = src != tgt
+            nodes = np.concatenate([src, tgt[other]])
+            neighbors = np.concatenate([tgt, src[other]])
+        else:
+            nodes, neighbors = src, tgt
+        if neighbor_ids is not None:
+            nodes = nodes[pd.Index(neighbors).isin(neighbor_ids)]
+
+        codes, uniques = pd.factorize(nodes)
+        index.ids = pd.Index(uniques)
+        index.degrees = np.bincount(
+            codes[codes >= 0],
+            minlength=len(uniques),
+        ).astype(np.int64)
+
+        LOGGER.debug(
+            "DegreeIndex.build  rel_type=%s  direction=%s  label=%s  "
+            "nodes=%d  elapsed=%.4fs",
+            rel_type,
+            direction,
+            neighbor_label,
+            len(index.ids),
+            time.perf_counter() - t0,
+        )
+        return index
+
+    def lookup(self, node_ids: np.ndarray | pd.Series) -> np.ndarray:
+        """Return the degree of each of *node_ids* (0 when it has none).
+
+        Null and unknown IDs have degree 0.
+        """
+        probe = np.asarray(node_ids)
+        if not len(self.ids):
+            return np.zeros(len(probe), dtype=np.int64)
+        if probe.dtype != self.ids.dtype:
+            probe = _coerce_query_ids(self.ids.to_numpy(), probe)
+        positions = self.ids.get_indexer(probe)
+        return np.where(positions >= 0, self.degrees[positions], 0)
+
+
 @dataclass(slots=True)
 class PropertyValueIndex:
     """Hash index on a single property of an entity type.
@@ -375,6 +499,111 @@ def _coerce_query_ids(
     return query_ids
 
 
+def _estimate_nbytes(values: np.ndarray) -> int:
+    """Approximate memory held by *values*, including boxed objects.
+
+    ``ndarray.nbytes`` only counts pointers for ``dtype=object``; the
+    referenced Python objects are estimated from a small sample.
+    """
+    nbytes = int(values.nbytes)
+    if values.dtype != object or len(values) == 0:
+        return nbytes
+    step = max(1, len(values) // 64)
+    sample = values[::step]
+    per_item = sum(sys.getsizeof(v) for v in sample) / len(sample)
+    return nbytes + int(per_item * len(values))
+
+
+class PropertyArrayCache:
+    """Byte-budgeted LRU cache of per-property value arrays.
+
+    :class:`VectorizedPropertyStore` converts property columns from the
+    source table one at a time, on first use, and parks them here.  When the
+    total estimated size exceeds *max_bytes* the least recently used arrays
+    are dropped; they are rebuilt from the source if requested again.
+
+    Thread-safe: all operations hold an internal lock.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self._arrays: OrderedDict[Hashable, tuple[np.ndarray, int]] = (
+            OrderedDict()
+        )
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes currently held."""
+        return self._nbytes
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """Return the cached array for *key*, marking it recently used."""
+        with self._lock:
+            entry = self._arrays.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._arrays.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, values: np.ndarray) -> None:
+        """Cache *values* under *key*, evicting older arrays over budget.
+
+        Arrays larger than the whole budget are not cached.
+        """
+        size = _estimate_nbytes(values)
+        with self._lock:
+            old = self._arrays.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._arrays[key] = (values, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._arrays.popitem(last=False)
+                self._nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached array."""
+        with self._lock:
+            self._arrays.clear()
+            self._nbytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return occupancy and hit/miss counters for diagnostics."""
+        return {
+            "arrays": len(self._arrays),
+            "bytes": self._nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _object_values(column: pd.Series) -> np.ndarray:
+    """Return *column* as an object array with Arrow nulls mapped to None."""
+    values = column.values
+    if hasattr(values, "to_numpy"):
+        # Arrow-backed columns
+        return values.to_numpy(dtype=object, na_value=None)
+    return np.asarray(values, dtype=object)
+
+
+_STORE_TOKENS = itertools.count()
+
+
 @dataclass(frozen=True)
 class VectorizedPropertyStore:
     """Pre-sorted entity ID array with aligned property columns for O(n log n) bulk lookups.
@@ -384,6 +613,11 @@ class VectorizedPropertyStore:
     DataFrames), this store uses ``np.searchsorted`` on a pre-sorted ID array to resolve
     entity IDs to row positions, then fancy-indexes directly into numpy property arrays.
 
+    Only the ID column is converted at build time.  Each property array is
+    converted from *source* and permuted into ID order the first time it is
+    fetched, then kept in *cache* (LRU, memory-bounded) or, without a cache,
+    in ``property_arrays``.
+
     Build cost: O(N log N) for the sort (one-time, cached).
     Lookup cost: O(k log N) for k query IDs against N stored entities.
     """
@@ -393,16 +627,38 @@ class VectorizedPropertyStore:
     property_arrays: dict[
         str, np.ndarray
     ]  # prop_name → values aligned with sorted_ids
+    source: Any = field(default=None, repr=False, compare=False)
+    sort_order: np.ndarray | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    source_columns: tuple[str, ...] = ()
+    cache: PropertyArrayCache | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    token: int = field(
+        default_factory=lambda: next(_STORE_TOKENS),
+        repr=False,
+        compare=False,
+    )
 
     @classmethod
     def build(
-        cls, entity_type: str, source_df: pd.DataFrame
+        cls,
+        entity_type: str,
+        source_df: Any,
+        cache: PropertyArrayCache | None = None,
     ) -> VectorizedPropertyStore:
-        """Build a vectorized store from an entity DataFrame.
+        """Build a vectorized store from an entity DataFrame or Arrow table.
 
         Args:
             entity_type: The entity type label.
-            source_df: DataFrame with ID_COLUMN and property columns.
+            source_df: ``pd.DataFrame`` or ``pyarrow.Table`` with ID_COLUMN
+                and property columns.
+            cache: Shared LRU for lazily converted property arrays.
 
         Returns:
             A new VectorizedPropertyStore.
@@ -416,7 +672,8 @@ class VectorizedPropertyStore:
             )
 
         # Convert to numpy for sorting (handles Arrow-backed DFs)
-        ids = np.array(source_df[ID_COLUMN].tolist(), dtype=object)
+        id_frame = source_columns_to_pandas(source_df, [ID_COLUMN])
+        ids = np.array(id_frame[ID_COLUMN].tolist(), dtype=object)
         # When IDs have mixed types (e.g. str + int after CREATE into a
         # string-ID context), np.argsort fails because '<' is undefined
         # across types.  Coerce to uniform str keys for sorting only.
@@ -427,25 +684,63 @@ class VectorizedPropertyStore:
             sort_order = np.argsort(sort_keys, kind="mergesort")
         sorted_ids = ids[sort_order]
 
-        # Build aligned property arrays
-        prop_arrays: dict[str, np.ndarray] = {}
-        for col in source_df.columns:
-            if col == ID_COLUMN:
-                continue
-            values = source_df[col].values
-            if hasattr(values, "to_numpy"):
-                # Arrow-backed columns
-                values = values.to_numpy(dtype=object, na_value=None)
-            else:
-                values = np.asarray(values, dtype=object)
-            prop_arrays[col] = values[sort_order]
-
         return cls(
             entity_type=entity_type,
             sorted_ids=sorted_ids,
-            property_arrays=prop_arrays,
+            property_arrays={},
+            source=source_df,
+            sort_order=sort_order,
+            source_columns=tuple(
+                c for c in source_column_names(source_df) if c != ID_COLUMN
+            ),
+            cache=cache,
         )
 
+    def _array(self, prop_name: str) -> np.ndarray | None:
+        """Return ID-aligned values of *prop_name*, converting on demand."""
+        values = self.property_arrays.get(prop_name)
+        if values is not None or prop_name not in self.source_columns:
+            return values
+        key = (self.token, prop_name)
+        if self.cache is not None:
+            values = self.cache.get(key)
+            if values is not None:
+                return values
+        frame = source_columns_to_pandas(self.source, [prop_name])
+        values = _object_values(frame[prop_name])[self.sort_order]
+        if self.cache is not None:
+            self.cache.put(key, values)
+        else:
+            self.property_arrays[prop_name] = values
+        return values
+
+    def materialize(self, prop_names: list[str]) -> None:
+        """Convert every not-yet-resident property in *prop_names* at once.
+
+        A single projected Arrow conversion is cheaper than one per column,
+        so callers that know the referenced properties up front (see
+        :meth:`GraphIndexManager.prefetch_properties`) batch them here.
+        """
+        missing = [
+            p
+            for p in dict.fromkeys(prop_names)
+            if p in self.source_columns
+            and p not in self.property_arrays
+            and (
+                self.cache is None
+                or self.cache.get((self.token, p)) is None
+            )
+        ]
+        if not missing:
+            return
+        frame = source_columns_to_pandas(self.source, missing)
+        for prop in missing:
+            values = _object_values(frame[prop])[self.sort_order]
+            if self.cache is not None:
+                self.cache.put((self.token, prop), values)
+            else:
+                self.property_arrays[prop] = values
+
     @property
     def size(self) -> int:
         """Number of entities in this store."""
@@ -454,7 +749,9 @@ class VectorizedPropertyStore:
     @property
     def properties(self) -> list[str]:
         """List of available property names."""
-        return list(self.property_arrays.keys())
+        if self.source is None:
+            return list(self.property_arrays.keys())
+        return list(self.source_columns)
 
     def fetch(self, query_ids: np.ndarray, prop_name: str) -> np.ndarray:
         """Fetch property values for a batch of entity IDs.
@@ -471,18 +768,17 @@ class VectorizedPropertyStore:
             Missing IDs get None.
 
         """
-        if prop_name not in self.property_arrays:
+        if len(self.sorted_ids) == 0:
             result = np.empty(len(query_ids), dtype=object)
             result[:] = None
             return result
 
-        if len(self.sorted_ids) == 0:
+        prop_values = self._array(prop_name)
+        if prop_values is None:
             result = np.empty(len(query_ids), dtype=object)
             result[:] = None
             return result
 
-        prop_values = self.property_arrays[prop_name]
-
         # Coerce query IDs to match sorted_ids element types for correct comparison.
         # Both arrays may be object dtype but contain different Python types
         # (e.g. int vs str after DuckDB merges).
@@ -547,14 +843,14 @@ class VectorizedPropertyStore:
         matched = self.sorted_ids[safe_positions] == query_ids
         match_mask = matched  # reuse for all properties
 
+        self.materialize(prop_names)
         results: dict[str, np.ndarray] = {}
         for prop in prop_names:
             result = np.empty(len(query_ids), dtype=object)
             result[:] = None
-            if prop in self.property_arrays and match_mask.any():
-                result[match_mask] = self.property_arrays[prop][
-                    safe_positions[match_mask]
-                ]
+            prop_values = self._array(prop)
+            if prop_values is not None and match_mask.any():
+                result[match_mask] = prop_values[safe_positions[match_mask]]
             results[prop] = result
         return results
 
@@ -573,9 +869,14 @@ class GraphIndexManager:
     def __init__(self, context: Context) -> None:
         self._context = context
         self._adjacency: dict[str, AdjacencyIndex] = {}
+        self._degree: dict[tuple[str, str, str | None], DegreeIndex] = {}
         self._property: dict[tuple[str, str], PropertyValueIndex] = {}
         self._label: dict[str, EntityLabelIndex] = {}
         self._vectorized: dict[str, VectorizedPropertyStore] = {}
+        self._spatial: dict[tuple[str, str], SpatialIndex] = {}
+        self._property_arrays = PropertyArrayCache(
+            config.PROPERTY_CACHE_MAX_MB * 1024 * 1024,
+        )
         self._epoch: int = getattr(context, "_data_epoch", 0)
         self._lock = threading.Lock()
 
@@ -589,9 +890,12 @@ class GraphIndexManager:
                 current_epoch,
             )
             self._adjacency.clear()
+            self._degree.clear()
             self._property.clear()
             self._label.clear()
             self._vectorized.clear()
+            self._spatial.clear()
+            self._property_arrays.clear()
             self._epoch = current_epoch
 
     def get_adjacency_index(self, rel_type: str) -> AdjacencyIndex | None:
@@ -619,6 +923,58 @@ class GraphIndexManager:
             self._adjacency[rel_type] = index
             return index
 
+    def get_degree_index(
+        self,
+        rel_type: str,
+        direction: str = "outgoing",
+        neighbor_label: str | None = None,
+    ) -> DegreeIndex | None:
+        """Get or build the degree index of a relationship type.
+
+        Args:
+            rel_type: Relationship type.
+            direction: ``"outgoing"``, ``"incoming"`` or ``"both"``.
+            neighbor_label: Count only relationships whose other endpoint
+                carries this label.
+
+        Returns None if the relationship type doesn't exist in the context.
+        Thread-safe: uses a lock to prevent concurrent builds.
+        """
+        neighbor_ids = None
+        if neighbor_label is not None:
+            label_index = self.get_label_index(neighbor_label)
+            neighbor_ids = (
+                label_index.ids
+                if label_index is not None
+                else np.array([], dtype=object)
+            )
+
+        with self._lock:
+            self._check_epoch()
+
+            key = (rel_type, direction, neighbor_label)
+            if key in self._degree:
+                return self._degree[key]
+
+            rel_mapping = self._context.relationship_mapping.mapping
+            if rel_type not in rel_mapping:
+                return None
+
+            source_df = source_columns_to_pandas(
+                rel_mapping[rel_type].source_obj,
+                [RELATIONSHIP_SOURCE_COLUMN, RELATIONSHIP_TARGET_COLUMN],
+            )
+
+            index = DegreeIndex.build(
+                rel_type,
+                direction,
+                source_df,
+                neighbor_label=neighbor_label,
+                neighbor_ids=neighbor_ids,
+            )
+            self._degree[key] = index
+            return index
+
     def get_property_index(
         self,
         entity_type: str,
@@ -679,6 +1035,39 @@ class GraphIndexManager:
             self._label[entity_type] = index
             return index
 
+    def get_spatial_index(
+        self,
+        entity_type: str,
+        property_name: str = "geometry",
+    ) -> SpatialIndex | None:
+        """Get or build the STR-tree over a WKB geometry property.
+
+        Returns None if the entity type or property doesn't exist.
+        Thread-safe: uses a lock to prevent concurrent builds.
+        """
+        with self._lock:
+            self._check_epoch()
+
+            key = (entity_type, property_name)
+            if key in self._spatial:
+                return self._spatial[key]
+
+            ent_mapping = self._context.entity_mapping.mapping
+            if entity_type not in ent_mapping:
+                return None
+
+            source_df = ent_mapping[entity_type].source_obj
+            if property_name not in source_column_names(source_df):
+                return None
+            source_df = source_columns_to_pandas(
+                source_df,
+                [ID_COLUMN, property_name],
+            )
+
+            index = SpatialIndex.build(entity_type, property_name, source_df)
+            self._spatial[key] = index
+            return index
+
     def indexed_relationship_scan(
         self,
         rel_type: str,
@@ -776,7 +1165,9 @@ class GraphIndexManager:
         """Get or build a VectorizedPropertyStore for an entity type.
 
         The store pre-sorts entity IDs and aligns property columns for
-        O(k log N) bulk property resolution via np.searchsorted.
+        O(k log N) bulk property resolution via np.searchsorted.  Arrow
+        sources are handed over unconverted; property columns are converted
+        on first use and share this manager's memory-bounded LRU.
 
         Returns None if the entity type doesn't exist in the context.
         Thread-safe: uses a lock to prevent concurrent builds.
@@ -794,22 +1185,28 @@ class GraphIndexManager:
             source_df = None
             if entity_type in entity_mapping:
                 raw = entity_mapping[entity_type].source_obj
-                if hasattr(raw, "to_pandas"):
-                    source_df = raw.to_pandas()
-                elif isinstance(raw, pd.DataFrame):
+                if hasattr(raw, "column_names") or isinstance(
+                    raw,
+                    pd.DataFrame,
+                ):
                     source_df = raw
             elif entity_type in rel_mapping:
                 raw = rel_mapping[entity_type].source_obj
-                if hasattr(raw, "to_pandas"):
-                    source_df = raw.to_pandas()
-                elif isinstance(raw, pd.DataFrame):
+                if hasattr(raw, "column_names") or isinstance(
+                    raw,
+                    pd.DataFrame,
+                ):
                     source_df = raw
 
             if source_df is None:
                 return None
 
             t0 = time.perf_counter()
-            store = VectorizedPropertyStore.build(entity_type, source_df)
+            store = VectorizedPropertyStore.build(
+                entity_type,
+                source_df,
+                cache=self._property_arrays,
+            )
             LOGGER.debug(
                 "VectorizedPropertyStore built for %s: %d entities, %d properties in %.4fs",
                 entity_type,
@@ -820,6 +1217,21 @@ class GraphIndexManager:
             self._vectorized[entity_type] = store
             return store
 
+    def prefetch_properties(
+        self,
+        entity_type: str,
+        prop_names: list[str],
+    ) -> None:
+        """Convert *prop_names* of *entity_type* in one batched projection.
+
+        Called with the properties a query references (computed from its
+        AST) so they are resident before the first lookup; unreferenced
+        columns are never converted.
+        """
+        store = self.get_vectorized_store(entity_type)
+        if store is not None and store.size:
+            store.materialize(prop_names)
+
     def stats(self) -> dict[str, Any]:
         """Return index statistics for diagnostics."""
         return {
@@ -832,6 +1244,10 @@ class GraphIndexManager:
                 }
                 for rt, idx in self._adjacency.items()
             },
+            "degree_indexes": {
+                ":".join(filter(None, key)): {"nodes": len(idx.ids)}
+                for key, idx in self._degree.items()
+            },
             "property_indexes": {
                 f"{et}.{prop}": {
                     "entries": idx.size,
@@ -849,6 +1265,11 @@ class GraphIndexManager:
                 }
                 for et, store in self._vectorized.items()
             },
+            "spatial_indexes": {
+                f"{et}.{prop}": {"geometries": idx.size}
+                for (et, prop), idx in self._spatial.items()
+            },
+            "property_arrays": self._property_arrays.stats(),
         }
 
     def eager_build_vectorized_stores(self) -> None:
@@ -884,4 +1305,6 @@ class GraphIndexManager:
         self._property.clear()
         self._label.clear()
         self._vectorized.clear()
+        self._spatial.clear()
+        self._property_arrays.clear()
         self._epoch = getattr(self._context, "_data_epoch", 0)
@@ -0,0 +1,659 @@
+"""Single-pass grouped aggregation over factorized group codes.
+
+A grouped projection such as ``RETURN t.state, count(*), sum(x), avg(y)``
+used to hash its group keys once per aggregate.  This module factorizes the
+keys once into dense integer codes (:class:`GroupCodes`) and computes every
+aggregate from those codes with NumPy kernels — ``bincount`` for counts and
+``ufunc.reduceat`` over a stable sort for sums, minima and maxima.
+
+Aggregates are held as *partial states* (:class:`PartialAggregates`) that
+can be merged, so the same kernels serve chunked or parallel execution:
+aggregate each chunk, :meth:`~PartialAggregates.merge` the partials, then
+:meth:`~PartialAggregates.finalize`.
+
+Usage::
+
+    partial = PartialAggregates.from_rows(
+        keys,                                   # one column per group key
+        {"n": ("count", None), "total": ("sum", df["x"])},
+    )
+    partial.merge(other_chunk).finalize()       # keys + one column per alias
+
+Null group keys form their own group, and results follow Cypher's null
+semantics: ``sum``/``avg``/``min``/``max`` over a group with no non-null
+input are null, ``count`` is zero and ``collect`` keeps every value.
+
+The approximate aggregates keep sketches from :mod:`pycypher.sketches` as
+their state: HyperLogLog registers for ``approxCountDistinct`` (one row per
+group, built in one pass), a KLL sketch per group for ``approxPercentile``
+and a SpaceSaving summary per group for ``approxTopK``.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from pycypher.sketches import (
+    DEFAULT_PRECISION,
+    KllSketch,
+    SpaceSaving,
+    estimate_registers,
+    fold_registers,
+    grouped_hll_registers,
+    hash_values,
+)
+
+__all__ = [
+    "MERGEABLE_AGGREGATIONS",
+    "GroupCodes",
+    "PartialAggregates",
+]
+
+#: A partial aggregate: one per-group array per state component.
+_State = tuple[np.ndarray, ...]
+
+
+@dataclass(frozen=True)
+class GroupCodes:
+    """Dense group ids for the rows of a group-key frame.
+
+    Attributes:
+        codes: ``int64`` group id per row.  Ids follow first-seen order, so
+            group ``g`` is the ``g``-th distinct key — the order
+            ``groupby(sort=False)`` produces.
+        first_rows: Row position of each group's first occurrence.
+
+    """
+
+    codes: np.ndarray
+    first_rows: np.ndarray
+
+    @classmethod
+    def from_frame(cls, keys: pd.DataFrame) -> GroupCodes | None:
+        """Factorize the rows of *keys* into group codes.
+
+        Each key column is factorized once; multi-column keys are combined
+        pairwise into a single code.  Null keys form their own group.
+
+        Returns:
+            The group codes, or ``None`` when a key column holds unhashable
+            values (lists or maps) and cannot be factorized.
+
+        """
+        codes = np.zeros(len(keys), dtype=np.int64)
+        for _, column in keys.items():
+            try:
+                column_codes, uniques = pd.factorize(
+                    column,
+                    use_na_sentinel=False,
+                )
+            except TypeError:
+                return None
+            codes, _ = pd.factorize(
+                codes * max(len(uniques), 1) + column_codes,
+            )
+        _, first_rows = np.unique(codes, return_index=True)
+        return cls(
+            codes=codes.astype(np.int64, copy=False),
+            first_rows=first_rows,
+        )
+
+    @property
+    def n_groups(self) -> int:
+        """Number of distinct groups."""
+        return len(self.first_rows)
+
+    @cached_property
+    def sizes(self) -> np.ndarray:
+        """Number of rows in each group."""
+        return np.bincount(self.codes, minlength=self.n_groups)
+
+    @cached_property
+    def order(self) -> np.ndarray:
+        """Row positions sorted by group, stable within each group."""
+        return np.argsort(self.codes, kind="stable")
+
+    def key_frame(self, keys: pd.DataFrame) -> pd.DataFrame:
+        """Return one row of *keys* per group, in group-id order."""
+        return keys.iloc[self.first_rows].reset_index(drop=True)
+
+    def group_rows(self) -> list[np.ndarray]:
+        """Return the row positions of each group, in group-id order."""
+        if self.n_groups == 0:
+            return []
+        return np.split(self.order, np.cumsum(self.sizes)[:-1])
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+_UFUNCS: dict[str, np.ufunc] = {
+    "sum": np.add,
+    "min": np.minimum,
+    "max": np.maximum,
+}
+
+
+def _non_null_counts(groups: GroupCodes, valid: np.ndarray) -> np.ndarray:
+    return np.bincount(groups.codes[valid], minlength=groups.n_groups)
+
+
+def _reduce(
+    groups: GroupCodes,
+    values: pd.Series,
+    valid: np.ndarray,
+    op: str,
+) -> np.ndarray:
+    """Return the per-group ``sum``/``min``/``max`` of the *valid* values.
+
+    Integer columns, float minima and maxima, and object columns holding
+    only numbers are reduced with ``ufunc.reduceat`` over the shared group
+    sort.  Float sums and other columns go through pandas over the
+    precomputed codes, which keeps pandas' compensated float summation and
+    its handling of strings and temporal values.
+
+    Results keep the conventions of ``groupby`` on the input dtype: numeric
+    columns give NaN for groups without valid input, object columns give
+    object results (``None`` for an empty sum).
+    """
+    array = values.to_numpy()
+    boxed = array.dtype == object
+    if boxed:
+        inferred = values.infer_objects()
+        if inferred.dtype.kind in "iuf":
+            array = inferred.to_numpy()
+    kind = array.dtype.kind
+    if kind in "iu" or (kind == "f" and (op != "sum" or boxed)):
+        counts = _non_null_counts(groups, valid)
+        present = counts > 0
+        order = groups.order[valid[groups.order]]
+        starts = (np.cumsum(counts) - counts)[present]
+        reduced = (
+            _UFUNCS[op].reduceat(array[order], starts)
+            if len(order)
+            else array[:0]
+        )
+        if boxed:
+            out = np.full(
+                groups.n_groups,
+                None if op == "sum" else np.nan,
+                dtype=object,
+            )
+        elif present.all():
+            return reduced
+        else:
+            out = np.full(groups.n_groups, np.nan)
+        out[present] = reduced
+        return out
+    grouped = values.groupby(groups.codes)
+    result = grouped.sum(min_count=1) if op == "sum" else grouped.agg(op)
+    result = result.reindex(range(groups.n_groups))
+    if isinstance(result.dtype, pd.api.extensions.ExtensionDtype):
+        return result.array
+    return result.to_numpy()
+
+
+def _valid(values: pd.Series) -> np.ndarray:
+    return values.notna().to_numpy()
+
+
+def _concatenated(
+    merge: Callable[[GroupCodes, _State], _State],
+) -> Callable[[GroupCodes, list[_State]], _State]:
+    """Adapt a merge over one concatenated state to a list of partials."""
+
+    def merge_parts(groups: GroupCodes, parts: list[_State]) -> _State:
+        return merge(
+            groups,
+            tuple(_concat(list(component)) for component in zip(*parts)),
+        )
+
+    return merge_parts
+
+
+def _count_partial(
+    groups: GroupCodes,
+    values: pd.Series | None,
+    _option: Any,
+) -> _State:
+    if values is None:
+        return (groups.sizes,)
+    return (_non_null_counts(groups, _valid(values)),)
+
+
+def _count_merge(groups: GroupCodes, state: _State) -> _State:
+    (counts,) = state
+    merged = np.bincount(
+        groups.codes,
+        weights=counts,
+        minlength=groups.n_groups,
+    )
+    return (merged.astype(np.int64),)
+
+
+def _reduce_partial(op: str) -> Callable[[GroupCodes, pd.Series, Any], _State]:
+    def partial(groups: GroupCodes, values: pd.Series, _option: Any) -> _State:
+        valid = _valid(values)
+        return (
+            _reduce(groups, values, valid, op),
+            _non_null_counts(groups, valid),
+        )
+
+    return partial
+
+
+def _reduce_merge(op: str) -> Callable[[GroupCodes, _State], _State]:
+    def merge(groups: GroupCodes, state: _State) -> _State:
+        values, counts = state
+        (merged_counts,) = _count_merge(groups, (counts,))
+        return (
+            _reduce(groups, pd.Series(values), counts > 0, op),
+            merged_counts,
+        )
+
+    return merge
+
+
+def _avg_finalize(state: _State, _option: Any) -> np.ndarray:
+    sums, counts = state
+    out = np.full(len(counts), np.nan)
+    present = counts > 0
+    out[present] = np.asarray(sums[present]) / counts[present]
+    if sums.dtype == object:
+        return out.astype(object)
+    return out
+
+
+def _slice_lists(items: Any, groups: GroupCodes) -> np.ndarray:
+    """Cut *items* (already in group order) into one slice per group."""
+    ends = np.cumsum(groups.sizes)
+    out = np.empty(groups.n_groups, dtype=object)
+    for group, (start, end) in enumerate(zip(ends - groups.sizes, ends)):
+        out[group] = items[start:end]
+    return out
+
+
+def _collect_partial(
+    groups: GroupCodes,
+    values: pd.Series,
+    _option: Any,
+) -> _State:
+    items = values.iloc[groups.order].tolist()
+    return (_slice_lists(items, groups),)
+
+
+def _collect_merge(groups: GroupCodes, state: _State) -> _State:
+    (lists,) = state
+    chunks = _slice_lists(list(lists[groups.order]), groups)
+    out = np.empty(groups.n_groups, dtype=object)
+    for group, parts in enumerate(chunks):
+        out[group] = list(itertools.chain.from_iterable(parts))
+    return (out,)
+
+
+# -- sketches ---------------------------------------------------------------
+
+#: Memory budget for per-group HyperLogLog registers; precision drops as the
+#: number of groups grows so that ``n_groups * 2**precision`` stays within it.
+_HLL_BUDGET_BYTES: int = 64 * 1024 * 1024
+
+
+def _hll_precision(n_groups: int) -> int:
+    affordable = _HLL_BUDGET_BYTES // max(n_groups, 1)
+    return int(np.clip(affordable.bit_length() - 1, 4, DEFAULT_PRECISION))
+
+
+def _approx_distinct_partial(
+    groups: GroupCodes,
+    values: pd.Series,
+    _option: Any,
+) -> _State:
+    valid = _valid(values)
+    registers = grouped_hll_registers(
+        hash_values(values[valid]),
+        groups.codes[valid],
+        groups.n_groups,
+        _hll_precision(groups.n_groups),
+    )
+    return (registers,)
+
+
+def _approx_distinct_merge(groups: GroupCodes, parts: list[_State]) -> _State:
+    width = min(part[0].shape[1] for part in parts)
+    precision = min(width.bit_length() - 1, _hll_precision(groups.n_groups))
+    registers = np.concatenate(
+        [fold_registers(part[0], precision) for part in parts],
+    )
+    merged = np.zeros((groups.n_groups, 1 << precision), dtype=np.uint8)
+    np.maximum.at(merged, groups.codes, registers)
+    return (merged,)
+
+
+def _approx_distinct_finalize(state: _State, _option: Any) -> np.ndarray:
+    (registers,) = state
+    if len(registers) == 0:
+        return np.zeros(0, dtype=np.int64)
+    return np.round(estimate_registers(registers)).astype(np.int64)
+
+
+def _per_group(
+    groups: GroupCodes,
+    values: pd.Series,
+    build: Callable[[pd.Series], Any],
+) -> np.ndarray:
+    ordered = values.iloc[groups.order].reset_index(drop=True)
+    out = np.empty(groups.n_groups, dtype=object)
+    ends = np.cumsum(groups.sizes)
+    for group, (start, end) in enumerate(zip(ends - groups.sizes, ends)):
+        out[group] = build(ordered.iloc[start:end])
+    return out
+
+
+def _merge_per_group(
+    groups: GroupCodes,
+    parts: list[_State],
+    empty: Callable[[Any], Any],
+) -> _State:
+    sketches = np.concatenate([part[0] for part in parts])
+    out = np.empty(groups.n_groups, dtype=object)
+    for group, rows in enumerate(groups.group_rows()):
+        merged = empty(sketches[rows[0]])
+        for row in rows:
+            merged.merge(sketches[row])
+        out[group] = merged
+    return (out,)
+
+
+def _approx_percentile_partial(
+    groups: GroupCodes,
+    values: pd.Series,
+    _option: Any,
+) -> _State:
+    return (
+        _per_group(
+            groups,
+            values,
+            lambda chunk: KllSketch.from_series(chunk, seed=0),
+        ),
+    )
+
+
+def _approx_percentile_merge(
+    groups: GroupCodes,
+    parts: list[_State],
+) -> _State:
+    return _merge_per_group(
+        groups,
+        parts,
+        lambda sketch: KllSketch(sketch.k, seed=0),
+    )
+
+
+def _approx_percentile_finalize(state: _State, percentile: Any) -> np.ndarray:
+    (sketches,) = state
+    out = np.empty(len(sketches), dtype=object)
+    for group, sketch in enumerate(sketches):
+        out[group] = sketch.quantile(percentile)
+    return out
+
+
+def _approx_top_k_partial(
+    groups: GroupCodes,
+    values: pd.Series,
+    k: Any,
+) -> _State:
+    def build(chunk: pd.Series) -> SpaceSaving:
+        summary = SpaceSaving.for_top_k(k)
+        summary.add_series(chunk)
+        return summary
+
+    return (_per_group(groups, values, build),)
+
+
+def _approx_top_k_merge(groups: GroupCodes, parts: list[_State]) -> _State:
+    return _merge_per_group(
+        groups,
+        parts,
+        lambda summary: SpaceSaving(summary.capacity),
+    )
+
+
+def _approx_top_k_finalize(state: _State, k: Any) -> np.ndarray:
+    (summaries,) = state
+    out = np.empty(len(summaries), dtype=object)
+    for group, summary in enumerate(summaries):
+        out[group] = [value for value, _ in summary.top(k)]
+    return out
+
+
+@dataclass(frozen=True)
+class _Kernel:
+    """How one aggregate builds, merges and finalizes its partial state.
+
+    *option* is the aggregate's constant second argument (the percentile of
+    ``approxPercentile``, the ``k`` of ``approxTopK``), or ``None``.
+    """
+
+    partial: Callable[[GroupCodes, Any, Any], _State]
+    merge: Callable[[GroupCodes, list[_State]], _State]
+    finalize: Callable[[_State, Any], Any]
+    requires_option: bool = False
+
+
+def _first(state: _State, _option: Any) -> Any:
+    return state[0]
+
+
+_KERNELS: dict[str, _Kernel] = {
+    "count": _Kernel(_count_partial, _concatenated(_count_merge), _first),
+    "sum": _Kernel(
+        _reduce_partial("sum"),
+        _concatenated(_reduce_merge("sum")),
+        _first,
+    ),
+    "avg": _Kernel(
+        _reduce_partial("sum"),
+        _concatenated(_reduce_merge("sum")),
+        _avg_finalize,
+    ),
+    "min": _Kernel(
+        _reduce_partial("min"),
+        _concatenated(_reduce_merge("min")),
+        _first,
+    ),
+    "max": _Kernel(
+        _reduce_partial("max"),
+        _concatenated(_reduce_merge("max")),
+        _first,
+    ),
+    "collect": _Kernel(
+        _collect_partial,
+        _concatenated(_collect_merge),
+        _first,
+    ),
+    "approxcountdistinct": _Kernel(
+        _approx_distinct_partial,
+        _approx_distinct_merge,
+        _approx_distinct_finalize,
+    ),
+    "approxpercentile": _Kernel(
+        _approx_percentile_partial,
+        _approx_percentile_merge,
+        _approx_percentile_finalize,
+        requires_option=True,
+    ),
+    "approxtopk": _Kernel(
+        _approx_top_k_partial,
+        _approx_top_k_merge,
+        _approx_top_k_finalize,
+        requires_option=True,
+    ),
+}
+
+#: Lower-case aggregate names computed by :class:`PartialAggregates`.
+MERGEABLE_AGGREGATIONS: frozenset[str] = frozenset(_KERNELS)
+
+
+# ---------------------------------------------------------------------------
+# Partial aggregates
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class PartialAggregates:
+    """Per-group aggregate states for one batch of rows.
+
+    Attributes:
+        keys: One row per group, holding the group-key values.
+        functions: Aggregate function name per output alias.
+        states: Partial state per output alias, aligned with *keys*.
+        options: Constant second argument per output alias (the percentile
+            of ``approxPercentile``, the ``k`` of ``approxTopK``).
+
+    """
+
+    keys: pd.DataFrame
+    functions: dict[str, str]
+    states: dict[str, _State]
+    options: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(
+        cls,
+        keys: pd.DataFrame,
+        aggregates: Mapping[str, tuple[Any, ...]],
+        *,
+        groups: GroupCodes | None = None,
+    ) -> PartialAggregates:
+        """Aggregate a batch of rows in a single pass.
+
+        Args:
+            keys: Group-key values, one column per key and one row per input
+                row.
+            aggregates: Output alias → ``(function, values)`` or
+                ``(function, values, option)``.  *values* is the evaluated
+                argument, aligned with *keys*; ``None`` is only valid for
+                ``count`` and means ``count(*)``.  *option* is required by
+                ``approxpercentile`` (the percentile) and ``approxtopk``
+                (``k``).
+            groups: Precomputed codes for *keys*, when the caller already
+                factorized them.
+
+        Raises:
+            ValueError: If a function is not in
+                :data:`MERGEABLE_AGGREGATIONS` or a value column does not
+                match the number of key rows.
+            TypeError: If the group keys are not hashable.
+
+        """
+        if groups is None:
+            groups = _factorize(keys)
+        functions: dict[str, str] = {}
+        states: dict[str, _State] = {}
+        options: dict[str, Any] = {}
+        for alias, (function, values, *rest) in aggregates.items():
+            kernel = _kernel(function)
+            option = rest[0] if rest else None
+            if kernel.requires_option and option is None:
+                msg = f"{function}() requires a second argument"
+                raise ValueError(msg)
+            if values is None:
+                if function != "count":
+                    msg = f"{function}() requires an argument"
+                    raise ValueError(msg)
+            elif len(values) != len(keys):
+                msg = (
+                    f"Aggregate {alias!r} has {len(values)} values for "
+                    f"{len(keys)} key rows"
+                )
+                raise ValueError(msg)
+            else:
+                values = values.reset_index(drop=True)
+            functions[alias] = function
+            options[alias] = option
+            states[alias] = kernel.partial(groups, values, option)
+        return cls(
+            keys=groups.key_frame(keys),
+            functions=functions,
+            states=states,
+            options=options,
+        )
+
+    def merge(self, *others: PartialAggregates) -> PartialAggregates:
+        """Combine this partial with *others* computed over other rows.
+
+        Groups are matched on their key values, so each partial may have
+        seen any subset of the groups.  Group order is first-seen across
+        the partials, in argument order.
+
+        Raises:
+            ValueError: If the partials compute different aggregates.
+
+        """
+        parts = (self, *others)
+        for other in others:
+            if (other.functions, other.options) != (
+                self.functions,
+                self.options,
+            ):
+                msg = "Cannot merge partial aggregates of different functions"
+                raise ValueError(msg)
+        keys = pd.concat([p.keys for p in parts], ignore_index=True)
+        groups = _factorize(keys)
+        states = {
+            alias: _KERNELS[function].merge(
+                groups,
+                [p.states[alias] for p in parts],
+            )
+            for alias, function in self.functions.items()
+        }
+        return PartialAggregates(
+            keys=groups.key_frame(keys),
+            functions=dict(self.functions),
+            states=states,
+            options=dict(self.options),
+        )
+
+    def finalize(self) -> pd.DataFrame:
+        """Return the group keys followed by one column per aggregate."""
+        result = self.keys.copy()
+        for alias, function in self.functions.items():
+            result[alias] = _KERNELS[function].finalize(
+                self.states[alias],
+                self.options.get(alias),
+            )
+        return result
+
+
+def _kernel(function: str) -> _Kernel:
+    try:
+        return _KERNELS[function]
+    except KeyError:
+        msg = (
+            f"Aggregate {function!r} is not mergeable; expected one of "
+            f"{sorted(MERGEABLE_AGGREGATIONS)}"
+        )
+        raise ValueError(msg) from None
+
+
+def _factorize(keys: pd.DataFrame) -> GroupCodes:
+    groups = GroupCodes.from_frame(keys)
+    if groups is None:
+        msg = "Group keys must be hashable to aggregate by group codes"
+        raise TypeError(msg)
+    return groups
+
+
+def _concat(arrays: list[Any]) -> np.ndarray:
+    if any(isinstance(a, pd.api.extensions.ExtensionArray) for a in arrays):
+        # e.g. per-group minima of a string column
+        return pd.concat(map(pd.Series, arrays), ignore_index=True).array
+    return np.concatenate(arrays)
@@ -74,42 +74,127 @@ Inspect data sources before building full contexts::
 
 from __future__ import annotations
 
-from pycypher.ingestion.config import PipelineConfig, load_pipeline_config
-from pycypher.ingestion.context_builder import ContextBuilder
-from pycypher.ingestion.data_preview import (
-    ColumnStats,
-    DataSampler,
-    PreviewCache,
-    QueryResult,
-    QueryTester,
-    SamplingStrategy,
-    SchemaInfo,
-)
-from pycypher.ingestion.data_sources import (
-    ArrowDataSource,
-    CsvFormat,
-    DataFrameDataSource,
-    DataSource,
-    FileDataSource,
-    Format,
-    JsonFormat,
-    ParquetFormat,
-    SqlDataSource,
-    data_source_from_uri,
-)
-from pycypher.ingestion.duckdb_reader import DuckDBReader
-from pycypher.ingestion.introspector import DataSourceIntrospector
-from pycypher.ingestion.output_writer import write_dataframe_to_uri
-from pycypher.ingestion.pipeline_builder import (
-    PipelineBuilder,
-    PipelineOperation,
-    PipelineSnapshot,
-)
-from pycypher.ingestion.validation import (
-    ValidationResult,
-    validate_config,
-    validate_config_dict,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pycypher.ingestion.config import PipelineConfig, load_pipeline_config
+    from pycypher.ingestion.context_builder import ContextBuilder
+    from pycypher.ingestion.data_preview import (
+        ColumnStats,
+        DataSampler,
+        PreviewCache,
+        PreviewStage,
+        QueryResult,
+        QueryTester,
+        SamplingStrategy,
+        SchemaInfo,
+    )
+    from pycypher.ingestion.data_sources import (
+        ArrowDataSource,
+        CsvFormat,
+        DataFrameDataSource,
+        DataSource,
+        FileDataSource,
+        Format,
+        JsonFormat,
+        ParquetFormat,
+        SqlDataSource,
+        data_source_from_uri,
+    )
+    from pycypher.ingestion.duckdb_reader import DuckDBReader
+    from pycypher.ingestion.introspector import DataSourceIntrospector
+    from pycypher.ingestion.output_writer import write_dataframe_to_uri
+    from pycypher.ingestion.pipeline_builder import (
+        PipelineBuilder,
+        PipelineOperation,
+        PipelineSnapshot,
+    )
+    from pycypher.ingestion.scan_pushdown import (
+        ScanPredicate,
+        ScanSpec,
+        plan_source_scans,
+    )
+    from pycypher.ingestion.validation import (
+        ValidationResult,
+        validate_config,
+        validate_config_dict,
+    )
+
+# Submodules are imported on first attribute access (PEP 562), so that
+# importing one light submodule (``pycypher.ingestion.security``, say) does
+# not load pandas, DuckDB and the whole ingestion stack.
+# Lazy-loaded symbols: mapped to (module_path, attribute_name).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "PipelineConfig": ("pycypher.ingestion.config", "PipelineConfig"),
+    "load_pipeline_config": (
+        "pycypher.ingestion.config",
+        "load_pipeline_config",
+    ),
+    "ContextBuilder": (
+        "pycypher.ingestion.context_builder",
+        "ContextBuilder",
+    ),
+    "ColumnStats": ("pycypher.ingestion.data_preview", "ColumnStats"),
+    "DataSampler": ("pycypher.ingestion.data_preview", "DataSampler"),
+    "PreviewCache": ("pycypher.ingestion.data_preview", "PreviewCache"),
+    "PreviewStage": ("pycypher.ingestion.data_preview", "PreviewStage"),
+    "QueryResult": ("pycypher.ingestion.data_preview", "QueryResult"),
+    "QueryTester": ("pycypher.ingestion.data_preview", "QueryTester"),
+    "SamplingStrategy": (
+        "pycypher.ingestion.data_preview",
+        "SamplingStrategy",
+    ),
+    "SchemaInfo": ("pycypher.ingestion.data_preview", "SchemaInfo"),
+    "ArrowDataSource": ("pycypher.ingestion.data_sources", "ArrowDataSource"),
+    "CsvFormat": ("pycypher.ingestion.data_sources", "CsvFormat"),
+    "DataFrameDataSource": (
+        "pycypher.ingestion.data_sources",
+        "DataFrameDataSource",
+    ),
+    "DataSource": ("pycypher.ingestion.data_sources", "DataSource"),
+    "FileDataSource": ("pycypher.ingestion.data_sources", "FileDataSource"),
+    "Format": ("pycypher.ingestion.data_sources", "Format"),
+    "JsonFormat": ("pycypher.ingestion.data_sources", "JsonFormat"),
+    "ParquetFormat": ("pycypher.ingestion.data_sources", "ParquetFormat"),
+    "SqlDataSource": ("pycypher.ingestion.data_sources", "SqlDataSource"),
+    "data_source_from_uri": (
+        "pycypher.ingestion.data_sources",
+        "data_source_from_uri",
+    ),
+    "DuckDBReader": ("pycypher.ingestion.duckdb_reader", "DuckDBReader"),
+    "DataSourceIntrospector": (
+        "pycypher.ingestion.introspector",
+        "DataSourceIntrospector",
+    ),
+    "write_dataframe_to_uri": (
+        "pycypher.ingestion.output_writer",
+        "write_dataframe_to_uri",
+    ),
+    "PipelineBuilder": (
+        "pycypher.ingestion.pipeline_builder",
+        "PipelineBuilder",
+    ),
+    "PipelineOperation": (
+        "pycypher.ingestion.pipeline_builder",
+        "PipelineOperation",
+    ),
+    "PipelineSnapshot": (
+        "pycypher.ingestion.pipeline_builder",
+        "PipelineSnapshot",
+    ),
+    "ScanPredicate": ("pycypher.ingestion.scan_pushdown", "ScanPredicate"),
+    "ScanSpec": ("pycypher.ingestion.scan_pushdown", "ScanSpec"),
+    "plan_source_scans": (
+        "pycypher.ingestion.scan_pushdown",
+        "plan_source_scans",
+    ),
+    "ValidationResult": ("pycypher.ingestion.validation", "ValidationResult"),
+    "validate_config": ("pycypher.ingestion.validation", "validate_config"),
+    "validate_config_dict": (
+        "pycypher.ingestion.validation",
+        "validate_config_dict",
+    ),
+}
 
 __all__ = [
     "ArrowDataSource",
@@ -127,9 +212,13 @@ __all__ = [
     "JsonFormat",
     "ParquetFormat",
     "SqlDataSource",
+    "ScanPredicate",
+    "ScanSpec",
+    "plan_source_scans",
     "ColumnStats",
     "DataSampler",
     "PreviewCache",
+    "PreviewStage",
     "QueryResult",
     "QueryTester",
     "SamplingStrategy",
@@ -142,3 +231,22 @@ __all__ = [
     "validate_config",
     "validate_config_dict",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import public symbols on first attribute access."""
+    if name in _LAZY_IMPORTS:
+        module_path, attr_name = _LAZY_IMPORTS[name]
+        import importlib
+
+        value = getattr(importlib.import_module(module_path), attr_name)
+        # Cache on the module to avoid repeated imports.
+        globals()[name] = value
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded symbols in ``dir()``."""
+    return sorted({*globals(), *__all__})
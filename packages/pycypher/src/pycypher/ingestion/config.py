@@ -443,6 +443,14 @@ class FunctionConfig(BaseModel):
 
         callable: "mypackage.string_utils.normalize_name"
 
+    Either form accepts the evaluation options of
+    :func:`~pycypher.scalar_functions.user_functions.register_user_function`::
+
+        callable: "mypackage.geo.geocode"
+        mode: dedup          # row (default) | dedup | vectorized
+        memo_size: 100000
+        processes: 4
+
     Attributes:
         module: Dotted import path of the module to register from.
         names: List of function names within ``module`` to register, or
@@ -450,12 +458,18 @@ class FunctionConfig(BaseModel):
             ``module`` is specified.
         callable: Fully-qualified dotted path to a single callable.
             Mutually exclusive with ``module``.
+        mode: ``"row"``, ``"dedup"`` or ``"vectorized"`` evaluation.
+        memo_size: Distinct inputs memoized per ``dedup`` function.
+        processes: Worker processes for ``row``/``dedup`` functions.
 
     """
 
     module: str | None = None
     names: list[str] | str | None = None  # list of names or "*"
     callable: str | None = None
+    mode: Literal["row", "dedup", "vectorized"] = "row"
+    memo_size: int | None = Field(default=None, ge=0)
+    processes: int | None = Field(default=None, ge=1)
 
     @field_validator("module", mode="after")
     @classmethod
@@ -559,6 +573,64 @@ class QueryConfig(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+class ParquetLayoutConfig(BaseModel):
+    """File layout of a Parquet output.
+
+    With ``partition_by`` or ``max_rows_per_file`` set, the output ``uri``
+    names a directory of ``part-NNNNN.parquet`` files (hive-style
+    ``column=value`` sub-directories for each partition) rather than a
+    single file.  Results are written incrementally, one chunk at a time.
+
+    Attributes:
+        partition_by: Columns to partition the output by.  Their values
+            become directory names and are not stored inside the files.
+        sort_by: Columns each file is sorted by, which tightens the
+            per-row-group min/max statistics readers prune with.  Sorting
+            buffers a whole file, so pair it with ``max_rows_per_file``
+            for large outputs.
+        max_rows_per_file: Start a new file after this many rows.
+        row_group_size: Rows per Parquet row group.
+        compression: Parquet codec (``snappy``, ``zstd``, ``gzip``,
+            ``brotli``, ``lz4`` or ``none``).
+        compression_level: Codec-specific compression level.
+        use_dictionary: Dictionary-encode all columns (``True``), none
+            (``False``), or only the listed columns.
+        max_open_files: Files kept open at once across partitions.  When
+            a new partition needs a file beyond this, the least recently
+            written one is closed and that partition continues in a new
+            part file.
+
+    """
+
+    partition_by: list[str] = Field(default_factory=list)
+    sort_by: list[str] = Field(default_factory=list)
+    max_rows_per_file: int | None = Field(default=None, ge=1)
+    row_group_size: int = Field(default=128 * 1024, ge=1)
+    compression: Literal["snappy", "zstd", "gzip", "brotli", "lz4", "none"] = (
+        "snappy"
+    )
+    compression_level: int | None = None
+    use_dictionary: bool | list[str] = True
+    max_open_files: int = Field(default=64, ge=1)
+
+    @model_validator(mode="after")
+    def check_columns(self) -> ParquetLayoutConfig:
+        """Reject sorting by a partition column (it is constant per file)."""
+        overlap = sorted(set(self.partition_by) & set(self.sort_by))
+        if overlap:
+            msg = (
+                f"Columns {overlap!r} appear in both 'partition_by' and "
+                "'sort_by'; partition columns are constant within a file."
+            )
+            raise ValueError(msg)
+        return self
+
+    @property
+    def is_dataset(self) -> bool:
+        """Whether the output is a directory of files rather than one file."""
+        return bool(self.partition_by) or self.max_rows_per_file is not None
+
+
 class OutputConfig(BaseModel):
     """Sink configuration for writing a query's result.
 
@@ -569,12 +641,16 @@ class OutputConfig(BaseModel):
             when ``format`` is absent.
         format: Explicit output format.  When ``None``, inferred from the
             URI extension (e.g. ``.parquet`` → ``parquet``).
+        parquet: Layout options for Parquet outputs (partitioning, file and
+            row-group sizes, sorting, compression).  ``None`` writes one
+            file with default settings.
 
     """
 
     query_id: str
     uri: str
     format: OutputFormat | None = None
+    parquet: ParquetLayoutConfig | None = None
 
     @model_validator(mode="after")
     def check_uri(self) -> OutputConfig:
@@ -582,6 +658,24 @@ class OutputConfig(BaseModel):
         _check_output_uri(self.uri)
         return self
 
+    @model_validator(mode="after")
+    def check_parquet_layout(self) -> OutputConfig:
+        """Reject ``parquet`` layout options on a non-Parquet output."""
+        if self.parquet is None:
+            return self
+        is_parquet = (
+            self.format == OutputFormat.PARQUET
+            if self.format is not None
+            else urlparse(self.uri).path.lower().endswith(".parquet")
+        )
+        if not is_parquet:
+            msg = (
+                f"Output {self.uri!r} sets 'parquet' layout options but is "
+                "not a Parquet output."
+            )
+            raise ValueError(msg)
+        return self
+
 
 # ---------------------------------------------------------------------------
 # Config schema versioning
@@ -27,7 +27,11 @@ from pycypher.ingestion.arrow_utils import (
     normalize_entity_table,
     normalize_relationship_table,
 )
-from pycypher.ingestion.data_sources import data_source_from_uri
+from pycypher.ingestion.data_sources import (
+    DataSource,
+    FileDataSource,
+    data_source_from_uri,
+)
 from pycypher.relational_models import (
     RELATIONSHIP_SOURCE_COLUMN,
     RELATIONSHIP_TARGET_COLUMN,
@@ -41,6 +45,15 @@ from pycypher.relational_models import (
 if TYPE_CHECKING:
     import pyarrow as pa
 
+    from pycypher.ingestion.scan_pushdown import ScanSpec
+
+
+def _read_source(data_source: DataSource, scan: ScanSpec | None) -> pa.Table:
+    """Read *data_source*, pushing *scan* down when the source supports it."""
+    if scan is not None and isinstance(data_source, FileDataSource):
+        return data_source.read(scan=scan)
+    return data_source.read()
+
 
 class ContextBuilder:
     """Fluent builder that assembles a ``Context`` from heterogeneous sources.
@@ -62,6 +75,7 @@ class ContextBuilder:
         id_col: str | None = None,
         query: str | None = None,
         schema_hints: dict[str, str] | None = None,
+        scan: ScanSpec | None = None,
     ) -> ContextBuilder:
         """Register an entity type loaded from *source*.
 
@@ -73,12 +87,26 @@ class ContextBuilder:
             query: Optional SQL query applied after loading (file paths only).
             schema_hints: Optional mapping of column name → DuckDB type
                 string, applied as a ``CAST`` before *query* runs.
+            scan: Optional projection/filter pushed into the file scan
+                (file paths only; see
+                :func:`~pycypher.ingestion.scan_pushdown.plan_source_scans`).
+                Row filters are ignored without *id_col*, since dropping
+                rows would renumber the generated IDs.
 
         Returns:
             ``self`` for chaining.
 
         """
-        raw = data_source_from_uri(source, query=query, schema_hints=schema_hints).read()
+        if scan is not None:
+            scan = scan.require(id_col)
+            if id_col is None:
+                scan = scan.without_predicates()
+        data_source = data_source_from_uri(
+            source,
+            query=query,
+            schema_hints=schema_hints,
+        )
+        raw = _read_source(data_source, scan)
         table = normalize_entity_table(raw, id_col=id_col)
         entity_table = EntityTable.from_arrow(entity_type, table)
         self._entity_tables.append(entity_table)
@@ -95,6 +123,7 @@ class ContextBuilder:
         query: str | None = None,
         allow_multi_edges: bool = False,
         schema_hints: dict[str, str] | None = None,
+        scan: ScanSpec | None = None,
     ) -> ContextBuilder:
         """Register a relationship type loaded from *source*.
 
@@ -112,12 +141,25 @@ class ContextBuilder:
                 transaction).
             schema_hints: Optional mapping of column name → DuckDB type
                 string, applied as a ``CAST`` before *query* runs.
+            scan: Optional projection/filter pushed into the file scan
+                (file paths only).  Row filters are ignored without *id_col*
+                or when parallel edges are collapsed, because either would
+                change which rows survive.
 
         Returns:
             ``self`` for chaining.
 
         """
-        raw = data_source_from_uri(source, query=query, schema_hints=schema_hints).read()
+        if scan is not None:
+            scan = scan.require(source_col, target_col, id_col)
+            if id_col is None or not allow_multi_edges:
+                scan = scan.without_predicates()
+        data_source = data_source_from_uri(
+            source,
+            query=query,
+            schema_hints=schema_hints,
+        )
+        raw = _read_source(data_source, scan)
         table = normalize_relationship_table(
             raw,
             source_col=source_col,
@@ -10,16 +10,27 @@ Classes:
     PreviewCache: LRU cache for preview results.
     DataSampler: Core sampling engine with pluggable strategies.
     QueryResult: Container for query execution results with timing.
+    PreviewStage: One round of a progressive preview.
     QueryTester: Execute Cypher queries against sampled data.
+
+Samples used for query previews are *consistent* — the same rows on every
+run, and every larger sample contains every smaller one — and
+*relationship-aware*: relationships are drawn from those whose source node
+was sampled, and their target nodes are added to the sample, so joins on
+sampled data still find matches.
 """
 
 from __future__ import annotations
 
+import itertools
+import threading
 import time
-from collections import OrderedDict
-from dataclasses import dataclass
+import weakref
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -32,6 +43,14 @@ from pycypher.ingestion.data_sources import (
 )
 from pycypher.ingestion.security import escape_sql_string_literal
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    import duckdb
+
+    from pycypher.cancellation import CancellationToken
+    from pycypher.relational_models import Context
+
 # ---------------------------------------------------------------------------
 # Enums and data classes
 # ---------------------------------------------------------------------------
@@ -43,6 +62,9 @@ class SamplingStrategy(Enum):
     HEAD = "head"
     TAIL = "tail"
     RANDOM = "random"
+    #: The rows with the smallest hash of a key column: repeatable, and
+    #: nested — a larger sample contains every smaller one.
+    CONSISTENT = "consistent"
 
 
 @dataclass(frozen=True)
@@ -75,6 +97,57 @@ class QueryResult:
     error: str | None = None
 
 
+@dataclass
+class PreviewStage:
+    """One round of a progressive preview.
+
+    Attributes:
+        sample_rows: Rows sampled per source for this round.
+        result: The query result on that sample.
+        elapsed_ms: Wall-clock time of the round, sampling included.
+        cached: Whether the result came from the :class:`PreviewCache`.
+        complete: Whether the sample held every row of every source, so
+            the result is the full result.
+
+    """
+
+    sample_rows: int
+    result: QueryResult
+    elapsed_ms: float = 0.0
+    cached: bool = False
+    complete: bool = False
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+#: Cache-key tokens of live in-memory sources, keyed by ``id()``.  An
+#: entry is dropped when its source is garbage-collected, so an object
+#: that later reuses the ``id()`` gets a fresh token, not a stale cache hit.
+_SOURCE_TOKENS: dict[int, str] = {}
+_SOURCE_COUNTER = itertools.count()
+_SOURCE_LOCK = threading.Lock()
+
+
+def _source_identity(source: str | pd.DataFrame | pa.Table) -> str:
+    """Return a cache-key identity for *source* that is stable while it lives.
+
+    File sources are identified by their URI; in-memory tables by a token
+    issued on first use.
+    """
+    if isinstance(source, str):
+        return source
+    key = id(source)
+    with _SOURCE_LOCK:
+        token = _SOURCE_TOKENS.get(key)
+        if token is None:
+            token = f"<memory:{next(_SOURCE_COUNTER)}>"
+            _SOURCE_TOKENS[key] = token
+            weakref.finalize(source, _SOURCE_TOKENS.pop, key, None)
+    return token
+
+
 # ---------------------------------------------------------------------------
 # PreviewCache
 # ---------------------------------------------------------------------------
@@ -172,11 +245,30 @@ class DataSampler:
         msg = f"Unsupported file extension: {ext!r}"
         raise ValueError(msg)
 
-    def _cache_key(self, n: int, strategy: SamplingStrategy) -> str:
-        source_id = (
-            self._source if isinstance(self._source, str) else id(self._source)
-        )
-        return f"{source_id}:{n}:{strategy.value}"
+    def _cache_key(
+        self,
+        n: int,
+        strategy: SamplingStrategy,
+        key: str | None = None,
+    ) -> str:
+        suffix = f":{key}" if key is not None else ""
+        return f"{_source_identity(self._source)}:{n}:{strategy.value}{suffix}"
+
+    @contextmanager
+    def _connect(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Yield a DuckDB connection exposing the data as view ``source``."""
+        import duckdb
+
+        with duckdb.connect() as con:
+            if self._resolved_table is not None:
+                con.register("source", self._resolved_table)
+            else:
+                assert isinstance(self._source, str)
+                read_fn = self._duckdb_read_fn(
+                    _uri_to_duckdb_path(self._source),
+                )
+                con.execute(f"CREATE VIEW source AS SELECT * FROM {read_fn}")  # nosec B608
+            yield con
 
     # -- public API ---------------------------------------------------------
 
@@ -184,29 +276,81 @@ class DataSampler:
         self,
         n: int = 50,
         strategy: SamplingStrategy = SamplingStrategy.HEAD,
+        *,
+        key: str | None = None,
     ) -> pa.Table:
         """Return a sample of *n* rows using the given strategy.
 
         Args:
             n: Number of rows to return.
-            strategy: Sampling method (HEAD, TAIL, RANDOM).
+            strategy: Sampling method (HEAD, TAIL, RANDOM, CONSISTENT).
+            key: Column whose hash orders a CONSISTENT sample; defaults
+                to the first column.
 
         Returns:
             Arrow table with at most *n* rows.
         """
         if self._cache is not None:
-            key = self._cache_key(n, strategy)
-            cached = self._cache.get(key)
+            cache_key = self._cache_key(n, strategy, key)
+            cached = self._cache.get(cache_key)
             if cached is not None:
                 return cached
 
-        result = self._sample_impl(n, strategy)
+        if strategy == SamplingStrategy.CONSISTENT:
+            result = self._sample_consistent(n, key)
+        else:
+            result = self._sample_impl(n, strategy)
 
         if self._cache is not None:
-            self._cache.put(self._cache_key(n, strategy), result)
+            self._cache.put(self._cache_key(n, strategy, key), result)
 
         return result
 
+    def _sample_consistent(self, n: int, key: str | None) -> pa.Table:
+        with self._connect() as con:
+            if key is None:
+                key = con.execute("DESCRIBE source").fetchall()[0][0]
+            column = _quote_ident(key)
+            return con.execute(
+                f"SELECT * FROM source ORDER BY hash({column}), {column} "  # nosec B608
+                f"LIMIT {int(n)}"
+            ).to_arrow_table()
+
+    def rows_matching(
+        self,
+        column: str,
+        values: Iterable[Any],
+        *,
+        limit: int | None = None,
+    ) -> pa.Table:
+        """Return the rows whose *column* holds one of *values*.
+
+        Values are compared as text, so integer IDs match IDs read from
+        CSV as strings.  With *limit*, the rows with the smallest hash of
+        *column* are kept, as for a CONSISTENT sample.
+
+        Args:
+            column: Column to filter on.
+            values: Values to keep.
+            limit: Optional maximum number of rows.
+
+        Returns:
+            Arrow table of the matching rows.
+        """
+        keys = pa.table(
+            {"k": pa.array([str(v) for v in values], type=pa.string())},
+        )
+        quoted = _quote_ident(column)
+        sql = (
+            f"SELECT * FROM source WHERE CAST({quoted} AS VARCHAR) "  # nosec B608
+            "IN (SELECT k FROM keys)"
+        )
+        if limit is not None:
+            sql += f" ORDER BY hash({quoted}), {quoted} LIMIT {int(limit)}"
+        with self._connect() as con:
+            con.register("keys", keys)
+            return con.execute(sql).to_arrow_table()
+
     def _sample_impl(self, n: int, strategy: SamplingStrategy) -> pa.Table:
         if self._resolved_table is not None:
             return self._sample_arrow(self._resolved_table, n, strategy)
@@ -406,16 +550,33 @@ class QueryTester:
     Args:
         sample_size: Number of rows to sample per entity when building
             the test context.  ``None`` means use full data.
+        cache: Optional :class:`PreviewCache` for the results of
+            :meth:`run_sample`, keyed by (query, sample).
     """
 
-    def __init__(self, sample_size: int | None = None) -> None:
+    def __init__(
+        self,
+        sample_size: int | None = None,
+        *,
+        cache: PreviewCache | None = None,
+    ) -> None:
         self._sample_size = sample_size
+        self._cache = cache
         self._entities: list[
             tuple[str, str | pd.DataFrame | pa.Table, str | None]
         ] = []
         self._relationships: list[
-            tuple[str, str | pd.DataFrame | pa.Table, str, str, str | None]
+            tuple[
+                str,
+                str | pd.DataFrame | pa.Table,
+                str,
+                str,
+                str | None,
+                str | None,
+                str | None,
+            ]
         ] = []
+        self._samples: dict[int, _GraphSample] = {}
 
     def add_entity(
         self,
@@ -435,6 +596,7 @@ class QueryTester:
             ``self`` for chaining.
         """
         self._entities.append((entity_type, source, id_col))
+        self._samples.clear()
         return self
 
     def add_relationship(
@@ -445,6 +607,8 @@ class QueryTester:
         source_col: str,
         target_col: str,
         id_col: str | None = None,
+        source_type: str | None = None,
+        target_type: str | None = None,
     ) -> QueryTester:
         """Register a relationship type for query testing.
 
@@ -454,71 +618,159 @@ class QueryTester:
             source_col: Column containing source node IDs.
             target_col: Column containing target node IDs.
             id_col: Optional ID column for the relationship itself.
+            source_type: Entity type of the source nodes, if known.
+                Samples then only draw relationships from that type's
+                sampled nodes.
+            target_type: Entity type of the target nodes, if known.
+                Sampled targets are then only added to that type.
 
         Returns:
             ``self`` for chaining.
         """
         self._relationships.append(
-            (rel_type, source, source_col, target_col, id_col)
+            (
+                rel_type,
+                source,
+                source_col,
+                target_col,
+                id_col,
+                source_type,
+                target_type,
+            )
         )
+        self._samples.clear()
         return self
 
-    def run(self, cypher: str) -> QueryResult:
-        """Execute a Cypher query against the registered sample data.
+    # -- sampling -----------------------------------------------------------
 
-        Args:
-            cypher: Cypher query string.
+    def _graph_sample(self, n: int) -> _GraphSample:
+        """Return a consistent, relationship-aware sample of every source.
 
-        Returns:
-            :class:`QueryResult` with the result table, timing, and any error.
+        Each entity source contributes its *n* CONSISTENT rows.  Each
+        relationship source contributes up to *n* relationships whose
+        source node was sampled, and the target nodes of those
+        relationships are then added to the entity samples — of the
+        relationship's ``target_type`` when one was given, otherwise of
+        every type with a node of that ID.  The sample is complete only
+        when every source was read in full.
         """
-        from pycypher.ingestion.context_builder import ContextBuilder
+        sample = self._samples.get(n)
+        if sample is not None:
+            return sample
+        complete = True
+        entity_tables: list[pa.Table] = []
+        sampled_ids: defaultdict[str, set[str]] = defaultdict(set)
+        for entity_type, source, id_col in self._entities:
+            table = DataSampler(source).sample(
+                n,
+                SamplingStrategy.CONSISTENT,
+                key=id_col,
+            )
+            complete = complete and len(table) < n
+            entity_tables.append(table)
+            if id_col is not None:
+                sampled_ids[entity_type].update(
+                    str(v) for v in table.column(id_col).to_pylist()
+                )
+        all_ids = set().union(*sampled_ids.values())
+        rel_tables: list[pa.Table] = []
+        # Target IDs by entity type; ``None`` collects untyped targets.
+        endpoints: defaultdict[str | None, set[str]] = defaultdict(set)
+        for (
+            _rel_type,
+            source,
+            source_col,
+            target_col,
+            _id,
+            source_type,
+            target_type,
+        ) in self._relationships:
+            sampler = DataSampler(source)
+            table = sampler.rows_matching(
+                source_col,
+                all_ids if source_type is None else sampled_ids[source_type],
+                limit=n,
+            )
+            complete = complete and len(table) == sampler.schema().row_count
+            rel_tables.append(table)
+            endpoints[target_type].update(
+                str(v) for v in table.column(target_col).to_pylist()
+            )
+        untyped = endpoints.pop(None, set()) - all_ids
+        for i, (entity_type, source, id_col) in enumerate(self._entities):
+            missing = untyped | (
+                endpoints.get(entity_type, set()) - sampled_ids[entity_type]
+            )
+            if id_col is not None and missing:
+                extra = DataSampler(source).rows_matching(id_col, missing)
+                if len(extra):
+                    entity_tables[i] = pa.concat_tables(
+                        [entity_tables[i], extra],
+                        promote_options="permissive",
+                    )
+        sample = _GraphSample(entity_tables, rel_tables, complete)
+        self._samples[n] = sample
+        return sample
 
-        try:
-            builder = ContextBuilder()
+    def _build_context(self, n: int | None) -> Context:
+        from pycypher.ingestion.context_builder import ContextBuilder
 
+        builder = ContextBuilder()
+        if n is None:
             for entity_type, source, id_col in self._entities:
-                if self._sample_size is not None:
-                    sampler = DataSampler(source)
-                    sampled = sampler.sample(
-                        n=self._sample_size, strategy=SamplingStrategy.HEAD
-                    )
-                    builder.add_entity(entity_type, sampled, id_col=id_col)
-                else:
-                    builder.add_entity(entity_type, source, id_col=id_col)
-
-            for (
+                builder.add_entity(entity_type, source, id_col=id_col)
+            for rel_type, source, source_col, target_col, *_ in (
+                self._relationships
+            ):
+                builder.add_relationship(
+                    rel_type,
+                    source,
+                    source_col=source_col,
+                    target_col=target_col,
+                )
+            return builder.build()
+        sample = self._graph_sample(n)
+        for (entity_type, _source, id_col), table in zip(
+            self._entities, sample.entities, strict=True
+        ):
+            builder.add_entity(entity_type, table, id_col=id_col)
+        for (rel_type, _source, source_col, target_col, *_), table in zip(
+            self._relationships, sample.relationships, strict=True
+        ):
+            builder.add_relationship(
                 rel_type,
-                source,
-                source_col,
-                target_col,
-                id_col,
-            ) in self._relationships:
-                if self._sample_size is not None:
-                    sampler = DataSampler(source)
-                    sampled = sampler.sample(
-                        n=self._sample_size, strategy=SamplingStrategy.HEAD
-                    )
-                    builder.add_relationship(
-                        rel_type,
-                        sampled,
-                        source_col=source_col,
-                        target_col=target_col,
-                    )
-                else:
-                    builder.add_relationship(
-                        rel_type,
-                        source,
-                        source_col=source_col,
-                        target_col=target_col,
-                    )
+                table,
+                source_col=source_col,
+                target_col=target_col,
+            )
+        return builder.build()
+
+    def _fingerprint(self) -> str:
+        """Identify the registered sources, for result cache keys."""
+        specs = [(t, src) for t, src, _ in self._entities] + [
+            (t, src) for t, src, *_ in self._relationships
+        ]
+        return "|".join(
+            f"{label}={_source_identity(src)}" for label, src in specs
+        )
 
-            context = builder.build()
+    # -- execution ----------------------------------------------------------
 
-            from pycypher.star import Star
+    def _execute(
+        self,
+        cypher: str,
+        n: int | None,
+        cancel_token: CancellationToken | None = None,
+    ) -> QueryResult:
+        from pycypher.star import Star
 
+        try:
+            context = self._build_context(n)
             start = time.perf_counter()
-            result_df = Star(context).execute_query(cypher)
+            result_df = Star(context).execute_query(
+                cypher,
+                cancel_token=cancel_token,
+            )
             elapsed = (time.perf_counter() - start) * 1000
 
             result_table = pa.Table.from_pandas(result_df)
@@ -526,3 +778,115 @@ class QueryTester:
 
         except Exception as exc:
             return QueryResult(error=str(exc))
+
+    def run(self, cypher: str) -> QueryResult:
+        """Execute a Cypher query against the registered sample data.
+
+        Args:
+            cypher: Cypher query string.
+
+        Returns:
+            :class:`QueryResult` with the result table, timing, and any error.
+        """
+        return self._execute(cypher, self._sample_size)
+
+    def run_sample(
+        self,
+        cypher: str,
+        n: int,
+        *,
+        cancel_token: CancellationToken | None = None,
+    ) -> PreviewStage:
+        """Execute *cypher* against the consistent sample of *n* rows.
+
+        Successful results are cached per (query, sample) when the tester
+        has a :class:`PreviewCache`.
+
+        Args:
+            cypher: Cypher query string.
+            n: Rows sampled per source.
+            cancel_token: Optional token that stops the query.
+
+        Returns:
+            The :class:`PreviewStage` for this sample.
+        """
+        start = time.perf_counter()
+        key = f"{self._fingerprint()}\x00{n}\x00{cypher}"
+        cached = self._cache.get(key) if self._cache is not None else None
+        if cached is not None:
+            sample = self._graph_sample(n)
+            return PreviewStage(
+                sample_rows=n,
+                result=QueryResult(table=cached),
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+                cached=True,
+                complete=sample.complete,
+            )
+        result = self._execute(cypher, n, cancel_token)
+        if self._cache is not None and result.table is not None:
+            self._cache.put(key, result.table)
+        return PreviewStage(
+            sample_rows=n,
+            result=result,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+            complete=self._graph_sample(n).complete,
+        )
+
+    def run_progressive(
+        self,
+        cypher: str,
+        *,
+        initial_rows: int = 100,
+        target_ms: float = 500.0,
+        max_rows: int = 1_000_000,
+        growth: int = 4,
+        on_stage: Callable[[PreviewStage], None] | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> list[PreviewStage]:
+        """Execute *cypher* on ever larger samples within a latency target.
+
+        The first round runs on *initial_rows* rows per source, so its
+        rows are available almost at once; each further round samples
+        *growth* times as many rows.  Rounds stop once the next one is
+        expected to exceed *target_ms*, the sample held all the data, a
+        round failed, *max_rows* was reached, or *cancel_token* was
+        cancelled.
+
+        Args:
+            cypher: Cypher query string.
+            initial_rows: Rows per source in the first round.
+            target_ms: Latency a round should stay under.
+            max_rows: Largest sample to try.
+            growth: Factor by which each round's sample grows.
+            on_stage: Called with each :class:`PreviewStage` as soon as it
+                is available.
+            cancel_token: Optional token that stops the preview.
+
+        Returns:
+            Every round, smallest sample first.
+        """
+        stages: list[PreviewStage] = []
+        n = max(initial_rows, 1)
+        while True:
+            stage = self.run_sample(cypher, n, cancel_token=cancel_token)
+            stages.append(stage)
+            if on_stage is not None:
+                on_stage(stage)
+            if (
+                stage.result.error is not None
+                or stage.complete
+                or n >= max_rows
+                or stage.elapsed_ms * growth > target_ms
+                or (cancel_token is not None and cancel_token.cancelled)
+            ):
+                return stages
+            n = min(n * growth, max_rows)
+
+
+@dataclass
+class _GraphSample:
+    """Sampled tables of a :class:`QueryTester`'s sources."""
+
+    entities: list[pa.Table] = field(default_factory=list)
+    relationships: list[pa.Table] = field(default_factory=list)
+    complete: bool = False
@@ -35,7 +35,7 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -50,6 +50,9 @@ from pycypher.ingestion.security import (
     validate_uri_scheme,
 )
 
+if TYPE_CHECKING:
+    from pycypher.ingestion.scan_pushdown import ScanSpec
+
 #: URI schemes that indicate a relational / SQL source.
 #: Imported by ``config.py`` for URI validation — single source of truth.
 _SQL_SCHEMES: frozenset[str] = frozenset(
@@ -337,9 +340,22 @@ class CsvFormat(Format):
         return f"read_csv_auto({escaped_path}{args})"
 
 
+@dataclass
 @dataclass
 class ParquetFormat(Format):
-    """Strategy for reading Parquet files via DuckDB's ``read_parquet``."""
+    """Strategy for reading Parquet files via DuckDB's ``read_parquet``.
+
+    The path may be a glob (``data/year=*/*.parquet``) spanning a
+    hive-partitioned dataset; filters on partition keys then skip whole
+    directories.
+
+    Attributes:
+        hive_partitioning: Parse ``key=value`` path segments into columns.
+            ``None`` (default) leaves DuckDB's auto-detection in charge.
+
+    """
+
+    hive_partitioning: bool | None = None
 
     @property
     def name(self) -> str:
@@ -355,8 +371,8 @@ class ParquetFormat(Format):
         """Generate a DuckDB SQL fragment to read a Parquet file.
 
         Produces a ``read_parquet()`` call for the given path. Parquet files
-        are self-describing and require no additional format options. The path
-        is validated to prevent SQL injection attacks.
+        are self-describing; the only option is ``hive_partitioning``. The
+        path is validated to prevent SQL injection attacks.
 
         Args:
             path: Filesystem path or URI to the Parquet file to read.
@@ -372,7 +388,10 @@ class ParquetFormat(Format):
         """
         _validate_sql_string_literal(path, "path")
         escaped_path = escape_sql_string_literal(path)
-        return f"read_parquet({escaped_path})"
+        if self.hive_partitioning is None:
+            return f"read_parquet({escaped_path})"
+        hive = "true" if self.hive_partitioning else "false"
+        return f"read_parquet({escaped_path}, hive_partitioning={hive})"
 
 
 @dataclass
@@ -556,9 +575,16 @@ class FileDataSource(DataSource):
         """Optional column-type overrides applied before ``query`` runs."""
         return self._schema_hints
 
-    def read(self) -> pa.Table:
+    def read(self, scan: ScanSpec | None = None) -> pa.Table:
         """Read the file via DuckDB and return an Arrow table.
 
+        Args:
+            scan: Optional projection and row filter applied on top of
+                ``query`` (see :mod:`pycypher.ingestion.scan_pushdown`).
+                DuckDB pushes it into the file scan, so Parquet sources skip
+                unreferenced columns, row groups whose statistics exclude
+                the filter, and non-matching hive partitions.
+
         Returns:
             ``pa.Table`` with the file contents (or query results).
 
@@ -615,7 +641,14 @@ class FileDataSource(DataSource):
             select = "SELECT *" if replace_clause is None else f"SELECT * {replace_clause}"
             con.execute(f"CREATE VIEW source AS {select} FROM __raw_source")  # nosec B608 — column/type identifiers validated by _schema_hints_replace_clause
             sql = self._query or "SELECT * FROM source"
-            return con.execute(sql).to_arrow_table()
+            params: list[Any] = []
+            if scan is not None and not scan.is_full_scan:
+                relation = con.sql(sql)
+                column_types = dict(
+                    zip(relation.columns, map(str, relation.types), strict=True),
+                )
+                sql, params = scan.to_sql(sql, column_types)
+            return con.execute(sql, params).to_arrow_table()
 
     def read_relation(self, con: Any) -> Any:
         """Scan the file directly via DuckDB, returning a lazy relation.
@@ -15,6 +15,16 @@ supported and raise :exc:`NotImplementedError`.  Add cloud support by
 integrating ``pyarrow.fs`` or ``fsspec`` as a separate enhancement.
 
 Parent directories are created automatically when they do not exist.
+
+Parquet layout
+--------------
+Both writers accept a
+:class:`~pycypher.ingestion.config.ParquetLayoutConfig` (``parquet=``)
+for Parquet outputs.  The result is then streamed in chunks through
+:class:`~pycypher.ingestion.parquet_writer.ParquetDatasetWriter`, with
+hive-style partitioning, file and row-group sizes, sort-within-file and
+compression options; a DuckDB relation is read through an Arrow
+record-batch reader rather than materialised.
 """
 
 from __future__ import annotations
@@ -26,7 +36,7 @@ from urllib.parse import urlparse
 if TYPE_CHECKING:
     import pandas as pd
 
-    from pycypher.ingestion.config import OutputFormat
+    from pycypher.ingestion.config import OutputFormat, ParquetLayoutConfig
 
 # URI schemes that DuckDB handles as remote storage (not local filesystem)
 _CLOUD_SCHEMES: frozenset[str] = frozenset(
@@ -95,10 +105,23 @@ def _resolve_output(uri: str, fmt: OutputFormat | None) -> tuple[Path, OutputFor
     return path, fmt
 
 
+def _check_layout_format(
+    parquet: ParquetLayoutConfig | None,
+    fmt: OutputFormat,
+) -> None:
+    from pycypher.ingestion.config import OutputFormat
+
+    if parquet is not None and fmt != OutputFormat.PARQUET:
+        msg = f"Parquet layout options given for a {fmt.value} output."
+        raise ValueError(msg)
+
+
 def write_dataframe_to_uri(
     df: pd.DataFrame,
     uri: str,
     fmt: OutputFormat | None = None,
+    *,
+    parquet: ParquetLayoutConfig | None = None,
 ) -> None:
     """Write *df* to *uri* in the appropriate format.
 
@@ -111,19 +134,31 @@ def write_dataframe_to_uri(
             Cloud URIs raise :exc:`NotImplementedError`.
         fmt: Explicit :class:`~pycypher.ingestion.config.OutputFormat`.
             When ``None``, the format is inferred from the URI extension.
+        parquet: Layout of a Parquet output.  When given, *df* is written
+            in chunks with the configured partitioning, file sizes,
+            sorting and compression.
 
     Raises:
         NotImplementedError: If *uri* uses a cloud URI scheme
             (``s3://``, ``gs://``, ``https://``, …).
         ValueError: If *fmt* is ``None`` and the URI's extension is not
-            ``.csv``, ``.parquet``, or ``.json``.
+            ``.csv``, ``.parquet``, or ``.json``, or if *parquet* is given
+            for another format.
 
     """
     from pycypher.ingestion.config import OutputFormat
 
     path, fmt = _resolve_output(uri, fmt)
+    _check_layout_format(parquet, fmt)
+
+    if parquet is not None:
+        from pycypher.ingestion.parquet_writer import (
+            iter_chunks,
+            write_parquet_chunks,
+        )
 
-    if fmt == OutputFormat.CSV:
+        write_parquet_chunks(iter_chunks(df), path, parquet)
+    elif fmt == OutputFormat.CSV:
         df.to_csv(path, index=False)
     elif fmt == OutputFormat.PARQUET:
         df.to_parquet(str(path), index=False)
@@ -147,6 +182,8 @@ def write_relation_to_uri(
     relation: object,
     uri: str,
     fmt: OutputFormat | None = None,
+    *,
+    parquet: ParquetLayoutConfig | None = None,
 ) -> None:
     """Stream a DuckDB relation to *uri* via ``COPY … TO`` (no pandas frame).
 
@@ -161,11 +198,15 @@ def write_relation_to_uri(
             cloud URIs raise :exc:`NotImplementedError`.
         fmt: Explicit :class:`~pycypher.ingestion.config.OutputFormat`.
             When ``None``, inferred from the URI extension.
+        parquet: Layout of a Parquet output.  When given, the relation is
+            read as a stream of Arrow record batches and written with
+            the configured layout instead of by ``COPY``.
 
     Raises:
         TypeError: If *relation* is not a ``DuckDBLazyFrame``.
         NotImplementedError: If *uri* uses a cloud URI scheme.
-        ValueError: If the format cannot be resolved.
+        ValueError: If the format cannot be resolved, or if *parquet* is
+            given for another format.
 
     """
     import uuid
@@ -181,6 +222,15 @@ def write_relation_to_uri(
         raise TypeError(msg)
 
     path, fmt = _resolve_output(uri, fmt)
+    _check_layout_format(parquet, fmt)
+    if parquet is not None:
+        from pycypher.ingestion.parquet_writer import (
+            iter_chunks,
+            write_parquet_chunks,
+        )
+
+        write_parquet_chunks(iter_chunks(relation), path, parquet)
+        return
     options = _COPY_FORMAT_OPTIONS[fmt.value]
 
     con = relation._conn
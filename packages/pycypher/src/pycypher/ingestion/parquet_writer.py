@@ -0,0 +1,382 @@
+"""Incremental, partitioned Parquet output.
+
+:func:`~pycypher.ingestion.output_writer.write_dataframe_to_uri` writes a
+whole result with one ``to_parquet`` call.  :class:`ParquetDatasetWriter`
+instead consumes a stream of chunks — pandas frames, Arrow tables or
+record batches — and lays them out as described by a
+:class:`~pycypher.ingestion.config.ParquetLayoutConfig`:
+
+* ``partition_by`` — rows are routed to hive-style
+  ``column=value/part-NNNNN.parquet`` files; the partition columns live in
+  the directory names only.
+* ``max_rows_per_file`` / ``row_group_size`` — files roll over after a
+  row budget and are written one row group at a time.
+* ``max_open_files`` — at most this many files are open at once; the
+  least recently written partition's file is closed to make room, and
+  that partition continues in a new part file.
+* ``sort_by`` — each file is sorted before it is written, so its row
+  groups carry narrow min/max statistics for downstream pruning.  The
+  rows of one file are buffered for this; unsorted output only buffers
+  one row group per open partition.
+* ``compression`` / ``compression_level`` / ``use_dictionary`` — passed
+  to :class:`pyarrow.parquet.ParquetWriter`.
+
+:func:`iter_chunks` turns a DataFrame, an iterable of chunks or a
+``DuckDBLazyFrame`` (streamed through an Arrow record-batch reader) into
+such a stream, and :func:`write_parquet_chunks` drives the writer.
+"""
+
+from __future__ import annotations
+
+import shutil
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from shared.logger import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pycypher.ingestion.config import ParquetLayoutConfig
+
+__all__ = [
+    "ParquetDatasetWriter",
+    "iter_chunks",
+    "write_parquet_chunks",
+]
+
+#: Directory name hive readers use for a null partition value.
+NULL_PARTITION: str = "__HIVE_DEFAULT_PARTITION__"
+
+#: Rows per chunk when a single DataFrame or relation is streamed.
+DEFAULT_CHUNK_ROWS: int = 256 * 1024
+
+Chunk = pd.DataFrame | pa.Table | pa.RecordBatch
+
+
+def iter_chunks(
+    source: Any,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[pa.Table]:
+    """Yield *source* as a stream of Arrow tables.
+
+    Args:
+        source: A ``pd.DataFrame``, ``pa.Table``, ``pa.RecordBatch``, a
+            ``DuckDBLazyFrame`` (fetched through an Arrow record-batch
+            reader, never materialised whole), or an iterable of any of
+            the first three.
+        chunk_rows: Rows per chunk when *source* is a single frame or a
+            relation.
+
+    Yields:
+        Arrow tables in input order.
+
+    """
+    from pycypher.backends.duckdb_backend import DuckDBLazyFrame
+
+    if isinstance(source, DuckDBLazyFrame):
+        relation = source.relation
+        reader = (
+            relation.to_arrow_reader(chunk_rows)
+            if hasattr(relation, "to_arrow_reader")
+            else relation.fetch_record_batch(chunk_rows)
+        )
+        for batch in reader:
+            yield pa.Table.from_batches([batch])
+        return
+    if isinstance(source, (pd.DataFrame, pa.Table, pa.RecordBatch)):
+        table = _to_table(source)
+        # An empty source still yields one chunk, carrying its schema.
+        for offset in range(0, max(table.num_rows, 1), chunk_rows):
+            yield table.slice(offset, chunk_rows)
+        return
+    for chunk in source:
+        yield _to_table(chunk)
+
+
+def _to_table(chunk: Chunk) -> pa.Table:
+    if isinstance(chunk, pd.DataFrame):
+        return pa.Table.from_pandas(chunk, preserve_index=False)
+    if isinstance(chunk, pa.RecordBatch):
+        return pa.Table.from_batches([chunk])
+    return chunk
+
+
+def _partition_dir(columns: list[str], values: tuple[Any, ...]) -> str:
+    parts = []
+    for column, value in zip(columns, values, strict=True):
+        text = NULL_PARTITION if pd.isna(value) else quote(str(value), safe="")
+        parts.append(f"{quote(column, safe='')}={text}")
+    return "/".join(parts)
+
+
+@dataclass
+class _Partition:
+    """Write state of one output directory."""
+
+    directory: Path
+    buffered: list[pa.Table] = field(default_factory=list)
+    buffered_rows: int = 0
+    file_index: int = 0
+    file_rows: int = 0
+    writer: pq.ParquetWriter | None = None
+
+
+class ParquetDatasetWriter:
+    """Write a stream of chunks as a (partitioned) Parquet dataset.
+
+    Use as a context manager, or call :meth:`close` to flush buffered
+    rows::
+
+        with ParquetDatasetWriter(path, layout) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        print(writer.files)
+
+    When *layout* is not a dataset layout (no ``partition_by`` and no
+    ``max_rows_per_file``), *path* is the single output file.  Otherwise
+    it is a directory; an existing one is replaced only if it holds
+    nothing but Parquet files and partition directories.
+
+    Args:
+        path: Output file or directory.
+        layout: Layout options.
+
+    Raises:
+        FileExistsError: If *path* is a directory with other content.
+
+    """
+
+    def __init__(self, path: Path, layout: ParquetLayoutConfig) -> None:
+        self._path = path
+        self._layout = layout
+        self._partitions: dict[tuple[Any, ...], _Partition] = {}
+        # Partitions with an open file, least recently written first.
+        self._open: OrderedDict[Path, _Partition] = OrderedDict()
+        self._schema: pa.Schema | None = None
+        #: Files written so far, in the order they were completed.
+        self.files: list[Path] = []
+        #: Rows written so far.
+        self.rows = 0
+        if layout.is_dataset:
+            _clear_dataset_dir(path)
+            path.mkdir(parents=True, exist_ok=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> ParquetDatasetWriter:
+        """Return *self* for use as a context manager."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Flush and close every open file."""
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def write(self, chunk: Chunk) -> None:
+        """Route the rows of *chunk* to their partitions.
+
+        Args:
+            chunk: A DataFrame, Arrow table or record batch whose columns
+                include every ``partition_by`` and ``sort_by`` column.
+
+        Raises:
+            ValueError: If a layout column is missing from *chunk*.
+
+        """
+        table = _to_table(chunk)
+        if table.num_rows == 0:
+            if self._schema is None:
+                self._schema = table.schema
+            return
+        missing = [
+            c
+            for c in [*self._layout.partition_by, *self._layout.sort_by]
+            if c not in table.column_names
+        ]
+        if missing:
+            msg = f"Parquet layout columns {missing!r} are not in the result."
+            raise ValueError(msg)
+        partition_by = self._layout.partition_by
+        if not partition_by:
+            self._append((), table)
+            return
+        keys = table.select(partition_by).to_pandas()
+        groups = keys.groupby(partition_by, dropna=False, sort=False).indices
+        data = table.drop_columns(partition_by)
+        for key, positions in groups.items():
+            key_tuple = key if isinstance(key, tuple) else (key,)
+            self._append(key_tuple, data.take(positions))
+
+    def close(self) -> None:
+        """Flush buffered rows and close every open file."""
+        for partition in self._partitions.values():
+            self._flush(partition)
+            self._close_file(partition)
+        if not self.files and not self._layout.is_dataset:
+            # An empty result still produces a (row-less) file.
+            schema = self._schema or pa.schema([])
+            pq.write_table(schema.empty_table(), self._path)
+            self.files.append(self._path)
+        self._partitions.clear()
+        LOGGER.debug(
+            "parquet output  path=%s  files=%d  rows=%d",
+            self._path,
+            len(self.files),
+            self.rows,
+        )
+
+    def _append(self, key: tuple[Any, ...], table: pa.Table) -> None:
+        partition = self._partitions.get(key)
+        if partition is None:
+            directory = (
+                self._path / _partition_dir(self._layout.partition_by, key)
+                if key
+                else self._path
+            )
+            partition = self._partitions[key] = _Partition(directory)
+        partition.buffered.append(table)
+        partition.buffered_rows += table.num_rows
+        limit = (
+            self._layout.max_rows_per_file
+            if self._layout.sort_by
+            else self._layout.row_group_size
+        )
+        if limit is not None and partition.buffered_rows >= limit:
+            self._flush(partition)
+
+    def _flush(self, partition: _Partition) -> None:
+        if not partition.buffered:
+            return
+        table = pa.concat_tables(
+            partition.buffered,
+            promote_options="permissive",
+        )
+        partition.buffered, partition.buffered_rows = [], 0
+        if self._layout.sort_by:
+            table = table.sort_by(
+                [(column, "ascending") for column in self._layout.sort_by],
+            )
+        max_rows = self._layout.max_rows_per_file
+        offset = 0
+        while offset < table.num_rows:
+            if max_rows is not None and partition.file_rows >= max_rows:
+                self._close_file(partition)
+            room = (
+                table.num_rows - offset
+                if max_rows is None
+                else max_rows - partition.file_rows
+            )
+            piece = table.slice(offset, room)
+            writer = self._open_file(partition, piece.schema)
+            writer.write_table(
+                piece.cast(writer.schema),
+                row_group_size=self._layout.row_group_size,
+            )
+            partition.file_rows += piece.num_rows
+            self.rows += piece.num_rows
+            offset += piece.num_rows
+        if self._layout.sort_by:
+            # Each flush of a sorted layout is one whole, sorted file.
+            self._close_file(partition)
+
+    def _open_file(
+        self,
+        partition: _Partition,
+        schema: pa.Schema,
+    ) -> pq.ParquetWriter:
+        if partition.writer is not None:
+            self._open.move_to_end(partition.directory)
+            return partition.writer
+        while len(self._open) >= self._layout.max_open_files:
+            _, idle = self._open.popitem(last=False)
+            self._close_file(idle)
+        if self._layout.is_dataset:
+            partition.directory.mkdir(parents=True, exist_ok=True)
+            name = f"part-{partition.file_index:05d}.parquet"
+            path = partition.directory / name
+        else:
+            path = self._path
+        layout = self._layout
+        partition.writer = pq.ParquetWriter(
+            path,
+            schema,
+            compression=layout.compression,
+            compression_level=layout.compression_level,
+            use_dictionary=layout.use_dictionary,
+        )
+        self.files.append(path)
+        self._open[partition.directory] = partition
+        return partition.writer
+
+    def _close_file(self, partition: _Partition) -> None:
+        if partition.writer is None:
+            return
+        partition.writer.close()
+        partition.writer = None
+        self._open.pop(partition.directory, None)
+        partition.file_index += 1
+        partition.file_rows = 0
+
+
+def _clear_dataset_dir(path: Path) -> None:
+    """Remove a previous dataset at *path* so a re-run replaces it.
+
+    Raises:
+        FileExistsError: If *path* exists and holds anything besides
+            Parquet files and ``column=value`` directories.
+
+    """
+    if not path.exists():
+        return
+    if path.is_file():
+        if path.suffix.lower() != ".parquet":
+            msg = f"Parquet dataset path {str(path)!r} is an existing file."
+            raise FileExistsError(msg)
+        path.unlink()
+        return
+    for entry in path.rglob("*"):
+        ours = (
+            entry.suffix.lower() == ".parquet"
+            if entry.is_file()
+            else "=" in entry.name
+        )
+        if not ours:
+            msg = (
+                f"Refusing to replace {str(path)!r}: it contains "
+                f"{str(entry.relative_to(path))!r}, which is not part of a "
+                "Parquet dataset."
+            )
+            raise FileExistsError(msg)
+    shutil.rmtree(path)
+
+
+def write_parquet_chunks(
+    chunks: Iterable[Chunk],
+    path: Path,
+    layout: ParquetLayoutConfig,
+) -> list[Path]:
+    """Write *chunks* to *path* with *layout*.
+
+    Args:
+        chunks: Stream of DataFrames, Arrow tables or record batches.
+        path: Output file, or directory for a dataset layout.
+        layout: Layout options.
+
+    Returns:
+        The files written.
+
+    """
+    with ParquetDatasetWriter(path, layout) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.files
@@ -0,0 +1,689 @@
+"""Projection and filter pushdown into file-backed source scans.
+
+Without pushdown every registered source is read in full and Cypher
+``WHERE`` filters only run once the whole table is in memory.  This module
+works out, for a known workload of Cypher queries, which columns and rows of
+each source any of those queries can observe, and renders that as a
+``SELECT … WHERE …`` over the DuckDB ``source`` view.  DuckDB pushes both
+into ``read_parquet``, so unreferenced columns are never decoded, row groups
+whose min/max statistics exclude the filter are skipped, and hive partitions
+(``year=2024/…``) whose keys fail the filter are never opened.
+
+Key pieces:
+
+- :class:`ScanPredicate` — one ``column <op> literal`` atom.
+- :class:`ScanSpec` — the columns to keep plus a disjunction of
+  conjunctions of predicates; rendered to SQL by :meth:`ScanSpec.to_sql`.
+- :func:`plan_source_scans` — derives a :class:`SourceScanPlan` (one spec
+  per entity label and relationship type) from a list of queries.
+
+A spec is always a *superset* of what the workload needs.  Anything the
+planner cannot reason about — mutations, ``CALL``, unlabelled node
+patterns, whole-node references such as ``RETURN n`` — widens the affected
+specs back to a full scan rather than risk dropping a row or column a query
+would have seen.
+
+Usage::
+
+    plan = plan_source_scans([
+        "MATCH (t:Tract) WHERE t.state_fips = '13' RETURN t.name",
+    ])
+    plan.entity("Tract")
+    # ScanSpec(columns=frozenset({'name', 'state_fips'}),
+    #          predicates=((ScanPredicate('state_fips', '=', '13'),),))
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from pycypher.ast_models import (
+    And,
+    ASTConverter,
+    ASTNode,
+    BooleanLiteral,
+    Call,
+    Comparison,
+    Create,
+    Delete,
+    FloatLiteral,
+    Foreach,
+    FunctionInvocation,
+    IntegerLiteral,
+    LabelPredicate,
+    ListLiteral,
+    Match,
+    Merge,
+    NodePattern,
+    NullCheck,
+    PropertyLookup,
+    RelationshipPattern,
+    Remove,
+    RemoveItem,
+    Set,
+    SetItem,
+    StringLiteral,
+    StringPredicate,
+    Variable,
+    With,
+)
+from pycypher.ingestion.security import sanitize_sql_identifier
+
+__all__ = [
+    "ScanPredicate",
+    "ScanSpec",
+    "SourceScanPlan",
+    "plan_source_scans",
+]
+
+#: Comparison operators that translate one-for-one into DuckDB SQL.
+_COMPARISON_OPS: frozenset[str] = frozenset({"=", "<>", "<", "<=", ">", ">="})
+
+#: Mirror of each comparison when the literal is on the left-hand side.
+_FLIPPED: dict[str, str] = {
+    "=": "=",
+    "<>": "<>",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+_MUTATING_CLAUSES = (Create, Merge, Set, Delete, Remove, Foreach)
+
+#: Functions whose node/relationship argument needs no property columns.
+_IDENTITY_FUNCTIONS: frozenset[str] = frozenset(
+    {"id", "elementid", "labels", "type", "count"},
+)
+
+_SCALAR_LITERAL_TYPES: frozenset[str] = frozenset(
+    {"IntegerLiteral", "FloatLiteral", "StringLiteral", "BooleanLiteral"},
+)
+
+_NUMERIC_TYPES: frozenset[str] = frozenset(
+    {
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "BIGINT",
+        "HUGEINT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+        "UBIGINT",
+        "UHUGEINT",
+        "FLOAT",
+        "DOUBLE",
+    },
+)
+
+
+def _column_family(duckdb_type: str) -> str | None:
+    """Classify a DuckDB column type as ``"num"``, ``"str"`` or ``"bool"``."""
+    t = duckdb_type.upper()
+    if t in _NUMERIC_TYPES or t.startswith("DECIMAL"):
+        return "num"
+    if t == "VARCHAR":
+        return "str"
+    if t == "BOOLEAN":
+        return "bool"
+    return None
+
+
+def _value_family(value: Any) -> str | None:
+    """Classify a Python literal the same way as :func:`_column_family`."""
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "num"
+    if isinstance(value, str):
+        return "str"
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Scan specification
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ScanPredicate:
+    """A single pushable filter atom: ``column <op> value``.
+
+    Attributes:
+        column: Source column (Cypher property) name.
+        op: One of ``=``, ``<>``, ``<``, ``<=``, ``>``, ``>=``, ``IN``,
+            ``STARTS WITH``, ``IS NULL`` or ``IS NOT NULL``.
+        value: The literal operand — a scalar, a tuple for ``IN``, or
+            ``None`` for the null checks.
+
+    """
+
+    column: str
+    op: str
+    value: Any = None
+
+    def to_sql(
+        self, column_types: Mapping[str, str]
+    ) -> tuple[str, list[Any]] | None:
+        """Render as a parameterised DuckDB condition.
+
+        Returns ``None`` when the atom cannot be pushed safely: the column
+        does not exist in the scan, or the literal's type differs from the
+        column's (Cypher yields ``null`` for such comparisons where DuckDB
+        would attempt an implicit cast).  Dropping an atom from a
+        conjunction only widens the scan, so callers simply skip it.
+        """
+        if self.column not in column_types:
+            return None
+        col = f'"{sanitize_sql_identifier(self.column)}"'
+        if self.op == "IS NULL":
+            return f"{col} IS NULL", []
+        if self.op == "IS NOT NULL":
+            return f"{col} IS NOT NULL", []
+
+        family = _column_family(column_types[self.column])
+        if family is None:
+            return None
+        if self.op == "IN":
+            values = [v for v in self.value if v is not None]
+            if any(_value_family(v) != family for v in values):
+                return None
+            if not values:
+                return "FALSE", []
+            placeholders = ", ".join("?" for _ in values)
+            return f"{col} IN ({placeholders})", values
+        if _value_family(self.value) != family:
+            return None
+        if self.op == "STARTS WITH":
+            # The range bound lets DuckDB prune row groups on min/max stats;
+            # starts_with() keeps the predicate exact.
+            return f"({col} >= ? AND starts_with({col}, ?))", [
+                self.value,
+                self.value,
+            ]
+        return f"{col} {self.op} ?", [self.value]
+
+
+@dataclass(frozen=True)
+class ScanSpec:
+    """Columns and rows of one source that a workload can observe.
+
+    Attributes:
+        columns: Property columns to read, or ``None`` for all of them.
+            Key columns (``id_col``, ``source_col``…) are added by the caller
+            via :meth:`require`.
+        predicates: Disjunction of conjunctions — a row is kept when every
+            predicate of at least one inner tuple holds.  An empty tuple
+            means no row filter.
+
+    """
+
+    columns: frozenset[str] | None = None
+    predicates: tuple[tuple[ScanPredicate, ...], ...] = ()
+
+    @property
+    def is_full_scan(self) -> bool:
+        """``True`` when the spec reads every column of every row."""
+        return self.columns is None and not self.predicates
+
+    def require(self, *columns: str | None) -> ScanSpec:
+        """Return a copy that also keeps *columns* (``None`` entries ignored)."""
+        if self.columns is None:
+            return self
+        extra = {c for c in columns if c is not None}
+        return ScanSpec(self.columns | extra, self.predicates)
+
+    def without_predicates(self) -> ScanSpec:
+        """Return a copy that keeps the projection but reads every row."""
+        return ScanSpec(self.columns, ())
+
+    def without_columns(self) -> ScanSpec:
+        """Return a copy that keeps the row filter but reads every column."""
+        return ScanSpec(None, self.predicates)
+
+    def to_sql(
+        self,
+        relation_sql: str,
+        column_types: Mapping[str, str],
+    ) -> tuple[str, list[Any]]:
+        """Wrap *relation_sql* in the projection and filter of this spec.
+
+        Args:
+            relation_sql: A ``SELECT`` producing the unfiltered source rows.
+            column_types: Column name → DuckDB type of *relation_sql*, in
+                output order.
+
+        Returns:
+            ``(sql, params)`` for ``con.execute``.
+
+        """
+        if self.columns is None:
+            select = "*"
+        else:
+            kept = [c for c in column_types if c in self.columns]
+            select = (
+                ", ".join(f'"{sanitize_sql_identifier(c)}"' for c in kept)
+                if kept
+                else "*"
+            )
+
+        params: list[Any] = []
+        disjuncts: list[str] = []
+        for conjunction in self.predicates:
+            rendered = [p.to_sql(column_types) for p in conjunction]
+            atoms = [r for r in rendered if r is not None]
+            if not atoms:
+                # One unrestricted branch makes the whole filter a no-op.
+                disjuncts, params = [], []
+                break
+            disjuncts.append("(" + " AND ".join(sql for sql, _ in atoms) + ")")
+            for _, values in atoms:
+                params.extend(values)
+
+        sql = f"SELECT {select} FROM ({relation_sql}) AS __scan"  # nosec B608 — identifiers sanitised, literals bound as parameters
+        if disjuncts:
+            sql += " WHERE " + " OR ".join(disjuncts)
+        return sql, params
+
+
+#: Spec that reads the source unchanged.
+FULL_SCAN = ScanSpec()
+
+
+@dataclass
+class SourceScanPlan:
+    """Per-source scan specs derived from a workload by :func:`plan_source_scans`.
+
+    Sources the workload never mentions get :attr:`entity_default` /
+    :attr:`relationship_default` — key columns only when the planner could
+    prove nothing reads them, otherwise a full scan.
+    """
+
+    entities: dict[str, ScanSpec] = field(default_factory=dict)
+    relationships: dict[str, ScanSpec] = field(default_factory=dict)
+    entity_default: ScanSpec = field(
+        default_factory=lambda: ScanSpec(frozenset())
+    )
+    relationship_default: ScanSpec = field(
+        default_factory=lambda: ScanSpec(frozenset()),
+    )
+
+    def entity(self, label: str) -> ScanSpec:
+        """Return the spec for entity source *label*."""
+        return self.entities.get(label, self.entity_default)
+
+    def relationship(self, rel_type: str) -> ScanSpec:
+        """Return the spec for relationship source *rel_type*."""
+        return self.relationships.get(rel_type, self.relationship_default)
+
+
+# ---------------------------------------------------------------------------
+# Workload analysis
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Needs:
+    """Accumulated columns and row branches for one source."""
+
+    columns: set[str] | None = field(default_factory=set)
+    disjuncts: list[tuple[ScanPredicate, ...]] | None = field(
+        default_factory=list
+    )
+
+    def add_use(self, conjunction: tuple[ScanPredicate, ...]) -> None:
+        if self.disjuncts is None:
+            return
+        if not conjunction:
+            self.disjuncts = None
+        elif conjunction not in self.disjuncts:
+            self.disjuncts.append(conjunction)
+
+    def add_columns(self, columns: Iterable[str]) -> None:
+        if self.columns is not None:
+            self.columns.update(columns)
+
+    def widen(self) -> None:
+        self.columns = None
+        self.disjuncts = None
+
+    def to_spec(self) -> ScanSpec:
+        return ScanSpec(
+            frozenset(self.columns) if self.columns is not None else None,
+            tuple(self.disjuncts) if self.disjuncts is not None else (),
+        )
+
+
+def _literal_value(node: Any) -> tuple[bool, Any]:
+    """Return ``(True, value)`` when *node* is a scalar literal."""
+    if isinstance(
+        node, (IntegerLiteral, FloatLiteral, StringLiteral, BooleanLiteral)
+    ):
+        return True, node.value
+    if isinstance(node, (bool, int, float, str)):
+        return True, node
+    # Relationship property maps keep literals in their raw converter form.
+    if isinstance(node, dict) and node.get("type") in _SCALAR_LITERAL_TYPES:
+        return True, node.get("value")
+    return False, None
+
+
+def _property_target(expr: Any) -> tuple[str, str] | None:
+    """Return ``(variable, property)`` for ``var.prop`` expressions."""
+    if (
+        isinstance(expr, PropertyLookup)
+        and isinstance(expr.expression, Variable)
+        and expr.property is not None
+    ):
+        return expr.expression.name, expr.property
+    return None
+
+
+def _conjuncts(expr: Any) -> list[Any]:
+    """Flatten nested ``AND`` into its operands."""
+    if isinstance(expr, And):
+        return [c for operand in expr.operands for c in _conjuncts(operand)]
+    return [expr] if expr is not None else []
+
+
+def _to_scan_predicate(expr: Any) -> tuple[str, ScanPredicate] | None:
+    """Translate one WHERE conjunct into ``(variable, predicate)`` if possible."""
+    if isinstance(expr, Comparison) and expr.operator in _COMPARISON_OPS:
+        target = _property_target(expr.left)
+        is_lit, value = _literal_value(expr.right)
+        op = expr.operator
+        if target is None:
+            target = _property_target(expr.right)
+            is_lit, value = _literal_value(expr.left)
+            op = _FLIPPED[op]
+        if target is not None and is_lit:
+            return target[0], ScanPredicate(target[1], op, value)
+        return None
+    if isinstance(expr, StringPredicate):
+        target = _property_target(expr.left)
+        if target is None:
+            return None
+        if expr.operator == "STARTS WITH":
+            is_lit, value = _literal_value(expr.right)
+            if is_lit and isinstance(value, str):
+                return target[0], ScanPredicate(
+                    target[1], "STARTS WITH", value
+                )
+        if expr.operator == "IN" and isinstance(expr.right, ListLiteral):
+            values = []
+            for element in expr.right.elements:
+                is_lit, value = _literal_value(element)
+                if not is_lit:
+                    return None
+                values.append(value)
+            return target[0], ScanPredicate(target[1], "IN", tuple(values))
+        return None
+    if isinstance(expr, NullCheck):
+        target = _property_target(expr.operand)
+        if target is not None:
+            return target[0], ScanPredicate(target[1], expr.operator)
+    return None
+
+
+def _inline_predicates(
+    pattern: NodePattern | RelationshipPattern,
+) -> list[ScanPredicate]:
+    """Equality atoms for the ``{key: literal}`` map of a pattern element."""
+    atoms = []
+    for key, raw in (pattern.properties or {}).items():
+        is_lit, value = _literal_value(raw)
+        if is_lit:
+            atoms.append(ScanPredicate(key, "=", value))
+    return atoms
+
+
+class _QueryScan:
+    """Single-query pass collecting the needs of every source it touches."""
+
+    def __init__(self, query: ASTNode) -> None:
+        self.entities: dict[str, _Needs] = {}
+        self.relationships: dict[str, _Needs] = {}
+        #: Unlabelled node / untyped relationship patterns scan every source.
+        self.all_entities = False
+        self.all_relationships = False
+        #: A property read whose owner cannot be traced to a pattern.
+        self.untraced_properties = False
+
+        nodes = list(query.traverse())
+        self._node_vars: dict[str, set[str]] = {}
+        self._rel_vars: dict[str, set[str]] = {}
+        for node in nodes:
+            if isinstance(node, NodePattern) and node.variable and node.labels:
+                self._node_vars.setdefault(node.variable.name, set()).update(
+                    node.labels
+                )
+            if (
+                isinstance(node, RelationshipPattern)
+                and node.variable
+                and node.labels
+            ):
+                self._rel_vars.setdefault(node.variable.name, set()).update(
+                    node.labels
+                )
+
+        if any(isinstance(n, Call) for n in nodes):
+            self.all_entities = self.all_relationships = True
+            return
+
+        self._collect_uses(nodes)
+        self._collect_columns(nodes)
+        if any(isinstance(n, _MUTATING_CLAUSES) for n in nodes):
+            self._widen_mentioned(nodes)
+
+    def _needs(self, kind: dict[str, _Needs], name: str) -> _Needs:
+        return kind.setdefault(name, _Needs())
+
+    # -- rows ----------------------------------------------------------------
+
+    def _collect_uses(self, nodes: list[ASTNode]) -> None:
+        seen: set[int] = set()
+        for match in (n for n in nodes if isinstance(n, Match)):
+            by_var: dict[str, list[ScanPredicate]] = {}
+            for conjunct in _conjuncts(match.where):
+                translated = _to_scan_predicate(conjunct)
+                if translated is not None:
+                    by_var.setdefault(translated[0], []).append(translated[1])
+            if match.pattern is None:
+                continue
+            for element in match.pattern.traverse():
+                if isinstance(element, (NodePattern, RelationshipPattern)):
+                    seen.add(id(element))
+                    self._add_use(element, by_var)
+        for element in nodes:
+            if (
+                isinstance(element, (NodePattern, RelationshipPattern))
+                and id(element) not in seen
+            ):
+                self._add_use(element, {})
+
+    def _add_use(
+        self,
+        element: NodePattern | RelationshipPattern,
+        by_var: dict[str, list[ScanPredicate]],
+    ) -> None:
+        var = element.variable.name if element.variable else None
+        atoms = _inline_predicates(element)
+        if isinstance(element, NodePattern):
+            if not element.labels:
+                if var is None or var not in self._node_vars:
+                    self.all_entities = True
+                return
+            atoms += by_var.get(var, []) if var else []
+            kind = self.entities
+        else:
+            if not element.labels:
+                self.all_relationships = True
+                return
+            # A variable-length relationship binds a list; WHERE on it does
+            # not filter individual edges.
+            if var and element.length is None:
+                atoms += by_var.get(var, [])
+            if element.where is not None and element.length is None:
+                for conjunct in _conjuncts(element.where):
+                    translated = _to_scan_predicate(conjunct)
+                    if translated is not None and translated[0] == var:
+                        atoms.append(translated[1])
+            kind = self.relationships
+        for label in element.labels:
+            needs = self._needs(kind, label)
+            needs.add_use(tuple(atoms))
+            needs.add_columns(element.properties or {})
+
+    # -- columns -------------------------------------------------------------
+
+    def _collect_columns(self, nodes: list[ASTNode]) -> None:
+        allowed: set[int] = set()
+        for node in nodes:
+            if (
+                isinstance(node, (NodePattern, RelationshipPattern))
+                and node.variable
+            ):
+                allowed.add(id(node.variable))
+            elif isinstance(node, PropertyLookup):
+                target = _property_target(node)
+                if target is None:
+                    self.untraced_properties = True
+                    continue
+                allowed.add(id(node.expression))
+                var, prop = target
+                owners = self._owners(var)
+                if owners is None:
+                    self.untraced_properties = True
+                for needs in owners or ():
+                    needs.add_columns([prop])
+            elif isinstance(node, LabelPredicate) and isinstance(
+                node.operand, Variable
+            ):
+                allowed.add(id(node.operand))
+            elif isinstance(node, FunctionInvocation):
+                name = (
+                    node.name
+                    if isinstance(node.name, str)
+                    else node.name.get("name", "")
+                )
+                args = node.arguments
+                if isinstance(args, dict):
+                    args = args.get("arguments")
+                if name.lower() in _IDENTITY_FUNCTIONS and args:
+                    allowed.update(
+                        id(a) for a in args if isinstance(a, Variable)
+                    )
+            elif isinstance(node, With):
+                # ``WITH n`` carries the binding forward unchanged.
+                for item in node.items:
+                    expr = item.expression
+                    if isinstance(expr, Variable) and item.alias in (
+                        None,
+                        expr.name,
+                    ):
+                        allowed.add(id(expr))
+
+        for node in nodes:
+            if isinstance(node, Variable) and id(node) not in allowed:
+                for needs in self._owners(node.name) or ():
+                    needs.columns = None
+
+    def _owners(self, var: str) -> list[_Needs] | None:
+        """Needs of every source *var* may be bound to, or ``None`` if unknown."""
+        if var in self._node_vars:
+            return [
+                self._needs(self.entities, lbl) for lbl in self._node_vars[var]
+            ]
+        if var in self._rel_vars:
+            return [
+                self._needs(self.relationships, t) for t in self._rel_vars[var]
+            ]
+        return None
+
+    def _widen_mentioned(self, nodes: list[ASTNode]) -> None:
+        """Read every source a mutating query names in full."""
+        for node in nodes:
+            if isinstance(node, NodePattern):
+                for label in node.labels:
+                    self._needs(self.entities, label).widen()
+            elif isinstance(node, RelationshipPattern):
+                for rel_type in node.labels:
+                    self._needs(self.relationships, rel_type).widen()
+            elif isinstance(node, (SetItem, RemoveItem, LabelPredicate)):
+                for label in node.labels or ():
+                    self._needs(self.entities, label).widen()
+
+
+def plan_source_scans(queries: Iterable[str | ASTNode]) -> SourceScanPlan:
+    """Derive the narrowest safe scan of every source for a query workload.
+
+    Each entity label (and relationship type) gets the union of the columns
+    its queries read and the disjunction of the row filters each of its
+    pattern occurrences applies — inline ``{key: literal}`` properties and
+    ``MATCH … WHERE`` conjuncts of the form ``var.prop <op> literal``,
+    ``STARTS WITH``, ``IN [literals]`` and ``IS [NOT] NULL``.
+
+    Args:
+        queries: Cypher strings or already-parsed ASTs.
+
+    Returns:
+        A :class:`SourceScanPlan`.
+
+    Raises:
+        ASTConversionError: If a query string cannot be parsed.
+
+    """
+    entities: dict[str, _Needs] = {}
+    relationships: dict[str, _Needs] = {}
+    all_entities = all_relationships = untraced = False
+
+    for query in queries:
+        ast = (
+            ASTConverter.from_cypher(query)
+            if isinstance(query, str)
+            else query
+        )
+        scan = _QueryScan(ast)
+        all_entities |= scan.all_entities
+        all_relationships |= scan.all_relationships
+        untraced |= scan.untraced_properties
+        for target, found in (
+            (entities, scan.entities),
+            (relationships, scan.relationships),
+        ):
+            for name, needs in found.items():
+                merged = target.setdefault(name, _Needs())
+                if needs.columns is None:
+                    merged.columns = None
+                else:
+                    merged.add_columns(needs.columns)
+                if needs.disjuncts is None:
+                    merged.disjuncts = None
+                else:
+                    for conjunction in needs.disjuncts:
+                        merged.add_use(conjunction)
+
+    plan = SourceScanPlan(
+        entities={k: v.to_spec() for k, v in entities.items()},
+        relationships={k: v.to_spec() for k, v in relationships.items()},
+    )
+    if all_entities:
+        plan.entities, plan.entity_default = {}, FULL_SCAN
+    if all_relationships:
+        plan.relationships, plan.relationship_default = {}, FULL_SCAN
+    if untraced:
+        # Some property read (``startNode(r).name``, ``x.name`` over a
+        # collected list…) could land on any source; keep every column.
+        plan.entities = {
+            k: s.without_columns() for k, s in plan.entities.items()
+        }
+        plan.relationships = {
+            k: s.without_columns() for k, s in plan.relationships.items()
+        }
+        plan.entity_default = plan.entity_default.without_columns()
+        plan.relationship_default = plan.relationship_default.without_columns()
+    return plan
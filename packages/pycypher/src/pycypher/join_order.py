@@ -0,0 +1,790 @@
+"""Cost-based join ordering for MATCH patterns via dynamic programming.
+
+The path-at-a-time translation in
+:class:`~pycypher.pattern_matcher.PatternMatcher` joins hops strictly left
+to right, and :class:`~pycypher.query_optimizer.JoinReorderingRule` only
+reorders whole MATCH clauses.  For 5–8 node patterns that regularly builds
+huge intermediates — e.g. expanding a high-fanout hop before the selective
+filter three hops further along.
+
+This module treats every node scan and relationship scan in a MATCH as a
+base relation of a *join graph* (relations are adjacent when they share a
+variable) and enumerates bushy join trees with DPccp (Moerkotte & Neumann
+2006), which visits each connected-subgraph / connected-complement pair
+exactly once and never considers cross products.
+
+Cardinalities follow the textbook independence model:
+
+- base relations use table row counts, scaled by the selectivity of inline
+  properties and single-variable WHERE conjuncts pushed into the scan
+  (:meth:`~pycypher.query_planner.QueryPlanAnalyzer.estimate_predicate_selectivity`,
+  backed by :class:`~pycypher.cardinality_estimator.TableStatistics`
+  histograms);
+- each equi-join on a shared variable divides by the number of distinct
+  values (NDV) on all but the smallest side of its equivalence class;
+- WHERE conjuncts spanning several variables are applied at the lowest
+  sub-plan that binds them;
+- every (sub-)plan estimate is multiplied by the
+  :class:`~pycypher.cardinality_estimator.CardinalityFeedbackStore`
+  correction recorded the last times that sub-plan actually ran.
+
+The cost of a plan is the sum of its intermediate cardinalities
+(``C_out``).  :func:`plan_join_order` returns a :class:`JoinOrderPlan`
+whose :class:`JoinTree` the pattern matcher executes, recording actual row
+counts per sub-plan; ``Star.explain_query`` prints the tree with estimated
+and last-observed actual cardinalities.
+
+References
+~~~~~~~~~~
+
+- Moerkotte, G. & Neumann, T. (2006). "Analysis of Two Existing and One
+  New Dynamic Programming Algorithm for the Generation of Optimal Bushy
+  Join Trees without Cross Products." VLDB 2006.
+
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from shared.logger import LOGGER
+
+from pycypher.constants import (
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+)
+
+if TYPE_CHECKING:
+    from pycypher.ast_models import Expression, Match
+    from pycypher.cardinality_estimator import CardinalityFeedbackStore
+    from pycypher.generic_join import PatternGraph
+    from pycypher.query_planner import QueryPlanAnalyzer
+    from pycypher.relational_models import Context
+
+__all__ = [
+    "JoinOrderPlan",
+    "JoinRelation",
+    "JoinTree",
+    "enumerate_join_order",
+    "plan_join_order",
+]
+
+#: Prefix of the keys under which sub-plan cardinalities are recorded in
+#: the :class:`~pycypher.cardinality_estimator.CardinalityFeedbackStore`.
+FEEDBACK_KEY_PREFIX: str = "join:"
+
+#: Synthetic names of anonymous pattern elements, hidden in plan output.
+_ANON_NAME_RE = re.compile(r"_anon_(?:node|rel)_\d+")
+
+#: Row estimate for a scan whose table size cannot be determined.
+_UNKNOWN_TABLE_ROWS: int = 1_000
+
+
+# ---------------------------------------------------------------------------
+# Join graph and plan structures
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class JoinRelation:
+    """A base relation (scan) of the join graph.
+
+    Attributes:
+        name: Display name — ``(a:Person)`` or ``(a)-[r:KNOWS]->(b)``.
+        kind: ``"node"`` or ``"relationship"``.
+        variable: The node or relationship variable the scan binds.
+        variables: Every column the scan produces (a relationship scan also
+            binds its endpoint node variables).
+        estimated_rows: Rows after pushed-down filters.
+        ndv: Estimated distinct values per column in *variables*.
+        filters: Single-variable WHERE conjuncts evaluated on the scan.
+
+    """
+
+    name: str
+    kind: str
+    variable: str
+    variables: frozenset[str]
+    estimated_rows: float
+    ndv: dict[str, float]
+    filters: list[Expression] = field(default_factory=list)
+
+
+@dataclass
+class JoinTree:
+    """A node of a (bushy) join tree.
+
+    Leaves carry the index of a :class:`JoinRelation`; inner nodes join
+    their children on every variable they share.
+
+    Attributes:
+        relations: Bitmask of the base relations covered by this sub-plan.
+        variables: Columns bound by this sub-plan.
+        estimated_rows: Estimated output rows, feedback-corrected.
+        raw_rows: Estimated output rows before feedback correction.
+        cost: ``C_out`` — sum of the estimated rows of all joins below and
+            including this one.
+        left: Probe-side child (``None`` for leaves).
+        right: Build-side child, the smaller input (``None`` for leaves).
+        leaf: Index into :attr:`JoinOrderPlan.relations` for leaves.
+        join_vars: Variables the children are joined on.
+        filters: Multi-variable WHERE conjuncts applied after this join.
+        actual_rows: Rows produced when the plan was executed.
+
+    """
+
+    relations: int
+    variables: frozenset[str]
+    estimated_rows: float
+    raw_rows: float
+    cost: float
+    left: JoinTree | None = None
+    right: JoinTree | None = None
+    leaf: int | None = None
+    join_vars: tuple[str, ...] = ()
+    filters: list[Expression] = field(default_factory=list)
+    actual_rows: int | None = None
+
+    @property
+    def is_leaf(self) -> bool:
+        """``True`` for base-relation scans."""
+        return self.leaf is not None
+
+    def iter_nodes(self) -> Iterator[JoinTree]:
+        """Yield every node of the tree in post-order."""
+        if self.left is not None:
+            yield from self.left.iter_nodes()
+        if self.right is not None:
+            yield from self.right.iter_nodes()
+        yield self
+
+    @property
+    def depth(self) -> int:
+        """Height of the tree (``0`` for a leaf)."""
+        if self.left is None or self.right is None:
+            return 0
+        return 1 + max(self.left.depth, self.right.depth)
+
+
+@dataclass
+class JoinOrderPlan:
+    """A cost-based join order for one MATCH clause.
+
+    Attributes:
+        graph: The flattened MATCH pattern.
+        relations: Base relations; :attr:`JoinTree.leaf` indexes this list.
+        tree: The cheapest join tree found by DPccp.
+        pattern_order_cost: ``C_out`` of joining the relations in pattern
+            order — the plan the path-at-a-time translation would use.
+
+    """
+
+    graph: PatternGraph
+    relations: list[JoinRelation]
+    tree: JoinTree
+    pattern_order_cost: float
+
+    def feedback_key(self, node: JoinTree) -> str:
+        """Feedback-store key identifying the sub-plan rooted at *node*."""
+        return _feedback_key(self.relations, node.relations)
+
+    def describe(
+        self,
+        feedback_store: CardinalityFeedbackStore | None = None,
+    ) -> list[str]:
+        """Render the join tree, one line per node, indented by depth.
+
+        Args:
+            feedback_store: When given, sub-plans that have run before are
+                annotated with the last observed actual row count.
+
+        Returns:
+            Text lines (without a trailing newline).
+
+        """
+        lines: list[str] = []
+
+        def _walk(node: JoinTree, indent: int) -> None:
+            if node.is_leaf:
+                assert node.leaf is not None
+                label = _ANON_NAME_RE.sub("", self.relations[node.leaf].name)
+            else:
+                label = "⋈ on " + ", ".join(node.join_vars)
+            estimate = _fmt_rows(node.estimated_rows)
+            text = f"{'  ' * indent}{label}  ~{estimate} rows"
+            actual = node.actual_rows
+            if actual is None and feedback_store is not None:
+                observed = feedback_store.latest(self.feedback_key(node))
+                if observed is not None:
+                    actual = observed[1]
+            if actual is not None:
+                text += f" (actual {actual:,})"
+            if node.filters:
+                text += f" + {len(node.filters)} filter(s)"
+            lines.append(text)
+            if node.left is not None:
+                _walk(node.left, indent + 1)
+            if node.right is not None:
+                _walk(node.right, indent + 1)
+
+        _walk(self.tree, 0)
+        return lines
+
+
+def _feedback_key(relations: list[JoinRelation], mask: int) -> str:
+    """Key for the sub-plan joining the relations in *mask*."""
+    names = sorted(relations[i].name for i in _bits(mask))
+    return FEEDBACK_KEY_PREFIX + "⋈".join(names)
+
+
+def _fmt_rows(rows: float) -> str:
+    """Format an estimated row count for display."""
+    return f"{math.ceil(rows):,}"
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yield the indices of the set bits of *mask* in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _subsets(mask: int) -> Iterator[int]:
+    """Yield every non-empty subset of *mask*."""
+    sub = mask
+    while sub:
+        yield sub
+        sub = (sub - 1) & mask
+
+
+# ---------------------------------------------------------------------------
+# Cardinality model
+# ---------------------------------------------------------------------------
+
+
+class _CardinalityModel:
+    """Estimate the output size of any subset of base relations.
+
+    Estimates depend only on the *set* of relations joined, so every
+    bushy tree over the same set gets the same cardinality and DP sub-plan
+    costs compose.
+    """
+
+    def __init__(
+        self,
+        relations: list[JoinRelation],
+        conjuncts: list[tuple[Expression, frozenset[str], float]],
+        feedback_store: CardinalityFeedbackStore | None,
+        key_fn: Any,
+    ) -> None:
+        self._relations = relations
+        self._conjuncts = conjuncts
+        self._feedback = feedback_store
+        self._key_fn = key_fn
+        self._raw: dict[int, float] = {}
+
+    def variables(self, mask: int) -> frozenset[str]:
+        """Columns bound by the relations in *mask*."""
+        out: set[str] = set()
+        for i in _bits(mask):
+            out |= self._relations[i].variables
+        return frozenset(out)
+
+    def raw_rows(self, mask: int) -> float:
+        """Independence-model estimate for joining the relations in *mask*."""
+        cached = self._raw.get(mask)
+        if cached is not None:
+            return cached
+        members = [self._relations[i] for i in _bits(mask)]
+        rows = 1.0
+        for rel in members:
+            rows *= rel.estimated_rows
+        if rows > 0:
+            ndvs: dict[str, list[float]] = {}
+            for rel in members:
+                for var, ndv in rel.ndv.items():
+                    ndvs.setdefault(var, []).append(max(ndv, 1.0))
+            for values in ndvs.values():
+                if len(values) > 1:
+                    values.sort()
+                    for ndv in values[1:]:
+                        rows /= ndv
+            bound = self.variables(mask)
+            for _conj, refs, selectivity in self._conjuncts:
+                if refs and refs <= bound:
+                    rows *= selectivity
+            rows = max(rows, 1.0)
+        self._raw[mask] = rows
+        return rows
+
+    def rows(self, mask: int) -> tuple[float, float]:
+        """Return ``(corrected, raw)`` row estimates for *mask*."""
+        raw = self.raw_rows(mask)
+        if self._feedback is None or raw <= 0:
+            return raw, raw
+        factor = self._feedback.correction_factor(self._key_fn(mask))
+        return max(raw * factor, 1.0), raw
+
+
+# ---------------------------------------------------------------------------
+# DPccp enumeration
+# ---------------------------------------------------------------------------
+
+
+def _neighbourhood(mask: int, adjacency: list[int]) -> int:
+    """Relations adjacent to *mask* but not in it."""
+    out = 0
+    for i in _bits(mask):
+        out |= adjacency[i]
+    return out & ~mask
+
+
+def _csg_rec(
+    subgraph: int,
+    excluded: int,
+    adjacency: list[int],
+) -> Iterator[int]:
+    """EnumerateCsgRec: grow *subgraph* via neighbours not in *excluded*."""
+    neighbours = _neighbourhood(subgraph, adjacency) & ~excluded
+    if not neighbours:
+        return
+    for sub in _subsets(neighbours):
+        yield subgraph | sub
+    for sub in _subsets(neighbours):
+        yield from _csg_rec(subgraph | sub, excluded | neighbours, adjacency)
+
+
+def _connected_subgraphs(adjacency: list[int]) -> Iterator[int]:
+    """EnumerateCsg: every connected subgraph, each exactly once."""
+    for i in range(len(adjacency) - 1, -1, -1):
+        start = 1 << i
+        yield start
+        yield from _csg_rec(start, (1 << (i + 1)) - 1, adjacency)
+
+
+def _connected_complements(
+    subgraph: int,
+    adjacency: list[int],
+) -> Iterator[int]:
+    """EnumerateCmp: connected subgraphs adjacent to *subgraph*, disjoint."""
+    lowest = (subgraph & -subgraph).bit_length() - 1
+    excluded = ((1 << (lowest + 1)) - 1) | subgraph
+    neighbours = _neighbourhood(subgraph, adjacency) & ~excluded
+    for i in sorted(_bits(neighbours), reverse=True):
+        start = 1 << i
+        yield start
+        yield from _csg_rec(
+            start,
+            excluded | (((1 << (i + 1)) - 1) & neighbours),
+            adjacency,
+        )
+
+
+def _bfs_order(relations: list[JoinRelation]) -> list[int]:
+    """Breadth-first numbering of the join graph, as DPccp requires."""
+    order = [0]
+    seen = {0}
+    for current in order:
+        for j, rel in enumerate(relations):
+            if j not in seen and rel.variables & relations[current].variables:
+                seen.add(j)
+                order.append(j)
+    return order
+
+
+def enumerate_join_order(
+    relations: list[JoinRelation],
+    conjuncts: list[tuple[Expression, frozenset[str], float]] | None = None,
+    feedback_store: CardinalityFeedbackStore | None = None,
+    key_fn: Any = None,
+) -> JoinTree:
+    """Find the ``C_out``-optimal bushy join tree over *relations* (DPccp).
+
+    Args:
+        relations: Base relations; must form a connected join graph.
+        conjuncts: ``(predicate, variables, selectivity)`` triples applied
+            to any sub-plan binding all of *variables*.
+        feedback_store: Optional source of per-sub-plan corrections.
+        key_fn: ``mask -> str`` feedback key function (required with
+            *feedback_store*).
+
+    Returns:
+        The root of the cheapest join tree.  Leaf indices refer to
+        positions in *relations*.
+
+    Raises:
+        ValueError: If *relations* is empty or not connected.
+
+    """
+    if not relations:
+        msg = "Cannot order an empty set of relations"
+        raise ValueError(msg)
+
+    order = _bfs_order(relations)
+    if len(order) != len(relations):
+        msg = "Join graph is not connected; DPccp never forms cross products"
+        raise ValueError(msg)
+    ordered = [relations[i] for i in order]
+    n = len(ordered)
+
+    def _to_original(mask: int) -> int:
+        out = 0
+        for i in _bits(mask):
+            out |= 1 << order[i]
+        return out
+
+    model = _CardinalityModel(
+        ordered,
+        conjuncts or [],
+        feedback_store if key_fn is not None else None,
+        (lambda mask: key_fn(_to_original(mask))) if key_fn else None,
+    )
+    adjacency = [
+        sum(
+            1 << j
+            for j in range(n)
+            if j != i and ordered[i].variables & ordered[j].variables
+        )
+        for i in range(n)
+    ]
+
+    best: dict[int, JoinTree] = {}
+    for i, rel in enumerate(ordered):
+        est, raw = model.rows(1 << i)
+        best[1 << i] = JoinTree(
+            relations=1 << i,
+            variables=rel.variables,
+            estimated_rows=est,
+            raw_rows=raw,
+            cost=0.0,
+            leaf=order[i],
+        )
+
+    pairs = [
+        (s1, s2)
+        for s1 in _connected_subgraphs(adjacency)
+        for s2 in _connected_complements(s1, adjacency)
+    ]
+    # Process smaller unions first so both halves are always solved.
+    pairs.sort(key=lambda p: (p[0] | p[1]).bit_count())
+    for s1, s2 in pairs:
+        union = s1 | s2
+        p1, p2 = best[s1], best[s2]
+        est, raw = model.rows(union)
+        cost = est + p1.cost + p2.cost
+        current = best.get(union)
+        if current is not None and current.cost <= cost:
+            continue
+        left, right = (
+            (p1, p2) if p1.estimated_rows >= p2.estimated_rows else (p2, p1)
+        )
+        best[union] = JoinTree(
+            relations=union,
+            variables=p1.variables | p2.variables,
+            estimated_rows=est,
+            raw_rows=raw,
+            cost=cost,
+            left=left,
+            right=right,
+            join_vars=tuple(sorted(p1.variables & p2.variables)),
+        )
+
+    root = best[(1 << n) - 1]
+    for node in root.iter_nodes():
+        node.relations = _to_original(node.relations)
+
+    # Attach multi-variable conjuncts to the lowest sub-plan binding them.
+    for conj, refs, _sel in conjuncts or []:
+        target = root
+        for node in root.iter_nodes():
+            if not node.is_leaf and refs <= node.variables:
+                target = node
+                break
+        target.filters.append(conj)
+    return root
+
+
+def _pattern_order_cost(
+    relations: list[JoinRelation],
+    model: _CardinalityModel,
+) -> float:
+    """``C_out`` of a left-deep plan joining relations in list order."""
+    mask = 0
+    cost = 0.0
+    for i in range(len(relations)):
+        mask |= 1 << i
+        if i > 0:
+            cost += model.rows(mask)[0]
+    return cost
+
+
+# ---------------------------------------------------------------------------
+# MATCH → join graph
+# ---------------------------------------------------------------------------
+
+
+def _table_rows(source: Any) -> int:
+    """Row count of a table source, or a default when it is unsized."""
+    if hasattr(source, "__len__"):
+        return len(source)
+    return _UNKNOWN_TABLE_ROWS
+
+
+def _column_ndv(
+    analyzer: QueryPlanAnalyzer,
+    table: str,
+    column: str,
+    rows: float,
+) -> float:
+    """NDV of ``table.column``, capped at *rows*.
+
+    Served by the context's statistics catalog via *analyzer*: HyperLogLog
+    over the full column for analyzed tables, a sampled estimate otherwise.
+    """
+    stats = analyzer._get_column_stats(table, column)
+    if stats is None or stats.ndv <= 0:
+        return max(rows, 1.0)
+    return max(min(float(stats.ndv), rows), 1.0)
+
+
+def plan_join_order(
+    match_clause: Match,
+    context: Context,
+    *,
+    where: Expression | None = None,
+    feedback_store: CardinalityFeedbackStore | None = None,
+    anon_counter: list[int] | None = None,
+    bound_vars: Mapping[str, int] | None = None,
+    min_relationships: int | None = None,
+    max_relations: int | None = None,
+) -> JoinOrderPlan | None:
+    """Plan a cost-based join order for a MATCH clause.
+
+    Returns ``None`` (leaving the clause to the path-at-a-time translation)
+    unless :func:`~pycypher.generic_join.extract_pattern_graph` accepts the
+    pattern, it has at least *min_relationships* hops, and the join graph
+    has at most *max_relations* base relations.
+
+    Args:
+        match_clause: The MATCH clause to plan.
+        context: Execution context (table sizes and statistics).
+        where: The WHERE predicate to split across the plan, or ``None``
+            when the caller applies it elsewhere.
+        feedback_store: Optional feedback store for correcting estimates.
+        anon_counter: Counter used to name anonymous elements.  Only
+            advanced when a plan is returned.
+        bound_vars: Node variables already bound by a preceding clause,
+            mapped to their number of distinct bound IDs.
+        min_relationships: Override for
+            :data:`~pycypher.config.JOIN_ORDER_MIN_RELATIONSHIPS`.
+        max_relations: Override for
+            :data:`~pycypher.config.JOIN_ORDER_MAX_RELATIONS`.
+
+    Returns:
+        The plan, or ``None`` when the clause is not eligible.
+
+    """
+    from pycypher import config
+    from pycypher.ast_models import (
+        Comparison,
+        Pattern,
+        PatternPath,
+        PropertyLookup,
+        Query,
+        Variable,
+    )
+    from pycypher.ast_models import Match as _Match
+    from pycypher.frame_joiner import _extract_conjuncts
+    from pycypher.generic_join import extract_pattern_graph
+    from pycypher.lazy_eval import _extract_variables_from_predicate
+    from pycypher.query_planner import QueryPlanAnalyzer
+
+    if min_relationships is None:
+        min_relationships = config.JOIN_ORDER_MIN_RELATIONSHIPS
+    if max_relations is None:
+        max_relations = config.JOIN_ORDER_MAX_RELATIONS
+    if min_relationships <= 0:
+        return None
+
+    counter = [anon_counter[0] if anon_counter is not None else 0]
+    graph = extract_pattern_graph(match_clause, counter, allow_undirected=True)
+    if graph is None or len(graph.edges) < min_relationships:
+        return None
+
+    # Node scans follow the path-at-a-time translation, which scans each
+    # path's first node by label but does not check the labels of nodes it
+    # reaches by traversal; those only become relations to apply inline
+    # properties or bound IDs.
+    bound = dict(bound_vars or {})
+    leaf_vars = [
+        var
+        for var, node in graph.node_patterns.items()
+        if var in graph.path_starts or node.properties or var in bound
+    ]
+    if len(leaf_vars) + len(graph.edges) > max_relations:
+        return None
+
+    # Resolve every (including anonymous) node variable to its label when
+    # estimating predicate selectivity.
+    analyzer: QueryPlanAnalyzer = QueryPlanAnalyzer(
+        Query(
+            clauses=[
+                _Match(
+                    pattern=Pattern(
+                        paths=[
+                            PatternPath(elements=[node])
+                            for node in graph.node_patterns.values()
+                        ],
+                    ),
+                ),
+            ],
+        ),
+        context,
+    )
+
+    # --- Split WHERE into single-variable (scan) and multi-variable parts. ---
+    scan_filters: dict[str, list[Expression]] = {}
+    conjuncts: list[tuple[Expression, frozenset[str], float]] = []
+    scan_vars = set(leaf_vars) | {e.rel_var for e in graph.edges}
+    if where is not None:
+        for conj in _extract_conjuncts(where):
+            refs = frozenset(_extract_variables_from_predicate(conj))
+            if len(refs) == 1 and next(iter(refs)) in scan_vars:
+                scan_filters.setdefault(next(iter(refs)), []).append(conj)
+            else:
+                conjuncts.append(
+                    (
+                        conj,
+                        refs,
+                        analyzer.estimate_predicate_selectivity(conj),
+                    ),
+                )
+
+    entities = context.entity_mapping.mapping
+    relationships = context.relationship_mapping.mapping
+    by_variable: dict[str, JoinRelation] = {}
+
+    for var in leaf_vars:
+        node = graph.node_patterns[var]
+        label = node.labels[0] if node.labels else None
+        if label is not None:
+            rows = float(
+                _table_rows(entities[label].source_obj)
+                if label in entities
+                else 0,
+            )
+        else:
+            rows = float(
+                sum(_table_rows(t.source_obj) for t in entities.values())
+            )
+        if var in bound:
+            rows = min(rows, float(bound[var]))
+        selectivity = 1.0
+        for prop_name, prop_val in (node.properties or {}).items():
+            selectivity *= analyzer.estimate_predicate_selectivity(
+                Comparison(
+                    operator="=",
+                    left=PropertyLookup(
+                        expression=Variable(name=var),
+                        property=prop_name,
+                    ),
+                    right=prop_val,
+                ),
+            )
+        for conj in scan_filters.get(var, []):
+            selectivity *= analyzer.estimate_predicate_selectivity(conj)
+        rows *= selectivity
+        by_variable[var] = JoinRelation(
+            name=f"({var}:{label})" if label else f"({var})",
+            kind="node",
+            variable=var,
+            variables=frozenset({var}),
+            estimated_rows=rows,
+            ndv={var: rows},
+            filters=list(scan_filters.get(var, [])),
+        )
+
+    for edge in graph.edges:
+        table = relationships.get(edge.rel_type)
+        if table is None:
+            rows = 0.0
+            src_ndv = tgt_ndv = 1.0
+        else:
+            rows = float(_table_rows(table.source_obj))
+            src_ndv = _column_ndv(
+                analyzer, edge.rel_type, RELATIONSHIP_SOURCE_COLUMN, rows
+            )
+            tgt_ndv = _column_ndv(
+                analyzer, edge.rel_type, RELATIONSHIP_TARGET_COLUMN, rows
+            )
+        if edge.undirected:
+            rows *= 2
+            src_ndv = tgt_ndv = min(src_ndv + tgt_ndv, rows or 1.0)
+        for conj in scan_filters.get(edge.rel_var, []):
+            rows *= analyzer.estimate_predicate_selectivity(conj)
+        if edge.src_var == edge.tgt_var:
+            rows /= max(src_ndv, tgt_ndv)
+            ndv = {edge.rel_var: rows, edge.src_var: min(src_ndv, rows)}
+        else:
+            ndv = {
+                edge.rel_var: rows,
+                edge.src_var: min(src_ndv, rows),
+                edge.tgt_var: min(tgt_ndv, rows),
+            }
+        arrow = "-" if edge.undirected else "->"
+        by_variable[edge.rel_var] = JoinRelation(
+            name=(
+                f"({edge.src_var})-[{edge.rel_var}:{edge.rel_type}]"
+                f"{arrow}({edge.tgt_var})"
+            ),
+            kind="relationship",
+            variable=edge.rel_var,
+            variables=frozenset(ndv),
+            estimated_rows=rows,
+            ndv=ndv,
+            filters=list(scan_filters.get(edge.rel_var, [])),
+        )
+
+    # Pattern order — the order the path-at-a-time translation joins in.
+    relations = [by_variable[c] for c in graph.columns if c in by_variable]
+
+    def _key(mask: int) -> str:
+        return _feedback_key(relations, mask)
+
+    try:
+        tree = enumerate_join_order(
+            relations,
+            conjuncts,
+            feedback_store=feedback_store,
+            key_fn=_key,
+        )
+    except ValueError as exc:
+        LOGGER.debug("join ordering skipped: %s", exc)
+        return None
+
+    pattern_cost = _pattern_order_cost(
+        relations,
+        _CardinalityModel(relations, conjuncts, feedback_store, _key),
+    )
+    if anon_counter is not None:
+        anon_counter[0] = counter[0]
+    LOGGER.debug(
+        "join order  relations=%d  est_rows=%.0f  cost=%.0f  "
+        "pattern_order_cost=%.0f  depth=%d",
+        len(relations),
+        tree.estimated_rows,
+        tree.cost,
+        pattern_cost,
+        tree.depth,
+    )
+    return JoinOrderPlan(
+        graph=graph,
+        relations=relations,
+        tree=tree,
+        pattern_order_cost=pattern_cost,
+    )
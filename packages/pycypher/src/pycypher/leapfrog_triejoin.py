@@ -27,6 +27,9 @@ Integration
   share a common join variable.
 - Falls back to pairwise binary joins when the leapfrog strategy is not
   applicable (no shared variable across all frames, or only 2 frames).
+- Cyclic MATCH patterns, where each pair of relationships shares a
+  *different* variable, are handled by the multi-attribute Generic Join in
+  :mod:`pycypher.generic_join`.
 
 References
 ~~~~~~~~~~
@@ -267,8 +270,15 @@ def _collect_matching_rows(
 ) -> pd.DataFrame:
     """Build the result DataFrame from intersection keys.
 
-    For each key in the intersection, collects matching rows from all
-    relations and produces their Cartesian product (per-key).
+    For each key in the intersection, the matching rows of every relation
+    are combined by a per-key Cartesian product.  The expansion is fully
+    vectorised: each relation's ``[left, right)`` key range is located with
+    one ``searchsorted`` call over all keys, and the output row positions
+    are generated with ``np.repeat`` instead of a Python loop per key.
+
+    Non-join columns that appear in more than one relation are treated as
+    additional equi-join conditions: rows whose values disagree are dropped
+    and the column is emitted once.
 
     Args:
         infos: Relation metadata from :func:`_build_relation_infos`.
@@ -279,61 +289,53 @@ def _collect_matching_rows(
         all relations.
 
     """
+    join_col = infos[0].join_col
+    all_cols: list[str] = []
+    for info in infos:
+        all_cols.extend(c for c in info.other_cols if c not in all_cols)
+    all_cols.append(join_col)
+
     if not intersection_keys:
-        # Build empty frame with correct columns
-        all_cols = [infos[0].join_col]
-        for info in infos:
-            all_cols.extend(info.other_cols)
         return pd.DataFrame(columns=all_cols)
 
-    result_chunks: list[pd.DataFrame] = []
-    join_col = infos[0].join_col
-
-    for key in intersection_keys:
-        # For each relation, find all rows matching this key
-        row_sets: list[pd.DataFrame] = []
-        for info in infos:
-            # Binary search for key range in sorted array
-            left = int(np.searchsorted(info.sorted_keys, key, side="left"))
-            right = int(np.searchsorted(info.sorted_keys, key, side="right"))
-            original_indices = info.row_indices[left:right]
-            rows = info.source_df.iloc[original_indices]
-            # Keep only the non-join columns
-            if info.other_cols:
-                row_sets.append(rows[info.other_cols].reset_index(drop=True))
+    keys = np.asarray(intersection_keys)
+    if isinstance(infos[0].sorted_keys, np.ndarray):
+        keys = keys.astype(infos[0].sorted_keys.dtype, copy=False)
+
+    # key_pos[i] is the intersection key index of output row i; src_rows[j]
+    # holds the source-frame row of relation j for every output row.
+    key_pos = np.arange(len(keys), dtype=np.int64)
+    src_rows: list[np.ndarray] = []
+    for info in infos:
+        left = np.searchsorted(info.sorted_keys, keys, side="left")
+        right = np.searchsorted(info.sorted_keys, keys, side="right")
+        counts = (right - left)[key_pos]
+        total = int(counts.sum())
+        repeat_idx = np.repeat(np.arange(len(key_pos)), counts)
+        offsets = np.arange(total, dtype=np.int64) - np.repeat(
+            np.cumsum(counts) - counts,
+            counts,
+        )
+        sorted_pos = left[key_pos][repeat_idx] + offsets
+        src_rows = [rows[repeat_idx] for rows in src_rows]
+        src_rows.append(info.row_indices[sorted_pos])
+        key_pos = key_pos[repeat_idx]
+
+    columns: dict[str, np.ndarray] = {}
+    keep = np.ones(len(key_pos), dtype=bool)
+    for info, rows in zip(infos, src_rows, strict=True):
+        for col in info.other_cols:
+            values = info.source_df[col].to_numpy()[rows]
+            if col in columns:
+                keep &= np.asarray(columns[col] == values, dtype=bool)
             else:
-                # No extra columns — just need the count for cross-product
-                row_sets.append(pd.DataFrame({"_count": range(len(rows))}))
-
-        # Cross-product all row sets for this key
-        combined = row_sets[0]
-        for j, rs in enumerate(row_sets[1:], 1):
-            # Use unique synthetic column names to avoid collisions
-            if "_count" in combined.columns:
-                combined = combined.rename(
-                    columns={"_count": f"_count_{j - 1}"}
-                )
-            if "_count" in rs.columns:
-                rs = rs.rename(columns={"_count": f"_count_{j}"})
-            combined = combined.merge(rs, how="cross")
-
-        # Drop any synthetic _count columns
-        count_cols = [c for c in combined.columns if c.startswith("_count")]
-        if count_cols:
-            combined = combined.drop(columns=count_cols)
-
-        # Add the join key column
-        combined[join_col] = key
-
-        result_chunks.append(combined)
-
-    if not result_chunks:
-        all_cols = [join_col]
-        for info in infos:
-            all_cols.extend(info.other_cols)
-        return pd.DataFrame(columns=all_cols)
+                columns[col] = values
+    columns[join_col] = keys[key_pos]
 
-    return pd.concat(result_chunks, ignore_index=True)
+    result = pd.DataFrame(columns, columns=all_cols)
+    if not keep.all():
+        result = result[keep].reset_index(drop=True)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -1062,12 +1062,16 @@ class MutationEngine:
         self,
         clause: Call,
         current_frame: BindingFrame | None,
+        *,
+        make_seed_frame: Callable[[], BindingFrame] | None = None,
     ) -> BindingFrame | None:
         """Execute a CALL clause — invoke a registered procedure and YIELD results.
 
         Args:
             clause: AST :class:`~pycypher.ast_models.Call` node.
             current_frame: The current binding frame.
+            make_seed_frame: Callable that produces a single-row seed frame,
+                used to evaluate arguments when CALL is the first clause.
 
         Returns:
             An updated :class:`~pycypher.binding_frame.BindingFrame` with the
@@ -1089,8 +1093,11 @@ class MutationEngine:
         )
 
         args: list[Any] = []
-        if clause.arguments and current_frame is not None:
-            evaluator = self._evaluator_factory(current_frame)
+        eval_frame = current_frame
+        if eval_frame is None and make_seed_frame is not None:
+            eval_frame = make_seed_frame()
+        if clause.arguments and eval_frame is not None:
+            evaluator = self._evaluator_factory(eval_frame)
             for arg_expr in clause.arguments:
                 series = evaluator.evaluate(arg_expr)
                 args.append(series.iloc[0] if len(series) > 0 else None)
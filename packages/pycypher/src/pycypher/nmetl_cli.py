@@ -45,14 +45,6 @@ from pycypher.exceptions import (
     WrongCypherTypeError,
 )
 
-# Import DuckDB exceptions for proper error handling
-try:
-    import duckdb  # noqa: F401  # required for _duckdb internal module
-    from _duckdb import IOException as DuckDBIOException
-except ImportError:
-    # Handle case where DuckDB is not available
-    DuckDBIOException = None  # ty: ignore[invalid-assignment]  # fallback when duckdb unavailable
-
 if TYPE_CHECKING:
     pass
 
@@ -140,7 +132,9 @@ def _load_data_source(
     except (RuntimeError, ImportError, TypeError, MemoryError) as exc:
         _cli_error(_translate_duckdb_error(exc, kind, safe_path))
     except Exception as exc:  # noqa: BLE001 — DuckDB type-dispatch; unknown exceptions re-raised
-        if DuckDBIOException and isinstance(exc, DuckDBIOException):
+        from pycypher.cli.common import is_duckdb_io_error
+
+        if is_duckdb_io_error(exc):
             _cli_error(_translate_duckdb_error(exc, kind, safe_path))
         if "No files found that match the pattern" in str(exc):
             _cli_error(f"{kind} file not found: {safe_path!r}")
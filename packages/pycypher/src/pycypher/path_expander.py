@@ -28,6 +28,8 @@ import pandas as pd
 from shared.logger import LOGGER
 
 from pycypher.binding_frame import PATH_HOP_COLUMN_PREFIX, BindingFrame
+from pycypher.cancellation import run_chunked
+from pycypher.dataframe_utils import source_columns_to_pandas
 
 if TYPE_CHECKING:
     from pycypher.ast_models import PatternPath, RelationshipDirection
@@ -154,15 +156,10 @@ class PathExpander:
         if _edge_key in _edge_cache:
             edge_df = _edge_cache[_edge_key]
         else:
-            try:
-                import pyarrow as pa
-
-                raw = rel_table.source_obj
-                rel_df: pd.DataFrame = (
-                    raw.to_pandas() if isinstance(raw, pa.Table) else raw
-                )
-            except ImportError:
-                rel_df = rel_table.source_obj
+            rel_df = source_columns_to_pandas(
+                rel_table.source_obj,
+                [src_col, tgt_col],
+            )
             edge_df = rel_df[[src_col, tgt_col]]
             _edge_cache[_edge_key] = edge_df
 
@@ -171,6 +168,11 @@ class PathExpander:
             **{_VL_TIP_COL: start_frame.bindings[start_var]},
         )
 
+        # Edge column matched against the frontier, and the one reached.
+        near_col, far_col = (
+            (tgt_col, src_col) if is_left else (src_col, tgt_col)
+        )
+
         result_parts: list[pd.DataFrame] = []
         accumulated_rows: int = 0
 
@@ -181,22 +183,21 @@ class PathExpander:
             if len(frontier) == 0:
                 break
 
-            if is_left:
-                merged = frontier.merge(
-                    edge_df,
-                    left_on=_VL_TIP_COL,
-                    right_on=tgt_col,
-                    how="inner",
-                ).drop(columns=[tgt_col, _VL_TIP_COL])
-                frontier = merged.rename(columns={src_col: _VL_TIP_COL})
-            else:
-                merged = frontier.merge(
+            # A hop over a large frontier runs chunk by chunk so that it
+            # can be cancelled, and reports its progress, mid-hop.
+            merged = run_chunked(
+                self.context,
+                "expand",
+                frontier,
+                lambda part: part.merge(
                     edge_df,
                     left_on=_VL_TIP_COL,
-                    right_on=src_col,
+                    right_on=near_col,
                     how="inner",
-                ).drop(columns=[src_col, _VL_TIP_COL])
-                frontier = merged.rename(columns={tgt_col: _VL_TIP_COL})
+                ),
+                build_rows=len(edge_df),
+            ).drop(columns=[near_col, _VL_TIP_COL])
+            frontier = merged.rename(columns={far_col: _VL_TIP_COL})
 
             if frontier.empty:
                 break
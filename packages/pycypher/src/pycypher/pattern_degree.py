@@ -0,0 +1,187 @@
+"""Rewrite of degree-only pattern expressions into degree lookups.
+
+``size((n)-[:KNOWS]->())``, ``size([(n)-[:KNOWS]->() | 1])`` and
+``COUNT { (n)-[:KNOWS]->() }`` only ask how many relationships of a type a
+bound node has.  Evaluated as written they match the pattern for every
+row (building a Python list of neighbours per row, or running a
+subquery) just to take its length.
+
+:func:`rewrite_degree_patterns` replaces each of them with a
+:class:`~pycypher.ast_models.PatternDegree` node, which the binding
+evaluator answers with one vectorized lookup into the degree arrays of
+:class:`~pycypher.graph_index.DegreeIndex`.
+
+A pattern is *degree-only* (see :func:`degree_pattern`) when it is a
+single fixed-length hop whose relationship has no variable, properties
+or inline WHERE, one endpoint is a bare variable (the anchor) and the
+other is anonymous with at most one label and no properties.  Everything
+else is left untouched.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pycypher.ast_models import (
+    ASTNode,
+    CountSubquery,
+    Exists,
+    FunctionInvocation,
+    NodePattern,
+    Pattern,
+    PatternComprehension,
+    PatternDegree,
+    RelationshipDirection,
+    RelationshipPattern,
+    ReturnItem,
+    Variable,
+)
+from pycypher.expression_renderer import ExpressionRenderer
+
+if TYPE_CHECKING:
+    from pycypher.ast_models import Query
+
+__all__ = ["degree_pattern", "rewrite_degree_patterns"]
+
+_RENDERER = ExpressionRenderer()
+
+#: Direction seen from the anchor when it is the pattern's first node.
+_FORWARD: dict[RelationshipDirection, str] = {
+    RelationshipDirection.RIGHT: "outgoing",
+    RelationshipDirection.LEFT: "incoming",
+}
+
+#: Direction seen from the anchor when it is the pattern's last node.
+_BACKWARD: dict[RelationshipDirection, str] = {
+    RelationshipDirection.RIGHT: "incoming",
+    RelationshipDirection.LEFT: "outgoing",
+}
+
+
+def _is_anchor(node: NodePattern) -> bool:
+    return (
+        node.variable is not None and not node.labels and not node.properties
+    )
+
+
+def _is_anonymous(node: NodePattern) -> bool:
+    return (
+        node.variable is None and len(node.labels) <= 1 and not node.properties
+    )
+
+
+def degree_pattern(pattern: Pattern | None) -> PatternDegree | None:
+    """Return the degree lookup equivalent to *pattern*'s match count.
+
+    Args:
+        pattern: The pattern of a ``size(...)``, pattern comprehension,
+            ``COUNT`` or ``EXISTS`` expression.
+
+    Returns:
+        A :class:`~pycypher.ast_models.PatternDegree`, or ``None`` when
+        *pattern* is not degree-only.
+
+    """
+    if pattern is None or len(pattern.paths) != 1:
+        return None
+    path = pattern.paths[0]
+    if path.shortest_path_mode != "none" or len(path.elements) != 3:
+        return None
+    first, rel, last = path.elements
+    if not (
+        isinstance(first, NodePattern)
+        and isinstance(rel, RelationshipPattern)
+        and isinstance(last, NodePattern)
+    ):
+        return None
+    if (
+        rel.variable is not None
+        or rel.properties
+        or rel.length is not None
+        or rel.where is not None
+    ):
+        return None
+
+    if _is_anchor(first) and _is_anonymous(last):
+        anchor, other = first, last
+        direction = _FORWARD.get(rel.direction, "both")
+    elif _is_anchor(last) and _is_anonymous(first):
+        anchor, other = last, first
+        direction = _BACKWARD.get(rel.direction, "both")
+    else:
+        return None
+    assert anchor.variable is not None
+    return PatternDegree(
+        variable=Variable(name=anchor.variable.name),
+        rel_types=list(rel.labels),
+        direction=direction,
+        neighbor_label=other.labels[0] if other.labels else None,
+    )
+
+
+def _degree_expression(node: ASTNode) -> PatternDegree | None:
+    """Return the degree lookup replacing *node*, if it counts a pattern."""
+    if isinstance(node, CountSubquery) and isinstance(node.content, Pattern):
+        return degree_pattern(node.content)
+    if not (
+        isinstance(node, FunctionInvocation)
+        and node.function_name.lower() == "size"
+    ):
+        return None
+    arguments = node.arguments
+    if isinstance(arguments, dict):
+        arguments = arguments.get("arguments") or []
+    if len(arguments) != 1:
+        return None
+    (argument,) = arguments
+    if isinstance(argument, Exists) and isinstance(argument.content, Pattern):
+        return degree_pattern(argument.content)
+    if isinstance(argument, PatternComprehension) and argument.where is None:
+        return degree_pattern(argument.pattern)
+    return None
+
+
+def _rewrite_value(value: Any) -> Any:
+    if isinstance(value, ASTNode):
+        return _rewrite(value)
+    if isinstance(value, list):
+        items = [_rewrite_value(v) for v in value]
+        changed = any(new is not old for new, old in zip(items, value))
+        return items if changed else value
+    if isinstance(value, dict):
+        entries = {k: _rewrite_value(v) for k, v in value.items()}
+        changed = any(entries[k] is not v for k, v in value.items())
+        return entries if changed else value
+    return value
+
+
+def _rewrite(node: ASTNode) -> ASTNode:
+    replacement = _degree_expression(node)
+    if replacement is not None:
+        return replacement
+    updates = {}
+    for name in type(node).model_fields:
+        value = getattr(node, name)
+        new_value = _rewrite_value(value)
+        if new_value is not value:
+            updates[name] = new_value
+    if not updates:
+        return node
+    if isinstance(node, ReturnItem) and node.alias is None:
+        # Keep the column name the original expression would produce.
+        updates["alias"] = _RENDERER.render(node.expression)
+    return node.model_copy(update=updates)
+
+
+def rewrite_degree_patterns(query: Query) -> Query:
+    """Replace degree-only pattern expressions in *query* by degree lookups.
+
+    Args:
+        query: A parsed :class:`~pycypher.ast_models.Query`.
+
+    Returns:
+        The rewritten query.  Unchanged subtrees are shared with *query*,
+        and *query* itself is returned when nothing was rewritten.
+
+    """
+    return _rewrite(query)
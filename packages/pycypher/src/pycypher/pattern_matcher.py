@@ -23,6 +23,7 @@ Architecture
 
 from __future__ import annotations
 
+import dataclasses
 import time
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -37,14 +38,26 @@ from pycypher.ast_models import (
     RelationshipPattern,
 )
 from pycypher.binding_frame import PATH_HOP_COLUMN_PREFIX, BindingFrame
+from pycypher.cancellation import operator_monitor, run_chunked
 from pycypher.path_expander import PathExpander
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
+
+    import numpy as np
 
     from pycypher.ast_models import Match
+    from pycypher.cardinality_estimator import CardinalityFeedbackStore
     from pycypher.evaluator_protocol import ExpressionEvaluatorFactory
+    from pycypher.factorized import FactorizedFrame
+    from pycypher.generic_join import (
+        CyclicMatchPlan,
+        PatternEdge,
+        PatternGraph,
+    )
+    from pycypher.join_order import JoinOrderPlan, JoinRelation, JoinTree
     from pycypher.relational_models import Context
+    from pycypher.semi_join import SemiJoinReduction
 
 #: Synthetic variable name prefix for anonymous nodes.
 _ANON_NODE_PREFIX: str = "_anon_node_"
@@ -52,6 +65,10 @@ _ANON_NODE_PREFIX: str = "_anon_node_"
 #: Synthetic variable name prefix for anonymous relationships.
 _ANON_REL_PREFIX: str = "_anon_rel_"
 
+#: Smallest number of start nodes expanded at once when a LIMIT lets
+#: pattern matching stop early.
+LIMIT_SCAN_CHUNK_ROWS: int = 1024
+
 
 @dataclass(frozen=True, slots=True)
 class VariableLengthHopParams:
@@ -104,6 +121,10 @@ class PatternMatcher:
     4. **Predicate pushdown** — WHERE predicates referencing only one path
        are pushed down *before* the cross-path join to reduce row counts.
 
+    Patterns with several fixed-length hops skip steps 2–3: their node and
+    relationship scans are joined in the cost-based bushy order chosen by
+    :func:`~pycypher.join_order.plan_join_order`.
+
     For variable-length paths (``[*1..3]``), step 2 delegates to
     :class:`~pycypher.path_expander.PathExpander` for BFS expansion.
 
@@ -113,6 +134,14 @@ class PatternMatcher:
         coerce_join_fn: Callable for joining two BindingFrames (inner or cross join).
         apply_where_fn: Callable for applying a WHERE predicate to a BindingFrame.
         multi_way_join_fn: Optional callable for n-way joins using LeapfrogTriejoin.
+        use_generic_join: Route cyclic MATCH patterns through the worst-case
+            optimal :mod:`~pycypher.generic_join` executor.
+        use_join_ordering: Join multi-hop patterns in the cost-based order
+            chosen by :mod:`~pycypher.join_order`.
+        use_semi_join_reduction: Prune the scans of acyclic multi-hop
+            patterns with :mod:`~pycypher.semi_join` before joining.
+        cardinality_feedback: Store receiving the actual row count of every
+            executed join sub-plan.
 
     """
 
@@ -125,6 +154,10 @@ class PatternMatcher:
         multi_way_join_fn: Callable[..., BindingFrame] | None = None,
         *,
         evaluator_factory: ExpressionEvaluatorFactory,
+        use_generic_join: bool = True,
+        use_join_ordering: bool = True,
+        use_semi_join_reduction: bool = True,
+        cardinality_feedback: CardinalityFeedbackStore | None = None,
     ) -> None:
         """Initialize pattern matcher.
 
@@ -140,6 +173,19 @@ class PatternMatcher:
             evaluator_factory: Factory for constructing an expression
                 evaluator, threaded into inline-property ``BindingFilter``
                 construction.
+            use_generic_join: When ``True`` (default), MATCH clauses whose
+                pattern graph contains a cycle are evaluated with Generic
+                Join instead of a chain of binary joins.
+            use_join_ordering: When ``True`` (default), MATCH clauses with
+                at least :data:`~pycypher.config.JOIN_ORDER_MIN_RELATIONSHIPS`
+                fixed-length hops are joined in the DPccp-chosen order.
+            use_semi_join_reduction: When ``True`` (default), the base
+                relations of join-ordered plans, and the node variables of
+                multi-hop paths with a selective node filter, are first
+                narrowed by a Yannakakis semi-join reduction.
+            cardinality_feedback: Optional feedback store; estimated and
+                actual rows of each executed join sub-plan are recorded so
+                later estimates self-correct.
 
         """
         self.context = context
@@ -148,6 +194,12 @@ class PatternMatcher:
         self._apply_where_filter = apply_where_fn
         self._multi_way_join = multi_way_join_fn
         self._evaluator_factory = evaluator_factory
+        self._use_generic_join = use_generic_join
+        self._use_join_ordering = use_join_ordering
+        self._use_semi_join_reduction = use_semi_join_reduction
+        self._cardinality_feedback = cardinality_feedback
+        #: Join-order plan of the most recently executed MATCH, if any.
+        self.last_join_order_plan: JoinOrderPlan | None = None
 
     def node_pattern_to_binding_frame(
         self,
@@ -289,6 +341,8 @@ class PatternMatcher:
         anon_counter: list[int],
         context_frame: BindingFrame | None = None,
         row_limit: int | None = None,
+        start_frame: BindingFrame | None = None,
+        node_ids: Mapping[str, np.ndarray] | None = None,
     ) -> BindingFrame:
         """Translate a PatternPath into a BindingFrame via scans and joins.
 
@@ -300,6 +354,11 @@ class PatternMatcher:
             anon_counter: Mutable counter for synthetic names.
             context_frame: Optional preceding BindingFrame.
             row_limit: If given, forward to variable-length path expansion.
+            start_frame: Already-scanned rows of the first node; when given,
+                the first node is not scanned again.
+            node_ids: IDs that can take part in a full match, per node
+                variable (from :meth:`_semi_join_node_ids`); rows binding
+                any other ID are dropped after every scan and hop.
 
         Returns:
             A BindingFrame for this path.
@@ -332,15 +391,26 @@ class PatternMatcher:
         # Start with first node
         first_node = elements[0]
         assert isinstance(first_node, NodePattern)
-        frame = self.node_pattern_to_binding_frame(
-            first_node,
-            anon_counter,
-            context_frame=context_frame,
-        )
+        if start_frame is not None:
+            frame = start_frame
+        else:
+            frame = self.node_pattern_to_binding_frame(
+                first_node,
+                anon_counter,
+                context_frame=context_frame,
+            )
         prev_var = frame.var_names[0]
+        frame = self._restrict_to_ids(frame, prev_var, node_ids)
 
+        monitor = operator_monitor(
+            self.context,
+            "match",
+            total=(len(elements) - 1) // 2,
+            unit="hops",
+        )
         i = 1
         while i + 1 <= len(elements) - 1:
+            monitor.check()
             rel_ast = elements[i]  # RelationshipPattern
             assert isinstance(rel_ast, RelationshipPattern)
             node_ast = elements[i + 1]  # NodePattern
@@ -418,8 +488,11 @@ class PatternMatcher:
                     next_type,
                     direction,
                 )
+                frame = self._restrict_to_ids(frame, next_var, node_ids)
 
             prev_var = next_var
+            monitor.advance(1)
+        monitor.close()
 
         # Path variable hop-count column for fixed-length paths
         if path_var_name is not None:
@@ -733,12 +806,70 @@ class PatternMatcher:
                 "Provide at least one pattern, e.g. MATCH (n:Person).",
             )
 
+        if self._use_generic_join:
+            from pycypher.generic_join import plan_cyclic_match
+
+            cyclic_plan = plan_cyclic_match(match_clause, anon_counter)
+            if cyclic_plan is not None:
+                return self._match_cyclic_pattern(
+                    cyclic_plan,
+                    match_clause,
+                    context_frame=context_frame,
+                )
+
+        if self._use_join_ordering:
+            from pycypher.join_order import plan_join_order
+
+            bound_vars: dict[str, int] | None = None
+            if context_frame is not None:
+                bound_vars = dict.fromkeys(
+                    context_frame.var_names,
+                    len(context_frame.bindings),
+                )
+            join_plan = plan_join_order(
+                match_clause,
+                self.context,
+                where=match_clause.where if context_frame is None else None,
+                feedback_store=self._cardinality_feedback,
+                anon_counter=anon_counter,
+                bound_vars=bound_vars,
+            )
+            if join_plan is not None:
+                return self._match_join_ordered(
+                    join_plan,
+                    context_frame=context_frame,
+                )
+
+        if (
+            row_limit is not None
+            and context_frame is None
+            and match_clause.where is None
+            and len(pattern.paths) == 1
+            and pattern.paths[0].shortest_path_mode == "none"
+            and pattern.paths[0].elements
+            and not any(
+                isinstance(el, RelationshipPattern) and el.length is not None
+                for el in pattern.paths[0].elements
+            )
+        ):
+            return self._match_path_with_row_limit(
+                pattern.paths[0],
+                anon_counter,
+                row_limit,
+            )
+
+        node_ids = (
+            self._semi_join_node_ids(match_clause, anon_counter)
+            if self._use_semi_join_reduction and context_frame is None
+            else None
+        )
         frames = [
             self.pattern_path_to_binding_frame(
                 path,
                 anon_counter,
                 context_frame=context_frame,
                 row_limit=row_limit,
+                node_ids=node_ids,
             )
             for path in pattern.paths
         ]
@@ -796,3 +927,649 @@ class PatternMatcher:
             result = self._apply_where_filter(match_clause.where, result)
 
         return result
+
+    def _semi_join_node_ids(
+        self,
+        match_clause: Match,
+        anon_counter: list[int],
+    ) -> dict[str, np.ndarray] | None:
+        """Return the IDs per node variable that survive semi-join reduction.
+
+        Applies to acyclic patterns with at least two hops and a selective
+        node — one with inline properties or a single-variable WHERE
+        conjunct — where the hop-by-hop translation would otherwise carry
+        rows that the far end of the pattern later discards.  Node scans
+        (with those filters) and relationship scans are reduced with
+        :func:`~pycypher.semi_join.semi_join_reduce`; the path translation
+        then drops every row binding an ID outside the result.
+
+        Args:
+            match_clause: The MATCH clause about to be translated.
+            anon_counter: The translation's counter; synthetic names are
+                assigned from its current value without advancing it.
+
+        Returns:
+            Surviving IDs keyed by node variable, or ``None`` when the
+            pattern is not eligible.
+
+        """
+        from pycypher.generic_join import extract_pattern_graph
+
+        graph = extract_pattern_graph(
+            match_clause,
+            [anon_counter[0]],
+            allow_undirected=True,
+        )
+        if graph is None or len(graph.edges) < 2:
+            return None
+
+        scan_filters, _ = self._node_scan_filters(match_clause, graph)
+        if not scan_filters and not any(
+            node.properties for node in graph.node_patterns.values()
+        ):
+            return None
+        reduction = self._reduce_pattern(graph, scan_filters)
+        return None if reduction is None else reduction.ids
+
+    @staticmethod
+    def _node_scan_filters(
+        match_clause: Match,
+        graph: PatternGraph,
+    ) -> tuple[dict[str, list[Any]], list[Any]]:
+        """Split the MATCH's WHERE into per-node-variable conjuncts and rest.
+
+        Returns:
+            ``(scan_filters, remaining)`` — conjuncts referencing exactly
+            one node variable, keyed by it, and every other conjunct.
+
+        """
+        from pycypher.frame_joiner import _extract_conjuncts
+        from pycypher.lazy_eval import _extract_variables_from_predicate
+
+        scan_filters: dict[str, list[Any]] = {}
+        remaining: list[Any] = []
+        if match_clause.where is not None:
+            for conj in _extract_conjuncts(match_clause.where):
+                refs = _extract_variables_from_predicate(conj)
+                if len(refs) == 1 and next(iter(refs)) in graph.node_patterns:
+                    scan_filters.setdefault(next(iter(refs)), []).append(conj)
+                else:
+                    remaining.append(conj)
+        return scan_filters, remaining
+
+    def _reduce_pattern(
+        self,
+        graph: PatternGraph,
+        scan_filters: dict[str, list[Any]],
+    ) -> SemiJoinReduction | None:
+        """Scan an acyclic pattern's base relations and semi-join reduce them.
+
+        Only nodes the MATCH translation itself filters become node
+        relations — path starts, nodes with properties and nodes with
+        WHERE conjuncts — built by :meth:`_pattern_node_frame` so that
+        label checks match the path-at-a-time translation.
+
+        Returns:
+            The reduction, or ``None`` when the pattern is cyclic.
+
+        """
+        from pycypher.semi_join import semi_join_reduce
+
+        edge_frames = [self._edge_frame(edge) for edge in graph.edges]
+        type_registry = self._pattern_type_registry(graph, None)
+        frames: list[pd.DataFrame] = []
+        for var, node in graph.node_patterns.items():
+            if not (
+                var in graph.path_starts
+                or node.properties
+                or var in scan_filters
+            ):
+                continue
+            frames.append(
+                self._pattern_node_frame(
+                    var,
+                    graph,
+                    edge_frames,
+                    type_registry,
+                    scan_filters.get(var, []),
+                ),
+            )
+        frames.extend(edge_frames)
+        return semi_join_reduce(frames, graph.node_vars)
+
+    def _pattern_node_frame(
+        self,
+        var: str,
+        graph: PatternGraph,
+        edge_frames: list[pd.DataFrame],
+        type_registry: Mapping[str, str],
+        conjuncts: list[Any],
+        context_frame: BindingFrame | None = None,
+    ) -> pd.DataFrame:
+        """Return the candidate IDs of one node of a flattened pattern.
+
+        Mirrors the path-at-a-time translation: a path's first node is
+        scanned by label, while any other node is only reached by
+        traversal, which does not check its label — its candidates are
+        the IDs the adjacent hops in *edge_frames* bind, narrowed by its
+        inline properties.  *conjuncts* (single-variable WHERE conjuncts)
+        are applied to either, and IDs are narrowed to those bound by
+        *context_frame*.
+
+        Returns:
+            A single-column frame named after *var*.
+
+        """
+        from pycypher.ast_models import Comparison, PropertyLookup
+        from pycypher.ast_models import Variable as _Var
+
+        node = graph.node_patterns[var]
+        if var in graph.path_starts:
+            frame = self.node_pattern_to_binding_frame(
+                node.model_copy(
+                    update={"labels": list(graph.path_starts[var].labels)},
+                ),
+                [0],
+                context_frame=context_frame,
+            )
+        else:
+            ids = pd.concat(
+                [f[var] for f in edge_frames if var in f.columns],
+                ignore_index=True,
+            ).drop_duplicates()
+            frame = BindingFrame(
+                bindings=pd.DataFrame({var: ids.to_numpy()}),
+                type_registry=(
+                    {var: type_registry[var]} if var in type_registry else {}
+                ),
+                context=self.context,
+            )
+            for prop_name, prop_val in (node.properties or {}).items():
+                frame = self._apply_where_filter(
+                    Comparison(
+                        operator="=",
+                        left=PropertyLookup(
+                            expression=_Var(name=var),
+                            property=prop_name,
+                        ),
+                        right=prop_val,
+                    ),
+                    frame,
+                )
+        for conj in conjuncts:
+            frame = self._apply_where_filter(conj, frame)
+        df = frame.bindings[[var]]
+        if context_frame is not None and var in context_frame.bindings.columns:
+            df = df[df[var].isin(context_frame.bindings[var].dropna())]
+        return df
+
+    def match_to_factorized(
+        self,
+        match_clause: Match,
+    ) -> FactorizedFrame | None:
+        """Translate an acyclic MATCH into a factorized result.
+
+        The pattern's base relations are scanned and semi-join reduced
+        (see :meth:`_reduce_pattern`) but never joined; the
+        :class:`~pycypher.factorized.FactorizedFrame` answers counts and
+        aggregates from them, and is flattened only if rows are needed.
+
+        Applies to a non-optional MATCH whose pattern
+        :func:`~pycypher.generic_join.extract_pattern_graph` accepts, is
+        acyclic, and whose WHERE conjuncts each reference one node
+        variable.
+
+        Args:
+            match_clause: The first clause of the query.
+
+        Returns:
+            The factorized result, or ``None`` when the MATCH is not
+            eligible.
+
+        """
+        from pycypher.factorized import FactorizedFrame
+        from pycypher.generic_join import extract_pattern_graph
+
+        if match_clause.optional:
+            return None
+        graph = extract_pattern_graph(match_clause, [0], allow_undirected=True)
+        if graph is None:
+            return None
+        scan_filters, remaining = self._node_scan_filters(match_clause, graph)
+        if remaining:
+            return None
+        reduction = self._reduce_pattern(graph, scan_filters)
+        if reduction is None:
+            return None
+        # Type unlabelled nodes as the flat translation's scans would, so
+        # their properties resolve the same way.
+        graph = dataclasses.replace(
+            graph,
+            type_registry=self._pattern_type_registry(graph, None),
+        )
+        return FactorizedFrame(
+            graph=graph,
+            relations=reduction.frames,
+            ids=reduction.ids,
+            context=self.context,
+        )
+
+    @staticmethod
+    def _restrict_to_ids(
+        frame: BindingFrame,
+        var: str,
+        node_ids: Mapping[str, np.ndarray] | None,
+    ) -> BindingFrame:
+        """Drop the rows of *frame* whose *var* is not in ``node_ids[var]``."""
+        from pycypher.semi_join import id_membership
+
+        if not node_ids or var not in node_ids:
+            return frame
+        mask = id_membership(frame.bindings[var], node_ids[var])
+        if mask.all():
+            return frame
+        return frame.filter(pd.Series(mask))
+
+    def _match_path_with_row_limit(
+        self,
+        path: PatternPath,
+        anon_counter: list[int],
+        row_limit: int,
+    ) -> BindingFrame:
+        """Match a fixed-length path, stopping once *row_limit* rows exist.
+
+        The first node is scanned in full, then the rest of the path is
+        joined onto geometrically growing chunks of it until the chunks
+        seen so far yield *row_limit* rows.  Only valid when any
+        *row_limit* matches are an acceptable answer, i.e. for
+        ``MATCH … RETURN … LIMIT n`` without WHERE, ORDER BY or
+        aggregation.
+
+        Args:
+            path: Single AST PatternPath without variable-length hops.
+            anon_counter: Mutable counter for synthetic names.
+            row_limit: Number of matches needed.
+
+        Returns:
+            A BindingFrame with at most *row_limit* rows — all of them when
+            the pattern has fewer matches.
+
+        """
+        first_node = path.elements[0]
+        assert isinstance(first_node, NodePattern)
+        first = self.node_pattern_to_binding_frame(first_node, anon_counter)
+        if not isinstance(first.bindings, pd.DataFrame):
+            return self.pattern_path_to_binding_frame(
+                path,
+                anon_counter,
+                start_frame=first,
+            )
+
+        start_counter = anon_counter[0]
+        chunk_rows = max(row_limit, LIMIT_SCAN_CHUNK_ROWS)
+        parts: list[BindingFrame] = []
+        matched = start = 0
+        while True:
+            counter = [start_counter]
+            chunk = BindingFrame(
+                bindings=first.bindings.iloc[
+                    start : start + chunk_rows
+                ].reset_index(drop=True),
+                type_registry=first.type_registry,
+                context=first.context,
+            )
+            part = self.pattern_path_to_binding_frame(
+                path,
+                counter,
+                start_frame=chunk,
+            )
+            parts.append(part)
+            matched += len(part.bindings)
+            start += chunk_rows
+            chunk_rows *= 2
+            if matched >= row_limit or start >= len(first.bindings):
+                break
+        anon_counter[0] = counter[0]
+
+        LOGGER.debug(
+            "LIMIT %d: matched %d rows from %d of %d start nodes",
+            row_limit,
+            matched,
+            min(start, len(first.bindings)),
+            len(first.bindings),
+        )
+        type_registry: dict[str, str] = {}
+        for part in parts:
+            type_registry.update(part.type_registry)
+        return BindingFrame(
+            bindings=pd.concat(
+                [part.bindings for part in parts],
+                ignore_index=True,
+            ).iloc[:row_limit],
+            type_registry=type_registry,
+            context=self.context,
+        )
+
+    def _match_cyclic_pattern(
+        self,
+        plan: CyclicMatchPlan,
+        match_clause: Match,
+        context_frame: BindingFrame | None = None,
+    ) -> BindingFrame:
+        """Evaluate a cyclic MATCH pattern with worst-case optimal Generic Join.
+
+        Node candidates come from label scans (with inline properties pushed
+        into :class:`~pycypher.binding_frame.EntityScan`), narrowed by WHERE
+        conjuncts that reference a single node variable and by IDs already
+        bound in *context_frame*.  Relationship tables are scanned once per
+        type and shared by every hop of that type.
+
+        Args:
+            plan: Plan from :func:`~pycypher.generic_join.plan_cyclic_match`.
+            match_clause: The originating MATCH clause (for its WHERE).
+            context_frame: Optional preceding BindingFrame.
+
+        Returns:
+            A BindingFrame satisfying the MATCH pattern.
+
+        """
+        from pycypher.binding_frame import RelationshipScan
+        from pycypher.frame_joiner import _extract_conjuncts, _rebuild_and
+        from pycypher.generic_join import generic_join_bindings
+
+        _t0 = time.perf_counter()
+
+        # --- Split WHERE into per-node-variable filters and a residual. ---
+        node_filters: dict[str, list[Any]] = {}
+        residual: Any = None
+        apply_where = match_clause.where is not None and context_frame is None
+        if apply_where:
+            from pycypher.lazy_eval import _extract_variables_from_predicate
+
+            remaining: list[Any] = []
+            for conj in _extract_conjuncts(match_clause.where):
+                refs = _extract_variables_from_predicate(conj)
+                if len(refs) == 1 and next(iter(refs)) in plan.node_patterns:
+                    node_filters.setdefault(next(iter(refs)), []).append(conj)
+                else:
+                    remaining.append(conj)
+            residual = _rebuild_and(remaining)
+
+        # --- Candidate IDs per node variable. ---
+        node_candidates: dict[str, pd.Series | None] = {}
+        for var, node in plan.node_patterns.items():
+            bound_ids: pd.Series | None = None
+            if (
+                context_frame is not None
+                and var in context_frame.bindings.columns
+            ):
+                bound_ids = context_frame.bindings[var].dropna()
+            if not node.labels and var not in node_filters:
+                node_candidates[var] = bound_ids
+                continue
+            if not node.labels and bound_ids is None:
+                # Unlabelled variable with a filter: evaluate the filter
+                # after the join, where its entity type is known.
+                node_candidates[var] = None
+                residual = _rebuild_and(
+                    [c for c in (residual,) if c is not None]
+                    + node_filters.pop(var),
+                )
+                continue
+            node_frame = self.node_pattern_to_binding_frame(
+                node,
+                [0],
+                context_frame=context_frame,
+            )
+            for conj in node_filters.get(var, []):
+                node_frame = self._apply_where_filter(conj, node_frame)
+            ids = node_frame.bindings[var]
+            if bound_ids is not None:
+                ids = ids[ids.isin(bound_ids)]
+            node_candidates[var] = ids
+
+        # --- One relationship scan per type, shared across hops. ---
+        relationships: dict[str, pd.DataFrame] = {}
+        for edge in plan.edges:
+            if edge.rel_type in relationships:
+                continue
+            rs = RelationshipScan(edge.rel_type, edge.rel_var)
+            rel_bindings = rs.scan(self.context).bindings
+            relationships[edge.rel_type] = pd.DataFrame(
+                {
+                    "id": rel_bindings[edge.rel_var].to_numpy(),
+                    "src": rel_bindings[rs.src_col].to_numpy(),
+                    "tgt": rel_bindings[rs.tgt_col].to_numpy(),
+                },
+            )
+
+        bindings = generic_join_bindings(plan, node_candidates, relationships)
+        LOGGER.debug(
+            "generic join  vars=%s  edges=%d  rows=%d  elapsed=%.3fs",
+            plan.node_vars,
+            len(plan.edges),
+            len(bindings),
+            time.perf_counter() - _t0,
+        )
+        result = BindingFrame(
+            bindings=bindings,
+            type_registry=self._pattern_type_registry(plan, context_frame),
+            context=self.context,
+        )
+        if apply_where and residual is not None:
+            result = self._apply_where_filter(residual, result)
+        return result
+
+    def _pattern_type_registry(
+        self,
+        graph: PatternGraph,
+        context_frame: BindingFrame | None,
+    ) -> dict[str, str]:
+        """Type registry for a flattened pattern, including unlabelled nodes."""
+        type_registry = dict(graph.type_registry)
+        entity_types = list(self.context.entity_mapping.mapping)
+        for var in graph.node_vars:
+            if var in type_registry:
+                continue
+            if (
+                context_frame is not None
+                and var in context_frame.type_registry
+            ):
+                type_registry[var] = context_frame.type_registry[var]
+            elif entity_types:
+                # Same convention as an unlabelled node scan.
+                type_registry[var] = (
+                    entity_types[0] if len(entity_types) == 1 else "__MULTI__"
+                )
+        return type_registry
+
+    def _match_join_ordered(
+        self,
+        plan: JoinOrderPlan,
+        context_frame: BindingFrame | None = None,
+    ) -> BindingFrame:
+        """Evaluate a MATCH pattern by executing a cost-based join tree.
+
+        Each leaf of ``plan.tree`` is a node or relationship scan (with its
+        pushed-down filters); each inner node is an inner join on every
+        variable its children share, followed by the WHERE conjuncts the
+        planner attached to it.  The actual row count of every sub-plan is
+        recorded in the cardinality feedback store.
+
+        Args:
+            plan: Plan from :func:`~pycypher.join_order.plan_join_order`.
+            context_frame: Optional preceding BindingFrame.
+
+        Returns:
+            A BindingFrame satisfying the MATCH pattern.
+
+        """
+        _t0 = time.perf_counter()
+        type_registry = self._pattern_type_registry(plan.graph, context_frame)
+        _be = getattr(self.context, "backend", None)
+
+        def _filter(df: pd.DataFrame, conjuncts: list[Any]) -> pd.DataFrame:
+            if not conjuncts:
+                return df
+            frame = BindingFrame(
+                bindings=df,
+                type_registry={
+                    k: v for k, v in type_registry.items() if k in df.columns
+                },
+                context=self.context,
+            )
+            for conj in conjuncts:
+                frame = self._apply_where_filter(conj, frame)
+            return frame.bindings
+
+        edge_frames = {
+            edge.rel_var: self._edge_frame(edge) for edge in plan.graph.edges
+        }
+        scans = [
+            self._join_order_scan(
+                relation,
+                plan.graph,
+                edge_frames,
+                type_registry,
+                context_frame,
+            )
+            for relation in plan.relations
+        ]
+        if self._use_semi_join_reduction:
+            from pycypher.semi_join import semi_join_reduce
+
+            reduction = semi_join_reduce(scans, plan.graph.node_vars)
+            if reduction is not None:
+                scans = reduction.frames
+
+        def _run(node: JoinTree) -> pd.DataFrame:
+            if node.leaf is not None:
+                df = scans[node.leaf]
+            else:
+                assert node.left is not None and node.right is not None
+                left = _run(node.left)
+                right = _run(node.right)
+                on = list(node.join_vars)
+                if _be is not None:
+                    df = run_chunked(
+                        self.context,
+                        "join",
+                        left,
+                        lambda part: _be.join(part, right, on=on, how="inner"),
+                        build_rows=len(right),
+                    )
+                else:
+                    df = run_chunked(
+                        self.context,
+                        "join",
+                        left,
+                        lambda part: part.merge(right, on=on, how="inner"),
+                        build_rows=len(right),
+                    )
+            df = _filter(df, node.filters)
+            node.actual_rows = len(df)
+            if self._cardinality_feedback is not None:
+                self._cardinality_feedback.record(
+                    plan.feedback_key(node),
+                    round(node.raw_rows),
+                    node.actual_rows,
+                )
+            return df
+
+        bindings = _run(plan.tree)
+        columns = [c for c in plan.graph.columns if c in bindings.columns]
+        bindings = bindings[columns].reset_index(drop=True)
+        self.last_join_order_plan = plan
+        LOGGER.debug(
+            "join-ordered match  relations=%d  est_rows=%.0f  rows=%d  "
+            "elapsed=%.3fs",
+            len(plan.relations),
+            plan.tree.estimated_rows,
+            len(bindings),
+            time.perf_counter() - _t0,
+        )
+        return BindingFrame(
+            bindings=bindings,
+            type_registry=type_registry,
+            context=self.context,
+        )
+
+    def _join_order_scan(
+        self,
+        relation: JoinRelation,
+        graph: PatternGraph,
+        edge_frames: Mapping[str, pd.DataFrame],
+        type_registry: Mapping[str, str],
+        context_frame: BindingFrame | None,
+    ) -> pd.DataFrame:
+        """Materialise one base relation of a join-order plan.
+
+        Node relations are built by :meth:`_pattern_node_frame`, so labels
+        are checked exactly where the path-at-a-time translation checks
+        them; relationship scans (from *edge_frames*) name their endpoint
+        columns after the adjacent node variables so that every join in
+        the tree is a natural join.  The relation's filters are applied.
+        """
+        if relation.kind == "node":
+            return self._pattern_node_frame(
+                relation.variable,
+                graph,
+                list(edge_frames.values()),
+                type_registry,
+                relation.filters,
+                context_frame=context_frame,
+            )
+        df = edge_frames[relation.variable]
+        if not relation.filters:
+            return df
+        frame = BindingFrame(
+            bindings=df,
+            type_registry={
+                k: v for k, v in type_registry.items() if k in df.columns
+            },
+            context=self.context,
+        )
+        for conj in relation.filters:
+            frame = self._apply_where_filter(conj, frame)
+        return frame.bindings
+
+    def _edge_frame(self, edge: PatternEdge) -> pd.DataFrame:
+        """Scan one pattern hop into a frame keyed by pattern variables.
+
+        Columns are the relationship variable and its endpoint node
+        variables (one endpoint for a self-loop); undirected hops list
+        both orientations.
+        """
+        from pycypher.binding_frame import RelationshipScan
+
+        rs = RelationshipScan(edge.rel_type, edge.rel_var)
+        scanned = rs.scan(self.context).bindings
+        if edge.src_var == edge.tgt_var:
+            loops = scanned[scanned[rs.src_col] == scanned[rs.tgt_col]]
+            return pd.DataFrame(
+                {
+                    edge.rel_var: loops[edge.rel_var].to_numpy(),
+                    edge.src_var: loops[rs.src_col].to_numpy(),
+                },
+            )
+        forward = pd.DataFrame(
+            {
+                edge.rel_var: scanned[edge.rel_var].to_numpy(),
+                edge.src_var: scanned[rs.src_col].to_numpy(),
+                edge.tgt_var: scanned[rs.tgt_col].to_numpy(),
+            },
+        )
+        if not edge.undirected:
+            return forward
+        backward = pd.DataFrame(
+            {
+                edge.rel_var: scanned[edge.rel_var].to_numpy(),
+                edge.src_var: scanned[rs.tgt_col].to_numpy(),
+                edge.tgt_var: scanned[rs.src_col].to_numpy(),
+            },
+        )
+        return (
+            pd.concat([forward, backward], ignore_index=True)
+            .drop_duplicates()
+            .reset_index(drop=True)
+        )
@@ -582,6 +582,8 @@ class ExecuteStage(Stage):
                 execute_relation_mutation(parsed, _context, mutation_kind)
                 ctx.result = pd.DataFrame()
             else:
+                if not is_mutation:
+                    ctx.star._prefetch_referenced_properties(parsed)
                 ctx.result = ctx.star._execute_query_binding_frame(parsed)
         else:
             from pycypher.exceptions import GrammarTransformerSyncError
@@ -9,7 +9,8 @@ Handles:
 
 - Alias inference from expression AST nodes (Variable, PropertyLookup, etc.)
 - Alias disambiguation for colliding inferred names
-- RETURN clause evaluation (projection + aggregation + modifiers)
+- RETURN clause evaluation (projection + aggregation + modifiers), also
+  straight from a factorized MATCH result
 - WITH clause evaluation (projection + aggregation + WHERE + modifiers)
 - DISTINCT, ORDER BY (ASC/DESC with NULLS FIRST/LAST), SKIP, LIMIT
 """
@@ -23,11 +24,14 @@ from typing import TYPE_CHECKING, Any
 import pandas as pd
 from shared.logger import LOGGER
 
+from pycypher.top_k import top_k_candidates, use_top_k
+
 if TYPE_CHECKING:
     from pycypher.aggregation_planner import AggregationPlanner
     from pycypher.binding_frame import BindingFrame
     from pycypher.evaluator_protocol import ExpressionEvaluatorFactory
     from pycypher.expression_renderer import ExpressionRenderer
+    from pycypher.factorized import FactorizedFrame, FactorizedReturn
 
 
 class ProjectionPlanner:
@@ -146,6 +150,17 @@ class ProjectionPlanner:
         """
         from pycypher.binding_frame import BindingFrame
 
+        # ``skip`` / ``limit`` are ints (literals) or Expression AST nodes
+        # (e.g. Parameter), resolved up front so ORDER BY can use the bound.
+        skip_val = self._resolve_row_count(
+            getattr(clause, "skip", None),
+            frame,
+        )
+        limit_val = self._resolve_row_count(
+            getattr(clause, "limit", None),
+            frame,
+        )
+
         # ── DISTINCT ─────────────────────────────────────────────────────────
         if getattr(clause, "distinct", False):
             df = df.drop_duplicates().reset_index(drop=True)
@@ -211,6 +226,29 @@ class ProjectionPlanner:
                     )
                     null_col_names.append((null_col, not nulls_first))
 
+            # ── Top-K ────────────────────────────────────────────────────
+            # With a small SKIP + LIMIT bound, drop every row that cannot
+            # reach the first k positions before sorting.
+            top_k = None if limit_val is None else (skip_val or 0) + limit_val
+            if use_top_k(len(temp_df), top_k):
+                candidates = top_k_candidates(
+                    temp_df[sort_col_names[0]],
+                    top_k,
+                    ascending=ascending_flags[0],
+                    nulls_first=(
+                        getattr(order_by[0], "nulls_placement", None)
+                        == "first"
+                    ),
+                )
+                if candidates is not None:
+                    LOGGER.debug(
+                        "ORDER BY: Top-K kept %d of %d rows (k=%d)",
+                        int(candidates.sum()),
+                        len(temp_df),
+                        top_k,
+                    )
+                    temp_df = temp_df[candidates]
+
             if has_explicit_nulls:
                 # Interleave [null_ind_0, sort_0, null_ind_1, sort_1, ...]
                 interleaved_by: list[str] = []
@@ -238,27 +276,30 @@ class ProjectionPlanner:
             df = temp_df.drop(columns=drop_cols).reset_index(drop=True)
 
         # ── SKIP ─────────────────────────────────────────────────────────────
-        # ``skip`` is an int (literal) or an Expression AST node (e.g.
-        # Parameter).  Evaluate non-int values through ``frame``'s evaluator
-        # (which holds the query's Context including any bound parameters).
-        skip_val: Any = getattr(clause, "skip", None)
         if skip_val is not None:
-            if not isinstance(skip_val, int):
-                evaluator = self._evaluator_factory(frame)
-                skip_val = int(evaluator.evaluate(skip_val).iloc[0])
-            df = df.iloc[int(skip_val) :].reset_index(drop=True)
+            df = df.iloc[skip_val:].reset_index(drop=True)
 
         # ── LIMIT ────────────────────────────────────────────────────────────
-        # Same int-or-Expression handling as SKIP above.
-        limit_val: Any = getattr(clause, "limit", None)
         if limit_val is not None:
-            if not isinstance(limit_val, int):
-                evaluator = self._evaluator_factory(frame)
-                limit_val = int(evaluator.evaluate(limit_val).iloc[0])
-            df = df.iloc[: int(limit_val)].reset_index(drop=True)
+            df = df.iloc[:limit_val].reset_index(drop=True)
 
         return df
 
+    def _resolve_row_count(
+        self,
+        value: Any,
+        frame: BindingFrame,
+    ) -> int | None:
+        """Resolve a SKIP/LIMIT value to an ``int``.
+
+        Non-int values (e.g. a Parameter) are evaluated through *frame*'s
+        evaluator, which holds the query's Context and bound parameters.
+        """
+        if value is None or isinstance(value, int):
+            return value
+        evaluator = self._evaluator_factory(frame)
+        return int(evaluator.evaluate(value).iloc[0])
+
     def return_from_frame(
         self,
         return_clause: Any,
@@ -296,6 +337,13 @@ class ProjectionPlanner:
                 frame,
             )
 
+        self._assign_aliases(items)
+        frame = self._prune_groups_for_limit(items, return_clause, frame)
+        result = self._agg_planner.aggregate_items(items, frame)
+        return self.apply_projection_modifiers(result, return_clause, frame)
+
+    def _assign_aliases(self, items: list[Any]) -> None:
+        """Infer missing RETURN aliases and disambiguate colliding ones."""
         for item in items:
             if item.alias is None:
                 item.alias = self.infer_alias(item.expression)
@@ -312,8 +360,152 @@ class ProjectionPlanner:
                 if qualified is not None:
                     item.alias = qualified
 
-        result = self._agg_planner.aggregate_items(items, frame)
-        return self.apply_projection_modifiers(result, return_clause, frame)
+    def plan_factorized_return(
+        self,
+        return_clause: Any,
+        node_vars: set[str] | None = None,
+    ) -> FactorizedReturn | None:
+        """Return how to answer *return_clause* from a factorized MATCH.
+
+        Args:
+            return_clause: AST :class:`~pycypher.ast_models.Return` node.
+            node_vars: The pattern's node variables, when known.
+
+        Returns:
+            The plan, or ``None`` when the RETURN needs flat rows.
+
+        """
+        from pycypher.factorized import plan_factorized_return
+
+        self._assign_aliases(return_clause.items)
+        return plan_factorized_return(
+            return_clause,
+            self._agg_planner.contains_aggregation,
+            node_vars,
+        )
+
+    def return_from_factorized(
+        self,
+        return_clause: Any,
+        frame: FactorizedFrame,
+    ) -> pd.DataFrame | None:
+        """Evaluate a RETURN clause against a factorized MATCH result.
+
+        Aggregates and DISTINCT keys are computed from the frame's weights
+        by :meth:`AggregationPlanner.aggregate_factorized`; the flat rows
+        are never built.  ORDER BY, SKIP and LIMIT then apply as usual.
+
+        Args:
+            return_clause: AST :class:`~pycypher.ast_models.Return` node.
+            frame: The :class:`~pycypher.factorized.FactorizedFrame`.
+
+        Returns:
+            A plain ``pd.DataFrame`` with columns matching RETURN aliases,
+            or ``None`` when the caller should flatten *frame* and use
+            :meth:`return_from_frame`.
+
+        """
+        from pycypher.ast_models import Variable as _Var
+
+        plan = self.plan_factorized_return(
+            return_clause,
+            set(frame.graph.node_vars),
+        )
+        if plan is None:
+            return None
+        # Properties are resolved through the variable's label.
+        untyped = {
+            a.variable
+            for a in plan.aggregates
+            if a.variable is not None and not isinstance(a.argument, _Var)
+        }
+        if plan.group_var is not None:
+            untyped.add(plan.group_var)
+        if not untyped <= frame.graph.type_registry.keys():
+            return None
+        result = self._agg_planner.aggregate_factorized(plan, frame)
+        if result is None:
+            return None
+        LOGGER.debug("RETURN: %d groups from a factorized MATCH", len(result))
+        group_var = plan.group_var or frame.graph.node_vars[0]
+        return self.apply_projection_modifiers(
+            result,
+            return_clause,
+            frame.node_frame(group_var),
+        )
+
+    def _prune_groups_for_limit(
+        self,
+        items: list[Any],
+        clause: Any,
+        frame: BindingFrame,
+    ) -> BindingFrame:
+        """Push an ``ORDER BY <grouping key> LIMIT k`` bound below grouping.
+
+        Only the groups whose key is among the first ``SKIP + LIMIT``
+        distinct values can reach the output, so rows of every other group
+        are dropped before aggregating.  Applies only when the leading
+        ORDER BY key is a non-aggregate RETURN item and there is no
+        DISTINCT; otherwise *frame* is returned unchanged.
+
+        Args:
+            items: RETURN items with aliases set.
+            clause: The RETURN clause carrying ORDER BY / SKIP / LIMIT.
+            frame: Input frame of the aggregation.
+
+        Returns:
+            *frame*, or the subset of its rows in the surviving groups.
+
+        """
+        from pycypher.ast_models import Variable as _Var
+
+        order_by = getattr(clause, "order_by", None)
+        limit_val = getattr(clause, "limit", None)
+        if not order_by or limit_val is None or clause.distinct:
+            return frame
+        agg_flags = [
+            self._agg_planner.contains_aggregation(i.expression)
+            for i in items
+        ]
+        if not any(agg_flags) or all(agg_flags):
+            return frame
+        leading = order_by[0].expression
+        key_item = next(
+            (
+                item
+                for item, is_agg in zip(items, agg_flags, strict=True)
+                if not is_agg
+                and (
+                    (isinstance(leading, _Var) and leading.name == item.alias)
+                    or leading == item.expression
+                )
+            ),
+            None,
+        )
+        if key_item is None:
+            return frame
+        top_k = self._resolve_row_count(limit_val, frame) + (
+            self._resolve_row_count(getattr(clause, "skip", None), frame)
+            or 0
+        )
+        if not use_top_k(len(frame), top_k):
+            return frame
+        keys = self._evaluator_factory(frame).evaluate(key_item.expression)
+        candidates = top_k_candidates(
+            keys.reset_index(drop=True),
+            top_k,
+            ascending=order_by[0].ascending,
+            distinct=True,
+        )
+        if candidates is None:
+            return frame
+        LOGGER.debug(
+            "RETURN: Top-K kept %d of %d rows before grouping (k=%d)",
+            int(candidates.sum()),
+            len(frame),
+            top_k,
+        )
+        return frame.filter(pd.Series(candidates))
 
     def with_to_binding_frame(
         self,
@@ -105,9 +105,11 @@ class QueryAnalyzer:
     def extract_limit_hint(self, query: Any) -> int | None:
         """Extract a LIMIT value for pushdown if the query pattern is safe.
 
-        Returns the integer LIMIT value when the query has the simple pattern
-        ``MATCH ... RETURN ... LIMIT N`` (no aggregation, no DISTINCT, no
-        ORDER BY, no SKIP, no WITH).  Returns ``None`` when pushdown is unsafe.
+        Returns the integer LIMIT value when the query is exactly
+        ``MATCH ... RETURN ... LIMIT N`` (no OPTIONAL MATCH, no other clauses,
+        no aggregation, no DISTINCT, no ORDER BY, no SKIP).  Any ``N`` rows of
+        that MATCH then form a valid answer, so pattern matching may stop
+        early.  Returns ``None`` when pushdown is unsafe.
 
         Args:
             query: Parsed :class:`~pycypher.ast_models.Query` AST node.
@@ -116,20 +118,18 @@ class QueryAnalyzer:
             Integer limit for pushdown, or ``None`` if pushdown is unsafe.
 
         """
-        from pycypher.ast_models import Match, Return, With
+        from pycypher.ast_models import Match, Return
 
         clauses = query.clauses
-        if not clauses:
+        if (
+            len(clauses) != 2
+            or not isinstance(clauses[0], Match)
+            or clauses[0].optional
+            or not isinstance(clauses[1], Return)
+        ):
             return None
 
-        match_count = sum(1 for c in clauses if isinstance(c, Match))
-        with_count = sum(1 for c in clauses if isinstance(c, With))
-        return_clauses = [c for c in clauses if isinstance(c, Return)]
-
-        if match_count != 1 or with_count > 0 or len(return_clauses) != 1:
-            return None
-
-        ret = return_clauses[0]
+        ret = clauses[1]
 
         if ret.distinct or ret.order_by or ret.skip is not None:
             return None
@@ -299,10 +299,10 @@ class QueryAnalyzer:
         self.apply_match_reordering(query)
 
         # --- LIMIT pushdown hint ---
-        _opt_limit = _opt_plan.hints.get("limit_pushdown_value")
-        _limit_hint = _opt_limit if isinstance(_opt_limit, int) else None
-        if _limit_hint is None:
-            _limit_hint = self.extract_limit_hint(query)
+        # The optimizer's ``limit_pushdown_value`` hint is advisory (it is
+        # reported by EXPLAIN); the hint that truncates pattern matching
+        # comes from the stricter structural check.
+        _limit_hint = self.extract_limit_hint(query)
         if _limit_hint is not None:
             LOGGER.debug(
                 "LIMIT pushdown hint: %d rows",
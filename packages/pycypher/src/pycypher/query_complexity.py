@@ -248,6 +248,9 @@ def _score_expression(
             "stdevp",
             "percentilecont",
             "percentiledisc",
+            "approxcountdistinct",
+            "approxpercentile",
+            "approxtopk",
         }
         if (
             hasattr(expr, "function_name")
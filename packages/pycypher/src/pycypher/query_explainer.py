@@ -139,6 +139,33 @@ class QueryExplainer:
                 if jp.notes:
                     lines.append(f"    Note: {jp.notes}")
 
+        if analysis.multiway_join_plans:
+            lines.append("Multi-way joins:")
+            for jp in analysis.multiway_join_plans:
+                lines.append(
+                    f"  {jp.left_name} over {jp.right_name}: "
+                    f"{jp.strategy.value} (<= {jp.estimated_rows:,} rows)",
+                )
+                if jp.notes:
+                    lines.append(f"    Note: {jp.notes}")
+
+        if analysis.join_order_plans:
+            lines.append("Join order (cost-based, DPccp):")
+            for plan in analysis.join_order_plans:
+                saving = ""
+                if plan.tree.cost < plan.pattern_order_cost:
+                    saving = (
+                        f", pattern order {plan.pattern_order_cost:,.0f}"
+                    )
+                lines.append(
+                    f"  {len(plan.relations)} scans, "
+                    f"est. cost {plan.tree.cost:,.0f}{saving}",
+                )
+                lines.extend(
+                    f"    {line}"
+                    for line in plan.describe(self._cardinality_feedback)
+                )
+
         if analysis.has_pushdown_opportunities:
             lines.append("Optimization opportunities:")
             for p in analysis.pushdown_opportunities:
@@ -298,7 +298,11 @@ class LintIssue:
     severity: str = "warning"
 
 
-def lint_query(query: str) -> list[LintIssue]:
+def lint_query(
+    query: str,
+    *,
+    check_parse: bool = True,
+) -> list[LintIssue]:
     """Lint a Cypher query for formatting issues.
 
     Checks:
@@ -310,6 +314,8 @@ def lint_query(query: str) -> list[LintIssue]:
 
     Args:
         query: The Cypher query to lint.
+        check_parse: Also parse *query* and report syntax errors.  Callers
+            that have already parsed it (the LSP server) pass ``False``.
 
     Returns:
         List of :class:`LintIssue` instances.
@@ -358,6 +364,9 @@ def lint_query(query: str) -> list[LintIssue]:
                             )
             col += len(token)
 
+    if not check_parse:
+        return issues
+
     # Check for parse errors
     try:
         from pycypher.grammar_parser import GrammarParser
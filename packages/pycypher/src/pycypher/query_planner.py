@@ -55,12 +55,15 @@ from pycypher.cardinality_estimator import (
 from pycypher.cardinality_estimator import (
     CardinalityFeedbackStore,
     ColumnStatistics,
+    DegreeStatistics,
     TableStatistics,
 )
 
 if TYPE_CHECKING:
     from pycypher.ast_models import ASTNode, Comparison, Match, Query
+    from pycypher.join_order import JoinOrderPlan
     from pycypher.relational_models import Context
+    from pycypher.statistics_catalog import StatisticsCatalog
 
 __all__ = [
     "AggStrategy",
@@ -99,8 +102,10 @@ class JoinStrategy(enum.Enum):
     NESTED_LOOP = "nested_loop"
 
     #: LeapfrogTriejoin — worst-case optimal multi-way join.
-    #: Best for 3+ relations sharing a common join variable (e.g. triangle
-    #: queries).  O(N^{w/2}) vs O(N^{w-1}) for iterated binary joins.
+    #: Best for 3+ relations sharing a common join variable, and (via the
+    #: multi-attribute Generic Join in :mod:`pycypher.generic_join`) for
+    #: cyclic MATCH patterns such as triangles.  O(N^{w/2}) vs O(N^{w-1})
+    #: for iterated binary joins.
     LEAPFROG = "leapfrog"
 
 
@@ -482,6 +487,12 @@ class AnalysisResult:
             with ``query.clauses``).
         estimated_peak_bytes: Peak memory estimate across all clauses.
         join_plans: Join strategy recommendations (one per relationship hop).
+        multiway_join_plans: Worst-case optimal multi-way joins chosen for
+            cyclic MATCH patterns (one per eligible MATCH clause).  Kept
+            separate from ``join_plans``, which are consumed pairwise by
+            :meth:`~pycypher.frame_joiner.FrameJoiner.coerce_join`.
+        join_order_plans: Cost-based (DPccp) join trees for acyclic
+            multi-hop MATCH clauses, one per eligible clause.
         pushdown_opportunities: Filters that can be applied before joins.
         has_pushdown_opportunities: Convenience flag.
 
@@ -490,6 +501,8 @@ class AnalysisResult:
     clause_cardinalities: list[int] = field(default_factory=list)
     estimated_peak_bytes: int = 0
     join_plans: list[JoinPlan] = field(default_factory=list)
+    multiway_join_plans: list[JoinPlan] = field(default_factory=list)
+    join_order_plans: list[JoinOrderPlan] = field(default_factory=list)
     pushdown_opportunities: list[PushdownOpportunity] = field(
         default_factory=list,
     )
@@ -518,6 +531,19 @@ class AnalysisResult:
                     f"{jp.strategy.value} ({jp.estimated_rows:,} rows)",
                 )
 
+        for jp in self.multiway_join_plans:
+            lines.append(
+                f"Multi-way join {jp.left_name} over {jp.right_name}: "
+                f"{jp.strategy.value} (<= {jp.estimated_rows:,} rows)",
+            )
+
+        for plan in self.join_order_plans:
+            lines.append(
+                f"Join order over {len(plan.relations)} scans: "
+                f"cost {plan.tree.cost:,.0f} "
+                f"(pattern order {plan.pattern_order_cost:,.0f})",
+            )
+
         if self.has_pushdown_opportunities:
             lines.append("Pushdown opportunities:")
             for p in self.pushdown_opportunities:
@@ -573,11 +599,38 @@ class QueryPlanAnalyzer:
     # -- statistics helpers --------------------------------------------------
 
     def _build_table_stats(self) -> None:
-        """Pre-build ``TableStatistics`` for all registered tables."""
+        """Pre-build ``TableStatistics`` for all registered tables.
+
+        Statistics come from the context's
+        :class:`~pycypher.statistics_catalog.StatisticsCatalog`, which serves
+        ``ANALYZE`` profiles where available and otherwise shares one lazily
+        sampled instance per table across analyzers.
+        """
+        catalog = getattr(self.context, "statistics", None)
         for name, et in self.context.entity_mapping.mapping.items():
-            self._table_stats[name] = TableStatistics(et.source_obj)
+            self._table_stats[name] = self._lookup_table_stats(
+                catalog, name, et.source_obj
+            )
         for name, rt in self.context.relationship_mapping.mapping.items():
-            self._table_stats[name] = TableStatistics(rt.source_obj)
+            self._table_stats[name] = self._lookup_table_stats(
+                catalog, name, rt.source_obj
+            )
+
+    @staticmethod
+    def _lookup_table_stats(
+        catalog: StatisticsCatalog | None,
+        name: str,
+        source_obj: Any,
+    ) -> TableStatistics:
+        stats = catalog.table_statistics(name) if catalog is not None else None
+        return stats if stats is not None else TableStatistics(source_obj)
+
+    def _degree_stats(self, rel_type: str) -> DegreeStatistics | None:
+        """Return analyzed fan-out statistics for *rel_type*, if any."""
+        catalog = getattr(self.context, "statistics", None)
+        if catalog is None:
+            return None
+        return catalog.degree_statistics(rel_type)
 
     def _get_column_stats(
         self,
@@ -596,8 +649,12 @@ class QueryPlanAnalyzer:
 
         Supported predicate patterns:
         - ``p.age > 30`` → range selectivity from column stats
-        - ``p.name = 'Alice'`` → equality selectivity (1/NDV)
+        - ``p.name = 'Alice'`` → equality selectivity (MCV frequency or
+          1/NDV)
+        - ``p.name STARTS WITH 'Al'`` → string-prefix histogram
         - ``p.age > 30 AND p.dept = 'Eng'`` → product of selectivities
+        - ``p.city = 'X' AND p.zip = 'Y'`` → 1/NDV of the column group when
+          it was analyzed together
         - ``p.age > 30 OR p.dept = 'Eng'`` → capped union
         - ``NOT pred`` → 1 - selectivity
         """
@@ -606,9 +663,13 @@ class QueryPlanAnalyzer:
             Comparison,
             Not,
             Or,
+            StringPredicate,
         )
 
         if isinstance(predicate, And):
+            joint = self._joint_equality_selectivity(predicate)
+            if joint is not None:
+                return joint
             # Independence assumption: multiply selectivities
             sel = 1.0
             for op in (predicate.left, predicate.right):
@@ -643,9 +704,87 @@ class QueryPlanAnalyzer:
         if isinstance(predicate, Comparison):
             return self._estimate_comparison_selectivity(predicate)
 
+        if isinstance(predicate, StringPredicate):
+            return self._estimate_string_predicate_selectivity(predicate)
+
         # Unknown predicate type — fall back to default
         return _DEFAULT_FILTER_SELECTIVITY
 
+    def _property_of(
+        self,
+        expr: ASTNode | None,
+    ) -> tuple[str, str, str] | None:
+        """Resolve ``var.prop`` to ``(variable, entity_type, property)``."""
+        from pycypher.ast_models import PropertyLookup, Variable
+
+        if isinstance(expr, PropertyLookup) and isinstance(
+            expr.expression,
+            Variable,
+        ):
+            var_name = expr.expression.name
+            entity_type = self._resolve_variable_entity_type(var_name)
+            if entity_type is not None:
+                return var_name, entity_type, expr.property
+        return None
+
+    def _estimate_string_predicate_selectivity(self, pred: ASTNode) -> float:
+        """Estimate ``STARTS WITH`` from the string-prefix histogram."""
+        from pycypher.ast_models import StringLiteral
+
+        operator = str(getattr(pred, "operator", "")).strip().upper()
+        resolved = self._property_of(getattr(pred, "left", None))
+        right = getattr(pred, "right", None)
+        if (
+            operator != "STARTS WITH"
+            or resolved is None
+            or not isinstance(right, StringLiteral)
+        ):
+            return _DEFAULT_FILTER_SELECTIVITY
+        stats = self._get_column_stats(resolved[1], resolved[2])
+        if stats is None:
+            return _DEFAULT_FILTER_SELECTIVITY
+        return stats.prefix_selectivity(right.value)
+
+    def _joint_equality_selectivity(self, predicate: ASTNode) -> float | None:
+        """Selectivity of ``a.x = 1 AND a.y = 2 …`` from a column-group sketch.
+
+        Applies only when every conjunct is an equality between a property
+        of the same variable and a literal, and that exact set of columns
+        was analyzed as a group (``analyze(column_groups=...)``).  Returns
+        ``None`` otherwise so the caller falls back to independence.
+        """
+        from pycypher.ast_models import Comparison, Literal
+        from pycypher.frame_joiner import _extract_conjuncts
+
+        catalog = getattr(self.context, "statistics", None)
+        if catalog is None:
+            return None
+        columns: set[str] = set()
+        owner: tuple[str, str] | None = None
+        for conj in _extract_conjuncts(predicate):
+            if not isinstance(conj, Comparison) or str(conj.operator) not in (
+                "=",
+                "==",
+            ):
+                return None
+            resolved = self._property_of(conj.left)
+            literal = conj.right
+            if resolved is None:
+                resolved = self._property_of(conj.right)
+                literal = conj.left
+            if resolved is None or not isinstance(literal, Literal):
+                return None
+            if owner is not None and owner != resolved[:2]:
+                return None
+            owner = resolved[:2]
+            columns.add(resolved[2])
+        if owner is None or len(columns) < 2:
+            return None
+        ndv = catalog.distinct_count(owner[1], sorted(columns))
+        if not ndv:
+            return None
+        return 1.0 / max(ndv, 1.0)
+
     def _estimate_comparison_selectivity(self, comp: Comparison) -> float:
         """Estimate selectivity for a single comparison expression."""
         from pycypher.ast_models import (
@@ -695,19 +834,23 @@ class QueryPlanAnalyzer:
             return _DEFAULT_FILTER_SELECTIVITY
 
         if op in ("=", "==", "EQ"):
-            return stats.equality_selectivity()
+            return stats.equality_selectivity(literal_value)
 
         if op in ("<>", "!=", "NEQ"):
-            return 1.0 - stats.equality_selectivity()
+            return 1.0 - stats.equality_selectivity(literal_value)
 
         if op in (">", "GT", ">=", "GTE"):
             if isinstance(literal_value, (int, float)):
                 return stats.range_selectivity(low=literal_value)
+            if isinstance(literal_value, str):
+                return stats.string_range_selectivity(low=literal_value)
             return _DEFAULT_FILTER_SELECTIVITY
 
         if op in ("<", "LT", "<=", "LTE"):
             if isinstance(literal_value, (int, float)):
                 return stats.range_selectivity(high=literal_value)
+            if isinstance(literal_value, str):
+                return stats.string_range_selectivity(high=literal_value)
             return _DEFAULT_FILTER_SELECTIVITY
 
         return _DEFAULT_FILTER_SELECTIVITY
@@ -773,6 +916,14 @@ class QueryPlanAnalyzer:
         for clause in self.query.clauses:
             if isinstance(clause, Match):
                 card, joins, pushdowns = self._analyze_match(clause)
+                multiway = self._plan_multiway_join(clause)
+                if multiway is not None:
+                    result.multiway_join_plans.append(multiway)
+                    card = min(card, max(multiway.estimated_rows, 1))
+                else:
+                    join_order = self._plan_join_order(clause)
+                    if join_order is not None:
+                        result.join_order_plans.append(join_order)
                 current_cardinality = card
                 result.join_plans.extend(joins)
                 result.pushdown_opportunities.extend(pushdowns)
@@ -866,18 +1017,37 @@ class QueryPlanAnalyzer:
                         node_variables.append(element.variable.name)
 
                 elif isinstance(element, RelationshipPattern):
+                    first_hop = not has_relationship
                     has_relationship = True
                     if element.labels:
                         rel_type = element.labels[0]
                         rel_types.append(rel_type)
                         rel_count = self.relationship_row_count(rel_type)
-                        # Cardinality bounded by relationship count
-                        cardinality = min(
-                            cardinality * rel_count
-                            if cardinality > 0
-                            else rel_count,
-                            rel_count,
-                        )
+                        degrees = self._degree_stats(rel_type)
+                        if degrees is not None:
+                            # Analyzed fan-out: expand the frontier by the
+                            # average degree in the traversal direction.
+                            direction = str(element.direction)
+                            frontier = float(cardinality)
+                            if first_hop:
+                                endpoints = degrees.endpoint_count(direction)
+                                frontier = (
+                                    min(frontier, endpoints)
+                                    if entity_types
+                                    else endpoints
+                                )
+                            cardinality = max(
+                                1,
+                                round(frontier * degrees.fanout(direction)),
+                            )
+                        else:
+                            # Cardinality bounded by relationship count
+                            cardinality = min(
+                                cardinality * rel_count
+                                if cardinality > 0
+                                else rel_count,
+                                rel_count,
+                            )
 
         # Generate join plans for relationship hops
         if has_relationship and entity_types and rel_types:
@@ -937,6 +1107,67 @@ class QueryPlanAnalyzer:
 
         return cardinality, joins, pushdowns
 
+    def _plan_multiway_join(self, clause: Match) -> JoinPlan | None:
+        """Plan a worst-case optimal join for a cyclic MATCH pattern.
+
+        Mirrors the routing decision in
+        :meth:`~pycypher.pattern_matcher.PatternMatcher.match_to_binding_frame`:
+        when :func:`~pycypher.generic_join.plan_cyclic_match` accepts the
+        pattern, the executor runs Generic Join instead of pairwise joins.
+        The row estimate is the AGM bound over the relationship table sizes.
+
+        Returns:
+            A :class:`JoinPlan` with :attr:`JoinStrategy.LEAPFROG`, or
+            ``None`` if the pattern is acyclic or otherwise ineligible.
+
+        """
+        from pycypher.generic_join import plan_cyclic_match
+
+        plan = plan_cyclic_match(clause)
+        if plan is None:
+            return None
+        edge_sizes = [
+            self.relationship_row_count(e.rel_type) for e in plan.edges
+        ]
+        bound = plan.agm_bound(edge_sizes)
+        order = plan.variable_order(
+            {
+                var: self.entity_row_count(node.labels[0])
+                for var, node in plan.node_patterns.items()
+                if node.labels
+            },
+        )
+        rel_types = sorted({e.rel_type for e in plan.edges})
+        return JoinPlan(
+            left_name=f"({', '.join(plan.node_vars)})",
+            right_name=", ".join(rel_types),
+            join_key=order,
+            strategy=JoinStrategy.LEAPFROG,
+            estimated_rows=bound,
+            estimated_memory_bytes=sum(edge_sizes) * 3 * 8,
+            notes=(
+                f"Cyclic pattern with {len(plan.edges)} relationships: "
+                f"Generic Join binding {' -> '.join(order)} "
+                f"(AGM bound {bound:,} rows)."
+            ),
+        )
+
+    def _plan_join_order(self, clause: Match) -> JoinOrderPlan | None:
+        """Plan the cost-based join order the executor will use for *clause*.
+
+        Mirrors the routing in
+        :meth:`~pycypher.pattern_matcher.PatternMatcher.match_to_binding_frame`
+        for acyclic multi-hop patterns; see :mod:`pycypher.join_order`.
+        """
+        from pycypher.join_order import plan_join_order
+
+        return plan_join_order(
+            clause,
+            self.context,
+            where=clause.where,
+            feedback_store=self._feedback,
+        )
+
     def _extract_variables(self, expr: ASTNode) -> set[str]:
         """Extract all variable names referenced in an expression.
 
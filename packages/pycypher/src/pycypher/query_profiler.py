@@ -20,11 +20,14 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from shared.logger import LOGGER
 
+if TYPE_CHECKING:
+    from pycypher.cancellation import OperatorProgress, ProgressCallback
+
 # Recommendation thresholds (milliseconds).
 _SLOW_PARSE_MS = 50.0
 _SLOW_PLAN_MS = 20.0
@@ -46,6 +49,9 @@ class ProfileReport:
         hotspot: The clause type that consumed the most time, or ``None``.
         recommendations: List of optimization suggestions based on the profile.
         memory_delta_mb: RSS change during execution (MB).
+        backend_timings: Per-operation timings from an instrumented backend.
+        operator_progress: Units (rows, hops, groups) each long-running
+            operator processed, and its time.
 
     """
 
@@ -59,6 +65,9 @@ class ProfileReport:
     recommendations: list[str]
     memory_delta_mb: float = 0.0
     backend_timings: dict[str, dict[str, float]] = field(default_factory=dict)
+    operator_progress: dict[str, OperatorProgress] = field(
+        default_factory=dict,
+    )
 
     def __str__(self) -> str:
         """Return a human-readable profile report."""
@@ -90,6 +99,17 @@ class ProfileReport:
                 count = int(stats.get("count", 0))
                 total = stats.get("total_ms", 0.0)
                 lines.append(f"  {op}: {total:.1f}ms ({count} calls)")
+        if self.operator_progress:
+            lines.append("Operators:")
+            for op, progress in sorted(
+                self.operator_progress.items(),
+                key=lambda x: x[1].elapsed_seconds,
+                reverse=True,
+            ):
+                lines.append(
+                    f"  {op}: {progress.processed} {progress.unit} "
+                    f"in {progress.elapsed_seconds * 1000.0:.1f}ms",
+                )
         if self.recommendations:
             lines.append("Recommendations:")
             for rec in self.recommendations:
@@ -118,12 +138,15 @@ class QueryProfiler:
         query: str,
         *,
         parameters: dict[str, Any] | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> ProfileReport:
         """Execute and profile a query.
 
         Args:
             query: Cypher query string.
             parameters: Optional named query parameters.
+            on_progress: Optional callback for operator progress while the
+                query runs.
 
         Returns:
             A :class:`ProfileReport` with timing breakdown and recommendations.
@@ -137,8 +160,16 @@ class QueryProfiler:
 
         # Reset per-query state on the star.
         self.star._last_clause_timings = {}
-
-        result = self.star.execute_query(query, parameters=parameters)
+        self.star._last_operator_progress = {}
+
+        if on_progress is None:
+            result = self.star.execute_query(query, parameters=parameters)
+        else:
+            result = self.star.execute_query(
+                query,
+                parameters=parameters,
+                on_progress=on_progress,
+            )
 
         total_ms = (time.perf_counter() - t0) * 1000.0
         rss_after = get_rss_mb()
@@ -159,6 +190,10 @@ class QueryProfiler:
             else 0.0
         )
 
+        operator_progress: dict[str, OperatorProgress] = dict(
+            getattr(self.star, "_last_operator_progress", {}),
+        )
+
         row_count = len(result) if isinstance(result, pd.DataFrame) else 0
 
         # Identify hotspot.
@@ -200,6 +235,7 @@ class QueryProfiler:
             recommendations=recommendations,
             memory_delta_mb=mem_delta,
             backend_timings=backend_timings,
+            operator_progress=operator_progress,
         )
 
         self.history.append(report)
@@ -44,6 +44,17 @@ _AGG_FUNCS: dict[str, str] = {
     "max": "MAX",
 }
 
+#: Cypher approximate aggregate → DuckDB sketch aggregate.  Their second
+#: argument (percentile / k) must be a numeric literal.
+_APPROX_AGG_FUNCS: dict[str, str] = {
+    "approxcountdistinct": "approx_count_distinct",
+    "approxpercentile": "approx_quantile",
+    "approxtopk": "approx_top_k",
+}
+
+#: Default ``k`` for ``approxTopK(expr)``; matches the pandas engine.
+_DEFAULT_TOP_K: int = 10
+
 
 def is_aggregate(expr: Any) -> bool:
     """True if *expr* is an aggregation (``count(*)`` or a supported agg call)."""
@@ -51,9 +62,9 @@ def is_aggregate(expr: Any) -> bool:
 
     if isinstance(expr, CountStar):
         return True
-    return (
-        isinstance(expr, FunctionInvocation)
-        and expr.name.lower() in _AGG_FUNCS
+    return isinstance(expr, FunctionInvocation) and (
+        expr.name.lower() in _AGG_FUNCS
+        or expr.name.lower() in _APPROX_AGG_FUNCS
     )
 
 
@@ -65,8 +76,12 @@ def compile_aggregate(
 ) -> str | None:
     """Compile an aggregation expression to a DuckDB SQL aggregate, or ``None``.
 
-    Supports ``count(*)``, ``count(var)``, and
-    ``count|sum|avg|min|max(<expr>)`` with optional ``DISTINCT``.  The argument
+    Supports ``count(*)``, ``count(var)``,
+    ``count|sum|avg|min|max(<expr>)`` with optional ``DISTINCT``, and the
+    sketch aggregates ``approxCountDistinct(<expr>)``,
+    ``approxPercentile(<expr>, <p>)`` and ``approxTopK(<expr>[, <k>])``
+    (DuckDB ``approx_count_distinct`` / ``approx_quantile`` /
+    ``approx_top_k``) with a literal *p* / *k*.  The argument
     expression is compiled with the same *functions*/*resolve_var* as
     :func:`compile_expression`, so registered UDFs and post-``WITH`` scalar
     variables work inside aggregates.  Returns ``None`` for anything else, so
@@ -78,14 +93,22 @@ def compile_aggregate(
         return "COUNT(*)"
     if not isinstance(expr, FunctionInvocation):
         return None
-    func = _AGG_FUNCS.get(expr.name.lower())
-    if func is None:
-        return None
     args = (
         expr.arguments.get("arguments", [])
         if isinstance(expr.arguments, dict)
         else []
     )
+    if expr.name.lower() in _APPROX_AGG_FUNCS:
+        return _compile_approx_aggregate(
+            expr,
+            args,
+            resolve,
+            functions,
+            resolve_var,
+        )
+    func = _AGG_FUNCS.get(expr.name.lower())
+    if func is None:
+        return None
     if len(args) != 1:
         return None
     distinct = bool(getattr(expr, "distinct", False))
@@ -104,6 +127,42 @@ def compile_aggregate(
     return f"{func}({distinct_kw}{inner})"
 
 
+def _compile_approx_aggregate(
+    expr: Any,
+    args: list[Any],
+    resolve: Any,
+    functions: frozenset[str] | set[str] | None,
+    resolve_var: Any,
+) -> str | None:
+    """Compile an ``approx*`` aggregate, or ``None`` if it cannot be."""
+    from pycypher.ast_models import FloatLiteral, IntegerLiteral
+
+    name = expr.name.lower()
+    if getattr(expr, "distinct", False) or not args:
+        return None
+    inner = compile_expression(args[0], resolve, functions, resolve_var)
+    if inner is None:
+        return None
+    func = _APPROX_AGG_FUNCS[name]
+    if name == "approxcountdistinct":
+        return f"{func}({inner})" if len(args) == 1 else None
+    if name == "approxtopk" and len(args) == 1:
+        return f"{func}({inner}, {_DEFAULT_TOP_K})"
+    if len(args) != 2:
+        return None
+    option = args[1]
+    if name == "approxtopk":
+        if not isinstance(option, IntegerLiteral) or int(option.value) < 1:
+            return None
+        return f"{func}({inner}, {int(option.value)})"
+    if not isinstance(option, (IntegerLiteral, FloatLiteral)):
+        return None
+    percentile = float(option.value)
+    if not 0.0 <= percentile <= 1.0:
+        return None
+    return f"{func}({inner}, {percentile!r})"
+
+
 def compile_expression(
     expr: Any,
     resolve: Any,
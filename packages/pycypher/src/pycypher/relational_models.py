@@ -59,6 +59,8 @@ if TYPE_CHECKING:
     import pandas as pd
     import pyarrow as pa
 
+    from pycypher.cancellation import CancellationToken, ProgressReporter
+
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from shared.logger import LOGGER
 
@@ -162,6 +164,10 @@ class ProcedureRegistry:
     * ``db.propertyKeys()`` — one row per unique user-visible property key
       across all entity and relationship tables.
 
+    ``spatial.pointInPolygon(pointLabel, xProp, yProp, polygonLabel)``
+    is registered alongside them; see
+    :func:`pycypher.spatial.point_in_polygon_procedure`.
+
     Custom procedures can be registered with :meth:`register`.
 
     Example::
@@ -179,7 +185,7 @@ class ProcedureRegistry:
         self._register_builtins()
 
     def _register_builtins(self) -> None:
-        """Register all built-in db.* procedures."""
+        """Register all built-in db.* and spatial.* procedures."""
 
         def _db_labels(context: Context, args: list[Any]) -> list[dict]:
             """Return one row per entity type label in the context."""
@@ -225,6 +231,17 @@ class ProcedureRegistry:
         self._procedures["db.relationshiptypes"] = _db_relationship_types
         self._procedures["db.propertykeys"] = _db_property_keys
 
+        def _spatial_point_in_polygon(
+            context: Context,
+            args: list[Any],
+        ) -> list[dict]:
+            """Return one row per (point, containing polygon) ID pair."""
+            from pycypher.spatial import point_in_polygon_procedure
+
+            return point_in_polygon_procedure(context, args)
+
+        self._procedures["spatial.pointinpolygon"] = _spatial_point_in_polygon
+
     def register(self, name: str) -> Callable:
         """Decorator to register a procedure under *name*.
 
@@ -309,8 +326,11 @@ class Context(BaseModel):
     #: Property-lookup index cache: maps entity_type → ``source_df.set_index(ID_COLUMN)``.
     #: Populated lazily by ``BindingFrame.get_property()`` and cleared by
     #: ``commit_query()`` so mutations see fresh data.  The shadow path in
-    #: ``get_property`` bypasses this cache entirely.
-    _property_lookup_cache: dict[str, pd.DataFrame] = PrivateAttr(
+    #: ``get_property`` bypasses this cache entirely.  Arrow-backed entries
+    #: are filled one column at a time by
+    #: :func:`~pycypher.dataframe_utils.indexed_source_frame`, which keeps its
+    #: bookkeeping under tuple keys in the same dict.
+    _property_lookup_cache: dict[Any, Any] = PrivateAttr(
         default_factory=dict,
     )
     #: The DataFrame computation backend.  Resolved lazily from the *backend*
@@ -324,6 +344,10 @@ class Context(BaseModel):
     #: Graph-native index manager for O(degree) neighbor lookups and
     #: O(1) property equality lookups.  Created lazily on first access.
     _index_manager: Any = PrivateAttr(default=None)
+    #: ANALYZE statistics catalog (see ``pycypher.statistics_catalog``).
+    #: Created lazily on first access; mutated tables are marked stale by
+    #: ``commit_query()``.
+    _statistics: Any = PrivateAttr(default=None)
     #: Subquery executor (see ``pycypher.subquery_protocol.SubqueryExecutor``).
     #: Registered once by ``Star.__init__`` (the composition root); read by
     #: ``ExistsEvaluator`` to run EXISTS subqueries without importing ``Star``.
@@ -497,6 +521,20 @@ class Context(BaseModel):
             self._index_manager.eager_build_vectorized_stores()
         return self._index_manager
 
+    @property
+    def statistics(self) -> Any:
+        """Return the :class:`~pycypher.statistics_catalog.StatisticsCatalog`.
+
+        Created lazily on first access.  Call ``context.statistics.analyze()``
+        to profile tables in full; planners fall back to sampled statistics
+        for tables that were never analyzed.
+        """
+        if self._statistics is None:
+            from pycypher.statistics_catalog import StatisticsCatalog
+
+            self._statistics = StatisticsCatalog(self)
+        return self._statistics
+
     def __repr__(self) -> str:
         """Return an informative summary for REPL/notebook display.
 
@@ -550,32 +588,60 @@ class Context(BaseModel):
             scope.query_timeout_seconds = None
             scope.query_deadline = None
 
+    def set_cancellation(
+        self,
+        token: CancellationToken | None,
+        reporter: ProgressReporter | None = None,
+    ) -> None:
+        """Attach a cancellation token and progress reporter to this query.
+
+        Both live on the active execution scope and are discarded with it.
+
+        Args:
+            token: Checked by :meth:`check_timeout`; ``None`` for none.
+            reporter: Receives operator progress; ``None`` for none.
+
+        """
+        scope = execution_scope.current_scope(self._scope_var)
+        scope.cancel_token = token
+        scope.progress = reporter
+
+    @property
+    def progress_reporter(self) -> ProgressReporter | None:
+        """Return the active query's progress reporter, if any."""
+        return execution_scope.current_scope(self._scope_var).progress
+
     def check_timeout(self, query_fragment: str = "") -> None:
-        """Raise :class:`~pycypher.exceptions.QueryTimeoutError` if the deadline has passed.
+        """Raise if the query was cancelled or its deadline has passed.
 
-        This is intentionally cheap — a single ``perf_counter()`` comparison —
-        so it can be called at the top of every clause iteration without
-        measurable overhead.
+        This is intentionally cheap — a flag test and a single
+        ``perf_counter()`` comparison — so it can be called at the top of
+        every clause iteration and between the chunks of long operators
+        without measurable overhead.
 
         Args:
             query_fragment: Optional truncated query text for the error message.
 
         Raises:
+            QueryCancelledError: If the query's cancellation token was set.
             QueryTimeoutError: If the wall-clock deadline has been exceeded.
 
         """
         import time
 
-        if self._query_deadline is None:
+        scope = execution_scope.current_scope(self._scope_var)
+        if scope.cancel_token is not None:
+            scope.cancel_token.raise_if_cancelled(query_fragment)
+        if scope.query_deadline is None:
             return
-        elapsed = time.perf_counter() - (
-            self._query_deadline - (self._query_timeout_seconds or 0)
-        )
-        if time.perf_counter() > self._query_deadline:
+        now = time.perf_counter()
+        if now > scope.query_deadline:
             from pycypher.exceptions import QueryTimeoutError
 
+            timeout = scope.query_timeout_seconds or 0.0
+            elapsed = now - (scope.query_deadline - timeout)
             raise QueryTimeoutError(
-                timeout_seconds=self._query_timeout_seconds or 0.0,
+                timeout_seconds=timeout,
                 elapsed_seconds=elapsed,
                 query_fragment=query_fragment,
             )
@@ -606,6 +672,7 @@ class Context(BaseModel):
         scope = execution_scope.current_scope(self._scope_var)
         # Capture mutation flag BEFORE clearing shadows.
         had_mutations: bool = bool(scope.shadow or scope.shadow_rels)
+        mutated_tables: list[str] = [*scope.shadow, *scope.shadow_rels]
 
         try:
             for entity_type, shadow_df in scope.shadow.items():
@@ -656,6 +723,8 @@ class Context(BaseModel):
         if had_mutations:
             self._property_lookup_cache = {}
             self._data_epoch += 1
+            if self._statistics is not None:
+                self._statistics.invalidate(mutated_tables)
 
     def rollback_query(self) -> None:
         """Discard all shadow writes — leaves the context unmodified."""
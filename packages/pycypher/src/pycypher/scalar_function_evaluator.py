@@ -297,27 +297,23 @@ class ScalarFunctionEvaluator:
             var_name = arg_expressions[0].name
             entity_type = self.frame.type_registry.get(var_name)
             if entity_type is not None:
-                from pycypher.dataframe_utils import (
-                    source_to_pandas as _source_to_pandas,
-                )
+                from pycypher.dataframe_utils import source_column_names
 
                 ctx = self.frame.context
                 try:
                     if entity_type in ctx.entity_mapping.mapping:
-                        raw_df = _source_to_pandas(
+                        columns = source_column_names(
                             ctx.entity_mapping[entity_type].source_obj,
                         )
                     elif entity_type in ctx.relationship_mapping.mapping:
-                        raw_df = _source_to_pandas(
+                        columns = source_column_names(
                             ctx.relationship_mapping[entity_type].source_obj,
                         )
                     else:
                         n = len(self.frame)
                         return _broadcast_series([], n)
                     prop_keys = [
-                        c
-                        for c in raw_df.columns
-                        if c not in _GRAPH_INTERNAL_COLS
+                        c for c in columns if c not in _GRAPH_INTERNAL_COLS
                     ]
                     n = len(self.frame)
                     return _broadcast_series(prop_keys, n)
@@ -445,7 +441,7 @@ class ScalarFunctionEvaluator:
                     RELATIONSHIP_SOURCE_COLUMN as _SRC_COL,
                 )
                 from pycypher.dataframe_utils import (
-                    source_to_pandas as _source_to_pandas,
+                    source_columns_to_pandas,
                 )
                 from pycypher.relational_models import (
                     RELATIONSHIP_TARGET_COLUMN as _TGT_COL,
@@ -453,12 +449,13 @@ class ScalarFunctionEvaluator:
 
                 ctx = self.frame.context
                 try:
-                    raw_df = _source_to_pandas(
-                        ctx.relationship_mapping[rel_type].source_obj,
-                    )
                     endpoint_col = (
                         _SRC_COL if name_lower == "startnode" else _TGT_COL
                     )
+                    raw_df = source_columns_to_pandas(
+                        ctx.relationship_mapping[rel_type].source_obj,
+                        [_ID_COL, endpoint_col],
+                    )
                     lookup: pd.Series = raw_df.set_index(_ID_COL)[endpoint_col]
                     id_series = self.frame.bindings[var_name]
                     return id_series.map(lookup).reset_index(drop=True)
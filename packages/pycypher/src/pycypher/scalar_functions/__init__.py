@@ -19,6 +19,9 @@ Vectorisation strategy by category
   pandas ``.str`` accessor.
 - **Type conversion** (toInteger, toFloat): ``pd.to_numeric`` + numpy
   ``np.fix``; no per-row Python.
+- **Spatial** (point, distance, point.withinPolygon): point maps are
+  unpacked into float arrays once, distances are numpy haversine, and each
+  distinct WKB polygon is parsed and prepared once per call (GEOS).
 - All remaining categories use ``pd.Series.apply()`` because their logic is
   inherently element-wise (e.g. list operations, temporal parsing, encoding).
   ``round()`` uses Python's ``decimal`` module (no numpy equivalent).  It
@@ -48,6 +51,8 @@ This module provides:
   * **Temporal (parse)**: date, datetime, localdatetime, duration
   * **Temporal (truncate)**: date.truncate, datetime.truncate, localdatetime.truncate
   * **Temporal (now)**: timestamp, localtime, localdate
+  * **Spatial**: point, distance, point.distance, point.withinPolygon,
+    point.withinBBox
   * **Type introspection**: valueType
   * **Type predicates**: isString, isInteger, isFloat, isBoolean, isList, isMap
   * **Hash & encoding**: md5, sha1, sha256, encodeBase64, decodeBase64
@@ -88,6 +93,7 @@ from pycypher.scalar_functions import (
     extended_string_functions,
     list_functions,
     math_functions,
+    spatial_functions,
     temporal_functions,
     utility_functions,
 )
@@ -433,6 +439,7 @@ class ScalarFunctionRegistry:
         - Map functions (keys, values, properties)
         - Hash & encoding functions (md5, sha1, sha256, encodeBase64, decodeBase64)
         - Utility functions (coalesce)
+        - Spatial functions (point, distance, point.withinPolygon)
         """
         self._register_string_functions()
         extended_string_functions.register(self)
@@ -445,6 +452,7 @@ class ScalarFunctionRegistry:
         utility_functions.register(self)
         self._register_hash_encoding_functions()
         temporal_functions.register(self)
+        spatial_functions.register(self)
         self._register_function_aliases()
         self._builtin_names = frozenset(self._functions.keys())
 
@@ -0,0 +1,144 @@
+"""Category registration module for scalar functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from pycypher.spatial import (
+    haversine_m,
+    make_points,
+    point_coordinates,
+    points_in_polygons,
+)
+
+if TYPE_CHECKING:
+    from pycypher.scalar_functions import ScalarFunctionRegistry
+
+
+def register(registry: ScalarFunctionRegistry) -> None:
+    """Register spatial functions.
+
+    Cypher usage::
+
+        MATCH (n:OsmNode)
+        RETURN point({longitude: n.longitude, latitude: n.latitude}) AS p
+        MATCH (a:Store), (b:Store)
+        RETURN distance(a.location, b.location) AS metres
+        MATCH (n:OsmNode), (t:CensusTract {GEOID: '13121001100'})
+        WHERE point.withinPolygon(
+            point({longitude: n.longitude, latitude: n.latitude}),
+            t.geometry)
+        RETURN n
+
+    Polygons are WKB-encoded geometry properties.  Each function works on
+    whole columns: points are unpacked into float arrays once and every
+    distinct polygon is parsed once per call.  To join a large point set
+    against a polygon set, use ``CALL spatial.pointInPolygon(...)`` — it
+    probes an STR-tree instead of testing every pair.
+
+    Null handling: null or malformed points and polygons produce null.
+    """
+
+    def _point(s: pd.Series) -> pd.Series:
+        x, y, geographic = point_coordinates(s)
+        return make_points(x, y, geographic)
+
+    # point(map) -> point  ({longitude, latitude} or {x, y}; vectorised)
+    registry.register_function(
+        name="point",
+        callable=_point,
+        min_args=1,
+        max_args=1,
+        description=(
+            "Create a WGS-84 point from {longitude, latitude} or a "
+            "cartesian point from {x, y}"
+        ),
+        example="point({longitude: -84.39, latitude: 33.75})",
+    )
+
+    def _distance(a: pd.Series, b: pd.Series) -> pd.Series:
+        ax, ay, a_geo = point_coordinates(a)
+        bx, by, b_geo = point_coordinates(b)
+        with np.errstate(invalid="ignore"):
+            result = np.where(
+                a_geo,
+                haversine_m(ax, ay, bx, by),
+                np.hypot(ax - bx, ay - by),
+            )
+        out = pd.Series(result, dtype=object)
+        # Points in different coordinate systems have no distance.
+        out[np.isnan(result) | (a_geo != b_geo)] = None
+        return out
+
+    # distance(p1, p2) -> float  (metres for WGS-84, units for cartesian)
+    for name in ("distance", "point.distance"):
+        registry.register_function(
+            name=name,
+            callable=_distance,
+            min_args=2,
+            max_args=2,
+            description=(
+                "Distance between two points: great-circle metres for "
+                "WGS-84, Euclidean for cartesian"
+            ),
+            example=f"{name}(a.location, b.location) → 1523.4",
+        )
+
+    def _within_polygon(p: pd.Series, polygon: pd.Series) -> pd.Series:
+        x, y, _ = point_coordinates(p)
+        inside, valid = points_in_polygons(x, y, polygon)
+        out = pd.Series(inside, dtype=object)
+        out[~valid] = None
+        return out
+
+    # point.withinPolygon(p, wkb) -> bool  (boundary counts as inside)
+    registry.register_function(
+        name="point.withinPolygon",
+        callable=_within_polygon,
+        min_args=2,
+        max_args=2,
+        description=(
+            "True if the point lies inside (or on the boundary of) a "
+            "WKB polygon"
+        ),
+        example="point.withinPolygon(n.location, t.geometry) → true",
+    )
+
+    def _within_bbox(
+        p: pd.Series,
+        lower_left: pd.Series,
+        upper_right: pd.Series,
+    ) -> pd.Series:
+        x, y, geo = point_coordinates(p)
+        x0, y0, geo0 = point_coordinates(lower_left)
+        x1, y1, geo1 = point_coordinates(upper_right)
+        with np.errstate(invalid="ignore"):
+            inside_y = (y >= y0) & (y <= y1)
+            # A geographic box whose west edge is east of its east edge
+            # crosses the antimeridian.
+            wraps = geo & (x0 > x1)
+            inside_x = np.where(
+                wraps,
+                (x >= x0) | (x <= x1),
+                (x >= x0) & (x <= x1),
+            )
+        out = pd.Series(inside_x & inside_y, dtype=object)
+        missing = np.isnan(x) | np.isnan(x0) | np.isnan(x1)
+        out[missing | (geo != geo0) | (geo != geo1)] = None
+        return out
+
+    # point.withinBBox(p, lowerLeft, upperRight) -> bool
+    registry.register_function(
+        name="point.withinBBox",
+        callable=_within_bbox,
+        min_args=3,
+        max_args=3,
+        description="True if the point lies inside the bounding box",
+        example=(
+            "point.withinBBox(n.location, point({x: 0, y: 0}), "
+            "point({x: 10, y: 10})) → true"
+        ),
+    )
@@ -15,15 +15,46 @@ which is slow for large frames.  The built-in registry uses vectorised
 numpy/pandas operations (see ``scalar_functions/__init__.py``).  This module
 exists because user code is much easier to write in scalar form, and
 correctness is more valuable than per-row throughput for a first cut.
+
+Three registration modes trade that simplicity for speed:
+
+``mode="row"`` (default)
+    The row-wise wrapper described above.
+
+``mode="dedup"``
+    Still a scalar function, but evaluated once per *distinct* input tuple
+    in each call; results are scattered back to every row that shares the
+    input and kept in a bounded LRU memo, so repeated values (state codes,
+    category labels, addresses seen in an earlier batch) are never
+    recomputed.  The function must be pure.
+
+``mode="vectorized"``
+    The function receives one NumPy array (or, with ``arrays="arrow"``, one
+    ``pyarrow.Array``) per argument, holding the non-null rows, and returns
+    an array of the same length.
+
+``row`` and ``dedup`` functions can additionally be spread over a process
+pool with ``processes=N``; the rows still to be evaluated are split into
+chunks of ``chunk_size`` and shipped to worker processes, which pays off
+for CPU-bound pure-Python code.  The function must then be picklable
+(defined at module top level).  Pools are started on first use and shared
+by every function with the same worker count.
 """
 
 from __future__ import annotations
 
 import functools
 import inspect
+import itertools
 import math
-from typing import TYPE_CHECKING, Any
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 import pandas as pd
 from shared.logger import LOGGER
 
@@ -37,6 +68,20 @@ if TYPE_CHECKING:
 # rows, individual failures are suppressed but still counted in the summary.
 _MAX_PER_ROW_LOG_LINES: int = 3
 
+#: Default number of distinct input tuples remembered by a ``dedup`` function.
+DEFAULT_MEMO_SIZE: int = 65_536
+
+#: Default number of rows shipped to a worker process per task.
+DEFAULT_CHUNK_SIZE: int = 10_000
+
+UserFunctionMode = Literal["row", "dedup", "vectorized"]
+
+_MISSING = object()
+
+#: Worker pools shared by every user function, keyed by worker count.
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
 
 def _is_null(v: Any) -> bool:
     """Return True for Python None or float NaN."""
@@ -82,15 +127,164 @@ def _description(func: Callable[..., Any]) -> str:
     return ""
 
 
+def _require_arguments(
+    func: Callable[..., Any],
+    series_args: tuple[pd.Series, ...],
+) -> None:
+    """Raise ``TypeError`` when a wrapped function is called with no Series."""
+    if not series_args:
+        msg = (
+            f"Wrapped function {func.__name__!r} was called with no "
+            "arguments; user-defined Cypher functions must take at "
+            "least one argument."
+        )
+        raise TypeError(msg)
+
+
+def _apply_rows(
+    func: Callable[..., Any],
+    rows: list[tuple[Any, ...]],
+) -> tuple[list[Any], list[tuple[int, BaseException]]]:
+    """Call ``func(*row)`` for every row; failing rows yield ``None``.
+
+    Returns the output values and ``(offset, exception)`` for each failure.
+    """
+    values: list[Any] = []
+    failures: list[tuple[int, BaseException]] = []
+    for offset, row in enumerate(rows):
+        try:
+            values.append(func(*row))
+        except Exception as exc:  # noqa: BLE001 — log+null-fallback per row
+            failures.append((offset, exc))
+            values.append(None)
+    return values, failures
+
+
+def _apply_rows_in_worker(
+    func: Callable[..., Any],
+    rows: list[tuple[Any, ...]],
+) -> tuple[list[Any], list[tuple[int, str, str]]]:
+    """Process-pool task: like :func:`_apply_rows` with picklable failures."""
+    values, failures = _apply_rows(func, rows)
+    return values, [
+        (offset, type(exc).__name__, str(exc)) for offset, exc in failures
+    ]
+
+
+def _worker_pool(processes: int) -> ProcessPoolExecutor:
+    """Return the shared pool of *processes* workers, starting it if needed."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(processes)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=processes)
+            _POOLS[processes] = pool
+        return pool
+
+
+def _discard_worker_pool(processes: int, pool: ProcessPoolExecutor) -> None:
+    """Forget a broken *pool* so the next call starts a fresh one."""
+    with _POOLS_LOCK:
+        if _POOLS.get(processes) is pool:
+            del _POOLS[processes]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _evaluate_rows(
+    func: Callable[..., Any],
+    rows: list[tuple[Any, ...]],
+    *,
+    processes: int | None,
+    chunk_size: int,
+) -> tuple[list[Any], list[tuple[int, str, str, BaseException | None]]]:
+    """Evaluate *rows*, in worker processes when there is enough work.
+
+    Returns the output values and, per failed row,
+    ``(offset, exception type name, message, exception or None)`` — the
+    exception object itself only survives for in-process evaluation.
+    """
+    if not processes or len(rows) < 2 * chunk_size:
+        values, failures = _apply_rows(func, rows)
+        return values, [
+            (offset, type(exc).__name__, str(exc), exc)
+            for offset, exc in failures
+        ]
+    starts = range(0, len(rows), chunk_size)
+    values: list[Any] = []
+    remote: list[tuple[int, str, str, BaseException | None]] = []
+    pool = _worker_pool(processes)
+    try:
+        chunks = pool.map(
+            _apply_rows_in_worker,
+            itertools.repeat(func),
+            (rows[start : start + chunk_size] for start in starts),
+        )
+        for start, (chunk_values, chunk_failures) in zip(
+            starts,
+            chunks,
+            strict=True,
+        ):
+            values.extend(chunk_values)
+            remote.extend(
+                (start + offset, exc_type, message, None)
+                for offset, exc_type, message in chunk_failures
+            )
+    except BrokenProcessPool:
+        _discard_worker_pool(processes, pool)
+        raise
+    return values, remote
+
+
+def _log_failures(
+    func: Callable[..., Any],
+    failures: list[tuple[int, tuple[Any, ...], str, str, Any]],
+    n_failed_rows: int,
+    n_rows: int,
+) -> None:
+    """Log per-row failures (capped) and the summary count.
+
+    Each failure is ``(row, inputs, exception type, message, exc_info)``.
+    """
+    for i, (row, inputs, exc_type, message, exc_info) in enumerate(failures):
+        if i < _MAX_PER_ROW_LOG_LINES:
+            LOGGER.warning(
+                "user function %s failed on row %d (inputs=%r): %s: %s",
+                func.__name__,
+                row,
+                list(inputs),
+                exc_type,
+                message,
+                exc_info=exc_info,
+            )
+        else:
+            LOGGER.warning(
+                "user function %s: further per-row failures will be "
+                "suppressed; a summary count will be logged at the end",
+                func.__name__,
+            )
+            break
+    if n_failed_rows:
+        LOGGER.warning(
+            "user function %s: %d / %d row(s) raised an exception "
+            "and were replaced with null in the output.",
+            func.__name__,
+            n_failed_rows,
+            n_rows,
+        )
+
+
 def _wrap_row_wise(
     func: Callable[..., Any],
+    *,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
 ) -> Callable[..., pd.Series]:
     """Wrap a scalar Python function as a ``pd.Series → pd.Series`` callable.
 
     The wrapper:
     - Iterates the input Series in lockstep.
     - Returns ``None`` for any row where any input value is null.
-    - Calls ``func(*row_values)`` for non-null rows.
+    - Calls ``func(*row_values)`` for non-null rows, in chunks across
+      *processes* worker processes when given.
     - Builds the result as ``pd.Series(values, index=first_arg.index)``.
 
     Error handling: if ``func`` raises on a particular row, the wrapper logs
@@ -107,53 +301,279 @@ def _wrap_row_wise(
 
     @functools.wraps(func)
     def wrapped(*series_args: pd.Series) -> pd.Series:
-        if not series_args:
-            msg = (
-                f"Wrapped function {func.__name__!r} was called with no "
-                "arguments; user-defined Cypher functions must take at "
-                "least one argument."
-            )
-            raise TypeError(msg)
+        _require_arguments(func, series_args)
         n = len(series_args[0])
         index = series_args[0].index
-        out: list[Any] = []
-        n_failures = 0
+        positions: list[int] = []
+        rows: list[tuple[Any, ...]] = []
         for i in range(n):
-            row = [s.iat[i] for s in series_args]
-            if any(_is_null(v) for v in row):
-                out.append(None)
-                continue
-            try:
-                out.append(func(*row))
-            except Exception as exc:  # noqa: BLE001 — log+null-fallback per row
-                n_failures += 1
-                if n_failures <= _MAX_PER_ROW_LOG_LINES:
-                    LOGGER.warning(
-                        "user function %s failed on row %d (inputs=%r): %s: %s",
-                        func.__name__,
-                        i,
-                        row,
-                        type(exc).__name__,
+            row = tuple(s.iat[i] for s in series_args)
+            if not any(_is_null(v) for v in row):
+                positions.append(i)
+                rows.append(row)
+        values, failures = _evaluate_rows(
+            func,
+            rows,
+            processes=processes,
+            chunk_size=chunk_size,
+        )
+        out: list[Any] = [None] * n
+        for i, value in zip(positions, values, strict=True):
+            out[i] = value
+        _log_failures(
+            func,
+            [
+                (positions[offset], rows[offset], exc_type, message, exc)
+                for offset, exc_type, message, exc in failures
+            ],
+            len(failures),
+            n,
+        )
+        return pd.Series(out, index=index)
+
+    return wrapped
+
+
+def _typed(key: tuple[Any, ...]) -> tuple[tuple[type, Any], ...]:
+    """Tag each value of *key* with its type, so ``1``, ``1.0`` and
+    ``True`` — equal and equal-hashing in Python — stay distinct.
+    """
+    return tuple((type(v), v) for v in key)
+
+
+class _ResultMemo:
+    """Bounded LRU map from input tuples to a function's results.
+
+    Keys are compared by type as well as value (see :func:`_typed`).
+    Thread-safe; ``hits``/``misses`` count lookups for diagnostics.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = max(0, maxsize)
+        self._entries: OrderedDict[tuple[tuple[type, Any], ...], Any] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[Any, ...]) -> Any:
+        """Return the memoized result for *key*, or ``_MISSING``."""
+        key = _typed(key)
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: tuple[Any, ...], value: Any) -> None:
+        """Remember *value* for *key*, evicting the least recently used."""
+        if not self.maxsize:
+            return
+        key = _typed(key)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every memoized result."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _distinct_rows(
+    series_args: tuple[pd.Series, ...],
+) -> tuple[list[tuple[Any, ...]], np.ndarray, np.ndarray] | None:
+    """Factorize the argument Series into distinct non-null input tuples.
+
+    Returns ``(keys, inverse, valid)``: *keys* holds each distinct tuple,
+    *valid* masks rows with no null argument and ``keys[inverse[k]]`` is the
+    tuple of the *k*-th valid row.  Values of different types never share a
+    key, even when they compare equal (``1``, ``1.0``, ``True``).  Returns
+    ``None`` when an argument holds unhashable values (lists, maps).
+    """
+    codes: list[np.ndarray] = []
+    uniques: list[np.ndarray] = []
+    for s in series_args:
+        # Only object columns can mix types; factorize those on
+        # (type, value) pairs and unwrap the values afterwards.
+        tagged = s.dtype == object
+        if tagged:
+            s = s.map(lambda v: (type(v), v), na_action="ignore")
+        try:
+            arg_codes, arg_uniques = pd.factorize(s, use_na_sentinel=True)
+        except TypeError:
+            return None
+        if tagged:
+            values = np.empty(len(arg_uniques), dtype=object)
+            for i, (_type, value) in enumerate(arg_uniques):
+                values[i] = value
+        else:
+            values = np.asarray(arg_uniques, dtype=object)
+        codes.append(arg_codes)
+        uniques.append(values)
+    if len(codes) == 1:
+        valid = codes[0] >= 0
+        keys = [(u,) for u in uniques[0]]
+        return keys, codes[0][valid], valid
+    stacked = np.column_stack(codes)
+    valid = (stacked >= 0).all(axis=1)
+    distinct, inverse = np.unique(
+        stacked[valid],
+        axis=0,
+        return_inverse=True,
+    )
+    keys = [
+        tuple(u[c] for u, c in zip(uniques, row, strict=True))
+        for row in distinct
+    ]
+    return keys, inverse.reshape(-1), valid
+
+
+def _wrap_deduplicated(
+    func: Callable[..., Any],
+    *,
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Callable[..., pd.Series]:
+    """Wrap a pure scalar function to run once per distinct input tuple.
+
+    Inputs are factorized, each distinct non-null tuple not already in the
+    LRU memo (exposed as ``wrapped.memo``) is evaluated — in worker
+    processes when *processes* is given — and the results are scattered
+    back to every row.  Null handling and per-row error reporting match
+    :func:`_wrap_row_wise`; failed inputs are not memoized.  Arguments that
+    hold unhashable values fall back to row-wise evaluation.
+    """
+    memo = _ResultMemo(memo_size)
+    row_wise = _wrap_row_wise(
+        func,
+        processes=processes,
+        chunk_size=chunk_size,
+    )
+
+    @functools.wraps(func)
+    def wrapped(*series_args: pd.Series) -> pd.Series:
+        _require_arguments(func, series_args)
+        distinct = _distinct_rows(series_args)
+        if distinct is None:
+            return row_wise(*series_args)
+        keys, inverse, valid = distinct
+        n = len(series_args[0])
+
+        results = np.empty(len(keys), dtype=object)
+        pending: list[int] = []
+        for j, key in enumerate(keys):
+            value = memo.get(key)
+            if value is _MISSING:
+                pending.append(j)
+            else:
+                results[j] = value
+        values, failures = _evaluate_rows(
+            func,
+            [keys[j] for j in pending],
+            processes=processes,
+            chunk_size=chunk_size,
+        )
+        failed = {offset for offset, *_ in failures}
+        for offset, (j, value) in enumerate(zip(pending, values, strict=True)):
+            results[j] = value
+            if offset not in failed:
+                memo.put(keys[j], value)
+
+        out = np.empty(n, dtype=object)
+        out[:] = None
+        out[valid] = results[inverse]
+        if failures:
+            rows = np.flatnonzero(valid)
+            counts = np.bincount(inverse, minlength=len(keys))
+            _log_failures(
+                func,
+                [
+                    (
+                        int(rows[np.argmax(inverse == pending[offset])]),
+                        keys[pending[offset]],
+                        exc_type,
+                        message,
                         exc,
-                        exc_info=True,
-                    )
-                elif n_failures == _MAX_PER_ROW_LOG_LINES + 1:
-                    LOGGER.warning(
-                        "user function %s: further per-row failures will be "
-                        "suppressed; a summary count will be logged at the end",
-                        func.__name__,
                     )
-                out.append(None)
-        if n_failures:
-            LOGGER.warning(
-                "user function %s: %d / %d row(s) raised an exception "
-                "and were replaced with null in the output.",
-                func.__name__,
-                n_failures,
+                    for offset, exc_type, message, exc in failures[
+                        : _MAX_PER_ROW_LOG_LINES + 1
+                    ]
+                ],
+                int(sum(counts[pending[offset]] for offset in failed)),
                 n,
             )
-        return pd.Series(out, index=index)
+        return pd.Series(out.tolist(), index=series_args[0].index)
+
+    wrapped.memo = memo  # type: ignore[attr-defined]
+    return wrapped
+
+
+def _to_batch(s: pd.Series, arrays: Literal["numpy", "arrow"]) -> Any:
+    """Convert one argument Series to the array type a vectorized UDF takes."""
+    if arrays == "arrow":
+        import pyarrow as pa
+
+        return pa.array(s, from_pandas=True)
+    return s.to_numpy()
+
+
+def _wrap_vectorized(
+    func: Callable[..., Any],
+    *,
+    arrays: Literal["numpy", "arrow"] = "numpy",
+) -> Callable[..., pd.Series]:
+    """Wrap an array-in, array-out function as a ``pd.Series`` callable.
 
+    Rows where any argument is null are removed before the call and get
+    ``None`` in the output.  *func* receives one array per argument and
+    must return an array-like (NumPy, Arrow, pandas or list) of the same
+    length; exceptions propagate to the query.
+    """
+
+    def wrapped(*series_args: pd.Series) -> pd.Series:
+        _require_arguments(func, series_args)
+        index = series_args[0].index
+        null = np.zeros(len(index), dtype=bool)
+        for s in series_args:
+            null |= s.isna().to_numpy()
+        batch = [
+            _to_batch(s[~null] if null.any() else s, arrays)
+            for s in series_args
+        ]
+        result = func(*batch)
+        if hasattr(result, "to_numpy") and not isinstance(result, pd.Series):
+            # pyarrow.Array / ChunkedArray
+            result = result.to_numpy(zero_copy_only=False)
+        values = np.asarray(result)
+        n_valid = int((~null).sum())
+        if values.shape != (n_valid,):
+            msg = (
+                f"vectorized user function {func.__name__!r} returned "
+                f"{values.shape} values for {n_valid} input row(s)"
+            )
+            raise ValueError(msg)
+        if not null.any():
+            return pd.Series(values, index=index)
+        out = np.empty(len(index), dtype=object)
+        out[:] = None
+        out[~null] = values
+        return pd.Series(out.tolist(), index=index)
+
+    # Deliberately no functools.wraps: the DuckDB bridge treats
+    # ``__wrapped__`` as a per-row scalar callable, which this is not.
+    wrapped.__name__ = func.__name__
+    wrapped.__doc__ = func.__doc__
     return wrapped
 
 
@@ -161,22 +581,36 @@ def register_user_function(
     func: Callable[..., Any],
     *,
     name: str | None = None,
+    mode: UserFunctionMode = "row",
+    memo_size: int = DEFAULT_MEMO_SIZE,
+    processes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    arrays: Literal["numpy", "arrow"] = "numpy",
 ) -> None:
     """Register *func* as a Cypher scalar function.
 
     The user writes a plain Python scalar function — ``def f(x, y): ...`` —
     and this helper takes care of wrapping it row-wise, null-propagating,
     inferring arity from the signature, and pulling a description from the
-    docstring.
+    docstring.  See the module docstring for the faster modes.
 
     Args:
         func: A plain Python callable.  Must take at least one positional
             argument.
         name: Override the registered Cypher function name.  Defaults to
             ``func.__name__``.
+        mode: ``"row"``, ``"dedup"`` or ``"vectorized"``.
+        memo_size: Distinct input tuples remembered in ``dedup`` mode.
+        processes: Evaluate ``row``/``dedup`` functions in this many worker
+            processes.  ``None`` evaluates in-process.
+        chunk_size: Rows per worker-process task.
+        arrays: Array type passed to ``vectorized`` functions.
 
     Raises:
-        TypeError: If *func* takes zero positional arguments.
+        TypeError: If *func* takes zero positional arguments, or
+            *processes* is given and *func* cannot be pickled.
+        ValueError: If *mode* is unknown or *processes* is combined with
+            ``mode="vectorized"``.
     """
     min_args, max_args = _infer_arity(func)
     if (max_args is not None and max_args == 0) or (
@@ -187,9 +621,44 @@ def register_user_function(
             "functions must take at least one positional argument."
         )
         raise TypeError(msg)
+    if processes is not None:
+        if mode == "vectorized":
+            msg = "processes= only applies to 'row' and 'dedup' functions."
+            raise ValueError(msg)
+        try:
+            pickle.dumps(func)
+        except (pickle.PicklingError, AttributeError, TypeError) as exc:
+            msg = (
+                f"Cannot run {func.__name__!r} in worker processes: it is "
+                f"not picklable ({exc}).  Define it at module top level."
+            )
+            raise TypeError(msg) from exc
+
+    if mode == "row":
+        wrapped = _wrap_row_wise(
+            func,
+            processes=processes,
+            chunk_size=chunk_size,
+        )
+    elif mode == "dedup":
+        wrapped = _wrap_deduplicated(
+            func,
+            memo_size=memo_size,
+            processes=processes,
+            chunk_size=chunk_size,
+        )
+    elif mode == "vectorized":
+        wrapped = _wrap_vectorized(func, arrays=arrays)
+    else:
+        msg = (
+            f"Unknown user function mode {mode!r}; expected 'row', "
+            "'dedup' or 'vectorized'."
+        )
+        raise ValueError(msg)
+
     ScalarFunctionRegistry.get_instance().register_function(
         name=name or func.__name__,
-        callable=_wrap_row_wise(func),
+        callable=wrapped,
         min_args=min_args,
         max_args=max_args,
         description=_description(func),
@@ -31,7 +31,10 @@ from pycypher.constants import (
     RELATIONSHIP_TARGET_COLUMN,
 )
 from pycypher.cypher_types import FrameSeries
-from pycypher.dataframe_utils import source_to_pandas as _source_to_pandas
+from pycypher.dataframe_utils import (
+    indexed_source_frame,
+    source_columns_to_pandas,
+)
 
 if TYPE_CHECKING:
     from pycypher.ast_models import Expression
@@ -235,12 +238,12 @@ class EntityScan:
         if not _pushed_down:
             # --- Standard full scan ---
             cache: dict = getattr(context, "_property_lookup_cache", {})
-            if self.entity_type not in cache:
-                raw_df: pd.DataFrame = _source_to_pandas(
-                    entity_table.source_obj
-                )
-                cache[self.entity_type] = raw_df.set_index(ID_COLUMN)
-            indexed_df = cache[self.entity_type]
+            indexed_df = indexed_source_frame(
+                cache,
+                self.entity_type,
+                entity_table.source_obj,
+                columns=(),
+            )
             ids = pd.Series(
                 indexed_df.index.to_numpy(dtype=object),
                 name=ID_COLUMN,
@@ -342,8 +345,9 @@ class RelationshipScan:
 
         # --- Coerce pushdown IDs to match relationship table dtypes ---
         if source_ids is not None or target_ids is not None:
-            raw_df_for_dtype: pd.DataFrame = _source_to_pandas(
-                rel_table.source_obj
+            raw_df_for_dtype: pd.DataFrame = source_columns_to_pandas(
+                rel_table.source_obj,
+                [RELATIONSHIP_SOURCE_COLUMN, RELATIONSHIP_TARGET_COLUMN],
             )
             if source_ids is not None:
                 source_ids = _coerce_pushdown_series(
@@ -405,10 +409,12 @@ class RelationshipScan:
         # --- Fallback: table scan with isin() pushdown ---
         cache: dict = getattr(context, "_property_lookup_cache", {})
         cache_key = f"__rel__{self.rel_type}"
-        if cache_key not in cache:
-            raw_df: pd.DataFrame = _source_to_pandas(rel_table.source_obj)
-            cache[cache_key] = raw_df.set_index(ID_COLUMN)
-        indexed_df = cache[cache_key]
+        indexed_df = indexed_source_frame(
+            cache,
+            cache_key,
+            rel_table.source_obj,
+            columns=(RELATIONSHIP_SOURCE_COLUMN, RELATIONSHIP_TARGET_COLUMN),
+        )
 
         # --- Predicate pushdown: filter at scan level ---
         mask: pd.Series | None = None
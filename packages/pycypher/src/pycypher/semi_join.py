@@ -0,0 +1,219 @@
+"""Semi-join reduction (Yannakakis) for acyclic MATCH patterns.
+
+Both MATCH translations push only *adjacent* information into a scan: a
+fixed hop scans relationships whose source is among the preceding node
+IDs, and a join-ordered plan filters each base relation by its own
+predicates.  A selective predicate at the far end of a chain — ``(p)-
+[:LIVES_IN_PUMA]->(:Puma)-[:IN_STATE]->(s:State {abbr: 'GA'})`` — is
+therefore felt only once the whole chain has been joined.
+
+For an acyclic pattern the classic Yannakakis reduction fixes this
+before any join runs.  Every base relation is a frame whose columns are
+pattern variables: node scans bind one node variable, relationship scans
+bind the relationship and its two endpoints.  The node variables form a
+forest whose edges are the relationship relations, and two passes of
+ID-set semi-joins run over it:
+
+1. *bottom-up* — each relationship keeps the rows whose child endpoint
+   survived, then narrows the parent's ID set to its parent endpoints;
+2. *top-down* — each relationship keeps the rows whose parent endpoint
+   survived, and the child's ID set becomes its child endpoints.
+
+Afterwards every remaining row of every relation takes part in at least
+one full match, so joins never build dangling intermediates.  ID sets
+are probed with a bitmap when IDs are small non-negative integers and
+with a hash set (:meth:`pandas.Index.isin`) otherwise.
+
+Cyclic patterns (including parallel relationships between the same two
+variables) are left alone — :mod:`~pycypher.generic_join` handles them.
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+from shared.logger import LOGGER
+
+__all__ = [
+    "SemiJoinReduction",
+    "id_membership",
+    "semi_join_reduce",
+]
+
+#: Largest ID a membership bitmap is built for, relative to the probed
+#: column: a bitmap of ``max_id + 1`` bytes is used only while it is no
+#: larger than ``BITMAP_DENSITY`` bytes per probed value (or 1 MiB).
+BITMAP_DENSITY: int = 8
+
+_BITMAP_MIN_BYTES: int = 1 << 20
+
+
+@dataclass
+class SemiJoinReduction:
+    """Reduced base relations of an acyclic pattern.
+
+    Attributes:
+        frames: The input frames, each narrowed to rows that take part in
+            a full match, in input order.
+        ids: Surviving IDs per node variable that some relation binds.
+        rows_before: Total rows of the input frames.
+        rows_after: Total rows of :attr:`frames`.
+
+    """
+
+    frames: list[pd.DataFrame]
+    ids: dict[str, np.ndarray] = field(default_factory=dict)
+    rows_before: int = 0
+    rows_after: int = 0
+
+
+def id_membership(
+    values: pd.Series | np.ndarray,
+    ids: np.ndarray,
+) -> np.ndarray:
+    """Return a boolean mask of the *values* that occur in *ids*.
+
+    Args:
+        values: Column to probe.
+        ids: Unique IDs to probe against.
+
+    Returns:
+        Boolean ``np.ndarray`` aligned with *values*.
+
+    """
+    probe = np.asarray(values)
+    if (
+        len(ids)
+        and probe.dtype.kind in "iu"
+        and ids.dtype.kind in "iu"
+        and ids.min() >= 0
+    ):
+        top = int(ids.max())
+        if top < max(BITMAP_DENSITY * len(probe), _BITMAP_MIN_BYTES):
+            bitmap = np.zeros(top + 1, dtype=bool)
+            bitmap[ids] = True
+            in_range = (probe >= 0) & (probe <= top)
+            mask = np.zeros(len(probe), dtype=bool)
+            mask[in_range] = bitmap[probe[in_range]]
+            return mask
+    probe_index, id_index = pd.Index(probe), pd.Index(ids)
+    # Backends may hand back string IDs for one side of a join (DuckDB
+    # does for traversed endpoints); compare those by their text form.
+    kinds = {probe_index.inferred_type, id_index.inferred_type}
+    if len(kinds) > 1 and "string" in kinds:
+        return probe_index.astype(str).isin(id_index.astype(str))
+    return probe_index.isin(id_index)
+
+
+def _unique(values: pd.Series) -> np.ndarray:
+    return pd.unique(values.dropna().to_numpy())
+
+
+def _restrict(frame: pd.DataFrame, var: str, ids: np.ndarray) -> pd.DataFrame:
+    mask = id_membership(frame[var], ids)
+    return frame if mask.all() else frame[mask]
+
+
+def semi_join_reduce(
+    frames: Sequence[pd.DataFrame],
+    node_vars: Collection[str],
+) -> SemiJoinReduction | None:
+    """Run the Yannakakis semi-join passes over the base relations.
+
+    Args:
+        frames: Base relations; their columns are pattern variables.  A
+            frame binding one node variable is a node relation, one
+            binding two is a relationship relation between them.
+        node_vars: The pattern's node variables.
+
+    Returns:
+        The reduction, or ``None`` when the pattern is cyclic (or a frame
+        binds more than two node variables) and was not reduced.
+
+    """
+    frames = list(frames)
+    rows_before = sum(len(f) for f in frames)
+    ids: dict[str, np.ndarray] = {}
+    unary: list[tuple[int, str]] = []
+    # node variable -> [(neighbour, relation index)]
+    adjacency: dict[str, list[tuple[str, int]]] = {}
+    component: dict[str, str] = {}
+
+    def _root(var: str) -> str:
+        while component.get(var, var) != var:
+            var = component[var]
+        return var
+
+    for index, frame in enumerate(frames):
+        bound = [c for c in frame.columns if c in node_vars]
+        if len(bound) == 1:
+            unary.append((index, bound[0]))
+            continue
+        if len(bound) != 2:
+            return None
+        src, tgt = bound
+        src_root, tgt_root = _root(src), _root(tgt)
+        if src_root == tgt_root:
+            return None
+        component[src_root] = tgt_root
+        adjacency.setdefault(src, []).append((tgt, index))
+        adjacency.setdefault(tgt, []).append((src, index))
+
+    # Node relations (and self-loops) restrict their variable directly.
+    for index, var in unary:
+        values = _unique(frames[index][var])
+        ids[var] = (
+            values
+            if var not in ids
+            else values[id_membership(values, ids[var])]
+        )
+
+    # Root every tree of the forest and list its hops parent-first.
+    hops: list[tuple[str, str, int]] = []
+    visited: set[str] = set()
+    for start in list(adjacency):
+        if start in visited:
+            continue
+        visited.add(start)
+        queue = [start]
+        while queue:
+            var = queue.pop(0)
+            for neighbour, index in adjacency[var]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    hops.append((var, neighbour, index))
+                    queue.append(neighbour)
+
+    for parent, child, index in reversed(hops):
+        if child in ids:
+            frames[index] = _restrict(frames[index], child, ids[child])
+        values = _unique(frames[index][parent])
+        ids[parent] = (
+            values
+            if parent not in ids
+            else values[id_membership(values, ids[parent])]
+        )
+    for parent, child, index in hops:
+        frames[index] = _restrict(frames[index], parent, ids[parent])
+        ids[child] = _unique(frames[index][child])
+
+    for index, var in unary:
+        frames[index] = _restrict(frames[index], var, ids[var])
+
+    reduction = SemiJoinReduction(
+        frames=frames,
+        ids=ids,
+        rows_before=rows_before,
+        rows_after=sum(len(f) for f in frames),
+    )
+    LOGGER.debug(
+        "semi-join reduction  relations=%d  rows=%d -> %d",
+        len(frames),
+        reduction.rows_before,
+        reduction.rows_after,
+    )
+    return reduction
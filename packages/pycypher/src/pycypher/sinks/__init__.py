@@ -9,4 +9,11 @@ Available sinks
 ``pycypher.sinks.neo4j``
     Write DataFrames to a Neo4j graph database via the official Python
     driver.  Requires the ``neo4j`` package (``uv pip install neo4j``).
+
+Shared helpers
+--------------
+``pycypher.sinks.parallel``
+    Driver-independent parallel batch writer used by the sinks' parallel
+    mode: hash-partitioned lanes, adaptive batch sizes, per-batch retries
+    and throughput statistics.
 """
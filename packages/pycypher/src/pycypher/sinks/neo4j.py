@@ -25,6 +25,18 @@ Quick start::
             ),
         )
 
+For large writes pass ``workers=N`` to write over ``N`` concurrent
+sessions (see :mod:`pycypher.sinks.parallel`): relationship batches are
+partitioned by endpoint hash so concurrent transactions do not contend
+for the same node locks, batch sizes can adapt to observed latency
+(``target_batch_seconds``), and transient failures are retried per
+batch::
+
+    with Neo4jSink(uri, user, password, workers=8,
+                   target_batch_seconds=1.0) as sink:
+        sink.write_relationships(edges, rel_mapping)
+        print(sink.last_write_stats.rows_per_second)
+
 Requires the ``neo4j`` package::
 
     uv pip install neo4j
@@ -40,6 +52,13 @@ import pandas as pd
 from pydantic import BaseModel, Field, field_validator
 from shared.logger import LOGGER
 
+from pycypher.sinks.parallel import (
+    AdaptiveBatchSize,
+    ParallelBatchWriter,
+    WriteStats,
+    partition_rounds,
+)
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from types import TracebackType
@@ -47,6 +66,11 @@ if TYPE_CHECKING:
 try:
     from neo4j import Driver as _Neo4jDriver
     from neo4j import GraphDatabase
+    from neo4j.exceptions import (
+        ServiceUnavailable,
+        SessionExpired,
+        TransientError,
+    )
 except ImportError as _import_err:
     _msg = "Install the neo4j package to use this sink: uv pip install neo4j"
     raise ImportError(_msg) from _import_err
@@ -207,6 +231,33 @@ def _coerce_value(value: Any) -> Any:
     return value
 
 
+def _column_values(column: pd.Series) -> list[Any]:
+    """Return *column* as a list of driver-safe Python values.
+
+    The columnar counterpart of :func:`_coerce_value`: numeric and boolean
+    columns convert in one ``tolist()`` call, datetime columns in one
+    ``to_pydatetime()`` call, and only object columns are coerced value by
+    value.  Nulls become ``None``.
+
+    Args:
+        column: One column of the result DataFrame.
+
+    Returns:
+        List aligned with *column*.
+
+    """
+    if column.dtype.kind == "M":
+        values = list(column.dt.to_pydatetime())
+    elif column.dtype == object:
+        return [_coerce_value(v) for v in column.tolist()]
+    else:
+        values = column.tolist()
+    null_mask = column.isna().to_numpy()
+    for position in np.flatnonzero(null_mask):
+        values[position] = None
+    return values
+
+
 def _coerce_row(row: dict[str, Any]) -> dict[str, Any]:
     """Return a copy of *row* with all values coerced to driver-safe types.
 
@@ -396,9 +447,9 @@ def _build_node_rows(
     a warning.  Property values that are ``None`` after coercion are excluded
     from the ``properties`` sub-dict (Neo4j property keys must have values).
 
-    Uses ``DataFrame.to_dict('records')`` (Cython-level) rather than
-    ``iterrows()`` to eliminate per-row ``pd.Series`` construction overhead.
-    Typical speedup: 4–5× on 10k-row batches.
+    Values are converted column by column (:func:`_column_values`) and
+    only then zipped into row dicts, so no per-row ``pd.Series`` or
+    per-value type dispatch is needed for typed columns.
 
     Args:
         df: Slice of the result DataFrame.
@@ -421,32 +472,22 @@ def _build_node_rows(
     if df_clean.empty:
         return []
 
-    # --- 2. Vectorized record extraction (Cython-level, no Series per row) ---
-    prop_col_names = list(mapping.property_columns.values())  # df column names
-    prop_neo4j_names = list(
-        mapping.property_columns.keys(),
-    )  # neo4j prop names
-    cols_needed = [id_col, *prop_col_names]
-    records: list[dict[str, Any]] = df_clean[cols_needed].to_dict("records")
-
-    # --- 3. Coerce values and build result (cheap dict access, not Series) ---
-    rows: list[dict[str, Any]] = []
-    for rec in records:
-        id_val = _coerce_value(rec[id_col])
-        if id_val is None:
-            continue  # safety guard: should not happen after null filter
-        props = _drop_nulls(
-            {
-                neo4j_prop: _coerce_value(rec[df_col])
-                for neo4j_prop, df_col in zip(
-                    prop_neo4j_names,
-                    prop_col_names,
-                    strict=False,
-                )
-            },
-        )
-        rows.append({"id": id_val, "properties": props})
-    return rows
+    # --- 2. Columnar coercion ---
+    prop_neo4j_names = list(mapping.property_columns.keys())
+    ids = _column_values(df_clean[id_col])
+    prop_values = [
+        _column_values(df_clean[df_col])
+        for df_col in mapping.property_columns.values()
+    ]
+
+    # --- 3. Zip columns into rows ---
+    return [
+        {
+            "id": id_val,
+            "properties": _drop_nulls(dict(zip(prop_neo4j_names, values))),
+        }
+        for id_val, *values in zip(ids, *prop_values)
+    ]
 
 
 def _build_rel_rows(
@@ -458,9 +499,7 @@ def _build_rel_rows(
     Rows where either endpoint ID is ``None`` / ``NaN`` are skipped with a
     warning.
 
-    Uses ``DataFrame.to_dict('records')`` (Cython-level) rather than
-    ``iterrows()`` to eliminate per-row ``pd.Series`` construction overhead.
-    Typical speedup: 4–5× on 10k-row batches.
+    Values are converted column by column, as in :func:`_build_node_rows`.
 
     Args:
         df: Slice of the result DataFrame.
@@ -485,31 +524,29 @@ def _build_rel_rows(
     if df_clean.empty:
         return []
 
-    # --- 2. Vectorized record extraction ---
-    prop_col_names = list(mapping.property_columns.values())
+    # --- 2. Columnar coercion ---
     prop_neo4j_names = list(mapping.property_columns.keys())
-    cols_needed = [src_col, tgt_col, *prop_col_names]
-    records: list[dict[str, Any]] = df_clean[cols_needed].to_dict("records")
-
-    # --- 3. Coerce and build result ---
-    rows: list[dict[str, Any]] = []
-    for rec in records:
-        src_id = _coerce_value(rec[src_col])
-        tgt_id = _coerce_value(rec[tgt_col])
-        if src_id is None or tgt_id is None:
-            continue  # safety guard: should not happen after null filter
-        props = _drop_nulls(
-            {
-                neo4j_prop: _coerce_value(rec[df_col])
-                for neo4j_prop, df_col in zip(
-                    prop_neo4j_names,
-                    prop_col_names,
-                    strict=False,
-                )
-            },
-        )
-        rows.append({"src_id": src_id, "tgt_id": tgt_id, "properties": props})
-    return rows
+    src_ids = _column_values(df_clean[src_col])
+    tgt_ids = _column_values(df_clean[tgt_col])
+    prop_values = [
+        _column_values(df_clean[df_col])
+        for df_col in mapping.property_columns.values()
+    ]
+
+    # --- 3. Zip columns into rows ---
+    return [
+        {
+            "src_id": src_id,
+            "tgt_id": tgt_id,
+            "properties": _drop_nulls(dict(zip(prop_neo4j_names, values))),
+        }
+        for src_id, tgt_id, *values in zip(src_ids, tgt_ids, *prop_values)
+    ]
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return whether a failed batch may succeed when retried."""
+    return isinstance(exc, (TransientError, ServiceUnavailable, SessionExpired))
 
 
 # ---------------------------------------------------------------------------
@@ -541,6 +578,24 @@ class Neo4jSink:
             to the Neo4j driver's scheme-based defaults (``bolt://`` is
             unencrypted, ``bolt+s://`` or ``neo4j+s://`` are encrypted).
             Set to ``True`` for production connections to enforce TLS.
+        workers: Number of concurrent sessions.  With more than one, writes
+            go through :class:`~pycypher.sinks.parallel.ParallelBatchWriter`:
+            rows are hash-partitioned by ID (nodes) or by both endpoint
+            IDs (relationships), failed batches are retried and
+            :attr:`last_write_stats` reports throughput.
+        target_batch_seconds: In parallel mode, adapt the batch size so a
+            batch takes about this long.  ``None`` keeps ``batch_size``.
+        max_retries: In parallel mode, retries per batch after a transient
+            error (``TransientError``, ``ServiceUnavailable`` or
+            ``SessionExpired``).
+        retry_backoff_seconds: In parallel mode, delay before the first
+            retry of a batch; doubled for each further one.
+        on_progress: In parallel mode, called with a
+            :class:`~pycypher.sinks.parallel.WriteStats` snapshot after
+            every batch.
+        driver: An open driver — or a stand-in with the same ``session()``
+            interface — to use instead of connecting to *uri*.  The sink
+            closes it on exit.
 
     Raises:
         ImportError: If the ``neo4j`` driver package is not installed.
@@ -556,14 +611,30 @@ class Neo4jSink:
         database: str | None = None,
         batch_size: int = 500,
         encrypted: bool | None = None,
+        workers: int = 1,
+        target_batch_seconds: float | None = None,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+        on_progress: Callable[[WriteStats], None] | None = None,
+        driver: _Neo4jDriver | None = None,
     ) -> None:
         self._uri = uri
         self._database = database
         self._batch_size = batch_size
+        self._workers = workers
+        self._target_batch_seconds = target_batch_seconds
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._on_progress = on_progress
+        #: Statistics of the last parallel write, or ``None``.
+        self.last_write_stats: WriteStats | None = None
+        if driver is not None:
+            self._driver: _Neo4jDriver = driver
+            return
         driver_kwargs: dict[str, Any] = {"auth": (user, password)}
         if encrypted is not None:
             driver_kwargs["encrypted"] = encrypted
-        self._driver: _Neo4jDriver = GraphDatabase.driver(uri, **driver_kwargs)
+        self._driver = GraphDatabase.driver(uri, **driver_kwargs)
 
     # ------------------------------------------------------------------
     # Public write methods
@@ -603,6 +674,7 @@ class Neo4jSink:
             df,
             cypher,
             lambda batch: _build_node_rows(batch, mapping),
+            key_columns=[mapping.id_column],
         )
         LOGGER.info(
             f"write_nodes: wrote {total} row(s) to label {mapping.label!r}",
@@ -657,6 +729,7 @@ class Neo4jSink:
             df,
             cypher,
             lambda batch: _build_rel_rows(batch, mapping),
+            key_columns=[mapping.source_id_column, mapping.target_id_column],
         )
         LOGGER.info(
             f"write_relationships: wrote {total} row(s) of type {mapping.rel_type!r}",
@@ -672,6 +745,8 @@ class Neo4jSink:
         df: pd.DataFrame,
         cypher: str,
         build_rows: Callable[[pd.DataFrame], list[dict[str, Any]]],
+        *,
+        key_columns: list[str],
     ) -> int:
         """Execute *cypher* over all batches sliced from *df*.
 
@@ -680,6 +755,8 @@ class Neo4jSink:
             cypher: Cypher query string expecting a ``$rows`` parameter.
             build_rows: Callable that converts a DataFrame slice to the
                 ``$rows`` list accepted by *cypher*.
+            key_columns: Columns whose hash assigns rows to concurrent
+                sessions in parallel mode.
 
         Returns:
             Total number of rows written across all batches.
@@ -690,6 +767,8 @@ class Neo4jSink:
         """
         if df.empty:
             return 0
+        if self._workers > 1:
+            return self._write_parallel(df, cypher, build_rows, key_columns)
 
         n_batches = math.ceil(len(df) / self._batch_size)
         LOGGER.debug(
@@ -724,6 +803,49 @@ class Neo4jSink:
 
         return total
 
+    def _write_parallel(
+        self,
+        df: pd.DataFrame,
+        cypher: str,
+        build_rows: Callable[[pd.DataFrame], list[dict[str, Any]]],
+        key_columns: list[str],
+    ) -> int:
+        """Execute *cypher* over *df* with ``workers`` concurrent sessions.
+
+        Returns:
+            Total number of rows written.
+
+        """
+        writer = ParallelBatchWriter(
+            lambda: self._driver.session(database=self._database),
+            workers=self._workers,
+            batch_size=AdaptiveBatchSize(
+                self._batch_size,
+                target_seconds=self._target_batch_seconds,
+            ),
+            is_transient=_is_transient,
+            max_retries=self._max_retries,
+            backoff_seconds=self._retry_backoff_seconds,
+            on_progress=self._on_progress,
+        )
+        stats = writer.write(
+            cypher,
+            partition_rounds(df, key_columns, self._workers),
+            build_rows,
+        )
+        self.last_write_stats = stats
+        LOGGER.info(
+            "Parallel write: %d row(s) in %d batch(es), %d retr(ies), "
+            "%.2fs (%.0f rows/s, %d workers)",
+            stats.rows,
+            stats.batches,
+            stats.retries,
+            stats.seconds,
+            stats.rows_per_second,
+            self._workers,
+        )
+        return stats.rows
+
     # ------------------------------------------------------------------
     # Resource management
     # ------------------------------------------------------------------
@@ -0,0 +1,344 @@
+"""Parallel, pipelined batch writing shared by the sinks.
+
+A sink that writes one ``UNWIND`` batch after another over a single
+session spends most of its time waiting on round trips.
+:class:`ParallelBatchWriter` instead runs several *lanes* at once, each
+on its own session, and builds the next batch's parameter payload while
+other lanes wait on the database.
+
+Rows are assigned to lanes by hashing their key columns
+(:func:`partition_rounds`):
+
+* with one key (node writes) each lane owns one hash partition of the
+  IDs, so no two lanes ever ``MERGE`` the same node;
+* with two keys (relationship writes) both endpoints are hashed into
+  ``2n`` partitions and rows are grouped by their (unordered) pair of
+  endpoint partitions.  The pairs are scheduled round-robin, like the
+  fixtures of a tournament: each of the ``2n - 1`` rounds pairs every
+  partition with exactly one other, giving ``n`` lanes that touch
+  disjoint node partitions — whether as source or as target — so
+  concurrent transactions stay off each other's endpoint locks.
+
+Batch sizes follow :class:`AdaptiveBatchSize`, which steers towards a
+target latency from the observed per-batch timings.  Failed batches are
+retried with exponential back-off when the sink's ``is_transient``
+predicate accepts the error; every lane stops at its next batch once
+any lane fails for good.  Throughput is reported through
+:class:`WriteStats`.
+
+Nothing here depends on a database driver: a lane only needs a callable
+returning a session context manager whose ``run(cypher, rows=...)``
+executes a batch.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from shared.logger import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from contextlib import AbstractContextManager
+
+__all__ = [
+    "AdaptiveBatchSize",
+    "ParallelBatchWriter",
+    "WriteStats",
+    "partition_rounds",
+]
+
+
+@dataclass
+class WriteStats:
+    """Progress of one parallel write.
+
+    Attributes:
+        rows: Rows written so far.
+        batches: Batches written so far.
+        retries: Batch attempts that failed transiently and were retried.
+        seconds: Wall-clock seconds since the write started.
+
+    """
+
+    rows: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the write throughput, or ``0.0`` before any time passed."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class AdaptiveBatchSize:
+    """Batch size steered towards a target per-batch latency.
+
+    After each batch the size moves towards ``rows / seconds * target``,
+    but by at most a factor of two per observation so one slow batch (a
+    lock wait, a GC pause) cannot collapse it.  With ``target_seconds``
+    set to ``None`` the size stays fixed.
+
+    Args:
+        initial: Starting batch size.
+        target_seconds: Desired seconds per batch, or ``None``.
+        minimum: Smallest size the controller will choose.
+        maximum: Largest size the controller will choose.
+
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        target_seconds: float | None = None,
+        minimum: int = 50,
+        maximum: int = 50_000,
+    ) -> None:
+        if initial < 1:
+            msg = f"batch size must be positive, got {initial}"
+            raise ValueError(msg)
+        self._size = initial
+        self._target = target_seconds
+        self._minimum = min(minimum, initial)
+        self._maximum = max(maximum, initial)
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Return the current batch size."""
+        return self._size
+
+    def observe(self, rows: int, seconds: float) -> None:
+        """Record that a batch of *rows* took *seconds* to write."""
+        if self._target is None or rows <= 0:
+            return
+        ideal = rows * self._target / max(seconds, 1e-6)
+        with self._lock:
+            size = min(max(ideal, self._size / 2), self._size * 2)
+            self._size = int(min(max(size, self._minimum), self._maximum))
+
+
+def _partitions(values: pd.Series, n: int) -> np.ndarray:
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return (hashes % np.uint64(n)).astype(np.intp)
+
+
+def _round_robin(n_parts: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the round and lane of every partition pair.
+
+    Uses the circle method over an even *n_parts*: partition
+    ``n_parts - 1`` stays fixed while the others rotate.  A pair of equal
+    partitions joins the lane its partition has in round 0.
+    """
+    rounds = np.zeros((n_parts, n_parts), dtype=np.intp)
+    lanes = np.zeros((n_parts, n_parts), dtype=np.intp)
+    rotating = n_parts - 1
+    for r in range(rotating):
+        pairs = [(r, rotating)] + [
+            ((r + k) % rotating, (r - k) % rotating)
+            for k in range(1, n_parts // 2)
+        ]
+        for lane, (a, b) in enumerate(pairs):
+            rounds[a, b] = rounds[b, a] = r
+            lanes[a, b] = lanes[b, a] = lane
+            if r == 0:
+                lanes[a, a] = lanes[b, b] = lane
+    return rounds, lanes
+
+
+def partition_rounds(
+    frame: pd.DataFrame,
+    key_columns: Sequence[str],
+    n: int,
+) -> list[list[pd.DataFrame]]:
+    """Split *frame* into rounds of lanes that can be written concurrently.
+
+    Args:
+        frame: Rows to write.
+        key_columns: One column (node IDs) or two (source and target
+            IDs) whose hash decides each row's lane.
+        n: Number of lanes per round.
+
+    Returns:
+        Rounds to run one after another; each is a list of non-empty
+        frames to write side by side.
+
+    Raises:
+        ValueError: If *key_columns* does not name one or two columns.
+
+    """
+    if len(key_columns) == 1:
+        parts = _partitions(frame[key_columns[0]], n)
+        return [[frame[parts == i] for i in range(n) if (parts == i).any()]]
+    if len(key_columns) != 2:  # noqa: PLR2004
+        msg = f"expected one or two key columns, got {list(key_columns)!r}"
+        raise ValueError(msg)
+    src = _partitions(frame[key_columns[0]], 2 * n)
+    tgt = _partitions(frame[key_columns[1]], 2 * n)
+    round_of, lane_of = _round_robin(2 * n)
+    key = round_of[src, tgt] * n + lane_of[src, tgt]
+    groups = dict(list(frame.groupby(key, sort=True)))
+    rounds = [
+        [groups[k] for k in range(r * n, (r + 1) * n) if k in groups]
+        for r in range(2 * n - 1)
+    ]
+    return [lanes for lanes in rounds if lanes]
+
+
+class ParallelBatchWriter:
+    """Write batches over several concurrent sessions.
+
+    Args:
+        open_session: Returns a new session context manager; called once
+            per lane.  Sessions need a ``run(cypher, rows=...)`` method.
+        workers: Number of lanes written at the same time.
+        batch_size: Batch size controller shared by all lanes.
+        is_transient: Predicate telling retryable errors apart.
+        max_retries: Retries per batch before the error is raised.
+        backoff_seconds: Delay before the first retry; doubled for each
+            further one.
+        on_progress: Called with a :class:`WriteStats` snapshot after
+            every batch (from the lane's thread).
+
+    """
+
+    def __init__(
+        self,
+        open_session: Callable[[], AbstractContextManager[Any]],
+        *,
+        workers: int,
+        batch_size: AdaptiveBatchSize,
+        is_transient: Callable[[BaseException], bool] = lambda _exc: False,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+        on_progress: Callable[[WriteStats], None] | None = None,
+    ) -> None:
+        self._open_session = open_session
+        self._workers = workers
+        self._batch_size = batch_size
+        self._is_transient = is_transient
+        self._max_retries = max_retries
+        self._backoff = backoff_seconds
+        self._on_progress = on_progress
+        self._lock = threading.Lock()
+        self._stats = WriteStats()
+        self._started = 0.0
+        self._failed = threading.Event()
+
+    def write(
+        self,
+        cypher: str,
+        rounds: Sequence[Sequence[pd.DataFrame]],
+        build_rows: Callable[[pd.DataFrame], list[dict[str, Any]]],
+    ) -> WriteStats:
+        """Write every lane of every round.
+
+        Args:
+            cypher: Query expecting a ``$rows`` parameter.
+            rounds: Lanes per round, as returned by
+                :func:`partition_rounds`.
+            build_rows: Turns a slice of a lane into the ``$rows`` list.
+
+        Returns:
+            Final statistics of the write.
+
+        Raises:
+            Exception: The first error a lane could not retry past.
+
+        """
+        self._stats = WriteStats()
+        self._failed.clear()
+        self._started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=self._workers,
+            thread_name_prefix="sink-lane",
+        ) as pool:
+            for lanes in rounds:
+                futures = [
+                    pool.submit(self._write_lane, cypher, lane, build_rows)
+                    for lane in lanes
+                ]
+                errors = [f.exception() for f in futures]
+                error = next((e for e in errors if e is not None), None)
+                if error is not None:
+                    raise error
+        return self._snapshot()
+
+    def _snapshot(self) -> WriteStats:
+        with self._lock:
+            return replace(
+                self._stats,
+                seconds=time.perf_counter() - self._started,
+            )
+
+    def _write_lane(
+        self,
+        cypher: str,
+        lane: pd.DataFrame,
+        build_rows: Callable[[pd.DataFrame], list[dict[str, Any]]],
+    ) -> None:
+        with self._open_session() as session:
+            start = 0
+            while start < len(lane) and not self._failed.is_set():
+                size = self._batch_size.size
+                rows = build_rows(lane.iloc[start : start + size])
+                start += size
+                if not rows:
+                    continue
+                t0 = time.perf_counter()
+                try:
+                    self._run(session, cypher, rows)
+                except Exception:
+                    self._failed.set()
+                    # SECURITY: Log only the keys of the first row, not
+                    # the values, to avoid leaking PII or sensitive data.
+                    LOGGER.exception(
+                        "Batch failed (%d rows, first row keys: %s)",
+                        len(rows),
+                        list(rows[0].keys()),
+                    )
+                    raise
+                self._batch_size.observe(len(rows), time.perf_counter() - t0)
+                with self._lock:
+                    self._stats.rows += len(rows)
+                    self._stats.batches += 1
+                if self._on_progress is not None:
+                    self._on_progress(self._snapshot())
+
+    def _run(self, session: Any, cypher: str, rows: list[dict]) -> None:
+        for attempt in range(self._max_retries + 1):
+            try:
+                result = session.run(cypher, rows=rows)
+                # Auto-commit results are lazy; consuming surfaces errors
+                # while this batch can still be retried.
+                consume = getattr(result, "consume", None)
+                if callable(consume):
+                    consume()
+            except Exception as exc:
+                if attempt == self._max_retries or not self._is_transient(
+                    exc,
+                ):
+                    raise
+                delay = self._backoff * 2**attempt
+                LOGGER.warning(
+                    "Transient error on a %d-row batch (%s); retry %d/%d "
+                    "in %.2fs",
+                    len(rows),
+                    type(exc).__name__,
+                    attempt + 1,
+                    self._max_retries,
+                    delay,
+                )
+                with self._lock:
+                    self._stats.retries += 1
+                time.sleep(delay)
+            else:
+                return
@@ -0,0 +1,380 @@
+"""Spatial values, an STR-tree polygon index and vectorized point tests.
+
+Geometry travels through entity tables as WKB ``bytes`` columns, so it
+survives Parquet, Arrow and DuckDB unchanged.  Points are Cypher maps in
+the Neo4j shape — ``{longitude, latitude}`` for WGS-84 and ``{x, y}`` for
+cartesian coordinates.
+
+Polygon work is delegated to GEOS through shapely, which is an optional
+dependency (``pip install pycypher[spatial]``); it is imported on first
+use so that the rest of the package never pays for it.
+
+Everything here operates on whole columns: points are split into float
+arrays once, each distinct polygon is parsed from WKB once, and index
+probes run in fixed-size batches of points against a single
+:class:`shapely.STRtree`.
+
+Usage::
+
+    index = SpatialIndex.build("CensusTract", "geometry", tracts_df)
+    positions, tract_ids = index.query_points(lons, lats)
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from shared.logger import LOGGER
+
+from pycypher.constants import ID_COLUMN
+from pycypher.dataframe_utils import source_columns_to_pandas
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from pycypher.relational_models import Context
+
+#: CRS names used in point maps, matching Neo4j's spelling.
+GEOGRAPHIC_CRS = "wgs-84"
+CARTESIAN_CRS = "cartesian"
+
+#: Mean Earth radius used for great-circle distances, in metres.
+EARTH_RADIUS_M = 6_371_008.8
+
+#: Points probed against an index per batch; bounds the temporary shapely
+#: point array to roughly 100 MB.
+DEFAULT_BATCH_SIZE = 1_000_000
+
+
+def _shapely() -> ModuleType:
+    """Import and return shapely, with an install hint when it is missing."""
+    try:
+        import shapely
+    except ImportError as exc:
+        msg = (
+            "Spatial functions require shapely: "
+            "uv pip install 'pycypher[spatial]'"
+        )
+        raise ImportError(msg) from exc
+    return shapely
+
+
+# ---------------------------------------------------------------------------
+# Point values
+# ---------------------------------------------------------------------------
+
+
+def point_coordinates(
+    values: pd.Series,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a column of point maps into coordinate arrays.
+
+    Args:
+        values: Series of point maps; nulls and maps without coordinates
+            are allowed.
+
+    Returns:
+        ``(x, y, geographic)`` — float64 arrays holding NaN where the row
+        is not a point, and a boolean array marking WGS-84 points.
+
+    """
+    n = len(values)
+    x = np.full(n, np.nan)
+    y = np.full(n, np.nan)
+    geographic = np.zeros(n, dtype=bool)
+    for i, value in enumerate(values.tolist()):
+        if not isinstance(value, dict):
+            continue
+        if "longitude" in value:
+            x[i] = _as_float(value.get("longitude"))
+            y[i] = _as_float(value.get("latitude"))
+            geographic[i] = True
+        elif "x" in value:
+            x[i] = _as_float(value.get("x"))
+            y[i] = _as_float(value.get("y"))
+            geographic[i] = value.get("crs") == GEOGRAPHIC_CRS
+    return x, y, geographic
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def make_points(
+    x: np.ndarray,
+    y: np.ndarray,
+    geographic: bool | np.ndarray,
+) -> pd.Series:
+    """Build a column of point maps from coordinate arrays.
+
+    *geographic* is a flag for the whole column or a per-row boolean
+    array.  Rows where either coordinate is NaN become null.
+    """
+    flags = np.broadcast_to(np.asarray(geographic, dtype=bool), x.shape)
+    out = [
+        None
+        if xi != xi or yi != yi  # NaN
+        else (
+            {"longitude": xi, "latitude": yi, "crs": GEOGRAPHIC_CRS}
+            if geo
+            else {"x": xi, "y": yi, "crs": CARTESIAN_CRS}
+        )
+        for xi, yi, geo in zip(x.tolist(), y.tolist(), flags, strict=True)
+    ]
+    return pd.Series(out, dtype=object)
+
+
+def haversine_m(
+    lon1: np.ndarray,
+    lat1: np.ndarray,
+    lon2: np.ndarray,
+    lat2: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distance in metres between coordinate arrays."""
+    lon1, lat1, lon2, lat2 = (np.radians(a) for a in (lon1, lat1, lon2, lat2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+# ---------------------------------------------------------------------------
+# Polygons
+# ---------------------------------------------------------------------------
+
+
+def geometries_from_wkb(values: pd.Series | np.ndarray) -> np.ndarray:
+    """Parse a WKB column into shapely geometries, one parse per value.
+
+    Rows that repeat a polygon — the common case after a join, where
+    thousands of points share a tract — reuse the same parsed object.
+    The parsed geometries are prepared, which makes repeated point tests
+    against one polygon logarithmic in its vertex count.  Nulls and
+    non-bytes values become ``None``.
+    """
+    shapely = _shapely()
+    series = pd.Series(values, dtype=object)
+    is_wkb = series.map(lambda v: isinstance(v, (bytes, bytearray)))
+    out = np.full(len(series), None, dtype=object)
+    if not is_wkb.any():
+        return out
+    codes, uniques = pd.factorize(series[is_wkb])
+    parsed = shapely.from_wkb(np.asarray(uniques, dtype=object))
+    shapely.prepare(parsed)
+    out[is_wkb.to_numpy()] = parsed[codes]
+    return out
+
+
+def points_in_polygons(
+    x: np.ndarray,
+    y: np.ndarray,
+    polygons: pd.Series | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row-wise test of whether point *i* lies in polygon *i*.
+
+    Points on a polygon's boundary count as inside.
+
+    Returns:
+        ``(inside, valid)`` boolean arrays; rows where the point or the
+        polygon is missing are ``valid == False``.
+
+    """
+    shapely = _shapely()
+    geoms = geometries_from_wkb(polygons)
+    valid = ~(np.isnan(x) | np.isnan(y)) & (geoms != None)  # noqa: E711
+    inside = np.zeros(len(x), dtype=bool)
+    if valid.any():
+        inside[valid] = shapely.intersects_xy(
+            geoms[valid].astype(object),
+            x[valid],
+            y[valid],
+        )
+    return inside, valid
+
+
+@dataclass(slots=True)
+class SpatialIndex:
+    """STR-tree over the polygons of one entity type.
+
+    Attributes:
+        entity_type: Entity type label.
+        property_name: WKB geometry column that was indexed.
+        ids: Entity IDs aligned with the tree's geometry positions.
+        geometries: Prepared polygons, aligned with *ids*.
+        tree: The packed :class:`shapely.STRtree`, or ``None`` when the
+            entity type has no geometry.
+
+    """
+
+    entity_type: str
+    property_name: str
+    ids: np.ndarray = field(default_factory=lambda: np.array([], dtype=object))
+    geometries: np.ndarray = field(
+        default_factory=lambda: np.array([], dtype=object),
+    )
+    tree: Any = None
+
+    @classmethod
+    def build(
+        cls,
+        entity_type: str,
+        property_name: str,
+        source_df: pd.DataFrame,
+    ) -> SpatialIndex:
+        """Bulk-load an STR-tree from the WKB column of *source_df*.
+
+        Rows without a geometry are left out of the tree.
+        """
+        t0 = time.perf_counter()
+        idx = cls(entity_type=entity_type, property_name=property_name)
+        if (
+            property_name not in source_df.columns
+            or ID_COLUMN not in source_df.columns
+        ):
+            return idx
+
+        geoms = geometries_from_wkb(source_df[property_name])
+        present = geoms != None  # noqa: E711
+        idx.ids = np.asarray(source_df[ID_COLUMN].to_numpy()[present])
+        idx.geometries = geoms[present]
+        if len(idx.ids):
+            idx.tree = _shapely().STRtree(idx.geometries)
+
+        LOGGER.debug(
+            "SpatialIndex.build  type=%s  prop=%s  geometries=%d  elapsed=%.4fs",
+            entity_type,
+            property_name,
+            len(idx.ids),
+            time.perf_counter() - t0,
+        )
+        return idx
+
+    @property
+    def size(self) -> int:
+        """Number of indexed geometries."""
+        return len(self.ids)
+
+    def query_points(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the polygon containing each point.
+
+        A point on an edge shared by several polygons is assigned to the
+        first of them in index order, so every point matches at most once.
+
+        Args:
+            x: Point x coordinates (longitude for WGS-84).
+            y: Point y coordinates (latitude for WGS-84).
+            batch_size: Points probed per tree query.
+
+        Returns:
+            ``(positions, ids)`` — positions into *x*/*y* of the points
+            that fell inside a polygon, in ascending order, and the entity
+            ID of that polygon.
+
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if self.tree is None or len(x) == 0:
+            return np.array([], dtype=np.int64), self.ids[:0]
+
+        shapely = _shapely()
+        hits_pos: list[np.ndarray] = []
+        hits_geom: list[np.ndarray] = []
+        for start in range(0, len(x), batch_size):
+            bx = x[start : start + batch_size]
+            by = y[start : start + batch_size]
+            valid = np.flatnonzero(~(np.isnan(bx) | np.isnan(by)))
+            if not len(valid):
+                continue
+            px, py = bx[valid], by[valid]
+            # Envelope candidates from the tree, then an exact test
+            # against the prepared polygons.  A predicate query would
+            # prepare the probe points instead, which buys nothing.
+            pos, geom = self.tree.query(shapely.points(px, py))
+            hit = shapely.intersects_xy(
+                self.geometries[geom],
+                px[pos],
+                py[pos],
+            )
+            pos, geom = pos[hit], geom[hit]
+            order = np.lexsort((geom, pos))
+            pos, geom = pos[order], geom[order]
+            first = np.ones(len(pos), dtype=bool)
+            first[1:] = pos[1:] != pos[:-1]
+            hits_pos.append(valid[pos[first]] + start)
+            hits_geom.append(geom[first])
+
+        if not hits_pos:
+            return np.array([], dtype=np.int64), self.ids[:0]
+        positions = np.concatenate(hits_pos).astype(np.int64)
+        return positions, self.ids[np.concatenate(hits_geom)]
+
+
+# ---------------------------------------------------------------------------
+# Spatial join procedure
+# ---------------------------------------------------------------------------
+
+
+def point_in_polygon_procedure(
+    context: Context,
+    args: list[Any],
+) -> list[dict]:
+    """``CALL spatial.pointInPolygon(...)`` — join points to polygons.
+
+    Arguments are the point label, its x (longitude) and y (latitude)
+    property names, the polygon label and optionally its geometry property
+    (default ``'geometry'``).  Yields one ``{point, polygon}`` row of
+    entity IDs per point that falls inside a polygon, probing the polygon
+    label's cached :class:`SpatialIndex` in batches rather than testing
+    every point against every polygon.
+    """
+    if len(args) not in (4, 5):
+        msg = (
+            "spatial.pointInPolygon expects (pointLabel, xProperty, "
+            "yProperty, polygonLabel[, geometryProperty])"
+        )
+        raise ValueError(msg)
+    point_label, x_prop, y_prop, polygon_label = args[:4]
+    geometry_prop = args[4] if len(args) == 5 else "geometry"
+
+    index = context.index_manager.get_spatial_index(
+        polygon_label,
+        geometry_prop,
+    )
+    if index is None:
+        return []
+    mapping = context.entity_mapping.mapping
+    if point_label not in mapping:
+        return []
+    points = source_columns_to_pandas(
+        mapping[point_label].source_obj,
+        [ID_COLUMN, x_prop, y_prop],
+    )
+    if x_prop not in points.columns or y_prop not in points.columns:
+        return []
+
+    x = pd.to_numeric(points[x_prop], errors="coerce").to_numpy(
+        dtype=np.float64,
+    )
+    y = pd.to_numeric(points[y_prop], errors="coerce").to_numpy(
+        dtype=np.float64,
+    )
+    positions, polygon_ids = index.query_points(x, y)
+    point_ids = points[ID_COLUMN].to_numpy()[positions]
+    return [
+        {"point": p, "polygon": g}
+        for p, g in zip(point_ids.tolist(), polygon_ids.tolist(), strict=True)
+    ]
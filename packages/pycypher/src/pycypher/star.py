@@ -21,7 +21,7 @@ from __future__ import annotations
 import threading
 import time
 import uuid
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 from shared.logger import LOGGER, reset_query_id, set_query_id
@@ -34,6 +34,7 @@ from pycypher.ast_models import (
 )
 from pycypher.audit import audit_query_error, audit_query_success
 from pycypher.binding_frame import BindingFrame
+from pycypher.cancellation import ProgressReporter
 from pycypher.clause_executor import ClauseExecutor
 from pycypher.config import COMPLEXITY_WARN_THRESHOLD as _COMPLEXITY_WARN
 from pycypher.config import MAX_COMPLEXITY_SCORE as _DEFAULT_MAX_COMPLEXITY
@@ -51,6 +52,13 @@ from pycypher.relational_models import Context
 from pycypher.result_cache import ResultCache
 from pycypher.timeout_handler import TimeoutHandler
 
+if TYPE_CHECKING:
+    from pycypher.cancellation import (
+        CancellationToken,
+        OperatorProgress,
+        ProgressCallback,
+    )
+
 __all__ = [
     "ResultCache",
     "Star",
@@ -226,6 +234,11 @@ class Star:
             where_fn=_where_fn,
         )
 
+        # Cardinality feedback store.
+        from pycypher.cardinality_estimator import CardinalityFeedbackStore
+
+        self._cardinality_feedback = CardinalityFeedbackStore()
+
         # Delegate pattern matching to the focused PatternMatcher.
         self._pattern_matcher: PatternMatcher = PatternMatcher(
             context=context,
@@ -234,6 +247,7 @@ class Star:
             apply_where_fn=_where_fn,
             multi_way_join_fn=self._frame_joiner.multi_way_join,
             evaluator_factory=self._evaluator_factory,
+            cardinality_feedback=self._cardinality_feedback,
         )
 
         # Delegate expression rendering.
@@ -256,11 +270,6 @@ class Star:
             evaluator_factory=self._evaluator_factory,
         )
 
-        # Cardinality feedback store.
-        from pycypher.cardinality_estimator import CardinalityFeedbackStore
-
-        self._cardinality_feedback = CardinalityFeedbackStore()
-
         # Query analyzer — pre-execution planning and optimization.
         self._query_analyzer: QueryAnalyzer = QueryAnalyzer(
             context=context,
@@ -414,6 +423,37 @@ class Star:
         registry = ScalarFunctionRegistry.get_instance()
         return registry.list_functions()
 
+    def analyze(
+        self,
+        tables: list[str] | None = None,
+        *,
+        column_groups: dict[str, list[tuple[str, ...]]] | None = None,
+        path: str | None = None,
+    ) -> list[str]:
+        """Collect full-table planner statistics (``ANALYZE``).
+
+        Profiles *tables* (default: all) with HyperLogLog NDV,
+        most-common values, histograms and relationship degree
+        distributions; see :mod:`pycypher.statistics_catalog`.  Mutated
+        tables are refreshed automatically on next use.
+
+        Args:
+            tables: Entity/relationship types to analyze.
+            column_groups: Extra multi-column NDV sketches per table.
+            path: If given, also persist the catalog to this JSON file so a
+                later process can restore it with
+                ``star.context.statistics.load(path)``.
+
+        Returns:
+            The names of the analyzed tables.
+
+        """
+        catalog = self.context.statistics
+        analyzed = catalog.analyze(tables, column_groups=column_groups)
+        if path is not None:
+            catalog.save(path)
+        return analyzed
+
     # ------------------------------------------------------------------
     # Delegation to extracted components
     # ------------------------------------------------------------------
@@ -506,6 +546,29 @@ class Star:
         """Create a seed frame — delegates to :class:`FrameJoiner`."""
         return self._frame_joiner.make_seed_frame()
 
+    def _prefetch_referenced_properties(self, query: Any) -> None:
+        """Convert the property columns *query* reads before it executes.
+
+        Property arrays are otherwise converted from Arrow one column at a
+        time on first lookup.  The columns each label and relationship type
+        needs are known from the AST, so they are converted here in a single
+        projection per table; columns the query never reads stay in Arrow.
+        """
+        from pycypher.ingestion.scan_pushdown import plan_source_scans
+
+        index_mgr = getattr(self.context, "index_manager", None)
+        if index_mgr is None:
+            return
+        try:
+            plan = plan_source_scans([query])
+        except (KeyError, ValueError, TypeError, AttributeError):
+            LOGGER.debug("property prefetch planning failed", exc_info=True)
+            return
+        specs = {**plan.entities, **plan.relationships}
+        for name, spec in specs.items():
+            if spec.columns:
+                index_mgr.prefetch_properties(name, sorted(spec.columns))
+
     def _execute_query_binding_frame(self, query: Any) -> pd.DataFrame:
         """Execute with query-scoped shadow write atomicity."""
         result = self._clause_executor.execute_query_binding_frame(query)
@@ -580,6 +643,8 @@ class Star:
         query: str | Any,
         uri: str,
         fmt: Any | None = None,
+        *,
+        parquet: Any | None = None,
     ) -> bool:
         """Stream an *eligible* query's result straight to *uri* (out-of-core).
 
@@ -594,6 +659,9 @@ class Star:
             uri: Destination URI (bare path / ``file://``; cloud is rejected).
             fmt: Optional explicit output format; inferred from the extension
                 when ``None``.
+            parquet: Optional
+                :class:`~pycypher.ingestion.config.ParquetLayoutConfig` for
+                a partitioned / tuned Parquet output.
 
         Returns:
             ``True`` if the query was streamed, ``False`` if not eligible.
@@ -614,7 +682,7 @@ class Star:
             return False
 
         bindings = execute_relation_query(ast, self.context, materialize=False)
-        write_relation_to_uri(bindings.lazy, uri, fmt)
+        write_relation_to_uri(bindings.lazy, uri, fmt, parquet=parquet)
         return True
 
     def execute_query(
@@ -625,6 +693,8 @@ class Star:
         timeout_seconds: float | None = None,
         memory_budget_bytes: int | None = None,
         max_complexity_score: int | None = None,
+        cancel_token: CancellationToken | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> pd.DataFrame:
         """Execute a complete Cypher query and return results as DataFrame.
 
@@ -634,6 +704,11 @@ class Star:
             timeout_seconds: Optional wall-clock timeout in seconds.
             memory_budget_bytes: Optional peak-memory budget in bytes.
             max_complexity_score: Optional ceiling for query complexity score.
+            cancel_token: Optional token; cancelling it (from any thread)
+                stops the query at its next cooperative check.
+            on_progress: Optional callback receiving
+                :class:`~pycypher.cancellation.OperatorProgress` snapshots
+                from long-running operators, on the query's thread.
 
         Returns:
             DataFrame with columns matching the RETURN clause aliases.
@@ -642,6 +717,7 @@ class Star:
             ValueError: If query structure is invalid.
             NotImplementedError: For unsupported clause types.
             QueryTimeoutError: If execution exceeds *timeout_seconds*.
+            QueryCancelledError: If *cancel_token* is cancelled.
             QueryMemoryBudgetError: If estimated memory exceeds budget.
             QueryComplexityError: If complexity score exceeds threshold.
 
@@ -674,6 +750,13 @@ class Star:
                 msg = f"timeout_seconds must be non-negative, got {_effective_timeout}"
                 raise ValueError(msg)
 
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            _progress = ProgressReporter(
+                [on_progress] if on_progress is not None else (),
+            )
+            self.context.set_cancellation(cancel_token, _progress)
+
             # Inject parameters into the shared context.
             self.context._parameters.clear()
             if parameters:
@@ -692,6 +775,7 @@ class Star:
             _rss_before = get_rss_mb()
             self._last_clause_timings: dict[str, float] = {}
             self._last_clause_memory: dict[str, float] = {}
+            self._last_operator_progress: dict[str, OperatorProgress] = {}
             self.context.set_memory_budget_bytes(memory_budget_bytes)
             _parse_elapsed_ms: float | None = None
 
@@ -711,6 +795,17 @@ class Star:
                 parameters=parameters,
             )
             _otel_span = _otel_cm.__enter__()
+            _progress.add_callback(
+                lambda p: _otel_span.add_event(
+                    "pycypher.progress",
+                    {
+                        "operator": p.operator,
+                        "processed": p.processed,
+                        "total": -1 if p.total is None else p.total,
+                        "unit": p.unit,
+                    },
+                ),
+            )
 
             # --- Result cache: fast path for repeated read-only queries ---
             _NON_DETERMINISTIC = {"rand(", "randomuuid(", "timestamp("}
@@ -884,6 +979,12 @@ class Star:
                     "pycypher.memory_delta_mb", round(_mem_delta, 2)
                 )
                 _otel_span.set_attribute("pycypher.cached", False)
+                self._last_operator_progress = _progress.totals
+                for _op, _op_progress in self._last_operator_progress.items():
+                    _otel_span.set_attribute(
+                        f"pycypher.operator.{_op}.{_op_progress.unit}",
+                        _op_progress.processed,
+                    )
                 if _parse_elapsed_ms is not None:
                     _otel_span.set_attribute(
                         "pycypher.parse_time_ms", round(_parse_elapsed_ms, 2)
@@ -936,6 +1037,8 @@ class Star:
         timeout_seconds: float | None = None,
         memory_budget_bytes: int | None = None,
         max_complexity_score: int | None = None,
+        cancel_token: CancellationToken | None = None,
+        on_progress: ProgressCallback | None = None,
     ) -> pd.DataFrame:
         """Async wrapper around :meth:`execute_query`."""
         import asyncio
@@ -947,4 +1050,6 @@ class Star:
             timeout_seconds=timeout_seconds,
             memory_budget_bytes=memory_budget_bytes,
             max_complexity_score=max_complexity_score,
+            cancel_token=cancel_token,
+            on_progress=on_progress,
         )
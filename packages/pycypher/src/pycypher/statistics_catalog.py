@@ -0,0 +1,642 @@
+"""ANALYZE-style statistics catalog for a :class:`~pycypher.relational_models.Context`.
+
+:class:`~pycypher.cardinality_estimator.TableStatistics` samples a table the
+first time a planner asks for a column and forgets everything when the
+process exits.  The catalog adds an explicit, full-table ``ANALYZE`` step
+whose results are kept per table, persisted to disk, and refreshed only for
+the tables a mutation actually touched.
+
+For every analyzed table the catalog records:
+
+- per-column :class:`~pycypher.cardinality_estimator.ColumnStatistics` with
+  HyperLogLog NDV over the full column, most-common values, numeric
+  histograms and string-prefix histograms;
+- a :class:`~pycypher.sketches.HyperLogLog` sketch per column and per
+  requested column group, so multi-column NDV and join-key overlap between
+  tables can be estimated without rescanning;
+- :class:`~pycypher.cardinality_estimator.DegreeStatistics` (average and
+  maximum fan-out in each direction) for relationship tables.
+
+Freshness is tracked with a cheap content fingerprint.  ``commit_query()``
+marks mutated tables stale; the next lookup re-fingerprints the table and
+re-analyzes it only if its contents changed.  Persisted profiles whose
+fingerprint no longer matches the loaded data are discarded on
+:meth:`StatisticsCatalog.load`.
+
+Tables that were never analyzed still get sampled, lazily computed
+:class:`~pycypher.cardinality_estimator.TableStatistics`, cached here so that
+every :class:`~pycypher.query_planner.QueryPlanAnalyzer` shares them instead
+of re-sampling per query.
+
+Usage::
+
+    context.statistics.analyze()                      # all tables
+    context.statistics.analyze(["Person"], column_groups={"Person": [("city", "age")]})
+    context.statistics.save("data/graph.stats.json")  # next to the sources
+    ...
+    context.statistics.load("data/graph.stats.json")  # later process
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from shared.logger import LOGGER
+
+from pycypher.cardinality_estimator import (
+    ColumnStatistics,
+    DegreeStatistics,
+    TableStatistics,
+    profile_column,
+)
+from pycypher.constants import (
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+)
+from pycypher.sketches import HyperLogLog, hash_values
+
+if TYPE_CHECKING:
+    from pycypher.relational_models import Context
+
+__all__ = [
+    "StatisticsCatalog",
+    "TableProfile",
+    "table_fingerprint",
+]
+
+#: Version tag written to persisted catalogs; bumped on format changes.
+_FORMAT_VERSION: int = 1
+
+#: Rows hashed when fingerprinting a table (evenly spaced, plus shape).
+_FINGERPRINT_ROWS: int = 1024
+
+
+def _group_key(columns: Sequence[str]) -> str:
+    """Canonical sketch key for a column group."""
+    return ",".join(sorted(columns))
+
+
+def _as_pandas(source: Any) -> pd.DataFrame | None:
+    """Materialise a table source as pandas, or ``None`` if unsupported."""
+    if isinstance(source, pd.DataFrame):
+        return source
+    if hasattr(source, "to_pandas"):
+        return source.to_pandas()
+    return None
+
+
+def _safe_hashes(values: pd.Series | pd.DataFrame) -> np.ndarray:
+    """Hash *values*, falling back to their string form for unhashable cells."""
+    try:
+        return hash_values(values)
+    except TypeError:
+        return hash_values(values.astype(str))
+
+
+def table_fingerprint(df: pd.DataFrame) -> str:
+    """Return a cheap content fingerprint for *df*.
+
+    Combines the shape, the column names and hashes of up to
+    ``_FINGERPRINT_ROWS`` evenly spaced rows.  Appends, deletes and most
+    in-place edits change it; it is a staleness check, not a checksum.
+    """
+    n = len(df)
+    parts = [str(n), ",".join(map(str, df.columns))]
+    if n:
+        positions = np.unique(
+            np.linspace(0, n - 1, min(n, _FINGERPRINT_ROWS)).astype(np.intp),
+        )
+        hashes = _safe_hashes(df.iloc[positions])
+        parts.append(format(int(np.bitwise_xor.reduce(hashes)), "016x"))
+        parts.append(format(int(hashes.sum(dtype=np.uint64)), "016x"))
+    return ":".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Per-table profile
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class TableProfile:
+    """``ANALYZE`` results for one entity or relationship table.
+
+    Attributes:
+        name: Entity or relationship type.
+        kind: ``"entity"`` or ``"relationship"``.
+        row_count: Rows in the table when it was analyzed.
+        fingerprint: :func:`table_fingerprint` of the analyzed data.
+        columns: Per-column statistics.
+        sketches: HyperLogLog sketches keyed by column name, or by the
+            comma-joined sorted names of a column group.
+        degrees: Fan-out statistics (relationship tables only).
+        analyzed_at: Unix timestamp of the analysis.
+
+    """
+
+    name: str
+    kind: str
+    row_count: int
+    fingerprint: str
+    columns: dict[str, ColumnStatistics] = field(default_factory=dict)
+    sketches: dict[str, HyperLogLog] = field(default_factory=dict)
+    degrees: DegreeStatistics | None = None
+    analyzed_at: float = 0.0
+
+    @classmethod
+    def build(
+        cls,
+        name: str,
+        kind: str,
+        df: pd.DataFrame,
+        column_groups: Iterable[Sequence[str]] = (),
+    ) -> TableProfile:
+        """Analyze *df* in full and return its profile."""
+        profile = cls(
+            name=name,
+            kind=kind,
+            row_count=len(df),
+            fingerprint=table_fingerprint(df),
+            analyzed_at=time.time(),
+        )
+        for column in df.columns:
+            series = df[column]
+            sketch = HyperLogLog()
+            non_null = series.dropna()
+            if len(non_null):
+                sketch.add_hashes(_safe_hashes(non_null))
+            profile.sketches[str(column)] = sketch
+            try:
+                profile.columns[str(column)] = profile_column(
+                    series,
+                    ndv=min(round(sketch.estimate()), len(non_null)),
+                )
+            except (TypeError, ValueError, ArithmeticError) as exc:
+                LOGGER.debug(
+                    "ANALYZE skipped column %s.%s: %s",
+                    name,
+                    column,
+                    exc,
+                )
+        groups = list(column_groups)
+        if kind == "relationship" and {
+            RELATIONSHIP_SOURCE_COLUMN,
+            RELATIONSHIP_TARGET_COLUMN,
+        } <= set(df.columns):
+            groups.append(
+                (RELATIONSHIP_SOURCE_COLUMN, RELATIONSHIP_TARGET_COLUMN),
+            )
+            profile.degrees = DegreeStatistics.from_frame(df)
+        for group in groups:
+            missing = [c for c in group if c not in df.columns]
+            if missing:
+                LOGGER.warning(
+                    "ANALYZE %s: column group %s references unknown columns %s",
+                    name,
+                    tuple(group),
+                    missing,
+                )
+                continue
+            rows = df[list(group)].dropna()
+            sketch = HyperLogLog()
+            if len(rows):
+                sketch.add_hashes(_safe_hashes(rows))
+            profile.sketches[_group_key(group)] = sketch
+        return profile
+
+    @property
+    def column_groups(self) -> list[tuple[str, ...]]:
+        """Column groups with a multi-column sketch."""
+        return [tuple(key.split(",")) for key in self.sketches if "," in key]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise to a JSON-compatible mapping."""
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "row_count": self.row_count,
+            "fingerprint": self.fingerprint,
+            "analyzed_at": self.analyzed_at,
+            "columns": {c: s.to_dict() for c, s in self.columns.items()},
+            "sketches": {k: s.to_dict() for k, s in self.sketches.items()},
+            "degrees": self.degrees.to_dict() if self.degrees else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TableProfile:
+        """Rebuild a profile serialised by :meth:`to_dict`."""
+        return cls(
+            name=data["name"],
+            kind=data["kind"],
+            row_count=int(data["row_count"]),
+            fingerprint=data["fingerprint"],
+            analyzed_at=float(data.get("analyzed_at", 0.0)),
+            columns={
+                c: ColumnStatistics.from_dict(s)
+                for c, s in data.get("columns", {}).items()
+            },
+            sketches={
+                k: HyperLogLog.from_dict(s)
+                for k, s in data.get("sketches", {}).items()
+            },
+            degrees=(
+                DegreeStatistics.from_dict(data["degrees"])
+                if data.get("degrees")
+                else None
+            ),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+
+
+class StatisticsCatalog:
+    """Statistics for every table of a context.
+
+    Created lazily by :attr:`Context.statistics
+    <pycypher.relational_models.Context.statistics>`; not normally
+    instantiated directly.  Thread-safe.
+
+    Args:
+        context: The context whose entity and relationship tables are
+            profiled.
+
+    """
+
+    def __init__(self, context: Context) -> None:
+        self._context = context
+        self._lock = threading.RLock()
+        self._profiles: dict[str, TableProfile] = {}
+        self._column_groups: dict[str, list[tuple[str, ...]]] = {}
+        self._stale: set[str] = set()
+        # name -> (id(source_obj) at analysis time) — detects replaced tables.
+        self._source_ids: dict[str, int] = {}
+        # name -> (id(source_obj), sampled TableStatistics)
+        self._sampled: dict[str, tuple[int, TableStatistics]] = {}
+
+    # -- table access --------------------------------------------------------
+
+    def _table(self, name: str) -> tuple[str, Any] | None:
+        """Return ``(kind, source_obj)`` for *name*, or ``None``."""
+        entities = self._context.entity_mapping.mapping
+        if name in entities:
+            return "entity", entities[name].source_obj
+        relationships = self._context.relationship_mapping.mapping
+        if name in relationships:
+            return "relationship", relationships[name].source_obj
+        return None
+
+    def _all_tables(self) -> list[str]:
+        return list(self._context.entity_mapping.mapping) + list(
+            self._context.relationship_mapping.mapping,
+        )
+
+    # -- ANALYZE -------------------------------------------------------------
+
+    def analyze(
+        self,
+        tables: Iterable[str] | None = None,
+        *,
+        column_groups: Mapping[str, Iterable[Sequence[str]]] | None = None,
+    ) -> list[str]:
+        """Profile *tables* (default: all) in full and store the results.
+
+        Args:
+            tables: Entity and/or relationship type names.
+            column_groups: Extra multi-column sketches per table, e.g.
+                ``{"Person": [("city", "age")]}``.  Groups are remembered
+                and rebuilt on every later refresh of that table.
+
+        Returns:
+            The names of the tables that were analyzed.
+
+        Raises:
+            KeyError: If a table name is not registered in the context.
+
+        """
+        names = list(tables) if tables is not None else self._all_tables()
+        for name in names:
+            if self._table(name) is None:
+                msg = f"Cannot ANALYZE unknown table {name!r}"
+                raise KeyError(msg)
+        analyzed: list[str] = []
+        with self._lock:
+            for table, groups in (column_groups or {}).items():
+                known = self._column_groups.setdefault(table, [])
+                for group in groups:
+                    if tuple(group) not in known:
+                        known.append(tuple(group))
+            for name in names:
+                if self._analyze_one(name):
+                    analyzed.append(name)
+        return analyzed
+
+    def _analyze_one(self, name: str) -> bool:
+        table = self._table(name)
+        if table is None:
+            return False
+        kind, source = table
+        df = _as_pandas(source)
+        if df is None:
+            LOGGER.warning(
+                "ANALYZE %s: source of type %s cannot be profiled",
+                name,
+                type(source).__name__,
+            )
+            return False
+        started = time.perf_counter()
+        profile = TableProfile.build(
+            name,
+            kind,
+            df,
+            self._column_groups.get(name, ()),
+        )
+        self._profiles[name] = profile
+        self._source_ids[name] = id(source)
+        self._stale.discard(name)
+        self._sampled.pop(name, None)
+        LOGGER.debug(
+            "ANALYZE %s: %d rows, %d columns in %.3fs",
+            name,
+            profile.row_count,
+            len(profile.columns),
+            time.perf_counter() - started,
+        )
+        return True
+
+    # -- freshness -----------------------------------------------------------
+
+    def invalidate(self, tables: Iterable[str] | None = None) -> None:
+        """Mark *tables* (default: all) as possibly changed.
+
+        Called by :meth:`Context.commit_query
+        <pycypher.relational_models.Context.commit_query>` for the tables a
+        query mutated.  Stale profiles are re-checked on next use.
+        """
+        with self._lock:
+            names = list(tables) if tables is not None else self._all_tables()
+            for name in names:
+                self._sampled.pop(name, None)
+                if name in self._profiles:
+                    self._stale.add(name)
+
+    def refresh(self) -> list[str]:
+        """Re-analyze every stale table whose contents changed.
+
+        Returns:
+            The names of the tables that were re-analyzed.
+
+        """
+        with self._lock:
+            return [
+                name
+                for name in sorted(self._stale | self._replaced_tables())
+                if self._refresh_one(name)
+            ]
+
+    def _replaced_tables(self) -> set[str]:
+        """Analyzed tables whose source object has been swapped out."""
+        replaced = set()
+        for name, source_id in self._source_ids.items():
+            table = self._table(name)
+            if table is not None and id(table[1]) != source_id:
+                replaced.add(name)
+        return replaced
+
+    def _refresh_one(self, name: str) -> bool:
+        """Re-analyze *name* if its fingerprint changed; drop it if gone."""
+        table = self._table(name)
+        if table is None:
+            self._profiles.pop(name, None)
+            self._source_ids.pop(name, None)
+            self._stale.discard(name)
+            return False
+        df = _as_pandas(table[1])
+        profile = self._profiles.get(name)
+        if (
+            df is not None
+            and profile is not None
+            and table_fingerprint(df) == profile.fingerprint
+        ):
+            self._source_ids[name] = id(table[1])
+            self._stale.discard(name)
+            return False
+        return self._analyze_one(name)
+
+    def _fresh_profile(self, name: str) -> TableProfile | None:
+        """Return the profile for *name*, refreshing it first if stale."""
+        with self._lock:
+            if name not in self._profiles:
+                return None
+            table = self._table(name)
+            if name in self._stale or (
+                table is not None
+                and id(table[1]) != self._source_ids.get(name)
+            ):
+                self._refresh_one(name)
+            return self._profiles.get(name)
+
+    # -- lookups -------------------------------------------------------------
+
+    @property
+    def analyzed_tables(self) -> list[str]:
+        """Names of tables with an ``ANALYZE`` profile."""
+        with self._lock:
+            return sorted(self._profiles)
+
+    def is_analyzed(self, name: str) -> bool:
+        """Return whether *name* has an ``ANALYZE`` profile."""
+        with self._lock:
+            return name in self._profiles
+
+    def profile(self, name: str) -> TableProfile | None:
+        """Return the up-to-date ``ANALYZE`` profile for *name*, if any."""
+        return self._fresh_profile(name)
+
+    def table_statistics(self, name: str) -> TableStatistics | None:
+        """Return :class:`TableStatistics` for *name*.
+
+        Analyzed tables are served from their profile; other tables get a
+        cached, lazily sampled instance.  Returns ``None`` for unknown
+        tables.
+        """
+        table = self._table(name)
+        if table is None:
+            return None
+        profile = self._fresh_profile(name)
+        if profile is not None:
+            return TableStatistics.from_columns(
+                table[1],
+                profile.row_count,
+                profile.columns,
+            )
+        with self._lock:
+            cached = self._sampled.get(name)
+            if cached is not None and cached[0] == id(table[1]):
+                return cached[1]
+            stats = TableStatistics(table[1])
+            self._sampled[name] = (id(table[1]), stats)
+            return stats
+
+    def column_statistics(
+        self,
+        name: str,
+        column: str,
+    ) -> ColumnStatistics | None:
+        """Return statistics for ``name.column``, if available."""
+        stats = self.table_statistics(name)
+        return stats.column_stats(column) if stats is not None else None
+
+    def degree_statistics(self, rel_type: str) -> DegreeStatistics | None:
+        """Return fan-out statistics for an analyzed relationship type."""
+        profile = self._fresh_profile(rel_type)
+        return profile.degrees if profile is not None else None
+
+    def distinct_count(
+        self,
+        name: str,
+        columns: Sequence[str],
+    ) -> float | None:
+        """Estimated NDV of one column or of a column group.
+
+        Multi-column estimates require the group to have been requested via
+        ``analyze(column_groups=...)``.  Returns ``None`` when no sketch is
+        available.
+        """
+        profile = self._fresh_profile(name)
+        if profile is None:
+            return None
+        sketch = profile.sketches.get(_group_key(columns))
+        return sketch.estimate() if sketch is not None else None
+
+    def join_key_overlap(
+        self,
+        left: str,
+        left_column: str,
+        right: str,
+        right_column: str,
+    ) -> float | None:
+        """Estimated number of key values present in both columns.
+
+        Uses inclusion–exclusion over the column sketches:
+        ``|A ∩ B| = |A| + |B| - |A ∪ B|``.  Both tables must be analyzed.
+        """
+        left_profile = self._fresh_profile(left)
+        right_profile = self._fresh_profile(right)
+        if left_profile is None or right_profile is None:
+            return None
+        a = left_profile.sketches.get(left_column)
+        b = right_profile.sketches.get(right_column)
+        if a is None or b is None:
+            return None
+        union = a.copy().merge(b).estimate()
+        overlap = a.estimate() + b.estimate() - union
+        return max(0.0, min(overlap, a.estimate(), b.estimate()))
+
+    # -- persistence ---------------------------------------------------------
+
+    def save(self, path: str | os.PathLike[str]) -> Path:
+        """Write all profiles to *path* as JSON (atomically).
+
+        Stale profiles are refreshed first so the file matches the data.
+        """
+        self.refresh()
+        target = Path(path)
+        with self._lock:
+            payload = {
+                "version": _FORMAT_VERSION,
+                "column_groups": {
+                    name: [list(g) for g in groups]
+                    for name, groups in self._column_groups.items()
+                },
+                "tables": {
+                    name: profile.to_dict()
+                    for name, profile in self._profiles.items()
+                },
+            }
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=target.parent,
+            prefix=f".{target.name}.",
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(payload, fh)
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return target
+
+    def load(self, path: str | os.PathLike[str]) -> list[str]:
+        """Restore profiles saved by :meth:`save`.
+
+        Profiles are only accepted for tables that exist in the context and
+        whose current fingerprint matches the persisted one; everything else
+        is skipped (call :meth:`analyze` to rebuild it).
+
+        Returns:
+            The names of the tables whose profiles were restored.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+
+        """
+        with Path(path).open(encoding="utf-8") as fh:
+            payload = json.load(fh)
+        version = payload.get("version")
+        if version != _FORMAT_VERSION:
+            msg = (
+                f"Unsupported statistics catalog version {version!r} in "
+                f"{path} (expected {_FORMAT_VERSION})"
+            )
+            raise ValueError(msg)
+        restored: list[str] = []
+        with self._lock:
+            for name, groups in payload.get("column_groups", {}).items():
+                self._column_groups[name] = [tuple(g) for g in groups]
+            for name, data in payload.get("tables", {}).items():
+                table = self._table(name)
+                df = _as_pandas(table[1]) if table is not None else None
+                if df is None:
+                    continue
+                profile = TableProfile.from_dict(data)
+                if table_fingerprint(df) != profile.fingerprint:
+                    LOGGER.info(
+                        "Discarding persisted statistics for %s: data changed",
+                        name,
+                    )
+                    continue
+                self._profiles[name] = profile
+                self._source_ids[name] = id(table[1])
+                self._stale.discard(name)
+                self._sampled.pop(name, None)
+                restored.append(name)
+        return restored
+
+    def summary(self) -> dict[str, Any]:
+        """Return a JSON-friendly overview of the analyzed tables."""
+        with self._lock:
+            return {
+                name: {
+                    "kind": p.kind,
+                    "rows": p.row_count,
+                    "columns": len(p.columns),
+                    "column_groups": p.column_groups,
+                    "stale": name in self._stale,
+                    "analyzed_at": p.analyzed_at,
+                }
+                for name, p in sorted(self._profiles.items())
+            }
@@ -0,0 +1,169 @@
+"""Top-K candidate selection for ``ORDER BY … LIMIT``.
+
+A query such as ``MATCH (c:Contract) RETURN c ORDER BY c.amount DESC
+LIMIT 10`` only needs the first ``SKIP + LIMIT`` rows of the ordering, yet
+a full ``sort_values`` over the projected frame costs ``O(n log n)``.
+This module narrows the frame to a small *candidate* set first:
+
+1. Find the ``k``-th value of the leading ORDER BY key in linear time —
+   :func:`numpy.partition` for numeric and temporal keys, a per-chunk
+   :func:`heapq.nsmallest` / :func:`heapq.nlargest` merged at the end for
+   any other orderable values (strings, dates, ...).
+2. Keep every row whose leading key is at or before that value, plus the
+   rows whose nulls sort ahead of it under ``NULLS FIRST/LAST``.
+
+The candidate set is a superset of the first ``k`` rows under *any*
+tie-break on the remaining keys, so the caller sorts just the candidates
+with the normal multi-key sort and gets the same answer as sorting
+everything.  Ties on the leading key are kept, so the set can exceed
+``k`` when that key has few distinct values; it never drops a row the
+full sort would return.
+
+Integration
+~~~~~~~~~~~
+
+- :class:`~pycypher.projection_planner.ProjectionPlanner` prunes to the
+  candidates before its ORDER BY sort when :func:`use_top_k` says the
+  bound is small enough to pay off.
+- For grouped ``RETURN … ORDER BY <grouping key> LIMIT k`` the planner
+  calls :func:`top_k_candidates` with ``distinct=True`` *before*
+  aggregating, so only the rows of the first ``k`` groups are aggregated.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+#: Frames smaller than this are sorted directly.
+TOP_K_MIN_ROWS: int = 4096
+
+#: Use Top-K only when ``k * TOP_K_MIN_SELECTIVITY <= n``.
+TOP_K_MIN_SELECTIVITY: int = 8
+
+#: Rows per chunk for the heap-based path.
+HEAP_CHUNK_ROWS: int = 65_536
+
+_SCALAR_TYPES = (str, bytes, int, float, bool, np.generic, pd.Timestamp)
+
+
+def use_top_k(n_rows: int, k: int | None) -> bool:
+    """Return whether Top-K pruning is worthwhile for *k* of *n_rows*.
+
+    Args:
+        n_rows: Rows in the frame to be ordered.
+        k: ``SKIP + LIMIT`` bound, or ``None`` when there is no LIMIT.
+
+    Returns:
+        ``True`` when the frame is large and *k* a small fraction of it.
+
+    """
+    return (
+        k is not None
+        and n_rows >= TOP_K_MIN_ROWS
+        and k * TOP_K_MIN_SELECTIVITY <= n_rows
+    )
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray | None:
+    """Return *series* as ``float64`` (nulls as NaN), or ``None``."""
+    dtype = series.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        values = series.to_numpy(dtype="datetime64[ns]")
+        return np.where(
+            np.isnat(values),
+            np.nan,
+            values.view(np.int64).astype(np.float64),
+        )
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(
+        dtype,
+    ):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return None
+
+
+def _kth_numeric(
+    values: np.ndarray,
+    k: int,
+    *,
+    ascending: bool,
+) -> float:
+    position = k - 1 if ascending else len(values) - k
+    return float(np.partition(values, position)[position])
+
+
+def _kth_object(values: list[Any], k: int, *, ascending: bool) -> Any:
+    select = heapq.nsmallest if ascending else heapq.nlargest
+    best: list[Any] = []
+    for start in range(0, len(values), HEAP_CHUNK_ROWS):
+        chunk = values[start : start + HEAP_CHUNK_ROWS]
+        best = select(k, [*best, *select(k, chunk)])
+    return best[-1]
+
+
+def top_k_candidates(
+    series: pd.Series,
+    k: int,
+    *,
+    ascending: bool = True,
+    nulls_first: bool = False,
+    distinct: bool = False,
+) -> np.ndarray | None:
+    """Return a mask of the rows that can be among the first *k* rows.
+
+    Args:
+        series: Leading ORDER BY key, one value per row.
+        k: Number of leading rows needed (``SKIP + LIMIT``).
+        ascending: Sort direction of the key.
+        nulls_first: Whether nulls sort before every value.
+        distinct: Select the rows holding the first *k* distinct values
+            instead of the first *k* rows — used to keep whole groups
+            before a grouped aggregation.  Null rows are then always kept
+            since a null group may or may not be produced.
+
+    Returns:
+        Boolean mask aligned with *series*, or ``None`` when the values
+        cannot be ordered this way (mixed or container types) and the
+        caller should sort everything.
+
+    """
+    isna = series.isna().to_numpy(dtype=bool)
+    present = ~isna
+    if distinct:
+        needed, keep_nulls = k, True
+    else:
+        n_null = int(isna.sum())
+        if nulls_first and n_null >= k:
+            return isna
+        needed = k - n_null if nulls_first else k
+        keep_nulls = nulls_first or int(present.sum()) < k
+
+    numeric = _numeric_values(series)
+    try:
+        if numeric is not None:
+            values = numeric[present]
+            if distinct:
+                values = pd.unique(values)
+            if len(values) <= needed:
+                return present | isna if keep_nulls else present
+            kth = _kth_numeric(values, needed, ascending=ascending)
+            within = numeric <= kth if ascending else numeric >= kth
+        else:
+            values = series[present].tolist()
+            if distinct:
+                values = list(dict.fromkeys(values))
+            if len(values) <= needed:
+                return present | isna if keep_nulls else present
+            kth = _kth_object(values, needed, ascending=ascending)
+            if not isinstance(kth, _SCALAR_TYPES):
+                return None
+            within = series <= kth if ascending else series >= kth
+            within = within.to_numpy(dtype=bool, na_value=False)
+    except TypeError:
+        return None
+    mask = present & within
+    return mask | isna if keep_nulls else mask
@@ -41,10 +41,33 @@ import time
 from pathlib import Path
 from typing import Any, Protocol
 
+from shared.metrics import LogHistogram
+
 _logger = logging.getLogger(__name__)
 
 _PREFIX: str = os.environ.get("PYCYPHER_METRICS_PREFIX", "pycypher")
 
+# Upper bounds (ms) of the classic Prometheus ``le`` buckets derived from
+# the collector's log histograms (the text format has no native, sparse
+# histograms).  Fixed so every scrape has the same series.
+_DURATION_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+)
+
 
 # ---------------------------------------------------------------------------
 # Exporter protocol
@@ -120,6 +143,31 @@ class PrometheusExporter:
             lines.append(f"# TYPE {p}_{name} counter")
             lines.append(f"{p}_{name} {value}")
 
+        def _histogram(
+            name: str,
+            help_text: str,
+            series: dict[str, LogHistogram],
+        ) -> None:
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} histogram")
+            for labels, hist in series.items():
+                prefix = f"{labels}," if labels else ""
+                counts = hist.cumulative_counts(_DURATION_BUCKETS_MS)
+                for bound, count in zip(
+                    _DURATION_BUCKETS_MS,
+                    counts,
+                    strict=True,
+                ):
+                    lines.append(
+                        f'{p}_{name}_bucket{{{prefix}le="{bound}"}} {count}',
+                    )
+                lines.append(
+                    f'{p}_{name}_bucket{{{prefix}le="+Inf"}} {hist.count}',
+                )
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{p}_{name}_sum{suffix} {round(hist.total, 3)}")
+                lines.append(f"{p}_{name}_count{suffix} {hist.count}")
+
         # Core counters
         _counter(
             "queries_total",
@@ -164,6 +212,25 @@ class PrometheusExporter:
             round(snapshot.timing_max_ms, 2),
         )
 
+        # Latency distributions, straight from the collector's histograms
+        timing_hist = getattr(snapshot, "timing_histogram_ms", None)
+        if isinstance(timing_hist, LogHistogram):
+            _histogram(
+                "query_duration_ms",
+                "Query execution time in milliseconds.",
+                {"": timing_hist},
+            )
+        clause_hists = getattr(snapshot, "clause_timing_histograms_ms", None)
+        if isinstance(clause_hists, dict) and clause_hists:
+            _histogram(
+                "clause_duration_ms",
+                "Per-clause execution time in milliseconds.",
+                {
+                    'clause="{}"'.format(clause.replace('"', "")): hist
+                    for clause, hist in clause_hists.items()
+                },
+            )
+
         # Throughput
         _gauge(
             "queries_per_second",
@@ -369,6 +436,28 @@ class StatsDExporter:
         self._send("parse.p50_ms", snapshot.parse_time_p50_ms, "g")
         self._send("plan.p50_ms", snapshot.plan_time_p50_ms, "g")
 
+        timing_hist = getattr(snapshot, "timing_histogram_ms", None)
+        if isinstance(timing_hist, LogHistogram) and timing_hist.count:
+            self._send("query.duration.mean_ms", timing_hist.mean(), "g")
+            self._send(
+                "query.duration.p999_ms",
+                timing_hist.percentile(0.999),
+                "g",
+            )
+        clause_hists = getattr(snapshot, "clause_timing_histograms_ms", None)
+        if isinstance(clause_hists, dict):
+            for clause, hist in clause_hists.items():
+                self._send(
+                    f"clause.{clause}.p50_ms",
+                    hist.percentile(0.5),
+                    "g",
+                )
+                self._send(
+                    f"clause.{clause}.p99_ms",
+                    hist.percentile(0.99),
+                    "g",
+                )
+
         status_map = {"healthy": 0, "degraded": 1, "unhealthy": 2}
         self._send(
             "health_status",
@@ -414,6 +503,10 @@ class JSONFileExporter:
     def export(self, snapshot: Any) -> None:
         """Append a JSON-lines entry for the snapshot.
 
+        Histograms are written as their occupied buckets (see
+        :meth:`~shared.metrics.LogHistogram.to_dict`), so consumers can
+        compute any percentile offline.
+
         Args:
             snapshot: A :class:`~shared.metrics.MetricsSnapshot`.
 
@@ -5,8 +5,10 @@ rates, and slow-query detection — without requiring an external metrics
 backend.  All data lives in-process and is designed for diagnostic access
 via ``QueryMetrics.snapshot()``.
 
-The collector is **thread-safe** (uses a :class:`threading.Lock`) for
-compatibility with the free-threaded Python 3.14t build.
+The collector is **thread-safe** and compatible with the free-threaded
+Python 3.14t build: each recording thread writes to its own counters and
+HDR-style :class:`LogHistogram` instances, which ``snapshot()`` merges.
+Memory use is constant per thread and percentiles cost O(buckets).
 
 Enable/disable via the ``PYCYPHER_METRICS_ENABLED`` environment variable
 (default: enabled).  When disabled, all recording methods are no-ops.
@@ -45,13 +47,15 @@ Attributes:
 from __future__ import annotations
 
 import logging
+import math
 import os
 import resource
-import statistics
 import threading
 import time
+import weakref
 from collections import Counter
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
 from typing import Any
 
 _logger = logging.getLogger(__name__)
@@ -82,8 +86,11 @@ _ENABLED: bool = os.environ.get(
     "no",
 )
 
-# Maximum number of recent timing samples to keep (rolling window).
-_MAX_SAMPLES: int = 1000
+# Sub-buckets per power of two in :class:`LogHistogram` (~1.6% resolution).
+_SUB_BUCKETS: int = 32
+
+# Width of the window behind the ``recent_*`` rates, in seconds.
+_RATE_WINDOW_S: int = 60
 
 # macOS reports ru_maxrss in bytes; Linux in kilobytes.
 _RUSAGE_DIVISOR: float = (
@@ -104,6 +111,146 @@ def get_rss_mb() -> float:
         return 0.0
 
 
+class LogHistogram:
+    """HDR-style log-linear histogram with bounded relative error.
+
+    Every power-of-two range is split into :data:`_SUB_BUCKETS` equal-width
+    sub-buckets, so a value is placed in a bucket whose width is at most
+    ``1 / _SUB_BUCKETS`` of its magnitude.  Bucket counts live in sparse
+    dictionaries keyed by bucket index: memory is bounded by the number of
+    distinct buckets touched rather than by the number of samples, and a
+    percentile query walks the occupied buckets once.  ``count``,
+    ``total``, ``min`` and ``max`` are exact.  Negative values (memory can
+    shrink during a query) are recorded in a mirrored set of buckets.
+
+    Instances are not thread-safe on their own; :class:`QueryMetrics`
+    gives every recording thread private histograms and merges them on
+    snapshot.
+    """
+
+    __slots__ = (
+        "_negative",
+        "_positive",
+        "_zeros",
+        "count",
+        "max",
+        "min",
+        "total",
+    )
+
+    def __init__(self) -> None:
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zeros: int = 0
+        self.count: int = 0
+        self.total: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    @staticmethod
+    def _index(magnitude: float) -> int:
+        mantissa, exponent = math.frexp(magnitude)
+        sub = int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+        return exponent * _SUB_BUCKETS + sub
+
+    @staticmethod
+    def _midpoint(index: int) -> float:
+        exponent, sub = divmod(index, _SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub + 0.5) / (2 * _SUB_BUCKETS), exponent)
+
+    def record(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value > 0.0:
+            index = self._index(value)
+            self._positive[index] = self._positive.get(index, 0) + 1
+        elif value < 0.0:
+            index = self._index(-value)
+            self._negative[index] = self._negative.get(index, 0) + 1
+        else:
+            self._zeros += 1
+
+    def merge(self, other: LogHistogram) -> None:
+        """Add every observation of *other* to this histogram in place."""
+        if not other.count:
+            return
+        for index, n in other._positive.items():
+            self._positive[index] = self._positive.get(index, 0) + n
+        for index, n in other._negative.items():
+            self._negative[index] = self._negative.get(index, 0) + n
+        self._zeros += other._zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _buckets(self) -> list[tuple[float, int]]:
+        """Return ``(representative value, count)`` pairs in value order."""
+        buckets = [
+            (-self._midpoint(index), self._negative[index])
+            for index in sorted(self._negative, reverse=True)
+        ]
+        if self._zeros:
+            buckets.append((0.0, self._zeros))
+        buckets.extend(
+            (self._midpoint(index), self._positive[index])
+            for index in sorted(self._positive)
+        )
+        return buckets
+
+    def percentile(self, pct: float) -> float:
+        """Return the value at fraction *pct* (e.g. ``0.99``), or 0.0 if empty.
+
+        Uses the nearest-rank definition and reports the midpoint of the
+        bucket holding that rank, clamped to the exact ``[min, max]``.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct * self.count))
+        seen = 0
+        for value, n in self._buckets():
+            seen += n
+            if seen >= rank:
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """Return the exact arithmetic mean, or 0.0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> list[int]:
+        """Return the number of observations ``<= bound`` for each bound.
+
+        Resolution is one bucket: observations are attributed to their
+        bucket's midpoint.  *bounds* must be ascending.
+        """
+        counts: list[int] = []
+        buckets = self._buckets()
+        position = 0
+        seen = 0
+        for bound in bounds:
+            while position < len(buckets) and buckets[position][0] <= bound:
+                seen += buckets[position][1]
+                position += 1
+            counts.append(seen)
+        return counts
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary with the occupied buckets."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "buckets": [[value, n] for value, n in self._buckets()],
+        }
+
+
 @dataclass(frozen=True)
 class MetricsSnapshot:
     """Immutable point-in-time view of collected metrics.
@@ -121,6 +268,9 @@ class MetricsSnapshot:
         timing_min_ms: Minimum observed execution time in milliseconds.
         total_rows_returned: Cumulative rows returned across all queries.
         uptime_s: Seconds since the collector was created.
+        timing_histogram_ms: Merged query-time histogram, for exporters
+            that publish bucket distributions.
+        clause_timing_histograms_ms: Merged per-clause-type histograms.
 
     """
 
@@ -161,6 +311,16 @@ class MetricsSnapshot:
     result_cache_size_mb: float = 0.0
     result_cache_entries: int = 0
     result_cache_evictions: int = 0
+    timing_histogram_ms: LogHistogram | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    clause_timing_histograms_ms: dict[str, LogHistogram] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
 
     def summary(self) -> str:
         """Return a human-readable diagnostic summary.
@@ -431,13 +591,131 @@ class MetricsSnapshot:
         Useful for programmatic access, log aggregation pipelines, and
         external monitoring integrations.
 
+        Histograms are rendered with :meth:`LogHistogram.to_dict`.
+
         Returns:
             A dictionary with all metric fields as key-value pairs.
 
         """
-        from dataclasses import asdict
+        result: dict[str, Any] = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, LogHistogram):
+                value = value.to_dict()
+            elif isinstance(value, dict):
+                value = {
+                    k: v.to_dict() if isinstance(v, LogHistogram) else v
+                    for k, v in value.items()
+                }
+            result[f.name] = value
+        return result
+
+
+class _Shard:
+    """One recording thread's private slice of a :class:`QueryMetrics`.
+
+    Only the owning thread records into a shard; its ``lock`` is taken by
+    the owner and, briefly, by ``snapshot()`` and ``reset()``, so it is
+    uncontended on the hot path.
+    """
+
+    __slots__ = (
+        "clause_counts",
+        "clause_timings",
+        "error_counts",
+        "error_slots",
+        "errors",
+        "lock",
+        "memory_deltas",
+        "owner",
+        "parse_times",
+        "plan_times",
+        "planner_abs_error_sum",
+        "planner_ratios",
+        "queries",
+        "query_slots",
+        "rows",
+        "slow",
+        "timings",
+    )
 
-        return asdict(self)
+    def __init__(self, owner: threading.Thread | None = None) -> None:
+        self.lock = threading.Lock()
+        self.owner = weakref.ref(owner) if owner is not None else None
+        self.clear()
+
+    def clear(self) -> None:
+        """Zero every counter and histogram."""
+        self.queries = 0
+        self.errors = 0
+        self.slow = 0
+        self.rows = 0
+        self.error_counts: Counter[str] = Counter()
+        self.clause_counts: Counter[str] = Counter()
+        self.timings = LogHistogram()
+        self.memory_deltas = LogHistogram()
+        self.parse_times = LogHistogram()
+        self.plan_times = LogHistogram()
+        self.planner_ratios = LogHistogram()
+        self.planner_abs_error_sum = 0.0
+        self.clause_timings: dict[str, LogHistogram] = {}
+        # Per-second rings for the recent-rate window: slot ``s % W`` holds
+        # ``[second, count]`` for the most recent second that mapped to it.
+        self.query_slots = [[-1, 0] for _ in range(_RATE_WINDOW_S)]
+        self.error_slots = [[-1, 0] for _ in range(_RATE_WINDOW_S)]
+
+    def alive(self) -> bool:
+        """Return False once the owning thread has exited."""
+        if self.owner is None:
+            return True
+        thread = self.owner()
+        return thread is not None and thread.is_alive()
+
+    def merge_into(self, target: _Shard) -> None:
+        """Add this shard's state to *target*."""
+        target.queries += self.queries
+        target.errors += self.errors
+        target.slow += self.slow
+        target.rows += self.rows
+        target.error_counts.update(self.error_counts)
+        target.clause_counts.update(self.clause_counts)
+        target.timings.merge(self.timings)
+        target.memory_deltas.merge(self.memory_deltas)
+        target.parse_times.merge(self.parse_times)
+        target.plan_times.merge(self.plan_times)
+        target.planner_ratios.merge(self.planner_ratios)
+        target.planner_abs_error_sum += self.planner_abs_error_sum
+        for clause_name, histogram in self.clause_timings.items():
+            target.clause_timings.setdefault(
+                clause_name,
+                LogHistogram(),
+            ).merge(histogram)
+        _merge_slots(self.query_slots, target.query_slots)
+        _merge_slots(self.error_slots, target.error_slots)
+
+
+def _tick(slots: list[list[int]], second: int) -> None:
+    """Count one event at *second* in a per-second ring."""
+    slot = slots[second % _RATE_WINDOW_S]
+    if slot[0] != second:
+        slot[0] = second
+        slot[1] = 0
+    slot[1] += 1
+
+
+def _merge_slots(source: list[list[int]], target: list[list[int]]) -> None:
+    """Add the ring *source* into *target*, keeping the newer second."""
+    for src, dst in zip(source, target, strict=True):
+        if src[0] == dst[0]:
+            dst[1] += src[1]
+        elif src[0] > dst[0]:
+            dst[0], dst[1] = src[0], src[1]
+
+
+def _recent(slots: list[list[int]], second: int) -> int:
+    """Return the number of events in the window ending at *second*."""
+    cutoff = second - _RATE_WINDOW_S
+    return sum(count for slot_second, count in slots if slot_second > cutoff)
 
 
 @dataclass
@@ -445,28 +723,38 @@ class QueryMetrics:
     """Thread-safe in-process query metrics collector.
 
     Records query execution statistics and provides diagnostic snapshots.
-    All mutating methods acquire ``_lock`` before modifying internal state.
+    Each recording thread writes to its own :class:`_Shard` — counters plus
+    :class:`LogHistogram` instances — so concurrent queries never contend
+    on a shared lock.  ``snapshot()`` merges the shards; shards of exited
+    threads are folded into a retired shard when new threads register.
+    Memory is constant per thread and percentiles cost O(buckets).
     """
 
-    _total_queries: int = 0
-    _total_errors: int = 0
-    _slow_queries: int = 0
-    _total_rows: int = 0
-    _error_counts: Counter[str] = field(default_factory=Counter)
-    _clause_counts: Counter[str] = field(default_factory=Counter)
-    _timings_ms: list[float] = field(default_factory=list)
-    _memory_deltas_mb: list[float] = field(default_factory=list)
-    _clause_timings_ms: dict[str, list[float]] = field(default_factory=dict)
-    _parse_times_ms: list[float] = field(default_factory=list)
-    _query_timestamps: list[float] = field(default_factory=list)
-    _error_timestamps: list[float] = field(default_factory=list)
-    _planner_accuracy_ratios: list[float] = field(default_factory=list)
-    _planner_abs_errors_mb: list[float] = field(default_factory=list)
-    _plan_times_ms: list[float] = field(default_factory=list)
+    _shards: list[_Shard] = field(default_factory=lambda: [_Shard()])
+    _local: threading.local = field(default_factory=threading.local)
+    _registry_lock: threading.Lock = field(default_factory=threading.Lock)
     _cache_stats: dict[str, Any] = field(default_factory=dict)
-    _lock: threading.Lock = field(default_factory=threading.Lock)
     _created_at: float = field(default_factory=time.monotonic)
 
+    def _shard(self) -> _Shard:
+        """Return the calling thread's shard, registering it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard(threading.current_thread())
+            with self._registry_lock:
+                retired = self._shards[0]
+                live = [retired]
+                for other in self._shards[1:]:
+                    if other.alive():
+                        live.append(other)
+                        continue
+                    with other.lock, retired.lock:
+                        other.merge_into(retired)
+                live.append(shard)
+                self._shards = live
+            self._local.shard = shard
+        return shard
+
     def record_query(
         self,
         *,
@@ -500,77 +788,46 @@ class QueryMetrics:
         elapsed_ms = elapsed_s * 1000.0
         is_slow = elapsed_s > SLOW_QUERY_THRESHOLD_S
 
-        now = time.monotonic()
-        with self._lock:
-            self._total_queries += 1
-            self._total_rows += rows
-            if len(self._query_timestamps) >= _MAX_SAMPLES:
-                self._query_timestamps = self._query_timestamps[
-                    _MAX_SAMPLES // 2 :
-                ]
-            self._query_timestamps.append(now)
+        second = int(time.monotonic())
+        shard = self._shard()
+        with shard.lock:
+            shard.queries += 1
+            shard.rows += rows
+            _tick(shard.query_slots, second)
             if is_slow:
-                self._slow_queries += 1
-
-            # Rolling window — discard oldest samples when full.
-            if len(self._timings_ms) >= _MAX_SAMPLES:
-                self._timings_ms = self._timings_ms[_MAX_SAMPLES // 2 :]
-            self._timings_ms.append(elapsed_ms)
+                shard.slow += 1
+            shard.timings.record(elapsed_ms)
 
             if memory_delta_mb is not None:
-                if len(self._memory_deltas_mb) >= _MAX_SAMPLES:
-                    self._memory_deltas_mb = self._memory_deltas_mb[
-                        _MAX_SAMPLES // 2 :
-                    ]
-                self._memory_deltas_mb.append(memory_delta_mb)
+                shard.memory_deltas.record(memory_delta_mb)
 
             if clauses:
-                for clause_name in clauses:
-                    self._clause_counts[clause_name] += 1
+                shard.clause_counts.update(clauses)
 
             if clause_timings_ms:
                 for clause_name, timing in clause_timings_ms.items():
-                    samples = self._clause_timings_ms.setdefault(
-                        clause_name,
-                        [],
-                    )
-                    if len(samples) >= _MAX_SAMPLES:
-                        self._clause_timings_ms[clause_name] = samples[
-                            _MAX_SAMPLES // 2 :
-                        ]
-                    self._clause_timings_ms[clause_name].append(timing)
+                    histogram = shard.clause_timings.get(clause_name)
+                    if histogram is None:
+                        histogram = shard.clause_timings[clause_name] = (
+                            LogHistogram()
+                        )
+                    histogram.record(timing)
 
             if parse_time_ms is not None:
-                if len(self._parse_times_ms) >= _MAX_SAMPLES:
-                    self._parse_times_ms = self._parse_times_ms[
-                        _MAX_SAMPLES // 2 :
-                    ]
-                self._parse_times_ms.append(parse_time_ms)
+                shard.parse_times.record(parse_time_ms)
 
             if estimated_memory_mb is not None and memory_delta_mb is not None:
-                abs_err = abs(estimated_memory_mb - memory_delta_mb)
-                ratio = (
+                shard.planner_abs_error_sum += abs(
+                    estimated_memory_mb - memory_delta_mb,
+                )
+                shard.planner_ratios.record(
                     estimated_memory_mb / memory_delta_mb
                     if memory_delta_mb != 0.0
-                    else 0.0
+                    else 0.0,
                 )
-                if len(self._planner_accuracy_ratios) >= _MAX_SAMPLES:
-                    self._planner_accuracy_ratios = (
-                        self._planner_accuracy_ratios[_MAX_SAMPLES // 2 :]
-                    )
-                self._planner_accuracy_ratios.append(ratio)
-                if len(self._planner_abs_errors_mb) >= _MAX_SAMPLES:
-                    self._planner_abs_errors_mb = self._planner_abs_errors_mb[
-                        _MAX_SAMPLES // 2 :
-                    ]
-                self._planner_abs_errors_mb.append(abs_err)
 
             if plan_time_ms is not None:
-                if len(self._plan_times_ms) >= _MAX_SAMPLES:
-                    self._plan_times_ms = self._plan_times_ms[
-                        _MAX_SAMPLES // 2 :
-                    ]
-                self._plan_times_ms.append(plan_time_ms)
+                shard.plan_times.record(plan_time_ms)
 
         if is_slow:
             _logger.warning(
@@ -599,21 +856,19 @@ class QueryMetrics:
         if not _ENABLED:
             return
 
-        now = time.monotonic()
-        with self._lock:
-            self._total_errors += 1
-            self._error_counts[error_type] += 1
-            if len(self._error_timestamps) >= _MAX_SAMPLES:
-                self._error_timestamps = self._error_timestamps[
-                    _MAX_SAMPLES // 2 :
-                ]
-            self._error_timestamps.append(now)
+        second = int(time.monotonic())
+        shard = self._shard()
+        with shard.lock:
+            shard.errors += 1
+            shard.error_counts[error_type] += 1
+            _tick(shard.error_slots, second)
 
     def update_cache_stats(self, stats: dict[str, Any]) -> None:
         """Update the latest result cache statistics.
 
         Called after each query execution with the output of
-        ``ResultCache.stats()``.
+        ``ResultCache.stats()``.  The dictionary is replaced wholesale, so
+        no lock is needed.
 
         Args:
             stats: Dict with keys like ``result_cache_hits``,
@@ -622,8 +877,17 @@ class QueryMetrics:
         """
         if not _ENABLED:
             return
-        with self._lock:
-            self._cache_stats = dict(stats)
+        self._cache_stats = dict(stats)
+
+    def _merged(self) -> _Shard:
+        """Return a fresh shard holding the sum of every thread's shard."""
+        with self._registry_lock:
+            shards = list(self._shards)
+        merged = _Shard()
+        for shard in shards:
+            with shard.lock:
+                shard.merge_into(merged)
+        return merged
 
     def snapshot(self) -> MetricsSnapshot:
         """Return an immutable point-in-time view of all collected metrics.
@@ -632,165 +896,119 @@ class QueryMetrics:
             A :class:`MetricsSnapshot` with current aggregated statistics.
 
         """
-        _RATE_WINDOW_S = 60.0
         now = time.monotonic()
-        with self._lock:
-            timings = list(self._timings_ms)
-            mem_deltas = list(self._memory_deltas_mb)
-            parse_times = list(self._parse_times_ms)
-
-            uptime_s = now - self._created_at
-
-            # Throughput rates.
-            queries_per_second = (
-                self._total_queries / uptime_s if uptime_s > 0 else 0.0
-            )
-            rows_per_second = (
-                self._total_rows / uptime_s if uptime_s > 0 else 0.0
-            )
-
-            # Time-windowed recent rate: count queries in last 60s.
-            cutoff = now - _RATE_WINDOW_S
-            recent_count = sum(
-                1 for ts in self._query_timestamps if ts >= cutoff
-            )
-            recent_queries_per_second = recent_count / _RATE_WINDOW_S
+        merged = self._merged()
+        cache_stats = self._cache_stats
+        uptime_s = now - self._created_at
+
+        # Throughput rates.
+        queries_per_second = merged.queries / uptime_s if uptime_s > 0 else 0.0
+        rows_per_second = merged.rows / uptime_s if uptime_s > 0 else 0.0
+
+        # Time-windowed recent rate: count queries in the last 60s.
+        recent_count = _recent(merged.query_slots, int(now))
+        recent_queries_per_second = recent_count / _RATE_WINDOW_S
+
+        # Error rates.
+        total_ops = merged.queries + merged.errors
+        error_rate = merged.errors / total_ops if total_ops > 0 else 0.0
+        recent_errors = _recent(merged.error_slots, int(now))
+        recent_total_ops = recent_count + recent_errors
+        recent_error_rate = (
+            recent_errors / recent_total_ops if recent_total_ops > 0 else 0.0
+        )
 
-            # Error rates.
-            total_ops = self._total_queries + self._total_errors
-            error_rate = (
-                self._total_errors / total_ops if total_ops > 0 else 0.0
-            )
-            recent_errors = sum(
-                1 for ts in self._error_timestamps if ts >= cutoff
-            )
-            recent_total_ops = recent_count + recent_errors
-            recent_error_rate = (
-                recent_errors / recent_total_ops
-                if recent_total_ops > 0
+        timings = merged.timings
+        mem_deltas = merged.memory_deltas
+        parse_times = merged.parse_times
+        plan_times = merged.plan_times
+        clause_timings = merged.clause_timings
+        return MetricsSnapshot(
+            total_queries=merged.queries,
+            total_errors=merged.errors,
+            slow_queries=merged.slow,
+            error_counts=dict(merged.error_counts),
+            clause_counts=dict(merged.clause_counts),
+            timing_p50_ms=timings.percentile(0.50),
+            timing_p90_ms=timings.percentile(0.90),
+            timing_p99_ms=timings.percentile(0.99),
+            timing_max_ms=_maximum(timings),
+            timing_min_ms=timings.min if timings.count else 0.0,
+            total_rows_returned=merged.rows,
+            uptime_s=uptime_s,
+            queries_per_second=queries_per_second,
+            rows_per_second=rows_per_second,
+            recent_queries_per_second=recent_queries_per_second,
+            memory_delta_p50_mb=mem_deltas.percentile(0.50),
+            memory_delta_p90_mb=mem_deltas.percentile(0.90),
+            memory_delta_max_mb=_maximum(mem_deltas),
+            clause_timing_p50_ms={
+                name: h.percentile(0.50) for name, h in clause_timings.items()
+            },
+            clause_timing_p90_ms={
+                name: h.percentile(0.90) for name, h in clause_timings.items()
+            },
+            clause_timing_max_ms={
+                name: _maximum(h) for name, h in clause_timings.items()
+            },
+            parse_time_p50_ms=parse_times.percentile(0.50),
+            parse_time_p90_ms=parse_times.percentile(0.90),
+            parse_time_max_ms=_maximum(parse_times),
+            error_rate=error_rate,
+            recent_error_rate=recent_error_rate,
+            planner_accuracy_ratio_p50=merged.planner_ratios.percentile(0.50),
+            planner_mae_mb=(
+                merged.planner_abs_error_sum / merged.planner_ratios.count
+                if merged.planner_ratios.count
                 else 0.0
-            )
-
-            # Build per-clause-type timing percentiles.
-            ct_p50: dict[str, float] = {}
-            ct_p90: dict[str, float] = {}
-            ct_max: dict[str, float] = {}
-            for clause_name, samples in self._clause_timings_ms.items():
-                s = list(samples)
-                ct_p50[clause_name] = _percentile(s, 0.50)
-                ct_p90[clause_name] = _percentile(s, 0.90)
-                ct_max[clause_name] = max(s) if s else 0.0
-
-            return MetricsSnapshot(
-                total_queries=self._total_queries,
-                total_errors=self._total_errors,
-                slow_queries=self._slow_queries,
-                error_counts=dict(self._error_counts),
-                clause_counts=dict(self._clause_counts),
-                timing_p50_ms=_percentile(timings, 0.50),
-                timing_p90_ms=_percentile(timings, 0.90),
-                timing_p99_ms=_percentile(timings, 0.99),
-                timing_max_ms=max(timings) if timings else 0.0,
-                timing_min_ms=min(timings) if timings else 0.0,
-                total_rows_returned=self._total_rows,
-                uptime_s=uptime_s,
-                queries_per_second=queries_per_second,
-                rows_per_second=rows_per_second,
-                recent_queries_per_second=recent_queries_per_second,
-                memory_delta_p50_mb=_percentile(mem_deltas, 0.50),
-                memory_delta_p90_mb=_percentile(mem_deltas, 0.90),
-                memory_delta_max_mb=max(mem_deltas) if mem_deltas else 0.0,
-                clause_timing_p50_ms=ct_p50,
-                clause_timing_p90_ms=ct_p90,
-                clause_timing_max_ms=ct_max,
-                parse_time_p50_ms=_percentile(parse_times, 0.50),
-                parse_time_p90_ms=_percentile(parse_times, 0.90),
-                parse_time_max_ms=max(parse_times) if parse_times else 0.0,
-                error_rate=error_rate,
-                recent_error_rate=recent_error_rate,
-                planner_accuracy_ratio_p50=_percentile(
-                    list(self._planner_accuracy_ratios),
-                    0.50,
-                ),
-                planner_mae_mb=(
-                    sum(self._planner_abs_errors_mb)
-                    / len(self._planner_abs_errors_mb)
-                    if self._planner_abs_errors_mb
-                    else 0.0
-                ),
-                plan_time_p50_ms=_percentile(list(self._plan_times_ms), 0.50),
-                plan_time_p90_ms=_percentile(list(self._plan_times_ms), 0.90),
-                plan_time_max_ms=max(self._plan_times_ms)
-                if self._plan_times_ms
-                else 0.0,
-                result_cache_hits=self._cache_stats.get(
-                    "result_cache_hits",
-                    0,
-                ),
-                result_cache_misses=self._cache_stats.get(
-                    "result_cache_misses",
-                    0,
-                ),
-                result_cache_hit_rate=self._cache_stats.get(
-                    "result_cache_hit_rate",
-                    0.0,
-                ),
-                result_cache_size_mb=self._cache_stats.get(
-                    "result_cache_size_mb",
-                    0.0,
-                ),
-                result_cache_entries=self._cache_stats.get(
-                    "result_cache_entries",
-                    0,
-                ),
-                result_cache_evictions=self._cache_stats.get(
-                    "result_cache_evictions",
-                    0,
-                ),
-            )
+            ),
+            plan_time_p50_ms=plan_times.percentile(0.50),
+            plan_time_p90_ms=plan_times.percentile(0.90),
+            plan_time_max_ms=_maximum(plan_times),
+            result_cache_hits=cache_stats.get(
+                "result_cache_hits",
+                0,
+            ),
+            result_cache_misses=cache_stats.get(
+                "result_cache_misses",
+                0,
+            ),
+            result_cache_hit_rate=cache_stats.get(
+                "result_cache_hit_rate",
+                0.0,
+            ),
+            result_cache_size_mb=cache_stats.get(
+                "result_cache_size_mb",
+                0.0,
+            ),
+            result_cache_entries=cache_stats.get(
+                "result_cache_entries",
+                0,
+            ),
+            result_cache_evictions=cache_stats.get(
+                "result_cache_evictions",
+                0,
+            ),
+            timing_histogram_ms=timings,
+            clause_timing_histograms_ms=clause_timings,
+        )
 
     def reset(self) -> None:
         """Reset all counters and timings to zero.
 
         Useful for test isolation or periodic metric rotation.
         """
-        with self._lock:
-            self._total_queries = 0
-            self._total_errors = 0
-            self._slow_queries = 0
-            self._total_rows = 0
-            self._error_counts.clear()
-            self._clause_counts.clear()
-            self._timings_ms.clear()
-            self._memory_deltas_mb.clear()
-            self._clause_timings_ms.clear()
-            self._parse_times_ms.clear()
-            self._query_timestamps.clear()
-            self._error_timestamps.clear()
-            self._planner_accuracy_ratios.clear()
-            self._planner_abs_errors_mb.clear()
-            self._plan_times_ms.clear()
-            self._cache_stats.clear()
+        with self._registry_lock:
+            for shard in self._shards:
+                with shard.lock:
+                    shard.clear()
+            self._cache_stats = {}
             self._created_at = time.monotonic()
 
 
-def _percentile(data: list[float], pct: float) -> float:
-    """Compute a percentile from a sorted list of floats.
-
-    Args:
-        data: List of observed values (will be sorted in-place).
-        pct: Percentile as a fraction (e.g. 0.95 for p95).
-
-    Returns:
-        The percentile value, or 0.0 if data is empty.
-
-    """
-    if not data:
-        return 0.0
-    try:
-        return statistics.quantiles(data, n=100)[max(0, int(pct * 100) - 1)]
-    except statistics.StatisticsError:
-        return data[0] if data else 0.0
+def _maximum(histogram: LogHistogram) -> float:
+    """Return the exact maximum of *histogram*, or 0.0 if it is empty."""
+    return histogram.max if histogram.count else 0.0
 
 
 # Module-level singleton.
@@ -0,0 +1,169 @@
+"""Benchmark: aggregating star-shaped MATCHes with and without factorization.
+
+Runs ``(a:Person)-[:LIVES_IN]->(u:Puma)<-[:LIVES_IN]-(b:Person)``
+(neighbours per PUMA, quadratic in its residents) and pairs of people
+knowing the same person, grouped by State, once on the factorized
+MATCH result and once on the flat rows, and reports the peak traced
+memory and the best time of each.
+
+Run directly (100k Persons)::
+
+    uv run python tests/benchmarks/bench_factorized.py
+
+Or via pytest (smaller graph)::
+
+    uv run pytest tests/benchmarks/bench_factorized.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+QUERIES: dict[str, str] = {
+    "neighbours": (
+        "MATCH (a:Person)-[:LIVES_IN]->(u:Puma)<-[:LIVES_IN]-(b:Person) "
+        "RETURN u.name AS puma, count(*) AS pairs, avg(b.age) AS age"
+    ),
+    "co-followers": (
+        "MATCH (a:Person)-[:KNOWS]->(p:Person)<-[:KNOWS]-(b:Person), "
+        "(p)-[:LIVES_IN]->(u:Puma)-[:IN_STATE]->(s:State) "
+        "RETURN s.abbr AS state, count(*) AS pairs, max(a.age) AS age"
+    ),
+}
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _star(n_people: int) -> Star:
+    rng = np.random.default_rng(42)
+    n_pumas = max(n_people // 100, 10)
+    people = np.arange(n_people)
+    pumas = np.arange(n_people, n_people + n_pumas)
+    states = np.arange(n_people + n_pumas, n_people + n_pumas + 50)
+
+    def _entities(ids: np.ndarray, **columns) -> pd.DataFrame:
+        return pd.DataFrame({ID_COLUMN: ids, **columns})
+
+    def _edges(n: int, src: np.ndarray, tgt: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ID_COLUMN: np.arange(n),
+                RELATIONSHIP_SOURCE_COLUMN: rng.choice(src, n),
+                RELATIONSHIP_TARGET_COLUMN: rng.choice(tgt, n),
+            },
+        )
+
+    entities = {
+        "Person": _entities(people, age=rng.integers(90, size=n_people)),
+        "Puma": _entities(pumas, name=[f"P{i}" for i in range(n_pumas)]),
+        "State": _entities(states, abbr=[f"S{i}" for i in range(50)]),
+    }
+    relationships = {
+        "LIVES_IN": _edges(n_people, people, pumas),
+        "IN_STATE": _edges(n_pumas, pumas, states),
+        "KNOWS": _edges(5 * n_people, people, people),
+    }
+    return Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    name: EntityTable.from_dataframe(name, df)
+                    for name, df in entities.items()
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    name: RelationshipTable.from_dataframe(name, df)
+                    for name, df in relationships.items()
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+
+
+def _run(star: Star, query: str, repeat: int) -> tuple[float, float]:
+    """Return ``(best seconds, peak traced MB)`` of *query*."""
+    star.execute_query(query)
+    tracemalloc.start()
+    star.execute_query(query)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        star.execute_query(query)
+        best = min(best, time.perf_counter() - t0)
+    return best, peak / 1e6
+
+
+def measure(n_people: int, repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Return seconds and peak MB per query, factorized and flat."""
+    star = _star(n_people)
+    executor = star._clause_executor
+    results = {}
+    for name, query in QUERIES.items():
+        factorized_s, factorized_mb = _run(star, query, repeat)
+        executor._use_factorization = False
+        try:
+            flat_s, flat_mb = _run(star, query, repeat)
+        finally:
+            executor._use_factorization = True
+        results[name] = {
+            "factorized_s": factorized_s,
+            "flat_s": flat_s,
+            "factorized_mb": factorized_mb,
+            "flat_mb": flat_mb,
+        }
+    return results
+
+
+def _report(results: dict[str, dict[str, float]]) -> None:
+    print(
+        f"{'query':<14}{'fact. s':>9}{'flat s':>9}"
+        f"{'fact. MB':>10}{'flat MB':>10}",
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<14}{row['factorized_s']:>9.3f}{row['flat_s']:>9.3f}"
+            f"{row['factorized_mb']:>10.1f}{row['flat_mb']:>10.1f}",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestFactorized:
+    def test_factorized_is_smaller_and_faster(self) -> None:
+        results = measure(20_000, repeat=1)
+        print()
+        _report(results)
+        for row in results.values():
+            assert row["factorized_mb"] * 2 < row["flat_mb"]
+            assert row["factorized_s"] < row["flat_s"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n:,} Persons")
+    _report(measure(n))
@@ -0,0 +1,111 @@
+"""Benchmark: import and cold-start cost of pycypher entry points.
+
+Times, each in a fresh interpreter:
+
+* ``import <module>`` for the package, the ``nmetl`` CLI and the legacy
+  CLI module (``python -X importtime`` cumulative cost);
+* ``first parse`` — ``import pycypher`` plus parsing one query, with the
+  on-disk grammar cache ``cold`` (empty directory) and ``warm``.
+
+Run directly::
+
+    uv run python tests/benchmarks/bench_import_time.py
+
+Or via pytest::
+
+    uv run pytest tests/benchmarks/bench_import_time.py -v -s
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+_MODULES = ["pycypher", "pycypher.cli.main", "pycypher.nmetl_cli"]
+
+# Cumulative import cost budgets, in milliseconds.  Deliberately loose
+# (several times the measured cost): they catch an eager ``import pandas``
+# sneaking back into a package ``__init__``, not small drifts.
+_BUDGETS_MS = {
+    "pycypher": 250.0,
+    "pycypher.cli.main": 300.0,
+}
+
+_FIRST_PARSE = (
+    "from pycypher.grammar_parser import get_default_parser; "
+    "get_default_parser().parse_to_ast('MATCH (n:Person) RETURN n.name')"
+)
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _import_ms(module: str) -> float:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    match = re.search(
+        rf"\|\s+(\d+) \|\s*{re.escape(module)}$",
+        stderr,
+        re.MULTILINE,
+    )
+    assert match, stderr[-2000:]
+    return int(match.group(1)) / 1000
+
+
+def _first_parse_ms(cache_dir: str) -> float:
+    env = {**os.environ, "PYCYPHER_GRAMMAR_CACHE_DIR": cache_dir}
+    t0 = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", _FIRST_PARSE],
+        check=True,
+        env=env,
+    )
+    return (time.perf_counter() - t0) * 1000
+
+
+def measure() -> dict[str, float]:
+    """Return milliseconds for each import and for cold/warm first parse."""
+    results = {
+        f"import {module}": min(_import_ms(module) for _ in range(3))
+        for module in _MODULES
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "grammar")
+        results["first parse (cold)"] = _first_parse_ms(cache_dir)
+        results["first parse (warm)"] = min(
+            _first_parse_ms(cache_dir) for _ in range(3)
+        )
+    return results
+
+
+def _report(results: dict[str, float]) -> None:
+    for name, ms in results.items():
+        print(f"  {name:<28}{ms:>10.1f} ms")
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestImportTime:
+    def test_warm_grammar_cache_speeds_first_parse(self) -> None:
+        results = measure()
+        print()
+        _report(results)
+        assert results["first parse (warm)"] < results["first parse (cold)"]
+        for module, budget in _BUDGETS_MS.items():
+            assert results[f"import {module}"] < budget, module
+
+
+if __name__ == "__main__":
+    _report(measure())
@@ -0,0 +1,129 @@
+"""Benchmark: LSP diagnostics latency on large multi-statement documents.
+
+Times, for a ``.cypher`` document of N ``;``-separated statements:
+
+* ``cold`` — diagnostics with an empty statement cache (every statement
+  parsed, validated and linted once);
+* ``edit`` — diagnostics after a one-character edit to one statement and
+  a line inserted above it (one statement re-parsed, the rest cached);
+* ``didChange`` — time the message loop spends handling the change
+  notification when a diagnostics worker is running.  This is what a
+  completion or hover request queued behind the edit waits for.
+
+Run directly (1,000 statements)::
+
+    uv run python tests/benchmarks/bench_lsp_diagnostics.py
+
+Or via pytest (smaller document)::
+
+    uv run pytest tests/benchmarks/bench_lsp_diagnostics.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from unittest.mock import patch
+
+from pycypher import cypher_lsp
+from pycypher.cypher_lsp import (
+    _DiagnosticsWorker,
+    _document_diagnostics,
+    _handle_message,
+    _statement_cache,
+)
+
+_TEMPLATES = [
+    "MATCH (p:Person)-[:KNOWS]->(f:Person)\n"
+    "WHERE p.age > {i} AND f.name STARTS WITH 'A'\n"
+    "RETURN p.name AS name, count(f) AS friends\n"
+    "ORDER BY friends DESC LIMIT 10",
+    "MATCH (c:Company {{id: {i}}})<-[:WORKS_AT]-(p:Person)\n"
+    "WITH c, collect(p.name) AS staff\n"
+    "RETURN c.name, size(staff) AS headcount",
+    "UNWIND range(0, {i}) AS x\nRETURN x * 2 AS doubled",
+]
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _document(n_statements: int) -> str:
+    return "\n\n".join(
+        _TEMPLATES[i % len(_TEMPLATES)].format(i=i) + ";"
+        for i in range(n_statements)
+    )
+
+
+def _edited(document: str, n_statements: int) -> str:
+    middle = str(n_statements // 2)
+    return "// edited\n" + document.replace(
+        f"range(0, {middle})",
+        f"range(1, {middle})",
+    ).replace(f"p.age > {middle} ", f"p.age >= {middle} ")
+
+
+def _did_change_ms(uri: str, text: str) -> float:
+    worker = _DiagnosticsWorker(delay=60.0)
+    message = {
+        "jsonrpc": "2.0",
+        "method": "textDocument/didChange",
+        "params": {
+            "textDocument": {"uri": uri},
+            "contentChanges": [{"text": text}],
+        },
+    }
+    with patch.object(cypher_lsp, "_diagnostics_worker", worker):
+        worker.start()
+        try:
+            t0 = time.perf_counter()
+            _handle_message(message)
+            elapsed = time.perf_counter() - t0
+        finally:
+            worker.stop()
+    return elapsed * 1000
+
+
+def measure(n_statements: int) -> dict[str, float]:
+    """Return milliseconds for cold, edited and didChange handling."""
+    document = _document(n_statements)
+    edited = _edited(document, n_statements)
+    assert edited != document
+    _statement_cache.clear()
+    t0 = time.perf_counter()
+    cold = _document_diagnostics(document)
+    t1 = time.perf_counter()
+    warm = _document_diagnostics(edited)
+    t2 = time.perf_counter()
+    assert len(warm) == len(cold)
+    return {
+        "cold": (t1 - t0) * 1000,
+        "edit": (t2 - t1) * 1000,
+        "didChange": _did_change_ms("file:///bench.cypher", edited),
+    }
+
+
+def _report(n_statements: int, results: dict[str, float]) -> None:
+    print(f"{n_statements:,} statements")
+    for name, ms in results.items():
+        print(f"  {name:<10}{ms:>10.1f} ms")
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestLspDiagnostics:
+    def test_edit_reuses_cached_statements(self) -> None:
+        results = measure(60)
+        print()
+        _report(60, results)
+        assert results["edit"] < results["cold"] / 5
+        assert results["didChange"] < results["edit"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    _report(n, measure(n))
@@ -0,0 +1,140 @@
+"""Benchmark: degree-only pattern counts versus per-row pattern matching.
+
+Times ``size((n)-[:KNOWS]->())`` and ``COUNT { (n)-[:KNOWS]->() }``
+(rewritten into degree-index lookups) against the same counts written so
+the rewrite does not apply — a pattern comprehension naming the
+neighbour and a ``COUNT`` subquery with a RETURN — which match the
+pattern for every row.
+
+Run directly (100k Persons)::
+
+    uv run python tests/benchmarks/bench_pattern_degree.py
+
+Or via pytest (smaller graph)::
+
+    uv run pytest tests/benchmarks/bench_pattern_degree.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+#: name -> (degree-only query, per-row equivalent)
+QUERIES: dict[str, tuple[str, str]] = {
+    "size": (
+        "MATCH (n:Person) RETURN size((n)-[:KNOWS]->()) AS d",
+        "MATCH (n:Person) RETURN size([(n)-[:KNOWS]->(m) | m]) AS d",
+    ),
+    "count": (
+        "MATCH (n:Person) RETURN COUNT { (n)-[:KNOWS]->() } AS d",
+        "MATCH (n:Person) "
+        "RETURN COUNT { MATCH (n)-[:KNOWS]->(m) RETURN m } AS d",
+    ),
+}
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _star(n_people: int) -> Star:
+    rng = np.random.default_rng(42)
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: np.arange(n_people),
+            "age": rng.integers(90, size=n_people),
+        },
+    )
+    n_edges = 5 * n_people
+    knows = pd.DataFrame(
+        {
+            ID_COLUMN: np.arange(n_edges),
+            RELATIONSHIP_SOURCE_COLUMN: rng.integers(n_people, size=n_edges),
+            RELATIONSHIP_TARGET_COLUMN: rng.integers(n_people, size=n_edges),
+        },
+    )
+    return Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    "Person": EntityTable.from_dataframe("Person", people),
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    "KNOWS": RelationshipTable.from_dataframe("KNOWS", knows),
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+
+
+def _seconds(star: Star, query: str, repeat: int = 3) -> float:
+    star.execute_query(query)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        star.execute_query(query)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def measure(n_people: int) -> dict[str, dict[str, float]]:
+    """Return seconds per query for the degree and per-row forms."""
+    star = _star(n_people)
+    results = {}
+    for name, (degree, per_row) in QUERIES.items():
+        assert (
+            star.execute_query(degree)["d"].tolist()
+            == star.execute_query(per_row)["d"].tolist()
+        )
+        results[name] = {
+            "degree": _seconds(star, degree),
+            "per_row": _seconds(star, per_row, repeat=1),
+        }
+    return results
+
+
+def _report(results: dict[str, dict[str, float]]) -> None:
+    print(f"{'query':<10}{'degree s':>12}{'per-row s':>12}{'speedup':>10}")
+    for name, row in results.items():
+        print(
+            f"{name:<10}{row['degree']:>12.3f}{row['per_row']:>12.3f}"
+            f"{row['per_row'] / row['degree']:>9.1f}x",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestPatternDegree:
+    def test_degree_lookup_is_faster(self) -> None:
+        results = measure(20_000)
+        print()
+        _report(results)
+        for row in results.values():
+            assert row["degree"] < row["per_row"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n:,} Persons")
+    _report(measure(n))
@@ -0,0 +1,151 @@
+"""Benchmark: semi-join reduction of chains with a selective far end.
+
+Times ``(p:Person)-[:LIVES_IN]->(:Puma)-[:IN_STATE]->(s:State {abbr})``
+(hop-by-hop translation) and a three-hop variant through ``KNOWS``
+(join-ordered translation) with the Yannakakis reduction on and off.
+
+Run directly (1M Persons)::
+
+    uv run python tests/benchmarks/bench_semi_join.py
+
+Or via pytest (smaller graph)::
+
+    uv run pytest tests/benchmarks/bench_semi_join.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+QUERIES: dict[str, str] = {
+    "two-hop": (
+        "MATCH (p:Person)-[:LIVES_IN]->(:Puma)-[:IN_STATE]->"
+        "(s:State {abbr: 'S7'}) RETURN p.age AS age"
+    ),
+    "three-hop": (
+        "MATCH (q:Person)-[:KNOWS]->(p:Person)-[:LIVES_IN]->(:Puma)"
+        "-[:IN_STATE]->(s:State {abbr: 'S7'}) RETURN q.age AS age"
+    ),
+}
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _star(n_people: int) -> Star:
+    rng = np.random.default_rng(42)
+    n_pumas = max(n_people // 400, 50)
+    people = np.arange(n_people)
+    pumas = np.arange(n_people, n_people + n_pumas)
+    states = np.arange(n_people + n_pumas, n_people + n_pumas + 50)
+
+    def _entities(ids: np.ndarray, **columns) -> pd.DataFrame:
+        return pd.DataFrame({ID_COLUMN: ids, **columns})
+
+    def _edges(n: int, src: np.ndarray, tgt: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ID_COLUMN: np.arange(n),
+                RELATIONSHIP_SOURCE_COLUMN: rng.choice(src, n),
+                RELATIONSHIP_TARGET_COLUMN: rng.choice(tgt, n),
+            },
+        )
+
+    entities = {
+        "Person": _entities(people, age=rng.integers(90, size=n_people)),
+        "Puma": _entities(pumas),
+        "State": _entities(states, abbr=[f"S{i}" for i in range(50)]),
+    }
+    relationships = {
+        "LIVES_IN": _edges(n_people, people, pumas),
+        "IN_STATE": _edges(n_pumas, pumas, states),
+        "KNOWS": _edges(3 * n_people, people, people),
+    }
+    return Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    name: EntityTable.from_dataframe(name, df)
+                    for name, df in entities.items()
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    name: RelationshipTable.from_dataframe(name, df)
+                    for name, df in relationships.items()
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+
+
+def _seconds(star: Star, query: str, repeat: int = 3) -> float:
+    star.execute_query(query)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        star.execute_query(query)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def measure(n_people: int) -> dict[str, dict[str, float]]:
+    """Return seconds per query with and without semi-join reduction."""
+    star = _star(n_people)
+    matcher = star._pattern_matcher
+    results = {}
+    for name, query in QUERIES.items():
+        reduced = _seconds(star, query)
+        matcher._use_semi_join_reduction = False
+        try:
+            plain = _seconds(star, query)
+        finally:
+            matcher._use_semi_join_reduction = True
+        results[name] = {"reduced": reduced, "plain": plain}
+    return results
+
+
+def _report(results: dict[str, dict[str, float]]) -> None:
+    print(f"{'query':<12}{'reduced s':>12}{'plain s':>12}{'speedup':>10}")
+    for name, row in results.items():
+        print(
+            f"{name:<12}{row['reduced']:>12.3f}{row['plain']:>12.3f}"
+            f"{row['plain'] / row['reduced']:>9.1f}x",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestSemiJoin:
+    def test_reduction_is_faster(self) -> None:
+        results = measure(200_000)
+        print()
+        _report(results)
+        for row in results.values():
+            assert row["reduced"] < row["plain"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n:,} Persons")
+    _report(measure(n))
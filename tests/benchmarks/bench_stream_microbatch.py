@@ -0,0 +1,140 @@
+"""Benchmark: per-record vs columnar micro-batch StreamEngine throughput.
+
+Feeds the same event stream through a :class:`StreamEngine` pipeline
+(batch filter → stream-table join → tumbling window → last-value view)
+in the default per-record mode and in ``micro_batch=True`` mode, and
+reports records/sec for each.
+
+Run directly (1M events)::
+
+    uv run python tests/benchmarks/bench_stream_microbatch.py
+
+Or via pytest (smaller stream)::
+
+    uv run pytest tests/benchmarks/bench_stream_microbatch.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+import pyarrow.compute as pc
+from fastopendata.streaming.core import (
+    StreamBuffer,
+    StreamRecord,
+    WatermarkTracker,
+)
+from fastopendata.streaming.engine import StreamEngine
+from fastopendata.streaming.joins import StreamTableJoin, TableSnapshot
+from fastopendata.streaming.views import IncrementalView
+from fastopendata.streaming.windows import TumblingWindow, WindowManager
+
+N_KEYS = 1_000
+N_REGIONS = 50
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _events(n_events: int) -> list[StreamRecord]:
+    rng = np.random.default_rng(42)
+    keys = rng.integers(N_KEYS, size=n_events)
+    regions = rng.integers(N_REGIONS + 10, size=n_events)
+    amounts = rng.random(n_events) * 100
+    times = np.sort(rng.random(n_events) * n_events / 1_000)
+    return [
+        StreamRecord(
+            key=f"user{k}",
+            value={"region": int(r), "amount": float(a)},
+            event_time=float(t),
+            record_id=str(i),
+        )
+        for i, (k, r, a, t) in enumerate(
+            zip(keys, regions, amounts, times, strict=True),
+        )
+    ]
+
+
+def _build_engine(buf: StreamBuffer, *, micro_batch: bool) -> StreamEngine:
+    engine = StreamEngine(
+        buf,
+        watermark=WatermarkTracker(allowed_lateness=1.0),
+        batch_size=10_000,
+        cycle_interval=0.001,
+        micro_batch=micro_batch,
+    )
+    table = TableSnapshot(name="regions")
+    table.bulk_load(
+        {str(i): {"region_name": f"R{i}"} for i in range(N_REGIONS)},
+    )
+    if micro_batch:
+        engine.add_batch_transform(
+            lambda b: b.filter(pc.greater(b.column("amount"), 1.0)),
+        )
+        engine.add_join(StreamTableJoin(table, key_column="region"))
+    else:
+        engine.add_transform(
+            lambda r: r if r.value["amount"] > 1.0 else None,
+        )
+        engine.add_join(
+            StreamTableJoin(table, lambda r: str(r.value["region"])),
+        )
+    engine.add_window_manager(WindowManager(TumblingWindow(size=10.0)))
+    engine.add_view(IncrementalView(name="latest"))
+    return engine
+
+
+async def _run(events: list[StreamRecord], *, micro_batch: bool) -> float:
+    buf = StreamBuffer(max_size=len(events) + 1)
+    for event in events:
+        await buf.put(event)
+    engine = _build_engine(buf, micro_batch=micro_batch)
+    t0 = time.perf_counter()
+    await engine.start()
+    while buf.size:
+        await asyncio.sleep(0.001)
+    await engine.stop()
+    elapsed = time.perf_counter() - t0
+    assert engine.metrics.errors == 0
+    return len(events) / elapsed
+
+
+def measure(n_events: int) -> dict[str, float]:
+    """Return records/sec for both modes over *n_events* events."""
+    events = _events(n_events)
+    per_record = asyncio.run(_run(events, micro_batch=False))
+    micro_batch = asyncio.run(_run(events, micro_batch=True))
+    return {
+        "per_record_rps": per_record,
+        "micro_batch_rps": micro_batch,
+        "speedup": micro_batch / per_record,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestStreamMicroBatchThroughput:
+    def test_micro_batch_is_faster(self) -> None:
+        result = measure(50_000)
+        print(
+            f"\nper-record: {result['per_record_rps']:,.0f} rec/s, "
+            f"micro-batch: {result['micro_batch_rps']:,.0f} rec/s "
+            f"({result['speedup']:.1f}x)",
+        )
+        assert result["speedup"] > 1.0
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    result = measure(n)
+    print(f"{n:,} events")
+    print(f"  per-record:  {result['per_record_rps']:>12,.0f} records/sec")
+    print(f"  micro-batch: {result['micro_batch_rps']:>12,.0f} records/sec")
+    print(f"  speedup:     {result['speedup']:>12.1f}x")
@@ -0,0 +1,154 @@
+"""Benchmark: Top-K ``ORDER BY … LIMIT`` and early LIMIT termination.
+
+Times the same queries with Top-K pruning on and off (by raising
+:data:`pycypher.top_k.TOP_K_MIN_ROWS` out of reach):
+
+- ``ORDER BY <numeric> DESC LIMIT 10`` and ``ORDER BY <string> LIMIT 10``
+  over every Person,
+- ``ORDER BY <grouping key> LIMIT 10`` over a grouped aggregation,
+
+and a ``MATCH (a)-[:KNOWS]->(b) RETURN … LIMIT 10`` against the same
+pattern without a LIMIT.
+
+Run directly (1M Persons)::
+
+    uv run python tests/benchmarks/bench_top_k.py
+
+Or via pytest (smaller graph)::
+
+    uv run pytest tests/benchmarks/bench_top_k.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from pycypher import top_k
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+QUERIES: dict[str, str] = {
+    "numeric": (
+        "MATCH (p:Person) RETURN p.name AS name, p.salary AS salary "
+        "ORDER BY salary DESC LIMIT 10"
+    ),
+    "string": (
+        "MATCH (p:Person) RETURN p.name AS name ORDER BY name LIMIT 10"
+    ),
+    "grouped": (
+        "MATCH (p:Person) RETURN p.team AS team, count(*) AS n, "
+        "avg(p.salary) AS pay ORDER BY team LIMIT 10"
+    ),
+}
+
+MATCH_QUERY = "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.name, b.name"
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _star(n_persons: int) -> Star:
+    rng = np.random.default_rng(42)
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: np.arange(n_persons),
+            "name": [f"p{i:07d}" for i in rng.permutation(n_persons)],
+            "salary": rng.integers(40_000, 200_000, size=n_persons),
+            "team": rng.integers(n_persons // 10, size=n_persons),
+        },
+    )
+    n_edges = 3 * n_persons
+    knows = pd.DataFrame(
+        {
+            ID_COLUMN: np.arange(n_edges),
+            RELATIONSHIP_SOURCE_COLUMN: rng.integers(n_persons, size=n_edges),
+            RELATIONSHIP_TARGET_COLUMN: rng.integers(n_persons, size=n_edges),
+        },
+    )
+    return Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    "Person": EntityTable.from_dataframe("Person", people),
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    "KNOWS": RelationshipTable.from_dataframe("KNOWS", knows),
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+
+
+def _seconds(star: Star, query: str, repeat: int = 3) -> float:
+    star.execute_query(query)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        star.execute_query(query)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def measure(n_persons: int) -> dict[str, dict[str, float]]:
+    """Return seconds per query with and without the LIMIT optimizations."""
+    star = _star(n_persons)
+    results = {}
+    for name, query in QUERIES.items():
+        fast = _seconds(star, query)
+        saved = top_k.TOP_K_MIN_ROWS
+        top_k.TOP_K_MIN_ROWS = sys.maxsize
+        try:
+            slow = _seconds(star, query)
+        finally:
+            top_k.TOP_K_MIN_ROWS = saved
+        results[name] = {"optimized": fast, "baseline": slow}
+    results["match"] = {
+        "optimized": _seconds(star, f"{MATCH_QUERY} LIMIT 10"),
+        "baseline": _seconds(star, MATCH_QUERY),
+    }
+    return results
+
+
+def _report(results: dict[str, dict[str, float]]) -> None:
+    print(f"{'query':<10}{'optimized s':>14}{'baseline s':>14}{'speedup':>10}")
+    for name, row in results.items():
+        print(
+            f"{name:<10}{row['optimized']:>14.4f}{row['baseline']:>14.4f}"
+            f"{row['baseline'] / row['optimized']:>9.1f}x",
+        )
+
+
+# ---------------------------------------------------------------------------
+# Pytest benchmarks
+# ---------------------------------------------------------------------------
+
+
+class TestTopK:
+    def test_limit_queries_are_faster(self) -> None:
+        results = measure(200_000)
+        print()
+        _report(results)
+        assert results["numeric"]["optimized"] < results["numeric"]["baseline"]
+        assert results["match"]["optimized"] < results["match"]["baseline"]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n:,} Persons, {3 * n:,} KNOWS edges")
+    _report(measure(n))
@@ -0,0 +1,200 @@
+"""Benchmark: triangle counting with Generic Join vs. binary joins.
+
+Cyclic MATCH patterns are routed through the worst-case optimal Generic
+Join executor (:mod:`pycypher.generic_join`).  This benchmark counts
+directed triangles on a power-law graph and compares it against the
+iterated binary-join plan, which materialises every 2-path before closing
+the cycle.
+
+Run directly (defaults to 10K, 100K and 1M edges)::
+
+    uv run python tests/benchmarks/bench_triangle_counting.py
+    uv run python tests/benchmarks/bench_triangle_counting.py --edges 1000000
+
+Or via pytest::
+
+    uv run pytest tests/benchmarks/bench_triangle_counting.py -v -s
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.relational_models import (
+    ID_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+TRIANGLE_QUERY = (
+    "MATCH (a:Place)-[:NEAR]->(b:Place)-[:NEAR]->(c:Place)-[:NEAR]->(a) "
+    "RETURN count(*) AS triangles"
+)
+
+# ---------------------------------------------------------------------------
+# Graph builder
+# ---------------------------------------------------------------------------
+
+
+def _build_colocation_graph(n_edges: int, seed: int = 42) -> Context:
+    """Build a skewed co-location graph with roughly *n_edges* edges.
+
+    Endpoints are drawn from a Zipf-like distribution so a few hub nodes
+    have very high degree — the case where binary joins blow up.
+    """
+    rng = np.random.default_rng(seed)
+    n_nodes = max(n_edges // 8, 100)
+    weights = 1.0 / np.arange(1, n_nodes + 1) ** 0.8
+    weights /= weights.sum()
+    src = rng.choice(n_nodes, size=n_edges, p=weights)
+    tgt = rng.choice(n_nodes, size=n_edges, p=weights)
+    keep = src != tgt
+    src, tgt = src[keep], tgt[keep]
+    edges = pd.DataFrame({"__SOURCE__": src, "__TARGET__": tgt})
+    edges = edges.drop_duplicates().reset_index(drop=True)
+    edges[ID_COLUMN] = np.arange(len(edges))
+
+    places_df = pd.DataFrame({ID_COLUMN: np.arange(n_nodes)})
+    place_table = EntityTable(
+        entity_type="Place",
+        identifier="Place",
+        column_names=[ID_COLUMN],
+        source_obj_attribute_map={},
+        attribute_map={},
+        source_obj=places_df,
+    )
+    near_table = RelationshipTable(
+        relationship_type="NEAR",
+        identifier="NEAR",
+        column_names=[ID_COLUMN, "__SOURCE__", "__TARGET__"],
+        source_obj_attribute_map={},
+        attribute_map={},
+        source_obj=edges[[ID_COLUMN, "__SOURCE__", "__TARGET__"]],
+        source_entity_type="Place",
+        target_entity_type="Place",
+    )
+    return Context(
+        entity_mapping=EntityMapping(mapping={"Place": place_table}),
+        relationship_mapping=RelationshipMapping(
+            mapping={"NEAR": near_table},
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Benchmark helpers
+# ---------------------------------------------------------------------------
+
+
+def _time_triangles(
+    ctx: Context,
+    *,
+    generic_join: bool,
+    n_iterations: int = 3,
+) -> dict[str, float]:
+    """Time the triangle-count query with or without Generic Join."""
+    star = Star(context=ctx, result_cache_max_mb=0)
+    star._pattern_matcher._use_generic_join = generic_join
+    star._pattern_matcher._use_join_ordering = generic_join
+
+    timings: list[float] = []
+    triangles = 0
+    for _ in range(n_iterations):
+        t0 = time.perf_counter()
+        result = star.execute_query(TRIANGLE_QUERY)
+        timings.append(time.perf_counter() - t0)
+        triangles = int(result["triangles"].iloc[0])
+
+    return {
+        "median_seconds": float(np.median(timings)),
+        "min_seconds": min(timings),
+        "triangles": triangles,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Pytest tests
+# ---------------------------------------------------------------------------
+
+
+class TestTriangleCounting:
+    """Validate Generic Join triangle counting correctness and speed."""
+
+    def test_counts_agree_with_binary_joins(self) -> None:
+        ctx = _build_colocation_graph(5_000)
+        wcoj = _time_triangles(ctx, generic_join=True, n_iterations=1)
+        binary = _time_triangles(ctx, generic_join=False, n_iterations=1)
+        assert wcoj["triangles"] == binary["triangles"] > 0
+
+    @pytest.mark.timeout(120)
+    def test_benchmark_generic_join_faster_at_10k_edges(self) -> None:
+        ctx = _build_colocation_graph(10_000)
+        wcoj = _time_triangles(ctx, generic_join=True)
+        binary = _time_triangles(ctx, generic_join=False, n_iterations=1)
+
+        print("\n  Triangle counting, 10K edges:")
+        print(f"    Generic Join: {wcoj['median_seconds']:.3f}s")
+        print(f"    Binary joins: {binary['median_seconds']:.3f}s")
+        print(f"    Triangles:    {wcoj['triangles']:,}")
+
+        assert wcoj["triangles"] == binary["triangles"]
+        assert wcoj["median_seconds"] < binary["median_seconds"]
+
+
+# ---------------------------------------------------------------------------
+# CLI entry point
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    """Run benchmarks from command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--edges",
+        type=int,
+        nargs="*",
+        default=[10_000, 100_000, 1_000_000],
+        help="Edge counts to benchmark.",
+    )
+    parser.add_argument(
+        "--binary-max-edges",
+        type=int,
+        default=10_000,
+        help="Skip the binary-join baseline above this many edges.",
+    )
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Triangle Counting: Generic Join vs Binary Joins")
+    print("=" * 60)
+
+    for n_edges in args.edges:
+        ctx = _build_colocation_graph(n_edges)
+        n_actual = len(ctx.relationship_mapping["NEAR"].source_obj)
+        print(f"\n--- {n_actual:,} edges ---")
+        wcoj = _time_triangles(ctx, generic_join=True)
+        print(
+            f"  Generic Join:  median={wcoj['median_seconds']:.3f}s  "
+            f"triangles={wcoj['triangles']:,}",
+        )
+        if n_edges > args.binary_max_edges:
+            print("  Binary joins:  skipped (use --binary-max-edges)")
+            continue
+        binary = _time_triangles(ctx, generic_join=False, n_iterations=1)
+        speedup = binary["median_seconds"] / max(wcoj["median_seconds"], 1e-9)
+        print(
+            f"  Binary joins:  median={binary['median_seconds']:.3f}s  "
+            f"triangles={binary['triangles']:,}  speedup={speedup:.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,3 +20,8 @@ def plus_n(x, n=1):
 def _private_helper(x):
     """Underscore-prefixed; should be skipped by ``names: '*'``."""
     return x
+
+
+def state_prefix(code):
+    """Return the two-character state prefix of a FIPS code."""
+    return str(code)[:2]
@@ -242,12 +242,14 @@ class TestDispatchTables:
             "max",
             "stdev",
             "stdevp",
+            "approxcountdistinct",
+            "approxtopk",
         }
         assert set(_AGG_OPS.keys()) == expected_ops
 
     def test_percentile_aggregations_set(self) -> None:
         """Test percentile aggregations set."""
-        expected = {"percentilecont", "percentiledisc"}
+        expected = {"percentilecont", "percentiledisc", "approxpercentile"}
         assert expected == _PERCENTILE_AGGREGATIONS
 
     def test_known_aggregations_completeness(self) -> None:
@@ -0,0 +1,259 @@
+"""Tests for the sketch-based approximate aggregates.
+
+``approxCountDistinct`` (HyperLogLog), ``approxPercentile`` (KLL) and
+``approxTopK`` (SpaceSaving), in full-table, grouped and merged-partial
+form, plus their DuckDB relation-engine translation.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import grouped_aggregation
+from pycypher.ast_converter import ASTConverter
+from pycypher.grouped_aggregation import PartialAggregates
+from pycypher.relation_engine import is_relation_eligible
+from pycypher.relational_models import (
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+)
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def people() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    n = 30_000
+    return pd.DataFrame(
+        {
+            "__ID__": np.arange(n),
+            "state": rng.choice(["CA", "NY", "TX"], size=n),
+            "serial": rng.integers(0, 5_000, size=n),
+            "income": rng.gamma(2.0, 30_000.0, size=n),
+            "city": [f"c{v}" for v in rng.zipf(1.6, size=n) % 500],
+        },
+    )
+
+
+def _context(people: pd.DataFrame, backend: str = "pandas") -> Context:
+    return Context(
+        entity_mapping=EntityMapping(
+            mapping={"Person": EntityTable.from_dataframe("Person", people)},
+        ),
+        relationship_mapping=RelationshipMapping(mapping={}),
+        backend=backend,
+    )
+
+
+def _rank(values: pd.Series, value: float) -> float:
+    return float((values <= value).mean())
+
+
+# ---------------------------------------------------------------------------
+# Cypher execution
+# ---------------------------------------------------------------------------
+
+
+class TestFullTable:
+    def test_approximate_results(self, people):
+        result = Star(context=_context(people)).execute_query(
+            "MATCH (p:Person) RETURN approxCountDistinct(p.serial) AS d, "
+            "approxPercentile(p.income, 0.95) AS p95, "
+            "approxTopK(p.city, 3) AS top",
+        )
+        assert result["d"].iloc[0] == pytest.approx(
+            people["serial"].nunique(),
+            rel=0.05,
+        )
+        assert _rank(people["income"], result["p95"].iloc[0]) == pytest.approx(
+            0.95,
+            abs=0.02,
+        )
+        expected = people["city"].value_counts().head(3).index.tolist()
+        assert result["top"].iloc[0] == expected
+
+    def test_top_k_defaults_to_ten(self, people):
+        result = Star(context=_context(people)).execute_query(
+            "MATCH (p:Person) RETURN approxTopK(p.city) AS top",
+        )
+        assert len(result["top"].iloc[0]) == 10
+
+    def test_no_rows(self, people):
+        result = Star(context=_context(people)).execute_query(
+            "MATCH (p:Person) WHERE p.serial < 0 "
+            "RETURN approxTopK(p.city, 3) AS top, "
+            "approxPercentile(p.income, 0.5) AS p50, "
+            "approxCountDistinct(p.serial) AS d",
+        )
+        assert result.to_dict("records") == [
+            {"top": [], "p50": None, "d": 0},
+        ]
+
+
+class TestGrouped:
+    def test_per_group_results(self, people):
+        result = Star(context=_context(people)).execute_query(
+            "MATCH (p:Person) RETURN p.state AS state, "
+            "approxCountDistinct(p.serial) AS d, "
+            "approxPercentile(p.income, 0.5) AS median, "
+            "approxTopK(p.city, 2) AS top, count(*) AS n ORDER BY state",
+        )
+        assert result["state"].tolist() == ["CA", "NY", "TX"]
+        for row in result.itertuples():
+            group = people[people["state"] == row.state]
+            assert row.n == len(group)
+            assert row.d == pytest.approx(group["serial"].nunique(), rel=0.05)
+            assert _rank(group["income"], row.median) == pytest.approx(
+                0.5,
+                abs=0.02,
+            )
+            assert (
+                row.top == group["city"].value_counts().head(2).index.tolist()
+            )
+
+    def test_null_only_group(self):
+        frame = pd.DataFrame(
+            {
+                "__ID__": [1, 2, 3],
+                "g": ["a", "a", "b"],
+                "x": [1.0, 2.0, None],
+            },
+        )
+        result = Star(context=_context(frame)).execute_query(
+            "MATCH (n:Person) RETURN n.g AS g, approxCountDistinct(n.x) AS d, "
+            "approxPercentile(n.x, 0.5) AS m, approxTopK(n.x, 1) AS t "
+            "ORDER BY g",
+        )
+        assert result["d"].tolist() == [2, 0]
+        assert result["m"].iloc[1] is None
+        assert result["t"].iloc[1] == []
+
+    def test_no_rows(self, people):
+        result = Star(context=_context(people)).execute_query(
+            "MATCH (p:Person) WHERE p.serial < 0 RETURN p.state AS state, "
+            "approxTopK(p.city, 3) AS top, "
+            "approxPercentile(p.income, 0.5) AS p50",
+        )
+        assert result.empty
+        assert list(result.columns) == ["state", "top", "p50"]
+
+
+class TestMergedPartials:
+    AGGREGATES = {
+        "d": ("approxcountdistinct", "serial"),
+        "p90": ("approxpercentile", "income", 0.9),
+        "top": ("approxtopk", "city", 3),
+    }
+
+    def _partial(self, chunk: pd.DataFrame) -> PartialAggregates:
+        return PartialAggregates.from_rows(
+            chunk[["state"]],
+            {
+                alias: (func, chunk[column], *option)
+                for alias, (func, column, *option) in self.AGGREGATES.items()
+            },
+        )
+
+    def test_chunks_merge_to_whole(self, people, monkeypatch):
+        # A small budget gives the chunks different register precisions,
+        # which the merge reconciles by folding.
+        monkeypatch.setattr(grouped_aggregation, "_HLL_BUDGET_BYTES", 4_096)
+        chunks = [
+            people.iloc[:20],
+            people.iloc[20:12_000],
+            people.iloc[12_000:],
+        ]
+        parts = [self._partial(chunk) for chunk in chunks]
+        merged = parts[0].merge(*parts[1:]).finalize().sort_values("state")
+        exact = people.groupby("state")
+        np.testing.assert_allclose(
+            merged["d"].to_numpy(dtype=float),
+            exact["serial"].nunique().to_numpy(dtype=float),
+            rtol=0.1,
+        )
+        for row in merged.itertuples():
+            group = people[people["state"] == row.state]
+            assert _rank(group["income"], row.p90) == pytest.approx(
+                0.9, abs=0.03
+            )
+            assert (
+                row.top == group["city"].value_counts().head(3).index.tolist()
+            )
+
+    def test_option_is_required(self, people):
+        with pytest.raises(ValueError, match="second argument"):
+            PartialAggregates.from_rows(
+                people[["state"]],
+                {"p": ("approxpercentile", people["income"])},
+            )
+
+    def test_options_must_match_to_merge(self, people):
+        left = PartialAggregates.from_rows(
+            people[["state"]],
+            {"t": ("approxtopk", people["city"], 3)},
+        )
+        right = PartialAggregates.from_rows(
+            people[["state"]],
+            {"t": ("approxtopk", people["city"], 4)},
+        )
+        with pytest.raises(ValueError, match="different functions"):
+            left.merge(right)
+
+
+# ---------------------------------------------------------------------------
+# Relation engine (DuckDB)
+# ---------------------------------------------------------------------------
+
+
+class TestRelationEngine:
+    QUERY = (
+        "MATCH (p:Person) RETURN p.state AS state, "
+        "approxCountDistinct(p.serial) AS d, "
+        "approxPercentile(p.income, 0.5) AS median, "
+        "approxTopK(p.city, 2) AS top"
+    )
+
+    def test_eligible(self, people):
+        assert is_relation_eligible(
+            ASTConverter.from_cypher(self.QUERY),
+            _context(people, "duckdb"),
+        )
+
+    def test_non_literal_option_is_ineligible(self, people):
+        query = (
+            "MATCH (p:Person) RETURN approxPercentile(p.income, p.serial) AS x"
+        )
+        assert not is_relation_eligible(
+            ASTConverter.from_cypher(query),
+            _context(people, "duckdb"),
+        )
+
+    def test_duckdb_results(self, people):
+        ctx = _context(people, "duckdb")
+        ctx._relation_engine_enabled = True
+        result = Star(context=ctx).execute_query(self.QUERY)
+        result = result.sort_values("state").reset_index(drop=True)
+        exact = people.groupby("state")
+        # DuckDB's own HLL is coarser than ours at this cardinality.
+        np.testing.assert_allclose(
+            result["d"].to_numpy(dtype=float),
+            exact["serial"].nunique().to_numpy(dtype=float),
+            rtol=0.3,
+        )
+        np.testing.assert_allclose(
+            result["median"].to_numpy(dtype=float),
+            exact["income"].median().to_numpy(),
+            rtol=0.05,
+        )
+        for row in result.itertuples():
+            group = people[people["state"] == row.state]
+            assert list(row.top) == (
+                group["city"].value_counts().head(2).index.tolist()
+            )
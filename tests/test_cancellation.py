@@ -0,0 +1,218 @@
+"""Tests for pycypher.cancellation: cancellation tokens and operator progress.
+
+Covers:
+- ``CancellationToken`` / ``ProgressReporter`` / ``chunk_slices`` units
+- Chunked joins, expansion and aggregation match unchunked results
+- Cancelling from a progress callback stops a query mid-operator
+- Progress totals reach ``QueryProfiler`` reports
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pycypher.config as config
+import pytest
+from pycypher import (
+    CancellationToken,
+    ContextBuilder,
+    OperatorProgress,
+    QueryCancelledError,
+    Star,
+)
+from pycypher.cancellation import (
+    ProgressReporter,
+    chunk_slices,
+    run_chunked,
+)
+from pycypher.query_profiler import QueryProfiler
+
+
+@pytest.fixture
+def star() -> Star:
+    """Return a Star over 200 people with 1,000 random KNOWS edges."""
+    rng = np.random.default_rng(11)
+    people = pd.DataFrame(
+        {
+            "__ID__": np.arange(200),
+            "name": [f"p{i}" for i in range(200)],
+            "age": rng.integers(18, 80, 200),
+        },
+    )
+    knows = pd.DataFrame(
+        {
+            "__ID__": np.arange(1_000),
+            "__SOURCE__": rng.integers(0, 200, 1_000),
+            "__TARGET__": rng.integers(0, 200, 1_000),
+        },
+    )
+    context = (
+        ContextBuilder()
+        .add_entity("Person", people)
+        .add_relationship(
+            "KNOWS",
+            knows,
+            source_col="__SOURCE__",
+            target_col="__TARGET__",
+        )
+        .build()
+    )
+    return Star(context=context, result_cache_max_mb=0)
+
+
+def _sorted(frame: pd.DataFrame) -> pd.DataFrame:
+    return frame.sort_values(list(frame.columns)).reset_index(drop=True)
+
+
+# ===========================================================================
+# Units
+# ===========================================================================
+
+
+class TestCancellationToken:
+    def test_keeps_first_reason(self) -> None:
+        token = CancellationToken()
+        assert not token.cancelled
+        token.raise_if_cancelled()
+        token.cancel("first")
+        token.cancel("second")
+        assert token.cancelled
+        with pytest.raises(QueryCancelledError, match="first") as exc_info:
+            token.raise_if_cancelled("MATCH (n) RETURN n")
+        assert exc_info.value.reason == "first"
+        assert isinstance(exc_info.value, RuntimeError)
+
+    def test_cancel_from_another_thread(self) -> None:
+        token = CancellationToken()
+        thread = threading.Thread(target=token.cancel, args=("stop",))
+        thread.start()
+        thread.join()
+        assert token.reason == "stop"
+
+
+class TestProgressReporter:
+    def test_totals_sum_runs(self) -> None:
+        seen: list[OperatorProgress] = []
+        reporter = ProgressReporter([seen.append])
+        reporter.report(OperatorProgress("join", 5, 10))
+        reporter.finish(OperatorProgress("join", 10, 10, "rows", 0.5))
+        reporter.finish(OperatorProgress("join", 4, None, "rows", 0.25))
+        assert len(seen) == 1
+        assert seen[0].fraction == 0.5
+        total = reporter.totals["join"]
+        assert (total.processed, total.total) == (14, None)
+        assert total.elapsed_seconds == pytest.approx(0.75)
+
+
+class TestChunking:
+    def test_slices_cover_rows(self) -> None:
+        slices = list(chunk_slices(None, "op", 10, chunk_rows=4))
+        assert slices == [slice(0, 4), slice(4, 8), slice(8, 10)]
+        assert list(chunk_slices(None, "op", 10, chunk_rows=0)) == [
+            slice(0, 10),
+        ]
+        assert list(chunk_slices(None, "op", 0, chunk_rows=4)) == [
+            slice(0, 0),
+        ]
+
+    def test_build_side_and_fanout_resize_chunks(self) -> None:
+        # A 64-row build side may be re-read at most MAX_BUILD_PASSES times.
+        grown = chunk_slices(None, "op", 100, chunk_rows=1, build_rows=64)
+        assert len(list(grown)) == 13
+        shrunk = chunk_slices(None, "op", 100, chunk_rows=50, fanout=10)
+        assert len(list(shrunk)) == 20
+
+    def test_run_chunked_matches_whole_frame(self) -> None:
+        frame = pd.DataFrame({"k": np.arange(100) % 7, "v": np.arange(100)})
+        other = pd.DataFrame({"k": [1, 1, 3], "w": [10, 20, 30]})
+
+        def apply(part: pd.DataFrame) -> pd.DataFrame:
+            return part.merge(other, on="k", how="inner")
+
+        got = run_chunked(None, "join", frame, apply, chunk_rows=9)
+        pd.testing.assert_frame_equal(got, apply(frame))
+
+
+# ===========================================================================
+# Chunked operators
+# ===========================================================================
+
+
+_QUERIES = [
+    "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.name AS a, b.name AS b",
+    "MATCH (a:Person)-[:KNOWS*1..2]->(b:Person) RETURN a.name AS a, "
+    "b.name AS b",
+    "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.name AS a, "
+    "count(b) AS n, sum(b.age) AS s, collect(b.name) AS names",
+    "MATCH (a:Person), (b:Person) WHERE a.age = b.age RETURN a.name AS a, "
+    "b.name AS b",
+    "MATCH (a:Person) OPTIONAL MATCH (a)-[:KNOWS]->(b:Person) "
+    "RETURN a.name AS a, b.name AS b",
+]
+
+
+class TestChunkedOperators:
+    @pytest.mark.parametrize("query", _QUERIES)
+    def test_matches_unchunked(
+        self,
+        star: Star,
+        query: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(config, "OPERATOR_CHUNK_ROWS", 0)
+        expected = star.execute_query(query)
+        monkeypatch.setattr(config, "OPERATOR_CHUNK_ROWS", 16)
+        seen: list[OperatorProgress] = []
+        got = star.execute_query(query, on_progress=seen.append)
+        if "names" in got.columns:
+            for frame in (expected, got):
+                frame["names"] = frame["names"].map(sorted).map(tuple)
+        pd.testing.assert_frame_equal(_sorted(got), _sorted(expected))
+        assert any(p.operator != "clauses" for p in seen)
+
+    def test_cancel_from_progress_stops_mid_operator(
+        self,
+        star: Star,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(config, "OPERATOR_CHUNK_ROWS", 16)
+        token = CancellationToken()
+        seen: list[OperatorProgress] = []
+
+        def on_progress(progress: OperatorProgress) -> None:
+            seen.append(progress)
+            if progress.operator == "join":
+                token.cancel("enough")
+
+        with pytest.raises(QueryCancelledError, match="enough"):
+            star.execute_query(
+                _QUERIES[0],
+                cancel_token=token,
+                on_progress=on_progress,
+            )
+        joins = [p for p in seen if p.operator == "join"]
+        assert len(joins) == 1
+        assert joins[0].processed < (joins[0].total or 0)
+
+    def test_cancelled_token_fails_fast(self, star: Star) -> None:
+        token = CancellationToken()
+        token.cancel("before start")
+        with pytest.raises(QueryCancelledError):
+            star.execute_query(_QUERIES[0], cancel_token=token)
+        # The token belongs to that query only.
+        assert len(star.execute_query(_QUERIES[0])) == 991
+
+
+class TestProfilerProgress:
+    def test_report_lists_operators(self, star: Star) -> None:
+        seen: list[OperatorProgress] = []
+        report = QueryProfiler(star).profile(
+            _QUERIES[0],
+            on_progress=seen.append,
+        )
+        assert report.operator_progress["clauses"].processed == 2
+        assert report.operator_progress["join"].processed > 0
+        assert "Operators:" in str(report)
+        assert seen
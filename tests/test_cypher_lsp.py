@@ -6,9 +6,14 @@ without requiring a real stdin/stdout transport.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import Callable
 from unittest.mock import patch
 
 from pycypher.cypher_lsp import (
+    _DiagnosticsWorker,
+    _document_diagnostics,
     _documents,
     _format_document,
     _get_completions,
@@ -18,6 +23,8 @@ from pycypher.cypher_lsp import (
     _handle_message,
     _handle_signature_help,
     _publish_diagnostics,
+    _split_statements,
+    _statement_cache,
 )
 
 
@@ -147,6 +154,189 @@ class TestDiagnostics:
         assert len(errors) > 0
 
 
+_MULTI = (
+    "// people; and friends\n"
+    "MATCH (n:Person) RETURN n.name;\n"
+    "\n"
+    "  MATCH (m:Person {motto: 'a;b'}) RETURN m ;\n"
+    "/* skip; this */ MATCH (k RETURN k\n"
+    ";  \n"
+)
+
+
+def _capture_diagnostics() -> tuple[
+    list[dict],
+    Callable[[str, dict], None],
+]:
+    sent: list[dict] = []
+
+    def capture_notify(method: str, params: dict) -> None:
+        if method == "textDocument/publishDiagnostics":
+            sent.append(params)
+
+    return sent, capture_notify
+
+
+class TestStatements:
+    """Verify statement splitting and per-statement diagnostics."""
+
+    def test_split_ignores_quoted_and_commented_semicolons(self) -> None:
+        statements = _split_statements(_MULTI)
+        assert [(s.line, s.character) for s in statements] == [
+            (1, 0),
+            (3, 2),
+            (4, 17),
+        ]
+        assert statements[1].text == (
+            "MATCH (m:Person {motto: 'a;b'}) RETURN m"
+        )
+        assert _split_statements("  // only a comment;\n;") == []
+
+    def test_diagnostics_point_into_their_statement(self) -> None:
+        diags = _document_diagnostics(_MULTI)
+        errors = [d for d in diags if d["severity"] == 1]
+        assert len(errors) == 1
+        assert errors[0]["range"]["start"]["line"] == 4
+        assert errors[0]["range"]["start"]["character"] >= 17
+
+    def test_lint_position_on_later_line(self) -> None:
+        diags = _document_diagnostics("RETURN 1;\nmatch (n) RETURN n")
+        assert [d["range"]["start"] for d in diags] == [
+            {"line": 1, "character": 0},
+        ]
+
+    def test_edit_reparses_only_changed_statement(self) -> None:
+        from pycypher import cypher_lsp
+
+        _statement_cache.clear()
+        doc = "".join(
+            f"MATCH (n:Person) WHERE n.age > {i} RETURN n;\n"
+            for i in range(10)
+        )
+        with patch.object(
+            cypher_lsp,
+            "_statement_diagnostics",
+            wraps=cypher_lsp._statement_diagnostics,
+        ) as spy:
+            _document_diagnostics(doc)
+            assert spy.call_count == 10
+            # Insert a line above and edit one statement.
+            edited = "\n" + doc.replace("> 3 ", "> 33 ")
+            _document_diagnostics(edited)
+            assert spy.call_count == 11
+
+
+class TestIncrementalSync:
+    """Verify ranged didChange edits."""
+
+    def test_range_change_is_applied(self) -> None:
+        _documents.clear()
+        _documents["file:///inc.cypher"] = "MATCH (n)\nRETURN n"
+        with patch("pycypher.cypher_lsp._notify"):
+            _handle_message(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {"uri": "file:///inc.cypher"},
+                        "contentChanges": [
+                            {
+                                "range": {
+                                    "start": {"line": 1, "character": 7},
+                                    "end": {"line": 1, "character": 8},
+                                },
+                                "text": "n.name",
+                            },
+                            {
+                                "range": {
+                                    "start": {"line": 0, "character": 8},
+                                    "end": {"line": 0, "character": 8},
+                                },
+                                "text": ":Person",
+                            },
+                        ],
+                    },
+                },
+            )
+        assert _documents["file:///inc.cypher"] == (
+            "MATCH (n:Person)\nRETURN n.name"
+        )
+
+    def test_incremental_sync_advertised(self) -> None:
+        with patch("pycypher.cypher_lsp._respond") as mock_respond:
+            _handle_message(
+                {"jsonrpc": "2.0", "id": 1, "method": "initialize"},
+            )
+        caps = mock_respond.call_args[0][1]["capabilities"]
+        assert caps["textDocumentSync"]["change"] == 2
+
+
+class TestDiagnosticsWorker:
+    """Verify debounced background diagnostics."""
+
+    def test_burst_of_edits_publishes_once(self) -> None:
+        uri = "file:///burst.cypher"
+        _documents.clear()
+        sent, capture_notify = _capture_diagnostics()
+        published = threading.Event()
+        worker = _DiagnosticsWorker(delay=0.1)
+
+        def notify(method: str, params: dict) -> None:
+            capture_notify(method, params)
+            published.set()
+
+        with (
+            patch("pycypher.cypher_lsp._notify", side_effect=notify),
+            patch("pycypher.cypher_lsp._diagnostics_worker", worker),
+        ):
+            worker.start()
+            try:
+                for text in ["MATCH (", "MATCH (n", "MATCH (n) RETURN n"]:
+                    _handle_message(
+                        {
+                            "jsonrpc": "2.0",
+                            "method": "textDocument/didChange",
+                            "params": {
+                                "textDocument": {"uri": uri},
+                                "contentChanges": [{"text": text}],
+                            },
+                        },
+                    )
+                # Handling an edit only schedules work.
+                assert not sent
+                assert published.wait(5)
+                time.sleep(0.2)
+            finally:
+                worker.stop()
+        assert len(sent) == 1
+        assert sent[0]["uri"] == uri
+        assert not [d for d in sent[0]["diagnostics"] if d["severity"] == 1]
+
+    def test_closed_document_is_not_published(self) -> None:
+        uri = "file:///closed.cypher"
+        sent, capture_notify = _capture_diagnostics()
+        worker = _DiagnosticsWorker(delay=0.05)
+        _documents[uri] = "RETURN 1"
+        with (
+            patch("pycypher.cypher_lsp._notify", side_effect=capture_notify),
+            patch("pycypher.cypher_lsp._diagnostics_worker", worker),
+        ):
+            worker.start()
+            try:
+                worker.schedule(uri)
+                _handle_message(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "textDocument/didClose",
+                        "params": {"textDocument": {"uri": uri}},
+                    },
+                )
+                time.sleep(0.2)
+            finally:
+                worker.stop()
+        assert sent == []
+
+
 class TestCompletion:
     """Verify completion items."""
 
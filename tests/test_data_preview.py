@@ -7,11 +7,13 @@ Covers:
 - Preview caching with LRU eviction
 - QueryTester: execute Cypher queries against sampled data
 - Query result caching and timing
+- Consistent, relationship-aware samples and progressive previews
 """
 
 from __future__ import annotations
 
 import csv
+import gc
 import tempfile
 import time
 from pathlib import Path
@@ -19,10 +21,12 @@ from pathlib import Path
 import pandas as pd
 import pyarrow as pa
 import pytest
+from pycypher.ingestion import data_preview
 from pycypher.ingestion.data_preview import (
     ColumnStats,
     DataSampler,
     PreviewCache,
+    PreviewStage,
     QueryTester,
     SamplingStrategy,
     SchemaInfo,
@@ -96,6 +100,7 @@ class TestSamplingStrategy:
         assert SamplingStrategy.HEAD in SamplingStrategy
         assert SamplingStrategy.TAIL in SamplingStrategy
         assert SamplingStrategy.RANDOM in SamplingStrategy
+        assert SamplingStrategy.CONSISTENT in SamplingStrategy
 
 
 # ---------------------------------------------------------------------------
@@ -404,3 +409,188 @@ class TestDataSamplerPandasIntegration:
         schema = sampler.schema()
         assert schema.row_count == 50
         assert "x" in schema.column_names
+
+
+# ---------------------------------------------------------------------------
+# TestConsistentSampling
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def social_graph(tmp_path: Path) -> tuple[Path, Path]:
+    """Write 2,000 people and 8,000 KNOWS edges as CSV."""
+    import numpy as np
+
+    rng = np.random.default_rng(3)
+    people = tmp_path / "people.csv"
+    pd.DataFrame(
+        {"id": range(2_000), "name": [f"p{i}" for i in range(2_000)]},
+    ).to_csv(people, index=False)
+    knows = tmp_path / "knows.csv"
+    pd.DataFrame(
+        {
+            "src": rng.integers(0, 2_000, 8_000),
+            "tgt": rng.integers(0, 2_000, 8_000),
+        },
+    ).to_csv(knows, index=False)
+    return people, knows
+
+
+def _graph_tester(
+    social_graph: tuple[Path, Path],
+    **kwargs: object,
+) -> QueryTester:
+    people, knows = social_graph
+    tester = QueryTester(**kwargs)
+    tester.add_entity("Person", str(people), id_col="id")
+    tester.add_relationship(
+        "KNOWS", str(knows), source_col="src", target_col="tgt"
+    )
+    return tester
+
+
+_JOIN = "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.name AS a, b.name AS b"
+
+
+class TestConsistentSampling:
+    """Repeatable, nested samples and key filtering."""
+
+    def test_repeatable_and_nested(self, arrow_table: pa.Table) -> None:
+        sampler = DataSampler(arrow_table)
+        small = sampler.sample(20, SamplingStrategy.CONSISTENT, key="id")
+        again = sampler.sample(20, SamplingStrategy.CONSISTENT, key="id")
+        large = sampler.sample(80, SamplingStrategy.CONSISTENT, key="id")
+        assert small.equals(again)
+        assert set(small["id"].to_pylist()) <= set(large["id"].to_pylist())
+        # Not simply the first rows.
+        assert small["id"].to_pylist() != list(range(20))
+
+    def test_rows_matching(self, sample_csv: Path) -> None:
+        sampler = DataSampler(str(sample_csv))
+        rows = sampler.rows_matching("id", ["3", 5, 999])
+        assert sorted(rows["id"].to_pylist()) == [3, 5]
+        assert len(sampler.rows_matching("id", range(50), limit=7)) == 7
+
+
+class TestGraphSampling:
+    """QueryTester samples keep relationships joinable."""
+
+    def test_sampled_joins_find_matches(
+        self,
+        social_graph: tuple[Path, Path],
+    ) -> None:
+        tester = _graph_tester(social_graph)
+        stage = tester.run_sample(_JOIN, 100)
+        assert stage.result.error is None
+        # Every sampled relationship joins to both of its endpoints.
+        assert len(stage.result.table) == 100
+        assert not stage.complete
+
+    def test_sample_size_limit_keeps_joins(
+        self,
+        social_graph: tuple[Path, Path],
+    ) -> None:
+        result = _graph_tester(social_graph, sample_size=50).run(_JOIN)
+        assert result.table is not None
+        assert len(result.table) == 50
+
+    def test_results_cached_per_query_and_sample(
+        self,
+        social_graph: tuple[Path, Path],
+    ) -> None:
+        cache = PreviewCache()
+        tester = _graph_tester(social_graph, cache=cache)
+        first = tester.run_sample(_JOIN, 100)
+        second = tester.run_sample(_JOIN, 100)
+        other = tester.run_sample(_JOIN, 200)
+        assert not first.cached
+        assert second.cached
+        assert second.result.table.equals(first.result.table)
+        assert not other.cached
+
+
+    def test_complete_only_when_every_source_read(self) -> None:
+        people = pd.DataFrame({"name": ["a", "b", "c"]})
+        knows = pd.DataFrame({"src": [0, 1], "tgt": [1, 2]})
+        tester = QueryTester()
+        # No id_col: no relationship can be matched to a sampled node.
+        tester.add_entity("Person", people)
+        tester.add_relationship(
+            "KNOWS", knows, source_col="src", target_col="tgt"
+        )
+        assert not tester.run_sample(_JOIN, 100).complete
+
+    def test_targets_added_to_target_type_only(self) -> None:
+        people = pd.DataFrame({"id": range(20), "name": range(20)})
+        cities = pd.DataFrame({"id": range(20), "name": range(20)})
+        lives_in = pd.DataFrame({"src": range(20), "tgt": [19] * 20})
+        tester = QueryTester()
+        tester.add_entity("Person", people, id_col="id")
+        tester.add_entity("City", cities, id_col="id")
+        tester.add_relationship(
+            "LIVES_IN",
+            lives_in,
+            source_col="src",
+            target_col="tgt",
+            source_type="Person",
+            target_type="City",
+        )
+        sample = tester._graph_sample(5)
+        person_ids, city_ids = (
+            set(table["id"].to_pylist()) for table in sample.entities
+        )
+        assert 19 in city_ids
+        assert len(person_ids) == 5
+        # Relationships only start at sampled people.
+        assert set(sample.relationships[0]["src"].to_pylist()) <= person_ids
+
+    def test_memory_source_identity_not_reused(self) -> None:
+        frame = pd.DataFrame({"x": [1, 2]})
+        token = data_preview._source_identity(frame)
+        assert data_preview._source_identity(frame) == token
+        key = id(frame)
+        del frame
+        gc.collect()
+        assert key not in data_preview._SOURCE_TOKENS
+        assert data_preview._source_identity(pd.DataFrame()) != token
+
+
+class TestProgressivePreview:
+    """Row counts grow until the latency target or the full data."""
+
+    def test_grows_to_full_data(
+        self,
+        social_graph: tuple[Path, Path],
+    ) -> None:
+        seen: list[PreviewStage] = []
+        stages = _graph_tester(social_graph).run_progressive(
+            _JOIN,
+            initial_rows=50,
+            target_ms=60_000.0,
+            on_stage=seen.append,
+        )
+        assert seen == stages
+        assert [s.sample_rows for s in stages] == [50, 200, 800, 3200, 12800]
+        assert stages[-1].complete
+        full = QueryTester()
+        full.add_entity("Person", str(social_graph[0]), id_col="id")
+        full.add_relationship(
+            "KNOWS", str(social_graph[1]), source_col="src", target_col="tgt"
+        )
+        assert len(stages[-1].result.table) == len(full.run(_JOIN).table)
+
+    def test_stops_at_latency_target(
+        self,
+        social_graph: tuple[Path, Path],
+    ) -> None:
+        stages = _graph_tester(social_graph).run_progressive(
+            _JOIN,
+            target_ms=0.0,
+        )
+        assert len(stages) == 1
+        assert stages[0].result.table is not None
+
+    def test_stops_on_error(self, social_graph: tuple[Path, Path]) -> None:
+        stages = _graph_tester(social_graph).run_progressive("MATCH (")
+        assert len(stages) == 1
+        assert stages[0].result.error
@@ -0,0 +1,339 @@
+"""Tests for factorized MATCH results and the RETURNs they answer.
+
+Weights of :class:`FactorizedFrame` are checked against its flattened
+rows, aggregating queries are compared with factorization switched off,
+and the planner is checked to leave row-returning RETURNs to the flat
+path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import Star
+from pycypher.ast_converter import ASTConverter
+from pycypher.factorized import FactorizedFrame
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+
+_CHAIN = "MATCH (s:State)<-[:IN_STATE]-(u:Puma)<-[:LIVES_IN]-(p:Person) "
+
+
+@pytest.fixture(scope="module")
+def star() -> Star:
+    rng = np.random.default_rng(3)
+    n_people, n_pumas = 2_000, 120
+    states = pd.DataFrame(
+        {ID_COLUMN: range(30), "abbr": [f"S{i}" for i in range(30)]},
+    )
+    pumas = pd.DataFrame(
+        {ID_COLUMN: range(1_000, 1_000 + n_pumas), "pop": range(n_pumas)},
+    )
+    ages = rng.integers(90, size=n_people).astype(float)
+    ages[::17] = np.nan
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: range(10_000, 10_000 + n_people),
+            "age": ages,
+            "rank": rng.integers(5, size=n_people),
+        },
+    )
+
+    def _edges(n: int, sources: pd.Series, targets: pd.Series) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ID_COLUMN: range(n),
+                RELATIONSHIP_SOURCE_COLUMN: rng.choice(sources, n),
+                RELATIONSHIP_TARGET_COLUMN: rng.choice(targets, n),
+            },
+        )
+
+    context = Context(
+        entity_mapping=EntityMapping(
+            mapping={
+                "Person": EntityTable.from_dataframe("Person", people),
+                "Puma": EntityTable.from_dataframe("Puma", pumas),
+                "State": EntityTable.from_dataframe("State", states),
+            },
+        ),
+        relationship_mapping=RelationshipMapping(
+            mapping={
+                "LIVES_IN": RelationshipTable.from_dataframe(
+                    "LIVES_IN",
+                    _edges(n_people, people[ID_COLUMN], pumas[ID_COLUMN]),
+                ),
+                "IN_STATE": RelationshipTable.from_dataframe(
+                    "IN_STATE",
+                    _edges(n_pumas, pumas[ID_COLUMN], states[ID_COLUMN]),
+                ),
+                "KNOWS": RelationshipTable.from_dataframe(
+                    "KNOWS",
+                    _edges(
+                        3 * n_people,
+                        people[ID_COLUMN],
+                        people[ID_COLUMN],
+                    ),
+                ),
+            },
+        ),
+    )
+    return Star(context=context, result_cache_max_mb=0)
+
+
+@pytest.fixture(scope="module")
+def mixed_star() -> Star:
+    """People and cities sharing one KNOWS table."""
+    rng = np.random.default_rng(5)
+    ages = rng.integers(18, 80, 60).astype(float)
+    ages[rng.random(60) < 0.3] = np.nan
+    people = pd.DataFrame({ID_COLUMN: range(60), "age": ages})
+    cities = pd.DataFrame(
+        {ID_COLUMN: range(100, 130), "age": rng.integers(18, 80, 30)},
+    )
+    ids = np.concatenate([np.arange(60), np.arange(100, 130)])
+    knows = pd.DataFrame(
+        {
+            ID_COLUMN: range(250),
+            RELATIONSHIP_SOURCE_COLUMN: rng.choice(ids, 250),
+            RELATIONSHIP_TARGET_COLUMN: rng.choice(ids, 250),
+        },
+    )
+    return Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    "Person": EntityTable.from_dataframe("Person", people),
+                    "City": EntityTable.from_dataframe("City", cities),
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    "KNOWS": RelationshipTable.from_dataframe(
+                        "KNOWS",
+                        knows,
+                    ),
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+
+
+def _match(query: str):
+    return ASTConverter.from_cypher(query).clauses[0]
+
+
+def _rows(frame: pd.DataFrame) -> list[tuple]:
+    frame = frame.astype(object).where(frame.notna(), None)
+    return sorted(
+        (
+            tuple(round(v, 9) if isinstance(v, float) else v for v in row)
+            for row in frame.to_numpy().tolist()
+        ),
+        key=repr,
+    )
+
+
+def _flat(star: Star, query: str) -> pd.DataFrame:
+    star._clause_executor._use_factorization = False
+    try:
+        return star.execute_query(query)
+    finally:
+        star._clause_executor._use_factorization = True
+
+
+# ---------------------------------------------------------------------------
+# FactorizedFrame
+# ---------------------------------------------------------------------------
+
+
+class TestFactorizedFrame:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            _CHAIN + "RETURN count(*)",
+            "MATCH (q:Person)-[:KNOWS]->(p:Person)-[:LIVES_IN]->(u:Puma) "
+            "RETURN count(*)",
+            "MATCH (p:Person)-[:KNOWS]-(q:Person), (p)-[:LIVES_IN]->(u:Puma) "
+            "WHERE q.rank = 1 RETURN count(*)",
+        ],
+    )
+    def test_weights_match_flattened_rows(self, star, query) -> None:
+        frame = star._pattern_matcher.match_to_factorized(_match(query))
+        assert isinstance(frame, FactorizedFrame)
+        flat = frame.flatten().bindings
+        assert len(frame) == len(flat) > 0
+        for var in frame.graph.node_vars:
+            expected = flat[var].value_counts()
+            weights = frame.weights(var)
+            assert weights[weights > 0].sort_index().to_dict() == (
+                expected.sort_index().to_dict()
+            )
+        root, other = frame.graph.node_vars[0], frame.graph.node_vars[-1]
+        roots, ids, weights = frame.pair_weights(root, other)
+        pairs = flat.groupby([root, other]).size()
+        assert dict(zip(zip(roots, ids), weights.tolist())) == pairs.to_dict()
+
+    def test_smaller_than_flat_rows(self, star) -> None:
+        frame = star._pattern_matcher.match_to_factorized(
+            _match(
+                "MATCH (a:Person)-[:KNOWS]->(p:Person)<-[:KNOWS]-(b:Person) "
+                "RETURN count(*)",
+            ),
+        )
+        flat = frame.flatten().bindings
+        assert frame.nbytes * 2 < flat.memory_usage(deep=True).sum()
+
+    def test_ineligible_matches(self, star) -> None:
+        matcher = star._pattern_matcher
+        for query in [
+            # WHERE across two variables
+            _CHAIN + "WHERE p.rank = u.pop RETURN count(*)",
+            "MATCH (p:Person)-[:KNOWS*1..2]->(q:Person) RETURN count(*)",
+            "OPTIONAL MATCH (p:Person)-[:KNOWS]->(q:Person) RETURN count(*)",
+            # cyclic
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(a) "
+            "RETURN count(*)",
+        ]:
+            assert matcher.match_to_factorized(_match(query)) is None
+
+
+# ---------------------------------------------------------------------------
+# RETURN
+# ---------------------------------------------------------------------------
+
+QUERIES = [
+    "MATCH (s:State)<-[:IN_STATE]-(t)<-[:LIVES_IN]-(p) "
+    "RETURN s.abbr AS state, count(p) AS n",
+    _CHAIN + "RETURN count(*) AS n, sum(p.age) AS total",
+    _CHAIN + "WHERE p.age > 30 AND s.abbr <> 'S2' "
+    "RETURN s.abbr AS s, sum(p.age) AS total, avg(p.age) AS mean, "
+    "min(p.age) AS lo, max(p.age) AS hi, count(p.age) AS known",
+    _CHAIN + "RETURN s.abbr AS s, count(DISTINCT u) AS pumas, "
+    "count(DISTINCT p.rank) AS ranks",
+    _CHAIN + "RETURN p.rank AS rank, count(*) AS n, max(u.pop) AS top",
+    "MATCH (p:Person)-[:KNOWS]-(q:Person)-[:LIVES_IN]->(u:Puma) "
+    "RETURN u.pop AS pop, count(*) AS n, avg(p.age) AS age",
+    "MATCH (q:Person)-[:KNOWS]->(p:Person)-[:LIVES_IN]->(u:Puma)"
+    "-[:IN_STATE]->(s:State) RETURN s.abbr AS s, count(*) AS n, "
+    "sum(q.rank) AS ranks",
+    _CHAIN + "WHERE p.rank = 2 RETURN DISTINCT s.abbr AS s",
+    _CHAIN + "WHERE s.abbr = 'none' RETURN count(*) AS n, sum(p.age) AS t",
+    _CHAIN + "WHERE s.abbr = 'none' RETURN s.abbr AS s, count(*) AS n",
+]
+
+
+class TestFactorizedReturn:
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_flat(self, star, query) -> None:
+        result, flat = star.execute_query(query), _flat(star, query)
+        assert _rows(result) == _rows(flat)
+        assert result.dtypes.to_dict() == flat.dtypes.to_dict()
+
+    def test_order_by_limit(self, star) -> None:
+        query = (
+            _CHAIN + "RETURN s.abbr AS s, count(*) AS n ORDER BY s DESC "
+            "LIMIT 4"
+        )
+        result = star.execute_query(query)
+        pd.testing.assert_frame_equal(result, _flat(star, query))
+        assert len(result) == 4
+
+    def test_rows_are_never_built(self, star, monkeypatch) -> None:
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("flattened")
+
+        monkeypatch.setattr(FactorizedFrame, "flatten", _fail)
+        monkeypatch.setattr(
+            type(star._pattern_matcher),
+            "match_to_binding_frame",
+            _fail,
+        )
+        result = star.execute_query(QUERIES[2])
+        assert not result.empty
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            _CHAIN + "RETURN s.abbr AS s, p.age AS age",
+            _CHAIN + "RETURN s.abbr AS s, collect(p.age) AS ages",
+            _CHAIN + "RETURN s.abbr AS s, u.pop AS pop, count(*) AS n",
+            _CHAIN + "RETURN s.abbr AS s, count(*) + 1 AS n",
+            _CHAIN + "RETURN count(*) AS n ORDER BY p.age",
+            _CHAIN + "WITH s RETURN count(*) AS n",
+        ],
+    )
+    def test_row_queries_stay_flat(self, star, query) -> None:
+        ast = ASTConverter.from_cypher(query)
+        assert not star._clause_executor.factorizable(ast)
+
+    def test_dangling_edges_match_flat(self) -> None:
+        people = pd.DataFrame({ID_COLUMN: [1, 2, 3], "n": ["a", "b", "c"]})
+        knows = pd.DataFrame(
+            {
+                ID_COLUMN: [1, 2, 3, 4],
+                RELATIONSHIP_SOURCE_COLUMN: [1, 1, 2, 3],
+                RELATIONSHIP_TARGET_COLUMN: [2, 99, 3, 1],
+            },
+        )
+        star = Star(
+            context=Context(
+                entity_mapping=EntityMapping(
+                    mapping={
+                        "Person": EntityTable.from_dataframe("Person", people),
+                    },
+                ),
+                relationship_mapping=RelationshipMapping(
+                    mapping={
+                        "KNOWS": RelationshipTable.from_dataframe(
+                            "KNOWS",
+                            knows,
+                        ),
+                    },
+                ),
+            ),
+            result_cache_max_mb=0,
+        )
+        for query in [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c) "
+            "RETURN a.n AS a, count(c) AS n",
+            "MATCH (a:Person)-[:KNOWS]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d) "
+            "RETURN a.n AS a, count(*) AS n",
+        ]:
+            assert _rows(star.execute_query(query)) == _rows(
+                _flat(star, query),
+            )
+
+
+class TestLabelSemantics:
+    """Traversed nodes are not label-checked on the flat path either."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person) WHERE b.age IS NULL "
+            "RETURN count(*) AS n",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:City) "
+            "WHERE c.age > 40 RETURN count(*) AS n, sum(b.age) AS t",
+            "MATCH (a)-[:KNOWS]->(b:Person) WHERE b.age < 50 "
+            "RETURN count(*) AS n, min(a.age) AS lo, sum(b.age) AS t",
+            "MATCH (a:Person)-[:KNOWS]->(b:City {age: 69}) "
+            "RETURN count(*) AS n",
+        ],
+    )
+    def test_matches_flat(self, mixed_star, query) -> None:
+        assert _rows(mixed_star.execute_query(query)) == _rows(
+            _flat(mixed_star, query),
+        )
+        assert mixed_star._clause_executor.factorizable(
+            ASTConverter.from_cypher(query),
+        )
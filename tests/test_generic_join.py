@@ -0,0 +1,425 @@
+"""Tests for the worst-case optimal Generic Join used for cyclic MATCH."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.ast_models import ASTConverter
+from pycypher.generic_join import (
+    CSRRelation,
+    JoinAtom,
+    choose_variable_order,
+    generic_join,
+    plan_cyclic_match,
+)
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.query_planner import JoinStrategy, QueryPlanAnalyzer
+from pycypher.relational_models import (
+    ID_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _rel(edges: list[tuple[int, int]], n: int) -> CSRRelation:
+    src = np.array([e[0] for e in edges], dtype=np.int64)
+    tgt = np.array([e[1] for e in edges], dtype=np.int64)
+    return CSRRelation.build(src, tgt, n)
+
+
+def _match(query: str):
+    return ASTConverter.from_cypher(query).clauses[0]
+
+
+def _random_graph(n_nodes: int, n_edges: int, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    persons = pd.DataFrame(
+        {
+            "__ID__": np.arange(n_nodes),
+            "name": [f"p{i}" for i in range(n_nodes)],
+            "age": rng.integers(18, 80, size=n_nodes),
+        },
+    )
+    knows = pd.DataFrame(
+        {
+            "__ID__": np.arange(1000, 1000 + n_edges),
+            "__SOURCE__": rng.integers(0, n_nodes, size=n_edges),
+            "__TARGET__": rng.integers(0, n_nodes, size=n_edges),
+        },
+    )
+    return ContextBuilder.from_dict({"Person": persons, "KNOWS": knows})
+
+
+def _both_plans(ctx, query: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Run *query* with Generic Join and with the binary-join plan."""
+    wcoj = Star(context=ctx).execute_query(query)
+    star = Star(context=ctx)
+    star._pattern_matcher._use_generic_join = False
+    star._pattern_matcher._use_join_ordering = False
+    binary = star.execute_query(query)
+    return wcoj, binary
+
+
+def _canonical(df: pd.DataFrame) -> list[tuple]:
+    return sorted(tuple(str(v) for v in row) for row in df.to_numpy())
+
+
+# ---------------------------------------------------------------------------
+# CSRRelation
+# ---------------------------------------------------------------------------
+
+
+class TestCSRRelation:
+    def test_deduplicates_pairs(self):
+        rel = _rel([(0, 1), (0, 1), (0, 2), (2, 0)], 3)
+        assert len(rel) == 3
+        assert rel.fwd_indices[rel.fwd_indptr[0] : rel.fwd_indptr[1]].tolist() == [
+            1,
+            2,
+        ]
+
+    def test_degrees_both_directions(self):
+        rel = _rel([(0, 1), (0, 2), (2, 1)], 3)
+        codes = np.array([0, 1, 2])
+        assert rel.degrees(codes, reverse=False).tolist() == [2, 0, 1]
+        assert rel.degrees(codes, reverse=True).tolist() == [0, 2, 1]
+
+    def test_expand(self):
+        rel = _rel([(0, 1), (0, 2), (2, 1)], 3)
+        rows, nbrs = rel.expand(np.array([2, 0]), reverse=False)
+        assert rows.tolist() == [0, 1, 1]
+        assert nbrs.tolist() == [1, 1, 2]
+
+    def test_contains(self):
+        rel = _rel([(0, 1), (2, 1)], 3)
+        mask = rel.contains(np.array([0, 1, 2]), np.array([1, 0, 1]))
+        assert mask.tolist() == [True, False, True]
+
+    def test_empty_relation(self):
+        rel = _rel([], 4)
+        assert len(rel) == 0
+        assert rel.active(reverse=False).tolist() == []
+        assert rel.contains(np.array([0]), np.array([1])).tolist() == [False]
+
+
+# ---------------------------------------------------------------------------
+# generic_join kernel
+# ---------------------------------------------------------------------------
+
+
+class TestGenericJoin:
+    def test_triangle(self):
+        # 0->1->2->0 is a triangle; 2->3 dangles.
+        rel = _rel([(0, 1), (1, 2), (2, 0), (2, 3)], 4)
+        atoms = [
+            JoinAtom(rel, "a", "b"),
+            JoinAtom(rel, "b", "c"),
+            JoinAtom(rel, "c", "a"),
+        ]
+        out = generic_join(atoms, ["a", "b", "c"])
+        triples = sorted(zip(out["a"], out["b"], out["c"]))
+        assert triples == [(0, 1, 2), (1, 2, 0), (2, 0, 1)]
+
+    def test_matches_brute_force_on_random_graph(self):
+        rng = np.random.default_rng(0)
+        n = 40
+        edges = set(
+            zip(
+                rng.integers(0, n, 300).tolist(),
+                rng.integers(0, n, 300).tolist(),
+            ),
+        )
+        rel = _rel(sorted(edges), n)
+        atoms = [
+            JoinAtom(rel, "a", "b"),
+            JoinAtom(rel, "b", "c"),
+            JoinAtom(rel, "c", "d"),
+            JoinAtom(rel, "d", "a"),
+        ]
+        out = generic_join(atoms, ["a", "b", "c", "d"])
+        got = sorted(zip(out["a"], out["b"], out["c"], out["d"]))
+        adj: dict[int, set[int]] = {}
+        for s, t in edges:
+            adj.setdefault(s, set()).add(t)
+        expected = sorted(
+            (a, b, c, d)
+            for a in adj
+            for b in adj.get(a, ())
+            for c in adj.get(b, ())
+            for d in adj.get(c, ())
+            if a in adj.get(d, ())
+        )
+        assert got == expected
+
+    def test_candidates_restrict_domain(self):
+        rel = _rel([(0, 1), (1, 2), (2, 0)], 3)
+        atoms = [
+            JoinAtom(rel, "a", "b"),
+            JoinAtom(rel, "b", "c"),
+            JoinAtom(rel, "c", "a"),
+        ]
+        out = generic_join(
+            atoms,
+            ["a", "b", "c"],
+            candidates={"b": np.array([2])},
+        )
+        assert out["b"].tolist() == [2]
+        assert out["a"].tolist() == [1]
+
+    def test_disconnected_order_raises(self):
+        rel = _rel([(0, 1)], 2)
+        with pytest.raises(ValueError, match="shares no relationship"):
+            generic_join(
+                [JoinAtom(rel, "a", "b"), JoinAtom(rel, "c", "d")],
+                ["a", "c", "b", "d"],
+            )
+
+    def test_variable_order_keeps_prefix_connected(self):
+        rel = _rel([], 1)
+        atoms = [
+            JoinAtom(rel, "a", "b"),
+            JoinAtom(rel, "b", "c"),
+            JoinAtom(rel, "c", "a"),
+            JoinAtom(rel, "c", "d"),
+        ]
+        order = choose_variable_order(atoms, ["a", "b", "c", "d"])
+        assert order[0] == "c"  # highest pattern degree
+        assert order[-1] == "d"
+
+
+# ---------------------------------------------------------------------------
+# Pattern planning
+# ---------------------------------------------------------------------------
+
+
+class TestPlanCyclicMatch:
+    def test_triangle_is_planned(self):
+        plan = plan_cyclic_match(
+            _match(
+                "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c)"
+                "-[:KNOWS]->(a) RETURN a",
+            ),
+        )
+        assert plan is not None
+        assert plan.node_vars == ["a", "b", "c"]
+        assert [(e.src_var, e.tgt_var) for e in plan.edges] == [
+            ("a", "b"),
+            ("b", "c"),
+            ("c", "a"),
+        ]
+
+    def test_cycle_across_comma_separated_paths(self):
+        plan = plan_cyclic_match(
+            _match(
+                "MATCH (a)-[:KNOWS]->(b), (b)-[:KNOWS]->(c), "
+                "(a)<-[:KNOWS]-(c) RETURN a",
+            ),
+        )
+        assert plan is not None
+        assert ("c", "a") in [(e.src_var, e.tgt_var) for e in plan.edges]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a)-[:KNOWS]->(b)-[:KNOWS]->(c) RETURN a",
+            "MATCH (a)-[:KNOWS*1..2]->(b)-[:KNOWS]->(a) RETURN a",
+            "MATCH (a)-[:KNOWS]-(b)-[:KNOWS]->(a) RETURN a",
+            "MATCH p = (a)-[:KNOWS]->(b)-[:KNOWS]->(a) RETURN a",
+            "MATCH (a)-[r:KNOWS]->(b)-[r:KNOWS]->(a) RETURN a",
+            "MATCH (a)-[:KNOWS|LIKES]->(b)-[:KNOWS]->(a) RETURN a",
+        ],
+    )
+    def test_ineligible_patterns(self, query):
+        assert plan_cyclic_match(_match(query)) is None
+
+    def test_anon_counter_only_advanced_when_planned(self):
+        counter = [0]
+        plan_cyclic_match(
+            _match("MATCH ()-[:KNOWS]->() RETURN 1"),
+            counter,
+        )
+        assert counter == [0]
+        plan = plan_cyclic_match(
+            _match("MATCH (a)-[:KNOWS]->()-[:KNOWS]->(a) RETURN a"),
+            counter,
+        )
+        assert plan is not None
+        assert counter[0] > 0
+
+    def test_agm_bound_for_triangle(self):
+        plan = plan_cyclic_match(
+            _match(
+                "MATCH (a)-[:KNOWS]->(b)-[:KNOWS]->(c)-[:KNOWS]->(a) RETURN a",
+            ),
+        )
+        assert plan is not None
+        assert plan.agm_bound([100, 100, 100]) == 1000
+
+
+# ---------------------------------------------------------------------------
+# End-to-end equivalence with the binary-join plan
+# ---------------------------------------------------------------------------
+
+
+class TestCyclicMatchExecution:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[r:KNOWS]->(b:Person)-[s:KNOWS]->(c:Person)"
+            "-[t:KNOWS]->(a) RETURN a.name, b.name, c.name, r, s, t",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(d:Person)-[:KNOWS]->(a) RETURN a, b, c, d",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) WHERE a.age > 40 AND b.age < c.age "
+            "RETURN a.name, b.name, c.name",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(a) "
+            "RETURN a.name AS x, b.name AS y",
+        ],
+    )
+    def test_matches_binary_join_plan(self, query):
+        ctx = _random_graph(60, 400)
+        wcoj, binary = _both_plans(ctx, query)
+        assert len(wcoj) > 0
+        assert _canonical(wcoj) == _canonical(binary)
+
+    def test_triangle_count(self):
+        ctx = _random_graph(60, 400)
+        query = (
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN count(*) AS n"
+        )
+        wcoj, binary = _both_plans(ctx, query)
+        assert wcoj["n"].iloc[0] == binary["n"].iloc[0] > 0
+
+    def test_parallel_edges_preserve_multiplicity(self):
+        persons = pd.DataFrame({"__ID__": [1, 2, 3]})
+        knows = pd.DataFrame(
+            {
+                "__ID__": [10, 11, 12, 13],
+                "__SOURCE__": [1, 1, 2, 3],
+                "__TARGET__": [2, 2, 3, 1],
+            },
+        )
+        ctx = Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    "Person": EntityTable(
+                        entity_type="Person",
+                        identifier="Person",
+                        column_names=[ID_COLUMN],
+                        source_obj_attribute_map={},
+                        attribute_map={},
+                        source_obj=persons,
+                    ),
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    "KNOWS": RelationshipTable(
+                        relationship_type="KNOWS",
+                        identifier="KNOWS",
+                        column_names=[ID_COLUMN, "__SOURCE__", "__TARGET__"],
+                        source_obj_attribute_map={},
+                        attribute_map={},
+                        source_obj=knows,
+                        source_entity_type="Person",
+                        target_entity_type="Person",
+                    ),
+                },
+            ),
+        )
+        wcoj, binary = _both_plans(
+            ctx,
+            "MATCH (a:Person)-[r:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN a, r",
+        )
+        assert _canonical(wcoj) == _canonical(binary)
+        result = wcoj[wcoj["a"] == 1]
+        assert sorted(result["r"].tolist()) == [10, 11]
+
+    def test_inline_property_on_back_reference(self):
+        persons = pd.DataFrame(
+            {"__ID__": [1, 2, 3, 4], "name": ["a", "b", "c", "d"]},
+        )
+        knows = pd.DataFrame(
+            {
+                "__ID__": [10, 11, 12, 13, 14, 15],
+                "__SOURCE__": [1, 2, 3, 4, 2, 3],
+                "__TARGET__": [2, 3, 1, 2, 3, 4],
+            },
+        )
+        ctx = ContextBuilder.from_dict({"Person": persons, "KNOWS": knows})
+        result = Star(context=ctx).execute_query(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a {name: 'd'}) RETURN b.name AS b, c.name AS c",
+        )
+        assert result.to_dict("records") == [{"b": "b", "c": "c"}]
+
+    def test_no_cycles_returns_empty(self):
+        persons = pd.DataFrame({"__ID__": [1, 2, 3]})
+        knows = pd.DataFrame(
+            {"__ID__": [10, 11], "__SOURCE__": [1, 2], "__TARGET__": [2, 3]},
+        )
+        ctx = ContextBuilder.from_dict({"Person": persons, "KNOWS": knows})
+        result = Star(context=ctx).execute_query(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN a, b, c",
+        )
+        assert len(result) == 0
+
+    def test_second_match_restricted_by_context(self):
+        ctx = _random_graph(60, 400)
+        query = (
+            "MATCH (a:Person) WHERE a.age > 50 WITH a "
+            "MATCH (a)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)-[:KNOWS]->(a) "
+            "RETURN a.name, b.name, c.name"
+        )
+        wcoj, binary = _both_plans(ctx, query)
+        assert _canonical(wcoj) == _canonical(binary)
+
+
+# ---------------------------------------------------------------------------
+# Planner / EXPLAIN integration
+# ---------------------------------------------------------------------------
+
+
+class TestPlannerIntegration:
+    def test_analyzer_reports_leapfrog_for_cycle(self):
+        ctx = _random_graph(20, 50)
+        query = ASTConverter.from_cypher(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN a",
+        )
+        analysis = QueryPlanAnalyzer(query, ctx).analyze()
+        assert len(analysis.multiway_join_plans) == 1
+        plan = analysis.multiway_join_plans[0]
+        assert plan.strategy is JoinStrategy.LEAPFROG
+        n_edges = len(ctx.relationship_mapping["KNOWS"].source_obj)
+        assert plan.estimated_rows == int(np.ceil(round(n_edges**1.5, 6)))
+
+    def test_analyzer_ignores_acyclic(self):
+        ctx = _random_graph(20, 50)
+        query = ASTConverter.from_cypher(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a",
+        )
+        analysis = QueryPlanAnalyzer(query, ctx).analyze()
+        assert analysis.multiway_join_plans == []
+
+    def test_explain_mentions_generic_join(self):
+        ctx = _random_graph(20, 50)
+        text = Star(context=ctx).explain_query(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN a",
+        )
+        assert "Multi-way joins:" in text
+        assert "leapfrog" in text
+        assert "Generic Join" in text
@@ -0,0 +1,146 @@
+"""Tests for pycypher.grammar_cache: the on-disk compiled-grammar cache.
+
+Covers:
+- A cached parser parses exactly like a freshly compiled one
+- Corrupt, tampered and stale cache files fall back to compiling
+- Pickles referencing anything but Lark's own classes are refused
+- An empty ``PYCYPHER_GRAMMAR_CACHE_DIR`` disables the cache
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import pickle
+from pathlib import Path
+
+import pycypher.config as config
+import pytest
+from lark import Lark, Tree
+from pycypher import grammar_cache
+from pycypher.grammar_cache import cache_path, load_parser
+from pycypher.grammar_parser import CYPHER_GRAMMAR
+
+_OPTIONS = {
+    "parser": "earley",
+    "debug": False,
+    "maybe_placeholders": True,
+    "ambiguity": "explicit",
+}
+
+_SMALL_GRAMMAR = r"""
+start: pair ("," pair)*
+pair: WORD "=" NUMBER
+%import common.WORD
+%import common.NUMBER
+%import common.WS
+%ignore WS
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the grammar cache at a private temporary directory."""
+    directory = tmp_path / "grammar-cache"
+    monkeypatch.setattr(config, "GRAMMAR_CACHE_DIR", str(directory))
+    return directory
+
+
+class TestRoundTrip:
+    def test_cached_parser_matches_compiled(self, cache_dir: Path) -> None:
+        fresh = Lark(CYPHER_GRAMMAR, **_OPTIONS)
+        first = load_parser(CYPHER_GRAMMAR, **_OPTIONS)
+        path = cache_path(CYPHER_GRAMMAR, **_OPTIONS)
+        assert path is not None and path.exists()
+        cached = load_parser(CYPHER_GRAMMAR, **_OPTIONS)
+        assert cached is not first
+        for query in (
+            "MATCH (n:Person {name: 'A'})-[:KNOWS*1..2]->(m) "
+            "WHERE n.age > 3 RETURN n.name, count(m) ORDER BY n.name",
+            "UNWIND [1, 2] AS x WITH x WHERE x > 1 RETURN x",
+            "MATCH (n) SET n.x = 1 RETURN n",
+        ):
+            assert cached.parse(query) == fresh.parse(query)
+
+    def test_key_depends_on_grammar_and_options(self, cache_dir: Path) -> None:
+        base = cache_path(_SMALL_GRAMMAR, parser="earley")
+        assert base is not None and base.parent == cache_dir
+        assert cache_path(_SMALL_GRAMMAR + "\n", parser="earley") != base
+        assert cache_path(_SMALL_GRAMMAR, parser="lalr") != base
+        assert cache_path(_SMALL_GRAMMAR, parser="earley") == base
+
+
+class TestFallback:
+    def test_corrupt_file_recompiles(self, cache_dir: Path) -> None:
+        path = cache_path(_SMALL_GRAMMAR)
+        assert path is not None
+        cache_dir.mkdir()
+        path.write_bytes(b"not a pickle")
+        parser = load_parser(_SMALL_GRAMMAR)
+        assert parser.parse("a = 1, b = 2").children
+        # The bad file was replaced by a good one.
+        assert grammar_cache._load(path) is not None
+
+    def test_tampered_payload_is_ignored(self, cache_dir: Path) -> None:
+        load_parser(_SMALL_GRAMMAR)
+        path = cache_path(_SMALL_GRAMMAR)
+        assert path is not None
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 1
+        path.write_bytes(bytes(data))
+        assert grammar_cache._load(path) is None
+
+    def test_file_for_another_key_is_ignored(self, cache_dir: Path) -> None:
+        load_parser(_SMALL_GRAMMAR)
+        path = cache_path(_SMALL_GRAMMAR)
+        other = cache_path(_SMALL_GRAMMAR, parser="lalr")
+        assert path is not None
+        assert other is not None
+        other.write_bytes(path.read_bytes())
+        assert grammar_cache._load(other) is None
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            (os.system, ("echo pwned",)),
+            (getattr, (os, "system")),
+            (getattr, (pickle, "loads")),
+            (getattr, (Tree("start", []), "__init__")),
+        ],
+    )
+    def test_foreign_globals_are_refused(
+        self,
+        cache_dir: Path,
+        payload: tuple,
+    ) -> None:
+        class _Evil:
+            def __reduce__(self) -> tuple:
+                return payload
+
+        path = cache_path(_SMALL_GRAMMAR)
+        assert path is not None
+        buffer = io.BytesIO()
+        grammar_cache._Pickler(buffer).dump(_Evil())
+        body = buffer.getvalue()
+        cache_dir.mkdir()
+        path.write_bytes(grammar_cache._header(path, body) + body)
+        assert grammar_cache._load(path) is None
+        assert load_parser(_SMALL_GRAMMAR).parse("a = 1").children
+
+    def test_empty_directory_disables_cache(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(config, "GRAMMAR_CACHE_DIR", "")
+        assert cache_path(_SMALL_GRAMMAR) is None
+        assert load_parser(_SMALL_GRAMMAR).parse("a = 1").children
+
+    def test_unwritable_directory_still_parses(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setattr(config, "GRAMMAR_CACHE_DIR", str(blocker / "sub"))
+        assert load_parser(_SMALL_GRAMMAR).parse("a = 1").children
@@ -2,6 +2,7 @@
 
 Covers:
 - AdjacencyIndex: build, outgoing/incoming lookups, batch lookups
+- DegreeIndex: per-direction and per-neighbour-label degree lookups
 - PropertyValueIndex: build, equality lookups, distinct values
 - EntityLabelIndex: build, membership, count
 - GraphIndexManager: lazy build, epoch invalidation, indexed scans
@@ -20,6 +21,7 @@ from pycypher.constants import (
 )
 from pycypher.graph_index import (
     AdjacencyIndex,
+    DegreeIndex,
     EntityLabelIndex,
     PropertyValueIndex,
 )
@@ -248,6 +250,65 @@ class TestEntityLabelIndex:
         assert idx.contains("x") is False
 
 
+# ---------------------------------------------------------------------------
+# DegreeIndex tests
+# ---------------------------------------------------------------------------
+
+
+class TestDegreeIndex:
+    @pytest.mark.parametrize(
+        ("direction", "expected"),
+        [
+            ("outgoing", [2, 1, 2, 0, 0]),
+            ("incoming", [1, 1, 2, 1, 0]),
+            ("both", [3, 2, 4, 1, 0]),
+        ],
+    )
+    def test_lookup(self, relationship_df, direction, expected):
+        idx = DegreeIndex.build("KNOWS", direction, relationship_df)
+        ids = np.array(["a", "b", "c", "d", "zzz"], dtype=object)
+        assert idx.lookup(ids).tolist() == expected
+
+    def test_self_loop_counts_once_undirected(self):
+        df = pd.DataFrame(
+            {
+                RELATIONSHIP_SOURCE_COLUMN: [1, 1],
+                RELATIONSHIP_TARGET_COLUMN: [1, 2],
+            },
+        )
+        idx = DegreeIndex.build("KNOWS", "both", df)
+        assert idx.lookup(np.array([1, 2])).tolist() == [2, 1]
+
+    def test_neighbor_ids(self, relationship_df):
+        idx = DegreeIndex.build(
+            "KNOWS",
+            "outgoing",
+            relationship_df,
+            neighbor_label="Hub",
+            neighbor_ids=np.array(["c"], dtype=object),
+        )
+        ids = np.array(["a", "b", "c"], dtype=object)
+        assert idx.lookup(ids).tolist() == [1, 1, 0]
+
+    def test_null_and_mismatched_ids(self):
+        df = pd.DataFrame(
+            {
+                RELATIONSHIP_SOURCE_COLUMN: [1, 1, 2],
+                RELATIONSHIP_TARGET_COLUMN: [2, 3, 3],
+            },
+        )
+        idx = DegreeIndex.build("KNOWS", "outgoing", df)
+        assert idx.lookup(np.array([1.0, np.nan])).tolist() == [2, 0]
+        assert idx.lookup(np.array(["1", "2"], dtype=object)).tolist() == [
+            2,
+            1,
+        ]
+
+    def test_empty(self):
+        idx = DegreeIndex.build("KNOWS", "outgoing", pd.DataFrame())
+        assert idx.lookup(np.array([1, 2])).tolist() == [0, 0]
+
+
 # ---------------------------------------------------------------------------
 # GraphIndexManager tests
 # ---------------------------------------------------------------------------
@@ -284,6 +345,21 @@ class TestGraphIndexManager:
         assert idx.contains(1) is True
         assert idx.contains(99) is False
 
+    def test_degree_index(self, context_with_data):
+        mgr = context_with_data.index_manager
+        idx = mgr.get_degree_index("KNOWS", "incoming")
+        assert idx is not None
+        assert idx.lookup(np.array([1, 2, 3, 4])).tolist() == [1, 1, 2, 1]
+        assert mgr.get_degree_index("KNOWS", "incoming") is idx
+        assert mgr.get_degree_index("NONEXISTENT") is None
+
+    def test_degree_index_neighbor_label(self, context_with_data):
+        mgr = context_with_data.index_manager
+        idx = mgr.get_degree_index("KNOWS", "outgoing", "Person")
+        assert idx.lookup(np.array([1, 2])).tolist() == [2, 1]
+        idx = mgr.get_degree_index("KNOWS", "outgoing", "City")
+        assert idx.lookup(np.array([1, 2])).tolist() == [0, 0]
+
     def test_epoch_invalidation(self, context_with_data):
         mgr = context_with_data.index_manager
         idx1 = mgr.get_adjacency_index("KNOWS")
@@ -295,6 +371,12 @@ class TestGraphIndexManager:
         idx2 = mgr.get_adjacency_index("KNOWS")
         assert idx2 is not idx1  # Rebuilt after epoch change
 
+    def test_epoch_invalidates_degree_index(self, context_with_data):
+        mgr = context_with_data.index_manager
+        idx1 = mgr.get_degree_index("KNOWS")
+        context_with_data._data_epoch += 1
+        assert mgr.get_degree_index("KNOWS") is not idx1
+
     def test_indexed_relationship_scan_outgoing(self, context_with_data):
         mgr = context_with_data.index_manager
         result = mgr.indexed_relationship_scan(
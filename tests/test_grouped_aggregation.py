@@ -0,0 +1,300 @@
+"""Tests for single-pass grouped aggregation over factorized group codes."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.aggregation_planner import AggregationPlanner
+from pycypher.ast_models import (
+    FunctionInvocation,
+    PropertyLookup,
+    ReturnItem,
+    Variable,
+)
+from pycypher.binding_evaluator import BindingExpressionEvaluator
+from pycypher.binding_frame import BindingFrame
+from pycypher.clause_executor import ClauseExecutor
+from pycypher.grouped_aggregation import GroupCodes, PartialAggregates
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def rows() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    n = 5_000
+    ints = rng.integers(0, 100, size=n)
+    floats = rng.random(n)
+    floats[rng.random(n) < 0.2] = np.nan
+    return pd.DataFrame(
+        {
+            "state": rng.choice(["CA", "NY", "TX", "WA"], size=n),
+            "year": rng.integers(2000, 2004, size=n),
+            "i": ints,
+            "f": floats,
+            "s": rng.choice(["a", "b", "c"], size=n),
+        },
+    )
+
+
+AGGREGATES = {
+    "n": ("count", None),
+    "nf": ("count", "f"),
+    "si": ("sum", "i"),
+    "sf": ("sum", "f"),
+    "af": ("avg", "f"),
+    "lo": ("min", "i"),
+    "hi": ("max", "f"),
+    "ms": ("min", "s"),
+}
+
+
+def _aggregates(df: pd.DataFrame) -> dict:
+    return {
+        alias: (func, None if col is None else df[col])
+        for alias, (func, col) in AGGREGATES.items()
+    }
+
+
+def _expected(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    grouped = df.groupby(keys, sort=False)
+    return pd.DataFrame(
+        {
+            "n": grouped.size(),
+            "nf": grouped["f"].count(),
+            "si": grouped["i"].sum(),
+            "sf": grouped["f"].sum(min_count=1),
+            "af": grouped["f"].mean(),
+            "lo": grouped["i"].min(),
+            "hi": grouped["f"].max(),
+            "ms": grouped["s"].min(),
+        },
+    ).reset_index()
+
+
+# ---------------------------------------------------------------------------
+# Group codes
+# ---------------------------------------------------------------------------
+
+
+class TestGroupCodes:
+    def test_first_seen_order(self):
+        keys = pd.DataFrame({"k": ["b", "a", "b", "c", "a"]})
+        groups = GroupCodes.from_frame(keys)
+        assert groups.codes.tolist() == [0, 1, 0, 2, 1]
+        assert groups.key_frame(keys)["k"].tolist() == ["b", "a", "c"]
+        assert [r.tolist() for r in groups.group_rows()] == [
+            [0, 2],
+            [1, 4],
+            [3],
+        ]
+
+    def test_multi_column_keys(self):
+        keys = pd.DataFrame({"a": [1, 1, 2, 1], "b": ["x", "y", "x", "x"]})
+        assert GroupCodes.from_frame(keys).codes.tolist() == [0, 1, 2, 0]
+
+    def test_null_keys_form_one_group(self):
+        keys = pd.DataFrame(
+            {"k": pd.Series(["a", None, np.nan], dtype=object)}
+        )
+        assert GroupCodes.from_frame(keys).n_groups == 2
+
+    def test_unhashable_keys(self):
+        keys = pd.DataFrame({"k": pd.Series([[1], [2]], dtype=object)})
+        assert GroupCodes.from_frame(keys) is None
+
+    def test_empty_frame(self):
+        groups = GroupCodes.from_frame(pd.DataFrame({"k": []}))
+        assert groups.n_groups == 0
+        assert groups.group_rows() == []
+
+
+# ---------------------------------------------------------------------------
+# Partial aggregates
+# ---------------------------------------------------------------------------
+
+
+class TestPartialAggregates:
+    @pytest.mark.parametrize("keys", [["state"], ["state", "year"]])
+    def test_single_pass_matches_pandas(self, rows, keys):
+        result = PartialAggregates.from_rows(
+            rows[keys],
+            _aggregates(rows),
+        ).finalize()
+        pd.testing.assert_frame_equal(
+            result,
+            _expected(rows, keys),
+            check_dtype=False,
+        )
+
+    def test_merged_chunks_match_single_pass(self, rows):
+        keys = ["state", "year"]
+        # The first chunk sees only some of the groups.
+        chunks = [rows.iloc[:40], rows.iloc[40:2_000], rows.iloc[2_000:]]
+        partials = [
+            PartialAggregates.from_rows(chunk[keys], _aggregates(chunk))
+            for chunk in chunks
+        ]
+        merged = partials[0].merge(*partials[1:]).finalize()
+        whole = PartialAggregates.from_rows(
+            rows[keys],
+            _aggregates(rows),
+        ).finalize()
+        pd.testing.assert_frame_equal(merged, whole, check_exact=False)
+
+    def test_collect_keeps_nulls_and_row_order(self):
+        keys = pd.DataFrame({"k": ["a", "b", "a", "a"]})
+        values = pd.Series([1.0, 2.0, None, 3.0])
+        first = PartialAggregates.from_rows(
+            keys.iloc[:2],
+            {"c": ("collect", values.iloc[:2])},
+        )
+        second = PartialAggregates.from_rows(
+            keys.iloc[2:],
+            {"c": ("collect", values.iloc[2:])},
+        )
+        result = first.merge(second).finalize()
+        assert result["c"].iloc[0][0] == 1.0
+        assert np.isnan(result["c"].iloc[0][1])
+        assert result["c"].iloc[0][2] == 3.0
+        assert result["c"].iloc[1] == [2.0]
+
+    def test_all_null_group(self):
+        keys = pd.DataFrame({"k": ["a", "b"]})
+        values = pd.Series([1, None], dtype=object)
+        result = PartialAggregates.from_rows(
+            keys,
+            {"s": ("sum", values), "n": ("count", values)},
+        ).finalize()
+        assert result["s"].tolist() == [1, None]
+        assert result["n"].tolist() == [1, 0]
+
+    def test_rejects_unknown_function(self):
+        with pytest.raises(ValueError, match="not mergeable"):
+            PartialAggregates.from_rows(
+                pd.DataFrame({"k": [1]}),
+                {"x": ("stdev", pd.Series([1.0]))},
+            )
+
+    def test_rejects_mismatched_merge(self):
+        keys = pd.DataFrame({"k": [1]})
+        left = PartialAggregates.from_rows(keys, {"x": ("count", None)})
+        right = PartialAggregates.from_rows(
+            keys,
+            {"x": ("sum", pd.Series([1]))},
+        )
+        with pytest.raises(ValueError, match="different functions"):
+            left.merge(right)
+
+
+# ---------------------------------------------------------------------------
+# Query execution
+# ---------------------------------------------------------------------------
+
+
+class TestGroupedReturn:
+    @pytest.fixture
+    def star(self) -> Star:
+        people = pd.DataFrame(
+            {
+                "__ID__": range(6),
+                "city": ["A", "B", "A", None, "B", "A"],
+                "age": [30, 40, None, 50, 20, 10],
+            },
+        )
+        return Star(context=ContextBuilder.from_dict({"Person": people}))
+
+    def test_null_group_key_is_kept(self, star):
+        result = star.execute_query(
+            "MATCH (p:Person) RETURN p.city AS city, count(*) AS n, "
+            "sum(p.age) AS total, avg(p.age) AS mean, collect(p.age) AS ages",
+        )
+        assert len(result) == 3
+        assert result["n"].tolist() == [3, 2, 1]
+        assert result["total"].tolist()[:2] == [40, 60]
+        assert result["mean"].tolist() == [20.0, 30.0, 50.0]
+        assert result["ages"].iloc[1] == [40, 20]
+
+    def test_mixed_with_distinct_and_arithmetic(self, star):
+        result = star.execute_query(
+            "MATCH (p:Person) WHERE p.city IS NOT NULL "
+            "RETURN p.city AS city, count(DISTINCT p.age) AS d, "
+            "max(p.age) - min(p.age) AS spread ORDER BY city",
+        )
+        assert result["d"].tolist() == [2, 2]
+        assert result["spread"].tolist() == [20, 20]
+
+
+class TestGroupCodeCache:
+    def test_reused_until_the_frame_is_written(self, monkeypatch):
+        people = pd.DataFrame(
+            {
+                "__ID__": range(4),
+                "city": ["A", "B", "A", "B"],
+                "age": [1, 2, 3, 4],
+            },
+        )
+        frame = BindingFrame(
+            bindings=pd.DataFrame({"p": range(4)}),
+            type_registry={"p": "Person"},
+            context=ContextBuilder.from_dict({"Person": people}),
+        )
+        planner = AggregationPlanner(
+            evaluator_factory=BindingExpressionEvaluator,
+        )
+        factorized = []
+        from_frame = GroupCodes.from_frame
+
+        def _from_frame(keys):
+            factorized.append(list(keys.columns))
+            return from_frame(keys)
+
+        monkeypatch.setattr(GroupCodes, "from_frame", _from_frame)
+
+        def _aggregate(function: str) -> dict:
+            age = PropertyLookup(expression=Variable(name="p"), property="age")
+            result = planner.aggregate_items(
+                [
+                    ReturnItem(
+                        expression=PropertyLookup(
+                            expression=Variable(name="p"),
+                            property="city",
+                        ),
+                        alias="city",
+                    ),
+                    ReturnItem(
+                        expression=FunctionInvocation(
+                            name=function,
+                            arguments=[age],
+                        ),
+                        alias="value",
+                    ),
+                ],
+                frame,
+            )
+            return dict(zip(result["city"], result["value"], strict=True))
+
+        assert _aggregate("sum") == {"A": 4, "B": 6}
+        assert _aggregate("max") == {"A": 3, "B": 4}
+        assert factorized == [["city"]]
+
+        frame.mutate("p", "city", pd.Series(["C", "C", "C", "D"]))
+        executor = ClauseExecutor(
+            context=frame.context,
+            pattern_matcher=MagicMock(),
+            mutations=MagicMock(),
+            frame_joiner=MagicMock(),
+            projection_planner=MagicMock(),
+            query_analyzer=MagicMock(),
+            evaluator_factory=BindingExpressionEvaluator,
+        )
+        executor._dispatch_set(MagicMock(), frame, None)
+        assert _aggregate("sum") == {"C": 6, "D": 4}
+        assert factorized == [["city"], ["city"]]
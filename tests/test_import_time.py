@@ -0,0 +1,108 @@
+"""Import-time hygiene for pycypher entry points.
+
+Each check runs in a fresh interpreter so modules already imported by the
+test session do not hide regressions.  Only which modules get loaded is
+asserted — wall-clock budgets live in
+``tests/benchmarks/bench_import_time.py``, where parallel test workers
+cannot skew them.
+
+Covers:
+- ``import pycypher`` / ``pycypher.cli`` / ``pycypher.nmetl_cli`` do not
+  load pandas or the query engine
+- Lazily loaded attributes still resolve, appear in ``dir()`` and keep
+  typo suggestions
+- The lazy ``nmetl`` group still lists and runs every command
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+_HEAVY_MODULES = ["pandas", "pycypher.star", "pycypher.relational_models"]
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+
+
+def _loaded_modules(module: str) -> set[str]:
+    code = f"import json, sys, {module}; print(json.dumps(list(sys.modules)))"
+    return set(json.loads(_run(code).stdout))
+
+
+class TestNoHeavyImports:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "pycypher",
+            "pycypher.cli",
+            "pycypher.cli.main",
+            "pycypher.nmetl_cli",
+        ],
+    )
+    def test_engine_not_loaded(self, module: str) -> None:
+        loaded = _loaded_modules(module)
+        assert not loaded.intersection(_HEAVY_MODULES)
+
+    def test_parser_not_compiled_on_import(self) -> None:
+        code = (
+            "import threading, pycypher.grammar_parser; "
+            "print(sorted(t.name for t in threading.enumerate()))"
+        )
+        assert "pycypher-parser-warmup" not in _run(code).stdout
+
+
+class TestLazyAttributes:
+    def test_public_names_resolve(self) -> None:
+        import pycypher
+
+        for name in pycypher.__all__:
+            assert getattr(pycypher, name) is not None, name
+        assert "Star" in dir(pycypher)
+        assert pycypher.Star is pycypher.star.Star
+
+    def test_typo_suggestion_still_works(self) -> None:
+        import pycypher
+
+        with pytest.raises(AttributeError, match="Star"):
+            pycypher.Stra  # noqa: B018
+
+    def test_ingestion_names_resolve(self) -> None:
+        from pycypher import ingestion
+
+        for name in ingestion.__all__:
+            assert getattr(ingestion, name) is not None, name
+
+
+class TestLazyCommandGroup:
+    def test_lists_every_command(self) -> None:
+        from pycypher.cli.main import _COMMANDS, cli
+
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in _COMMANDS:
+            assert name in result.output
+
+    def test_unknown_command_suggests(self) -> None:
+        from pycypher.cli.main import cli
+
+        result = CliRunner().invoke(cli, ["valdate"])
+        assert result.exit_code != 0
+        assert "validate" in result.output
+
+    def test_command_runs(self) -> None:
+        from pycypher.cli.main import cli
+
+        result = CliRunner().invoke(cli, ["parse", "MATCH (n) RETURN n"])
+        assert result.exit_code == 0, result.output
@@ -0,0 +1,477 @@
+"""Tests for cost-based (DPccp) join ordering of MATCH patterns."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import config
+from pycypher.ast_models import ASTConverter
+from pycypher.cardinality_estimator import CardinalityFeedbackStore
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.join_order import (
+    FEEDBACK_KEY_PREFIX,
+    JoinRelation,
+    enumerate_join_order,
+    plan_join_order,
+)
+from pycypher.query_planner import QueryPlanAnalyzer
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _match(query: str):
+    return ASTConverter.from_cypher(query).clauses[0]
+
+
+def _rel(name: str, rows: float, **ndv: float) -> JoinRelation:
+    return JoinRelation(
+        name=name,
+        kind="relationship" if len(ndv) > 1 else "node",
+        variable=name,
+        variables=frozenset(ndv),
+        estimated_rows=rows,
+        ndv=dict(ndv),
+    )
+
+
+def _social_graph(seed: int = 3) -> ContextBuilder:
+    rng = np.random.default_rng(seed)
+    n_people, n_cities = 300, 25
+    people = pd.DataFrame(
+        {
+            "__ID__": np.arange(n_people),
+            "name": [f"p{i}" for i in range(n_people)],
+            "age": rng.integers(18, 80, size=n_people),
+        },
+    )
+    cities = pd.DataFrame(
+        {
+            "__ID__": np.arange(1000, 1000 + n_cities),
+            "name": [f"c{i}" for i in range(n_cities)],
+        },
+    )
+    knows = pd.DataFrame(
+        {
+            "__ID__": np.arange(5000, 8000),
+            "__SOURCE__": rng.integers(0, n_people, size=3000),
+            "__TARGET__": rng.integers(0, n_people, size=3000),
+        },
+    )
+    lives_in = pd.DataFrame(
+        {
+            "__ID__": np.arange(9000, 9000 + n_people),
+            "__SOURCE__": np.arange(n_people),
+            "__TARGET__": rng.integers(1000, 1000 + n_cities, size=n_people),
+        },
+    )
+    return ContextBuilder.from_dict(
+        {
+            "Person": people,
+            "City": cities,
+            "KNOWS": knows,
+            "LIVES_IN": lives_in,
+        },
+    )
+
+
+def _mixed_label_graph(seed: int = 5) -> ContextBuilder:
+    """People with NULL ages and KNOWS edges that also reach cities and
+    IDs no entity table holds — the hops do not check endpoint labels.
+    """
+    rng = np.random.default_rng(seed)
+    ages = rng.integers(18, 80, size=60).astype(float)
+    ages[rng.random(60) < 0.3] = np.nan
+    people = pd.DataFrame(
+        {"__ID__": np.arange(60), "name": [f"p{i}" for i in range(60)]},
+    ).assign(age=ages)
+    cities = pd.DataFrame(
+        {
+            "__ID__": np.arange(100, 130),
+            "name": [f"c{i}" for i in range(30)],
+            "age": rng.integers(18, 80, size=30),
+        },
+    )
+    ids = np.concatenate([np.arange(60), np.arange(100, 130), [500, 501]])
+    edges = sorted(
+        {(int(s), int(t)) for s, t in rng.choice(ids, size=(260, 2))},
+    )
+    knows = pd.DataFrame(
+        {
+            "__ID__": np.arange(1000, 1000 + len(edges)),
+            "__SOURCE__": [s for s, _ in edges],
+            "__TARGET__": [t for _, t in edges],
+        },
+    )
+    return ContextBuilder.from_dict(
+        {"Person": people, "City": cities, "KNOWS": knows},
+    )
+
+
+def _both_orders(ctx, query: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Run *query* with cost-based join ordering and left to right."""
+    ordered = Star(context=ctx).execute_query(query)
+    star = Star(context=ctx)
+    star._pattern_matcher._use_join_ordering = False
+    sequential = star.execute_query(query)
+    return ordered, sequential
+
+
+def _canonical(df: pd.DataFrame) -> list[tuple]:
+    return sorted(tuple(str(v) for v in row) for row in df.to_numpy())
+
+
+def _brute_force_cost(relations: list[JoinRelation]) -> float:
+    """Optimal C_out over all bushy trees without cross products."""
+    from pycypher.join_order import _CardinalityModel
+
+    model = _CardinalityModel(relations, [], None, None)
+    n = len(relations)
+
+    def _connected(mask: int) -> bool:
+        members = [i for i in range(n) if mask >> i & 1]
+        seen = {members[0]}
+        stack = [members[0]]
+        while stack:
+            i = stack.pop()
+            for j in members:
+                if (
+                    j not in seen
+                    and relations[i].variables & relations[j].variables
+                ):
+                    seen.add(j)
+                    stack.append(j)
+        return len(seen) == len(members)
+
+    best: dict[int, float] = {1 << i: 0.0 for i in range(n)}
+    for size in range(2, n + 1):
+        for combo in itertools.combinations(range(n), size):
+            mask = sum(1 << i for i in combo)
+            if not _connected(mask):
+                continue
+            sub = (mask - 1) & mask
+            while sub:
+                rest = mask ^ sub
+                if sub in best and rest in best:
+                    cost = model.rows(mask)[0] + best[sub] + best[rest]
+                    if cost < best.get(mask, float("inf")):
+                        best[mask] = cost
+                sub = (sub - 1) & mask
+    return best[(1 << n) - 1]
+
+
+# ---------------------------------------------------------------------------
+# DPccp enumeration
+# ---------------------------------------------------------------------------
+
+
+class TestEnumerateJoinOrder:
+    def test_selective_end_is_joined_first(self):
+        # a -r1- b -r2- c -r3- d with a tiny filtered `d`.
+        relations = [
+            _rel("r1", 10_000, a=1_000, b=1_000),
+            _rel("r2", 10_000, b=1_000, c=1_000),
+            _rel("r3", 10_000, c=1_000, d=1_000),
+            _rel("d", 1, d=1),
+        ]
+        tree = enumerate_join_order(relations)
+        deepest = max(
+            (n for n in tree.iter_nodes() if not n.is_leaf),
+            key=lambda n: n.depth,
+            default=None,
+        )
+        # The first join executed is post-order first: it must involve `d`.
+        first = next(n for n in tree.iter_nodes() if not n.is_leaf)
+        assert first.relations & (1 << 3)
+        assert deepest is not None
+        assert tree.cost < 10_000
+
+    def test_bushy_plan_for_two_selective_ends(self):
+        relations = [
+            _rel("a", 1, a=1),
+            _rel("r1", 10_000, a=100, b=1_000),
+            _rel("r2", 10_000, b=1_000, c=1_000),
+            _rel("r3", 10_000, c=1_000, d=100),
+            _rel("d", 1, d=1),
+        ]
+        tree = enumerate_join_order(relations)
+        assert tree.left is not None and tree.right is not None
+        assert not tree.left.is_leaf and not tree.right.is_leaf
+
+    @pytest.mark.parametrize("seed", range(6))
+    def test_matches_brute_force_optimum(self, seed):
+        rng = np.random.default_rng(seed)
+        variables = [f"v{i}" for i in range(4)]
+        relations = []
+        # Spanning chain keeps the graph connected; add random extras.
+        for i in range(3):
+            relations.append(
+                _rel(
+                    f"e{i}",
+                    float(rng.integers(10, 5_000)),
+                    **{
+                        variables[i]: float(rng.integers(5, 500)),
+                        variables[i + 1]: float(rng.integers(5, 500)),
+                    },
+                ),
+            )
+        for var in rng.choice(variables, size=2, replace=False):
+            relations.append(
+                _rel(f"n_{var}", float(rng.integers(1, 300)), **{var: 1.0})
+            )
+        tree = enumerate_join_order(relations)
+        assert tree.cost == pytest.approx(_brute_force_cost(relations))
+
+    def test_every_relation_appears_once(self):
+        relations = [
+            _rel("r1", 100, a=10, b=10),
+            _rel("r2", 100, b=10, c=10),
+            _rel("r3", 100, b=10, d=10),
+            _rel("a", 5, a=5),
+        ]
+        tree = enumerate_join_order(relations)
+        leaves = sorted(n.leaf for n in tree.iter_nodes() if n.is_leaf)
+        assert leaves == [0, 1, 2, 3]
+        assert tree.relations == 0b1111
+
+    def test_rejects_disconnected_graph(self):
+        with pytest.raises(ValueError, match="not connected"):
+            enumerate_join_order([_rel("a", 1, a=1), _rel("b", 1, b=1)])
+
+    def test_rejects_empty(self):
+        with pytest.raises(ValueError, match="empty"):
+            enumerate_join_order([])
+
+    def test_feedback_correction_changes_estimate(self):
+        relations = [_rel("r1", 100, a=10, b=10), _rel("a", 10, a=10)]
+        store = CardinalityFeedbackStore()
+        key = FEEDBACK_KEY_PREFIX + "a⋈r1"
+        store.record(key, 100, 400)
+        tree = enumerate_join_order(
+            relations,
+            feedback_store=store,
+            key_fn=lambda mask: FEEDBACK_KEY_PREFIX
+            + "⋈".join(
+                sorted(relations[i].name for i in range(2) if mask >> i & 1)
+            ),
+        )
+        assert tree.raw_rows == pytest.approx(100)
+        assert tree.estimated_rows == pytest.approx(400)
+
+
+# ---------------------------------------------------------------------------
+# Planning a MATCH clause
+# ---------------------------------------------------------------------------
+
+
+class TestPlanJoinOrder:
+    def test_plans_long_chain(self):
+        ctx = _social_graph()
+        match = _match(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:LIVES_IN]->(x:City) RETURN a",
+        )
+        plan = plan_join_order(match, ctx)
+        assert plan is not None
+        # The start node and three hops; traversed nodes are not scanned.
+        assert [r.name for r in plan.relations if r.kind == "node"] == [
+            "(a:Person)",
+        ]
+        assert len(plan.relations) == 4
+        assert plan.tree.cost <= plan.pattern_order_cost
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a",
+            "MATCH (a:Person)-[:KNOWS*1..2]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d) RETURN a",
+            "MATCH p = (a)-[:KNOWS]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d) RETURN a",
+            "MATCH (a)-[:KNOWS|LIVES_IN]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d) RETURN a",
+        ],
+    )
+    def test_ineligible_patterns(self, query):
+        assert plan_join_order(_match(query), _social_graph()) is None
+
+    def test_disabled_by_zero_threshold(self):
+        match = _match(
+            "MATCH (a)-[:KNOWS]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d) RETURN a",
+        )
+        assert (
+            plan_join_order(match, _social_graph(), min_relationships=0)
+            is None
+        )
+
+    def test_max_relations_cap(self):
+        match = _match(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(d:Person) RETURN a",
+        )
+        assert plan_join_order(match, _social_graph(), max_relations=3) is None
+        assert plan_join_order(match, _social_graph(), max_relations=4)
+
+    def test_anon_counter_advanced_only_on_success(self):
+        counter = [0]
+        plan_join_order(
+            _match("MATCH (a)-[:KNOWS]->(b) RETURN a"),
+            _social_graph(),
+            anon_counter=counter,
+        )
+        assert counter == [0]
+        plan_join_order(
+            _match(
+                "MATCH (a)-[:KNOWS]->()-[:KNOWS]->()-[:KNOWS]->(d) RETURN a"
+            ),
+            _social_graph(),
+            anon_counter=counter,
+        )
+        assert counter[0] > 0
+
+    def test_where_split_into_scans_and_joins(self):
+        match = _match(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(d:Person) WHERE a.age > 70 AND a.age < d.age RETURN a",
+        )
+        plan = plan_join_order(match, _social_graph(), where=match.where)
+        assert plan is not None
+        scan_a = next(r for r in plan.relations if r.name == "(a:Person)")
+        assert len(scan_a.filters) == 1
+        attached = [n for n in plan.tree.iter_nodes() if n.filters]
+        assert len(attached) == 1
+        assert {"a", "d"} <= attached[0].variables
+
+    def test_feedback_config_defaults(self):
+        shown = config.show_config()
+        assert shown["JOIN_ORDER_MIN_RELATIONSHIPS"] == 3
+        assert shown["JOIN_ORDER_MAX_RELATIONS"] == 16
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+
+class TestJoinOrderedExecution:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:LIVES_IN]->(x:City {name: 'c3'}) "
+            "RETURN a.name AS a, b.name AS b, c.name AS c",
+            "MATCH (a:Person)-[:KNOWS]->(b)-[:KNOWS]->(c)-[:KNOWS]->(d:Person) "
+            "WHERE a.age > 70 AND d.age < 20 RETURN a.name AS a, d.name AS d",
+            "MATCH (a:Person)-[:KNOWS]-(b:Person)-[:LIVES_IN]->(x:City), "
+            "(a)-[:LIVES_IN]->(y:City) WHERE x.name = 'c1' "
+            "RETURN a.name AS a, b.name AS b, y.name AS y",
+            "MATCH (x:City)<-[:LIVES_IN]-(a:Person)-[r:KNOWS]->(b:Person)"
+            "-[:LIVES_IN]->(x) RETURN a.name AS a, b.name AS b",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(d:Person) WHERE a.age + d.age > 150 "
+            "RETURN count(*) AS n",
+        ],
+    )
+    def test_same_rows_as_left_to_right(self, query):
+        ordered, sequential = _both_orders(_social_graph(), query)
+        assert list(ordered.columns) == list(sequential.columns)
+        assert _canonical(ordered) == _canonical(sequential)
+
+    def test_relationship_variable_bound(self):
+        ordered, sequential = _both_orders(
+            _social_graph(),
+            "MATCH (a:Person)-[r:KNOWS]->(b:Person)-[s:KNOWS]->(c:Person)"
+            "-[:LIVES_IN]->(x:City) WHERE a.age > 75 "
+            "RETURN id(r) AS r, id(s) AS s, x.name AS city",
+        )
+        assert len(ordered) > 0
+        assert _canonical(ordered) == _canonical(sequential)
+
+    def test_after_with_clause(self):
+        ordered, sequential = _both_orders(
+            _social_graph(),
+            "MATCH (a:Person) WHERE a.age > 75 WITH a "
+            "MATCH (a)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:LIVES_IN]->(x:City) RETURN a.name AS a, x.name AS x",
+        )
+        assert _canonical(ordered) == _canonical(sequential)
+
+    def test_records_actual_cardinalities(self):
+        star = Star(context=_social_graph())
+        query = (
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:LIVES_IN]->(x:City) WHERE a.age > 70 RETURN a.name AS a"
+        )
+        n = len(star.execute_query(query))
+        plan = star._pattern_matcher.last_join_order_plan
+        assert plan is not None
+        assert plan.tree.actual_rows == n
+        assert all(
+            node.actual_rows is not None for node in plan.tree.iter_nodes()
+        )
+        observed = star._cardinality_feedback.latest(
+            plan.feedback_key(plan.tree)
+        )
+        assert observed is not None and observed[1] == n
+
+
+class TestLabelSemantics:
+    """Only a path's first node is label-checked, with or without a plan."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(d:Person) RETURN a.name AS a, d AS d",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person) "
+            "WHERE c.age IS NULL RETURN a.age AS a, c AS c",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person {name: 'p3'})-[:KNOWS]->"
+            "(c:City) RETURN a AS a, c AS c",
+            "MATCH (x:Person) WHERE x.age > 40 WITH x "
+            "MATCH (x)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:City) "
+            "RETURN x AS x, c AS c",
+        ],
+    )
+    def test_same_rows_as_left_to_right(self, query):
+        ordered, sequential = _both_orders(_mixed_label_graph(), query)
+        assert len(sequential) > 0
+        assert _canonical(ordered) == _canonical(sequential)
+
+
+# ---------------------------------------------------------------------------
+# Planner / EXPLAIN integration
+# ---------------------------------------------------------------------------
+
+
+class TestPlannerIntegration:
+    QUERY = (
+        "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+        "-[:LIVES_IN]->(x:City {name: 'c3'}) RETURN a.name AS a"
+    )
+
+    def test_analysis_has_join_order(self):
+        query = ASTConverter.from_cypher(self.QUERY)
+        analysis = QueryPlanAnalyzer(query, _social_graph()).analyze()
+        assert len(analysis.join_order_plans) == 1
+        assert "Join order over 5 scans" in analysis.summary()
+
+    def test_cyclic_pattern_left_to_generic_join(self):
+        query = ASTConverter.from_cypher(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person)"
+            "-[:KNOWS]->(a) RETURN a",
+        )
+        analysis = QueryPlanAnalyzer(query, _social_graph()).analyze()
+        assert analysis.join_order_plans == []
+        assert len(analysis.multiway_join_plans) == 1
+
+    def test_explain_shows_estimated_then_actual(self):
+        star = Star(context=_social_graph())
+        before = star.explain_query(self.QUERY)
+        assert "Join order (cost-based, DPccp):" in before
+        assert "(actual" not in before
+        star.execute_query(self.QUERY)
+        after = star.explain_query(self.QUERY)
+        assert "(actual" in after
+        assert "(x:City)" in after
@@ -0,0 +1,137 @@
+"""Tests for on-demand, per-property conversion of Arrow-backed tables."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pycypher.dataframe_utils import indexed_source_frame
+from pycypher.graph_index import PropertyArrayCache, VectorizedPropertyStore
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def people() -> pd.DataFrame:
+    n = 1_000
+    return pd.DataFrame(
+        {
+            "__ID__": np.arange(n)[::-1],
+            "name": [f"p{i}" for i in range(n)],
+            "age": np.arange(n) % 90,
+            "bio": ["x" * 200] * n,
+        },
+    )
+
+
+@pytest.fixture
+def ctx(people):
+    return ContextBuilder.from_dict({"Person": people})
+
+
+# ---------------------------------------------------------------------------
+# ID-indexed lookup frames
+# ---------------------------------------------------------------------------
+
+
+class TestIndexedSourceFrame:
+    def test_arrow_columns_are_added_on_demand(self, people):
+        table = pa.Table.from_pandas(people, preserve_index=False)
+        cache: dict = {}
+        frame = indexed_source_frame(cache, "Person", table, columns=())
+        assert list(frame.columns) == []
+        assert frame.index.name == "__ID__"
+
+        frame = indexed_source_frame(cache, "Person", table, columns=["bio"])
+        assert list(frame.columns) == ["bio"]
+        frame = indexed_source_frame(cache, "Person", table, columns=["name"])
+        assert list(frame.columns) == ["name", "bio"]
+        assert frame.loc[999, "name"] == "p0"
+
+    def test_none_converts_everything(self, people):
+        table = pa.Table.from_pandas(people, preserve_index=False)
+        cache: dict = {}
+        indexed_source_frame(cache, "Person", table, columns=["age"])
+        frame = indexed_source_frame(cache, "Person", table)
+        pd.testing.assert_frame_equal(frame, people.set_index("__ID__"))
+        assert list(cache) == ["Person"]
+
+    def test_pandas_source_is_indexed_in_full(self, people):
+        cache: dict = {}
+        frame = indexed_source_frame(cache, "Person", people, columns=())
+        assert list(frame.columns) == ["name", "age", "bio"]
+
+
+# ---------------------------------------------------------------------------
+# Vectorized store
+# ---------------------------------------------------------------------------
+
+
+class TestLazyVectorizedStore:
+    def test_build_converts_only_ids(self, people):
+        table = pa.Table.from_pandas(people, preserve_index=False)
+        cache = PropertyArrayCache(10**8)
+        store = VectorizedPropertyStore.build("Person", table, cache=cache)
+        assert store.properties == ["name", "age", "bio"]
+        assert len(cache) == 0
+
+        assert list(store.fetch(np.array([999, 0, -1]), "name")) == [
+            "p0",
+            "p999",
+            None,
+        ]
+        assert len(cache) == 1
+        store.fetch(np.array([1]), "name")
+        assert cache.hits == 1
+
+    def test_results_survive_eviction(self, people):
+        table = pa.Table.from_pandas(people, preserve_index=False)
+        cache = PropertyArrayCache(80_000)
+        store = VectorizedPropertyStore.build("Person", table, cache=cache)
+        ids = np.array([5, 500])
+        for _ in range(2):
+            for prop in ("name", "age", "bio"):
+                expected = people.set_index("__ID__").loc[ids, prop].tolist()
+                assert list(store.fetch(ids, prop)) == expected
+        assert cache.evictions > 0
+        assert cache.nbytes <= cache.max_bytes
+
+    def test_oversized_array_is_not_cached(self):
+        cache = PropertyArrayCache(100)
+        cache.put("k", np.zeros(1_000))
+        assert len(cache) == 0
+        assert cache.get("k") is None
+
+
+# ---------------------------------------------------------------------------
+# Query execution
+# ---------------------------------------------------------------------------
+
+
+class TestQueryReadsOnlyReferencedColumns:
+    def test_unreferenced_columns_stay_in_arrow(self, ctx, people):
+        result = Star(context=ctx).execute_query(
+            "MATCH (p:Person) WHERE p.age = 3 RETURN p.name AS name "
+            "ORDER BY name",
+        )
+        expected = sorted(people.loc[people["age"] == 3, "name"])
+        assert result["name"].tolist() == expected
+        stats = ctx.index_manager.stats()["property_arrays"]
+        assert stats["arrays"] == 2
+        lookup = ctx._property_lookup_cache.get("Person", pd.DataFrame())
+        assert "bio" not in lookup.columns
+
+    def test_cache_is_dropped_after_mutation(self, ctx):
+        star = Star(context=ctx)
+        star.execute_query("MATCH (p:Person) RETURN p.name AS name")
+        assert ctx.index_manager.stats()["property_arrays"]["arrays"] == 1
+        star.execute_query("MATCH (p:Person {name: 'p1'}) SET p.age = 200")
+        result = star.execute_query(
+            "MATCH (p:Person {name: 'p1'}) RETURN p.age AS age",
+        )
+        assert result["age"].tolist() == [200]
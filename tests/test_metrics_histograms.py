@@ -0,0 +1,200 @@
+"""Tests for the per-thread, histogram-based query metrics recording path.
+
+Covers :class:`shared.metrics.LogHistogram` accuracy and merging, exact
+counts across concurrently recording threads, folding of exited threads'
+shards, and the histogram output of the Prometheus and JSON exporters.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from pathlib import Path
+
+import pytest
+from shared.exporters import JSONFileExporter, PrometheusExporter
+from shared.metrics import LogHistogram, QueryMetrics
+
+# ---------------------------------------------------------------------------
+# LogHistogram
+# ---------------------------------------------------------------------------
+
+
+class TestLogHistogram:
+    def test_percentiles_within_bucket_resolution(self) -> None:
+        rng = random.Random(3)
+        values = [rng.lognormvariate(3.0, 1.5) for _ in range(20_000)]
+        hist = LogHistogram()
+        for value in values:
+            hist.record(value)
+        ordered = sorted(values)
+        for pct in (0.5, 0.9, 0.99, 0.999):
+            exact = ordered[int(pct * len(ordered)) - 1]
+            assert hist.percentile(pct) == pytest.approx(exact, rel=0.02)
+
+    def test_exact_count_sum_min_max(self) -> None:
+        hist = LogHistogram()
+        for value in (0.25, 3.0, 1_000_000.0):
+            hist.record(value)
+        assert hist.count == 3
+        assert hist.total == pytest.approx(1_000_003.25)
+        assert hist.min == 0.25
+        assert hist.max == 1_000_000.0
+        assert hist.percentile(1.0) == 1_000_000.0
+
+    def test_single_value_is_exact(self) -> None:
+        hist = LogHistogram()
+        hist.record(123.456)
+        assert hist.percentile(0.5) == 123.456
+
+    def test_negative_and_zero_values_are_ordered(self) -> None:
+        hist = LogHistogram()
+        for value in (-50.0, -1.0, 0.0, 0.0, 2.0, 40.0):
+            hist.record(value)
+        assert hist.percentile(0.01) == -50.0
+        assert hist.percentile(0.5) == 0.0
+        assert hist.percentile(0.3) == pytest.approx(-1.0, rel=0.02)
+
+    def test_merge_equals_recording_everything(self) -> None:
+        left, right, both = LogHistogram(), LogHistogram(), LogHistogram()
+        for i in range(1, 1_001):
+            (left if i % 3 else right).record(float(i))
+            both.record(float(i))
+        left.merge(right)
+        assert left.to_dict() == both.to_dict()
+
+    def test_memory_is_bounded_by_buckets(self) -> None:
+        hist = LogHistogram()
+        for i in range(100_000):
+            hist.record(1.0 + (i % 1_000) / 1_000)
+        assert len(hist.to_dict()["buckets"]) <= 32
+
+    def test_cumulative_counts(self) -> None:
+        hist = LogHistogram()
+        for value in (0.5, 3.0, 7.0, 200.0):
+            hist.record(value)
+        assert hist.cumulative_counts([1, 5, 10, 100, 1_000]) == [
+            1,
+            2,
+            3,
+            3,
+            4,
+        ]
+
+    def test_empty(self) -> None:
+        hist = LogHistogram()
+        assert hist.percentile(0.99) == 0.0
+        assert hist.mean() == 0.0
+        assert hist.to_dict()["max"] == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Per-thread recording
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentRecording:
+    def test_counts_are_exact_across_threads(self) -> None:
+        metrics = QueryMetrics()
+        per_thread = 2_000
+
+        def work() -> None:
+            for i in range(per_thread):
+                metrics.record_query(
+                    query_id="q",
+                    elapsed_s=(i + 1) / 10_000,
+                    rows=2,
+                    clauses=["Match"],
+                    clause_timings_ms={"Match": 1.0},
+                )
+            metrics.record_error(
+                query_id="e",
+                error_type="TypeError",
+                elapsed_s=0.0,
+            )
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snap = metrics.snapshot()
+        assert snap.total_queries == 8 * per_thread
+        assert snap.total_rows_returned == 16 * per_thread
+        assert snap.total_errors == 8
+        assert snap.error_counts == {"TypeError": 8}
+        assert snap.clause_counts == {"Match": 8 * per_thread}
+        assert snap.timing_histogram_ms.count == 8 * per_thread
+        assert snap.timing_max_ms == pytest.approx(200.0)
+        assert snap.timing_p50_ms == pytest.approx(100.0, rel=0.02)
+
+    def test_exited_threads_are_folded(self) -> None:
+        metrics = QueryMetrics()
+        for _ in range(5):
+            thread = threading.Thread(
+                target=metrics.record_query,
+                kwargs={"query_id": "q", "elapsed_s": 0.01},
+            )
+            thread.start()
+            thread.join()
+        metrics.record_query(query_id="main", elapsed_s=0.01)
+        assert len(metrics._shards) == 2
+        assert metrics.snapshot().total_queries == 6
+
+    def test_reset_clears_every_thread(self) -> None:
+        metrics = QueryMetrics()
+        thread = threading.Thread(
+            target=metrics.record_query,
+            kwargs={"query_id": "q", "elapsed_s": 0.01},
+        )
+        thread.start()
+        thread.join()
+        metrics.record_query(query_id="main", elapsed_s=0.01)
+        metrics.reset()
+        snap = metrics.snapshot()
+        assert snap.total_queries == 0
+        assert snap.recent_queries_per_second == 0.0
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def snapshot() -> object:
+    metrics = QueryMetrics()
+    for ms in (0.5, 4.0, 30.0, 700.0):
+        metrics.record_query(
+            query_id="q",
+            elapsed_s=ms / 1000,
+            clause_timings_ms={"Match": ms / 2},
+        )
+    return metrics.snapshot()
+
+
+class TestHistogramExport:
+    def test_prometheus_histogram(self, snapshot) -> None:
+        text = PrometheusExporter().render(snapshot)
+        assert "# TYPE pycypher_query_duration_ms histogram" in text
+        assert 'pycypher_query_duration_ms_bucket{le="1"} 1' in text
+        assert 'pycypher_query_duration_ms_bucket{le="5"} 2' in text
+        assert 'pycypher_query_duration_ms_bucket{le="1000"} 4' in text
+        assert 'pycypher_query_duration_ms_bucket{le="+Inf"} 4' in text
+        assert "pycypher_query_duration_ms_count 4" in text
+        assert (
+            'pycypher_clause_duration_ms_bucket{clause="Match",le="+Inf"} 4'
+            in text
+        )
+        assert 'pycypher_clause_duration_ms_count{clause="Match"} 4' in text
+
+    def test_json_lines_carry_buckets(self, snapshot, tmp_path: Path) -> None:
+        path = tmp_path / "metrics.jsonl"
+        JSONFileExporter(path=str(path)).export(snapshot)
+        entry = json.loads(path.read_text())
+        hist = entry["timing_histogram_ms"]
+        assert hist["count"] == 4
+        assert sum(n for _, n in hist["buckets"]) == 4
+        assert entry["clause_timing_histograms_ms"]["Match"]["count"] == 4
@@ -0,0 +1,332 @@
+"""Tests for pycypher.ingestion.parquet_writer and Parquet output layouts.
+
+Covers:
+- Single-file output: row groups, compression and dictionary options
+- Hive-style partitioning (including null and escaped values)
+- File roll-over and sort-within-file statistics
+- A cap on files open at once across many partitions
+- Incremental writes from pandas chunks and from a DuckDB relation
+- Replacing a previous dataset, refusing foreign directories
+- ``parquet:`` options on ``OutputConfig`` and in ``nmetl run``
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+from click.testing import CliRunner
+from pycypher.ingestion import parquet_writer
+from pycypher.ingestion.config import OutputConfig, ParquetLayoutConfig
+from pycypher.ingestion.output_writer import (
+    write_dataframe_to_uri,
+    write_relation_to_uri,
+)
+from pycypher.ingestion.parquet_writer import (
+    ParquetDatasetWriter,
+    iter_chunks,
+    write_parquet_chunks,
+)
+from pycypher.nmetl_cli import cli
+from pydantic import ValidationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _frame(n: int = 1_000) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "state": rng.choice(["GA", "NY", "a/b c"], n),
+            "year": rng.choice([2020, 2021], n),
+            "score": rng.random(n),
+        },
+    )
+
+
+def _read_dataset(path: Path) -> pd.DataFrame:
+    table = ds.dataset(path, format="parquet", partitioning="hive").to_table()
+    return table.to_pandas().sort_values("id").reset_index(drop=True)
+
+
+def _files(path: Path) -> list[Path]:
+    return sorted(path.rglob("*.parquet"))
+
+
+# ===========================================================================
+# Single file
+# ===========================================================================
+
+
+class TestSingleFile:
+    def test_row_groups_and_codec(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.parquet"
+        layout = ParquetLayoutConfig(
+            row_group_size=300,
+            compression="zstd",
+            use_dictionary=["state"],
+        )
+        write_dataframe_to_uri(_frame(), str(out), parquet=layout)
+        meta = pq.ParquetFile(out).metadata
+        assert meta.num_row_groups == 4
+        columns = {
+            meta.row_group(0).column(i).path_in_schema: meta.row_group(
+                0,
+            ).column(i)
+            for i in range(meta.num_columns)
+        }
+        assert columns["id"].compression == "ZSTD"
+        assert columns["state"].dictionary_page_offset is not None
+        assert not columns["id"].has_dictionary_page
+        pd.testing.assert_frame_equal(pd.read_parquet(out), _frame())
+
+    def test_sorted_single_file(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.parquet"
+        layout = ParquetLayoutConfig(sort_by=["score"], row_group_size=100)
+        write_dataframe_to_uri(_frame(), str(out), parquet=layout)
+        assert pd.read_parquet(out)["score"].is_monotonic_increasing
+
+    def test_empty_result(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.parquet"
+        write_dataframe_to_uri(
+            _frame().iloc[:0],
+            str(out),
+            parquet=ParquetLayoutConfig(),
+        )
+        assert list(pd.read_parquet(out).columns) == list(_frame().columns)
+
+
+# ===========================================================================
+# Datasets
+# ===========================================================================
+
+
+class TestDataset:
+    def test_hive_partitions(self, tmp_path: Path) -> None:
+        frame = _frame()
+        frame.loc[::50, "state"] = None
+        out = tmp_path / "out.parquet"
+        write_dataframe_to_uri(
+            frame,
+            str(out),
+            parquet=ParquetLayoutConfig(partition_by=["state", "year"]),
+        )
+        directories = {
+            f.parent.relative_to(out).as_posix() for f in _files(out)
+        }
+        assert "state=GA/year=2020" in directories
+        assert "state=a%2Fb%20c/year=2021" in directories
+        assert "state=__HIVE_DEFAULT_PARTITION__/year=2020" in directories
+        assert "state" not in pq.read_schema(_files(out)[0]).names
+        got = _read_dataset(out)
+        assert got["id"].tolist() == frame["id"].tolist()
+        assert got["score"].tolist() == frame["score"].tolist()
+
+    def test_files_roll_over_and_are_sorted(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.parquet"
+        layout = ParquetLayoutConfig(
+            partition_by=["year"],
+            sort_by=["score"],
+            max_rows_per_file=120,
+            row_group_size=40,
+        )
+        write_parquet_chunks(iter_chunks(_frame(), chunk_rows=64), out, layout)
+        files = _files(out)
+        assert len(files) >= 1_000 // 120
+        for path in files:
+            meta = pq.ParquetFile(path).metadata
+            assert meta.num_rows <= 120
+            scores = pq.read_table(path)["score"].to_pylist()
+            assert scores == sorted(scores)
+            # Sorted files give disjoint row-group ranges.
+            column = meta.schema.names.index("score")
+            stats = [
+                meta.row_group(i).column(column).statistics
+                for i in range(meta.num_row_groups)
+            ]
+            for left, right in zip(stats, stats[1:]):
+                assert left.max <= right.min
+        assert len(_read_dataset(out)) == 1_000
+
+    def test_unsorted_output_is_written_incrementally(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        layout = ParquetLayoutConfig(partition_by=["year"], row_group_size=100)
+        chunks = iter_chunks(_frame(), chunk_rows=250)
+        with ParquetDatasetWriter(tmp_path / "out", layout) as writer:
+            writer.write(next(chunks))
+            # Full row groups are written as they fill, not at close.
+            assert writer.rows >= 200
+            for chunk in chunks:
+                writer.write(chunk)
+        assert writer.rows == 1_000
+
+    def test_open_files_are_capped(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        open_now, peak = 0, 0
+
+        class _CountingWriter(pq.ParquetWriter):
+            def __init__(self, *args, **kwargs) -> None:
+                nonlocal open_now, peak
+                super().__init__(*args, **kwargs)
+                open_now += 1
+                peak = max(peak, open_now)
+
+            def close(self) -> None:
+                nonlocal open_now
+                open_now -= 1
+                super().close()
+
+        monkeypatch.setattr(
+            parquet_writer.pq, "ParquetWriter", _CountingWriter
+        )
+        frame = pd.DataFrame(
+            {"id": np.arange(6_000), "bucket": np.arange(6_000) % 300},
+        )
+        out = tmp_path / "out"
+        layout = ParquetLayoutConfig(
+            partition_by=["bucket"],
+            row_group_size=5,
+            max_open_files=8,
+        )
+        write_parquet_chunks(iter_chunks(frame, chunk_rows=1_000), out, layout)
+        assert peak == 8
+        assert open_now == 0
+        # Evicted partitions continued in new part files.
+        assert len(_files(out)) > 300
+        got = _read_dataset(out)
+        assert got["id"].tolist() == frame["id"].tolist()
+        assert (got["bucket"] == got["id"] % 300).all()
+
+    def test_rerun_replaces_previous_dataset(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.parquet"
+        layout = ParquetLayoutConfig(partition_by=["state"])
+        write_dataframe_to_uri(_frame(), str(out), parquet=layout)
+        write_dataframe_to_uri(_frame(10), str(out), parquet=layout)
+        assert len(_read_dataset(out)) == 10
+
+    def test_refuses_foreign_directory(self, tmp_path: Path) -> None:
+        out = tmp_path / "out"
+        out.mkdir()
+        (out / "notes.txt").write_text("keep me")
+        with pytest.raises(FileExistsError, match="notes.txt"):
+            ParquetDatasetWriter(
+                out,
+                ParquetLayoutConfig(partition_by=["year"]),
+            )
+        assert (out / "notes.txt").exists()
+
+    def test_missing_layout_column(self, tmp_path: Path) -> None:
+        layout = ParquetLayoutConfig(partition_by=["nope"])
+        with pytest.raises(ValueError, match="nope"):
+            write_dataframe_to_uri(
+                _frame(),
+                str(tmp_path / "o.parquet"),
+                parquet=layout,
+            )
+
+    def test_relation_is_streamed(self, tmp_path: Path) -> None:
+        import duckdb
+        from pycypher.backends.duckdb_backend import DuckDBLazyFrame
+
+        con = duckdb.connect()
+        relation = con.sql(
+            "SELECT range AS id, range % 3 AS bucket FROM range(5000)",
+        )
+        lazy = DuckDBLazyFrame(relation, con)
+        out = tmp_path / "out.parquet"
+        write_relation_to_uri(
+            lazy,
+            str(out),
+            parquet=ParquetLayoutConfig(
+                partition_by=["bucket"],
+                max_rows_per_file=1_000,
+            ),
+        )
+        assert lazy._materialised is None
+        got = _read_dataset(out)
+        assert got["id"].tolist() == list(range(5000))
+        assert len(_files(out)) == 6
+
+
+# ===========================================================================
+# Configuration
+# ===========================================================================
+
+
+class TestConfig:
+    def test_output_config_parses_layout(self) -> None:
+        output = OutputConfig.model_validate(
+            {
+                "query_id": "q",
+                "uri": "out/people.parquet",
+                "parquet": {
+                    "partition_by": ["state"],
+                    "max_rows_per_file": 1000,
+                    "compression": "zstd",
+                },
+            },
+        )
+        assert output.parquet is not None
+        assert output.parquet.is_dataset
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"uri": "out.csv", "parquet": {}},
+            {"uri": "out.parquet", "format": "json", "parquet": {}},
+            {
+                "uri": "out.parquet",
+                "parquet": {"partition_by": ["a"], "sort_by": ["a"]},
+            },
+            {"uri": "out.parquet", "parquet": {"compression": "rar"}},
+        ],
+    )
+    def test_rejects_invalid_layouts(self, fields) -> None:
+        with pytest.raises(ValidationError):
+            OutputConfig.model_validate({"query_id": "q", **fields})
+
+    def test_nmetl_run_writes_partitioned_output(self, tmp_path: Path) -> None:
+        src = tmp_path / "people.parquet"
+        _frame(60).to_parquet(src)
+        out = tmp_path / "out.parquet"
+        cfg = tmp_path / "pipeline.yaml"
+        cfg.write_text(
+            f"""\
+version: "1.0"
+sources:
+  entities:
+    - id: people_src
+      uri: "{src}"
+      entity_type: Person
+      id_col: id
+queries:
+  - id: q1
+    inline: "MATCH (p:Person) RETURN p.score AS score, p.state AS state"
+output:
+  - query_id: q1
+    uri: "{out}"
+    parquet:
+      partition_by: [state]
+      sort_by: [score]
+""",
+        )
+        result = CliRunner().invoke(cli, ["run", str(cfg)])
+        assert result.exit_code == 0, result.output
+        got = ds.dataset(out, format="parquet", partitioning="hive").to_table()
+        assert sorted(got["score"].to_pylist()) == sorted(_frame(60)["score"])
+        assert {p.parent.name for p in _files(out)} == {
+            "state=GA",
+            "state=NY",
+            "state=a%2Fb%20c",
+        }
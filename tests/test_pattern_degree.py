@@ -0,0 +1,288 @@
+"""Tests for degree-only pattern rewrites, COUNT subqueries and EXISTS.
+
+The rewrite is checked structurally, and its answers (plus those of the
+single-hop EXISTS semi-join and general COUNT subqueries) are compared
+with the same counts written as OPTIONAL MATCH aggregations.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import Star
+from pycypher.ast_converter import ASTConverter
+from pycypher.ast_models import PatternDegree, Return
+from pycypher.exists_evaluator import ExistsEvaluator
+from pycypher.pattern_degree import rewrite_degree_patterns
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+
+
+def _star() -> Star:
+    rng = np.random.default_rng(7)
+    n_people = 300
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: range(n_people),
+            "pid": range(n_people),
+            "age": rng.integers(90, size=n_people),
+        },
+    )
+    cities = pd.DataFrame(
+        {ID_COLUMN: range(1_000, 1_020), "name": [f"c{i}" for i in range(20)]},
+    )
+
+    def _edges(n: int, sources, targets) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ID_COLUMN: range(n),
+                RELATIONSHIP_SOURCE_COLUMN: rng.choice(sources, n),
+                RELATIONSHIP_TARGET_COLUMN: rng.choice(targets, n),
+            },
+        )
+
+    knows_targets = np.concatenate([people[ID_COLUMN], cities[ID_COLUMN]])
+    context = Context(
+        entity_mapping=EntityMapping(
+            mapping={
+                "Person": EntityTable.from_dataframe("Person", people),
+                "City": EntityTable.from_dataframe("City", cities),
+            },
+        ),
+        relationship_mapping=RelationshipMapping(
+            mapping={
+                # Some KNOWS edges point at cities, and some are self-loops.
+                "KNOWS": RelationshipTable.from_dataframe(
+                    "KNOWS",
+                    _edges(1_200, people[ID_COLUMN], knows_targets),
+                ),
+                "LIVES_IN": RelationshipTable.from_dataframe(
+                    "LIVES_IN",
+                    _edges(250, people[ID_COLUMN], cities[ID_COLUMN]),
+                ),
+            },
+        ),
+    )
+    return Star(context=context, result_cache_max_mb=0)
+
+
+@pytest.fixture(scope="module")
+def star() -> Star:
+    return _star()
+
+
+def _items(query: str) -> list:
+    ast = rewrite_degree_patterns(ASTConverter.from_cypher(query))
+    return_clause = ast.clauses[-1]
+    assert isinstance(return_clause, Return)
+    return return_clause.items
+
+
+def _sorted(frame: pd.DataFrame) -> list[tuple]:
+    return sorted(map(tuple, frame.to_numpy().tolist()))
+
+
+# ---------------------------------------------------------------------------
+# Rewrite
+# ---------------------------------------------------------------------------
+
+
+class TestRewrite:
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("size((n)-[:KNOWS]->())", (["KNOWS"], "outgoing", None)),
+            (
+                "size((n)<-[:KNOWS]-(:Person))",
+                (["KNOWS"], "incoming", "Person"),
+            ),
+            ("size(()-[:KNOWS]->(n))", (["KNOWS"], "incoming", None)),
+            (
+                "size((n)-[:KNOWS|LIVES_IN]-())",
+                (["KNOWS", "LIVES_IN"], "both", None),
+            ),
+            ("size([(n)-[:KNOWS]->() | 1])", (["KNOWS"], "outgoing", None)),
+            ("COUNT { (n)-->() }", ([], "outgoing", None)),
+        ],
+    )
+    def test_degree_only_patterns(self, expression, expected) -> None:
+        (item,) = _items(f"MATCH (n:Person) RETURN {expression} AS d")
+        degree = item.expression
+        assert isinstance(degree, PatternDegree)
+        assert degree.variable.name == "n"
+        assert (
+            degree.rel_types,
+            degree.direction,
+            degree.neighbor_label,
+        ) == expected
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "size((n)-[:KNOWS]->(m))",
+            "size((n)-[r:KNOWS]->())",
+            "size((n)-[:KNOWS*1..2]->())",
+            "size((n)-[:KNOWS {since: 1}]->())",
+            "size((n)-[:KNOWS]->({age: 3}))",
+            "size((n:Person)-[:KNOWS]->())",
+            "size((n)-[:KNOWS]->()-[:KNOWS]->())",
+            "size([(n)-[:KNOWS]->(m) WHERE m.age > 3 | m])",
+            "COUNT { (n)-[:KNOWS]->(m) WHERE m.age > 3 }",
+        ],
+    )
+    def test_other_patterns_are_kept(self, expression) -> None:
+        (item,) = _items(f"MATCH (n:Person) RETURN {expression} AS d")
+        assert not any(
+            isinstance(node, PatternDegree) for node in item.traverse()
+        )
+
+    def test_nested_and_unaliased(self, star) -> None:
+        query = (
+            "MATCH (n:Person) WHERE size((n)-[:KNOWS]->()) > 2 "
+            "RETURN n.age, size((n)-[:KNOWS]->()) + 1"
+        )
+        ast = ASTConverter.from_cypher(query)
+        rewritten = rewrite_degree_patterns(ast)
+        assert isinstance(rewritten.clauses[0].where.left, PatternDegree)
+        assert star.execute_query(query).columns.tolist() == [
+            "age",
+            "size(?) + 1",
+        ]
+        assert rewrite_degree_patterns(rewritten) is rewritten
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+PAIRS = [
+    (
+        "MATCH (n:Person) RETURN n.pid AS n, size((n)-[:KNOWS]->()) AS d",
+        "MATCH (n:Person) OPTIONAL MATCH (n)-[r:KNOWS]->() "
+        "RETURN n.pid AS n, count(r) AS d",
+    ),
+    (
+        "MATCH (n:Person) RETURN n.pid AS n, "
+        "COUNT { (n)<-[:KNOWS]-(:Person) } AS d",
+        "MATCH (n:Person) OPTIONAL MATCH (n)<-[r:KNOWS]-(:Person) "
+        "RETURN n.pid AS n, count(r) AS d",
+    ),
+    (
+        "MATCH (n:Person) RETURN n.pid AS n, size((n)-[:KNOWS]-()) AS d",
+        "MATCH (n:Person) OPTIONAL MATCH (n)-[r:KNOWS]-() "
+        "RETURN n.pid AS n, count(r) AS d",
+    ),
+    (
+        "MATCH (t:City) WHERE COUNT { (t)<-[:LIVES_IN]-() } > 12 "
+        "RETURN t.name AS t",
+        "MATCH (t:City)<-[r:LIVES_IN]-() WITH t, count(r) AS n "
+        "WHERE n > 12 RETURN t.name AS t",
+    ),
+    (
+        "MATCH (n:Person) WHERE (n)-[:LIVES_IN]->() RETURN n.pid AS n",
+        "MATCH (n:Person)-[:LIVES_IN]->() RETURN DISTINCT n.pid AS n",
+    ),
+    (
+        "MATCH (a:Person)-[:LIVES_IN]->(c:City), (b:Person)-[:LIVES_IN]->(c) "
+        "WHERE (a)-[:KNOWS]->(b) RETURN DISTINCT a.pid AS a, b.pid AS b",
+        "MATCH (a:Person)-[:LIVES_IN]->(c:City)<-[:LIVES_IN]-(b:Person), "
+        "(a)-[:KNOWS]->(b) RETURN DISTINCT a.pid AS a, b.pid AS b",
+    ),
+    (
+        "MATCH (n:Person) "
+        "WHERE EXISTS { (n)<-[:KNOWS]-(m:Person) WHERE m.age > 80 } "
+        "RETURN n.pid AS n",
+        "MATCH (n:Person)<-[:KNOWS]-(m:Person) WHERE m.age > 80 "
+        "RETURN DISTINCT n.pid AS n",
+    ),
+]
+
+
+class TestEvaluation:
+    @pytest.mark.parametrize(("query", "expected"), PAIRS)
+    def test_matches_match_based_counts(self, star, query, expected) -> None:
+        result = star.execute_query(query)
+        assert _sorted(result) == _sorted(star.execute_query(expected))
+
+    @pytest.mark.parametrize(
+        ("expression", "edges"),
+        [
+            # KNOWS also reaches cities: only those count.
+            (
+                "size((n)-[:KNOWS]->(:City))",
+                lambda knows, people: knows[knows["t"] >= 1_000],
+            ),
+            (
+                "COUNT { MATCH (n)-[:KNOWS]->(m:Person) WHERE m.age > 40 "
+                "RETURN m }",
+                lambda knows, people: knows[
+                    knows["t"].isin(people.loc[people["age"] > 40, ID_COLUMN])
+                ],
+            ),
+        ],
+    )
+    def test_matches_edge_counts(self, star, expression, edges) -> None:
+        context = star.context
+        knows = context.relationship_mapping.mapping["KNOWS"].source_obj
+        people = context.entity_mapping.mapping["Person"].source_obj
+        knows = knows.rename(
+            columns={
+                RELATIONSHIP_SOURCE_COLUMN: "s",
+                RELATIONSHIP_TARGET_COLUMN: "t",
+            },
+        )
+        expected = edges(knows, people).groupby("s").size()
+        result = star.execute_query(
+            f"MATCH (n:Person) RETURN n.pid AS n, {expression} AS d",
+        )
+        assert dict(zip(result["n"], result["d"])) == {
+            n: int(expected.get(n, 0)) for n in people["pid"]
+        }
+
+    def test_degrees_are_not_matched_per_row(self, monkeypatch) -> None:
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("matched per row")
+
+        star = _star()
+        for name in [
+            "evaluate_pattern_comprehension",
+            "_matched_rows_via_query_execution",
+        ]:
+            monkeypatch.setattr(ExistsEvaluator, name, _fail)
+        result = star.execute_query(
+            "MATCH (n:Person) WHERE (n)-[:KNOWS]->(:City) "
+            "RETURN size((n)-[:KNOWS]->()) AS d, "
+            "COUNT { (n)-[:LIVES_IN]->() } AS c",
+        )
+        assert len(result) > 0
+
+    def test_sees_writes_of_the_same_query(self) -> None:
+        star = _star()
+        query = (
+            "MATCH (a:Person {age: %d}) RETURN size((a)-[:LIVES_IN]->()) AS d"
+        )
+        age = int(
+            star.execute_query("MATCH (a:Person) RETURN a.age AS age")[
+                "age"
+            ].iloc[0],
+        )
+        before = star.execute_query(query % age)["d"].sum()
+        during = star.execute_query(
+            f"MATCH (a:Person {{age: {age}}}), (c:City {{name: 'c0'}}) "
+            "CREATE (a)-[:LIVES_IN]->(c) "
+            "WITH a RETURN size((a)-[:LIVES_IN]->()) AS d",
+        )["d"].sum()
+        after = star.execute_query(query % age)["d"].sum()
+        n = len(
+            star.execute_query(f"MATCH (a:Person {{age: {age}}}) RETURN a"),
+        )
+        assert during == after == before + n
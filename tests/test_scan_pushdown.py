@@ -0,0 +1,319 @@
+"""Tests for projection/filter pushdown into file-backed source scans."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.ingestion.data_sources import FileDataSource, ParquetFormat
+from pycypher.ingestion.scan_pushdown import (
+    ScanPredicate,
+    ScanSpec,
+    plan_source_scans,
+)
+from pycypher.nmetl_cli import cli
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def tracts() -> pd.DataFrame:
+    n = 2_000
+    return pd.DataFrame(
+        {
+            "tract_id": np.arange(n),
+            "state_fips": [f"{i % 20:02d}" for i in range(n)],
+            "name": [f"tract {i}" for i in range(n)],
+            "population": np.arange(n) % 500,
+            "notes": ["unused"] * n,
+        },
+    )
+
+
+@pytest.fixture
+def tracts_parquet(tmp_path: Path, tracts: pd.DataFrame) -> str:
+    path = tmp_path / "tracts.parquet"
+    tracts.to_parquet(path, row_group_size=200)
+    return str(path)
+
+
+def _entity(plan_query: str | list[str], label: str = "Tract") -> ScanSpec:
+    queries = [plan_query] if isinstance(plan_query, str) else plan_query
+    return plan_source_scans(queries).entity(label)
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+
+class TestPlanSourceScans:
+    def test_where_and_inline_properties(self):
+        spec = _entity(
+            "MATCH (t:Tract {state_fips: '13'}) WHERE 100 < t.population "
+            "RETURN t.name",
+        )
+        assert spec.columns == {"state_fips", "population", "name"}
+        assert spec.predicates == (
+            (
+                ScanPredicate("state_fips", "=", "13"),
+                ScanPredicate("population", ">", 100),
+            ),
+        )
+
+    def test_string_in_and_null_predicates(self):
+        spec = _entity(
+            "MATCH (t:Tract) WHERE t.name STARTS WITH 'tr' "
+            "AND t.state_fips IN ['01', '02'] AND t.notes IS NULL RETURN t.name",
+        )
+        assert spec.predicates == (
+            (
+                ScanPredicate("name", "STARTS WITH", "tr"),
+                ScanPredicate("state_fips", "IN", ("01", "02")),
+                ScanPredicate("notes", "IS NULL"),
+            ),
+        )
+
+    def test_queries_union_their_needs(self):
+        spec = _entity(
+            [
+                "MATCH (t:Tract) WHERE t.state_fips = '01' RETURN t.name",
+                "MATCH (t:Tract {state_fips: '02'}) RETURN t.population",
+            ],
+        )
+        assert spec.columns == {"state_fips", "name", "population"}
+        assert len(spec.predicates) == 2
+
+    def test_unfiltered_use_disables_row_filter(self):
+        spec = _entity(
+            [
+                "MATCH (t:Tract) WHERE t.state_fips = '01' RETURN t.name",
+                "MATCH (t:Tract) RETURN count(t)",
+            ],
+        )
+        assert spec.predicates == ()
+        assert spec.columns == {"state_fips", "name"}
+
+    def test_non_pushable_conjuncts_are_left_to_cypher(self):
+        spec = _entity(
+            "MATCH (t:Tract) WHERE t.population > 1 OR t.name = 'x' "
+            "RETURN t.name",
+        )
+        assert spec.predicates == ()
+
+    def test_whole_node_reference_keeps_all_columns(self):
+        spec = _entity("MATCH (t:Tract) WHERE t.state_fips = '01' RETURN t")
+        assert spec.columns is None
+        assert spec.predicates
+
+    def test_with_passthrough_keeps_projection(self):
+        spec = _entity("MATCH (t:Tract) WITH t RETURN t.name")
+        assert spec.columns == {"name"}
+
+    def test_unlabelled_node_reads_everything(self):
+        plan = plan_source_scans(
+            ["MATCH (t:Tract {state_fips: '01'})-[:IN]->(c) RETURN c.name"],
+        )
+        assert plan.entity("Tract").is_full_scan
+        assert plan.entity("County").is_full_scan
+
+    def test_mutating_query_reads_mentioned_sources_in_full(self):
+        plan = plan_source_scans(
+            [
+                "MATCH (t:Tract) SET t.flag = true",
+                "MATCH (t:Tract) WHERE t.flag RETURN t.name",
+                "MATCH (c:County {name: 'x'}) RETURN c.name",
+            ],
+        )
+        assert plan.entity("Tract").is_full_scan
+        assert not plan.entity("County").is_full_scan
+
+    def test_untraced_property_read_keeps_all_columns(self):
+        plan = plan_source_scans(
+            [
+                "MATCH (t:Tract)-[r:IN]->(c:County) WHERE t.state_fips = '01' "
+                "RETURN startNode(r).name",
+            ],
+        )
+        assert plan.entity("Tract").columns is None
+        assert plan.entity("Tract").predicates
+
+    def test_unreferenced_source_keeps_only_key_columns(self):
+        assert plan_source_scans(["MATCH (t:Tract) RETURN t.name"]).entity(
+            "County",
+        ) == ScanSpec(frozenset())
+
+    def test_relationship_predicates(self):
+        plan = plan_source_scans(
+            [
+                "MATCH (a:Tract)-[r:ADJ {kind: 'rook'}]->(b:Tract) "
+                "WHERE r.length > 5 RETURN r.length",
+            ],
+        )
+        spec = plan.relationship("ADJ")
+        assert spec.columns == {"kind", "length"}
+        assert spec.predicates == (
+            (ScanPredicate("kind", "=", "rook"), ScanPredicate("length", ">", 5)),
+        )
+
+
+# ---------------------------------------------------------------------------
+# SQL rendering
+# ---------------------------------------------------------------------------
+
+
+class TestScanSql:
+    types = {"id": "BIGINT", "name": "VARCHAR", "score": "DOUBLE"}
+
+    def test_type_mismatch_is_not_pushed(self):
+        assert ScanPredicate("name", "=", 13).to_sql(self.types) is None
+        assert ScanPredicate("missing", "=", 1).to_sql(self.types) is None
+        assert ScanPredicate("score", "<", 2).to_sql(self.types) == (
+            '"score" < ?',
+            [2],
+        )
+
+    def test_in_list_drops_nulls(self):
+        assert ScanPredicate("id", "IN", (1, None, 2)).to_sql(self.types) == (
+            '"id" IN (?, ?)',
+            [1, 2],
+        )
+        assert ScanPredicate("id", "IN", (None,)).to_sql(self.types) == (
+            "FALSE",
+            [],
+        )
+
+    def test_unrenderable_branch_drops_filter(self):
+        spec = ScanSpec(
+            frozenset({"name"}),
+            ((ScanPredicate("name", "=", "a"),), (ScanPredicate("name", "=", 1),)),
+        )
+        sql, params = spec.require("id").to_sql("SELECT * FROM t", self.types)
+        assert "WHERE" not in sql
+        assert params == []
+        assert sql.startswith('SELECT "id", "name" FROM')
+
+    def test_filter_reaches_parquet_scan(self, tracts_parquet):
+        spec = ScanSpec(
+            frozenset({"name"}),
+            ((ScanPredicate("state_fips", "=", "07"),),),
+        )
+        relation = f"SELECT * FROM read_parquet('{tracts_parquet}')"
+        con = duckdb.connect()
+        types = dict(
+            zip(
+                con.sql(relation).columns,
+                map(str, con.sql(relation).types),
+                strict=True,
+            ),
+        )
+        sql, params = spec.to_sql(relation, types)
+        plan = con.execute(f"EXPLAIN {sql}", params).fetchall()[0][1]
+        assert "READ_PARQUET" in plan
+        assert "state_fips='07'" in plan
+
+
+# ---------------------------------------------------------------------------
+# Reading sources
+# ---------------------------------------------------------------------------
+
+
+class TestPushdownReads:
+    def test_file_source_applies_scan(self, tracts_parquet, tracts):
+        spec = _entity(
+            "MATCH (t:Tract) WHERE t.state_fips = '03' RETURN t.name",
+        ).require("tract_id")
+        table = FileDataSource(tracts_parquet, ParquetFormat()).read(scan=spec)
+        assert set(table.column_names) == {"tract_id", "state_fips", "name"}
+        assert table.num_rows == (tracts["state_fips"] == "03").sum()
+
+    def test_hive_partitioned_dataset(self, tmp_path, tracts):
+        con = duckdb.connect()
+        con.register("tracts", tracts)
+        con.execute(
+            f"COPY tracts TO '{tmp_path / 'ds'}' "
+            "(FORMAT parquet, PARTITION_BY (state_fips))",
+        )
+        source = FileDataSource(
+            str(tmp_path / "ds" / "*" / "*.parquet"),
+            ParquetFormat(hive_partitioning=True),
+        )
+        spec = ScanSpec(
+            frozenset({"tract_id"}),
+            ((ScanPredicate("state_fips", "=", "05"),),),
+        )
+        table = source.read(scan=spec)
+        assert table.column_names == ["tract_id"]
+        assert sorted(table.column("tract_id").to_pylist()) == sorted(
+            tracts.loc[tracts["state_fips"] == "05", "tract_id"],
+        )
+
+    def test_hive_option_in_view_sql(self):
+        assert ParquetFormat().view_sql("a.parquet") == "read_parquet('a.parquet')"
+        assert ParquetFormat(hive_partitioning=False).view_sql("a.parquet") == (
+            "read_parquet('a.parquet', hive_partitioning=false)"
+        )
+
+    def test_results_match_full_scan(self, tracts_parquet):
+        queries = [
+            "MATCH (t:Tract) WHERE t.state_fips = '13' AND t.population > 100 "
+            "RETURN t.name AS name ORDER BY name",
+            "MATCH (t:Tract {state_fips: '14'}) RETURN count(t) AS n",
+        ]
+        plan = plan_source_scans(queries)
+        full = ContextBuilder().add_entity(
+            "Tract",
+            tracts_parquet,
+            id_col="tract_id",
+        ).build()
+        pushed = ContextBuilder().add_entity(
+            "Tract",
+            tracts_parquet,
+            id_col="tract_id",
+            scan=plan.entity("Tract"),
+        ).build()
+        assert len(pushed.entity_mapping["Tract"].source_obj) < 300
+        for query in queries:
+            pd.testing.assert_frame_equal(
+                Star(context=pushed).execute_query(query),
+                Star(context=full).execute_query(query),
+            )
+
+    def test_generated_ids_disable_row_filter(self, tracts_parquet, tracts):
+        spec = _entity("MATCH (t:Tract) WHERE t.state_fips = '03' RETURN t.name")
+        ctx = ContextBuilder().add_entity("Tract", tracts_parquet, scan=spec).build()
+        assert len(ctx.entity_mapping["Tract"].source_obj) == len(tracts)
+
+
+class TestPipelineRun:
+    def test_run_pushes_scans(self, tmp_path, tracts_parquet):
+        out = tmp_path / "out.csv"
+        cfg = tmp_path / "pipeline.yaml"
+        cfg.write_text(
+            f"""\
+version: "1.0"
+sources:
+  entities:
+    - id: tracts
+      uri: "{tracts_parquet}"
+      entity_type: Tract
+      id_col: tract_id
+queries:
+  - id: q1
+    inline: "MATCH (t:Tract) WHERE t.state_fips = '13' RETURN t.name AS name"
+output:
+  - query_id: q1
+    uri: "{out}"
+""",
+        )
+        result = CliRunner().invoke(cli, ["run", str(cfg)])
+        assert result.exit_code == 0, result.output
+        assert len(pd.read_csv(out)) == 100
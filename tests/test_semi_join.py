@@ -0,0 +1,340 @@
+"""Tests for Yannakakis semi-join reduction of acyclic MATCH patterns.
+
+The reducer is checked against explicit joins (every surviving row takes
+part in a match, no matching row is lost), and queries through both the
+hop-by-hop and the join-ordered translation are compared with reduction
+switched off.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import Star
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.semi_join import id_membership, semi_join_reduce
+
+
+def _chain_join(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    joined = frames[0]
+    for frame in frames[1:]:
+        joined = joined.merge(frame)
+    return joined
+
+
+# ---------------------------------------------------------------------------
+# Reducer
+# ---------------------------------------------------------------------------
+
+
+class TestSemiJoinReduce:
+    def test_keeps_exactly_participating_rows(self) -> None:
+        rng = np.random.default_rng(5)
+        frames = [
+            pd.DataFrame({"a": rng.choice(200, 40, replace=False)}),
+            pd.DataFrame(
+                {
+                    "r": range(500),
+                    "a": rng.integers(200, size=500),
+                    "b": rng.integers(100, size=500),
+                },
+            ),
+            pd.DataFrame(
+                {
+                    "s": range(300),
+                    "b": rng.integers(100, size=300),
+                    "c": rng.integers(50, size=300),
+                },
+            ),
+            pd.DataFrame(
+                {
+                    "t": range(300),
+                    "b": rng.integers(100, size=300),
+                    "d": rng.integers(50, size=300),
+                },
+            ),
+            pd.DataFrame({"c": [3, 7, 11]}),
+        ]
+        reduction = semi_join_reduce(frames, ["a", "b", "c", "d"])
+        assert reduction is not None
+        full = _chain_join(frames)
+        for before, after in zip(frames, reduction.frames, strict=True):
+            used = full[list(before.columns)].drop_duplicates()
+            expected = before.merge(used)
+            assert sorted(map(tuple, after.to_numpy())) == sorted(
+                map(tuple, expected.to_numpy()),
+            )
+        assert set(reduction.ids["b"]) == set(full["b"])
+        assert reduction.rows_after < reduction.rows_before
+
+    def test_cyclic_pattern_is_not_reduced(self) -> None:
+        edge = pd.DataFrame({"r": [1], "a": [1], "b": [2]})
+        back = pd.DataFrame({"s": [1], "b": [2], "a": [1]})
+        assert semi_join_reduce([edge, back], ["a", "b"]) is None
+
+    def test_self_loop_restricts_its_node(self) -> None:
+        loops = pd.DataFrame({"l": [1, 2], "a": [5, 6]})
+        edge = pd.DataFrame({"r": [1, 2, 3], "a": [5, 6, 7], "b": [1, 1, 1]})
+        reduction = semi_join_reduce([loops, edge], ["a", "b"])
+        assert reduction is not None
+        assert sorted(reduction.frames[1]["r"]) == [1, 2]
+
+    @pytest.mark.parametrize(
+        ("values", "ids"),
+        [
+            (np.array([0, 3, 9, 3, -1]), np.array([3, 9])),
+            (np.array([0, 3, 2**40]), np.array([2**40, 0])),
+            (np.array(["a", "b", "c"], dtype=object), np.array(["c"])),
+            (np.array([1.0, np.nan, 2.0]), np.array([2])),
+        ],
+    )
+    def test_membership_matches_isin(self, values, ids) -> None:
+        assert (
+            id_membership(values, ids).tolist()
+            == pd.Series(values).isin(ids).tolist()
+        )
+
+    def test_membership_of_string_ids(self) -> None:
+        values = np.array(["2", "3"], dtype=object)
+        ids = np.array([2], dtype=object)
+        assert id_membership(values, ids).tolist() == [True, False]
+
+
+# ---------------------------------------------------------------------------
+# MATCH
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def star() -> Star:
+    rng = np.random.default_rng(11)
+    n_people, n_pumas = 3_000, 200
+    states = pd.DataFrame(
+        {ID_COLUMN: range(50), "abbr": [f"S{i}" for i in range(50)]},
+    )
+    pumas = pd.DataFrame(
+        {ID_COLUMN: range(1_000, 1_000 + n_pumas), "pop": range(n_pumas)},
+    )
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: range(10_000, 10_000 + n_people),
+            "age": rng.integers(90, size=n_people),
+        },
+    )
+
+    def _edges(n: int, sources: pd.Series, targets: pd.Series) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                ID_COLUMN: range(n),
+                RELATIONSHIP_SOURCE_COLUMN: rng.choice(sources, n),
+                RELATIONSHIP_TARGET_COLUMN: rng.choice(targets, n),
+            },
+        )
+
+    context = Context(
+        entity_mapping=EntityMapping(
+            mapping={
+                "Person": EntityTable.from_dataframe("Person", people),
+                "Puma": EntityTable.from_dataframe("Puma", pumas),
+                "State": EntityTable.from_dataframe("State", states),
+            },
+        ),
+        relationship_mapping=RelationshipMapping(
+            mapping={
+                "LIVES_IN": RelationshipTable.from_dataframe(
+                    "LIVES_IN",
+                    _edges(n_people, people[ID_COLUMN], pumas[ID_COLUMN]),
+                ),
+                "IN_STATE": RelationshipTable.from_dataframe(
+                    "IN_STATE",
+                    _edges(n_pumas, pumas[ID_COLUMN], states[ID_COLUMN]),
+                ),
+                "KNOWS": RelationshipTable.from_dataframe(
+                    "KNOWS",
+                    _edges(
+                        4 * n_people,
+                        people[ID_COLUMN],
+                        people[ID_COLUMN],
+                    ),
+                ),
+            },
+        ),
+    )
+    return Star(context=context, result_cache_max_mb=0)
+
+
+def _rows(frame: pd.DataFrame) -> list[tuple]:
+    return sorted(map(tuple, frame.astype(str).to_numpy().tolist()))
+
+
+QUERIES = [
+    "MATCH (p:Person)-[:LIVES_IN]->(:Puma)-[:IN_STATE]->"
+    "(s:State {abbr: 'S7'}) RETURN p.age AS age",
+    "MATCH (p:Person)-[:LIVES_IN]->(u:Puma)-[:IN_STATE]->(s:State) "
+    "WHERE s.abbr = 'S3' AND p.age > 40 RETURN p.age AS age, u.pop AS pop",
+    "MATCH (s:State {abbr: 'S1'})<-[:IN_STATE]-(u:Puma)<-[:LIVES_IN]-"
+    "(p:Person)-[:KNOWS]-(q:Person) RETURN q.age AS age",
+    "MATCH (q:Person)-[:KNOWS]->(p:Person)-[:LIVES_IN]->(u:Puma)"
+    "-[:IN_STATE]->(s:State {abbr: 'S9'}) RETURN q.age AS a, s.abbr AS s",
+    "MATCH (p:Person {age: 30})-[:KNOWS]->(q:Person), "
+    "(q)-[:LIVES_IN]->(u:Puma) RETURN u.pop AS pop",
+]
+
+
+class TestReducedMatch:
+    @pytest.mark.parametrize("query", QUERIES)
+    def test_matches_unreduced(self, star, query) -> None:
+        reduced = star.execute_query(query)
+        star._pattern_matcher._use_semi_join_reduction = False
+        try:
+            plain = star.execute_query(query)
+        finally:
+            star._pattern_matcher._use_semi_join_reduction = True
+        assert _rows(reduced) == _rows(plain)
+        assert not reduced.empty
+
+    def test_far_filter_prunes_first_hop(self, star, monkeypatch) -> None:
+        hop_rows: list[int] = []
+        matcher = type(star._pattern_matcher)
+        original = matcher._traverse_fixed_hop
+
+        def _spy(self, frame, *args):
+            hop_rows.append(len(frame.bindings))
+            return original(self, frame, *args)
+
+        monkeypatch.setattr(matcher, "_traverse_fixed_hop", _spy)
+        result = star.execute_query(QUERIES[0])
+        # The Person scan is cut to the residents of one state's PUMAs
+        # before the first hop runs.
+        assert 0 < hop_rows[0] <= len(result)
+        assert hop_rows[0] < 3_000 / 10
+
+    def test_dangling_edges_match_unreduced(self) -> None:
+        # Hops do not check the label of the node they reach, so the
+        # reduction must not either: ``b`` below is matched to IDs that
+        # are not Persons, exactly as without reduction.
+        people = pd.DataFrame({ID_COLUMN: [1, 2], "n": ["a", "b"]})
+        cities = pd.DataFrame({ID_COLUMN: [10], "n": ["c"]})
+        knows = pd.DataFrame(
+            {
+                ID_COLUMN: [1, 2],
+                RELATIONSHIP_SOURCE_COLUMN: [1, 2],
+                RELATIONSHIP_TARGET_COLUMN: [2, 99],
+            },
+        )
+        near = pd.DataFrame(
+            {
+                ID_COLUMN: [1, 2],
+                RELATIONSHIP_SOURCE_COLUMN: [2, 99],
+                RELATIONSHIP_TARGET_COLUMN: [10, 10],
+            },
+        )
+        star = Star(
+            context=Context(
+                entity_mapping=EntityMapping(
+                    mapping={
+                        "Person": EntityTable.from_dataframe("Person", people),
+                        "City": EntityTable.from_dataframe("City", cities),
+                    },
+                ),
+                relationship_mapping=RelationshipMapping(
+                    mapping={
+                        "KNOWS": RelationshipTable.from_dataframe(
+                            "KNOWS",
+                            knows,
+                        ),
+                        "NEAR": RelationshipTable.from_dataframe("NEAR", near),
+                    },
+                ),
+            ),
+            result_cache_max_mb=0,
+        )
+        query = (
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:NEAR]->"
+            "(c:City {n: 'c'}) RETURN a.n AS a, c.n AS c"
+        )
+        reduced = star.execute_query(query)
+        star._pattern_matcher._use_semi_join_reduction = False
+        assert _rows(reduced) == _rows(star.execute_query(query))
+        assert len(reduced) == 2
+
+
+@pytest.fixture(scope="module")
+def mixed_star() -> Star:
+    """People with NULL ages whose KNOWS edges also reach cities and
+    dangling IDs; join ordering is off so every MATCH runs hop by hop.
+    """
+    rng = np.random.default_rng(5)
+    ages = rng.integers(18, 80, size=60).astype(float)
+    ages[rng.random(60) < 0.3] = np.nan
+    people = pd.DataFrame({ID_COLUMN: range(60), "age": ages})
+    cities = pd.DataFrame(
+        {ID_COLUMN: range(100, 130), "age": rng.integers(18, 80, size=30)},
+    )
+    ids = np.concatenate([np.arange(60), np.arange(100, 130), [500, 501]])
+    edges = sorted(
+        {(int(s), int(t)) for s, t in rng.choice(ids, size=(260, 2))},
+    )
+    knows = pd.DataFrame(
+        {
+            ID_COLUMN: range(len(edges)),
+            RELATIONSHIP_SOURCE_COLUMN: [s for s, _ in edges],
+            RELATIONSHIP_TARGET_COLUMN: [t for _, t in edges],
+        },
+    )
+    star = Star(
+        context=Context(
+            entity_mapping=EntityMapping(
+                mapping={
+                    "Person": EntityTable.from_dataframe("Person", people),
+                    "City": EntityTable.from_dataframe("City", cities),
+                },
+            ),
+            relationship_mapping=RelationshipMapping(
+                mapping={
+                    "KNOWS": RelationshipTable.from_dataframe("KNOWS", knows),
+                },
+            ),
+        ),
+        result_cache_max_mb=0,
+    )
+    star._pattern_matcher._use_join_ordering = False
+    return star
+
+
+class TestFilteredLabelledNodes:
+    """Filters on traversed nodes do not add a label check."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:Person) "
+            "WHERE c.age IS NULL RETURN a AS a, c AS c",
+            "MATCH (a:Person)-[:KNOWS]->(b:Person)-[:KNOWS]->(c:City) "
+            "WHERE b.age IS NULL AND c.age > 40 RETURN a AS a, c AS c",
+            "MATCH (a:Person)-[:KNOWS]->(b:City {age: 69})-[:KNOWS]->"
+            "(c:Person) RETURN a AS a, c AS c",
+            "MATCH (a:Person)-[:KNOWS]->(b)-[:KNOWS]->(c:Person), "
+            "(c)-[:KNOWS]->(d:City) WHERE d.age < 50 AND a.age > 30 "
+            "RETURN a AS a, d AS d",
+        ],
+    )
+    def test_matches_unreduced(self, mixed_star, query) -> None:
+        reduced = mixed_star.execute_query(query)
+        mixed_star._pattern_matcher._use_semi_join_reduction = False
+        try:
+            plain = mixed_star.execute_query(query)
+        finally:
+            mixed_star._pattern_matcher._use_semi_join_reduction = True
+        assert _rows(reduced) == _rows(plain)
+        assert not reduced.empty
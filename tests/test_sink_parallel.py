@@ -0,0 +1,321 @@
+"""Tests for pycypher.sinks.parallel and the parallel Neo4j sink mode.
+
+The writer is driven by a fake driver whose sessions record every batch,
+track which node IDs in-flight batches hold (to detect lock overlap
+between lanes) and can fail transiently.  The Neo4j sink tests need the
+``neo4j`` package only for its exception types.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.sinks.parallel import (
+    AdaptiveBatchSize,
+    ParallelBatchWriter,
+    WriteStats,
+    partition_rounds,
+)
+
+
+class _Transient(Exception):
+    pass
+
+
+class FakeDriver:
+    """Stand-in for ``neo4j.Driver`` recording batches per session."""
+
+    def __init__(
+        self,
+        *,
+        fail_first: int = 0,
+        error: type[Exception] = _Transient,
+        delay: float = 0.0,
+    ) -> None:
+        self.batches: list[list[dict[str, Any]]] = []
+        self.sessions = 0
+        self.conflicts = 0
+        self.closed = False
+        self._fail_left = fail_first
+        self._error = error
+        self._delay = delay
+        self._held: set[Any] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _keys(rows: list[dict[str, Any]]) -> set[Any]:
+        keys = set()
+        for row in rows:
+            keys.update(
+                row[k] for k in ("id", "src_id", "tgt_id") if k in row
+            )
+        return keys
+
+    def _run(self, cypher: str, rows: list[dict[str, Any]]) -> None:
+        keys = self._keys(rows)
+        with self._lock:
+            if self._fail_left:
+                self._fail_left -= 1
+                raise self._error("deadlock detected")
+            if keys & self._held:
+                self.conflicts += 1
+            self._held |= keys
+        time.sleep(self._delay)
+        with self._lock:
+            self._held -= keys
+            self.batches.append(rows)
+
+    @contextmanager
+    def session(self, database: str | None = None):
+        class _Session:
+            run = staticmethod(lambda cypher, rows: self._run(cypher, rows))
+
+        with self._lock:
+            self.sessions += 1
+        yield _Session()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _edges(n: int = 2_000, n_nodes: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(5)
+    return pd.DataFrame(
+        {
+            "src": rng.integers(n_nodes, size=n),
+            "tgt": rng.integers(n_nodes, size=n),
+            "w": rng.random(n),
+        },
+    )
+
+
+def _rows(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    return [
+        {"src_id": s, "tgt_id": t, "properties": {"w": w}}
+        for s, t, w in zip(
+            frame["src"].tolist(),
+            frame["tgt"].tolist(),
+            frame["w"].tolist(),
+        )
+    ]
+
+
+def _writer(driver: FakeDriver, **kwargs: Any) -> ParallelBatchWriter:
+    kwargs.setdefault("batch_size", AdaptiveBatchSize(100))
+    kwargs.setdefault("is_transient", lambda exc: isinstance(exc, _Transient))
+    kwargs.setdefault("backoff_seconds", 0.0)
+    return ParallelBatchWriter(driver.session, workers=4, **kwargs)
+
+
+# ===========================================================================
+# Partitioning
+# ===========================================================================
+
+
+class TestPartitionRounds:
+    def test_node_lanes_split_ids(self) -> None:
+        frame = pd.DataFrame({"id": np.arange(1_000) % 250})
+        (lanes,) = partition_rounds(frame, ["id"], 4)
+        assert sum(len(lane) for lane in lanes) == len(frame)
+        ids = [set(lane["id"]) for lane in lanes]
+        assert all(
+            not (a & b) for i, a in enumerate(ids) for b in ids[i + 1 :]
+        )
+
+    def test_relationship_rounds_keep_endpoints_apart(self) -> None:
+        frame = _edges()
+        rounds = partition_rounds(frame, ["src", "tgt"], 4)
+        assert len(rounds) == 7
+        assert sum(len(lane) for lanes in rounds for lane in lanes) == len(
+            frame,
+        )
+        for lanes in rounds:
+            assert len(lanes) == 4
+            ids = [set(lane["src"]) | set(lane["tgt"]) for lane in lanes]
+            assert all(
+                not (a & b) for i, a in enumerate(ids) for b in ids[i + 1 :]
+            )
+
+    def test_rejects_three_keys(self) -> None:
+        with pytest.raises(ValueError, match="one or two"):
+            partition_rounds(_edges(), ["src", "tgt", "w"], 2)
+
+
+# ===========================================================================
+# Batch size
+# ===========================================================================
+
+
+class TestAdaptiveBatchSize:
+    def test_fixed_without_target(self) -> None:
+        size = AdaptiveBatchSize(500)
+        size.observe(500, 10.0)
+        assert size.size == 500
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [(0.25, 800), (0.5, 400), (1.0, 200), (100.0, 200)],
+    )
+    def test_moves_towards_target(self, seconds, expected) -> None:
+        size = AdaptiveBatchSize(400, target_seconds=0.5, minimum=10)
+        size.observe(400, seconds)
+        assert size.size == expected
+
+    def test_clamped(self) -> None:
+        size = AdaptiveBatchSize(100, target_seconds=1.0, maximum=150)
+        size.observe(100, 0.01)
+        assert size.size == 150
+        with pytest.raises(ValueError, match="positive"):
+            AdaptiveBatchSize(0)
+
+
+# ===========================================================================
+# Writer
+# ===========================================================================
+
+
+class TestParallelBatchWriter:
+    def test_writes_every_row_without_lock_overlap(self) -> None:
+        driver = FakeDriver(delay=0.002)
+        frame = _edges()
+        stats = _writer(driver).write(
+            "UNWIND $rows AS row",
+            partition_rounds(frame, ["src", "tgt"], 4),
+            _rows,
+        )
+        written = [row for batch in driver.batches for row in batch]
+        assert stats.rows == len(written) == len(frame)
+        assert sorted(r["properties"]["w"] for r in written) == sorted(
+            frame["w"],
+        )
+        assert stats.batches == len(driver.batches)
+        assert stats.rows_per_second > 0
+        assert driver.conflicts == 0
+        assert driver.sessions > 1
+
+    def test_retries_transient_errors(self) -> None:
+        driver = FakeDriver(fail_first=2)
+        frame = _edges(300)
+        stats = _writer(driver).write(
+            "UNWIND $rows AS row",
+            partition_rounds(frame, ["src", "tgt"], 4),
+            _rows,
+        )
+        assert stats.retries == 2
+        assert stats.rows == len(frame)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [({"max_retries": 1}, _Transient), ({}, RuntimeError)],
+    )
+    def test_raises_after_retries_or_on_other_errors(
+        self,
+        kwargs,
+        error,
+    ) -> None:
+        driver = FakeDriver(fail_first=5, error=error)
+        with pytest.raises(error):
+            _writer(driver, **kwargs).write(
+                "UNWIND $rows AS row",
+                partition_rounds(_edges(), ["src", "tgt"], 4),
+                _rows,
+            )
+        assert len(driver.batches) < len(_edges()) / 100
+
+    def test_reports_progress(self) -> None:
+        seen: list[WriteStats] = []
+        driver = FakeDriver()
+        _writer(driver, on_progress=seen.append).write(
+            "UNWIND $rows AS row",
+            partition_rounds(_edges(1_000), ["src"], 4),
+            _rows,
+        )
+        assert len(seen) == len(driver.batches)
+        assert max(s.rows for s in seen) == 1_000
+
+    def test_adapts_batch_size(self) -> None:
+        size = AdaptiveBatchSize(10, target_seconds=0.5, maximum=10_000)
+        _writer(FakeDriver(), batch_size=size).write(
+            "UNWIND $rows AS row",
+            partition_rounds(_edges(), ["src"], 4),
+            _rows,
+        )
+        assert size.size > 10
+
+
+# ===========================================================================
+# Neo4jSink
+# ===========================================================================
+
+
+@pytest.fixture
+def neo4j_sink_module():
+    pytest.importorskip("neo4j")
+    from pycypher.sinks import neo4j as module
+
+    return module
+
+
+class TestNeo4jSinkParallel:
+    def test_parallel_matches_sequential(self, neo4j_sink_module) -> None:
+        module = neo4j_sink_module
+        edges = _edges()
+        mapping = module.RelationshipMapping(
+            rel_type="KNOWS",
+            source_label="Person",
+            target_label="Person",
+            source_id_column="src",
+            target_id_column="tgt",
+            property_columns={"w": "w"},
+        )
+        written = {}
+        for workers in (1, 4):
+            driver = FakeDriver()
+            with module.Neo4jSink(
+                "bolt://fake",
+                "neo4j",
+                "pw",
+                driver=driver,
+                workers=workers,
+                batch_size=128,
+            ) as sink:
+                assert sink.write_relationships(edges, mapping) == len(edges)
+            assert driver.closed
+            written[workers] = sorted(
+                (r["src_id"], r["tgt_id"], r["properties"]["w"])
+                for batch in driver.batches
+                for r in batch
+            )
+        assert written[1] == written[4]
+        assert sink.last_write_stats.rows == len(edges)
+
+    def test_retries_neo4j_transient_errors(self, neo4j_sink_module) -> None:
+        from neo4j.exceptions import TransientError
+
+        module = neo4j_sink_module
+        driver = FakeDriver(fail_first=1, error=TransientError)
+        people = pd.DataFrame({"pid": range(50), "name": ["x"] * 50})
+        sink = module.Neo4jSink(
+            "bolt://fake",
+            "neo4j",
+            "pw",
+            driver=driver,
+            workers=2,
+            retry_backoff_seconds=0.0,
+        )
+        written = sink.write_nodes(
+            people,
+            module.NodeMapping(
+                label="Person",
+                id_column="pid",
+                property_columns={"name": "name"},
+            ),
+        )
+        assert written == 50
+        assert sink.last_write_stats.retries == 1
@@ -0,0 +1,131 @@
+"""Tests for mergeable probabilistic sketches (pycypher.sketches)."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.sketches import (
+    HyperLogLog,
+    KllSketch,
+    SpaceSaving,
+    estimate_registers,
+    fold_registers,
+    grouped_hll_registers,
+    hash_values,
+)
+
+
+class TestHyperLogLog:
+    @pytest.mark.parametrize("n", [0, 1, 50, 5_000, 200_000])
+    def test_estimate_within_error_bound(self, n):
+        values = pd.Series(np.arange(n) * 7919)
+        estimate = HyperLogLog.from_series(values).estimate()
+        assert estimate == pytest.approx(n, rel=0.05, abs=1)
+
+    def test_ignores_nulls_and_duplicates(self):
+        values = pd.Series(["a", "b", None, "a", "c", None] * 100)
+        assert round(HyperLogLog.from_series(values).estimate()) == 3
+
+    def test_merge_estimates_union(self):
+        a = HyperLogLog.from_series(pd.Series(range(0, 60_000)))
+        b = HyperLogLog.from_series(pd.Series(range(30_000, 90_000)))
+        assert a.merge(b).estimate() == pytest.approx(90_000, rel=0.05)
+
+    def test_merge_matches_single_pass(self):
+        values = pd.Series(np.random.default_rng(1).integers(0, 10**6, 50_000))
+        whole = HyperLogLog.from_series(values)
+        left = HyperLogLog.from_series(values.iloc[:20_000])
+        left.merge(HyperLogLog.from_series(values.iloc[20_000:]))
+        assert left.estimate() == whole.estimate()
+
+    def test_merge_rejects_precision_mismatch(self):
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+    def test_invalid_precision(self):
+        with pytest.raises(ValueError, match="between"):
+            HyperLogLog(2)
+
+    def test_multi_column_hash_counts_pairs(self):
+        df = pd.DataFrame({"a": [1, 1, 2, 2, 1], "b": [1, 2, 1, 2, 1]})
+        assert round(HyperLogLog.from_series(df).estimate()) == 4
+        assert len(hash_values(df)) == 5
+
+    def test_round_trip_through_json(self):
+        sketch = HyperLogLog.from_series(pd.Series(range(1_000)))
+        restored = HyperLogLog.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.estimate() == sketch.estimate()
+
+    def test_copy_is_independent(self):
+        sketch = HyperLogLog.from_series(pd.Series(range(100)))
+        clone = sketch.copy()
+        clone.add_series(pd.Series(range(100, 10_000)))
+        assert sketch.estimate() < clone.estimate()
+
+
+class TestGroupedRegisters:
+    def test_rows_match_individual_sketches(self):
+        values = pd.Series(np.arange(3_000) % 700)
+        codes = np.arange(3_000) % 3
+        registers = grouped_hll_registers(hash_values(values), codes, 3)
+        for group in range(3):
+            sketch = HyperLogLog.from_series(values[codes == group])
+            assert estimate_registers(registers)[group] == sketch.estimate()
+
+    def test_fold_equals_lower_precision_build(self):
+        hashes = hash_values(pd.Series(range(20_000)))
+        codes = np.zeros(len(hashes), dtype=np.int64)
+        high = grouped_hll_registers(hashes, codes, 1, precision=12)
+        low = grouped_hll_registers(hashes, codes, 1, precision=7)
+        np.testing.assert_array_equal(fold_registers(high, 7), low)
+
+    def test_fold_rejects_higher_precision(self):
+        with pytest.raises(ValueError, match="fold"):
+            fold_registers(np.zeros((1, 16), dtype=np.uint8), 5)
+
+
+class TestKllSketch:
+    def test_quantiles_within_rank_error(self):
+        values = np.random.default_rng(3).normal(size=200_000)
+        sketch = KllSketch.from_series(values, seed=0)
+        for q in (0.01, 0.25, 0.5, 0.9, 0.99):
+            rank = (values <= sketch.quantile(q)).mean()
+            assert rank == pytest.approx(q, abs=0.02)
+
+    def test_merge_matches_union(self):
+        values = np.random.default_rng(4).random(100_000)
+        left = KllSketch.from_series(values[:30_000], seed=1)
+        left.merge(KllSketch.from_series(values[30_000:], seed=2))
+        assert len(left) == 100_000
+        assert left.quantile(0.5) == pytest.approx(0.5, abs=0.02)
+
+    def test_small_input_is_exact(self):
+        sketch = KllSketch.from_series(pd.Series([5.0, None, 1.0, 3.0]))
+        assert sketch.quantile(0.0) == 1.0
+        assert sketch.quantile(0.5) == 3.0
+        assert sketch.quantile(1.0) == 5.0
+
+    def test_empty_and_invalid(self):
+        assert KllSketch().quantile(0.5) is None
+        with pytest.raises(ValueError, match="between"):
+            KllSketch().quantile(1.5)
+
+
+class TestSpaceSaving:
+    def test_heavy_hitters(self):
+        values = pd.Series(np.random.default_rng(5).zipf(1.5, 50_000))
+        summary = SpaceSaving.from_series(values, capacity=64)
+        expected = values.value_counts().head(5)
+        assert [v for v, _ in summary.top(5)] == expected.index.tolist()
+
+    def test_merge_bounds_counts(self):
+        rng = np.random.default_rng(6)
+        values = pd.Series(rng.zipf(1.8, 40_000))
+        merged = SpaceSaving.from_series(values[:10_000], capacity=32)
+        merged.merge(SpaceSaving.from_series(values[10_000:], capacity=32))
+        exact = values.value_counts()
+        for value, count in merged.top(3):
+            assert exact[value] <= count <= exact[value] + 40_000 / 32
@@ -0,0 +1,212 @@
+"""Tests for spatial values, the STR-tree index and spatial Cypher functions.
+
+Covers :class:`pycypher.spatial.SpatialIndex` point probing, the
+``point``/``distance``/``point.withinPolygon``/``point.withinBBox``
+functions, the ``spatial.pointInPolygon`` procedure and index caching in
+:class:`pycypher.graph_index.GraphIndexManager`.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.spatial import SpatialIndex, haversine_m
+from pycypher.star import Star
+
+shapely = pytest.importorskip("shapely")
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _square(x0: float, y0: float, size: float = 1.0) -> bytes:
+    return shapely.to_wkb(shapely.box(x0, y0, x0 + size, y0 + size))
+
+
+@pytest.fixture
+def tracts() -> pd.DataFrame:
+    # Three unit squares side by side, plus one tract without geometry.
+    return pd.DataFrame(
+        {
+            "__ID__": ["A", "B", "C", "D"],
+            "name": ["a", "b", "c", "d"],
+            "geometry": [_square(0, 0), _square(1, 0), _square(2, 0), None],
+        },
+    )
+
+
+@pytest.fixture
+def nodes() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "__ID__": [1, 2, 3, 4, 5],
+            "lon": [0.5, 1.5, 1.0, 9.0, None],
+            "lat": [0.5, 0.5, 0.5, 9.0, 0.5],
+        },
+    )
+
+
+@pytest.fixture
+def star(tracts, nodes) -> Star:
+    return Star(context=ContextBuilder.from_dict({"T": tracts, "N": nodes}))
+
+
+# ---------------------------------------------------------------------------
+# SpatialIndex
+# ---------------------------------------------------------------------------
+
+
+class TestSpatialIndex:
+    def test_points_are_assigned_once(self, tracts) -> None:
+        index = SpatialIndex.build("T", "geometry", tracts)
+        assert index.size == 3
+        positions, ids = index.query_points(
+            np.array([0.5, 1.5, 1.0, 9.0, np.nan]),
+            np.array([0.5, 0.5, 0.5, 9.0, 0.5]),
+        )
+        # The point on the A|B edge goes to the first polygon only.
+        assert positions.tolist() == [0, 1, 2]
+        assert ids.tolist() == ["A", "B", "A"]
+
+    def test_batches_match_single_probe(self, tracts) -> None:
+        rng = np.random.default_rng(5)
+        x = rng.random(5_000) * 4 - 0.5
+        y = rng.random(5_000) * 2 - 0.5
+        index = SpatialIndex.build("T", "geometry", tracts)
+        whole = index.query_points(x, y)
+        batched = index.query_points(x, y, batch_size=333)
+        np.testing.assert_array_equal(whole[0], batched[0])
+        np.testing.assert_array_equal(whole[1], batched[1])
+        inside = (x >= 0) & (x <= 3) & (y >= 0) & (y <= 1)
+        assert whole[0].tolist() == np.flatnonzero(inside).tolist()
+
+    def test_missing_geometry_column(self, nodes) -> None:
+        index = SpatialIndex.build("N", "geometry", nodes)
+        assert index.tree is None
+        positions, _ = index.query_points(np.array([0.5]), np.array([0.5]))
+        assert len(positions) == 0
+
+
+# ---------------------------------------------------------------------------
+# Scalar functions
+# ---------------------------------------------------------------------------
+
+
+class TestSpatialFunctions:
+    def test_point_maps(self, star) -> None:
+        result = star.execute_query(
+            "MATCH (n:N) RETURN point({longitude: n.lon, latitude: n.lat}) "
+            "AS g, point({x: n.lon, y: n.lat}) AS c",
+        )
+        assert result["g"].iloc[0] == {
+            "longitude": 0.5,
+            "latitude": 0.5,
+            "crs": "wgs-84",
+        }
+        assert result["c"].iloc[0]["crs"] == "cartesian"
+        assert result["g"].iloc[4] is None
+
+    def test_distance(self, star) -> None:
+        result = star.execute_query(
+            "MATCH (n:N) RETURN "
+            "distance(point({longitude: n.lon, latitude: n.lat}), "
+            "point({longitude: 0.0, latitude: 0.0})) AS geo, "
+            "point.distance(point({x: n.lon, y: n.lat}), "
+            "point({x: 0.0, y: 0.0})) AS flat, "
+            "distance(point({x: n.lon, y: n.lat}), "
+            "point({longitude: 0.0, latitude: 0.0})) AS mixed",
+        )
+        expected = haversine_m(
+            np.array([0.5]),
+            np.array([0.5]),
+            np.array([0.0]),
+            np.array([0.0]),
+        )[0]
+        assert result["geo"].iloc[0] == pytest.approx(expected)
+        assert result["geo"].iloc[0] == pytest.approx(78_626, rel=1e-3)
+        assert result["flat"].iloc[3] == pytest.approx(np.hypot(9.0, 9.0))
+        assert result["mixed"].isna().all()
+        assert result["geo"].iloc[4] is None
+
+    def test_within_polygon_in_where(self, star) -> None:
+        result = star.execute_query(
+            "MATCH (n:N), (t:T) WHERE point.withinPolygon("
+            "point({longitude: n.lon, latitude: n.lat}), t.geometry) "
+            "RETURN n.lon AS lon, t.name AS tract ORDER BY lon, tract",
+        )
+        # Boundary points are inside every polygon that touches them.
+        assert list(zip(result["lon"], result["tract"], strict=True)) == [
+            (0.5, "a"),
+            (1.0, "a"),
+            (1.0, "b"),
+            (1.5, "b"),
+        ]
+
+    def test_within_polygon_nulls(self, star) -> None:
+        result = star.execute_query(
+            "MATCH (t:T) RETURN t.name AS name, point.withinPolygon("
+            "point({x: 0.5, y: 0.5}), t.geometry) AS inside ORDER BY name",
+        )
+        assert result["inside"].tolist() == [True, False, False, None]
+
+    def test_within_bbox(self, star) -> None:
+        result = star.execute_query(
+            "MATCH (n:N) RETURN point.withinBBox(point({x: n.lon, y: n.lat}), "
+            "point({x: 0, y: 0}), point({x: 1, y: 1})) AS b",
+        )
+        assert result["b"].tolist() == [True, False, True, False, None]
+
+    def test_within_bbox_across_antimeridian(self, star) -> None:
+        result = star.execute_query(
+            "RETURN point.withinBBox("
+            "point({longitude: -179.5, latitude: 0.0}), "
+            "point({longitude: 170.0, latitude: -1.0}), "
+            "point({longitude: -170.0, latitude: 1.0})) AS b",
+        )
+        assert result["b"].iloc[0] is True
+
+
+# ---------------------------------------------------------------------------
+# Procedure and index cache
+# ---------------------------------------------------------------------------
+
+
+class TestPointInPolygonProcedure:
+    def test_spatial_join(self, star) -> None:
+        result = star.execute_query(
+            "CALL spatial.pointInPolygon('N', 'lon', 'lat', 'T') "
+            "YIELD point, polygon RETURN point, polygon",
+        )
+        assert list(zip(result["point"], result["polygon"], strict=True)) == [
+            (1, "A"),
+            (2, "B"),
+            (3, "A"),
+        ]
+
+    def test_index_is_cached_and_reported(self, star) -> None:
+        manager = star.context.index_manager
+        first = manager.get_spatial_index("T")
+        assert manager.get_spatial_index("T") is first
+        assert manager.stats()["spatial_indexes"] == {
+            "T.geometry": {"geometries": 3},
+        }
+        manager.invalidate()
+        assert manager.get_spatial_index("T") is not first
+
+    def test_unknown_labels(self, star) -> None:
+        assert star.context.index_manager.get_spatial_index("X") is None
+        assert star.context.index_manager.get_spatial_index("N") is None
+        result = star.execute_query(
+            "CALL spatial.pointInPolygon('Nope', 'lon', 'lat', 'T') "
+            "YIELD point RETURN point",
+        )
+        assert result.empty
+
+    def test_wrong_arity(self, star) -> None:
+        with pytest.raises(ValueError, match="pointInPolygon expects"):
+            star.execute_query(
+                "CALL spatial.pointInPolygon('N') YIELD point RETURN point",
+            )
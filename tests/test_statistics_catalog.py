@@ -0,0 +1,258 @@
+"""Tests for ANALYZE statistics: column profiles, degree statistics and the
+persisted :class:`~pycypher.statistics_catalog.StatisticsCatalog`.
+"""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.ast_models import ASTConverter
+from pycypher.cardinality_estimator import (
+    ColumnStatistics,
+    DegreeStatistics,
+    profile_column,
+)
+from pycypher.ingestion.context_builder import ContextBuilder
+from pycypher.query_planner import QueryPlanAnalyzer
+from pycypher.star import Star
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def frames() -> dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(0)
+    n = 4_000
+    people = pd.DataFrame(
+        {
+            "__ID__": np.arange(n),
+            "name": [f"n{i % 1000:04d}" for i in range(n)],
+            "city": rng.choice(["A", "B", "C", "D"], size=n, p=[0.7, 0.1, 0.1, 0.1]),
+            "age": rng.integers(0, 100, size=n),
+        },
+    )
+    # Every edge points at one of 50 "hub" people.
+    knows = pd.DataFrame(
+        {
+            "__ID__": np.arange(100_000, 110_000),
+            "__SOURCE__": rng.integers(0, n, size=10_000),
+            "__TARGET__": rng.integers(0, 50, size=10_000),
+        },
+    ).drop_duplicates(["__SOURCE__", "__TARGET__"])
+    return {"Person": people, "KNOWS": knows}
+
+
+@pytest.fixture
+def ctx(frames):
+    return ContextBuilder.from_dict(frames)
+
+
+def _analyzer(query: str, context) -> QueryPlanAnalyzer:
+    return QueryPlanAnalyzer(ASTConverter.from_cypher(query), context)
+
+
+# ---------------------------------------------------------------------------
+# Column profiles
+# ---------------------------------------------------------------------------
+
+
+class TestColumnProfile:
+    def test_uniform_column_has_no_mcvs(self):
+        stats = profile_column(pd.Series(["a", "b", "c", "d"] * 10))
+        assert stats.most_common_values is None
+        assert stats.equality_selectivity("a") == pytest.approx(0.25)
+
+    def test_skewed_column_keeps_mcvs(self):
+        stats = profile_column(pd.Series(["x"] * 80 + list("abcdefghij") * 2))
+        assert stats.most_common_values == (("x", 0.8),)
+        assert stats.equality_selectivity("x") == pytest.approx(0.8)
+        # The other 10 values share the remaining 20%.
+        assert stats.equality_selectivity("a") == pytest.approx(0.02)
+
+    def test_numeric_mcv_matches_float_literal(self):
+        stats = profile_column(pd.Series([7] * 90 + list(range(10))))
+        assert stats.equality_selectivity(7.0) == pytest.approx(0.91)
+
+    def test_prefix_histogram(self):
+        values = pd.Series([f"{c}{i:03d}" for c in "abcdefghij" for i in range(100)])
+        stats = profile_column(values)
+        assert stats.prefix_bounds is not None
+        assert stats.prefix_selectivity("c") == pytest.approx(0.1, abs=0.04)
+        assert stats.prefix_selectivity("zzz") == pytest.approx(1 / 1000)
+        assert stats.string_range_selectivity(low="f") == pytest.approx(
+            0.5,
+            abs=0.04,
+        )
+
+    def test_numeric_column_has_no_prefix_histogram(self):
+        assert profile_column(pd.Series(range(100))).prefix_bounds is None
+
+    def test_unhashable_values_are_tolerated(self):
+        stats = profile_column(pd.Series([[1], [1], [2]] * 5, dtype=object), ndv=2)
+        assert stats.most_common_values is None
+
+    def test_round_trip(self):
+        stats = profile_column(pd.Series(["x"] * 50 + [f"v{i}" for i in range(50)]))
+        assert ColumnStatistics.from_dict(
+            json.loads(json.dumps(stats.to_dict())),
+        ) == stats
+
+
+class TestDegreeStatistics:
+    def test_from_frame(self):
+        df = pd.DataFrame({"__SOURCE__": [1, 1, 1, 2], "__TARGET__": [3, 4, 3, 3]})
+        deg = DegreeStatistics.from_frame(df)
+        assert (deg.source_count, deg.target_count) == (2, 2)
+        assert (deg.max_out_degree, deg.max_in_degree) == (3, 3)
+        assert deg.fanout("->") == pytest.approx(2.0)
+        assert deg.fanout("<-") == pytest.approx(2.0)
+        assert deg.fanout("-") == pytest.approx(2.0)
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+
+
+class TestStatisticsCatalog:
+    def test_analyze_all_tables(self, ctx):
+        assert sorted(ctx.statistics.analyze()) == ["KNOWS", "Person"]
+        assert ctx.statistics.analyzed_tables == ["KNOWS", "Person"]
+
+    def test_unknown_table(self, ctx):
+        with pytest.raises(KeyError, match="Nope"):
+            ctx.statistics.analyze(["Nope"])
+
+    def test_hll_ndv_over_full_table(self, ctx):
+        ctx.statistics.analyze(["Person"])
+        stats = ctx.statistics.column_statistics("Person", "name")
+        assert stats.ndv == pytest.approx(1000, rel=0.05)
+        assert stats.row_count == 4000
+
+    def test_degree_distribution(self, ctx, frames):
+        ctx.statistics.analyze(["KNOWS"])
+        deg = ctx.statistics.degree_statistics("KNOWS")
+        knows = frames["KNOWS"]
+        assert deg.relationship_count == len(knows)
+        assert deg.target_count == 50
+        assert deg.max_in_degree == knows["__TARGET__"].value_counts().max()
+        assert deg.avg_in_degree == pytest.approx(len(knows) / 50)
+
+    def test_column_group_and_join_key_sketches(self, ctx, frames):
+        ctx.statistics.analyze(column_groups={"Person": [("city", "age")]})
+        assert ctx.statistics.distinct_count(
+            "Person",
+            ["age", "city"],
+        ) == pytest.approx(400, rel=0.05)
+        assert ctx.statistics.distinct_count(
+            "KNOWS",
+            ["__SOURCE__", "__TARGET__"],
+        ) == pytest.approx(
+            len(frames["KNOWS"]),
+            rel=0.05,
+        )
+        assert ctx.statistics.join_key_overlap(
+            "KNOWS",
+            "__TARGET__",
+            "Person",
+            "__ID__",
+        ) == pytest.approx(50, rel=0.1)
+
+    def test_unanalyzed_tables_share_sampled_statistics(self, ctx):
+        first = ctx.statistics.table_statistics("Person")
+        assert ctx.statistics.table_statistics("Person") is first
+        assert not ctx.statistics.is_analyzed("Person")
+
+    def test_mutation_refreshes_only_changed_tables(self, ctx):
+        ctx.statistics.analyze()
+        knows_before = ctx.statistics.profile("KNOWS")
+        Star(context=ctx).execute_query(
+            "CREATE (:Person {name: 'new', city: 'Z', age: 1})",
+        )
+        assert ctx.statistics.summary()["Person"]["stale"]
+        assert ctx.statistics.profile("Person").row_count == 4001
+        assert ctx.statistics.profile("KNOWS") is knows_before
+
+    def test_replaced_source_is_detected(self, ctx, frames):
+        ctx.statistics.analyze(["Person"])
+        ctx.entity_mapping["Person"].source_obj = frames["Person"].iloc[:100]
+        assert ctx.statistics.profile("Person").row_count == 100
+
+    def test_save_and_load(self, ctx, frames, tmp_path):
+        path = tmp_path / "graph.stats.json"
+        Star(context=ctx).analyze(
+            column_groups={"Person": [("city", "age")]},
+            path=str(path),
+        )
+        restored = ContextBuilder.from_dict(frames)
+        assert sorted(restored.statistics.load(path)) == ["KNOWS", "Person"]
+        assert restored.statistics.column_statistics(
+            "Person",
+            "city",
+        ) == ctx.statistics.column_statistics("Person", "city")
+        assert restored.statistics.distinct_count(
+            "Person",
+            ["city", "age"],
+        ) == ctx.statistics.distinct_count("Person", ["city", "age"])
+
+    def test_load_discards_changed_tables(self, ctx, frames, tmp_path):
+        ctx.statistics.analyze()
+        path = ctx.statistics.save(tmp_path / "s.json")
+        changed = ContextBuilder.from_dict(
+            {"Person": frames["Person"].iloc[:-1], "KNOWS": frames["KNOWS"]},
+        )
+        assert changed.statistics.load(path) == ["KNOWS"]
+
+    def test_load_rejects_unknown_version(self, ctx, tmp_path):
+        path = tmp_path / "s.json"
+        path.write_text(json.dumps({"version": 999, "tables": {}}))
+        with pytest.raises(ValueError, match="version"):
+            ctx.statistics.load(path)
+
+
+# ---------------------------------------------------------------------------
+# Planner integration
+# ---------------------------------------------------------------------------
+
+
+class TestPlannerUsesStatistics:
+    def test_mcv_equality_estimate(self, ctx, frames):
+        ctx.statistics.analyze(["Person"])
+        query = "MATCH (p:Person) WHERE p.city = 'A' RETURN p"
+        estimate = _analyzer(query, ctx).analyze().clause_cardinalities[0]
+        actual = (frames["Person"]["city"] == "A").sum()
+        assert estimate == pytest.approx(actual, rel=0.05)
+
+    def test_starts_with_estimate(self, ctx):
+        query = "MATCH (p:Person) WHERE p.name STARTS WITH 'n01' RETURN p"
+        estimate = _analyzer(query, ctx).analyze().clause_cardinalities[0]
+        assert estimate == pytest.approx(400, rel=0.25)
+
+    def test_column_group_estimate(self, ctx):
+        ctx.statistics.analyze(column_groups={"Person": [("city", "age")]})
+        analyzer = _analyzer(
+            "MATCH (p:Person) WHERE p.city = 'B' AND p.age = 4 RETURN p",
+            ctx,
+        )
+        sel = analyzer.estimate_predicate_selectivity(
+            analyzer.query.clauses[0].where,
+        )
+        ndv = ctx.statistics.distinct_count("Person", ["city", "age"])
+        assert sel == pytest.approx(1 / ndv)
+
+    def test_degree_statistics_drive_expansion(self, ctx):
+        query = (
+            "MATCH (a:Person)<-[:KNOWS]-(b:Person)-[:KNOWS]->(c:Person) "
+            "RETURN a"
+        )
+        before = _analyzer(query, ctx).analyze().clause_cardinalities[0]
+        ctx.statistics.analyze()
+        after = _analyzer(query, ctx).analyze().clause_cardinalities[0]
+        actual = len(Star(context=ctx).execute_query(query))
+        assert abs(after - actual) < abs(before - actual)
+        assert after == pytest.approx(actual, rel=0.5)
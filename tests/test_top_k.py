@@ -0,0 +1,208 @@
+"""Tests for Top-K ``ORDER BY … LIMIT`` and early LIMIT termination.
+
+Results with Top-K pruning are compared against the same query with the
+pruning disabled, across multi-key orderings, NULLS FIRST/LAST, DESC,
+strings and SKIP, and for the bound pushed below grouped aggregation.
+``MATCH … RETURN … LIMIT`` is checked to stop pattern matching early
+while still returning valid matches.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher import Star, top_k
+from pycypher.ast_models import ASTConverter
+from pycypher.relational_models import (
+    ID_COLUMN,
+    RELATIONSHIP_SOURCE_COLUMN,
+    RELATIONSHIP_TARGET_COLUMN,
+    Context,
+    EntityMapping,
+    EntityTable,
+    RelationshipMapping,
+    RelationshipTable,
+)
+from pycypher.top_k import top_k_candidates, use_top_k
+
+N_ROWS = 10_000
+
+
+@pytest.fixture(scope="module")
+def star() -> Star:
+    rng = np.random.default_rng(3)
+    people = pd.DataFrame(
+        {
+            ID_COLUMN: range(N_ROWS),
+            "score": rng.integers(50, size=N_ROWS).astype(float),
+            "rank": rng.permutation(N_ROWS),
+            "name": [f"n{i:05d}" for i in rng.permutation(N_ROWS)],
+            "team": rng.integers(300, size=N_ROWS),
+        },
+    )
+    people.loc[rng.random(N_ROWS) < 0.1, "score"] = np.nan
+    knows = pd.DataFrame(
+        {
+            ID_COLUMN: range(3 * N_ROWS),
+            RELATIONSHIP_SOURCE_COLUMN: rng.integers(N_ROWS, size=3 * N_ROWS),
+            RELATIONSHIP_TARGET_COLUMN: rng.integers(N_ROWS, size=3 * N_ROWS),
+        },
+    )
+    context = Context(
+        entity_mapping=EntityMapping(
+            mapping={"Person": EntityTable.from_dataframe("Person", people)},
+        ),
+        relationship_mapping=RelationshipMapping(
+            mapping={
+                "KNOWS": RelationshipTable.from_dataframe("KNOWS", knows),
+            },
+        ),
+    )
+    return Star(context=context, result_cache_max_mb=0)
+
+
+def _rows(frame: pd.DataFrame) -> list[tuple]:
+    frame = frame.astype(object).where(frame.notna(), None)
+    return list(map(tuple, frame.to_numpy().tolist()))
+
+
+# ---------------------------------------------------------------------------
+# Candidate selection
+# ---------------------------------------------------------------------------
+
+
+class TestTopKCandidates:
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("nulls_first", [True, False])
+    @pytest.mark.parametrize("kind", ["float", "str", "datetime"])
+    def test_superset_of_first_k(self, ascending, nulls_first, kind) -> None:
+        rng = np.random.default_rng(0)
+        values = pd.Series(rng.integers(200, size=5_000).astype(float))
+        values[rng.random(5_000) < 0.05] = np.nan
+        if kind == "str":
+            values = values.map(lambda v: None if pd.isna(v) else f"{v:05.0f}")
+        elif kind == "datetime":
+            values = pd.to_datetime(values, unit="D")
+        for k in (1, 37, 400):
+            mask = top_k_candidates(
+                values,
+                k,
+                ascending=ascending,
+                nulls_first=nulls_first,
+            )
+            order = values.sort_values(
+                ascending=ascending,
+                na_position="first" if nulls_first else "last",
+            )
+            # Every row tied with the k-th row could be chosen by a later key.
+            kth = order.iloc[k - 1]
+            needed = order.iloc[:k].index.union(
+                values.index[values == kth] if pd.notna(kth) else [],
+            )
+            assert mask[needed].all()
+            assert mask.sum() < len(values)
+
+    def test_distinct_keeps_whole_groups(self) -> None:
+        keys = pd.Series([5, 1, 3, 1, None, 2, 5, 2, 4, 1])
+        mask = top_k_candidates(keys, 2, distinct=True)
+        assert keys[mask].isna().sum() == 1
+        assert sorted(keys[mask].dropna()) == [1, 1, 1, 2, 2]
+
+    def test_unorderable_values_are_declined(self) -> None:
+        assert top_k_candidates(pd.Series([[1], [2], [0]]), 1) is None
+        assert top_k_candidates(pd.Series(["a", 1, "b", 2]), 1) is None
+
+    def test_only_for_small_bounds(self) -> None:
+        assert use_top_k(100_000, 10)
+        assert not use_top_k(100_000, None)
+        assert not use_top_k(100, 1)
+        assert not use_top_k(100_000, 50_000)
+
+
+# ---------------------------------------------------------------------------
+# ORDER BY … LIMIT
+# ---------------------------------------------------------------------------
+
+
+class TestOrderByLimit:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (p:Person) RETURN p.score AS s, p.rank AS r "
+            "ORDER BY s DESC, r LIMIT 25",
+            "MATCH (p:Person) RETURN p.score AS s, p.rank AS r "
+            "ORDER BY s NULLS FIRST, r DESC SKIP 990 LIMIT 40",
+            "MATCH (p:Person) RETURN p.score AS s, p.rank AS r "
+            "ORDER BY s DESC NULLS LAST, r LIMIT 30",
+            "MATCH (p:Person) RETURN p.name AS name "
+            "ORDER BY name DESC LIMIT 9",
+            "MATCH (p:Person) RETURN p.rank AS r ORDER BY p.name LIMIT 12",
+            "MATCH (p:Person) RETURN p.team AS team, count(*) AS n "
+            "ORDER BY team DESC LIMIT 6",
+            "MATCH (p:Person) RETURN p.score AS s, max(p.rank) AS top "
+            "ORDER BY s NULLS FIRST LIMIT 4",
+            "MATCH (p:Person) RETURN p.team AS team, p.score AS s, "
+            "count(*) AS n ORDER BY team, s LIMIT 20",
+        ],
+    )
+    def test_matches_full_sort(self, star, query, monkeypatch) -> None:
+        pruned = star.execute_query(query)
+        monkeypatch.setattr(top_k, "TOP_K_MIN_ROWS", 10**12)
+        full = star.execute_query(query)
+        assert _rows(pruned) == _rows(full)
+        assert not pruned.empty
+
+
+# ---------------------------------------------------------------------------
+# Early LIMIT termination
+# ---------------------------------------------------------------------------
+
+
+class TestLimitStopsMatching:
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.rank, b.rank",
+            "MATCH (a:Person)-[k:KNOWS]-(b:Person) RETURN a.rank, k, b.rank",
+            "MATCH (a:Person)<-[:KNOWS]-(b:Person {team: 7}) "
+            "RETURN a.rank, b.rank",
+        ],
+    )
+    def test_returns_valid_matches(self, star, query) -> None:
+        full = _rows(star.execute_query(query))
+        for limit in (1, 50, 5_000, 10 * len(full)):
+            limited = _rows(star.execute_query(f"{query} LIMIT {limit}"))
+            assert len(limited) == min(limit, len(full))
+            assert set(limited) <= set(full)
+
+    def test_scans_only_needed_start_nodes(self, star, monkeypatch) -> None:
+        seen: list[int] = []
+        matcher = type(star._pattern_matcher)
+        original = matcher.pattern_path_to_binding_frame
+
+        def _spy(self, path, anon_counter, *args, **kwargs):
+            start = kwargs.get("start_frame")
+            if start is not None:
+                seen.append(len(start.bindings))
+            return original(self, path, anon_counter, *args, **kwargs)
+
+        monkeypatch.setattr(matcher, "pattern_path_to_binding_frame", _spy)
+        result = star.execute_query(
+            "MATCH (a:Person)-[:KNOWS]->(b:Person) RETURN a.rank LIMIT 10",
+        )
+        assert len(result) == 10
+        assert sum(seen) < N_ROWS
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "MATCH (a:Person) SET a.seen = true RETURN a.rank LIMIT 5",
+            "MATCH (a:Person) MATCH (b:Person) RETURN a.rank LIMIT 5",
+            "OPTIONAL MATCH (a:Person) RETURN a.rank LIMIT 5",
+            "MATCH (a:Person) UNWIND [1, 2] AS x RETURN a.rank LIMIT 5",
+        ],
+    )
+    def test_hint_requires_plain_match_return(self, star, query) -> None:
+        parsed = ASTConverter().from_cypher(query)
+        assert star._extract_limit_hint(parsed) is None
@@ -0,0 +1,210 @@
+"""Tests for ``dedup``, ``vectorized`` and process-pool user functions."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+from pycypher.ingestion.config import FunctionConfig
+from pycypher.scalar_functions import ScalarFunctionRegistry, user_functions
+from pycypher.scalar_functions.user_functions import (
+    _evaluate_rows,
+    _wrap_deduplicated,
+    _wrap_row_wise,
+    _wrap_vectorized,
+    register_user_function,
+)
+
+from tests.fixtures.user_scalar_module import state_prefix
+
+
+def _values(result: pd.Series) -> list[object]:
+    """Series values with every null spelled ``None``."""
+    return result.astype(object).where(result.notna(), None).tolist()
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry_singleton() -> None:
+    """Each test starts with a freshly-built registry to avoid name collisions."""
+    ScalarFunctionRegistry._instance = None
+    yield
+    ScalarFunctionRegistry._instance = None
+
+
+class TestDeduplicated:
+    def test_called_once_per_distinct_input(self) -> None:
+        calls: list[object] = []
+
+        def upper(s):
+            calls.append(s)
+            return s.upper()
+
+        wrapped = _wrap_deduplicated(upper)
+        result = wrapped(pd.Series(["a", "b", None, "a", "b", "a"]))
+        assert _values(result) == ["A", "B", None, "A", "B", "A"]
+        assert sorted(calls) == ["a", "b"]
+
+    def test_memo_spans_calls_and_is_bounded(self) -> None:
+        calls: list[object] = []
+
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        wrapped = _wrap_deduplicated(square, memo_size=2)
+        wrapped(pd.Series([1, 2, 2]))
+        assert wrapped(pd.Series([2, 1, 1])).tolist() == [4, 1, 1]
+        assert len(calls) == 2
+        assert wrapped.memo.hits == 2
+        wrapped(pd.Series([3]))
+        assert len(wrapped.memo) == 2
+        wrapped(pd.Series([1]))
+        assert calls == [1, 2, 3]
+
+    def test_multi_argument_tuples(self) -> None:
+        calls: list[tuple] = []
+
+        def join(a, b):
+            calls.append((a, b))
+            return f"{a}-{b}"
+
+        wrapped = _wrap_deduplicated(join)
+        result = wrapped(
+            pd.Series(["x", "x", "y", "x"]),
+            pd.Series([1, 2, 1, 1], dtype=object),
+        )
+        assert result.tolist() == ["x-1", "x-2", "y-1", "x-1"]
+        assert len(calls) == 3
+
+    def test_matches_row_wise_with_nulls(self) -> None:
+        def add(a, b):
+            return a + b
+
+        a = pd.Series([1.0, np.nan, 3.0, 1.0])
+        b = pd.Series([10, 20, None, 10], dtype=object)
+        pd.testing.assert_series_equal(
+            _wrap_deduplicated(add)(a, b),
+            _wrap_row_wise(add)(a, b),
+        )
+
+    def test_equal_values_of_different_types_stay_distinct(self) -> None:
+        def kind(v):
+            return type(v).__name__
+
+        wrapped = _wrap_deduplicated(kind)
+        result = wrapped(pd.Series([1, 1.0, True, 1], dtype=object))
+        assert result.tolist() == ["int", "float", "bool", "int"]
+        # The memo keeps them apart across calls too.
+        assert wrapped(pd.Series([1.0])).tolist() == ["float"]
+        assert wrapped(pd.Series([True])).tolist() == ["bool"]
+
+    def test_unhashable_inputs_fall_back_to_row_wise(self) -> None:
+        wrapped = _wrap_deduplicated(len)
+        assert wrapped(pd.Series([[1, 2], [3]])).tolist() == [2, 1]
+
+    def test_failures_are_logged_and_not_memoized(self, caplog) -> None:
+        def parse(s):
+            return int(s)
+
+        wrapped = _wrap_deduplicated(parse)
+        with caplog.at_level(logging.WARNING):
+            result = wrapped(pd.Series(["1", "x", "x", "2"]))
+        assert _values(result) == [1, None, None, 2]
+        messages = [r.getMessage() for r in caplog.records]
+        assert any("failed on row 1" in m for m in messages)
+        assert any("2 / 4" in m for m in messages)
+        assert len(wrapped.memo) == 2
+
+
+class TestVectorized:
+    def test_receives_non_null_numpy_arrays(self) -> None:
+        seen: list[np.ndarray] = []
+
+        def scale(x):
+            seen.append(x)
+            return x * 10
+
+        wrapped = _wrap_vectorized(scale)
+        result = wrapped(pd.Series([1.0, None, 3.0]))
+        assert _values(result) == [10.0, None, 30.0]
+        assert isinstance(seen[0], np.ndarray)
+        assert seen[0].tolist() == [1.0, 3.0]
+
+    def test_arrow_arrays(self) -> None:
+        import pyarrow.compute as pc
+
+        wrapped = _wrap_vectorized(pc.utf8_upper, arrays="arrow")
+        assert wrapped(pd.Series(["ab", "cd"])).tolist() == ["AB", "CD"]
+
+    def test_length_mismatch_raises(self) -> None:
+        wrapped = _wrap_vectorized(lambda x: x[:1])
+        with pytest.raises(ValueError, match="returned"):
+            wrapped(pd.Series([1, 2]))
+
+    def test_not_bridged_as_scalar_udf(self) -> None:
+        assert not hasattr(_wrap_vectorized(np.sqrt), "__wrapped__")
+
+
+class TestRegistration:
+    def test_vectorized_through_registry(self) -> None:
+        def add(a, b):
+            return a + b
+
+        register_user_function(add, name="vadd", mode="vectorized")
+        result = ScalarFunctionRegistry.get_instance().execute(
+            "vadd",
+            [pd.Series([1, 2]), pd.Series([3, 4])],
+        )
+        assert result.tolist() == [4, 6]
+
+    def test_process_pool(self) -> None:
+        register_user_function(
+            state_prefix,
+            mode="dedup",
+            processes=2,
+            chunk_size=100,
+        )
+        codes = pd.Series([f"{i % 50:02d}{i:03d}" for i in range(1_000)])
+        result = ScalarFunctionRegistry.get_instance().execute(
+            "state_prefix",
+            [codes],
+        )
+        assert result.tolist() == codes.str[:2].tolist()
+
+    def test_process_pool_is_reused(self) -> None:
+        rows = [(f"{i:05d}",) for i in range(400)]
+        first, _ = _evaluate_rows(
+            state_prefix,
+            rows,
+            processes=2,
+            chunk_size=100,
+        )
+        pool = user_functions._POOLS[2]
+        second, _ = _evaluate_rows(
+            state_prefix,
+            rows,
+            processes=2,
+            chunk_size=100,
+        )
+        assert user_functions._POOLS[2] is pool
+        assert first == second == [code[:2] for (code,) in rows]
+
+    def test_process_pool_requires_picklable_function(self) -> None:
+        with pytest.raises(TypeError, match="picklable"):
+            register_user_function(lambda x: x, name="f", processes=2)
+
+    def test_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="mode"):
+            register_user_function(state_prefix, mode="batch")
+
+    def test_pipeline_config_options(self) -> None:
+        cfg = FunctionConfig(
+            callable="tests.fixtures.user_scalar_module.state_prefix",
+            mode="dedup",
+            processes=2,
+        )
+        assert (cfg.mode, cfg.memo_size, cfg.processes) == ("dedup", None, 2)
+        with pytest.raises(ValueError):
+            FunctionConfig(callable="a.b", processes=0)